@@ -26,6 +26,16 @@ We expect the following arguments:
 - iterations    - number of iterations to run 
 - restarts      - we run the classifier this many times and use the one with 
                   the highest log likelihood
+- parallel      - if True, we run the restarts in parallel processes and stop
+                  the losing ones early, in successive halving style, with
+                  eta as in parallel_restarts.py (default False, eta=2)
+- P             - if given, the number of worker processes. At each step we 
+                  then train the candidates (K',L), (K,L') and (K',L') that we
+                  have not tried yet, and all their restarts, concurrently in a
+                  process pool. The restarts are seeded from numpy.random.
+- cache         - a ResultCache (see result_store.py). If given, each restart
+                  is seeded from its arguments, and restarts that are already
+                  in the cache are not trained again (default None)
 
 The greedy grid search can be started by running search(search_metric), where 
 we stop searching after our specified metric's performance drops.
@@ -37,16 +47,20 @@ be obtained using all_values(metric), and the best value of K and L can be
 returned using best_value(metric).
 
 all_values(metric) returns a list of tuples detailing the performances: (K,L,metric).
+The performances are memoised, so trying a (K,L) again does not retrain it.
 
 We use the optimised Variational Bayes algorithm for BNMTF.
 """
 
+from parallel_restarts import ParallelRestarts, train_restart, best_restart, seeded_restarts, train_restarts_cached
+
+from multiprocessing import Pool
 import numpy
 
 metrics = ['BIC','AIC','loglikelihood','MSE','ELBO']
 
 class GreedySearch:
-    def __init__(self,classifier,values_K,values_L,R,M,priors,initS,initFG,iterations,restarts=1):
+    def __init__(self,classifier,values_K,values_L,R,M,priors,initS,initFG,iterations,restarts=1,parallel=False,eta=2,P=None,cache=None):
         self.classifier = classifier
         self.values_K = values_K
         self.values_L = values_L
@@ -58,7 +72,13 @@ class GreedySearch:
         self.initFG = initFG
         self.iterations = iterations
         self.restarts = restarts
+        self.parallel = parallel
+        self.eta = eta
+        self.P = P
+        self.cache = cache
         assert self.restarts > 0, "Need at least 1 restart."        
+        assert not (self.parallel and self.P is not None), "Cannot use both the successive halving restarts and a pool of workers."
+        assert not (self.parallel and self.cache is not None), "Cannot use a cache with parallel restarts, as these are stopped early."
         
         self.all_performances = {
             metric : []
@@ -78,22 +98,35 @@ class GreedySearch:
             
             # Otherwise, we try it
             print "Running greedy search for BNMTF. Trying K = %s, L = %s." % (K,L)
-            best_BNMTF = None
-            for r in range(0,self.restarts):
-                print "Restart %s for K = %s, L = %s." % (r+1,K,L) 
-                BNMTF = self.classifier(self.R,self.M,K,L,self.priors)
-                BNMTF.initialise(init_S=self.initS,init_FG=self.initFG)
-                if minimum_TN is None:
-                    BNMTF.run(iterations=self.iterations)
-                else:
-                    BNMTF.run(iterations=self.iterations,minimum_TN=minimum_TN)
+            if self.P is not None or self.cache is not None:
+                train_in_pool([(K,L)])
+                return self.all_performances[search_metric][-1][2]
+            elif self.parallel:
+                best_BNMTF = ParallelRestarts(
+                    classifier=self.classifier,
+                    model_args={'R':self.R,'M':self.M,'K':K,'L':L,'priors':self.priors},
+                    init_args={'init_S':self.initS,'init_FG':self.initFG},
+                    iterations=self.iterations,
+                    restarts=self.restarts,
+                    eta=self.eta,
+                    run_args={} if minimum_TN is None else {'minimum_TN':minimum_TN}).run(burn_in,thinning)
+            else:
+                best_BNMTF = None
+                for r in range(0,self.restarts):
+                    print "Restart %s for K = %s, L = %s." % (r+1,K,L) 
+                    BNMTF = self.classifier(self.R,self.M,K,L,self.priors)
+                    BNMTF.initialise(init_S=self.initS,init_FG=self.initFG)
+                    if minimum_TN is None:
+                        BNMTF.run(iterations=self.iterations)
+                    else:
+                        BNMTF.run(iterations=self.iterations,minimum_TN=minimum_TN)
                 
-                args = {'metric':'loglikelihood'}
-                if burn_in is not None and thinning is not None:
-                    args['burn_in'], args['thinning'] = burn_in, thinning
+                    args = {'metric':'loglikelihood'}
+                    if burn_in is not None and thinning is not None:
+                        args['burn_in'], args['thinning'] = burn_in, thinning
                 
-                if best_BNMTF is None or BNMTF.quality(**args) > best_BNMTF.quality(**args):
-                    best_BNMTF = BNMTF
+                    if best_BNMTF is None or BNMTF.quality(**args) > best_BNMTF.quality(**args):
+                        best_BNMTF = BNMTF
             
             for metric in metrics:
                 if burn_in is not None and thinning is not None:
@@ -104,66 +137,105 @@ class GreedySearch:
                 
             return self.all_performances[search_metric][-1][2] # return the quality of the last appended value (K,L,quality)
             
-        # Get the initial starting point
-        ik, il = 0, 0 #current indices for values of K and L
-        current_K, current_L = self.values_K[ik], self.values_L[il]
-        performance_so_far = try_KL(current_K,current_L)
-        
-        while ik < len(self.values_K)-1 and il < len(self.values_L)-1: 
-            print "Currently at K = %s, L = %s." % (current_K,current_L)
-            new_K, new_L = self.values_K[ik+1], self.values_L[il+1]
-            performance_new_K = try_KL(new_K,current_L)
-            performance_new_L = try_KL(current_K,new_L)
-            performance_new_KL = try_KL(new_K,new_L)
-            
-            if performance_so_far < min(performance_new_K,performance_new_L,performance_new_KL):
-                break
-            else:
-                if performance_new_K < performance_new_L and performance_new_K < performance_new_KL:
-                    print "(%s,%s) -> (%s,%s)" % (current_K,current_L,new_K,current_L)
-                    ik += 1
-                    current_K = new_K
-                    performance_so_far = performance_new_K
-                elif performance_new_L < performance_new_KL:
-                    print "(%s,%s) -> (%s,%s)" % (current_K,current_L,current_K,new_L)
-                    il += 1
-                    current_L = new_L
-                    performance_so_far = performance_new_L
+        def train_in_pool(KLs):
+            # Train all restarts of the (K,L) values we have not tried yet in the pool (if any), and store their
+            # performances in order. With a cache we only train the restarts that are not in it.
+            KLs = [(K,L) for i,(K,L) in enumerate(KLs) if (K,L) not in KLs[:i] and not self.find_KL(search_metric,K,L)]
+            all_parameters = []
+            for (K,L) in KLs:
+                params = {
+                    'classifier' : self.classifier,
+                    'model_args' : {'R':self.R,'M':self.M,'K':K,'L':L,'priors':self.priors},
+                    'init_args' : {'init_S':self.initS,'init_FG':self.initFG},
+                    'run_args' : {} if minimum_TN is None else {'minimum_TN':minimum_TN},
+                    'iterations' : self.iterations,
+                    'metrics' : metrics,
+                    'burn_in' : burn_in,
+                    'thinning' : thinning
+                }
+                if self.cache is not None:
+                    all_parameters.extend(seeded_restarts(params,self.restarts,self.cache))
                 else:
-                    print "(%s,%s) -> (%s,%s)" % (current_K,current_L,new_K,new_L)
-                    ik += 1
-                    il += 1
-                    current_K,current_L = new_K,new_L
-                    performance_so_far = performance_new_KL
+                    all_parameters.extend([dict(params,seed=numpy.random.randint(0,2**31-1)) for r in range(0,self.restarts)])
+            if self.cache is not None:
+                outputs = train_restarts_cached(all_parameters,self.cache,pool)
+            else:
+                outputs = pool.map(train_restart,all_parameters)
+            for i,(K,L) in enumerate(KLs):
+                qualities = best_restart(outputs[i*self.restarts:(i+1)*self.restarts])
+                for metric in metrics:
+                    self.all_performances[metric].append((K,L,qualities[metric]))
+            
+        pool = Pool(self.P) if self.P is not None else None
+        try:
+            # Get the initial starting point
+            ik, il = 0, 0 #current indices for values of K and L
+            current_K, current_L = self.values_K[ik], self.values_L[il]
+            performance_so_far = try_KL(current_K,current_L)
         
-        # If we reached the edge of the grid (so ik == len(self.values_K)-1 or 
-        # il == len(self.values_L)-1) we keep the search going in the L or K direction (resp)
-        if ik == len(self.values_K)-1:
-            while il < len(self.values_L)-1:
+            while ik < len(self.values_K)-1 and il < len(self.values_L)-1: 
                 print "Currently at K = %s, L = %s." % (current_K,current_L)
-                new_L = self.values_L[il+1]
+                new_K, new_L = self.values_K[ik+1], self.values_L[il+1]
+                if pool is not None:
+                    train_in_pool([(new_K,current_L),(current_K,new_L),(new_K,new_L)])
+                performance_new_K = try_KL(new_K,current_L)
                 performance_new_L = try_KL(current_K,new_L)
-                if performance_so_far < performance_new_L:
+                performance_new_KL = try_KL(new_K,new_L)
+            
+                if performance_so_far < min(performance_new_K,performance_new_L,performance_new_KL):
                     break
                 else:
-                    print "(%s,%s) -> (%s,%s)" % (current_K,current_L,current_K,new_L)
-                    il += 1
-                    current_L = new_L
-                    performance_so_far = performance_new_L
+                    if performance_new_K < performance_new_L and performance_new_K < performance_new_KL:
+                        print "(%s,%s) -> (%s,%s)" % (current_K,current_L,new_K,current_L)
+                        ik += 1
+                        current_K = new_K
+                        performance_so_far = performance_new_K
+                    elif performance_new_L < performance_new_KL:
+                        print "(%s,%s) -> (%s,%s)" % (current_K,current_L,current_K,new_L)
+                        il += 1
+                        current_L = new_L
+                        performance_so_far = performance_new_L
+                    else:
+                        print "(%s,%s) -> (%s,%s)" % (current_K,current_L,new_K,new_L)
+                        ik += 1
+                        il += 1
+                        current_K,current_L = new_K,new_L
+                        performance_so_far = performance_new_KL
+        
+            # If we reached the edge of the grid (so ik == len(self.values_K)-1 or 
+            # il == len(self.values_L)-1) we keep the search going in the L or K direction (resp)
+            if ik == len(self.values_K)-1:
+                while il < len(self.values_L)-1:
+                    print "Currently at K = %s, L = %s." % (current_K,current_L)
+                    new_L = self.values_L[il+1]
+                    performance_new_L = try_KL(current_K,new_L)
+                    if performance_so_far < performance_new_L:
+                        break
+                    else:
+                        print "(%s,%s) -> (%s,%s)" % (current_K,current_L,current_K,new_L)
+                        il += 1
+                        current_L = new_L
+                        performance_so_far = performance_new_L
                     
-        elif il == len(self.values_L)-1:
-            while ik < len(self.values_K)-1:
-                print "Currently at K = %s, L = %s." % (current_K,current_L)
-                new_K = self.values_K[ik+1]
-                performance_new_K = try_KL(new_K,current_L)
-                if performance_so_far < performance_new_K:
-                    break
-                else:
-                    print "(%s,%s) -> (%s,%s)" % (current_K,current_L,new_K,current_L)
-                    ik += 1
-                    current_K = new_K     
-                    performance_so_far = performance_new_L
-                
+            elif il == len(self.values_L)-1:
+                while ik < len(self.values_K)-1:
+                    print "Currently at K = %s, L = %s." % (current_K,current_L)
+                    new_K = self.values_K[ik+1]
+                    performance_new_K = try_KL(new_K,current_L)
+                    if performance_so_far < performance_new_K:
+                        break
+                    else:
+                        print "(%s,%s) -> (%s,%s)" % (current_K,current_L,new_K,current_L)
+                        ik += 1
+                        current_K = new_K     
+                        performance_so_far = performance_new_L
+
+            if pool is not None:
+                pool.close()
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
         print "Finished running line search for BNMF."
     
     
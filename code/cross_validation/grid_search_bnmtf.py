@@ -21,6 +21,25 @@ We expect the following arguments:
 - iterations    - number of iterations to run 
 - restarts      - we run the classifier this many times and use the one with 
                   the highest log likelihood
+- parallel      - if True, we run the restarts in parallel processes and stop
+                  the losing ones early, in successive halving style, with
+                  eta as in parallel_restarts.py (default False, eta=2)
+- P             - if given, the number of worker processes. We then train each
+                  (K,L,restart) cell of the grid as a separate task in a process
+                  pool, with a seed derived from (K,L,restart), so that a search
+                  resumed from the store trains the same restarts.
+- store         - optionally, a result store (e.g. JSONLinesResultStore(filename),
+                  see result_store.py) to which we write the performances of
+                  each (K,L,restart) cell as soon as it finishes. Cells that are
+                  already in the store are not trained again, so an interrupted
+                  search resumes where it stopped. The store should only be used
+                  for the same grid, data, and settings.
+- cache         - a ResultCache (see result_store.py). Unlike the store, its
+                  keys describe the whole fit (classifier, data, K, L, priors,
+                  initialisation, iterations and seed), so it can be shared
+                  between searches. If given, each restart is seeded from
+                  its arguments, and restarts that are already in the cache
+                  are not trained again (default None)
 
 The grid search can be started by running search().
 If we use Gibbs then we run search(burn_in,thinning).
@@ -38,12 +57,23 @@ project_location = "/home/tab43/Documents/Projects/libraries/"
 import sys
 sys.path.append(project_location)
 
-import numpy
+from parallel_restarts import ParallelRestarts, train_restart, best_restart, seeded_restarts
+from result_store import derived_seed
+
+from multiprocessing import Pool
+import numpy, itertools
 
 metrics = ['BIC','AIC','loglikelihood','MSE','ELBO']
 
+
+# Train one (K,L,restart) cell of the grid, and return (cell,qualities). This function is outside of
+# the class so it can be used by the Pool.
+def train_cell(params):
+    return (params['cell'],train_restart(params))
+
+
 class GridSearch:
-    def __init__(self,classifier,values_K,values_L,R,M,priors,initS,initFG,iterations,restarts=1):
+    def __init__(self,classifier,values_K,values_L,R,M,priors,initS,initFG,iterations,restarts=1,parallel=False,eta=2,P=None,store=None,cache=None):
         self.classifier = classifier
         self.values_K = values_K
         self.values_L = values_L
@@ -55,7 +85,14 @@ class GridSearch:
         self.initFG = initFG
         self.iterations = iterations
         self.restarts = restarts
+        self.parallel = parallel
+        self.eta = eta
+        self.P = P
+        self.store = store
+        self.cache = cache
         assert self.restarts > 0, "Need at least 1 restart."
+        assert not (self.parallel and (self.P is not None or self.store is not None or self.cache is not None)), \
+            "Cannot use both the successive halving restarts and a pool of workers or result store."
         
         self.all_performances = {
             metric : numpy.empty((len(self.values_K),len(self.values_L)))
@@ -64,28 +101,36 @@ class GridSearch:
     
     
     def search(self,burn_in=None,thinning=None):
+        if self.P is not None or self.store is not None or self.cache is not None:
+            return self.search_cells(burn_in,thinning)
+            
         for ik,K in enumerate(self.values_K):
             for il,L in enumerate(self.values_L):
                 print "Running line search for BNMF. Trying K = %s, L = %s." % (K,L)
-                            
-                priors = self.priors.copy()
-                priors['lambdaF'] = self.priors['lambdaF']*numpy.ones((self.I,K))
-                priors['lambdaS'] = self.priors['lambdaS']*numpy.ones((K,L))
-                priors['lambdaG'] = self.priors['lambdaG']*numpy.ones((self.J,L))
+                priors = self.priors_KL(K,L)
                 
-                best_BNMTF = None
-                for r in range(0,self.restarts):
-                    print "Restart %s for K = %s, L = %s." % (r+1,K,L)    
-                    BNMTF = self.classifier(self.R,self.M,K,L,priors)
-                    BNMTF.initialise(init_S=self.initS,init_FG=self.initFG)
-                    BNMTF.run(iterations=self.iterations)
+                if self.parallel:
+                    best_BNMTF = ParallelRestarts(
+                        classifier=self.classifier,
+                        model_args={'R':self.R,'M':self.M,'K':K,'L':L,'priors':priors},
+                        init_args={'init_S':self.initS,'init_FG':self.initFG},
+                        iterations=self.iterations,
+                        restarts=self.restarts,
+                        eta=self.eta).run(burn_in,thinning)
+                else:
+                    best_BNMTF = None
+                    for r in range(0,self.restarts):
+                        print "Restart %s for K = %s, L = %s." % (r+1,K,L)    
+                        BNMTF = self.classifier(self.R,self.M,K,L,priors)
+                        BNMTF.initialise(init_S=self.initS,init_FG=self.initFG)
+                        BNMTF.run(iterations=self.iterations)
                     
-                    args = {'metric':'loglikelihood'}
-                    if burn_in is not None and thinning is not None:
-                        args['burn_in'], args['thinning'] = burn_in, thinning
+                        args = {'metric':'loglikelihood'}
+                        if burn_in is not None and thinning is not None:
+                            args['burn_in'], args['thinning'] = burn_in, thinning
                     
-                    if best_BNMTF is None or BNMTF.quality(**args) > best_BNMTF.quality(**args):
-                        best_BNMTF = BNMTF
+                        if best_BNMTF is None or BNMTF.quality(**args) > best_BNMTF.quality(**args):
+                            best_BNMTF = BNMTF
                 
                 for metric in metrics:
                     if burn_in is not None and thinning is not None:
@@ -97,6 +142,72 @@ class GridSearch:
         print "Finished running line search for BNMF."
     
     
+    # Train the (K,L,restart) cells that are not in the store or cache yet, in the pool if we have one, storing
+    # each result as soon as it finishes. Then use the restart with the best log likelihood for each K,L.
+    def search_cells(self,burn_in,thinning):
+        cells = list(itertools.product(self.values_K,self.values_L,range(0,self.restarts)))
+        all_parameters, cache_keys, results = [], {}, {}
+        for (K,L) in itertools.product(self.values_K,self.values_L):
+            params = {
+                'classifier' : self.classifier,
+                'model_args' : {'R':self.R,'M':self.M,'K':K,'L':L,'priors':self.priors_KL(K,L)},
+                'init_args' : {'init_S':self.initS,'init_FG':self.initFG},
+                'run_args' : {},
+                'iterations' : self.iterations,
+                'metrics' : metrics,
+                'burn_in' : burn_in,
+                'thinning' : thinning
+            }
+            if self.cache is not None:
+                restarts = seeded_restarts(params,self.restarts,self.cache)
+            else:
+                restarts = [dict(params,seed=derived_seed((K,L,r))) for r in range(0,self.restarts)]
+            
+            for r,params in enumerate(restarts):
+                cell = (K,L,r)
+                if self.cache is not None:
+                    cache_keys[cell] = self.cache.key(params)
+                if self.store is not None and self.store.contains(cell):
+                    results[cell] = self.store.get(cell)
+                elif self.cache is not None and self.cache.contains(cache_keys[cell]):
+                    results[cell] = self.cache.get(cache_keys[cell])
+                else:
+                    all_parameters.append(dict(params,cell=cell))
+        print "Running grid search for BNMTF. Training %s of %s cells." % (len(all_parameters),len(cells))
+        
+        pool = Pool(self.P) if self.P is not None else None
+        try:
+            outputs = pool.imap_unordered(train_cell,all_parameters) if pool is not None else itertools.imap(train_cell,all_parameters)
+            for (cell,qualities) in outputs:
+                print "Finished K = %s, L = %s, restart %s." % (cell[0],cell[1],cell[2]+1)
+                results[cell] = qualities
+                if self.store is not None:
+                    self.store.add(cell,qualities)
+                if self.cache is not None:
+                    self.cache.add(cache_keys[cell],qualities)
+            if pool is not None:
+                pool.close()
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            
+        for (ik,K),(il,L) in itertools.product(enumerate(self.values_K),enumerate(self.values_L)):
+            qualities = best_restart([results[(K,L,r)] for r in range(0,self.restarts)])
+            for metric in metrics:
+                self.all_performances[metric][ik,il] = qualities[metric]
+        print "Finished running grid search for BNMTF."
+    
+    
+    # Return the priors for the given K and L, with matrices for lambdaF, lambdaS, lambdaG
+    def priors_KL(self,K,L):
+        priors = self.priors.copy()
+        priors['lambdaF'] = self.priors['lambdaF']*numpy.ones((self.I,K))
+        priors['lambdaS'] = self.priors['lambdaS']*numpy.ones((K,L))
+        priors['lambdaG'] = self.priors['lambdaG']*numpy.ones((self.J,L))
+        return priors
+    
+    
     def all_values(self,metric):
         assert metric in metrics, "Unrecognised metric name: %s." % metric
         return self.all_performances[metric]
@@ -18,6 +18,12 @@ We expect the following arguments:
 - iterations    - number of iterations to run 
 - restarts      - we run the classifier this many times and use the one with 
                   the highest log likelihood
+- parallel      - if True, we run the restarts in parallel processes and stop
+                  the losing ones early, in successive halving style, with
+                  eta as in parallel_restarts.py (default False, eta=2)
+- cache         - a ResultCache (see result_store.py). If given, each restart
+                  is seeded from its arguments, and restarts that are already
+                  in the cache are not trained again (default None)
 
 The line search can be started by running search().
 If we use Gibbs then we run search(burn_in=<>,thinning=<>).
@@ -28,10 +34,12 @@ be obtained using all_values(metric), and the best value of K can be returned
 using best_value(metric).
 """
 
+from parallel_restarts import ParallelRestarts, seeded_restarts, train_restarts_cached, best_restart
+
 metrics = ['BIC','AIC','loglikelihood','MSE','ELBO']
 
 class LineSearch:
-    def __init__(self,classifier,values_K,R,M,priors,initUV,iterations,restarts=1):
+    def __init__(self,classifier,values_K,R,M,priors,initUV,iterations,restarts=1,parallel=False,eta=2,cache=None):
         self.classifier = classifier
         self.values_K = values_K
         self.R = R
@@ -41,7 +49,11 @@ class LineSearch:
         self.initUV = initUV
         self.iterations = iterations
         self.restarts = restarts
+        self.parallel = parallel
+        self.eta = eta
+        self.cache = cache
         assert self.restarts > 0, "Need at least 1 restart."
+        assert not (self.parallel and self.cache is not None), "Cannot use a cache with parallel restarts, as these are stopped early."
         
         self.all_performances = {
             metric : []
@@ -52,22 +64,38 @@ class LineSearch:
     def search(self,burn_in=None,thinning=None,minimum_TN=None):
         for K in self.values_K:
             print "Running line search for BNMF. Trying K = %s." % K
-            best_BNMF = None
-            for r in range(0,self.restarts):
-                print "Restart %s for K = %s." % (r+1,K)
-                BNMF = self.classifier(self.R,self.M,K,self.priors)
-                BNMF.initialise(init=self.initUV)
-                if minimum_TN is None:
-                    BNMF.run(iterations=self.iterations)
-                else:
-                    BNMF.run(iterations=self.iterations,minimum_TN=minimum_TN)
+            if self.cache is not None:
+                qualities = self.train_cached(K,burn_in,thinning,minimum_TN)
+                for metric in metrics:
+                    self.all_performances[metric].append(qualities[metric])
+                continue
+            
+            if self.parallel:
+                best_BNMF = ParallelRestarts(
+                    classifier=self.classifier,
+                    model_args={'R':self.R,'M':self.M,'K':K,'priors':self.priors},
+                    init_args={'init':self.initUV},
+                    iterations=self.iterations,
+                    restarts=self.restarts,
+                    eta=self.eta,
+                    run_args={} if minimum_TN is None else {'minimum_TN':minimum_TN}).run(burn_in,thinning)
+            else:
+                best_BNMF = None
+                for r in range(0,self.restarts):
+                    print "Restart %s for K = %s." % (r+1,K)
+                    BNMF = self.classifier(self.R,self.M,K,self.priors)
+                    BNMF.initialise(init=self.initUV)
+                    if minimum_TN is None:
+                        BNMF.run(iterations=self.iterations)
+                    else:
+                        BNMF.run(iterations=self.iterations,minimum_TN=minimum_TN)
                 
-                args = {'metric':'loglikelihood'}
-                if burn_in is not None and thinning is not None:
-                    args['burn_in'], args['thinning'] = burn_in, thinning
+                    args = {'metric':'loglikelihood'}
+                    if burn_in is not None and thinning is not None:
+                        args['burn_in'], args['thinning'] = burn_in, thinning
                 
-                if best_BNMF is None or BNMF.quality(**args) > best_BNMF.quality(**args):
-                    best_BNMF = BNMF
+                    if best_BNMF is None or BNMF.quality(**args) > best_BNMF.quality(**args):
+                        best_BNMF = BNMF
             
             for metric in metrics:
                 if burn_in is not None and thinning is not None:
@@ -79,6 +107,21 @@ class LineSearch:
         print "Finished running line search for BNMF."
     
     
+    # Return the qualities of the best restart for K, training the restarts that are not in the cache
+    def train_cached(self,K,burn_in,thinning,minimum_TN):
+        params = {
+            'classifier' : self.classifier,
+            'model_args' : {'R':self.R,'M':self.M,'K':K,'priors':self.priors},
+            'init_args' : {'init':self.initUV},
+            'run_args' : {} if minimum_TN is None else {'minimum_TN':minimum_TN},
+            'iterations' : self.iterations,
+            'metrics' : metrics,
+            'burn_in' : burn_in,
+            'thinning' : thinning
+        }
+        return best_restart(train_restarts_cached(seeded_restarts(params,self.restarts,self.cache),self.cache))
+    
+    
     def all_values(self,metric):
         assert metric in metrics, "Unrecognised metric name: %s." % metric
         return self.all_performances[metric]
@@ -12,8 +12,14 @@ Arguments:
 - init_UV           - how we initialise U and V
 - iterations        - number of iterations we run each model
 - restarts          - the number of times we try each model when doing model selection
+- parallel          - if True, run the restarts in parallel processes, stopping the
+                      losing ones early (see parallel_restarts.py; default False, eta=2)
 - quality_metric    - the metric we use to measure model quality - MSE, AIC, or BIC
 - file_performance  - the file in which we store the performances
+- cache             - optionally a ResultCache (see result_store.py), used by the
+                      line searches and for the final models. The folds are then
+                      derived from the mask, and each restart seeded from its
+                      arguments, so restarts in the cache are not trained again.
 
 We start the search using run(). If we use ICM we use run(minimum_TN=<>)
 run(burn_in=<>,thinning=<>).
@@ -21,15 +27,15 @@ run(burn_in=<>,thinning=<>).
 
 import mask
 from line_search_bnmf import LineSearch
+from parallel_restarts import ParallelRestarts, seeded_restarts, train_restarts_cached, best_restart
 
 import numpy
 
 metrics = ['MSE','AIC','BIC']
 measures = ['R^2','MSE','Rp']
-attempts_generate_M = 100 
 
 class LineSearchCrossValidation:
-    def __init__(self,classifier,R,M,values_K,folds,priors,init_UV,iterations,restarts,quality_metric,file_performance):
+    def __init__(self,classifier,R,M,values_K,folds,priors,init_UV,iterations,restarts,quality_metric,file_performance,parallel=False,eta=2,cache=None):
         self.classifier = classifier
         self.R = numpy.array(R,dtype=float)
         self.M = numpy.array(M)
@@ -39,7 +45,10 @@ class LineSearchCrossValidation:
         self.init_UV = init_UV
         self.iterations = iterations
         self.restarts = restarts
+        self.parallel = parallel
+        self.eta = eta
         self.quality_metric = quality_metric
+        self.cache = cache
         
         self.fout = open(file_performance,'w')
         (self.I,self.J) = self.R.shape
@@ -52,12 +61,13 @@ class LineSearchCrossValidation:
         
     # Run the cross-validation
     def run(self,burn_in=None,thinning=None,minimum_TN=None):
-        folds_test = mask.compute_folds_attempts(I=self.I,J=self.J,no_folds=self.folds,attempts=attempts_generate_M,M=self.M)
-        folds_training = mask.compute_Ms(folds_test)
+        seed = None if self.cache is None else self.cache.seed({'M':self.M,'folds':self.folds})
+        folds = mask.compute_fold_indices(I=self.I,J=self.J,no_folds=self.folds,M=self.M,seed=seed)
 
         performances_test = {measure:[] for measure in measures}
-        for i,(train,test) in enumerate(zip(folds_training,folds_test)):
+        for i in range(0,len(folds)):
             print "Fold %s." % (i+1)
+            (train,test) = (folds.train(i),folds.test_indices(i))
             
             # Run the line search
             line_search = LineSearch(
@@ -68,7 +78,10 @@ class LineSearchCrossValidation:
                 priors=self.priors,
                 initUV=self.init_UV,
                 iterations=self.iterations,
-                restarts=self.restarts)
+                restarts=self.restarts,
+                parallel=self.parallel,
+                eta=self.eta,
+                cache=self.cache)
             line_search.search(burn_in=burn_in,thinning=thinning,minimum_TN=minimum_TN)
             
             # Store the model fits, and find the best one according to the metric    
@@ -100,9 +113,33 @@ class LineSearchCrossValidation:
         return { measure:(sum(values)/float(len(values))) for measure,values in performances.iteritems() }
 
         
-    # Initialises and runs the model, and returns the performance on the test set
+    # Initialises and runs the model, and returns the performance on the test set, given as a mask or the (rows,columns) of its entries
     def run_model(self,train,test,K,burn_in=None,thinning=None,minimum_TN=None):
         # We train <restarts> models, and use the one with the best log likelihood to make predictions   
+        if self.cache is not None:
+            params = {
+                'classifier' : self.classifier,
+                'model_args' : {'R':self.R,'M':train,'K':K,'priors':self.priors},
+                'init_args' : {'init':self.init_UV},
+                'run_args' : {} if minimum_TN is None else {'minimum_TN':minimum_TN},
+                'iterations' : self.iterations,
+                'metrics' : ['loglikelihood'],
+                'burn_in' : burn_in,
+                'thinning' : thinning,
+                'test' : test
+            }
+            return best_restart(train_restarts_cached(seeded_restarts(params,self.restarts,self.cache),self.cache))['performance']
+        elif self.parallel:
+            model = ParallelRestarts(
+                classifier=self.classifier,
+                model_args={'R':self.R,'M':train,'K':K,'priors':self.priors},
+                init_args={'init':self.init_UV},
+                iterations=self.iterations,
+                restarts=self.restarts,
+                eta=self.eta,
+                run_args={} if minimum_TN is None else {'minimum_TN':minimum_TN}).run(burn_in,thinning)
+            return model.predict(test) if burn_in is None or thinning is None else model.predict(test,burn_in,thinning)
+            
         best_loglikelihood = None
         best_performance = None
         for r in range(0,self.restarts):
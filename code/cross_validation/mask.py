@@ -1,9 +1,23 @@
 """
 Methods for (randomly) generating a mask M of 1 values if a value is known, and
 0 if a value is unknown
+
+The cross-validation folds are generated by compute_folds_attempts, which
+guarantees that every training fold has at least one observed entry in each
+row and column by construction: we first reserve one random observed entry of
+each row and column for training, and then split the other observed entries
+randomly into the folds. The training masks are then M minus each fold, as
+given by compute_Ms(folds_M,M).
+
+compute_fold_indices returns the folds as a Folds object instead, which only
+stores the fold number of each observed entry. The dense test and training
+masks of a fold are formed when they are needed, and the models can also be
+evaluated on the (rows,columns) of the test entries directly. This needs a single permutation of the indices from
+numpy.nonzero, rather than repeatedly drawing folds until they satisfy the
+constraint.
 """
 
-import numpy, random, itertools
+import numpy, random
 
 # Generate a mask matrix M with <fraction> missing entries
 def generate_M(I,J,fraction):
@@ -45,39 +59,74 @@ def try_generate_M_from_M(M,fraction,attempts):
 # Compute <no_folds> folds, returning a list of M's. If M is defined, we split
 # only the 1 entries into the folds.
 def compute_folds(I,J,no_folds,M=None):
-    if M is None:
-        M = numpy.ones((I,J))
-    else:
-        M = numpy.array(M)
-        
-    no_elements = sum([len([v for v in row if v]) for row in M])
-    indices = nonzero_indices(M)
-    
-    random.shuffle(indices)
-    split_places = [int(i*no_elements/no_folds) for i in range(0,no_folds+1)] #find the indices where the next fold start
-    split_indices = [indices[split_places[i]:split_places[i+1]] for i in range(0,no_folds)] #split the indices list into the folds
-    
-    folds_M = [] #list of the M's for the different folds
-    for indices in split_indices:
-        M = numpy.zeros((I,J))
-        for i,j in indices:
-            M[i][j] = 1
-        folds_M.append(M)
-        
-    return folds_M
+    M = numpy.ones((I,J)) if M is None else numpy.array(M)
+    (rows,columns) = numpy.nonzero(M)
+    folds = Folds(I,J,rows,columns,split_into_folds(no_folds,numpy.zeros(len(rows),dtype=bool)),no_folds)
+    return [folds.test(fold) for fold in range(0,no_folds)]
     
-# Make n attempts to generate the folds with the training data having at least 1 observed entry per row and column
+# Compute <no_folds> folds such that the training data (all other folds) has at least 1 observed entry per
+# row and column, returning a list of M's. We no longer need the attempts, but keep the argument.
 def compute_folds_attempts(I,J,no_folds,attempts,M=None):
-    for i in range(0,attempts):
-        folds_M = compute_folds(I=I,J=J,no_folds=no_folds,M=M)
-        success = True
-        for M_test in folds_M:
-            M_train = M - M_test
-            if not check_empty_rows_columns(M_train):
-                success = False
-        if success:
-            return folds_M
-    assert False, "Failed to generate folds for training and test data, %s attempts." % attempts
+    folds = compute_fold_indices(I,J,no_folds,M)
+    return [folds.test(fold) for fold in range(0,no_folds)]
+    
+# Compute <no_folds> folds such that the training data has at least 1 observed entry per row and column, as
+# a Folds object. We reserve one random observed entry of each row and column for training, so that these
+# are in none of the folds, and split the rest. If a seed is given we use it rather than numpy.random.
+def compute_fold_indices(I,J,no_folds,M=None,seed=None):
+    M = numpy.ones((I,J)) if M is None else numpy.array(M)
+    assert check_empty_rows_columns(M), "Cannot generate folds for training and test data, as M has a row or column without observed entries."
+    (rows,columns) = numpy.nonzero(M)
+    random_state = numpy.random if seed is None else numpy.random.RandomState(seed)
+    
+    # numpy.unique gives the first position of each row and column in the shuffled entries
+    permutation = random_state.permutation(len(rows))
+    reserved = numpy.zeros(len(rows),dtype=bool)
+    reserved[permutation[numpy.unique(rows[permutation],return_index=True)[1]]] = True
+    reserved[permutation[numpy.unique(columns[permutation],return_index=True)[1]]] = True
+    return Folds(I,J,rows,columns,split_into_folds(no_folds,reserved,random_state),no_folds)
+    
+# Shuffle the entries that are not reserved and split them evenly into <no_folds> folds, returning the fold
+# number of each entry (and <no_folds> for the reserved ones)
+def split_into_folds(no_folds,reserved,random_state=numpy.random):
+    free = random_state.permutation(numpy.flatnonzero(~reserved))
+    fold_of_entry = no_folds * numpy.ones(len(reserved),dtype=numpy.int16)
+    fold_of_entry[free] = numpy.arange(0,len(free)) * no_folds // max(len(free),1)
+    return fold_of_entry
+    
+# Return an I x J mask with 1 values for the entries (rows[n],columns[n])
+def dense_mask(I,J,rows,columns):
+    M = numpy.zeros((I,J))
+    M[rows,columns] = 1
+    return M
+    
+    
+class Folds:
+    """ Cross-validation folds of the observed entries (rows[n],columns[n]) of an I x J mask, stored as the
+        fold number of each entry, where entries with fold number no_folds are in none of the folds (and
+        always used for training). The dense masks are only formed when asked for. """
+    def __init__(self,I,J,rows,columns,fold_of_entry,no_folds):
+        (self.I,self.J) = (I,J)
+        (self.rows,self.columns) = (numpy.array(rows),numpy.array(columns))
+        self.fold_of_entry = numpy.array(fold_of_entry)
+        self.no_folds = no_folds
+        
+    def __len__(self):
+        return self.no_folds
+        
+    # Return the (rows,columns) of the test and training entries of the given fold
+    def test_indices(self,fold):
+        return (self.rows[self.fold_of_entry == fold],self.columns[self.fold_of_entry == fold])
+        
+    def train_indices(self,fold):
+        return (self.rows[self.fold_of_entry != fold],self.columns[self.fold_of_entry != fold])
+        
+    # Return the test and training masks M of the given fold
+    def test(self,fold):
+        return dense_mask(self.I,self.J,*self.test_indices(fold))
+        
+    def train(self,fold):
+        return dense_mask(self.I,self.J,*self.train_indices(fold))
     
 ''' Make cross-validation folds, but only use the first amount of specified rows 
     or columns for the cross-validation splitting.
@@ -122,23 +171,15 @@ def compute_crossval_folds_columns_attempts(M,no_columns,no_folds,attempts):
     
 # Return True if all rows and columns have at least one observation
 def check_empty_rows_columns(M):
-    sums_columns = M.sum(axis=0)
-    sums_rows = M.sum(axis=1)
-                
-    # Assert none of the rows or columns are entirely unknown values
-    for i,c in enumerate(sums_rows):
-        if c == 0:
-            return False
-    for j,c in enumerate(sums_columns):
-        if c == 0:
-            return False
-    return True
-    
-# Take in the ten fold M's, and construct the masks M for the other nine folds
-def compute_Ms(folds_M):
-    no_folds = len(folds_M)
-    folds_M = [numpy.array(fold_M) for fold_M in folds_M]
-    return [sum(folds_M[:fold]+folds_M[fold+1:]) for fold in range(0,no_folds)]
+    M = numpy.array(M)
+    return bool((M.sum(axis=0) != 0).all() and (M.sum(axis=1) != 0).all())
+    
+# Take in the fold M's and the full mask M, and construct the training mask M minus the fold for each fold.
+# We need M rather than the sum of the other folds, as the folds from compute_folds_attempts leave out the
+# entries reserved for training.
+def compute_Ms(folds_M,M):
+    M = numpy.array(M)
+    return [M - numpy.array(fold_M) for fold_M in folds_M]
 
 def calc_inverse_M(M):
     (I,J) = numpy.array(M).shape
@@ -151,8 +192,8 @@ def calc_inverse_M(M):
     
 # Return a list of indices of all nonzero indices in M
 def nonzero_indices(M):
-    (I,J) = numpy.array(M).shape
-    return [(i,j) for i,j in itertools.product(range(0,I),range(0,J)) if M[i][j]]
+    (rows,columns) = numpy.nonzero(numpy.array(M))
+    return zip(rows.tolist(),columns.tolist())
     
 # Return a list of lists, the ith list being of all indices j s.t. M[i,j] != 0
 def nonzero_row_indices(M):
@@ -22,6 +22,11 @@ We expect the following arguments:
 - train_config, the additional parameters to pass to the train function (e.g. no. of iterations).
     This should be a dictionary mapping parameter names to values 
 - file_performance, the location and name of the file in which we store the performances.
+- cache, optionally a ResultCache (see result_store.py). We then derive the
+    folds of each parameter configuration from the data, mask and parameters,
+    and seed each fold's training from its description (method, X, training
+    and test masks, parameters, train_config), so that folds that are already
+    in the cache are not trained again.
 
 For each of the parameter configurations in <parameter_search>, we split the
 dataset <X> into <K> folds (considering only 1 entries in <M>), and thus form
@@ -40,19 +45,18 @@ Methods:
 
 import mask
 
-import numpy
+import numpy, random
 import json
 
-attempts_generate_M = 1000
-
 class MatrixCrossValidation:
-    def __init__(self,method,X,M,K,parameter_search,train_config,file_performance):
+    def __init__(self,method,X,M,K,parameter_search,train_config,file_performance,cache=None):
         self.method = method
-        self.X = numpy.array(X,dtype=float)
-        self.M = numpy.array(M)
+        self.X = numpy.asarray(X,dtype=float)
+        self.M = numpy.asarray(M)
         self.K = K
         self.train_config = train_config
         self.parameter_search = parameter_search
+        self.cache = cache
         
         self.fout = open(file_performance,'w')
         (self.I,self.J) = self.X.shape
@@ -69,14 +73,14 @@ class MatrixCrossValidation:
             print "Trying parameters %s." % (parameters)
             
             try:
-                folds_test = mask.compute_folds_attempts(I=self.I,J=self.J,no_folds=self.K,attempts=attempts_generate_M,M=self.M)
-                folds_training = mask.compute_Ms(folds_test)
+                seed = None if self.cache is None else self.cache.seed({'M':self.M,'K':self.K,'parameters':parameters})
+                folds = mask.compute_fold_indices(I=self.I,J=self.J,no_folds=self.K,M=self.M,seed=seed)
                 
                 # We need to put the parameter dict into json to hash it
                 self.all_performances[self.JSON(parameters)] = {}
-                for i,(train,test) in enumerate(zip(folds_training,folds_test)):
+                for i in range(0,len(folds)):
                     print "Fold %s (parameters: %s)." % (i+1,parameters)
-                    performance_dict = self.run_model(train,test,parameters)
+                    performance_dict = self.run_model(folds.train(i),folds.test(i),parameters)
                     self.store_performances(performance_dict,parameters)
                     
                 self.log(parameters)
@@ -86,8 +90,22 @@ class MatrixCrossValidation:
                 self.fout.flush()
             
             
-    # Initialises and runs the model, and returns the performance on the test set
+    # Initialises and runs the model, and returns the performance on the test set. With a cache we
+    # use its result if it has one, and otherwise seed the training from the description and store it.
     def run_model(self,train,test,parameters):
+        if self.cache is not None:
+            description = {'method':self.method,'X':self.X,'train':train,'test':test,'parameters':parameters,'train_config':self.train_config}
+            key = self.cache.key(description)
+            if not self.cache.contains(key):
+                seed = self.cache.seed(description)
+                numpy.random.seed(seed)
+                random.seed(seed)
+                self.cache.add(key,self.train_and_predict(train,test,parameters))
+            return self.cache.get(key)
+        return self.train_and_predict(train,test,parameters)
+        
+    # Trains the model on the training set, and returns the performance on the test set
+    def train_and_predict(self,train,test,parameters):
         model = self.method(self.X,train,**parameters)
         model.train(**self.train_config)
         return model.predict(test)
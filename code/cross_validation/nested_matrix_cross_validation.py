@@ -16,7 +16,7 @@ We expect the following arguments:
 - X, the data matrix.
 - M, a mask matrix with 1 values where entries in X are known, and 0 where they are not.
 - K, the number of folds for cross-validation.
-- P, the number of parallel threads
+- P, the number of parallel processes, for the whole nested cross-validation
 - parameter_search, a list of dictionaries from parameter names to values, 
     defining the space of our parameter search.
 - train_config, the additional parameters to pass to the train function (e.g. no. of iterations).
@@ -25,6 +25,12 @@ We expect the following arguments:
     overall performances of the nested cross-validations.
 - files_nested_performances, a list of K locations+names of the files in which
     we store the performances of the parameter search cross-validation.
+- folder, optionally the folder in which we put the temporary memory-mapped
+    files (by default the system's temporary folder).
+- cache, optionally a ResultCache (see result_store.py). The outer folds are
+    then derived from the mask, the parameter searches use the cache as in
+    ParallelMatrixCrossValidation, and the final models of the outer folds
+    that are in the cache are not trained again.
 
 We split the dataset <X> up into <K> folds (considering only 1 entries in <M>),
 thus forming our <K> training and test sets. Then for each we run the regular
@@ -32,7 +38,15 @@ cross-validation framework to find the best parameters on the training dataset.
 Then we train a model using these parameters, and evaluate it on the test set.
 The performances are stored in <file_performance>.
 
-We use the parallel matrix cross-validation module.
+We use the parallel matrix cross-validation module, with one pool of <P>
+processes for the whole nested cross-validation: P is the CPU budget. The
+folds of the parameter search of all <K> outer folds are queued at the start,
+and the final model of an outer fold is trained as soon as its parameter
+search is done - before the remaining parameter search tasks, so that the
+outer folds finish one by one rather than all at the end. We keep at most P
+tasks in the pool at a time, so the final models do not have to wait behind
+the whole queue. X and the folds are shared with the workers through
+memory-mapped files in a temporary folder (inside <folder>, if given).
 
 Methods:
 - Constructor - simply takes in the arguments requires
@@ -44,22 +58,27 @@ Methods:
 """
 
 import mask
-from parallel_matrix_cross_validation import ParallelMatrixCrossValidation
+from parallel_matrix_cross_validation import ParallelMatrixCrossValidation, open_folds, run_fold
 
-import numpy
+from multiprocessing import Pool
+from collections import deque
+import numpy, os, shutil, tempfile, Queue, pickle
 
-attempts_generate_M = 1000
+# The longest we wait for the result of a task, in seconds
+max_wait = 7*24*60*60
 
 class MatrixNestedCrossValidation:
-    def __init__(self,method,X,M,K,P,parameter_search,train_config,file_performance,files_nested_performances):
+    def __init__(self,method,X,M,K,P,parameter_search,train_config,file_performance,files_nested_performances,folder=None,cache=None):
         self.method = method
-        self.X = numpy.array(X,dtype=float)
-        self.M = numpy.array(M)
+        self.X = numpy.asarray(X,dtype=float)
+        self.M = numpy.asarray(M)
         self.K = K
         self.P = P
         self.train_config = train_config
         self.parameter_search = parameter_search
         self.files_nested_performances = files_nested_performances        
+        self.folder = folder
+        self.cache = cache
         
         self.fout = open(file_performance,'w')
         (self.I,self.J) = self.X.shape
@@ -71,40 +90,117 @@ class MatrixNestedCrossValidation:
         
     # Run the cross-validation
     def run(self):
-        folds_test = mask.compute_folds_attempts(I=self.I,J=self.J,no_folds=self.K,attempts=attempts_generate_M,M=self.M)
-        folds_training = mask.compute_Ms(folds_test)       
+        seed = None if self.cache is None else self.cache.seed({'M':self.M,'folds':self.K})
+        folds = mask.compute_fold_indices(I=self.I,J=self.J,no_folds=self.K,M=self.M,seed=seed)
 
-        for i,(train,test) in enumerate(zip(folds_training,folds_test)):
-            print "Fold %s of nested cross-validation." % (i+1)            
+        folder = tempfile.mkdtemp(prefix='nested_crossval_',dir=self.folder)
+        try:
+            numpy.save(os.path.join(folder,'X.npy'),self.X)
+            folds_outer = open_folds(folder,'folds_outer',folds.rows,folds.columns,1)
+            folds_outer[0] = folds.fold_of_entry
+            folds_outer.flush()
+            del folds_outer
             
-            # Run the cross-validation
-            crossval = ParallelMatrixCrossValidation(
-            #crossval = MatrixCrossValidation(
-                method=self.method,
-                X=self.X,
-                M=train,
-                K=self.K,
-                parameter_search=self.parameter_search,
-                train_config=self.train_config,
-                file_performance=self.files_nested_performances[i],
-                P=self.P
-            )
-            crossval.run()
+            # Queue the parameter search tasks of all outer folds
+            self.crossvals = []
+            inner_tasks = deque()
+            for i in range(0,len(folds)):
+                crossval = ParallelMatrixCrossValidation(
+                    method=self.method,
+                    X=self.X,
+                    M=folds.train(i),
+                    K=self.K,
+                    parameter_search=self.parameter_search,
+                    train_config=self.train_config,
+                    file_performance=self.files_nested_performances[i],
+                    P=self.P,
+                    cache=self.cache
+                )
+                self.crossvals.append(crossval)
+                inner_tasks.extend([(i,task) for task in crossval.prepare(folder,'folds_%s' % i)])
+                crossval.M = None # its folds are in the files now, so we only hold one training mask at a time
+            no_remaining = [len([j for (j,task) in inner_tasks if j == i]) for i in range(0,len(folds))]
+            outer_tasks = deque()
+            performances = [None for i in range(0,len(folds))]
+            for i in range(0,len(folds)):
+                if no_remaining[i] == 0:
+                    self.queue_outer(folder,folds,i,outer_tasks,performances)
             
+            # Keep at most P tasks in the pool, giving priority to the final models of the outer folds
+            pool = Pool(self.P)
+            results = Queue.Queue()
+            (jobs,in_flight) = (0,{})
             try:
-                (best_parameters,_) = crossval.find_best_parameters(evaluation_criterion='MSE',low_better=True)
-                print "Best parameters for fold %s were %s." % (i+1,best_parameters)
-            except KeyError:
-                best_parameters = self.parameter_search[0]
-                print "Found no performances, dataset too sparse? Use first values instead for fold %s, %s." % (i+1,best_parameters)
+                while inner_tasks or outer_tasks or in_flight:
+                    while len(in_flight) < self.P and (inner_tasks or outer_tasks):
+                        (kind,(i,task)) = ('outer',outer_tasks.popleft()) if outer_tasks else ('inner',inner_tasks.popleft())
+                        # A task that cannot be sent to the pool never calls back, so we check it can be pickled here,
+                        # raising its error straight away. run_fold always returns a result that can be sent back.
+                        pickle.dumps(task,pickle.HIGHEST_PROTOCOL)
+                        in_flight[jobs] = (kind,i,task)
+                        pool.apply_async(run_fold,(task,),callback=lambda result,job=jobs: results.put((job,result)))
+                        jobs += 1
+                    
+                    # In Python 2 only a wait with a timeout can be interrupted (with Ctrl-C), so we give a long one
+                    (job,(index,fold,performance_dict,exception)) = results.get(True,max_wait)
+                    (kind,i,task) = in_flight.pop(job)
+                    
+                    if kind == 'inner':
+                        self.crossvals[i].receive(index,fold,performance_dict,exception)
+                        no_remaining[i] -= 1
+                        if no_remaining[i] == 0:
+                            self.queue_outer(folder,folds,i,outer_tasks,performances)
+                    elif exception is not None:
+                        raise Exception("Fold %s of nested cross-validation failed with exception:\n%s" % (i+1,exception))
+                    else:
+                        if 'key' in task:
+                            self.cache.add(task['key'],performance_dict)
+                        performances[i] = performance_dict
+                        print "Finished fold %s, with performances %s." % (i+1,performance_dict)            
+                pool.close()
+            finally:
+                pool.terminate()
+                pool.join()
+        finally:
+            shutil.rmtree(folder)
             
-            # Train the model and test the performance on the test set
-            performance_dict = self.run_model(train,test,best_parameters)
+        for performance_dict in performances:
             self.store_performances(performance_dict)
-            print "Finished fold %s, with performances %s." % (i+1,performance_dict)            
-            
         self.log()
-            
+        
+    # Queue the task from outer_task() for outer fold i, or with a cache that has its performance, store that instead
+    def queue_outer(self,folder,folds,i,outer_tasks,performances):
+        task = self.outer_task(folder,folds,i)
+        if 'key' in task and self.cache.contains(task['key']):
+            performances[i] = self.cache.get(task['key'])
+            print "Found fold %s in the cache, with performances %s." % (i+1,performances[i])
+        else:
+            outer_tasks.append((i,task))
+        
+    # Finish the parameter search of outer fold i, and return the task for training its final model with the best
+    # parameters. With a cache, the task also has the key and seed derived from its description.
+    def outer_task(self,folder,folds,i):
+        crossval = self.crossvals[i]
+        crossval.finish()
+        try:
+            (best_parameters,_) = crossval.find_best_parameters(evaluation_criterion='MSE',low_better=True)
+            print "Best parameters for fold %s were %s." % (i+1,best_parameters)
+        except KeyError:
+            best_parameters = self.parameter_search[0]
+            print "Found no performances, dataset too sparse? Use first values instead for fold %s, %s." % (i+1,best_parameters)
+        task = {
+            'index' : 0,
+            'fold' : i,
+            'folder' : folder,
+            'folds' : 'folds_outer',
+            'parameters' : best_parameters,
+            'method' : self.method,
+            'train_config' : self.train_config
+        }
+        if self.cache is not None:
+            description = {'method':self.method,'X':self.X,'train':folds.train(i),'test':folds.test(i),'parameters':best_parameters,'train_config':self.train_config}
+            (task['key'],task['seed']) = (self.cache.key(description),self.cache.seed(description))
+        return task
             
     # Initialises and runs the model, and returns the performance on the test set
     def run_model(self,train,test,parameters):  
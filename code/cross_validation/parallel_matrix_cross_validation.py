@@ -3,26 +3,89 @@ Parallel version of the MatrixCrossValidation class, where we parallelize
 the K-fold cross-validation for each parameter.
 We now have an extra parameter P for the initialisation, defining the number
 of parallel threads we should run.
+
+We use a single pool of P processes for the whole parameter search. The folds
+of all parameter values are put in one queue of (parameters,fold) tasks, which
+the workers take one at a time, so the workers stay busy even when there are
+fewer folds than processes. The performance of each fold is stored as soon as
+it finishes, and the average performances are logged in the order of the
+parameter search once all folds of a parameter value are done.
+
+The data matrix X and the folds are written once to memory-mapped .npy files
+in a temporary folder (inside the given folder, if any), rather than sent to the workers
+with each task. We store the (row,column) of each observed entry once, and
+the folds of each parameter value as the fold number of each of these entries
+(see mask.Folds), so the tasks only contain the folder, the index of the
+parameters and the fold number. The workers form the dense training and test
+masks of their fold just before training the model. Each worker maps the files once, and the operating system shares
+their pages between the workers. The models in code/models take the
+(read-only) memory-mapped X with numpy.asarray, without copying it, so we
+keep one copy of the data rather than P. A method that copies X in its
+constructor still gets a private copy in each worker. The files are removed
+at the end of run().
+
+With a cache (a ResultCache, see result_store.py) we derive the folds of each
+parameter value from the data, mask and parameters, as MatrixCrossValidation
+does, and look up each fold in the cache before queueing it. Only the folds
+that are not in the cache are sent to the workers, seeded from their
+description, and their performances are added to the cache as they come in.
+
+To run the tasks in a pool shared with other cross-validations (as the nested
+cross-validation does), use prepare(folder,name) to get the tasks, pass the
+result of run_fold for each of them to receive(), and call finish() at the end.
 """
 
 import mask
 from matrix_cross_validation import MatrixCrossValidation
 
 from multiprocessing import Pool
-import numpy
+import numpy, random, os, shutil, tempfile, traceback
+
+# The memory-mapped data and folds, opened once by each worker process
+shared = {}
+
 
-attempts_generate_M = 1000
+# Return the memory-mapped X in the given folder, and the entries and fold numbers in the files <name>_entries.npy
+# and <name>.npy, opening them if we have not done so yet
+def load_shared(folder,name):
+    if shared.get('folder') != folder:
+        shared['X'] = numpy.load(os.path.join(folder,'X.npy'),mmap_mode='r')
+        shared['folds'] = {}
+        shared['folder'] = folder
+    if name not in shared['folds']:
+        shared['folds'][name] = (numpy.load(os.path.join(folder,name+'_entries.npy'),mmap_mode='r'),
+                                 numpy.load(os.path.join(folder,name+'.npy'),mmap_mode='r'))
+    return (shared['X'],)+shared['folds'][name]
 
 
-# We try the parameters in parallel. This function either raises an Exception,
-# or returns a tuple (parameters,all_performances,average_performances)
+# Store the (rows,columns) of the observed entries in <folder>/<name>_entries.npy, and return a memory-mapped
+# array in <folder>/<name>.npy for the fold numbers of these entries for <no_searches> sets of folds
+def open_folds(folder,name,rows,columns,no_searches):
+    numpy.save(os.path.join(folder,name+'_entries.npy'),numpy.array([rows,columns]))
+    return numpy.lib.format.open_memmap(os.path.join(folder,name+'.npy'),mode='w+',dtype=numpy.int16,shape=(no_searches,len(rows)))
+
+
+# We try the parameters in parallel. This function returns a tuple (index,fold,performance_dict,None), or
+# (index,fold,None,traceback) if training failed, where index is the index of the parameters.
+# The performances are returned as floats, so that the result can always be sent back to the pool.
+# If the task has a seed we seed the random number generators with it first.
 def run_fold(params):
-    (parameters,X,train,test,method,train_config) = \
-        (params['parameters'],params['X'],params['train'],params['test'],params['method'],params['train_config'])    
-    performance_dict = run_model(method,X,train,test,parameters,train_config)
-    return performance_dict           
-    
-    
+    (index,fold,folder,name,parameters,method,train_config) = \
+        (params['index'],params['fold'],params['folder'],params['folds'],params['parameters'],params['method'],params['train_config'])
+    try:
+        (X,(rows,columns),folds) = load_shared(folder,name)
+        (I,J) = X.shape
+        test = mask.dense_mask(I,J,rows[folds[index] == fold],columns[folds[index] == fold])
+        train = mask.dense_mask(I,J,rows[folds[index] != fold],columns[folds[index] != fold])
+        if 'seed' in params:
+            numpy.random.seed(params['seed'])
+            random.seed(params['seed'])
+        performance_dict = run_model(method,X,train,test,parameters,train_config)
+        return (index,fold,{name:float(value) for (name,value) in performance_dict.iteritems()},None)
+    except Exception:
+        return (index,fold,None,traceback.format_exc())
+
+
 # Method for running the model with the given parameters
 def run_model(method,X,train,test,parameters,train_config):
     model = method(X,train,**parameters)
@@ -32,46 +95,109 @@ def run_model(method,X,train,test,parameters,train_config):
 
 # Class, redefining the run function
 class ParallelMatrixCrossValidation(MatrixCrossValidation):
-    def __init__(self,method,X,M,K,parameter_search,train_config,file_performance,P):
-        MatrixCrossValidation.__init__(self,method,X,M,K,parameter_search,train_config,file_performance)
-        self.P = P        
-        
+    def __init__(self,method,X,M,K,parameter_search,train_config,file_performance,P,folder=None,cache=None):
+        MatrixCrossValidation.__init__(self,method,X,M,K,parameter_search,train_config,file_performance,cache)
+        self.P = P
+        self.folder = folder
+
     # Run the cross-validation
     def run(self):
-        for parameters in self.parameter_search:
-            print "Trying parameters %s." % (parameters)
-            
+        folder = tempfile.mkdtemp(prefix='crossval_',dir=self.folder)
+        try:
+            numpy.save(os.path.join(folder,'X.npy'),self.X)
+            tasks = self.prepare(folder)
+
+            # Run the tasks in the pool, storing the performances as they come in
+            pool = Pool(self.P)
             try:
-                folds_test = mask.compute_folds_attempts(I=self.I,J=self.J,no_folds=self.K,attempts=attempts_generate_M,M=self.M)
-                folds_training = mask.compute_Ms(folds_test)
-                
-                # We need to put the parameter dict into json to hash it
-                self.all_performances[self.JSON(parameters)] = {}
-                
-                # Create the threads for the folds, and run them
-                pool = Pool(self.P)
-                all_parameters = [
-                    {
-                        'parameters' : parameters,
-                        'X' : numpy.copy(self.X),
-                        'train' : train,
-                        'test' : test,
-                        'method' : self.method,
-                        'train_config' : self.train_config                
-                    }
-                    for (train,test) in zip(folds_training,folds_test)
-                ]
-                outputs = pool.map(run_fold,all_parameters)
+                for (index,fold,performance_dict,exception) in pool.imap_unordered(run_fold,tasks,chunksize=1):
+                    self.receive(index,fold,performance_dict,exception)
                 pool.close()
-                
-                for performance_dict in outputs:
-                    self.store_performances(performance_dict,parameters)
-                    
-                self.log(parameters)
-                
-            except Exception as e:
-                self.fout.write("Tried parameters %s but got exception: %s. \n" % (parameters,e))
-                
+            finally:
+                pool.terminate()
+                pool.join()
+        finally:
+            shutil.rmtree(folder)
+        self.finish()
+
+    # Compute the folds for each of the parameters, store them in <folder>/<name>.npy (and the entries in
+    # <folder>/<name>_entries.npy), and return all folds in one list of tasks for run_fold. The folder should
+    # also contain X.npy. With a cache, the folds that are in it are stored straight away rather than queued.
+    def prepare(self,folder,name='folds'):
+        (rows,columns) = numpy.nonzero(self.M)
+        folds = open_folds(folder,name,rows,columns,len(self.parameter_search))
+        tasks = []
+        self.exceptions = {}
+        self.keys = {}
+        for index,parameters in enumerate(self.parameter_search):
+            try:
+                seed = None if self.cache is None else self.cache.seed({'M':self.M,'K':self.K,'parameters':parameters})
+                fold_indices = mask.compute_fold_indices(I=self.I,J=self.J,no_folds=self.K,M=self.M,seed=seed)
+            except Exception:
+                self.exceptions[index] = traceback.format_exc()
+                continue
+            folds[index] = fold_indices.fold_of_entry
+
+            # We need to put the parameter dict into json to hash it
+            self.all_performances[self.JSON(parameters)] = {}
+            for fold in range(0,len(fold_indices)):
+                task = {
+                    'index' : index,
+                    'fold' : fold,
+                    'folder' : folder,
+                    'folds' : name,
+                    'parameters' : parameters,
+                    'method' : self.method,
+                    'train_config' : self.train_config
+                }
+                if self.cache is not None:
+                    description = {'method':self.method,'X':self.X,'train':fold_indices.train(fold),'test':fold_indices.test(fold),'parameters':parameters,'train_config':self.train_config}
+                    self.keys[(index,fold)] = self.cache.key(description)
+                    if self.cache.contains(self.keys[(index,fold)]):
+                        self.store_performances(self.cache.get(self.keys[(index,fold)]),parameters)
+                        continue
+                    task['seed'] = self.cache.seed(description)
+                tasks.append(task)
+        folds.flush()
+        del folds
+
+        self.no_remaining = [len([task for task in tasks if task['index'] == index]) for index in range(0,len(self.parameter_search))]
+        self.next_to_log = 0
+        return tasks
+
+    # Store the result of one of the tasks from prepare() (and add it to the cache), and log the parameters whose
+    # folds are all done, in order
+    def receive(self,index,fold,performance_dict,exception):
+        self.no_remaining[index] -= 1
+        if exception is not None:
+            self.exceptions[index] = exception
+        else:
+            if (index,fold) in self.keys:
+                self.cache.add(self.keys[(index,fold)],performance_dict)
+            if index not in self.exceptions:
+                self.store_performances(performance_dict,self.parameter_search[index])
+
+        while self.next_to_log < len(self.parameter_search) and self.no_remaining[self.next_to_log] == 0:
+            self.log_or_exception(self.next_to_log,self.exceptions)
+            self.next_to_log += 1
+
+    # Log the parameters that are left, once all tasks are done
+    def finish(self):
+        while self.next_to_log < len(self.parameter_search):
+            self.log_or_exception(self.next_to_log,self.exceptions)
+            self.next_to_log += 1
+
+    # Log the average performances of the parameters with the given index, or the traceback if one of its folds failed
+    def log_or_exception(self,index,exceptions):
+        parameters = self.parameter_search[index]
+        if index in exceptions:
+            self.all_performances[self.JSON(parameters)] = {}
+            self.fout.write("Tried parameters %s but got exception:\n%s" % (parameters,exceptions[index]))
+            self.fout.flush()
+        else:
+            print "Finished parameters %s." % (parameters)
+            self.log(parameters)
+
     # Undo the function run_model:
     def run_model(self,train,test,parameters):
-        raise Exception("Using wrong method for ParallelMatrixCrossValidation! Use the one defined outside of the class.")
\ No newline at end of file
+        raise Exception("Using wrong method for ParallelMatrixCrossValidation! Use the one defined outside of the class.")
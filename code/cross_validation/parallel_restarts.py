@@ -0,0 +1,255 @@
+"""
+Run the restarts of a model in parallel, one process per restart, and stop the
+restarts that are clearly losing early on, in the style of successive halving
+(Jamieson and Talwalkar, Non-stochastic best arm identification and
+hyperparameter optimization, 2016). Only the survivors run all iterations.
+
+We expect the following arguments:
+- classifier    - the class of the model (VB, Gibbs or ICM), with methods
+                    initialise(**init_args), run(iterations,observers,**run_args),
+                    evaluate([metric]), and quality('loglikelihood') or
+                    quality('loglikelihood',burn_in,thinning) for Gibbs
+- model_args    - a dictionary of the arguments of the constructor, e.g.
+                    { 'R':R, 'M':M, 'K':K, 'L':L, 'priors':priors }
+- init_args     - a dictionary of the arguments of initialise(), e.g.
+                    { 'init_S':'random', 'init_FG':'kmeans' }
+- iterations    - the number of iterations the surviving restarts run
+- restarts      - the number of restarts
+- eta           - at each checkpoint we keep the best 1/eta of the restarts (default 2)
+- metric        - the metric from evaluate() used to compare the restarts at the
+                  checkpoints, where higher is better - 'loglikelihood' (default),
+                  or 'ELBO' for VB
+- run_args      - a dictionary of other arguments of run(), e.g. { 'minimum_TN':0.1 }
+- seeds         - a list of random seeds, one per restart (by default drawn
+                  from numpy.random, so the restarts do not share a random state)
+- P             - if given, the number of restarts that run at a time (default
+                  all of them)
+
+With s = ceil(log_eta(restarts)) rounds of halving, the checkpoints are at
+iterations/eta^s, ..., iterations/eta^2, iterations/eta. At each checkpoint
+every restart that is still running sends its current value of the metric to
+the parent process, which lets the best ceil(n/eta) of them continue and stops
+the others. The restarts that reach the end send back their trained model, and
+we return the one with the highest log likelihood - as the sequential restarts
+of the searches do.
+
+With P given, we run the restarts in batches of P: we start (or, after the
+first checkpoint, let continue) the next batch once the previous one has
+reached the checkpoint. A restart waiting at a checkpoint is idle, so at most
+P restarts are training at any time, and after each checkpoint only the
+survivors are run in batches.
+
+Usage:
+    restarts = ParallelRestarts(bnmtf_vb_optimised,{'R':R,'M':M,'K':K,'L':L,'priors':priors},
+                                {'init_S':'random','init_FG':'kmeans'},iterations=1000,restarts=4)
+    model = restarts.run()                      # or run(burn_in,thinning) for Gibbs
+After that, restarts.stopped_at[r] gives the iteration at which restart r was
+stopped (None if it ran all iterations), and restarts.values[r] the values of
+the metric it reported at the checkpoints.
+
+The trained models are sent back between processes, so they should be
+picklable (e.g. the Gibbs samplers with the default MemorySampleStore).
+
+For running many restarts (of different models) in a process pool without
+pruning, train_restart(params) trains one restart and returns its quality for
+each of the given metrics, and best_restart(all_qualities) picks the one with
+the highest log likelihood. If params contains a 'test' mask (or a tuple of
+the rows and columns of the test entries), the quality also includes the
+'performance' of model.predict() on it.
+
+With a ResultCache (see result_store.py), seeded_restarts(params,restarts,cache)
+gives the arguments of each restart with a seed derived from the others, and
+train_restarts_cached(all_params,cache,pool) only trains the restarts that
+are not in the cache yet, so repeated or interrupted searches reuse the fits
+they have already done.
+"""
+
+from multiprocessing import Process, Pipe
+import numpy, random, math, traceback, itertools
+
+
+class StopRestart(Exception):
+    """ Raised by the CheckpointObserver to stop the run() of a losing restart. """
+    pass
+
+
+class CheckpointObserver:
+    """ Observer for run() that reports the metric at each checkpoint, and waits to hear whether to continue. """
+    def __init__(self,connection,checkpoints,metric):
+        self.connection = connection
+        self.checkpoints = checkpoints
+        self.metric = metric
+
+    def start(self,model,iterations):
+        return
+
+    def notify(self,model,iteration,time):
+        if iteration not in self.checkpoints:
+            return
+        self.connection.send(('checkpoint',model.evaluate([self.metric])[self.metric]))
+        if not self.connection.recv():
+            raise StopRestart()
+
+    def close(self):
+        return
+
+
+# Train a single restart in a child process, sending ('checkpoint',value) messages and finally
+# ('finished',model), ('stopped',None) or ('error',message). This function is outside of the class
+# so the process does not need a copy of the manager.
+def run_restart(connection,classifier,model_args,init_args,run_args,iterations,checkpoints,metric,seed):
+    try:
+        numpy.random.seed(seed)
+        random.seed(seed)
+        model = classifier(**model_args)
+        model.initialise(**init_args)
+        model.run(iterations,observers=[CheckpointObserver(connection,checkpoints,metric)],**run_args)
+        connection.send(('finished',model))
+    except StopRestart:
+        connection.send(('stopped',None))
+    except Exception:
+        connection.send(('error',traceback.format_exc()))
+    connection.close()
+
+
+class ParallelRestarts:
+    def __init__(self,classifier,model_args,init_args,iterations,restarts,eta=2,metric='loglikelihood',run_args={},seeds=None,P=None):
+        assert restarts > 0, "Need at least 1 restart."
+        assert eta > 1, "eta should be greater than 1, but is %s." % eta
+        assert P is None or P > 0, "P should be at least 1, but is %s." % P
+        self.classifier = classifier
+        self.model_args = model_args
+        self.init_args = init_args
+        self.iterations = iterations
+        self.restarts = restarts
+        self.eta = eta
+        self.metric = metric
+        self.run_args = run_args
+        self.seeds = seeds if seeds is not None else list(numpy.random.randint(0,2**31-1,size=restarts))
+        assert len(self.seeds) == self.restarts, "Expected %s seeds, but got %s." % (self.restarts,len(self.seeds))
+        self.P = P if P is not None else restarts
+        self.checkpoints = compute_checkpoints(iterations,restarts,eta)
+
+
+    # Run the restarts in parallel, at most P at a time, pruning at the checkpoints, and return the best trained model
+    def run(self,burn_in=None,thinning=None):
+        self.connections = [None for r in range(0,self.restarts)]
+        self.processes = [None for r in range(0,self.restarts)]
+        self.values = [[] for r in range(0,self.restarts)]
+        self.stopped_at = [None for r in range(0,self.restarts)]
+        running = range(0,self.restarts)
+        try:
+            for checkpoint in self.checkpoints:
+                for batch in self.batches(running):
+                    for r in batch:
+                        self.advance(r)
+                    for r in batch:
+                        self.values[r].append(self.receive(r,'checkpoint'))
+                no_keep = int(math.ceil(len(running) / float(self.eta)))
+                ranked = sorted(running,key=lambda r: self.values[r][-1] if not numpy.isnan(self.values[r][-1]) else -numpy.inf,reverse=True)
+                for r in running:
+                    if r not in ranked[:no_keep]:
+                        self.connections[r].send(False)
+                        self.stopped_at[r] = checkpoint
+                        self.receive(r,'stopped')
+                running = sorted(ranked[:no_keep])
+                print "Checkpoint at iteration %s. Continuing restarts %s." % (checkpoint,[r+1 for r in running])
+
+            models = []
+            for batch in self.batches(running):
+                for r in batch:
+                    self.advance(r)
+                models += [(r,self.receive(r,'finished')) for r in batch]
+        finally:
+            for process in self.processes:
+                if process is None:
+                    continue
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        args = {'metric':'loglikelihood'}
+        if burn_in is not None and thinning is not None:
+            args['burn_in'], args['thinning'] = burn_in, thinning
+        self.loglikelihoods = { r:model.quality(**args) for (r,model) in models }
+        (best_r,best_model) = max(models,key=lambda r_model: self.loglikelihoods[r_model[0]])
+        print "Best restart: %s. Log likelihood: %s." % (best_r+1,self.loglikelihoods[best_r])
+        return best_model
+
+
+    # Split the restarts into batches of at most P
+    def batches(self,restarts):
+        return [restarts[i:i+self.P] for i in range(0,len(restarts),self.P)]
+
+    # Start restart r if it has not started yet, and otherwise let it continue from the checkpoint it waits at
+    def advance(self,r):
+        if self.processes[r] is not None:
+            self.connections[r].send(True)
+            return
+        (parent_connection,child_connection) = Pipe()
+        process = Process(target=run_restart,args=(
+            child_connection,self.classifier,self.model_args,self.init_args,self.run_args,
+            self.iterations,self.checkpoints,self.metric,self.seeds[r]))
+        process.start()
+        self.connections[r] = parent_connection
+        self.processes[r] = process
+
+    # Receive the next message from restart r, which should be of the given type, and return its value
+    def receive(self,r,expected):
+        (message,value) = self.connections[r].recv()
+        if message == 'error':
+            raise Exception("Restart %s failed with exception:\n%s" % (r+1,value))
+        assert message == expected, "Expected message '%s' from restart %s, but got '%s'." % (expected,r+1,message)
+        return value
+
+
+# Train a single restart with the given seed, and return a dictionary of its quality for each of the metrics.
+# This function is outside of a class so it can be used by a Pool.
+def train_restart(params):
+    (classifier,model_args,init_args,run_args,iterations,seed,metrics,burn_in,thinning) = \
+        (params['classifier'],params['model_args'],params['init_args'],params['run_args'],params['iterations'],
+         params['seed'],params['metrics'],params['burn_in'],params['thinning'])
+    numpy.random.seed(seed)
+    random.seed(seed)
+    model = classifier(**model_args)
+    model.initialise(**init_args)
+    model.run(iterations,**run_args)
+    if burn_in is None or thinning is None:
+        qualities = { metric:model.quality(metric) for metric in metrics }
+        if params.get('test') is not None:
+            qualities['performance'] = model.predict(params['test'])
+    else:
+        qualities = { metric:model.quality(metric,burn_in,thinning) for metric in metrics }
+        if params.get('test') is not None:
+            qualities['performance'] = model.predict(params['test'],burn_in,thinning)
+    return qualities
+
+# Return the arguments for train_restart of each of the restarts, with seeds derived from the other arguments
+def seeded_restarts(params,restarts,cache):
+    return [dict(params,seed=cache.seed(params,r)) for r in range(0,restarts)]
+
+# Return the qualities of each of the restarts (arguments for train_restart), taking them from the cache if it has
+# them, and otherwise training them - in the pool, if given - and adding them to the cache
+def train_restarts_cached(all_params,cache,pool=None):
+    keys = [cache.key(params) for params in all_params]
+    missing = []
+    for key,params in zip(keys,all_params):
+        if not cache.contains(key) and key not in [key_missing for (key_missing,_) in missing]:
+            missing.append((key,params))
+    train = pool.imap if pool is not None else itertools.imap
+    for (key,_),qualities in zip(missing,train(train_restart,[params for (_,params) in missing])):
+        cache.add(key,qualities)
+    return [cache.get(key) for key in keys]
+
+# Return the qualities of the restart with the highest log likelihood (the first one if there is a tie)
+def best_restart(all_qualities):
+    return max(all_qualities,key=lambda qualities: qualities['loglikelihood'])
+
+# Return the checkpoints iterations/eta^s, ..., iterations/eta, with s the number of halvings needed to get to
+# one restart. Checkpoints that round to the same iteration, or to 0, are merged or dropped.
+def compute_checkpoints(iterations,restarts,eta):
+    halvings = 0
+    while eta**halvings < restarts:
+        halvings += 1
+    checkpoints = [int(iterations / float(eta**s)) for s in range(halvings,0,-1)]
+    return sorted(set([checkpoint for checkpoint in checkpoints if 0 < checkpoint < iterations]))
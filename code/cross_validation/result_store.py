@@ -0,0 +1,134 @@
+"""
+On-disk store for the results of the searches, so that an interrupted search
+can be resumed where it stopped rather than starting from scratch.
+
+JSONLinesResultStore(filename) appends one JSON line { "key":key, "value":value }
+to the file for each result, as soon as it is added, and flushes it to disk.
+Keys are lists or tuples of JSON values (e.g. (K,L,restart)), and values any
+JSON value (e.g. a dictionary from metric names to values). If the file
+already exists we load its results first; a last line that was cut off when
+the process was killed is ignored (and that result is computed again).
+
+Usage:
+    store = JSONLinesResultStore('grid_search.jsonl')
+    if not store.contains(key):
+        store.add(key,value)
+    value = store.get(key)
+
+ResultCache(filename) is a store whose keys are the content_hash of a
+description of how the result was computed - e.g. the arguments for
+train_restart in parallel_restarts.py: the classifier, R, M, K, L, priors,
+initialisation, iterations and seed. Numpy arrays and sparse matrices are
+hashed by their contents, so the same cache file can be shared between
+searches, cross-validations and datasets, and a result is only reused for
+exactly the same fit. cache.seed(description,restart) gives a seed derived
+from the description, so that re-running a search gives the same restarts
+(and hence the same keys).
+
+Classes and functions are hashed by their module and name, and by their
+cache_version attribute if they have one. So bump the cache_version of a
+model class when a change makes its fits differ, and the cached fits of the
+old version are no longer used.
+
+Usage:
+    cache = ResultCache('results.jsonl')
+    key = cache.key(description)
+    if not cache.contains(key):
+        cache.add(key,compute(description))
+    value = cache.get(key)
+"""
+
+import json, os, hashlib, types
+import numpy, scipy.sparse
+
+
+class JSONLinesResultStore:
+    def __init__(self,filename):
+        self.filename = filename
+        self.results = {}
+        self.complete = True # whether the file ends with a complete line
+        if os.path.exists(self.filename):
+            self.load()
+
+    # Load the results from the file, skipping a line that was cut off
+    def load(self):
+        text = open(self.filename,'r').read()
+        for line in text.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            self.results[self.tuple_key(record['key'])] = record['value']
+        self.complete = text == '' or text.endswith('\n')
+
+    def contains(self,key):
+        return self.tuple_key(key) in self.results
+
+    def get(self,key):
+        return self.results[self.tuple_key(key)]
+
+    # Store the result, and append it to the file straight away
+    def add(self,key,value):
+        self.results[self.tuple_key(key)] = value
+        with open(self.filename,'a') as fout:
+            if not self.complete:
+                fout.write('\n')
+                self.complete = True
+            fout.write(json.dumps({'key':list(key),'value':value})+'\n')
+            fout.flush()
+            os.fsync(fout.fileno())
+
+    # JSON turns tuples into lists (and str into unicode), so we compare keys as tuples
+    def tuple_key(self,key):
+        return tuple(key)
+
+
+class ResultCache(JSONLinesResultStore):
+    def key(self,description):
+        return (content_hash(description),)
+
+    # Return a random seed for the given restart, derived from the description
+    def seed(self,description,restart=0):
+        return derived_seed((description,restart))
+
+
+# Return a random seed in [0,2**31-1) derived from the content_hash of the given value
+def derived_seed(value):
+    return int(content_hash(value)[:8],16) % (2**31-1)
+
+# Return the SHA-1 hex digest of the given value
+def content_hash(value):
+    digest = hashlib.sha1()
+    update_hash(digest,value)
+    return digest.hexdigest()
+
+# Add the value to the digest: arrays and sparse matrices by their contents, classes and functions by their
+# module, name and cache_version, numbers as floats (so 1 and 1. are the same), and dictionaries, lists and
+# tuples recursively
+def update_hash(digest,value):
+    if scipy.sparse.issparse(value):
+        value = scipy.sparse.csr_matrix(value)
+        digest.update('sparse%s;' % (value.shape,))
+        for array in [value.data,value.indices,value.indptr]:
+            update_hash(digest,array)
+    elif isinstance(value,numpy.ndarray):
+        digest.update('array%s%s;' % (value.dtype.str,value.shape))
+        digest.update(numpy.ascontiguousarray(value).tostring())
+    elif isinstance(value,dict):
+        digest.update('dict%s;' % len(value))
+        for key in sorted(value):
+            update_hash(digest,key)
+            update_hash(digest,value[key])
+    elif isinstance(value,(list,tuple)):
+        digest.update('list%s;' % len(value))
+        for item in value:
+            update_hash(digest,item)
+    elif isinstance(value,(type,types.ClassType,types.FunctionType)):
+        digest.update('class%s.%s;' % (value.__module__,value.__name__))
+        update_hash(digest,getattr(value,'cache_version',None))
+    elif isinstance(value,numpy.generic):
+        update_hash(digest,value.item())
+    elif isinstance(value,(int,long,float)) and not isinstance(value,bool):
+        digest.update('number%r;' % float(value))
+    else:
+        digest.update('%s%r;' % (type(value).__name__,value))
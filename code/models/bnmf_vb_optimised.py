@@ -28,9 +28,22 @@ We can test the performance of our model on a test dataset, specifying our test
     performance = BNMF.predict(M_pred)
 This gives a dictionary of performances,
     performance = { 'MSE', 'R^2', 'Rp' }
+We can also pass a list of metrics, e.g. predict(M_pred,metrics=['MSE','MAE']).
+These are computed in one pass over the entries in M_pred (see metrics.py).
+M_pred can also be a tuple (rows,columns) of index arrays, and we can get the
+predictions for just those entries, without forming the I x J reconstruction, using
+    predictions = BNMF.predict_entries(rows,columns)
     
-The performances of all iterations are stored in BNMF.all_performances, which 
-is a dictionary from 'MSE', 'R^2', or 'Rp' to a list of performances.
+For large, very sparse datasets we can pass sparse=True to the constructor, in
+which case only the observed entries of R are stored (as scipy.sparse matrices)
+and the updates cost O(|Omega|*K) rather than O(I*J*K) - see observed_entries.py.
+    
+By default run() does not evaluate the model while training. To track the
+convergence, pass a list of observers to run() - see observers.py. For example,
+    performances = MemorySink()
+    BNMF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],every=10,sinks=[performances])])
+gives a dictionary performances.values from 'MSE', 'R^2', or 'Rp' to a list of
+performances for every 10th iteration.
     
 Finally, we can return the goodness of fit of the data using the quality(metric) function:
 - metric = 'loglikelihood' -> return p(D|theta)
@@ -44,15 +57,23 @@ Finally, we can return the goodness of fit of the data using the quality(metric)
 from distributions.gamma import gamma_expectation, gamma_expectation_log, gamma_draw
 from distributions.truncated_normal_vector import TN_vector_expectation, TN_vector_variance
 from distributions.exponential import exponential_draw
+from observed_entries import sparse_R_M, observed_triplets, dot_entries, masked_values, dense_mask, mask_dot, mask_T_dot, apply_mask
+from observers import start_observers, notify_observers, close_observers
+from metrics import ObservedValues, compute_MSE, compute_R2, compute_Rp
 
 import numpy, itertools, math, scipy, time
 from scipy.stats import norm
 import matplotlib.pyplot as plt
 
 class bnmf_vb_optimised:
-    def __init__(self,R,M,K,priors):
-        self.R = numpy.array(R,dtype=float)
-        self.M = numpy.array(M,dtype=float)
+    def __init__(self,R,M,K,priors,sparse=False):
+        self.sparse = sparse
+        self.observed = None
+        if self.sparse:
+            (self.R,self.M) = sparse_R_M(R,M)
+        else:
+            self.R = numpy.asarray(R,dtype=float)
+            self.M = dense_mask(M)
         self.K = K
         
         assert len(self.R.shape) == 2, "Input matrix R is not a two-dimensional array, " \
@@ -63,6 +84,8 @@ class bnmf_vb_optimised:
         (self.I,self.J) = self.R.shape
         self.size_Omega = self.M.sum()
         self.check_empty_rows_columns()      
+        if self.sparse:
+            (self.rows_Omega,self.columns_Omega,self.R_Omega) = observed_triplets(self.R,self.M)
         
         self.alpha, self.beta, self.lambdaU, self.lambdaV = \
             float(priors['alpha']), float(priors['beta']), numpy.array(priors['lambdaU']), numpy.array(priors['lambdaV'])
@@ -79,8 +102,8 @@ class bnmf_vb_optimised:
             
     # Raise an exception if an entire row or column is empty
     def check_empty_rows_columns(self):
-        sums_columns = self.M.sum(axis=0)
-        sums_rows = self.M.sum(axis=1)
+        sums_columns = numpy.asarray(self.M.sum(axis=0)).ravel()
+        sums_rows = numpy.asarray(self.M.sum(axis=1)).ravel()
                     
         # Assert none of the rows or columns are entirely unknown values
         for i,c in enumerate(sums_rows):
@@ -118,14 +141,11 @@ class bnmf_vb_optimised:
         
 
     # Run the Gibbs sampler
-    def run(self,iterations):
+    def run(self,iterations,observers=[]):
         self.all_exp_tau = []  # to check for convergence 
         self.all_times = [] # to plot performance against time
         
-        metrics = ['MSE','R^2','Rp']
-        self.all_performances = {} # for plotting convergence of metrics
-        for metric in metrics:
-            self.all_performances[metric] = []
+        start_observers(observers,self,iterations)
         
         time_start = time.time()
         for it in range(0,iterations):
@@ -141,15 +161,11 @@ class bnmf_vb_optimised:
             self.update_exp_tau()
             self.all_exp_tau.append(self.exptau)
             
-            perf, elbo = self.predict(self.M), self.elbo()
-            for metric in metrics:
-                self.all_performances[metric].append(perf[metric])
-                
-            print "Iteration %s. ELBO: %s. MSE: %s. R^2: %s. Rp: %s." % (it+1,elbo,perf['MSE'],perf['R^2'],perf['Rp'])
-            
             time_iteration = time.time()
-            self.all_times.append(time_iteration-time_start)            
+            self.all_times.append(time_iteration-time_start)
+            notify_observers(observers,self,it+1,self.all_times[-1])
             
+        close_observers(observers)
         return
         
         
@@ -183,16 +199,35 @@ class bnmf_vb_optimised:
         self.beta_s = self.beta + 0.5*self.exp_square_diff()
         
     def exp_square_diff(self): # Compute: sum_Omega E_q(U,V) [ ( Rij - Ui Vj )^2 ]
-        return(self.M *( ( self.R - numpy.dot(self.expU,self.expV.T) )**2 + \
-                         ( numpy.dot(self.varU+self.expU**2, (self.varV+self.expV**2).T) - numpy.dot(self.expU**2,(self.expV**2).T) ) ) ).sum()
+        if self.sparse:
+            (rows,columns) = (self.rows_Omega,self.columns_Omega)
+            return ( self.residual_Omega(self.expU,self.expV)**2 + \
+                     dot_entries(self.varU+self.expU**2,self.varV+self.expV**2,rows,columns) - dot_entries(self.expU**2,self.expV**2,rows,columns) ).sum()
+        # The variance terms sum_Omega sum_k a_ik b_jk are sum_k a_ik (M b)_ik, so we do not need I x J matrices for them
+        return (self.masked_residual(self.expU,self.expV)**2).sum() + \
+               ( (self.varU+self.expU**2) * mask_dot(self.M,self.varV+self.expV**2) - self.expU**2 * mask_dot(self.M,self.expV**2) ).sum()
         
     def update_U(self,k):       
-        self.tauU[:,k] = self.exptau*(self.M*( self.varV[:,k] + self.expV[:,k]**2 )).sum(axis=1) #sum over j, so rows
-        self.muU[:,k] = 1./self.tauU[:,k] * (-self.lambdaU[:,k] + self.exptau*(self.M * ( (self.R-numpy.dot(self.expU,self.expV.T)+numpy.outer(self.expU[:,k],self.expV[:,k]))*self.expV[:,k] )).sum(axis=1)) 
+        E = self.masked_residual(self.expU,self.expV)
+        self.tauU[:,k] = self.exptau*mask_dot(self.M, self.varV[:,k] + self.expV[:,k]**2 ) #sum over j, so rows
+        self.muU[:,k] = 1./self.tauU[:,k] * (-self.lambdaU[:,k] + self.exptau*(E.dot(self.expV[:,k]) + self.expU[:,k]*mask_dot(self.M,self.expV[:,k]**2)))
         
     def update_V(self,k):
-        self.tauV[:,k] = self.exptau*(self.M.T*( self.varU[:,k] + self.expU[:,k]**2 )).T.sum(axis=0) #sum over i, so columns
-        self.muV[:,k] = 1./self.tauV[:,k] * (-self.lambdaV[:,k] + self.exptau*(self.M.T * ( (self.R-numpy.dot(self.expU,self.expV.T)+numpy.outer(self.expU[:,k],self.expV[:,k])).T*self.expU[:,k] )).T.sum(axis=0)) 
+        E = self.masked_residual(self.expU,self.expV)
+        self.tauV[:,k] = self.exptau*mask_T_dot(self.M, self.varU[:,k] + self.expU[:,k]**2 ) #sum over i, so columns
+        self.muV[:,k] = 1./self.tauV[:,k] * (-self.lambdaV[:,k] + self.exptau*(E.T.dot(self.expU[:,k]) + self.expV[:,k]*mask_T_dot(self.M,self.expU[:,k]**2)))
+        
+    # Return the residual R - U V.T on the observed entries, in sparse mode
+    def residual_Omega(self,U,V):
+        return self.R_Omega - dot_entries(U,V,self.rows_Omega,self.columns_Omega)
+        
+    # Return the residual R - U V.T on the observed entries and 0 elsewhere, as a CSR matrix in sparse mode
+    def masked_residual(self,U,V):
+        if self.sparse:
+            return masked_values(self.M,self.residual_Omega(U,V))
+        E = self.R - numpy.dot(U,V.T)
+        apply_mask(self.M,E)
+        return E
         
         
     # Update the expectations and variances
@@ -216,31 +251,48 @@ class bnmf_vb_optimised:
 
 
     # Compute the expectation of U and V, and use it to predict missing values
-    def predict(self,M_pred):
-        R_pred = numpy.dot(self.expU,self.expV.T)
-        MSE = self.compute_MSE(M_pred,self.R,R_pred)
-        R2 = self.compute_R2(M_pred,self.R,R_pred)    
-        Rp = self.compute_Rp(M_pred,self.R,R_pred)        
-        return {'MSE':MSE,'R^2':R2,'Rp':Rp}
+    def predict(self,M_pred,metrics=['MSE','R^2','Rp']):
+        observed = self.observed_values(M_pred)
+        return observed.performances(self.predict_entries(observed.rows,observed.columns),metrics)
         
+    # Return the predictions for the entries (rows[n],columns[n]) of R, without forming the I x J reconstruction
+    def predict_entries(self,rows,columns):
+        return dot_entries(self.expU,self.expV,rows,columns)
         
-    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation)
+        
+    # Compute the given metrics ('MSE', 'R^2', 'Rp', 'ELBO', 'exp_tau', 'loglikelihood') on the observed entries, for the observers of run()
+    def evaluate(self,metrics):
+        for metric in metrics:
+            assert metric in ['MSE','MAE','R^2','Rp','ELBO','exp_tau','loglikelihood'], "Unrecognised metric for evaluation: %s." % metric
+        performance_metrics = [metric for metric in metrics if metric in ['MSE','MAE','R^2','Rp']]
+        values = self.predict(self.M,metrics=performance_metrics) if performance_metrics else {}
+        if 'ELBO' in metrics:
+            values['ELBO'] = self.elbo()
+        if 'exp_tau' in metrics:
+            values['exp_tau'] = self.exptau
+        if 'loglikelihood' in metrics:
+            values['loglikelihood'] = self.log_likelihood()
+        return values
+        
+        
+    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) - see metrics.py
     def compute_MSE(self,M,R,R_pred):
-        return (M * (R-R_pred)**2).sum() / float(M.sum())
+        return compute_MSE(M,R,R_pred)
         
     def compute_R2(self,M,R,R_pred):
-        mean = (M*R).sum() / float(M.sum())
-        SS_total = float((M*(R-mean)**2).sum())
-        SS_res = float((M*(R-R_pred)**2).sum())
-        return 1. - SS_res / SS_total if SS_total != 0. else numpy.inf
+        return compute_R2(M,R,R_pred)
         
     def compute_Rp(self,M,R,R_pred):
-        mean_real = (M*R).sum() / float(M.sum())
-        mean_pred = (M*R_pred).sum() / float(M.sum())
-        covariance = (M*(R-mean_real)*(R_pred-mean_pred)).sum()
-        variance_real = (M*(R-mean_real)**2).sum()
-        variance_pred = (M*(R_pred-mean_pred)**2).sum()
-        return covariance / float(math.sqrt(variance_real)*math.sqrt(variance_pred))
+        return compute_Rp(M,R,R_pred)
+        
+    # Return the observed values of R for the mask M_pred (which can also be a tuple (rows,columns) of indices). We only
+    # keep them for the training mask self.M, which is our own copy and does not change, and compute them for other masks.
+    def observed_values(self,M_pred):
+        if M_pred is not self.M:
+            return ObservedValues(self.R,M_pred)
+        if self.observed is None:
+            self.observed = ObservedValues(self.R,self.M)
+        return self.observed
         
         
     # Functions for model selection, measuring the goodness of fit vs model complexity
@@ -256,12 +308,12 @@ class bnmf_vb_optimised:
             # -2*loglikelihood + 2*no. free parameters
             return - 2 * log_likelihood + 2 * (self.I*self.K+self.J*self.K)
         elif metric == 'MSE':
-            R_pred = numpy.dot(self.expU,self.expV.T)
-            return self.compute_MSE(self.M,self.R,R_pred)
+            observed = self.observed_values(self.M)
+            return observed.performances(dot_entries(self.expU,self.expV,observed.rows,observed.columns),['MSE'])['MSE']
         elif metric == 'ELBO':
             return self.elbo()
         
     def log_likelihood(self):
         # Return the likelihood of the data given the trained model's parameters
-        return self.size_Omega / 2. * ( self.explogtau - math.log(2*math.pi) ) \
-             - self.exptau / 2. * (self.M*( self.R - numpy.dot(self.expU,self.expV.T))**2).sum()
\ No newline at end of file
+        observed = self.observed_values(self.M)
+        return observed.log_likelihood(dot_entries(self.expU,self.expV,observed.rows,observed.columns),self.exptau,self.explogtau)
\ No newline at end of file
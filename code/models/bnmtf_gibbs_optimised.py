@@ -25,16 +25,43 @@ Or:
     
 This returns a tuple (Fs,Ss,Gs,taus) of lists of F, S, G, tau values - of size <iterations>.
 
+We keep track of the masked residual E = M * (R - F S G.T) throughout the run.
+It is recomputed once at the start of each iteration, and after each draw of a 
+column of F or G, or an element of S, we update it with a rank-one correction.
+This avoids recomputing F S G.T for each of the K+K*L+L updates.
+
+If R and M are very sparse, we can pass sparse=True to the constructor. We then
+only store the observed entries of R, as scipy.sparse matrices (R and M can be
+given as either dense or scipy.sparse matrices), and E is a sparse matrix with
+the same structure as M, so each iteration costs O(|Omega|*(K+L)) rather than 
+O(I*J*(K+L)) - see observed_entries.py.
+
 The expectation can be computed by specifying a burn-in and thinning rate, and using:
     BNMF.approx_expectation(burn_in,thinning)
+    
+Instead of keeping every draw of F, S, G in memory, we can pass a sample store
+to run(iterations,store), such as MemmapSampleStore(folder,burn_in,thinning), 
+which writes only the thinned post-burn-in draws to disk - see sample_store.py.
+With SummarySampleStore(burn_in,thinning,rows,columns) we do not keep any draws,
+but only running means and variances of F, S, G, tau, and a bounded sample of 
+the predictions for the given entries, to give credible intervals.
 
 We can test the performance of our model on a test dataset, specifying our test set with a mask M. 
     performance = BNMF.predict(M_pred,burn_in,thinning)
 This gives a dictionary of performances,
     performance = { 'MSE', 'R^2', 'Rp' }
+We can also pass a list of metrics, e.g. predict(M_pred,burn_in,thinning,metrics=['MSE','MAE']).
+These are computed in one pass over the entries in M_pred (see metrics.py).
+M_pred can also be a tuple (rows,columns) of index arrays, and we can get the
+predictions for just those entries, without forming the I x J reconstruction, using
+    predictions = BNMF.predict_entries(rows,columns,burn_in,thinning)
     
-The performances of all iterations are stored in BNMF.all_performances, which 
-is a dictionary from 'MSE', 'R^2', or 'Rp' to a list of performances.
+By default run() does not evaluate the model while training. To track the
+convergence, pass a list of observers to run() - see observers.py. For example,
+    performances = MemorySink()
+    BNMF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],every=10,sinks=[performances])])
+gives a dictionary performances.values from 'MSE', 'R^2', or 'Rp' to a list of
+performances for every 10th iteration.
     
 Finally, we can return the goodness of fit of the data using the quality(metric) function:
 - metric = 'loglikelihood' -> return p(D|theta)
@@ -49,13 +76,22 @@ from distributions.exponential import exponential_draw
 from distributions.gamma import gamma_draw
 from distributions.truncated_normal import TN_draw
 from distributions.truncated_normal_vector import TN_vector_draw
+from sample_store import MemorySampleStore, sample_mean
+from observed_entries import sparse_R_M, observed_triplets, triple_dot_entries, masked_values, dense, dense_mask, mask_dot, mask_T_dot, apply_mask, subtract_outer
+from observers import start_observers, notify_observers, close_observers
+from metrics import ObservedValues, compute_MSE, compute_R2, compute_Rp
 
 import numpy, itertools, math, time
 
 class bnmtf_gibbs_optimised:
-    def __init__(self,R,M,K,L,priors):
-        self.R = numpy.array(R,dtype=float)
-        self.M = numpy.array(M,dtype=float)
+    def __init__(self,R,M,K,L,priors,sparse=False):
+        self.sparse = sparse
+        self.observed = None
+        if self.sparse:
+            (self.R,self.M) = sparse_R_M(R,M)
+        else:
+            self.R = numpy.asarray(R,dtype=float)
+            self.M = dense_mask(M)
         self.K = K
         self.L = L
         
@@ -67,6 +103,8 @@ class bnmtf_gibbs_optimised:
         (self.I,self.J) = self.R.shape
         self.size_Omega = self.M.sum()
         self.check_empty_rows_columns()      
+        if self.sparse:
+            (self.rows_Omega,self.columns_Omega,self.R_Omega) = observed_triplets(self.R,self.M)
         
         self.alpha, self.beta, self.lambdaF, self.lambdaS, self.lambdaG = \
             float(priors['alpha']), float(priors['beta']), numpy.array(priors['lambdaF']), numpy.array(priors['lambdaS']), numpy.array(priors['lambdaG'])
@@ -86,8 +124,8 @@ class bnmtf_gibbs_optimised:
         
     # Raise an exception if an entire row or column is empty
     def check_empty_rows_columns(self):
-        sums_columns = self.M.sum(axis=0)
-        sums_rows = self.M.sum(axis=1)
+        sums_columns = numpy.asarray(self.M.sum(axis=0)).ravel()
+        sums_rows = numpy.asarray(self.M.sum(axis=1)).ravel()
                     
         # Assert none of the rows or columns are entirely unknown values
         for i,c in enumerate(sums_rows):
@@ -120,63 +158,64 @@ class bnmtf_gibbs_optimised:
                 self.G[j,l] = exponential_draw(self.lambdaG[j,l])
         elif init_FG == 'kmeans':
             print "Initialising F using KMeans."
-            kmeans_F = KMeans(self.R,self.M,self.K)
+            kmeans_F = KMeans(dense(self.R),dense(self.M),self.K)
             kmeans_F.initialise()
             kmeans_F.cluster()
             self.F = kmeans_F.clustering_results + 0.2            
             
             print "Initialising G using KMeans."
-            kmeans_G = KMeans(self.R.T,self.M.T,self.L)   
+            kmeans_G = KMeans(dense(self.R).T,dense(self.M).T,self.L)   
             kmeans_G.initialise()
             kmeans_G.cluster()
             self.G = kmeans_G.clustering_results + 0.2
 
+        self.compute_residual()
         self.tau = self.alpha_s() / self.beta_s()
 
 
     # Run the Gibbs sampler
-    def run(self,iterations):
-        self.all_F = numpy.zeros((iterations,self.I,self.K))  
-        self.all_S = numpy.zeros((iterations,self.K,self.L))   
-        self.all_G = numpy.zeros((iterations,self.J,self.L))  
-        self.all_tau = numpy.zeros(iterations)
+    def run(self,iterations,store=None,observers=[]):
+        self.store = store if store is not None else MemorySampleStore()
+        samples = self.store.allocate(iterations,{ 'F':(self.I,self.K), 'S':(self.K,self.L), 'G':(self.J,self.L), 'tau':() },predict=self.predict_draw)
+        (self.all_F,self.all_S,self.all_G,self.all_tau) = (samples['F'],samples['S'],samples['G'],samples['tau'])
         self.all_times = [] # to plot performance against time
         
-        metrics = ['MSE','R^2','Rp']
-        self.all_performances = {} # for plotting convergence of metrics
-        for metric in metrics:
-            self.all_performances[metric] = []
+        start_observers(observers,self,iterations)
         
         time_start = time.time()
-        for it in range(0,iterations):            
+        for it in range(0,iterations):
+            # Recompute the residual once per iteration, to avoid accumulating rounding errors
+            self.compute_residual()
+            
             for k in range(0,self.K):
                 tauFk = self.tauF(k)
                 muFk = self.muF(tauFk,k)
-                self.F[:,k] = TN_vector_draw(muFk,tauFk)
+                self.set_F(k,TN_vector_draw(muFk,tauFk))
                 
+            # F, G and tau are fixed while we draw S, so we compute the Gram products for all (k,l) at once,
+            # and only update FEG during the sweep. The residual is recomputed once afterwards.
+            self.compute_gram_S()
             for k,l in itertools.product(xrange(0,self.K),xrange(0,self.L)):
-                tauSkl = self.tauS(k,l)
-                muSkl = self.muS(tauSkl,k,l)
-                self.S[k,l] = TN_draw(muSkl,tauSkl)
+                tauSkl = self.tauS_gram(k,l)
+                muSkl = self.muS_gram(tauSkl,k,l)
+                self.set_S_gram(k,l,TN_draw(muSkl,tauSkl))
+            self.compute_residual()
                 
             for l in range(0,self.L):
                 tauGl = self.tauG(l)
                 muGl = self.muG(tauGl,l)
-                self.G[:,l] = TN_vector_draw(muGl,tauGl)
+                self.set_G(l,TN_vector_draw(muGl,tauGl))
                 
             self.tau = gamma_draw(self.alpha_s(),self.beta_s())
             
-            self.all_F[it], self.all_S[it], self.all_G[it], self.all_tau[it] = numpy.copy(self.F), numpy.copy(self.S), numpy.copy(self.G), self.tau
+            self.store.add(it,{ 'F':self.F, 'S':self.S, 'G':self.G, 'tau':self.tau })
             
-            perf = self.predict_while_running()
-            for metric in metrics:
-                self.all_performances[metric].append(perf[metric])
-                
-            print "Iteration %s. MSE: %s. R^2: %s. Rp: %s." % (it+1,perf['MSE'],perf['R^2'],perf['Rp'])
-        
             time_iteration = time.time()
-            self.all_times.append(time_iteration-time_start)            
+            self.all_times.append(time_iteration-time_start)
+            notify_observers(observers,self,it+1,self.all_times[-1])
             
+        close_observers(observers)
+        self.store.close()
         return (self.all_F, self.all_S, self.all_G, self.all_tau)
         
 
@@ -185,77 +224,158 @@ class bnmtf_gibbs_optimised:
         return numpy.dot(M1,numpy.dot(M2,M3))
         
         
+    # Compute the masked residual E = M * (R - F S G.T) from scratch
+    def compute_residual(self):
+        if self.sparse:
+            self.E = masked_values(self.M,self.residual_Omega(self.F,self.S,self.G))
+        else:
+            self.E = self.R - self.triple_dot(self.F,self.S,self.G.T)
+            apply_mask(self.M,self.E)
+        
+    # Set new values for F[:,k], S[k,l], G[:,l], and update the residual with a rank-one correction
+    def set_F(self,k,Fk):
+        Fk = numpy.array(Fk,dtype=float)
+        if self.sparse:
+            self.E.data -= ((Fk-self.F[:,k])[self.rows_Omega]) * numpy.dot(self.S[k],self.G.T)[self.columns_Omega]
+        else:
+            subtract_outer(self.E,self.M,Fk-self.F[:,k],numpy.dot(self.S[k],self.G.T))
+        self.F[:,k] = Fk
+        
+    def set_S(self,k,l,Skl):
+        if self.sparse:
+            self.E.data -= (Skl-self.S[k,l]) * self.F[self.rows_Omega,k] * self.G[self.columns_Omega,l]
+        else:
+            subtract_outer(self.E,self.M,(Skl-self.S[k,l])*self.F[:,k],self.G[:,l])
+        self.S[k,l] = Skl
+        
+    # Set a new value for S[k,l], and update the Gram product FEG computed by compute_gram_S() in O(K*L).
+    # The residual E is not updated, so call compute_residual() after the sweep over S.
+    def set_S_gram(self,k,l,Skl):
+        self.FEG -= (Skl-self.S[k,l]) * self.FFMGG[k,l]
+        self.S[k,l] = Skl
+        
+    def set_G(self,l,Gl):
+        Gl = numpy.array(Gl,dtype=float)
+        if self.sparse:
+            self.E.data -= numpy.dot(self.F,self.S[:,l])[self.rows_Omega] * ((Gl-self.G[:,l])[self.columns_Omega])
+        else:
+            subtract_outer(self.E,self.M,numpy.dot(self.F,self.S[:,l]),Gl-self.G[:,l])
+        self.G[:,l] = Gl
+        
+    # Return the predictions (F S G.T)[i,j] for the given lists of indices i and j, for the draw values = {'F','S','G'}
+    def predict_draw(self,values,rows,columns):
+        return triple_dot_entries(values['F'],values['S'],values['G'],rows,columns)
+        
+    # Return the residual R - F S G.T on the observed entries, in sparse mode
+    def residual_Omega(self,F,S,G):
+        return self.R_Omega - triple_dot_entries(F,S,G,self.rows_Omega,self.columns_Omega)
+        
+        
     # Compute the parameters for the distributions we sample from
     def alpha_s(self):   
         return self.alpha + self.size_Omega/2.0
     
     def beta_s(self):   
-        return self.beta + 0.5*(self.M*(self.R-self.triple_dot(self.F,self.S,self.G.T))**2).sum()
+        if self.sparse:
+            return self.beta + 0.5*(self.E.data**2).sum()
+        return self.beta + 0.5*(self.E**2).sum()
         
     def tauF(self,k):       
-        return self.tau * ( self.M * numpy.dot(self.S[k],self.G.T)**2 ).sum(axis=1)
+        return self.tau * mask_dot(self.M,numpy.dot(self.S[k],self.G.T)**2)
         
     def muF(self,tauFk,k):
-        return 1./tauFk * (-self.lambdaF[:,k] + self.tau*(self.M * ( (self.R-self.triple_dot(self.F,self.S,self.G.T)+numpy.outer(self.F[:,k],numpy.dot(self.S[k],self.G.T)))*numpy.dot(self.S[k],self.G.T) )).sum(axis=1)) 
+        SGk = numpy.dot(self.S[k],self.G.T)
+        return 1./tauFk * (-self.lambdaF[:,k] + self.tau*( self.E.dot(SGk) + self.F[:,k]*mask_dot(self.M,SGk**2) )) 
         
     def tauS(self,k,l):       
-        return self.tau * ( self.M * numpy.outer(self.F[:,k]**2,self.G[:,l]**2) ).sum()
+        return self.tau * numpy.dot(self.F[:,k]**2,mask_dot(self.M,self.G[:,l]**2))
         
     def muS(self,tauSkl,k,l):
-        return 1./tauSkl * (-self.lambdaS[k,l] + self.tau*(self.M * ( (self.R-self.triple_dot(self.F,self.S,self.G.T)+self.S[k,l]*numpy.outer(self.F[:,k],self.G[:,l]))*numpy.outer(self.F[:,k],self.G[:,l]) )).sum()) 
+        return 1./tauSkl * (-self.lambdaS[k,l] + self.tau*( numpy.dot(self.F[:,k],self.E.dot(self.G[:,l])) 
+                                                           + self.S[k,l]*numpy.dot(self.F[:,k]**2,mask_dot(self.M,self.G[:,l]**2)) )) 
+        
+    # Compute the mask-weighted Gram products for the updates of S in bulk, using matrix products:
+    # - FMG2[k,l] = sum_ij M_ij F_ik^2 G_jl^2, so that tauS(k,l) = tau * FMG2[k,l]
+    # - FEG[k,l] = sum_ij E_ij F_ik G_jl, using the current residual E
+    # - FFMGG[k,l,k',l'] = sum_ij M_ij F_ik G_jl F_ik' G_jl', the change in FEG when S[k',l'] decreases by 1
+    # These stay valid while F and G do not change, if we update S using set_S_gram().
+    def compute_gram_S(self):
+        FF = (self.F[:,:,None] * self.F[:,None,:]).reshape(self.I,self.K*self.K)
+        GG = (self.G[:,:,None] * self.G[:,None,:]).reshape(self.J,self.L*self.L)
+        self.FFMGG = numpy.dot(FF.T,mask_dot(self.M,GG)).reshape(self.K,self.K,self.L,self.L).transpose(0,2,1,3)
+        self.FMG2 = numpy.dot(self.F.T**2,mask_dot(self.M,self.G**2))
+        self.FEG = numpy.dot(self.F.T,self.E.dot(self.G))
+        
+    def tauS_gram(self,k,l):
+        return self.tau * self.FMG2[k,l]
+        
+    def muS_gram(self,tauSkl,k,l):
+        return 1./tauSkl * (-self.lambdaS[k,l] + self.tau*( self.FEG[k,l] + self.S[k,l]*self.FMG2[k,l] ))
         
     def tauG(self,l):       
-        return self.tau * ( self.M.T * numpy.dot(self.F,self.S[:,l])**2 ).T.sum(axis=0)
+        return self.tau * mask_T_dot(self.M,numpy.dot(self.F,self.S[:,l])**2)
         
     def muG(self,tauGl,l):
-        return 1./tauGl * (-self.lambdaG[:,l] + self.tau*(self.M * ( (self.R-self.triple_dot(self.F,self.S,self.G.T)+numpy.outer(numpy.dot(self.F,self.S[:,l]),self.G[:,l])).T * numpy.dot(self.F,self.S[:,l]) ).T).sum(axis=0)) 
+        FSl = numpy.dot(self.F,self.S[:,l])
+        return 1./tauGl * (-self.lambdaG[:,l] + self.tau*( self.E.T.dot(FSl) + self.G[:,l]*mask_T_dot(self.M,FSl**2) )) 
         
 
     # Return the average value for U, V, tau - i.e. our approximation to the expectations. 
     # Throw away the first <burn_in> samples, and then use every <thinning>th after.
     def approx_expectation(self,burn_in,thinning):
-        indices = range(burn_in,len(self.all_F),thinning)
-        exp_F = numpy.array([self.all_F[i] for i in indices]).sum(axis=0) / float(len(indices))      
-        exp_S = numpy.array([self.all_S[i] for i in indices]).sum(axis=0) / float(len(indices))   
-        exp_G = numpy.array([self.all_G[i] for i in indices]).sum(axis=0) / float(len(indices))  
-        exp_tau = sum([self.all_tau[i] for i in indices]) / float(len(indices))
+        exp_F = sample_mean(self.all_F,burn_in,thinning)
+        exp_S = sample_mean(self.all_S,burn_in,thinning)
+        exp_G = sample_mean(self.all_G,burn_in,thinning)
+        exp_tau = sample_mean(self.all_tau,burn_in,thinning)
         return (exp_F, exp_S, exp_G, exp_tau)
 
 
     # Compute the expectation of U and V, and use it to predict missing values
-    def predict(self,M_pred,burn_in,thinning):
+    def predict(self,M_pred,burn_in,thinning,metrics=['MSE','R^2','Rp']):
+        observed = self.observed_values(M_pred)
+        return observed.performances(self.predict_entries(observed.rows,observed.columns,burn_in,thinning),metrics)
+        
+    # Return the predictions for the entries (rows[n],columns[n]) of R, without forming the I x J reconstruction
+    def predict_entries(self,rows,columns,burn_in,thinning):
         (exp_F,exp_S,exp_G,_) = self.approx_expectation(burn_in,thinning)
-        R_pred = self.triple_dot(exp_F,exp_S,exp_G.T)
-        MSE = self.compute_MSE(M_pred,self.R,R_pred)
-        R2 = self.compute_R2(M_pred,self.R,R_pred)    
-        Rp = self.compute_Rp(M_pred,self.R,R_pred)        
-        return {'MSE':MSE,'R^2':R2,'Rp':Rp}
+        return triple_dot_entries(exp_F,exp_S,exp_G,rows,columns)
+        
+    def predict_while_running(self,metrics=['MSE','R^2','Rp']):
+        observed = self.observed_values(self.M)
+        return observed.performances(triple_dot_entries(self.F,self.S,self.G,observed.rows,observed.columns),metrics)
         
-    def predict_while_running(self):
-        R_pred = self.triple_dot(self.F,self.S,self.G.T)
-        MSE = self.compute_MSE(self.M,self.R,R_pred)
-        R2 = self.compute_R2(self.M,self.R,R_pred)    
-        Rp = self.compute_Rp(self.M,self.R,R_pred)        
-        return {'MSE':MSE,'R^2':R2,'Rp':Rp}
         
+    # Compute the given metrics ('MSE', 'R^2', 'Rp', 'tau', 'loglikelihood') on the observed entries, for the observers of run()
+    def evaluate(self,metrics):
+        for metric in metrics:
+            assert metric in ['MSE','MAE','R^2','Rp','tau','loglikelihood'], "Unrecognised metric for evaluation: %s." % metric
+        performance_metrics = [metric for metric in metrics if metric in ['MSE','MAE','R^2','Rp']]
+        values = self.predict_while_running(performance_metrics) if performance_metrics else {}
+        if 'tau' in metrics:
+            values['tau'] = self.tau
+        if 'loglikelihood' in metrics:
+            values['loglikelihood'] = self.log_likelihood(self.F,self.S,self.G,self.tau)
+        return values
         
-    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation)
+        
+    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) - see metrics.py
     def compute_MSE(self,M,R,R_pred):
-        return (M * (R-R_pred)**2).sum() / float(M.sum())
+        return compute_MSE(M,R,R_pred)
         
     def compute_R2(self,M,R,R_pred):
-        mean = (M*R).sum() / float(M.sum())
-        SS_total = float((M*(R-mean)**2).sum())
-        SS_res = float((M*(R-R_pred)**2).sum())
-        return 1. - SS_res / SS_total if SS_total != 0. else numpy.inf
+        return compute_R2(M,R,R_pred)
         
     def compute_Rp(self,M,R,R_pred):
-        mean_real = (M*R).sum() / float(M.sum())
-        mean_pred = (M*R_pred).sum() / float(M.sum())
-        covariance = (M*(R-mean_real)*(R_pred-mean_pred)).sum()
-        variance_real = (M*(R-mean_real)**2).sum()
-        variance_pred = (M*(R_pred-mean_pred)**2).sum()
-        return covariance / float(math.sqrt(variance_real)*math.sqrt(variance_pred))
+        return compute_Rp(M,R,R_pred)
+        
+    # Return the observed values of R for the mask M_pred (which can also be a tuple (rows,columns) of indices). We only
+    # keep them for the training mask self.M, which is our own copy and does not change, and compute them for other masks.
+    def observed_values(self,M_pred):
+        if M_pred is not self.M:
+            return ObservedValues(self.R,M_pred)
+        if self.observed is None:
+            self.observed = ObservedValues(self.R,self.M)
+        return self.observed
         
         
     # Functions for model selection, measuring the goodness of fit vs model complexity
@@ -274,13 +394,12 @@ class bnmtf_gibbs_optimised:
             # -2*loglikelihood + 2*no. free parameters
             return - 2 * log_likelihood + 2 * (self.I*self.K+self.K*self.L+self.J*self.L)
         elif metric == 'MSE':
-            R_pred = self.triple_dot(expF,expS,expG.T)
-            return self.compute_MSE(self.M,self.R,R_pred)
+            observed = self.observed_values(self.M)
+            return observed.performances(triple_dot_entries(expF,expS,expG,observed.rows,observed.columns),['MSE'])['MSE']
         elif metric == 'ELBO':
             return 0.
         
     def log_likelihood(self,expF,expS,expG,exptau):
         # Return the likelihood of the data given the trained model's parameters
-        explogtau = math.log(exptau)
-        return self.size_Omega / 2. * ( explogtau - math.log(2*math.pi) ) \
-             - exptau / 2. * (self.M*( self.R - self.triple_dot(expF,expS,expG.T) )**2).sum()
\ No newline at end of file
+        observed = self.observed_values(self.M)
+        return observed.log_likelihood(triple_dot_entries(expF,expS,expG,observed.rows,observed.columns),exptau)
\ No newline at end of file
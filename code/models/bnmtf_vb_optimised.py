@@ -34,9 +34,23 @@ We can test the performance of our model on a test dataset, specifying our test
     performance = BNMF.predict(M_pred)
 This gives a dictionary of performances,
     performance = { 'MSE', 'R^2', 'Rp' }
+We can also pass a list of metrics, e.g. predict(M_pred,metrics=['MSE','MAE']).
+These are computed in one pass over the entries in M_pred (see metrics.py).
+M_pred can also be a tuple (rows,columns) of index arrays, and we can get the
+predictions for just those entries, without forming the I x J reconstruction, using
+    predictions = BNMF.predict_entries(rows,columns)
     
-The performances of all iterations are stored in BNMF.all_performances, which 
-is a dictionary from 'MSE', 'R^2', or 'Rp' to a list of performances.
+For large, very sparse datasets we can pass sparse=True to the constructor, in
+which case only the observed entries of R are stored (as scipy.sparse matrices)
+and all the sums over Omega in the updates are computed using sparse-dense 
+products, costing O(|Omega|*(K+L)) rather than O(I*J*(K+L)) - see observed_entries.py.
+    
+By default run() does not evaluate the model while training. To track the
+convergence, pass a list of observers to run() - see observers.py. For example,
+    performances = MemorySink()
+    BNMF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],every=10,sinks=[performances])])
+gives a dictionary performances.values from 'MSE', 'R^2', or 'Rp' to a list of
+performances for every 10th iteration.
     
 Finally, we can return the goodness of fit of the data using the quality(metric) function:
 - metric = 'loglikelihood' -> return p(D|theta)
@@ -52,16 +66,25 @@ from distributions.gamma import gamma_expectation, gamma_expectation_log
 from distributions.truncated_normal import TN_expectation, TN_variance
 from distributions.truncated_normal_vector import TN_vector_expectation, TN_vector_variance
 from distributions.exponential import exponential_draw
+from observed_entries import sparse_R_M, observed_triplets, dot_entries, triple_dot_entries, masked_values, dense, dense_mask, mask_dot, mask_T_dot, apply_mask, subtract_outer
+from observers import start_observers, notify_observers, close_observers
+from metrics import ObservedValues, compute_MSE, compute_R2, compute_Rp
 
 import numpy, itertools, math, scipy, time
 from random import shuffle
 
 class bnmtf_vb_optimised:
-    def __init__(self,R,M,K,L,priors):
-        self.R = numpy.array(R,dtype=float)
-        self.M = numpy.array(M,dtype=float)
+    def __init__(self,R,M,K,L,priors,sparse=False):
+        self.sparse = sparse
+        self.observed = None
+        if self.sparse:
+            (self.R,self.M) = sparse_R_M(R,M)
+        else:
+            self.R = numpy.asarray(R,dtype=float)
+            self.M = dense_mask(M)
         self.K = K
         self.L = L
+        self.cache = None
         
         assert len(self.R.shape) == 2, "Input matrix R is not a two-dimensional array, " \
             "but instead %s-dimensional." % len(self.R.shape)
@@ -71,6 +94,8 @@ class bnmtf_vb_optimised:
         (self.I,self.J) = self.R.shape
         self.size_Omega = self.M.sum()
         self.check_empty_rows_columns()      
+        if self.sparse:
+            (self.rows_Omega,self.columns_Omega,self.R_Omega) = observed_triplets(self.R,self.M)
         
         self.alpha, self.beta, self.lambdaF, self.lambdaS, self.lambdaG = \
             float(priors['alpha']), float(priors['beta']), numpy.array(priors['lambdaF']), numpy.array(priors['lambdaS']), numpy.array(priors['lambdaG'])
@@ -90,8 +115,8 @@ class bnmtf_vb_optimised:
             
     # Raise an exception if an entire row or column is empty
     def check_empty_rows_columns(self):
-        sums_columns = self.M.sum(axis=0)
-        sums_rows = self.M.sum(axis=1)
+        sums_columns = numpy.asarray(self.M.sum(axis=0)).ravel()
+        sums_rows = numpy.asarray(self.M.sum(axis=1)).ravel()
                     
         # Assert none of the rows or columns are entirely unknown values
         for i,c in enumerate(sums_rows):
@@ -127,13 +152,13 @@ class bnmtf_vb_optimised:
                 self.muG[j,l] = exponential_draw(self.lambdaG[j,l])
         elif init_FG == 'kmeans':
             print "Initialising F using KMeans."
-            kmeans_F = KMeans(self.R,self.M,self.K)
+            kmeans_F = KMeans(dense(self.R),dense(self.M),self.K)
             kmeans_F.initialise()
             kmeans_F.cluster()
             self.muF = kmeans_F.clustering_results #+ 0.2            
             
             print "Initialising G using KMeans."
-            kmeans_G = KMeans(self.R.T,self.M.T,self.L)   
+            kmeans_G = KMeans(dense(self.R).T,dense(self.M).T,self.L)   
             kmeans_G.initialise()
             kmeans_G.cluster()
             self.muG = kmeans_G.clustering_results #+ 0.2
@@ -157,52 +182,53 @@ class bnmtf_vb_optimised:
 
 
     # Run the Gibbs sampler
-    def run(self,iterations):
+    def run(self,iterations,observers=[]):
         self.all_exp_tau = []  # to check for convergence 
         self.all_times = [] # to plot performance against time    
         
-        metrics = ['MSE','R^2','Rp']
-        self.all_performances = {} # for plotting convergence of metrics
-        for metric in metrics:
-            self.all_performances[metric] = []
+        start_observers(observers,self,iterations)
         
+        # Keep the products expF expS, expS expG.T, and the expected residual up to date while running
+        self.cache = self.compute_products()
         time_start = time.time()
         for it in range(0,iterations): 
             indices_kl = list(itertools.product(xrange(0,self.K),xrange(0,self.L)))
             shuffle(indices_kl)
+            # F, G and tau are fixed while we update S, so we compute the Gram products for all (k,l) at once
+            self.compute_gram_S()
             for k,l in indices_kl:
             #for k,l in itertools.product(xrange(0,self.K),xrange(0,self.L)):
-                self.update_S(k,l)
-                self.update_exp_S(k,l)
+                self.update_S_gram(k,l)
+                self.update_exp_S_gram(k,l)
+            self.cache = self.compute_products()
                 
+            # G is fixed while we update F, and F while we update G, so we compute their second moments once per sweep
+            moments_G = self.compute_moments_G()
             indices_k = list(range(0,self.K))
             shuffle(indices_k)
             for k in indices_k:
             #for k in range(0,self.K):
-                self.update_F(k)
+                self.update_F(k,moments_G)
                 self.update_exp_F(k)
                
+            moments_F = self.compute_moments_F()
             indices_l = list(range(0,self.L))
             shuffle(indices_l)
             for l in indices_l:
             #for l in range(0,self.L):
-                self.update_G(l)
+                self.update_G(l,moments_F)
                 self.update_exp_G(l)
                 
             self.update_tau()
             self.update_exp_tau()
             self.all_exp_tau.append(self.exptau)
             
-            perf, elbo = self.predict(self.M), self.elbo()
-            
-            for metric in metrics:
-                self.all_performances[metric].append(perf[metric])
-                
-            print "Iteration %s. ELBO: %s. MSE: %s. R^2: %s. Rp: %s." % (it+1,elbo,perf['MSE'],perf['R^2'],perf['Rp'])
-                        
             time_iteration = time.time()
-            self.all_times.append(time_iteration-time_start)            
+            self.all_times.append(time_iteration-time_start)
+            notify_observers(observers,self,it+1,self.all_times[-1])
             
+        self.cache = None
+        close_observers(observers)
         
     # Compute the ELBO
     def elbo(self):
@@ -230,6 +256,33 @@ class bnmtf_vb_optimised:
     def triple_dot(self,M1,M2,M3):
         return numpy.dot(M1,numpy.dot(M2,M3))
         
+    # Return the residual R - F S G.T on the observed entries, in sparse mode
+    def residual_Omega(self,F,S,G):
+        return self.R_Omega - triple_dot_entries(F,S,G,self.rows_Omega,self.columns_Omega)
+        
+    # Return the residual R - F S G.T on the observed entries and 0 elsewhere, as a CSR matrix in sparse mode
+    def masked_residual(self,F,S,G):
+        if self.sparse:
+            return masked_values(self.M,self.residual_Omega(F,S,G))
+        E = self.R - self.triple_dot(F,S,G.T)
+        apply_mask(self.M,E)
+        return E
+        
+    # Compute the products FS = expF expS, SG = expS expG.T, and the expected residual E = M * (R - expF expS expG.T)
+    def compute_products(self):
+        FS = numpy.dot(self.expF,self.expS)
+        SG = numpy.dot(self.expS,self.expG.T)
+        if self.sparse:
+            E = masked_values(self.M,self.R_Omega - dot_entries(FS,self.expG,self.rows_Omega,self.columns_Omega))
+        else:
+            E = self.R - numpy.dot(FS,self.expG.T)
+            apply_mask(self.M,E)
+        return (FS,SG,E)
+        
+    # Return the products (FS,SG,E), using the ones run() keeps up to date if we are running
+    def products(self):
+        return self.cache if self.cache is not None else self.compute_products()
+        
         
     # Update the parameters for the distributions
     def update_tau(self):   
@@ -237,17 +290,32 @@ class bnmtf_vb_optimised:
         self.beta_s = self.beta + 0.5*self.exp_square_diff()
         
     def exp_square_diff(self): # Compute: sum_Omega E_q(F,S,G) [ ( Rij - Fi S Gj )^2 ]
-        return (self.M*( self.R - self.triple_dot(self.expF,self.expS,self.expG.T) )**2).sum() + \
-               (self.M*( self.triple_dot(self.varF+self.expF**2, self.varS+self.expS**2, (self.varG+self.expG**2).T ) - self.triple_dot(self.expF**2,self.expS**2,(self.expG**2).T) )).sum() + \
-               (self.M*( numpy.dot(self.varF, ( numpy.dot(self.expS,self.expG.T)**2 - numpy.dot(self.expS**2,self.expG.T**2) ) ) )).sum() + \
-               (self.M*( numpy.dot( numpy.dot(self.expF,self.expS)**2 - numpy.dot(self.expF**2,self.expS**2), self.varG.T ) )).sum()
+        (FS,SG,E) = self.products()
+        (expF2,expS2,expG2) = (self.expF**2,self.expS**2,self.expG**2)
+        square_residual = (E.data**2).sum() if self.sparse else (E**2).sum()
+        return square_residual + \
+               ( numpy.dot(self.varF+expF2,self.varS+expS2) * mask_dot(self.M,self.varG+expG2) - numpy.dot(expF2,expS2) * mask_dot(self.M,expG2) ).sum() + \
+               ( self.varF * mask_dot(self.M, SG.T**2 - numpy.dot(expG2,expS2.T) ) ).sum() + \
+               ( ( FS**2 - numpy.dot(expF2,expS2) ) * mask_dot(self.M,self.varG) ).sum()
     
-    def update_F(self,k):  
-        varSkG = numpy.dot( self.varS[k]+self.expS[k]**2 , (self.varG+self.expG**2).T ) - numpy.dot( self.expS[k]**2 , (self.expG**2).T ) # Vector of size J
-        self.tauF[:,k] = self.exptau * numpy.dot( varSkG + ( numpy.dot(self.expS[k],self.expG.T) )**2 , self.M.T ) 
+    # Return the second moments of G that the updates of F use: (expG**2, varG+expG**2, M varG). These do not change
+    # while we update F, so run() computes them once per sweep; compute_moments_F() gives the same for F and the updates of G.
+    def compute_moments_G(self):
+        expG2 = self.expG**2
+        return (expG2,self.varG+expG2,mask_dot(self.M,self.varG))
         
-        diff_term = (self.M * ( (self.R-self.triple_dot(self.expF,self.expS,self.expG.T)+numpy.outer(self.expF[:,k],numpy.dot(self.expS[k],self.expG.T)) ) * numpy.dot(self.expS[k],self.expG.T) )).sum(axis=1)        
-        cov_term = ( self.M * ( ( numpy.dot(self.expS[k]*numpy.dot(self.expF,self.expS), self.varG.T) - numpy.outer(self.expF[:,k], numpy.dot( self.expS[k]**2, self.varG.T )) ) ) ).sum(axis=1)
+    def compute_moments_F(self):
+        expF2 = self.expF**2
+        return (expF2,self.varF+expF2,mask_T_dot(self.M,self.varF))
+    
+    def update_F(self,k,moments_G=None):  
+        (FS,SG,E) = self.products()
+        (expG2,exp2G,MvarG) = self.compute_moments_G() if moments_G is None else moments_G
+        varSkG = numpy.dot( self.varS[k]+self.expS[k]**2 , exp2G.T ) - numpy.dot( self.expS[k]**2 , expG2.T ) # Vector of size J
+        self.tauF[:,k] = self.exptau * mask_dot(self.M, varSkG + SG[k]**2 )
+        
+        diff_term = E.dot(SG[k]) + self.expF[:,k]*mask_dot(self.M,SG[k]**2)
+        cov_term = ( self.expS[k]*FS * MvarG ).sum(axis=1) - self.expF[:,k]*numpy.dot(MvarG,self.expS[k]**2)
         self.muF[:,k] = 1./self.tauF[:,k] * (
             - self.lambdaF[:,k]
             + self.exptau * diff_term
@@ -255,11 +323,12 @@ class bnmtf_vb_optimised:
         ) 
         
     def update_S(self,k,l):       
-        self.tauS[k,l] = self.exptau*(self.M*( numpy.outer( self.varF[:,k]+self.expF[:,k]**2 , self.varG[:,l]+self.expG[:,l]**2 ) )).sum()
+        E = self.masked_residual(self.expF,self.expS,self.expG)
+        self.tauS[k,l] = self.exptau*numpy.dot( self.varF[:,k]+self.expF[:,k]**2, mask_dot(self.M,self.varG[:,l]+self.expG[:,l]**2) )
         
-        diff_term = (self.M * ( (self.R-self.triple_dot(self.expF,self.expS,self.expG.T)+self.expS[k,l]*numpy.outer(self.expF[:,k],self.expG[:,l]) ) * numpy.outer(self.expF[:,k],self.expG[:,l]) )).sum()
-        cov_term_G = (self.M * numpy.outer( self.expF[:,k] * ( numpy.dot(self.expF,self.expS[:,l]) - self.expF[:,k]*self.expS[k,l] ), self.varG[:,l] )).sum()
-        cov_term_F = (self.M * numpy.outer( self.varF[:,k], self.expG[:,l]*(numpy.dot(self.expS[k],self.expG.T) - self.expS[k,l]*self.expG[:,l]) )).sum()        
+        diff_term = numpy.dot(self.expF[:,k],E.dot(self.expG[:,l])) + self.expS[k,l]*numpy.dot(self.expF[:,k]**2,mask_dot(self.M,self.expG[:,l]**2))
+        cov_term_G = numpy.dot( self.expF[:,k] * ( numpy.dot(self.expF,self.expS[:,l]) - self.expF[:,k]*self.expS[k,l] ), mask_dot(self.M,self.varG[:,l]) )
+        cov_term_F = numpy.dot( self.varF[:,k], mask_dot(self.M,self.expG[:,l]*(numpy.dot(self.expS[k],self.expG.T) - self.expS[k,l]*self.expG[:,l])) )
         self.muS[k,l] = 1./self.tauS[k,l] * (
             - self.lambdaS[k,l] 
             + self.exptau * diff_term
@@ -267,12 +336,39 @@ class bnmtf_vb_optimised:
             - self.exptau * cov_term_F
         ) 
         
-    def update_G(self,l):  
-        varFSl = numpy.dot( self.varF+self.expF**2 , self.varS[:,l]+self.expS[:,l]**2 ) - numpy.dot( self.expF**2 , self.expS[:,l]**2 ) # Vector of size I
-        self.tauG[:,l] = self.exptau * numpy.dot( ( varFSl + ( numpy.dot(self.expF,self.expS[:,l]) )**2 ).T, self.M) #sum over i, so columns        
+    # Compute the mask-weighted Gram products for the updates of S in bulk, using matrix products:
+    # - FMG2[k,l] = sum_ij M_ij (varF_ik+expF_ik^2) (varG_jl+expG_jl^2), so that tauS[k,l] = exptau * FMG2[k,l]
+    # - FEG[k,l] = sum_ij E_ij expF_ik expG_jl, with E = M * (R - expF expS expG.T)
+    # - FFMGG[k,l,k',l'] = sum_ij M_ij expF_ik expG_jl expF_ik' expG_jl', the change in FEG when expS[k',l'] decreases by 1
+    # - FFMvarG[k,k',l] = sum_ij M_ij expF_ik expF_ik' varG_jl, and varFMGG[k,l,l'] = sum_ij M_ij varF_ik expG_jl expG_jl'
+    # These stay valid while F, G and tau do not change, if we update S using update_exp_S_gram().
+    def compute_gram_S(self):
+        FF = (self.expF[:,:,None] * self.expF[:,None,:]).reshape(self.I,self.K*self.K)
+        GG = (self.expG[:,:,None] * self.expG[:,None,:]).reshape(self.J,self.L*self.L)
+        (_,_,E) = self.products()
+        (_,exp2G,MvarG) = self.compute_moments_G()
+        MGG = mask_dot(self.M,GG)
+        self.FMG2 = numpy.dot((self.varF+self.expF**2).T,mask_dot(self.M,exp2G))
+        self.FEG = numpy.dot(self.expF.T,E.dot(self.expG))
+        self.FFMGG = numpy.dot(FF.T,MGG).reshape(self.K,self.K,self.L,self.L).transpose(0,2,1,3)
+        self.FFMvarG = numpy.dot(FF.T,MvarG).reshape(self.K,self.K,self.L)
+        self.varFMGG = numpy.dot(self.varF.T,MGG).reshape(self.K,self.L,self.L)
+        
+    def update_S_gram(self,k,l):
+        self.tauS[k,l] = self.exptau*self.FMG2[k,l]
+        diff_term = self.FEG[k,l] + self.expS[k,l]*self.FFMGG[k,l,k,l]
+        cov_term_G = numpy.dot(self.FFMvarG[k,:,l],self.expS[:,l]) - self.FFMvarG[k,k,l]*self.expS[k,l]
+        cov_term_F = numpy.dot(self.varFMGG[k,l],self.expS[k]) - self.varFMGG[k,l,l]*self.expS[k,l]
+        self.muS[k,l] = 1./self.tauS[k,l] * ( - self.lambdaS[k,l] + self.exptau * diff_term - self.exptau * cov_term_G - self.exptau * cov_term_F )
         
-        diff_term = (self.M * ( (self.R-self.triple_dot(self.expF,self.expS,self.expG.T)+numpy.outer(numpy.dot(self.expF,self.expS[:,l]), self.expG[:,l]) ).T * numpy.dot(self.expF,self.expS[:,l]) ).T ).sum(axis=0)
-        cov_term = (self.M * ( numpy.dot(self.varF, (self.expS[:,l]*numpy.dot(self.expS,self.expG.T).T).T) - numpy.outer(numpy.dot(self.varF,self.expS[:,l]**2), self.expG[:,l]) )).sum(axis=0)
+    def update_G(self,l,moments_F=None):  
+        (FS,SG,E) = self.products()
+        (expF2,exp2F,MTvarF) = self.compute_moments_F() if moments_F is None else moments_F
+        varFSl = numpy.dot( exp2F , self.varS[:,l]+self.expS[:,l]**2 ) - numpy.dot( expF2 , self.expS[:,l]**2 ) # Vector of size I
+        self.tauG[:,l] = self.exptau * mask_T_dot(self.M, varFSl + FS[:,l]**2 )
+        
+        diff_term = E.T.dot(FS[:,l]) + self.expG[:,l]*mask_T_dot(self.M,FS[:,l]**2)
+        cov_term = ( self.expS[:,l]*SG.T * MTvarF ).sum(axis=1) - self.expG[:,l]*numpy.dot(MTvarF,self.expS[:,l]**2)
         self.muG[:,l] = 1./self.tauG[:,l] * (
             - self.lambdaG[:,l] 
             + self.exptau * diff_term
@@ -281,16 +377,45 @@ class bnmtf_vb_optimised:
 
     # Update the expectations and variances
     def update_exp_F(self,k):
+        expFk = numpy.copy(self.expF[:,k])
         self.expF[:,k] = TN_vector_expectation(self.muF[:,k],self.tauF[:,k])
         self.varF[:,k] = TN_vector_variance(self.muF[:,k],self.tauF[:,k])
+        if self.cache is not None:
+            self.update_cache_F(k,self.expF[:,k]-expFk)
         
     def update_exp_S(self,k,l):
         self.expS[k,l] = TN_expectation(self.muS[k,l],self.tauS[k,l])
         self.varS[k,l] = TN_variance(self.muS[k,l],self.tauS[k,l])
         
+    # Update the expectation of S[k,l], and also the Gram product FEG computed by compute_gram_S()
+    def update_exp_S_gram(self,k,l):
+        expSkl = self.expS[k,l]
+        self.update_exp_S(k,l)
+        self.FEG -= (self.expS[k,l]-expSkl) * self.FFMGG[k,l]
+        
     def update_exp_G(self,l):
+        expGl = numpy.copy(self.expG[:,l])
         self.expG[:,l] = TN_vector_expectation(self.muG[:,l],self.tauG[:,l])
         self.varG[:,l] = TN_vector_variance(self.muG[:,l],self.tauG[:,l])
+        if self.cache is not None:
+            self.update_cache_G(l,self.expG[:,l]-expGl)
+        
+    # Update the cached products with a rank-one correction when expF[:,k] or expG[:,l] changes by delta
+    def update_cache_F(self,k,delta):
+        (FS,SG,E) = self.cache
+        FS += numpy.outer(delta,self.expS[k])
+        if self.sparse:
+            E.data -= delta[self.rows_Omega] * SG[k,self.columns_Omega]
+        else:
+            subtract_outer(E,self.M,delta,SG[k])
+            
+    def update_cache_G(self,l,delta):
+        (FS,SG,E) = self.cache
+        SG += numpy.outer(self.expS[:,l],delta)
+        if self.sparse:
+            E.data -= FS[self.rows_Omega,l] * delta[self.columns_Omega]
+        else:
+            subtract_outer(E,self.M,FS[:,l],delta)
         
     def update_exp_tau(self):
         self.exptau = gamma_expectation(self.alpha_s,self.beta_s)
@@ -298,31 +423,48 @@ class bnmtf_vb_optimised:
 
 
     # Compute the expectation of U and V, and use it to predict missing values
-    def predict(self,M_pred):
-        R_pred = self.triple_dot(self.expF,self.expS,self.expG.T)
-        MSE = self.compute_MSE(M_pred,self.R,R_pred)
-        R2 = self.compute_R2(M_pred,self.R,R_pred)    
-        Rp = self.compute_Rp(M_pred,self.R,R_pred)        
-        return {'MSE':MSE,'R^2':R2,'Rp':Rp}
+    def predict(self,M_pred,metrics=['MSE','R^2','Rp']):
+        observed = self.observed_values(M_pred)
+        return observed.performances(self.predict_entries(observed.rows,observed.columns),metrics)
+        
+    # Return the predictions for the entries (rows[n],columns[n]) of R, without forming the I x J reconstruction
+    def predict_entries(self,rows,columns):
+        return triple_dot_entries(self.expF,self.expS,self.expG,rows,columns)
         
         
-    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation)
+    # Compute the given metrics ('MSE', 'R^2', 'Rp', 'ELBO', 'exp_tau', 'loglikelihood') on the observed entries, for the observers of run()
+    def evaluate(self,metrics):
+        for metric in metrics:
+            assert metric in ['MSE','MAE','R^2','Rp','ELBO','exp_tau','loglikelihood'], "Unrecognised metric for evaluation: %s." % metric
+        performance_metrics = [metric for metric in metrics if metric in ['MSE','MAE','R^2','Rp']]
+        values = self.predict(self.M,metrics=performance_metrics) if performance_metrics else {}
+        if 'ELBO' in metrics:
+            values['ELBO'] = self.elbo()
+        if 'exp_tau' in metrics:
+            values['exp_tau'] = self.exptau
+        if 'loglikelihood' in metrics:
+            values['loglikelihood'] = self.log_likelihood()
+        return values
+        
+        
+    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) - see metrics.py
     def compute_MSE(self,M,R,R_pred):
-        return (M * (R-R_pred)**2).sum() / float(M.sum())
+        return compute_MSE(M,R,R_pred)
         
     def compute_R2(self,M,R,R_pred):
-        mean = (M*R).sum() / float(M.sum())
-        SS_total = float((M*(R-mean)**2).sum())
-        SS_res = float((M*(R-R_pred)**2).sum())
-        return 1. - SS_res / SS_total if SS_total != 0. else numpy.inf
+        return compute_R2(M,R,R_pred)
         
     def compute_Rp(self,M,R,R_pred):
-        mean_real = (M*R).sum() / float(M.sum())
-        mean_pred = (M*R_pred).sum() / float(M.sum())
-        covariance = (M*(R-mean_real)*(R_pred-mean_pred)).sum()
-        variance_real = (M*(R-mean_real)**2).sum()
-        variance_pred = (M*(R_pred-mean_pred)**2).sum()
-        return covariance / float(math.sqrt(variance_real)*math.sqrt(variance_pred))
+        return compute_Rp(M,R,R_pred)
+        
+    # Return the observed values of R for the mask M_pred (which can also be a tuple (rows,columns) of indices). We only
+    # keep them for the training mask self.M, which is our own copy and does not change, and compute them for other masks.
+    def observed_values(self,M_pred):
+        if M_pred is not self.M:
+            return ObservedValues(self.R,M_pred)
+        if self.observed is None:
+            self.observed = ObservedValues(self.R,self.M)
+        return self.observed
         
         
     # Functions for model selection, measuring the goodness of fit vs model complexity
@@ -338,12 +480,12 @@ class bnmtf_vb_optimised:
             # -2*loglikelihood + 2*no. free parameters
             return - 2 * log_likelihood + 2 * (self.I*self.K+self.K*self.L+self.J*self.L)
         elif metric == 'MSE':
-            R_pred = self.triple_dot(self.expF,self.expS,self.expG.T)
-            return self.compute_MSE(self.M,self.R,R_pred)
+            observed = self.observed_values(self.M)
+            return observed.performances(triple_dot_entries(self.expF,self.expS,self.expG,observed.rows,observed.columns),['MSE'])['MSE']
         elif metric == 'ELBO':
             return self.elbo()
         
     def log_likelihood(self):
         # Return the likelihood of the data given the trained model's parameters
-        return self.size_Omega / 2. * ( self.explogtau - math.log(2*math.pi) ) \
-             - self.exptau / 2. * (self.M*( self.R - self.triple_dot(self.expF,self.expS,self.expG.T) )**2).sum()
\ No newline at end of file
+        observed = self.observed_values(self.M)
+        return observed.log_likelihood(triple_dot_entries(self.expF,self.expS,self.expG,observed.rows,observed.columns),self.exptau,self.explogtau)
\ No newline at end of file
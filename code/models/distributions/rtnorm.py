@@ -12,6 +12,7 @@ Created on Mon Aug 12 13:48:22 2013
 from scipy.special import erf
 from numpy.random import uniform as rand, normal as randn, randint as randi
 from numpy import sqrt, pi, exp, log, floor, array
+import numpy
 
 def rtnorm(a, b, mu=0., sigma=1., size=1, probabilities=False):
     r"""
@@ -27,6 +28,10 @@ def rtnorm(a, b, mu=0., sigma=1., size=1, probabilities=False):
  
     The parameter size allows to specify a vector length and if probabilities
     is set to True, the function also returns the vector of probabilities of X.
+    
+    The arguments a, b, mu and sigma can also be arrays (of the same shape, or
+    broadcastable to one), giving one draw per element; size is then ignored.
+    All draws are done at once, see rtstdnorm_vector.
 
     This implements an extension of Chopin's algorithm detailed in
     N. Chopin, "Fast simulation of truncated Gaussian distributions", Stat
@@ -59,19 +64,47 @@ def rtnorm(a, b, mu=0., sigma=1., size=1, probabilities=False):
     see http://www.gnu.org/licenses/old-licenses/gpl-2.0.txt.
     
     """
-    # Ensure these are floats for proper division values later on.
-    mu = float(mu)
-    sigma = float(sigma)
-    a = float(a)
-    b = float(b)
+    # Scalar arguments and a single draw (as for each element in the Gibbs
+    # samplers) are faster with the scalar algorithm than through the arrays
+    if size == 1 and all(numpy.ndim(v) == 0 for v in (a, b, mu, sigma)):
+        return rtnorm_scalar(float(a), float(b), float(mu), float(sigma), probabilities)
+
+    # Ensure these are float arrays of the same shape for proper division values later on.
+    a, b, mu, sigma = [numpy.array(v, dtype=float) for v in (a, b, mu, sigma)]
+    shape = numpy.broadcast(a, b, mu, sigma).shape
+    if shape == ():
+        shape = (size,)
+    a, b, mu, sigma = [numpy.broadcast_to(v, shape).ravel() for v in (a, b, mu, sigma)]
+
+    # Scaling
+    a = (a-mu) / sigma
+    b = (b-mu) / sigma
+
+    # Generate the random variables
+    r = rtstdnorm_vector(a, b)
+
+    # Scaling
+    r = r * sigma + mu
+
+    # Compute the probabilities
+    if probabilities:
+        Z = sqrt(pi/2)*sigma * (erf(b/sqrt(2))-erf(a/sqrt(2)))
+        Z = numpy.maximum(Z, 1e-15)      # Avoid NaN
+        p = exp(-(r-mu)**2/2/sigma**2) / Z
+        return r.reshape(shape), p.reshape(shape)
+    else:
+        return r.reshape(shape)
+
 
+def rtnorm_scalar(a, b, mu, sigma, probabilities):
+    # One draw for float arguments, using rtstdnorm
     # Scaling
     if not mu == 0. or not sigma == 1.:
         a = (a-mu) / sigma
         b = (b-mu) / sigma
 
-    # Generate the random variables
-    r = array([rtstdnorm(a, b) for x in range(size)])
+    # Generate the random variable
+    r = array([rtstdnorm(a, b)])
 
     # Scaling
     if not mu == 0. or not sigma == 1.:
@@ -218,6 +251,147 @@ def rtstdnorm(a, b):
     return r
 
 
+
+def rtstdnorm_vector(a, b):
+    r"""
+    Vectorised version of rtstdnorm: one draw from the truncated (normalized)
+    Gaussian in [a[n],b[n]] for each n. Each case of rtstdnorm is applied to 
+    the entries it concerns at once, and in each round of a rejection loop 
+    only the rejected entries are redrawn.
+    """
+    a = numpy.array(a, dtype=float).ravel()
+    b = numpy.array(b, dtype=float).ravel()
+    
+    # Left and right limits
+    xmin = -2.00443204036
+    xmax = 3.48672170399
+
+    # Check if a < b
+    if numpy.any(a >= b):
+        raise Exception('For a truncated ndst in [a,b] b must be greater than a.')
+    # If |a| > |b|, draw from [-b,-a] instead and flip the sign at the end
+    flip = abs(a) > abs(b)
+    a, b = numpy.where(flip, -b, a), numpy.where(flip, -a, b)
+    
+    r = numpy.empty(len(a))
+    # If a in the right tail (a > xmax), use rejection algorithm with
+    # a truncated exponential proposal
+    right = numpy.flatnonzero(a > xmax)
+    r[right] = rtexp_vector(a[right], b[right])
+    # If a in the left tail (a < xmin), use rejection algorithm with
+    # a Gaussian proposal
+    left = numpy.flatnonzero(a < xmin)
+    r[left] = rtgauss_vector(a[left], b[left])
+    # In other cases (xmin < a < xmax), use Chopin's algorithm
+    middle = numpy.flatnonzero((a >= xmin) & (a <= xmax))
+    r[middle] = rtchopin_vector(a[middle], b[middle])
+    
+    return numpy.where(flip, -r, r)
+
+
+def rtexp_vector(a, b):
+    # Rejection algorithm with a truncated exponential proposal, for a > 0.
+    # Use a low lower border for rand, as in rtstdnorm.
+    r = numpy.empty(len(a))
+    remaining = numpy.arange(len(a))
+    while len(remaining) > 0:
+        ar, br = a[remaining], b[remaining]
+        z = log(1 + rand(low=1E-15, size=len(remaining))*(exp(-ar*(br-ar)) - 1))
+        e = -log(rand(low=1E-15, size=len(remaining)))
+        accept = 2*ar**2*e > z**2
+        r[remaining[accept]] = (ar - z/ar)[accept]
+        remaining = remaining[~accept]
+    return r
+
+
+def rtgauss_vector(a, b):
+    # Rejection algorithm with a Gaussian proposal
+    r = numpy.empty(len(a))
+    remaining = numpy.arange(len(a))
+    while len(remaining) > 0:
+        sim = randn(size=len(remaining))
+        accept = (sim >= a[remaining]) & (sim <= b[remaining])
+        r[remaining[accept]] = sim[accept]
+        remaining = remaining[~accept]
+    return r
+
+
+def rtchopin_vector(a, b):
+    # Chopin's algorithm, for xmin <= a <= xmax
+    # Design variables
+    xmax = 3.48672170399
+    kmin = 5                        # if kb-ka < kmin then use a rejection algorithm
+    INVH = 1631.73284006            # 1/h, h being the minimal interval range
+    I0 = 3271                       # = - floor(x(1)/h)
+    ALPHA = 1.837877066409345       # = log(2*pi)
+    N = 4000                        # Index of the right tail
+    
+    # Compute ka and kb
+    ka = ncell[(I0 + floor(a*INVH)).astype(int)]
+    kb = numpy.full(len(a), N)
+    finite_b = numpy.flatnonzero(b < xmax)
+    kb[finite_b] = ncell[(I0 + floor(b[finite_b]*INVH)).astype(int)]
+    
+    r = numpy.empty(len(a))
+    
+    # If |b-a| is small, use rejection algorithm with a truncated exponential proposal
+    small = numpy.flatnonzero(abs(kb-ka) < kmin)
+    r[small] = rtexp_vector(a[small], b[small])
+    
+    remaining = numpy.flatnonzero(abs(kb-ka) >= kmin)
+    while len(remaining) > 0:
+        ar, br, kar, kbr = a[remaining], b[remaining], ka[remaining], kb[remaining]
+        n = len(remaining)
+        
+        # Sample integer between ka and kb (inclusive)
+        k = (kar + floor(rand(size=n)*(kbr-kar+1))).astype(int)
+        u1, u2 = rand(size=n), rand(size=n)
+        sim = numpy.empty(n)
+        accept = numpy.zeros(n, dtype=bool)
+        
+        # Right tail
+        tail = (k == N)
+        lbound = x[-1]
+        z = -log(u1[tail]) / lbound
+        e = -log(u2[tail])
+        sim[tail] = lbound + z
+        accept[tail] = (z**2 <= 2*e) & (z < br[tail]-lbound)
+        
+        # Two leftmost and rightmost regions
+        edge = ~tail & ((k <= kar+2) | ((k >= kbr) & (br < xmax)))
+        ke = k[edge]
+        sim_edge = x[ke] + (x[ke+1]-x[ke]) * u1[edge]
+        simy = yu[ke] * u2[edge]
+        sim[edge] = sim_edge
+        accept[edge] = (sim_edge >= ar[edge]) & (sim_edge <= br[edge]) & \
+            ((simy < yl_vector(ke)) | (sim_edge**2 + 2*log(simy) + ALPHA < 0))
+            
+        # All the other boxes
+        box = ~tail & ~edge
+        kx = k[box]
+        simy = yu[kx] * u1[box]
+        d = x[kx+1] - x[kx]
+        ylk = yl_vector(kx)
+        below = simy < ylk  # That's what happens most of the time 
+        sim_box = numpy.where(below, x[kx] + u1[box]*d*yu[kx]/ylk, x[kx] + d*u2[box])
+        sim[box] = sim_box
+        # Otherwise, check you're below the pdf curve
+        accept[box] = below | (sim_box**2 + 2*log(simy) + ALPHA < 0)
+        
+        r[remaining[accept]] = sim[accept]
+        remaining = remaining[~accept]
+    return r
+
+
+def yl_vector(k):
+    # Compute y_l from y_k, for an array of box indices k
+    N = 4000                        # Index of the right tail
+    yl0 = 0.053513975472            # y_l of the leftmost rectangle
+    ylN = 0.000914116389555         # y_l of the rightmost rectangle
+    ylk = numpy.where(k <= 1954, yu[numpy.maximum(k-1, 0)], yu[numpy.minimum(k+1, N)])
+    ylk = numpy.where(k == 0, yl0, ylk)
+    return numpy.where(k == N, ylN, ylk)
+
         # Tables
 x = array([
     -2.00443204036, -1.99990455547, -1.99541747213, -1.99096998962, \
@@ -2674,4 +2848,23 @@ ncell = array([
     4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, \
     4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, \
     4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, 4000, \
-    4000 ])
\ No newline at end of file
+    4000 ])
+
+
+'''
+# Compare the time taken for 10000 draws using scipy's truncnorm, the scalar 
+# algorithm (rtstdnorm), and the vectorised one (rtnorm).
+import time
+from scipy.stats import truncnorm
+draws = 10000
+for (a, b, mu, sigma) in [(0., numpy.inf, 1., 3.), (0., numpy.inf, -20., 1.), (-1., 1., 0., 1.)]:
+    time0 = time.time()
+    X1 = truncnorm((a-mu)/sigma, (b-mu)/sigma, loc=mu, scale=sigma).rvs(draws)
+    time1 = time.time()
+    X2 = array([rtstdnorm((a-mu)/sigma, (b-mu)/sigma) for i in range(draws)]) * sigma + mu
+    time2 = time.time()
+    X3 = rtnorm(a, b, mu=mu, sigma=sigma, size=draws)
+    time3 = time.time()
+    print "a=%s, b=%s, mu=%s, sigma=%s. Time taken: scipy %s, scalar %s, vectorised %s. Means: %s, %s, %s." % \
+        (a, b, mu, sigma, time1-time0, time2-time1, time3-time2, X1.mean(), X2.mean(), X3.mean())
+'''
@@ -8,69 +8,111 @@ for multiple independent variables - i.e. mu and tau are vectors.
 truncnorm: a, b = (myclip_a - my_mean) / my_std, (myclip_b - my_mean) / my_std
            loc, scale = mu, sigma
            
-We get efficient draws using the library rtnorm by C. Lassner, from:
-    http://miv.u-strasbg.fr/mazet/rtnorm/
-We compute the expectation and variance ourselves - note that we use the
-complementary error function for 1-cdf(x) = 0.5*erfc(x/sqrt(2)), as for large
-x (>8), cdf(x)=1., so we get 0. instead of something like n*e^-n.
+Draws are done for all variables at once using rejection sampling on the
+standardised lower bound a = -mu/sigma (the upper bound is always inf):
+- a <= 0: propose from the normal distribution, N(0,1), and reject values < a.
+- a > 0: propose from a shifted exponential, as in Robert (1995), "Simulation of
+  truncated normal variables". This also handles the far tail (mu << 0).
+Only the rejected subset is redrawn in each round. We draw the distance above
+the bound, z - a >= 0, so that mu + sigma*z does not suffer from cancellation 
+in the tail.
 
-As mu gets lower (negative), and tau higher, we get draws and expectations that
-are closer to an exponential distribution with scale parameter mu * tau.
+We compute the expectation and variance ourselves, for all variables at once.
+We write 1-cdf(x) = 0.5*erfcx(x/sqrt(2))*exp(-x^2/2) using the scaled 
+complementary error function, so that the inverse Mills ratio 
+lambda(x) = pdf(x) / (1-cdf(x)) = sqrt(2/pi) / erfcx(x/sqrt(2)) does not 
+underflow for large x (>8), where cdf(x)=1.
 
-The draws in this case work effectively, but computing the mean and variance
-fails due to numerical errors. As a result, the mean and variance go to 0 after
-a certain point.
-This point is: -38 * std.
-
-This means that we need to use the mean and variance of an exponential when
-|mu| gets close to 38*std.
-Therefore we use it when |mu| < 30*std.
+As mu gets lower (negative), and tau higher, we get expectations that are 
+closer to an exponential distribution with scale parameter mu * tau. In this
+tail (x = -mu/sigma > 5) the expectation sigma*(lambda(x)-x) and variance
+sigma^2*(1-lambda(x)*(lambda(x)-x)) suffer from cancellation, so we instead
+compute lambda(x)-x = 1/(x+2/(x+3/(x+...))) using its continued fraction, which
+has converged after 30 terms for x > 5. This way we do not need to switch to the
+moments of the exponential distribution when mu < -30*sigma.
 """
 import math, numpy, time
 import matplotlib.pyplot as plt
 from scipy.stats import truncnorm, norm
-from scipy.special import erfc
+from scipy.special import erfc, erfcx
 import rtnorm
 
 
-# TN draws
+# TN draws - mus and taus can be vectors or matrices of the same shape
 def TN_vector_draw(mus,taus):
-    sigmas = numpy.float64(1.0) / numpy.sqrt(taus)
-    draws = []
-    for (mu,sigma,tau) in zip(mus,sigmas,taus):
-        if tau == 0.:
-            draws.append(0)
-        else:
-            d = rtnorm.rtnorm(a=0., b=numpy.inf, mu=mu, sigma=sigma)[0]
-            d = d if (d >= 0. and d != numpy.inf and d != -numpy.inf and not numpy.isnan(d)) else 0.
-            draws.append(d)   
-    '''
-    draws = parallel_draw(self.mu,self.sigma,self.tau)
-    '''     
-    return draws           
+    mus, taus = numpy.array(mus,dtype=float), numpy.array(taus,dtype=float)
+    draws = numpy.zeros(mus.shape)
+    
+    # If tau == 0 we return 0, as we do when the bound is not finite
+    with numpy.errstate(divide='ignore',invalid='ignore'):
+        sigmas = numpy.float64(1.0) / numpy.sqrt(taus)
+        lower = - mus / sigmas
+    indices = numpy.flatnonzero((taus != 0.) & numpy.isfinite(lower))
+    
+    draws.flat[indices] = sigmas.flat[indices] * TN_standard_vector_draw_above(lower.flat[indices])
+    draws[~((draws >= 0.) & numpy.isfinite(draws))] = 0.
+    return draws
+
+# Draw z ~ TN(0,1) truncated to [a,inf) for each a in the vector, returning z - a
+def TN_standard_vector_draw_above(a):
+    offsets = numpy.zeros(len(a))
+    
+    # Normal proposal when the bound is below the mean
+    indices = numpy.flatnonzero(a <= 0.)
+    while len(indices) > 0:
+        z = numpy.random.normal(size=len(indices))
+        accept = z >= a[indices]
+        offsets[indices[accept]] = z[accept] - a[indices[accept]]
+        indices = indices[~accept]
+        
+    # Exponential proposal with optimal rate when the bound is above the mean
+    indices = numpy.flatnonzero(a > 0.)
+    while len(indices) > 0:
+        a_i = a[indices]
+        rates = 0.5 * ( a_i + numpy.sqrt(a_i**2 + 4.) )
+        e = numpy.random.exponential(size=len(indices)) / rates
+        accept = numpy.random.uniform(size=len(indices)) <= numpy.exp(-0.5*(a_i+e-rates)**2)
+        offsets[indices[accept]] = e[accept]
+        indices = indices[~accept]
+        
+    return offsets
        
 # TN expectation    
 def TN_vector_expectation(mus,taus):
-    sigmas = numpy.float64(1.0) / numpy.sqrt(taus)
-    x = - numpy.float64(mus) / sigmas
-    lambdax = norm.pdf(x)/(0.5*erfc(x/math.sqrt(2)))
-    exp = mus + sigmas * lambdax
-    
-    # Exp expectation - overwrite value if mu < -30*sigma
-    exp = [1./(numpy.abs(mu)*tau) if mu < -30 * sigma else v for v,mu,tau,sigma in zip(exp,mus,taus,sigmas)]
-    return [v if (v >= 0.0 and v != numpy.inf and v != -numpy.inf and not numpy.isnan(v)) else 0. for v in exp]
+    mus, taus = numpy.array(mus,dtype=float), numpy.array(taus,dtype=float)
+    with numpy.errstate(divide='ignore',invalid='ignore'):
+        sigmas = numpy.float64(1.0) / numpy.sqrt(taus)
+        (offsets,_) = TN_standard_moments(- mus / sigmas)
+        exp = sigmas * offsets
+    return numpy.where((exp >= 0.) & numpy.isfinite(exp), exp, 0.)
     
 # TN variance
 def TN_vector_variance(mus,taus):
-    sigmas = numpy.float64(1.0) / numpy.sqrt(taus)
-    x = - numpy.float64(mus) / sigmas
-    lambdax = norm.pdf(x)/(0.5*erfc(x/math.sqrt(2)))
-    deltax = lambdax*(lambdax-x)
-    var = sigmas**2 * ( 1 - deltax )
+    mus, taus = numpy.array(mus,dtype=float), numpy.array(taus,dtype=float)
+    with numpy.errstate(divide='ignore',invalid='ignore'):
+        sigmas = numpy.float64(1.0) / numpy.sqrt(taus)
+        (_,variances) = TN_standard_moments(- mus / sigmas)
+        var = sigmas**2 * variances
+    return numpy.where((var >= 0.) & numpy.isfinite(var), var, 0.)
     
-    # Exp variance - overwrite value if mu < -30*sigma
-    var = [(1./(numpy.abs(mu)*tau))**2 if mu < -30 * sigma else v for v,mu,tau,sigma in zip(var,mus,taus,sigmas)]
-    return [v if (v >= 0.0 and v != numpy.inf and v != -numpy.inf and not numpy.isnan(v)) else 0. for v in var]      
+# Return lambda(x) - x and 1 - delta(x) for the standardised lower bounds x, where lambda(x) = pdf(x) / (1-cdf(x))
+# is the inverse Mills ratio and delta(x) = lambda(x) * (lambda(x) - x). The TN(0,1) truncated to [x,inf) then
+# has expectation x + (lambda(x) - x) and variance 1 - delta(x).
+def TN_standard_moments(x):
+    with numpy.errstate(over='ignore',divide='ignore',invalid='ignore'):
+        lambdax = math.sqrt(2./math.pi) / erfcx(x/math.sqrt(2))
+        offsets = numpy.array(lambdax - x)
+        variances = numpy.array(1. - lambdax * offsets)
+        
+    # In the tail both differences suffer from cancellation, so we use the continued fraction instead
+    tail = x > 5.
+    x_tail = x[tail]
+    fraction = numpy.zeros(x_tail.shape)
+    for n in range(30,1,-1):
+        fraction = n / (x_tail + fraction)
+    offsets[tail] = 1. / (x_tail + fraction)
+    variances[tail] = offsets[tail] * (fraction - offsets[tail])
+    return (offsets,variances)
        
 # TN mode
 def TN_vector_mode(mus):
@@ -1,193 +1,236 @@
 import numpy, random, time
 
 max_iterations = 200 # safeguard - if it takes more than this many iterations, stop
+max_full_batch_points = 10000 # by default we cluster in mini-batches if there are more points than this
+default_batch_size = 1000
 
 # Cluster the rows of the dataset X, with missing values indicated by M.
+# Centroids are seeded with k-means++ (initialise(init='kmeans++'), the default) or uniformly at random
+# between the min and max of each coordinate (init='random'). cluster() then runs full-batch K-means if the
+# batch_size is at least the number of points, and otherwise mini-batch K-means (Sculley, Web-scale k-means
+# clustering, 2010), sampling batch_size points per iteration. By default we use mini-batches of
+# default_batch_size points when there are more than max_full_batch_points points.
+# We stop when at most a fraction <tolerance> of the points (of the batch) change cluster (default 0).
 class KMeans:
-    def __init__(self,X,M,K,resolve_empty='singleton'):
-        self.X = numpy.copy(X)
-        self.M = numpy.copy(M)
+    def __init__(self,X,M,K,resolve_empty='singleton',batch_size=None,tolerance=0.):
+        self.X = numpy.array(X,dtype=float)
+        self.M = numpy.array(M,dtype=float)
         self.K = K
         self.resolve_empty = resolve_empty
+        self.tolerance = tolerance
         
         assert len(self.X.shape) == 2, "Input matrix X is not a two-dimensional array, but instead %s-dimensional." % len(self.X.shape)
         assert self.X.shape == self.M.shape, "Input matrix X is not of the same size as the indicator matrix M: %s and %s respectively." % (self.X.shape,self.M.shape)
         assert self.K > 0, "K should be greater than 0."
+        assert 0 <= self.tolerance < 1, "tolerance should be between 0 and 1, but is %s." % self.tolerance
         
         (self.no_points,self.no_coordinates) = self.X.shape
-        self.no_unique_points = len(set([tuple(l) for l in self.X.tolist()]))    
+        if batch_size is None:
+            batch_size = default_batch_size if self.no_points > max_full_batch_points else self.no_points
+        assert batch_size > 0, "batch_size should be greater than 0."
+        self.batch_size = min(batch_size,self.no_points)
+        self.no_unique_points = len(numpy.unique(self.X,axis=0)) if self.no_points > 0 else 0
         
         if self.no_points < self.K: print "Want %s clusters but only have %s datapoints!" % (self.K,self.no_points)
         if self.no_unique_points < self.K: print "Want %s clusters but only have %s unique datapoints!" % (self.K,self.no_unique_points)
         
-        # Compute lists of which indices are known (from M) for each row/column
-        self.omega_rows = [[j for j in range(0,self.no_coordinates) if self.M[i,j]] for i in range(0,self.no_points)]        
-        self.omega_columns = [[i for i in range(0,self.no_points) if self.M[i,j]] for j in range(0,self.no_coordinates)]
-                    
         # Assert none of the rows are entirely unknown values
-        for i,omega_row in enumerate(self.omega_rows):
-            assert len(omega_row) != 0, "Fully unobserved row in X, row %s." % i
+        unobserved_rows = numpy.flatnonzero(self.M.sum(axis=1) == 0)
+        assert len(unobserved_rows) == 0, "Fully unobserved row in X, row %s." % unobserved_rows[0]
             
         # Columns can be entirely unknown - they just don't influence the clustering - but we need to remove them
-        columns_to_remove = [j for j,omega_column in enumerate(self.omega_columns) if len(omega_column) == 0]
+        columns_to_remove = list(numpy.flatnonzero(self.M.sum(axis=0) == 0))
         if len(columns_to_remove) > 0:
             print "WARNING: removed columns %s for K-means clustering as they have no observed datapoints." % columns_to_remove
             self.X = numpy.delete(self.X,columns_to_remove,axis=1)
             self.M = numpy.delete(self.M,columns_to_remove,axis=1)
             self.no_coordinates -= len(columns_to_remove)
-            self.omega_rows = [[j for j in range(0,self.no_coordinates) if self.M[i,j]] for i in range(0,self.no_points)]        
-            self.omega_columns = [[i for i in range(0,self.no_points) if self.M[i,j]] for j in range(0,self.no_coordinates)]
+            
+        # The masked data and its squares, used to compute the distances to all centroids at once
+        self.X_masked = numpy.where(self.M != 0,self.X,0.)
+        self.X_masked_squared = self.X_masked * self.X_masked
             
         # Initialise the distances from data points to the assigned cluster centroids to zeros
         self.distances = numpy.zeros(self.no_points)
     
     
-    """ Initialise the cluster centroids randomly """
-    def initialise(self,seed=None):
+    """ Initialise the cluster centroids using k-means++ ('kmeans++') or uniformly at random ('random') """
+    def initialise(self,seed=None,init='kmeans++'):
+        assert init in ['kmeans++','random'], "Unrecognised init option for K-means: %s." % init
         if seed is not None:
             random.seed(seed)
         
         # Compute the mins and maxes of the columns - i.e. the min and max of each dimension
-        self.mins = [min([self.X[i,j] for i in self.omega_columns[j]]) for j in range(0,self.no_coordinates)]
-        self.maxs = [max([self.X[i,j] for i in self.omega_columns[j]]) for j in range(0,self.no_coordinates)]
+        self.mins = numpy.where(self.M != 0,self.X,numpy.inf).min(axis=0)
+        self.maxs = numpy.where(self.M != 0,self.X,-numpy.inf).max(axis=0)
+        
+        if init == 'kmeans++':
+            self.kmeans_plus_plus()
+        else:
+            self.centroids = numpy.array([self.random_cluster_centroid() for k in xrange(0,self.K)]).reshape(self.K,self.no_coordinates)
+            self.mask_centroids = numpy.ones((self.K,self.no_coordinates))
+        self.cluster_assignments = -numpy.ones(self.no_points,dtype=int)
+        
         
-        # Randomly initialise the cluster centroids
-        self.centroids = [self.random_cluster_centroid() for k in xrange(0,self.K)]
-        self.cluster_assignments = numpy.array([-1 for d in xrange(0,self.no_points)])
-        self.mask_centroids = numpy.ones((self.K,self.no_coordinates))
+    # Pick the first centroid uniformly from the data points, and each next one with probability proportional to
+    # the distance to the closest centroid so far (Arthur and Vassilvitskii, k-means++, 2007). The centroids are
+    # the points themselves, so they are only known (mask 1) where the point is observed; the distances are the
+    # masked MSEs over the coordinates known in both. Points that share no coordinates with any centroid so far
+    # get the largest finite distance, and if all points are at distance 0 we pick uniformly.
+    def kmeans_plus_plus(self):
+        self.centroids = numpy.zeros((self.K,self.no_coordinates))
+        self.mask_centroids = numpy.zeros((self.K,self.no_coordinates))
+        closest = numpy.inf * numpy.ones(self.no_points)
+        for k in xrange(0,self.K):
+            weights = closest.copy()
+            finite = numpy.isfinite(weights)
+            weights[~finite] = weights[finite].max() if finite.any() else 1.
+            cumulative = weights.cumsum()
+            if cumulative[-1] > 0:
+                d = min(numpy.searchsorted(cumulative,random.random()*cumulative[-1],side='right'),self.no_points-1)
+            else:
+                d = random.randint(0,self.no_points-1)
+            
+            self.centroids[k] = self.X_masked[d]
+            self.mask_centroids[k] = self.M[d]
+            closest = numpy.minimum(closest,self.masked_MSEs(slice(None),self.centroids[k:k+1],self.mask_centroids[k:k+1])[:,0])
 
 
     # Randomly place a new cluster centroids, picking uniformly between the min and max of each coordinate
     def random_cluster_centroid(self):
-        centroid = []
-        for coordinate in xrange(0,self.no_coordinates):
-            value = random.uniform(self.mins[coordinate],self.maxs[coordinate])
-            centroid.append(value)     
-        return centroid    
+        return [random.uniform(self.mins[coordinate],self.maxs[coordinate]) for coordinate in xrange(0,self.no_coordinates)]
     
             
-    """ Perform the clustering, until there is no change """
+    """ Perform the clustering, until at most a fraction <tolerance> of the points change cluster """
     def cluster(self):
-        iteration = 1
-        change = True
-        while change:
-            print "Iteration: %s." % iteration
-            iteration += 1
-            change = self.assignment()
-            self.update()
-            
-            if iteration >= max_iterations:
-                print "WARNING: did not converge, stopped after %s iterations." % max_iterations
-                break
+        if self.batch_size < self.no_points:
+            self.cluster_mini_batches()
+        else:
+            iteration = 1
+            reassigned = self.no_points
+            while reassigned > self.tolerance * self.no_points:
+                print "Iteration: %s." % iteration
+                iteration += 1
+                reassigned = self.assignment()
+                self.update()
+                
+                if iteration >= max_iterations:
+                    print "WARNING: did not converge, stopped after %s iterations." % max_iterations
+                    break
             
         # At the end, we create a binary matrix indicating which points were assigned to which cluster
         self.create_matrix()
+        
+        
+    # Mini-batch K-means: each iteration we assign a random batch of points to the closest centroids, and move
+    # each centroid coordinate towards the mean of the known values of its new points, with learning rate one
+    # over the number of values it has seen so far. We stop when at most a fraction <tolerance> of the batch
+    # changes cluster because of the update. Finally we assign all points once, and update the centroids as in
+    # full-batch K-means (which also resolves empty clusters).
+    def cluster_mini_batches(self):
+        counts = numpy.zeros((self.K,self.no_coordinates))
+        for iteration in xrange(1,max_iterations+1):
+            batch = numpy.array(random.sample(xrange(0,self.no_points),self.batch_size))
+            assignments = self.masked_MSEs(batch,self.centroids,self.mask_centroids).argmin(axis=1)
+            
+            (sums,counts_batch,_) = self.cluster_sums(assignments,batch)
+            counts += counts_batch
+            self.centroids += (sums - counts_batch * self.centroids) / numpy.maximum(counts,1)
+            self.mask_centroids = numpy.maximum(self.mask_centroids,counts > 0)
+            
+            churn = (self.masked_MSEs(batch,self.centroids,self.mask_centroids).argmin(axis=1) != assignments).mean()
+            print "Iteration: %s. Fraction of the batch that changed cluster: %s." % (iteration,churn)
+            if churn <= self.tolerance:
+                break
+            if iteration == max_iterations:
+                print "WARNING: did not converge, stopped after %s iterations." % max_iterations
+            
+        self.assignment()
+        self.update()
 
 
-    """ Assign each data point to the closest cluster, and return whether any reassignments were made """
+    """ Assign each data point to the closest cluster, and return the number of points that changed cluster.
+        If two clusters are equally far, we use the cluster with the lowest index. """
     def assignment(self):
-        self.data_point_assignments = [[] for k in xrange(0,self.K)]
+        MSEs = self.compute_MSEs()
+        new_assignments = MSEs.argmin(axis=1)
+        self.distances = MSEs[numpy.arange(self.no_points),new_assignments]
         
-        change = False
-        for d,(data_point,mask) in enumerate(zip(self.X,self.M)):
-            old_c = self.cluster_assignments[d]
-            new_c = self.closest_cluster(data_point,d,mask)
-            
-            self.cluster_assignments[d] = new_c
-            self.data_point_assignments[new_c].append(d)
-            
-            change = (change or old_c != new_c)
-        return change
-    
+        reassigned = (new_assignments != self.cluster_assignments).sum()
+        self.cluster_assignments = new_assignments
+        return reassigned
     
-    # Compute the MSE to each of the clusters, and return the index of the closest cluster.
-    # If two clusters are equally far, we return the cluster with the lowest index.
-    def closest_cluster(self,data_point,index_data_point,mask_d):
-        closest_index = None
-        closest_MSE = None
-        for c,(centroid,mask_c) in enumerate(zip(self.centroids,self.mask_centroids)):
-            MSE = self.compute_MSE(data_point,centroid,mask_d,mask_c)
-            if (closest_MSE is None) or (MSE is not None and MSE < closest_MSE): #either no closest centroid yet, or MSE is defined and less
-                closest_MSE = MSE
-                closest_index = c
-        self.distances[index_data_point] = closest_MSE
-        return closest_index
     
+    # Compute the MSE between each data point and each cluster centroid
+    def compute_MSEs(self):
+        return self.masked_MSEs(slice(None),self.centroids,self.mask_centroids)
     
-    # Compute the Euclidean distance between the data point and the cluster centroid.
-    # If they have no known values in common, we return None (=infinite distance).
-    def compute_MSE(self,x1,x2,mask1,mask2):
-        mask1_mask2 = numpy.multiply(mask1,mask2)
-        len_overlap = mask1_mask2.sum()
-        return None if len_overlap == 0 else numpy.multiply(mask1_mask2,numpy.power(numpy.subtract(x1,x2),2)).sum() / float(len_overlap)
+    # Compute the mean squared error between the given data points (rows) and centroids (columns), over the
+    # coordinates known in both. We expand sum_j M_dj M_cj (X_dj - C_cj)^2 into three matrix products, so we
+    # never form the (points x centroids x coordinates) differences. If the point and centroid have no known
+    # values in common the distance is infinite.
+    def masked_MSEs(self,points,centroids,mask_centroids):
+        (X_masked,X_masked_squared,M) = (self.X_masked[points],self.X_masked_squared[points],self.M[points])
+        centroids_masked = mask_centroids * centroids
+        overlap = numpy.dot(M,mask_centroids.T)
+        squared_errors = numpy.dot(X_masked_squared,mask_centroids.T) \
+                         - 2 * numpy.dot(X_masked,centroids_masked.T) \
+                         + numpy.dot(M,(centroids_masked * centroids_masked).T)
+        with numpy.errstate(divide='ignore',invalid='ignore'):
+            MSEs = numpy.maximum(squared_errors,0.) / overlap
+        MSEs[overlap == 0] = numpy.inf
+        return MSEs
             
         
     """ Update the centroids to the mean of the points assigned to it. 
         If for a coordinate there are no known values, we set this cluster's mask to 0 there.
-        If a cluster has no points assigned to it at all, we randomly re-initialise it. """
+        If a cluster has no points assigned to it at all, we either move the point furthest away from its
+        centroid to it (singleton), or randomly re-initialise it. """
     def update(self):
-        for c in xrange(0,self.K): 
-            self.update_cluster(c)
+        self.update_centroids()
+        
+        # Reassign a datapoint to each empty cluster, as long as there are enough unique datapoints
+        if self.no_unique_points < self.K:
+            return
+        for c in numpy.flatnonzero(self.cluster_sizes == 0):
+            if self.resolve_empty == 'singleton':
+                self.move_furthest_point(c)
+            else:
+                self.centroids[c] = self.random_cluster_centroid()
+                self.mask_centroids[c] = numpy.ones(self.no_coordinates)
     
-    # Update for one specific cluster
-    def update_cluster(self,c):
-        known_coordinate_values = self.find_known_coordinate_values(c)
-        
-        if known_coordinate_values is None:
-            # Reassign a datapoint to this cluster, as long as there are enough 
-            # unique datapoints. Either furthest away (singleton) or random.
-            if self.no_unique_points >= self.K:
-                if self.resolve_empty == 'singleton':
-                    # Find the point currently furthest away from its centroid                    
-                    index_furthest_away = self.find_point_furthest_away()
-                    old_cluster = self.cluster_assignments[index_furthest_away]
-                    
-                    # Add point to new cluster
-                    self.centroids[c] = self.X[index_furthest_away]
-                    self.mask_centroids[c] = self.M[index_furthest_away]
-                    self.distances[index_furthest_away] = 0.0
-                    self.cluster_assignments[index_furthest_away] = c
-                    self.data_point_assignments[c] = [index_furthest_away]
-                    
-                    # Remove from old cluster and update
-                    self.data_point_assignments[old_cluster].remove(index_furthest_away)
-                    #print c,old_cluster
-                    self.update_cluster(old_cluster)
-                else:
-                    # Randomly re-initialise this point
-                    self.centroids[c] = self.random_cluster_centroid()
-                    self.mask_centroids[c] = numpy.ones(self.no_coordinates)
-        else:
-            # For each coordinate set the centroid to the average, or to 0 if no values are observed
-            for coordinate,coordinate_values in enumerate(known_coordinate_values):
-                if len(coordinate_values) == 0:
-                    new_coordinate = 0              
-                    new_mask = 0
-                else:
-                    new_coordinate = sum(coordinate_values) / float(len(coordinate_values))
-                    new_mask = 1
-                
-                self.centroids[c][coordinate] = new_coordinate
-                self.mask_centroids[c][coordinate] = new_mask
+    # Set the centroids to the masked column means of the points assigned to them (and 0 with mask 0 for a
+    # coordinate without known values), for the given clusters (default all of them)
+    def update_centroids(self,clusters=None):
+        (sums,counts,self.cluster_sizes) = self.cluster_sums(self.cluster_assignments)
+        clusters = numpy.flatnonzero(self.cluster_sizes > 0) if clusters is None else clusters
+        self.centroids[clusters] = sums[clusters] / numpy.maximum(counts[clusters],1)
+        self.mask_centroids[clusters] = counts[clusters] > 0
     
+    # Return the sums and numbers of the known values per cluster and coordinate, and the number of points per
+    # cluster, of the given points (default all) with the given assignments. We sum the values per (cluster,
+    # coordinate) with one bincount over the flattened data, which is much faster than numpy.add.at.
+    def cluster_sums(self,assignments,points=slice(None)):
+        bins = (assignments[:,None] * self.no_coordinates + numpy.arange(self.no_coordinates)).ravel()
+        sums = numpy.bincount(bins,weights=self.X_masked[points].ravel(),minlength=self.K*self.no_coordinates)
+        counts = numpy.bincount(bins,weights=self.M[points].ravel(),minlength=self.K*self.no_coordinates)
+        sizes = numpy.bincount(assignments,minlength=self.K)
+        return (sums.reshape(self.K,self.no_coordinates),counts.reshape(self.K,self.no_coordinates),sizes)
     
-    # For a given centroid c, construct a list of lists, each list consisting of
-    # all known coordinate values of data points assigned to the centroid.
-    # If no points are assigned to a cluster, return None.
-    def find_known_coordinate_values(self,c):
-        assigned_data_indexes = self.data_point_assignments[c]
-        data_points = numpy.array([self.X[d] for d in assigned_data_indexes])
-        masks = numpy.array([self.M[d] for d in assigned_data_indexes])
-        
-        if len(assigned_data_indexes) == 0:
-            lists_known_coordinate_values = None
-        else: 
-            lists_known_coordinate_values = [
-                [v for d,v in enumerate(data_points.T[coordinate]) if masks[d][coordinate]]
-                for coordinate in xrange(0,self.no_coordinates)
-            ]
-            
-        return lists_known_coordinate_values
+    # Make the point currently furthest away from its centroid the only point of the empty cluster c, and update
+    # the cluster it came from - moving another point to that one if it is now empty
+    def move_furthest_point(self,c):
+        index_furthest_away = self.find_point_furthest_away()
+        old_cluster = self.cluster_assignments[index_furthest_away]
+        
+        self.centroids[c] = self.X_masked[index_furthest_away]
+        self.mask_centroids[c] = self.M[index_furthest_away]
+        self.distances[index_furthest_away] = 0.0
+        self.cluster_assignments[index_furthest_away] = c
+        
+        self.update_centroids([old_cluster])
+        if self.cluster_sizes[old_cluster] == 0:
+            self.move_furthest_point(old_cluster)
         
     
     # Find data point furthest away from its current cluster centroid
@@ -199,8 +242,5 @@ class KMeans:
     # Create a binary matrix indicating the clustering (so size [no_points x K])
     def create_matrix(self):
         self.clustering_results = numpy.zeros((self.no_points,self.K))
-        for d in range(0,self.no_points):
-            c = self.cluster_assignments[d]
-            self.clustering_results[d][c] = 1
-            
-        print [sum(column) for column in self.clustering_results.T]
\ No newline at end of file
+        self.clustering_results[numpy.arange(self.no_points),self.cluster_assignments] = 1
+        print list(self.clustering_results.sum(axis=0))
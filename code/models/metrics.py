@@ -0,0 +1,92 @@
+"""
+Evaluation measures for the predictions of the models, on the entries of R
+given by a mask M:
+- 'MSE', the mean square error;
+- 'MAE', the mean absolute error;
+- 'R^2', the coefficient of determination;
+- 'Rp', the Pearson correlation;
+- the log likelihood of R under a Gaussian noise model with precision tau.
+
+ObservedValues(R,M) stores the indices (rows,columns) of the nonzero entries of
+M (or of the entries given by a tuple M = (rows,columns) of index arrays), the values of R there, and their mean and total sum of squares. Evaluating
+predictions then only needs the predicted values at those indices, so it costs
+O(|Omega|) time and memory rather than O(I*J):
+    observed = ObservedValues(R,M)
+    R_pred = dot_entries(U,V,observed.rows,observed.columns)
+    performances = observed.performances(R_pred)    # { 'MSE', 'R^2', 'Rp' }
+    performances = observed.performances(R_pred,metrics=['MSE','MAE'])
+    log_likelihood = observed.log_likelihood(R_pred,tau)
+
+The models keep the ObservedValues for each mask they are given (see
+observed_values(M) in the models), so R is only gathered once per mask. This
+assumes the mask is not changed in place afterwards. Tuples of indices are not
+cached.
+
+The functions compute_MSE(M,R,R_pred), compute_R2(M,R,R_pred) and
+compute_Rp(M,R,R_pred) work on full (dense or sparse) matrices instead.
+"""
+
+from observed_entries import nonzero_entries, gather
+
+import numpy, math, scipy.sparse
+
+
+class ObservedValues:
+    def __init__(self,R,M):
+        self.M = M
+        R = R if scipy.sparse.issparse(R) else numpy.asarray(R,dtype=float)
+        if isinstance(M,tuple):
+            (self.rows,self.columns) = (numpy.array(M[0],dtype=int),numpy.array(M[1],dtype=int))
+            assert len(self.rows) == len(self.columns), "Expected as many row indices as column indices, but got %s and %s." % (len(self.rows),len(self.columns))
+        else:
+            (self.rows,self.columns) = nonzero_entries(M)
+        self.size = len(self.rows)
+        self.values = numpy.array(gather(R,self.rows,self.columns),dtype=float)
+
+        assert self.size > 0, "The mask does not contain any entries to evaluate."
+        self.mean = self.values.sum() / float(self.size)
+        self.centred = self.values - self.mean
+        self.SS_total = float((self.centred**2).sum())
+
+    # Return a dictionary of the given metrics, for the predictions R_pred at the observed entries
+    def performances(self,R_pred,metrics=['MSE','R^2','Rp']):
+        R_pred = numpy.array(R_pred,dtype=float)
+        residuals = self.values - R_pred
+        performances = {}
+        for metric in metrics:
+            if metric == 'MSE':
+                performances['MSE'] = (residuals**2).sum() / float(self.size)
+            elif metric == 'MAE':
+                performances['MAE'] = numpy.abs(residuals).sum() / float(self.size)
+            elif metric == 'R^2':
+                SS_res = float((residuals**2).sum())
+                performances['R^2'] = 1. - SS_res / self.SS_total if self.SS_total != 0. else numpy.inf
+            elif metric == 'Rp':
+                centred_pred = R_pred - R_pred.sum() / float(self.size)
+                covariance = (self.centred*centred_pred).sum()
+                variance_pred = (centred_pred**2).sum()
+                performances['Rp'] = covariance / float(math.sqrt(self.SS_total)*math.sqrt(variance_pred))
+            else:
+                assert False, "Unrecognised metric: %s." % metric
+        return performances
+
+    # Return the log likelihood of the observed values under N(R_pred,1/tau), where log_tau can be given as E[log tau]
+    def log_likelihood(self,R_pred,tau,log_tau=None):
+        log_tau = math.log(tau) if log_tau is None else log_tau
+        return self.size / 2. * ( log_tau - math.log(2*math.pi) ) - tau / 2. * ((self.values - R_pred)**2).sum()
+
+
+# Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) on full matrices
+def compute_MSE(M,R,R_pred):
+    return evaluate_matrix(M,R,R_pred,'MSE')
+
+def compute_R2(M,R,R_pred):
+    return evaluate_matrix(M,R,R_pred,'R^2')
+
+def compute_Rp(M,R,R_pred):
+    return evaluate_matrix(M,R,R_pred,'Rp')
+
+def evaluate_matrix(M,R,R_pred,metric):
+    observed = ObservedValues(R,M)
+    R_pred = R_pred if scipy.sparse.issparse(R_pred) else numpy.array(R_pred,dtype=float)
+    return observed.performances(gather(R_pred,observed.rows,observed.columns),metrics=[metric])[metric]
@@ -0,0 +1,148 @@
+"""
+Run several independently seeded chains of a Gibbs sampler (bnmf_gibbs_optimised
+or bnmtf_gibbs_optimised) in parallel, merge their posterior summaries, and
+report convergence diagnostics.
+
+We expect the following arguments:
+- method, the class of the Gibbs sampler
+- R, M, the data and mask matrix
+- model_args, a dictionary of the other arguments of the constructor, e.g.
+    { 'K':K, 'priors':priors } or { 'K':K, 'L':L, 'priors':priors }
+- no_chains, the number of chains
+- P, the number of parallel processes
+- seeds, a list of random seeds, one for each chain (default 0,1,..,no_chains-1)
+
+Usage of class:
+    chains = MultiChainGibbs(bnmtf_gibbs_optimised,R,M,{'K':K,'L':L,'priors':priors},no_chains=4,P=4)
+    chains.run(iterations,burn_in,thinning,init_config={'init_S':'random','init_FG':'kmeans'})
+    chains.report()
+Each chain only keeps its thinned draws after the burn-in. For each parameter
+(F, S, G, tau or U, V, tau) we then get a dictionary chains.summaries[name] with
+the posterior 'mean' and 'variance' over all chains, and for each entry:
+- 'Rhat', the split-Rhat statistic (Gelman et al., Bayesian Data Analysis, 2013),
+  which is close to 1 if the chains have converged to the same distribution;
+- 'ESS', the effective sample size over all chains, using Geyer's initial
+  positive sequence for the autocorrelations of the split chains;
+- 'ESS_per_second', the ESS divided by the wall-clock time of the run.
+"""
+
+from sample_store import MemorySampleStore
+
+from multiprocessing import Pool
+import numpy, random, time
+
+
+# Run a single chain. This function is outside of the class so it can be used by the Pool.
+def run_chain(params):
+    (method,R,M,model_args,seed,iterations,burn_in,thinning,init_config) = \
+        (params['method'],params['R'],params['M'],params['model_args'],params['seed'],
+         params['iterations'],params['burn_in'],params['thinning'],params['init_config'])
+    numpy.random.seed(seed)
+    random.seed(seed)
+
+    model = method(R,M,**model_args)
+    model.initialise(**init_config)
+    store = MemorySampleStore(burn_in=burn_in,thinning=thinning)
+    model.run(iterations,store=store)
+    return store.samples
+
+
+class MultiChainGibbs:
+    def __init__(self,method,R,M,model_args,no_chains,P,seeds=None):
+        self.method = method
+        self.R = R
+        self.M = M
+        self.model_args = model_args
+        self.no_chains = no_chains
+        self.P = P
+        self.seeds = seeds if seeds is not None else range(0,no_chains)
+
+        assert len(self.seeds) == self.no_chains, "Expected %s seeds, but got %s." % (self.no_chains,len(self.seeds))
+
+
+    # Run the chains in parallel, and compute the summaries and diagnostics
+    def run(self,iterations,burn_in=0,thinning=1,init_config={}):
+        assert len(range(burn_in,iterations,thinning)) >= 4, "Need at least 4 draws per chain after burn-in and thinning."
+        all_parameters = [
+            {
+                'method' : self.method,
+                'R' : self.R,
+                'M' : self.M,
+                'model_args' : self.model_args,
+                'seed' : seed,
+                'iterations' : iterations,
+                'burn_in' : burn_in,
+                'thinning' : thinning,
+                'init_config' : init_config
+            }
+            for seed in self.seeds
+        ]
+
+        time_start = time.time()
+        pool = Pool(self.P)
+        outputs = pool.map(run_chain,all_parameters)
+        pool.close()
+        self.time = time.time() - time_start
+
+        # Stack the draws of each parameter into an array of size no_chains x no_draws x shape
+        self.all_draws = { name:numpy.array([output[name] for output in outputs]) for name in outputs[0] }
+        self.summaries = {}
+        for name,draws in self.all_draws.iteritems():
+            ESS = effective_sample_size(draws)
+            self.summaries[name] = {
+                'mean' : draws.mean(axis=(0,1)),
+                'variance' : draws.var(axis=(0,1)),
+                'Rhat' : split_rhat(draws),
+                'ESS' : ESS,
+                'ESS_per_second' : ESS / self.time
+            }
+        return self.summaries
+
+
+    # Print the worst split-Rhat and ESS per second of each parameter
+    def report(self):
+        for name in sorted(self.summaries.keys()):
+            summary = self.summaries[name]
+            print "%s. Max Rhat: %s. Min ESS: %s. Min ESS per second: %s." % \
+                (name,numpy.nanmax(summary['Rhat']),numpy.nanmin(summary['ESS']),numpy.nanmin(summary['ESS_per_second']))
+        print "Wall-clock time: %s seconds." % self.time
+
+
+# Split each chain in half, giving an array of size 2*no_chains x floor(no_draws/2) x shape
+def split_chains(draws):
+    draws = numpy.array(draws,dtype=float)
+    n = draws.shape[1] / 2
+    return numpy.concatenate([draws[:,:n],draws[:,draws.shape[1]-n:]],axis=0)
+
+# Return the split-Rhat for each entry, given draws of size no_chains x no_draws x shape
+def split_rhat(draws):
+    split = split_chains(draws)
+    n = split.shape[1]
+    W = split.var(axis=1,ddof=1).mean(axis=0)
+    B_over_n = split.mean(axis=1).var(axis=0,ddof=1)
+    var_plus = (n-1.)/n * W + B_over_n
+    with numpy.errstate(divide='ignore',invalid='ignore'):
+        return numpy.sqrt(var_plus / W)
+
+# Return the effective sample size for each entry, given draws of size no_chains x no_draws x shape
+def effective_sample_size(draws):
+    split = split_chains(draws)
+    (m,n) = split.shape[:2]
+
+    # Autocovariances of each chain for each lag, using the FFT
+    centred = split - split.mean(axis=1)[:,None]
+    size = 2**int(numpy.ceil(numpy.log2(2*n)))
+    transform = numpy.fft.rfft(centred,n=size,axis=1)
+    autocovariances = numpy.fft.irfft(transform*numpy.conjugate(transform),n=size,axis=1)[:,:n] / float(n)
+
+    W = (autocovariances[:,0] * n / (n-1.)).mean(axis=0)
+    var_plus = (n-1.)/n * W + split.mean(axis=1).var(axis=0,ddof=1)
+    with numpy.errstate(divide='ignore',invalid='ignore'):
+        rho = 1. - (W - autocovariances.mean(axis=0)) / var_plus
+        rho[0] = 1.
+
+        # Geyer's initial positive sequence: sum the pairs rho[2t]+rho[2t+1] up to the first negative one
+        pairs = rho[0:n-1:2] + rho[1:n:2]
+        positive = numpy.cumprod(pairs > 0,axis=0).astype(bool)
+        tau = -1. + 2.*(pairs*positive).sum(axis=0)
+        return m*n / tau
@@ -25,9 +25,22 @@ We can test the performance of our model on a test dataset, specifying our test
     performance = NMF.predict(M_pred)
 This gives a dictionary of performances,
     performance = { 'MSE', 'R^2', 'Rp' }
+We can also pass a list of metrics, e.g. predict(M_pred,metrics=['MSE','MAE']).
+These are computed in one pass over the entries in M_pred (see metrics.py).
+M_pred can also be a tuple (rows,columns) of index arrays, and we can get the
+predictions for just those entries, without forming the I x J reconstruction, using
+    predictions = BNMF.predict_entries(rows,columns)
     
-The performances of all iterations are stored in NMF.all_performances, which 
-is a dictionary from 'MSE', 'R^2', or 'Rp' to a list of performances.
+With sparse=True in the constructor we only store the observed entries of R, 
+as scipy.sparse matrices, so that the updates scale with |Omega| rather than 
+I*J - see observed_entries.py.
+    
+By default run() does not evaluate the model while training. To track the
+convergence, pass a list of observers to run() - see observers.py. For example,
+    performances = MemorySink()
+    NMF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],every=10,sinks=[performances])])
+gives a dictionary performances.values from 'MSE', 'R^2', or 'Rp' to a list of
+performances for every 10th iteration.
     
 Finally, we can return the goodness of fit of the data using the quality(metric) function:
 - metric = 'loglikelihood' -> return p(D|theta)
@@ -40,13 +53,21 @@ Finally, we can return the goodness of fit of the data using the quality(metric)
 from distributions.exponential import exponential_draw
 from distributions.gamma import gamma_mode
 from distributions.truncated_normal_vector import TN_vector_mode
+from observed_entries import sparse_R_M, observed_triplets, dot_entries, masked_values, dense_mask, mask_dot, mask_T_dot, apply_mask
+from observers import start_observers, notify_observers, close_observers
+from metrics import ObservedValues, compute_MSE, compute_R2, compute_Rp
 
 import numpy, itertools, math, time
 
 class nmf_icm:
-    def __init__(self,R,M,K,priors):
-        self.R = numpy.array(R,dtype=float)
-        self.M = numpy.array(M,dtype=float)
+    def __init__(self,R,M,K,priors,sparse=False):
+        self.sparse = sparse
+        self.observed = None
+        if self.sparse:
+            (self.R,self.M) = sparse_R_M(R,M)
+        else:
+            self.R = numpy.asarray(R,dtype=float)
+            self.M = dense_mask(M)
         self.K = K
         
         assert len(self.R.shape) == 2, "Input matrix R is not a two-dimensional array, " \
@@ -57,6 +78,8 @@ class nmf_icm:
         (self.I,self.J) = self.R.shape
         self.size_Omega = self.M.sum()
         self.check_empty_rows_columns()      
+        if self.sparse:
+            (self.rows_Omega,self.columns_Omega,self.R_Omega) = observed_triplets(self.R,self.M)
         
         self.alpha, self.beta, self.lambdaU, self.lambdaV = \
             float(priors['alpha']), float(priors['beta']), numpy.array(priors['lambdaU']), numpy.array(priors['lambdaV'])
@@ -73,8 +96,8 @@ class nmf_icm:
         
     # Raise an exception if an entire row or column is empty
     def check_empty_rows_columns(self):
-        sums_columns = self.M.sum(axis=0)
-        sums_rows = self.M.sum(axis=1)
+        sums_columns = numpy.asarray(self.M.sum(axis=0)).ravel()
+        sums_rows = numpy.asarray(self.M.sum(axis=1)).ravel()
                     
         # Assert none of the rows or columns are entirely unknown values
         for i,c in enumerate(sums_rows):
@@ -111,14 +134,11 @@ class nmf_icm:
        
 
     # Run the Gibbs sampler
-    def run(self,iterations,minimum_TN=0.):   
+    def run(self,iterations,minimum_TN=0.,observers=[]):   
         self.all_tau = numpy.zeros(iterations) # to plot convergence
         self.all_times = [] # to plot performance against time
         
-        metrics = ['MSE','R^2','Rp']
-        self.all_performances = {} # for plotting convergence of metrics
-        for metric in metrics:
-            self.all_performances[metric] = []
+        start_observers(observers,self,iterations)
         
         time_start = time.time()
         for it in range(0,iterations):      
@@ -137,15 +157,11 @@ class nmf_icm:
             self.tau = gamma_mode(self.alpha_s(),self.beta_s())
             self.all_tau[it] = self.tau
             
-            perf = self.predict(self.M)
-            for metric in metrics:
-                self.all_performances[metric].append(perf[metric])
-                
-            print "Iteration %s. MSE: %s. R^2: %s. Rp: %s." % (it+1,perf['MSE'],perf['R^2'],perf['Rp'])
-            
             time_iteration = time.time()
-            self.all_times.append(time_iteration-time_start)            
+            self.all_times.append(time_iteration-time_start)
+            notify_observers(observers,self,it+1,self.all_times[-1])
             
+        close_observers(observers)
         return
         
         
@@ -154,47 +170,78 @@ class nmf_icm:
         return self.alpha + self.size_Omega/2.0
     
     def beta_s(self):   
-        return self.beta + 0.5*(self.M*(self.R-numpy.dot(self.U,self.V.T))**2).sum()
+        if self.sparse:
+            return self.beta + 0.5*(self.residual_Omega(self.U,self.V)**2).sum()
+        return self.beta + 0.5*(self.masked_residual(self.U,self.V)**2).sum()
         
     def tauU(self,k):       
-        return self.tau*(self.M*self.V[:,k]**2).sum(axis=1)
+        return self.tau*mask_dot(self.M,self.V[:,k]**2)
         
     def muU(self,tauUk,k):
-        return 1./tauUk * (-self.lambdaU[:,k] + self.tau*(self.M * ( (self.R-numpy.dot(self.U,self.V.T)+numpy.outer(self.U[:,k],self.V[:,k]))*self.V[:,k] )).sum(axis=1)) 
+        E = self.masked_residual(self.U,self.V)
+        return 1./tauUk * (-self.lambdaU[:,k] + self.tau*(E.dot(self.V[:,k]) + self.U[:,k]*mask_dot(self.M,self.V[:,k]**2)))
         
     def tauV(self,k):
-        return self.tau*(self.M.T*self.U[:,k]**2).T.sum(axis=0)
+        return self.tau*mask_T_dot(self.M,self.U[:,k]**2)
         
     def muV(self,tauVk,k):
-        return 1./tauVk * (-self.lambdaV[:,k] + self.tau*(self.M.T * ( (self.R-numpy.dot(self.U,self.V.T)+numpy.outer(self.U[:,k],self.V[:,k])).T*self.U[:,k] )).T.sum(axis=0)) 
+        E = self.masked_residual(self.U,self.V)
+        return 1./tauVk * (-self.lambdaV[:,k] + self.tau*(E.T.dot(self.U[:,k]) + self.V[:,k]*mask_T_dot(self.M,self.U[:,k]**2)))
+        
+    # Return the residual R - U V.T on the observed entries, in sparse mode
+    def residual_Omega(self,U,V):
+        return self.R_Omega - dot_entries(U,V,self.rows_Omega,self.columns_Omega)
+        
+    # Return the residual R - U V.T on the observed entries and 0 elsewhere, as a CSR matrix in sparse mode
+    def masked_residual(self,U,V):
+        if self.sparse:
+            return masked_values(self.M,self.residual_Omega(U,V))
+        E = self.R - numpy.dot(U,V.T)
+        apply_mask(self.M,E)
+        return E
 
 
     # Compute the expectation of U and V, and use it to predict missing values
-    def predict(self,M_pred):
-        R_pred = numpy.dot(self.U,self.V.T)
-        MSE = self.compute_MSE(M_pred,self.R,R_pred)
-        R2 = self.compute_R2(M_pred,self.R,R_pred)    
-        Rp = self.compute_Rp(M_pred,self.R,R_pred)        
-        return {'MSE':MSE,'R^2':R2,'Rp':Rp}
+    def predict(self,M_pred,metrics=['MSE','R^2','Rp']):
+        observed = self.observed_values(M_pred)
+        return observed.performances(self.predict_entries(observed.rows,observed.columns),metrics)
         
+    # Return the predictions for the entries (rows[n],columns[n]) of R, without forming the I x J reconstruction
+    def predict_entries(self,rows,columns):
+        return dot_entries(self.U,self.V,rows,columns)
         
-    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation)
+        
+    # Compute the given metrics ('MSE', 'R^2', 'Rp', 'tau', 'loglikelihood') on the observed entries, for the observers of run()
+    def evaluate(self,metrics):
+        for metric in metrics:
+            assert metric in ['MSE','MAE','R^2','Rp','tau','loglikelihood'], "Unrecognised metric for evaluation: %s." % metric
+        performance_metrics = [metric for metric in metrics if metric in ['MSE','MAE','R^2','Rp']]
+        values = self.predict(self.M,metrics=performance_metrics) if performance_metrics else {}
+        if 'tau' in metrics:
+            values['tau'] = self.tau
+        if 'loglikelihood' in metrics:
+            values['loglikelihood'] = self.log_likelihood()
+        return values
+        
+        
+    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) - see metrics.py
     def compute_MSE(self,M,R,R_pred):
-        return (M * (R-R_pred)**2).sum() / float(M.sum())
+        return compute_MSE(M,R,R_pred)
         
     def compute_R2(self,M,R,R_pred):
-        mean = (M*R).sum() / float(M.sum())
-        SS_total = float((M*(R-mean)**2).sum())
-        SS_res = float((M*(R-R_pred)**2).sum())
-        return 1. - SS_res / SS_total if SS_total != 0. else numpy.inf
+        return compute_R2(M,R,R_pred)
         
     def compute_Rp(self,M,R,R_pred):
-        mean_real = (M*R).sum() / float(M.sum())
-        mean_pred = (M*R_pred).sum() / float(M.sum())
-        covariance = (M*(R-mean_real)*(R_pred-mean_pred)).sum()
-        variance_real = (M*(R-mean_real)**2).sum()
-        variance_pred = (M*(R_pred-mean_pred)**2).sum()
-        return covariance / float(math.sqrt(variance_real)*math.sqrt(variance_pred))
+        return compute_Rp(M,R,R_pred)
+        
+    # Return the observed values of R for the mask M_pred (which can also be a tuple (rows,columns) of indices). We only
+    # keep them for the training mask self.M, which is our own copy and does not change, and compute them for other masks.
+    def observed_values(self,M_pred):
+        if M_pred is not self.M:
+            return ObservedValues(self.R,M_pred)
+        if self.observed is None:
+            self.observed = ObservedValues(self.R,self.M)
+        return self.observed
         
 
     # Functions for model selection, measuring the goodness of fit vs model complexity
@@ -211,12 +258,12 @@ class nmf_icm:
             # -2*loglikelihood + 2*no. free parameters
             return - 2 * log_likelihood + 2 * (self.I*self.K+self.J*self.K)
         elif metric == 'MSE':
-            R_pred = numpy.dot(self.U,self.V.T)
-            return self.compute_MSE(self.M,self.R,R_pred)
+            observed = self.observed_values(self.M)
+            return observed.performances(dot_entries(self.U,self.V,observed.rows,observed.columns),['MSE'])['MSE']
         elif metric == 'ELBO':
             return 0.
         
     def log_likelihood(self):
         # Return the likelihood of the data given the trained model's parameters
-        return self.size_Omega / 2. * ( math.log(self.tau) - math.log(2*math.pi) ) \
-             - self.tau / 2. * (self.M*( self.R - numpy.dot(self.U,self.V.T))**2).sum()
\ No newline at end of file
+        observed = self.observed_values(self.M)
+        return observed.log_likelihood(dot_entries(self.U,self.V,observed.rows,observed.columns),self.tau)
\ No newline at end of file
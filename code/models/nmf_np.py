@@ -24,19 +24,40 @@ Initialisation can be done by running the initialise(init,tauUV) function. We in
           = 'random'        -> U[i,k] ~ U(0,1), V[j,k] ~ U(0,1), 
           = 'exponential'   -> U[i,k] ~ Exp(expo_prior), V[j,k] ~ Exp(expo_prior) 
   where expo_prior is an additional parameter (default 1)
+  
+If we pass sparse=True to the constructor, R and M are stored as scipy.sparse 
+matrices containing only the observed entries, and the ratios R / (U V.T) in 
+the updates are only computed on Omega - see observed_entries.py.
+
+By default run() does not evaluate the model while training. To track the
+convergence, pass a list of observers to run() - see observers.py. For example,
+    performances = MemorySink()
+    nmf.run(iterations,observers=[IterationObserver(metrics=['MSE','I_div'],sinks=[performances])])
+gives a dictionary performances.values from 'MSE' and 'I_div' (the I-divergence)
+to a list of values for each iteration.
+
+We can evaluate the model on a test mask M_pred (or a tuple (rows,columns) of
+index arrays) using nmf.predict(M_pred), and get the predictions for given
+entries, without forming the I x J reconstruction, using nmf.predict_entries(rows,columns).
 """
 
 from distributions.exponential import exponential_draw
+from observed_entries import sparse_R_M, observed_triplets, dot_entries, masked_values, dense_mask, mask_dot, mask_T_dot, apply_mask
+from observers import start_observers, notify_observers, close_observers
+from metrics import ObservedValues, compute_MSE, compute_R2, compute_Rp
 import numpy, math, itertools, time
 
 class NMF:
-    def __init__(self,R,M,K):
-        self.R = numpy.array(R,dtype=float)
-        self.M = numpy.array(M,dtype=float)
+    def __init__(self,R,M,K,sparse=False):
+        self.sparse = sparse
+        self.observed = None
+        if self.sparse:
+            (self.R,self.M) = sparse_R_M(R,M)
+        else:
+            self.R = numpy.asarray(R,dtype=float)
+            self.M = dense_mask(M)
         self.K = K                     
         
-        self.metrics = ['MSE','R^2','Rp']
-                
         assert len(self.R.shape) == 2, "Input matrix R is not a two-dimensional array, " \
             "but instead %s-dimensional." % len(self.R.shape)
         assert self.R.shape == self.M.shape, "Input matrix R is not of the same size as " \
@@ -46,16 +67,19 @@ class NMF:
         
         self.check_empty_rows_columns() 
         
+        # In sparse mode we only need the observed entries, and never form I x J matrices
+        if self.sparse:
+            (self.rows_Omega,self.columns_Omega,self.R_Omega) = observed_triplets(self.R,self.M)
+            return
+        
         # For computing the I-div it is better if unknown values are 1's, not 0's
-        self.R_excl_unknown = numpy.empty((self.I,self.J))
-        for i,j in itertools.product(range(0,self.I),range(0,self.J)):
-            self.R_excl_unknown[i,j] = self.R[i,j] if self.M[i,j] else 1.
+        self.R_excl_unknown = numpy.where(self.M != 0,self.R,1.)
                  
                  
     # Raise an exception if an entire row or column is empty
     def check_empty_rows_columns(self):
-        sums_columns = self.M.sum(axis=0)
-        sums_rows = self.M.sum(axis=1)
+        sums_columns = numpy.asarray(self.M.sum(axis=0)).ravel()
+        sums_rows = numpy.asarray(self.M.sum(axis=1)).ravel()
                     
         # Assert none of the rows or columns are entirely unknown values
         for i,c in enumerate(sums_rows):
@@ -82,14 +106,12 @@ class NMF:
                 self.V[j,k] = exponential_draw(expo_prior)
     
     
-    """ Update U and V for a number of iterations, printing the MSE and divergence each iteration. """
-    def run(self,iterations):
+    """ Update U and V for a number of iterations, notifying the observers after each iteration. """
+    def run(self,iterations,observers=[]):
         assert hasattr(self,'U') and hasattr(self,'V'), "U and V have not been initialised - please run NMF.initialise() first."        
         
         self.all_times = [] # to plot performance against time
-        self.all_performances = {} # for plotting convergence of metrics
-        for metric in self.metrics:
-            self.all_performances[metric] = []
+        start_observers(observers,self,iterations)
             
         time_start = time.time()
         for it in range(1,iterations+1):
@@ -98,10 +120,10 @@ class NMF:
             for k in range(0,self.K):
                 self.update_V(k)
             
-            self.give_update(it)
-            
             time_iteration = time.time()
-            self.all_times.append(time_iteration-time_start)   
+            self.all_times.append(time_iteration-time_start)
+            notify_observers(observers,self,it,self.all_times[-1])
+        close_observers(observers)
         
         
     """ Method for doing both initialise() and run() """
@@ -112,48 +134,63 @@ class NMF:
 
     """ Updates for U and V """    
     def update_U(self,k):
-        self.U[:,k] = self.U[:,k] * (self.M * (self.V[:,k] * ( self.R / numpy.dot(self.U,self.V.T) ) )).sum(axis=1) / (self.M * self.V[:,k]).sum(axis=1)
+        self.U[:,k] = self.U[:,k] * self.masked_ratio().dot(self.V[:,k]) / mask_dot(self.M,self.V[:,k])
         
     def update_V(self,k):
-        self.V[:,k] = self.V[:,k] * ( (self.U[:,k] * ( self.R / numpy.dot(self.U,self.V.T) ).T ).T * self.M ).sum(axis=0) / (self.U[:,k] * self.M.T).T.sum(axis=0)
+        self.V[:,k] = self.V[:,k] * self.masked_ratio().T.dot(self.U[:,k]) / mask_T_dot(self.M,self.U[:,k])
+        
+    """ Return the ratio R / (U V.T) on the observed entries and 0 elsewhere, as a CSR matrix in sparse mode """
+    def masked_ratio(self):
+        if self.sparse:
+            return masked_values(self.M,self.R_Omega / dot_entries(self.U,self.V,self.rows_Omega,self.columns_Omega))
+        ratio = self.R / numpy.dot(self.U,self.V.T)
+        apply_mask(self.M,ratio)
+        return ratio
         
         
-    ''' Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) '''
-    def predict(self,M_pred):
-        R_pred = numpy.dot(self.U,self.V.T)
-        MSE = self.compute_MSE(M_pred,self.R,R_pred)
-        R2 = self.compute_R2(M_pred,self.R,R_pred)    
-        Rp = self.compute_Rp(M_pred,self.R,R_pred)        
-        return {'MSE':MSE,'R^2':R2,'Rp':Rp}        
+    ''' Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) - see metrics.py '''
+    def predict(self,M_pred,metrics=['MSE','R^2','Rp']):
+        observed = self.observed_values(M_pred)
+        return observed.performances(self.predict_entries(observed.rows,observed.columns),metrics)
+        
+    ''' Return the predictions for the entries (rows[n],columns[n]) of R, without forming the I x J reconstruction '''
+    def predict_entries(self,rows,columns):
+        return dot_entries(self.U,self.V,rows,columns)
         
     def compute_MSE(self,M,R,R_pred):
-        return (M * (R-R_pred)**2).sum() / float(M.sum())
+        return compute_MSE(M,R,R_pred)
         
     def compute_R2(self,M,R,R_pred):
-        mean = (M*R).sum() / float(M.sum())
-        SS_total = float((M*(R-mean)**2).sum())
-        SS_res = float((M*(R-R_pred)**2).sum())
-        return 1. - SS_res / SS_total if SS_total != 0. else numpy.inf
+        return compute_R2(M,R,R_pred)
         
     def compute_Rp(self,M,R,R_pred):
-        mean_real = (M*R).sum() / float(M.sum())
-        mean_pred = (M*R_pred).sum() / float(M.sum())
-        covariance = (M*(R-mean_real)*(R_pred-mean_pred)).sum()
-        variance_real = (M*(R-mean_real)**2).sum()
-        variance_pred = (M*(R_pred-mean_pred)**2).sum()
-        return covariance / float(math.sqrt(variance_real)*math.sqrt(variance_pred))   
+        return compute_Rp(M,R,R_pred)
+        
+    ''' Return the observed values of R for the mask M_pred, computing them only once for each mask (M_pred can also be a tuple (rows,columns) of indices) '''
+    # Return the observed values of R for the mask M_pred (which can also be a tuple (rows,columns) of indices). We only
+    # keep them for the training mask self.M, which is our own copy and does not change, and compute them for other masks.
+    def observed_values(self,M_pred):
+        if M_pred is not self.M:
+            return ObservedValues(self.R,M_pred)
+        if self.observed is None:
+            self.observed = ObservedValues(self.R,self.M)
+        return self.observed
         
     def compute_I_div(self):    
+        if self.sparse:
+            R_pred = dot_entries(self.U,self.V,self.rows_Omega,self.columns_Omega)
+            return ( self.R_Omega * numpy.log( self.R_Omega / R_pred ) - self.R_Omega + R_pred ).sum()
         R_pred = numpy.dot(self.U, self.V.T)
-        return (self.M * ( self.R_excl_unknown * numpy.log( self.R_excl_unknown / R_pred ) - self.R_excl_unknown + R_pred ) ).sum()        
-        
-        
-    """ Give updates and store performances """
-    def give_update(self,iteration):    
-        perf = self.predict(self.M)
-        i_div = self.compute_I_div()
-        
-        for metric in self.metrics:
-            self.all_performances[metric].append(perf[metric])
-               
-        print "Iteration %s. I-divergence: %s. MSE: %s. R^2: %s. Rp: %s." % (iteration,i_div,perf['MSE'],perf['R^2'],perf['Rp'])
+        (R_Omega,R_pred) = (self.R_excl_unknown[self.M],R_pred[self.M])
+        return ( R_Omega * numpy.log( R_Omega / R_pred ) - R_Omega + R_pred ).sum()
+        
+        
+    """ Compute the given metrics ('MSE', 'R^2', 'Rp', 'I_div') on the observed entries, for the observers of run() """
+    def evaluate(self,metrics):
+        for metric in metrics:
+            assert metric in ['MSE','MAE','R^2','Rp','I_div'], "Unrecognised metric for evaluation: %s." % metric
+        performance_metrics = [metric for metric in metrics if metric in ['MSE','MAE','R^2','Rp']]
+        values = self.predict(self.M,metrics=performance_metrics) if performance_metrics else {}
+        if 'I_div' in metrics:
+            values['I_div'] = self.compute_I_div()
+        return values
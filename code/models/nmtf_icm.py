@@ -26,9 +26,22 @@ We can test the performance of our model on a test dataset, specifying our test
     performance = BNMF.predict(M_pred)
 This gives a dictionary of performances,
     performance = { 'MSE', 'R^2', 'Rp' }
+We can also pass a list of metrics, e.g. predict(M_pred,metrics=['MSE','MAE']).
+These are computed in one pass over the entries in M_pred (see metrics.py).
+M_pred can also be a tuple (rows,columns) of index arrays, and we can get the
+predictions for just those entries, without forming the I x J reconstruction, using
+    predictions = BNMF.predict_entries(rows,columns)
     
-The performances of all iterations are stored in BNMF.all_performances, which 
-is a dictionary from 'MSE', 'R^2', or 'Rp' to a list of performances.
+With sparse=True in the constructor we only store the observed entries of R, 
+as scipy.sparse matrices, so that the updates scale with |Omega| rather than 
+I*J - see observed_entries.py.
+    
+By default run() does not evaluate the model while training. To track the
+convergence, pass a list of observers to run() - see observers.py. For example,
+    performances = MemorySink()
+    BNMF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],every=10,sinks=[performances])])
+gives a dictionary performances.values from 'MSE', 'R^2', or 'Rp' to a list of
+performances for every 10th iteration.
     
 Finally, we can return the goodness of fit of the data using the quality(metric) function:
 - metric = 'loglikelihood' -> return p(D|theta)
@@ -43,13 +56,21 @@ from distributions.exponential import exponential_draw
 from distributions.gamma import gamma_mode
 from distributions.truncated_normal import TN_mode
 from distributions.truncated_normal_vector import TN_vector_mode
+from observed_entries import sparse_R_M, observed_triplets, triple_dot_entries, masked_values, dense, dense_mask, mask_dot, mask_T_dot, apply_mask
+from observers import start_observers, notify_observers, close_observers
+from metrics import ObservedValues, compute_MSE, compute_R2, compute_Rp
 
 import numpy, itertools, math, time
 
 class nmtf_icm:
-    def __init__(self,R,M,K,L,priors):
-        self.R = numpy.array(R,dtype=float)
-        self.M = numpy.array(M,dtype=float)
+    def __init__(self,R,M,K,L,priors,sparse=False):
+        self.sparse = sparse
+        self.observed = None
+        if self.sparse:
+            (self.R,self.M) = sparse_R_M(R,M)
+        else:
+            self.R = numpy.asarray(R,dtype=float)
+            self.M = dense_mask(M)
         self.K = K
         self.L = L
         
@@ -60,7 +81,9 @@ class nmtf_icm:
             
         (self.I,self.J) = self.R.shape
         self.size_Omega = self.M.sum()
-        self.check_empty_rows_columns()      
+        self.check_empty_rows_columns()
+        if self.sparse:
+            (self.rows_Omega,self.columns_Omega,self.R_Omega) = observed_triplets(self.R,self.M)      
         
         self.alpha, self.beta, self.lambdaF, self.lambdaS, self.lambdaG = \
             float(priors['alpha']), float(priors['beta']), numpy.array(priors['lambdaF']), numpy.array(priors['lambdaS']), numpy.array(priors['lambdaG'])
@@ -80,8 +103,8 @@ class nmtf_icm:
         
     # Raise an exception if an entire row or column is empty
     def check_empty_rows_columns(self):
-        sums_columns = self.M.sum(axis=0)
-        sums_rows = self.M.sum(axis=1)
+        sums_columns = numpy.asarray(self.M.sum(axis=0)).ravel()
+        sums_rows = numpy.asarray(self.M.sum(axis=1)).ravel()
                     
         # Assert none of the rows or columns are entirely unknown values
         for i,c in enumerate(sums_rows):
@@ -114,13 +137,13 @@ class nmtf_icm:
                 self.G[j,l] = exponential_draw(self.lambdaG[j,l])
         elif init_FG == 'kmeans':
             print "Initialising F using KMeans."
-            kmeans_F = KMeans(self.R,self.M,self.K)
+            kmeans_F = KMeans(dense(self.R),dense(self.M),self.K)
             kmeans_F.initialise()
             kmeans_F.cluster()
             self.F = kmeans_F.clustering_results + 0.2            
             
             print "Initialising G using KMeans."
-            kmeans_G = KMeans(self.R.T,self.M.T,self.L)   
+            kmeans_G = KMeans(dense(self.R).T,dense(self.M).T,self.L)   
             kmeans_G.initialise()
             kmeans_G.cluster()
             self.G = kmeans_G.clustering_results + 0.2
@@ -129,14 +152,11 @@ class nmtf_icm:
 
 
     # Run the Gibbs sampler
-    def run(self,iterations,minimum_TN=0.):  
+    def run(self,iterations,minimum_TN=0.,observers=[]):  
         self.all_tau = numpy.zeros(iterations)
         self.all_times = [] # to plot performance against time
         
-        metrics = ['MSE','R^2','Rp']
-        self.all_performances = {} # for plotting convergence of metrics
-        for metric in metrics:
-            self.all_performances[metric] = []
+        start_observers(observers,self,iterations)
         
         time_start = time.time()
         for it in range(0,iterations):            
@@ -161,15 +181,11 @@ class nmtf_icm:
             self.tau = gamma_mode(self.alpha_s(),self.beta_s())
             self.all_tau[it] = self.tau
             
-            perf = self.predict(self.M)
-            for metric in metrics:
-                self.all_performances[metric].append(perf[metric])
-                
-            print "Iteration %s. MSE: %s. R^2: %s. Rp: %s." % (it+1,perf['MSE'],perf['R^2'],perf['Rp'])
-        
             time_iteration = time.time()
-            self.all_times.append(time_iteration-time_start)            
+            self.all_times.append(time_iteration-time_start)
+            notify_observers(observers,self,it+1,self.all_times[-1])
             
+        close_observers(observers)
         return 
         
 
@@ -177,31 +193,51 @@ class nmtf_icm:
     def triple_dot(self,M1,M2,M3):
         return numpy.dot(M1,numpy.dot(M2,M3))
         
+    # Return the residual R - F S G.T on the observed entries, in sparse mode
+    def residual_Omega(self,F,S,G):
+        return self.R_Omega - triple_dot_entries(F,S,G,self.rows_Omega,self.columns_Omega)
+        
+    # Return the residual R - F S G.T on the observed entries and 0 elsewhere, as a CSR matrix in sparse mode
+    def masked_residual(self,F,S,G):
+        if self.sparse:
+            return masked_values(self.M,self.residual_Omega(F,S,G))
+        E = self.R - self.triple_dot(F,S,G.T)
+        apply_mask(self.M,E)
+        return E
+        
         
     # Compute the parameters for the distributions we sample from
     def alpha_s(self):   
         return self.alpha + self.size_Omega/2.0
     
     def beta_s(self):   
-        return self.beta + 0.5*(self.M*(self.R-self.triple_dot(self.F,self.S,self.G.T))**2).sum()
+        if self.sparse:
+            return self.beta + 0.5*(self.residual_Omega(self.F,self.S,self.G)**2).sum()
+        return self.beta + 0.5*(self.masked_residual(self.F,self.S,self.G)**2).sum()
         
     def tauF(self,k):       
-        return self.tau * ( self.M * numpy.dot(self.S[k],self.G.T)**2 ).sum(axis=1)
+        return self.tau * mask_dot(self.M,numpy.dot(self.S[k],self.G.T)**2)
         
     def muF(self,tauFk,k):
-        return 1./tauFk * (-self.lambdaF[:,k] + self.tau*(self.M * ( (self.R-self.triple_dot(self.F,self.S,self.G.T)+numpy.outer(self.F[:,k],numpy.dot(self.S[k],self.G.T)))*numpy.dot(self.S[k],self.G.T) )).sum(axis=1)) 
+        SGk = numpy.dot(self.S[k],self.G.T)
+        E = self.masked_residual(self.F,self.S,self.G)
+        return 1./tauFk * (-self.lambdaF[:,k] + self.tau*( E.dot(SGk) + self.F[:,k]*mask_dot(self.M,SGk**2) )) 
         
     def tauS(self,k,l):       
-        return self.tau * ( self.M * numpy.outer(self.F[:,k]**2,self.G[:,l]**2) ).sum()
+        return self.tau * numpy.dot(self.F[:,k]**2,mask_dot(self.M,self.G[:,l]**2))
         
     def muS(self,tauSkl,k,l):
-        return 1./tauSkl * (-self.lambdaS[k,l] + self.tau*(self.M * ( (self.R-self.triple_dot(self.F,self.S,self.G.T)+self.S[k,l]*numpy.outer(self.F[:,k],self.G[:,l]))*numpy.outer(self.F[:,k],self.G[:,l]) )).sum()) 
+        E = self.masked_residual(self.F,self.S,self.G)
+        return 1./tauSkl * (-self.lambdaS[k,l] + self.tau*( numpy.dot(self.F[:,k],E.dot(self.G[:,l])) 
+                                                           + self.S[k,l]*numpy.dot(self.F[:,k]**2,mask_dot(self.M,self.G[:,l]**2)) )) 
         
     def tauG(self,l):       
-        return self.tau * ( self.M.T * numpy.dot(self.F,self.S[:,l])**2 ).T.sum(axis=0)
+        return self.tau * mask_T_dot(self.M,numpy.dot(self.F,self.S[:,l])**2)
         
     def muG(self,tauGl,l):
-        return 1./tauGl * (-self.lambdaG[:,l] + self.tau*(self.M * ( (self.R-self.triple_dot(self.F,self.S,self.G.T)+numpy.outer(numpy.dot(self.F,self.S[:,l]),self.G[:,l])).T * numpy.dot(self.F,self.S[:,l]) ).T).sum(axis=0)) 
+        FSl = numpy.dot(self.F,self.S[:,l])
+        E = self.masked_residual(self.F,self.S,self.G)
+        return 1./tauGl * (-self.lambdaG[:,l] + self.tau*( E.T.dot(FSl) + self.G[:,l]*mask_T_dot(self.M,FSl**2) )) 
         
 
     # Return the average value for U, V, tau - i.e. our approximation to the expectations. 
@@ -216,31 +252,46 @@ class nmtf_icm:
 
 
     # Compute the expectation of U and V, and use it to predict missing values
-    def predict(self,M_pred):
-        R_pred = self.triple_dot(self.F,self.S,self.G.T)
-        MSE = self.compute_MSE(M_pred,self.R,R_pred)
-        R2 = self.compute_R2(M_pred,self.R,R_pred)    
-        Rp = self.compute_Rp(M_pred,self.R,R_pred)        
-        return {'MSE':MSE,'R^2':R2,'Rp':Rp}
+    def predict(self,M_pred,metrics=['MSE','R^2','Rp']):
+        observed = self.observed_values(M_pred)
+        return observed.performances(self.predict_entries(observed.rows,observed.columns),metrics)
         
+    # Return the predictions for the entries (rows[n],columns[n]) of R, without forming the I x J reconstruction
+    def predict_entries(self,rows,columns):
+        return triple_dot_entries(self.F,self.S,self.G,rows,columns)
         
-    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation)
+        
+    # Compute the given metrics ('MSE', 'R^2', 'Rp', 'tau', 'loglikelihood') on the observed entries, for the observers of run()
+    def evaluate(self,metrics):
+        for metric in metrics:
+            assert metric in ['MSE','MAE','R^2','Rp','tau','loglikelihood'], "Unrecognised metric for evaluation: %s." % metric
+        performance_metrics = [metric for metric in metrics if metric in ['MSE','MAE','R^2','Rp']]
+        values = self.predict(self.M,metrics=performance_metrics) if performance_metrics else {}
+        if 'tau' in metrics:
+            values['tau'] = self.tau
+        if 'loglikelihood' in metrics:
+            values['loglikelihood'] = self.log_likelihood()
+        return values
+        
+        
+    # Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) - see metrics.py
     def compute_MSE(self,M,R,R_pred):
-        return (M * (R-R_pred)**2).sum() / float(M.sum())
+        return compute_MSE(M,R,R_pred)
         
     def compute_R2(self,M,R,R_pred):
-        mean = (M*R).sum() / float(M.sum())
-        SS_total = float((M*(R-mean)**2).sum())
-        SS_res = float((M*(R-R_pred)**2).sum())
-        return 1. - SS_res / SS_total if SS_total != 0. else numpy.inf
+        return compute_R2(M,R,R_pred)
         
     def compute_Rp(self,M,R,R_pred):
-        mean_real = (M*R).sum() / float(M.sum())
-        mean_pred = (M*R_pred).sum() / float(M.sum())
-        covariance = (M*(R-mean_real)*(R_pred-mean_pred)).sum()
-        variance_real = (M*(R-mean_real)**2).sum()
-        variance_pred = (M*(R_pred-mean_pred)**2).sum()
-        return covariance / float(math.sqrt(variance_real)*math.sqrt(variance_pred))
+        return compute_Rp(M,R,R_pred)
+        
+    # Return the observed values of R for the mask M_pred (which can also be a tuple (rows,columns) of indices). We only
+    # keep them for the training mask self.M, which is our own copy and does not change, and compute them for other masks.
+    def observed_values(self,M_pred):
+        if M_pred is not self.M:
+            return ObservedValues(self.R,M_pred)
+        if self.observed is None:
+            self.observed = ObservedValues(self.R,self.M)
+        return self.observed
         
         
     # Functions for model selection, measuring the goodness of fit vs model complexity
@@ -258,12 +309,12 @@ class nmtf_icm:
             # -2*loglikelihood + 2*no. free parameters
             return - 2 * log_likelihood + 2 * (self.I*self.K+self.K*self.L+self.J*self.L)
         elif metric == 'MSE':
-            R_pred = self.triple_dot(self.F,self.S,self.G.T)
-            return self.compute_MSE(self.M,self.R,R_pred)
+            observed = self.observed_values(self.M)
+            return observed.performances(triple_dot_entries(self.F,self.S,self.G,observed.rows,observed.columns),['MSE'])['MSE']
         elif metric == 'ELBO':
             return 0.
         
     def log_likelihood(self):
         # Return the likelihood of the data given the trained model's parameters
-        return self.size_Omega / 2. * ( math.log(self.tau) - math.log(2*math.pi) ) \
-             - self.tau / 2. * (self.M*( self.R - self.triple_dot(self.F,self.S,self.G.T) )**2).sum()
\ No newline at end of file
+        observed = self.observed_values(self.M)
+        return observed.log_likelihood(triple_dot_entries(self.F,self.S,self.G,observed.rows,observed.columns),self.tau)
\ No newline at end of file
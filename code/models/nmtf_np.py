@@ -29,22 +29,44 @@ Initialisation can be done by running the initialise(init,tauUV) function. We in
           = 'exponential'   -> F[i,k] ~ Exp(expo_prior), G[j,l] ~ Exp(expo_prior) 
           = 'kmeans'        -> F = KMeans(R,rows)+0.2, G = KMeans(R,columns)+0.2
   where expo_prior is an additional parameter (default 1)
+  
+If we pass sparse=True to the constructor, R and M are stored as scipy.sparse 
+matrices containing only the observed entries, and the ratios R / (F S G.T) in 
+the updates are only computed on Omega - see observed_entries.py.
+
+By default run() does not evaluate the model while training. To track the
+convergence, pass a list of observers to run() - see observers.py. For example,
+    performances = MemorySink()
+    nmtf.run(iterations,observers=[IterationObserver(metrics=['MSE','I_div'],sinks=[performances])])
+gives a dictionary performances.values from 'MSE' and 'I_div' (the I-divergence)
+to a list of values for each iteration.
+
+We can evaluate the model on a test mask M_pred (or a tuple (rows,columns) of
+index arrays) using nmtf.predict(M_pred), and get the predictions for given
+entries, without forming the I x J reconstruction, using nmtf.predict_entries(rows,columns).
 """
 
 from kmeans.kmeans import KMeans
 from distributions.exponential import exponential_draw
+from observed_entries import sparse_R_M, observed_triplets, triple_dot_entries, masked_values, dense, dense_mask, mask_dot, mask_T_dot, apply_mask
+from observers import start_observers, notify_observers, close_observers
+from metrics import ObservedValues, compute_MSE, compute_R2, compute_Rp
 
 import numpy,itertools,math,time
 
 class NMTF:
-    def __init__(self,R,M,K,L):
-        self.R = numpy.array(R,dtype=float)
-        self.M = numpy.array(M,dtype=float)
+    def __init__(self,R,M,K,L,sparse=False):
+        self.sparse = sparse
+        self.observed = None
+        if self.sparse:
+            (self.R,self.M) = sparse_R_M(R,M)
+        else:
+            self.R = numpy.asarray(R,dtype=float)
+            self.M = dense_mask(M)
         self.K = K            
         self.L = L    
         
-        self.metrics = ['MSE','R^2','Rp']
-                
+        
         assert len(self.R.shape) == 2, "Input matrix R is not a two-dimensional array, " \
             "but instead %s-dimensional." % len(self.R.shape)
         assert self.R.shape == self.M.shape, "Input matrix R is not of the same size as " \
@@ -54,16 +76,19 @@ class NMTF:
         
         self.check_empty_rows_columns() 
         
+        # In sparse mode we only need the observed entries, and never form I x J matrices
+        if self.sparse:
+            (self.rows_Omega,self.columns_Omega,self.R_Omega) = observed_triplets(self.R,self.M)
+            return
+        
         # For computing the I-div it is better if unknown values are 1's, not 0's
-        self.R_excl_unknown = numpy.empty((self.I,self.J))
-        for i,j in itertools.product(range(0,self.I),range(0,self.J)):
-            self.R_excl_unknown[i,j] = self.R[i,j] if self.M[i,j] else 1.
+        self.R_excl_unknown = numpy.where(self.M != 0,self.R,1.)
                  
                  
     # Raise an exception if an entire row or column is empty
     def check_empty_rows_columns(self):
-        sums_columns = self.M.sum(axis=0)
-        sums_rows = self.M.sum(axis=1)
+        sums_columns = numpy.asarray(self.M.sum(axis=0)).ravel()
+        sums_rows = numpy.asarray(self.M.sum(axis=1)).ravel()
                     
         # Assert none of the rows or columns are entirely unknown values
         for i,c in enumerate(sums_rows):
@@ -101,27 +126,25 @@ class NMTF:
                 self.G[j,l] = exponential_draw(expo_prior)
         elif init_FG == 'kmeans':
             print "Initialising F using KMeans."
-            kmeans_F = KMeans(self.R,self.M,self.K)
+            kmeans_F = KMeans(dense(self.R),dense(self.M),self.K)
             kmeans_F.initialise()
             kmeans_F.cluster()
             self.F = kmeans_F.clustering_results + 0.2            
             
             print "Initialising G using KMeans."
-            kmeans_G = KMeans(self.R.T,self.M.T,self.L)   
+            kmeans_G = KMeans(dense(self.R).T,dense(self.M).T,self.L)   
             kmeans_G.initialise()
             kmeans_G.cluster()
             self.G = kmeans_G.clustering_results + 0.2
         
         
-    """ Update F, S, G for a number of iterations, printing the performances each iteration. """
-    def run(self,iterations):
+    """ Update F, S, G for a number of iterations, notifying the observers after each iteration. """
+    def run(self,iterations,observers=[]):
         assert hasattr(self,'F') and hasattr(self,'S') and hasattr(self,'G'), \
             "F, S and G have not been initialised - please run NMTF.initialise() first."        
         
         self.all_times = [] # to plot performance against time
-        self.all_performances = {} # for plotting convergence of metrics
-        for metric in self.metrics:
-            self.all_performances[metric] = []
+        start_observers(observers,self,iterations)
             
         time_start = time.time()
         for it in range(1,iterations+1):
@@ -135,10 +158,10 @@ class NMTF:
             for l in range(0,self.L):
                 self.update_G(l)
                
-            self.give_update(it)
-            
             time_iteration = time.time()
-            self.all_times.append(time_iteration-time_start)  
+            self.all_times.append(time_iteration-time_start)
+            notify_observers(observers,self,it,self.all_times[-1])
+        close_observers(observers)
         
         
     """ Method for doing both initialise() and run() """
@@ -152,64 +175,71 @@ class NMTF:
     def triple_dot(self,M1,M2,M3):
         return numpy.dot(M1,numpy.dot(M2,M3))
         
+    # Return the ratio R / (F S G.T) on the observed entries and 0 elsewhere, as a CSR matrix in sparse mode
+    def masked_ratio(self):
+        if self.sparse:
+            return masked_values(self.M,self.R_Omega / triple_dot_entries(self.F,self.S,self.G,self.rows_Omega,self.columns_Omega))
+        ratio = self.R / self.triple_dot(self.F,self.S,self.G.T)
+        apply_mask(self.M,ratio)
+        return ratio
+        
     def update_F(self,k):
-        R_pred = self.triple_dot(self.F,self.S,self.G.T)
         SG = numpy.dot(self.S[k],self.G.T)
-        numerator = (self.M * self.R / R_pred * SG).sum(axis=1)
-        denominator = (self.M * SG).sum(axis=1)
-        self.F[:,k] = self.F[:,k] * numerator / denominator
+        self.F[:,k] = self.F[:,k] * self.masked_ratio().dot(SG) / mask_dot(self.M,SG)
         
     def update_G(self,l):
-        R_pred = self.triple_dot(self.F,self.S,self.G.T)
         FS = numpy.dot(self.F,self.S[:,l])
-        numerator = ((self.M * self.R / R_pred).T * FS).T.sum(axis=0)
-        denominator = (self.M.T * FS).T.sum(axis=0)
-        self.G[:,l] = self.G[:,l] * numerator / denominator
+        self.G[:,l] = self.G[:,l] * self.masked_ratio().T.dot(FS) / mask_T_dot(self.M,FS)
         
     def update_S(self,k,l):
-        R_pred = self.triple_dot(self.F,self.S,self.G.T)
-        F_times_G = self.M * numpy.outer(self.F[:,k], self.G[:,l])   
-        numerator = (self.R * F_times_G / R_pred).sum()
-        denominator = F_times_G.sum()
+        numerator = numpy.dot(self.F[:,k],self.masked_ratio().dot(self.G[:,l]))
+        denominator = numpy.dot(self.F[:,k],mask_dot(self.M,self.G[:,l]))
         self.S[k,l] = self.S[k,l] * numerator / denominator
            
            
-    ''' Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) '''
-    def predict(self,M_pred):
-        R_pred = self.triple_dot(self.F,self.S,self.G.T)
-        MSE = self.compute_MSE(M_pred,self.R,R_pred)
-        R2 = self.compute_R2(M_pred,self.R,R_pred)    
-        Rp = self.compute_Rp(M_pred,self.R,R_pred)        
-        return {'MSE':MSE,'R^2':R2,'Rp':Rp}        
+    ''' Functions for computing MSE, R^2 (coefficient of determination), Rp (Pearson correlation) - see metrics.py '''
+    def predict(self,M_pred,metrics=['MSE','R^2','Rp']):
+        observed = self.observed_values(M_pred)
+        return observed.performances(self.predict_entries(observed.rows,observed.columns),metrics)
+        
+    ''' Return the predictions for the entries (rows[n],columns[n]) of R, without forming the I x J reconstruction '''
+    def predict_entries(self,rows,columns):
+        return triple_dot_entries(self.F,self.S,self.G,rows,columns)
         
     def compute_MSE(self,M,R,R_pred):
-        return (M * (R-R_pred)**2).sum() / float(M.sum())
+        return compute_MSE(M,R,R_pred)
         
     def compute_R2(self,M,R,R_pred):
-        mean = (M*R).sum() / float(M.sum())
-        SS_total = float((M*(R-mean)**2).sum())
-        SS_res = float((M*(R-R_pred)**2).sum())
-        return 1. - SS_res / SS_total if SS_total != 0. else numpy.inf
+        return compute_R2(M,R,R_pred)
         
     def compute_Rp(self,M,R,R_pred):
-        mean_real = (M*R).sum() / float(M.sum())
-        mean_pred = (M*R_pred).sum() / float(M.sum())
-        covariance = (M*(R-mean_real)*(R_pred-mean_pred)).sum()
-        variance_real = (M*(R-mean_real)**2).sum()
-        variance_pred = (M*(R_pred-mean_pred)**2).sum()
-        return covariance / float(math.sqrt(variance_real)*math.sqrt(variance_pred))   
+        return compute_Rp(M,R,R_pred)
+        
+    ''' Return the observed values of R for the mask M_pred, computing them only once for each mask (M_pred can also be a tuple (rows,columns) of indices) '''
+    # Return the observed values of R for the mask M_pred (which can also be a tuple (rows,columns) of indices). We only
+    # keep them for the training mask self.M, which is our own copy and does not change, and compute them for other masks.
+    def observed_values(self,M_pred):
+        if M_pred is not self.M:
+            return ObservedValues(self.R,M_pred)
+        if self.observed is None:
+            self.observed = ObservedValues(self.R,self.M)
+        return self.observed
         
     def compute_I_div(self):    
+        if self.sparse:
+            R_pred = triple_dot_entries(self.F,self.S,self.G,self.rows_Omega,self.columns_Omega)
+            return ( self.R_Omega * numpy.log( self.R_Omega / R_pred ) - self.R_Omega + R_pred ).sum()
         R_pred = self.triple_dot(self.F,self.S,self.G.T)
-        return (self.M * ( self.R_excl_unknown * numpy.log( self.R_excl_unknown / R_pred ) - self.R_excl_unknown + R_pred ) ).sum()        
-        
-        
-    """ Give updates and store performances """
-    def give_update(self,iteration):    
-        perf = self.predict(self.M)
-        i_div = self.compute_I_div()
-        
-        for metric in self.metrics:
-            self.all_performances[metric].append(perf[metric])
-               
-        print "Iteration %s. I-divergence: %s. MSE: %s. R^2: %s. Rp: %s." % (iteration,i_div,perf['MSE'],perf['R^2'],perf['Rp'])
+        (R_Omega,R_pred) = (self.R_excl_unknown[self.M],R_pred[self.M])
+        return ( R_Omega * numpy.log( R_Omega / R_pred ) - R_Omega + R_pred ).sum()
+        
+        
+    """ Compute the given metrics ('MSE', 'R^2', 'Rp', 'I_div') on the observed entries, for the observers of run() """
+    def evaluate(self,metrics):
+        for metric in metrics:
+            assert metric in ['MSE','MAE','R^2','Rp','I_div'], "Unrecognised metric for evaluation: %s." % metric
+        performance_metrics = [metric for metric in metrics if metric in ['MSE','MAE','R^2','Rp']]
+        values = self.predict(self.M,metrics=performance_metrics) if performance_metrics else {}
+        if 'I_div' in metrics:
+            values['I_div'] = self.compute_I_div()
+        return values
@@ -0,0 +1,127 @@
+"""
+Helper functions for the sparse execution mode of the models, where we only
+store the observed entries of R (given by the mask M) rather than dense I x J
+matrices. The models use this mode if we pass sparse=True to the constructor.
+
+In this mode the models store:
+- M, a scipy.sparse CSR matrix with value 1 at the observed entries Omega.
+- R, a scipy.sparse CSR matrix with the known values of R. If R is given as a
+  dense matrix we keep its nonzero entries, so that we can still evaluate
+  predictions on test entries outside of M.
+- rows_Omega, columns_Omega, R_Omega - the observed (i,j,Rij) triplets, in the
+  same order as the stored values of M.
+Matrices that are zero outside of Omega (such as the residual R - U V.T) are
+stored as CSR matrices with the same structure as M, so that row and column
+sums can be computed using M.dot(v) and M.T.dot(v), and each update costs
+O(|Omega|) rather than O(I*J).
+
+In the dense mode M is stored as a boolean matrix. numpy 1.16 casts booleans
+to floats slowly in every product with them, and masking with where= runs at
+about half the speed of a float multiply. So mask_dot, mask_T_dot,
+apply_mask and subtract_outer cast blocks of rows of the mask (of about
+128KB, through a uint8 view, which is about 3x faster than casting the
+booleans) into one reused float buffer, where they are used.
+"""
+
+import numpy, scipy.sparse
+
+
+# Return R and M as CSR matrices, with M having value 1 at the observed entries
+def sparse_R_M(R,M):
+    R = R if scipy.sparse.issparse(R) else numpy.asarray(R,dtype=float)
+    M = M if scipy.sparse.issparse(M) else numpy.array(M,dtype=float)
+    if len(R.shape) != 2 or R.shape != M.shape:
+        return (R,M) # the model's constructor reports the problem
+
+    M = scipy.sparse.csr_matrix(M,dtype=float,copy=True)
+    M.eliminate_zeros()
+    M.sum_duplicates()
+    M.data[:] = 1.
+    R = scipy.sparse.csr_matrix(R,dtype=float)
+    return (R,M)
+
+# Return the (i,j,Rij) triplets of the observed entries, in the order of the values of M
+def observed_triplets(R,M):
+    rows = numpy.repeat(numpy.arange(M.shape[0]),numpy.diff(M.indptr))
+    columns = M.indices
+    return (rows,columns,gather(R,rows,columns))
+
+# Return the row and column indices of the nonzero entries of a dense or sparse mask
+def nonzero_entries(M):
+    if scipy.sparse.issparse(M):
+        M = scipy.sparse.coo_matrix(M)
+        nonzero = M.data != 0
+        return (M.row[nonzero],M.col[nonzero])
+    return numpy.nonzero(numpy.array(M))
+
+# Return the values X[i,j] for the given lists of indices i and j
+def gather(X,rows,columns):
+    if scipy.sparse.issparse(X):
+        return numpy.asarray(X[rows,columns],dtype=float).ravel() if len(rows) > 0 else numpy.zeros(0)
+    return X[rows,columns]
+
+# Return the values (A B.T)[i,j] for the given lists of indices i and j
+def dot_entries(A,B,rows,columns):
+    return (A[rows]*B[columns]).sum(axis=1)
+
+# Return the values (F S G.T)[i,j] for the given lists of indices i and j, using F S (I x L) if L <= K
+# and S G.T (K x J) otherwise, so each entry costs O(min(K,L)) and we never form an I x J matrix
+def triple_dot_entries(F,S,G,rows,columns):
+    if S.shape[1] <= S.shape[0]:
+        return dot_entries(numpy.dot(F,S),G,rows,columns)
+    return dot_entries(F,numpy.dot(G,S.T),rows,columns)
+
+# Return a CSR matrix with the same structure as M, with the given values on Omega
+def masked_values(M,values):
+    return scipy.sparse.csr_matrix((numpy.array(values,dtype=float),M.indices,M.indptr),shape=M.shape)
+
+# Return the mask as a dense boolean matrix, True at the observed entries
+def dense_mask(M):
+    return numpy.array(M) != 0
+
+# Yield (start,block) for consecutive blocks of rows of the dense boolean mask M, with block the rows
+# M[start:start+len(block)] as floats. The blocks share one buffer, so use each before asking for the next.
+def mask_blocks(M):
+    rows = max(1,2**17 // max(1,M.shape[1]))
+    buffer = numpy.empty((min(rows,M.shape[0]),M.shape[1]))
+    M_uint8 = M.view(numpy.uint8)
+    for start in xrange(0,M.shape[0],rows):
+        block = buffer[:len(M_uint8[start:start+rows])]
+        numpy.copyto(block,M_uint8[start:start+rows])
+        yield (start,block)
+
+# Return M.dot(X) for a dense boolean or sparse mask M
+def mask_dot(M,X):
+    if scipy.sparse.issparse(M):
+        return M.dot(X)
+    X = numpy.asarray(X,dtype=float)
+    product = numpy.empty((M.shape[0],)+X.shape[1:])
+    for (start,block) in mask_blocks(M):
+        product[start:start+len(block)] = numpy.dot(block,X)
+    return product
+
+# Return M.T.dot(X) for a dense boolean or sparse mask M
+def mask_T_dot(M,X):
+    if scipy.sparse.issparse(M):
+        return M.T.dot(X)
+    X = numpy.asarray(X,dtype=float)
+    product = numpy.zeros((M.shape[1],)+X.shape[1:])
+    for (start,block) in mask_blocks(M):
+        product += numpy.dot(block.T,X[start:start+len(block)])
+    return product
+
+# Set the entries of the dense matrix E outside of the boolean mask M to 0, in place, and return E
+def apply_mask(M,E):
+    for (start,block) in mask_blocks(M):
+        E[start:start+len(block)] *= block
+    return E
+
+# Subtract numpy.outer(a,b) from the dense matrix E on the entries in the boolean mask M, in place
+def subtract_outer(E,M,a,b):
+    for (start,block) in mask_blocks(M):
+        block *= numpy.outer(a[start:start+len(block)],b)
+        E[start:start+len(block)] -= block
+
+# Return a dense version of X
+def dense(X):
+    return X.toarray() if scipy.sparse.issparse(X) else X
@@ -0,0 +1,119 @@
+"""
+Observers for the run() method of the models, which decide which metrics are
+computed while training, every how many iterations, and where they are sent.
+By default (no observers) run() does not evaluate anything during training.
+
+- IterationObserver(metrics,every,sinks) computes the given metrics after every
+  <every>th iteration (and after the last one), using model.evaluate(metrics),
+  and sends a record to each of the sinks. A record is an ordered dictionary
+  { 'iteration':it, 'time':seconds, metric:value, ... }, where the time is
+  measured from the start of run() to the end of the updates of iteration it.
+
+The available metrics are:
+- 'MSE', 'MAE', 'R^2', 'Rp' - the performance on the observed entries M, for all
+  models (see metrics.py);
+- 'ELBO' and 'exp_tau' for the VB models, 'tau' for the Gibbs and ICM models;
+- 'loglikelihood' - the log likelihood of the current parameter values (the
+  current draw for Gibbs), for the VB, Gibbs and ICM models;
+- 'I_div' - the I-divergence, for the non-probabilistic models.
+
+The sinks are:
+- MemorySink() keeps the metrics in lists, as sink.values[metric], with the
+  corresponding sink.iterations and sink.times.
+- JSONLinesSink(filename) writes one JSON line per record to the file.
+- PrintSink() prints a line per record to stdout.
+
+Usage:
+    performances = MemorySink()
+    observer = IterationObserver(metrics=['MSE','ELBO'],every=10,sinks=[performances,JSONLinesSink('trace.jsonl')])
+    BNMF.run(iterations,observers=[observer])
+    plt.plot(performances.iterations,performances.values['MSE'])
+"""
+
+from collections import OrderedDict
+import json
+
+
+class IterationObserver:
+    def __init__(self,metrics=['MSE','R^2','Rp'],every=1,sinks=None):
+        assert every >= 1, "Should evaluate at least every 1 iteration, but every is %s." % every
+        self.metrics = metrics
+        self.every = every
+        self.sinks = sinks if sinks is not None else [MemorySink()]
+
+    def start(self,model,iterations):
+        self.iterations = iterations
+        for sink in self.sinks:
+            sink.start(self.metrics)
+
+    # Called by the model after each iteration (counting from 1), with the time since the start of run()
+    def notify(self,model,iteration,time):
+        if iteration % self.every != 0 and iteration != self.iterations:
+            return
+        record = OrderedDict([('iteration',iteration),('time',time)])
+        values = model.evaluate(self.metrics)
+        for metric in self.metrics:
+            record[metric] = values[metric]
+        for sink in self.sinks:
+            sink.add(record)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+class MemorySink:
+    def start(self,metrics):
+        self.iterations = []
+        self.times = []
+        self.values = { metric:[] for metric in metrics }
+
+    def add(self,record):
+        self.iterations.append(record['iteration'])
+        self.times.append(record['time'])
+        for metric in self.values:
+            self.values[metric].append(record[metric])
+
+    def close(self):
+        return
+
+
+class JSONLinesSink:
+    def __init__(self,filename,mode='w'):
+        self.filename = filename
+        self.mode = mode
+
+    def start(self,metrics):
+        self.fout = open(self.filename,self.mode)
+
+    def add(self,record):
+        self.fout.write(json.dumps(record)+"\n")
+        self.fout.flush()
+
+    def close(self):
+        self.fout.close()
+
+
+class PrintSink:
+    def start(self,metrics):
+        return
+
+    def add(self,record):
+        print "Iteration %s. " % record['iteration'] + " ".join(["%s: %s." % (metric,value) for metric,value in record.items()[2:]])
+
+    def close(self):
+        return
+
+
+# Let all observers know we start a run, finished an iteration, or finished the run
+def start_observers(observers,model,iterations):
+    for observer in observers:
+        observer.start(model,iterations)
+
+def notify_observers(observers,model,iteration,time):
+    for observer in observers:
+        observer.notify(model,iteration,time)
+
+def close_observers(observers):
+    for observer in observers:
+        observer.close()
@@ -0,0 +1,236 @@
+"""
+Sample stores for the Gibbs samplers, which decide where the draws of each
+iteration are kept.
+
+- MemorySampleStore() keeps all draws in memory, as numpy arrays of shape
+  (iterations,...). This is the default. With MemorySampleStore(burn_in,thinning)
+  we only keep the thinned draws after the burn-in.
+- MemmapSampleStore(folder,burn_in,thinning,chunk_size) only keeps the draws
+  after the burn-in, and every <thinning>th after that, in a memory-mapped .npy
+  file per parameter (e.g. folder/U.npy). The files are flushed to disk every
+  <chunk_size> stored draws, so long chains on large matrices do not need to
+  fit in RAM.
+- SummarySampleStore(burn_in,thinning,rows,columns,capacity) does not store the
+  draws at all. It keeps a running mean and variance (Welford's algorithm) of 
+  each parameter over the thinned post-burn-in draws, using O(I*K) memory, and 
+  optionally a fixed-size reservoir sample of the predictions for the entries
+  (rows[n],columns[n]) of R, from which we can compute quantiles and credible
+  intervals (store.predictions.quantiles(q), store.predictions.interval(0.95)).
+
+Usage (for the Gibbs samplers):
+    store = MemmapSampleStore(folder='samples/',burn_in=1000,thinning=10)
+    BNMF.run(iterations,store=store)
+    BNMF.approx_expectation(burn_in=1000,thinning=10)
+
+The first two stores give back an array-like object per parameter that can be 
+indexed by iteration (BNMF.all_U[it]), so approx_expectation() and predict() 
+work with either store, as long as we only ask for iterations that were stored.
+We can also load previously stored draws using MemmapSampleStore.load(iterations,names).
+The summary store gives back a RunningSummary per parameter instead, for which
+approx_expectation() and predict() only work with the burn-in and thinning that
+were given up front, but take O(1) time in the length of the chain.
+
+The samplers pass a function predict(values,rows,columns) to allocate(), which
+gives the predictions for the entries (rows[n],columns[n]) of R for a draw.
+"""
+
+import numpy, os
+
+
+class MemorySampleStore:
+    def __init__(self,burn_in=0,thinning=1):
+        assert burn_in >= 0, "Burn-in should be nonnegative, but is %s." % burn_in
+        assert thinning >= 1, "Thinning should be at least 1, but is %s." % thinning
+        self.burn_in = burn_in
+        self.thinning = thinning
+
+    # Allocate arrays of size no. kept draws x shape for each parameter, given as a dictionary of shapes
+    def allocate(self,iterations,shapes,predict=None):
+        no_kept = len(range(self.burn_in,iterations,self.thinning))
+        self.samples = { name:numpy.zeros((no_kept,)+tuple(shape)) for name,shape in shapes.iteritems() }
+        if (self.burn_in,self.thinning) == (0,1):
+            return self.samples
+        return { name:ThinnedSamples(samples,iterations,self.burn_in,self.thinning) for name,samples in self.samples.iteritems() }
+
+    # Store the values (a dictionary) of the parameters for the given iteration, if we keep it
+    def add(self,iteration,values):
+        if iteration < self.burn_in or (iteration - self.burn_in) % self.thinning != 0:
+            return
+        index = (iteration - self.burn_in) / self.thinning
+        for name,value in values.iteritems():
+            self.samples[name][index] = value
+
+    def close(self):
+        return
+
+
+class MemmapSampleStore:
+    def __init__(self,folder,burn_in=0,thinning=1,chunk_size=100):
+        assert burn_in >= 0, "Burn-in should be nonnegative, but is %s." % burn_in
+        assert thinning >= 1, "Thinning should be at least 1, but is %s." % thinning
+        assert chunk_size >= 1, "Chunk size should be at least 1, but is %s." % chunk_size
+        self.folder = folder
+        self.burn_in = burn_in
+        self.thinning = thinning
+        self.chunk_size = chunk_size
+
+    # Return the location of the file for the given parameter
+    def file_location(self,name):
+        return os.path.join(self.folder,name+'.npy')
+
+    # Create the memory-mapped files, with one row for each draw we keep
+    def allocate(self,iterations,shapes,predict=None):
+        if not os.path.exists(self.folder):
+            os.makedirs(self.folder)
+        no_kept = len(range(self.burn_in,iterations,self.thinning))
+        self.memmaps = {
+            name:numpy.lib.format.open_memmap(self.file_location(name),mode='w+',dtype=float,shape=(no_kept,)+tuple(shape))
+            for name,shape in shapes.iteritems()
+        }
+        self.no_stored = 0
+        return { name:ThinnedSamples(memmap,iterations,self.burn_in,self.thinning) for name,memmap in self.memmaps.iteritems() }
+
+    # Store the values if we keep this iteration, and write them to disk every chunk_size draws
+    def add(self,iteration,values):
+        if iteration < self.burn_in or (iteration - self.burn_in) % self.thinning != 0:
+            return
+        index = (iteration - self.burn_in) / self.thinning
+        for name,value in values.iteritems():
+            self.memmaps[name][index] = value
+        self.no_stored += 1
+        if self.no_stored % self.chunk_size == 0:
+            self.flush()
+
+    def flush(self):
+        for memmap in self.memmaps.values():
+            memmap.flush()
+
+    def close(self):
+        self.flush()
+
+    # Load previously stored draws (read-only) for a chain of the given number of iterations
+    def load(self,iterations,names):
+        return {
+            name:ThinnedSamples(numpy.load(self.file_location(name),mmap_mode='r'),iterations,self.burn_in,self.thinning)
+            for name in names
+        }
+
+
+class ThinnedSamples:
+    """ Array-like view of the thinned draws kept by a store, indexed by iteration. """
+    def __init__(self,samples,iterations,burn_in,thinning):
+        self.samples = samples
+        self.iterations = iterations
+        self.burn_in = burn_in
+        self.thinning = thinning
+        self.shape = (iterations,)+samples.shape[1:]
+
+    def __len__(self):
+        return self.iterations
+
+    def __getitem__(self,iteration):
+        assert iteration >= self.burn_in and (iteration - self.burn_in) % self.thinning == 0, \
+            "Iteration %s was not stored (burn-in %s, thinning %s)." % (iteration,self.burn_in,self.thinning)
+        return self.samples[(iteration - self.burn_in) / self.thinning]
+
+
+class SummarySampleStore:
+    def __init__(self,burn_in=0,thinning=1,rows=None,columns=None,capacity=1000,seed=None):
+        assert burn_in >= 0, "Burn-in should be nonnegative, but is %s." % burn_in
+        assert thinning >= 1, "Thinning should be at least 1, but is %s." % thinning
+        assert (rows is None) == (columns is None), "Should give both rows and columns of the entries to predict, or neither."
+        self.burn_in = burn_in
+        self.thinning = thinning
+        self.rows = None if rows is None else numpy.array(rows,dtype=int)
+        self.columns = None if columns is None else numpy.array(columns,dtype=int)
+        self.capacity = capacity
+        self.seed = seed
+
+    # Create a running summary for each parameter, and the reservoir for the predictions
+    def allocate(self,iterations,shapes,predict=None):
+        self.summaries = { name:RunningSummary(shape,self.burn_in,self.thinning) for name,shape in shapes.iteritems() }
+        self.predictions = None
+        if self.rows is not None:
+            assert predict is not None, "Cannot summarise predictions without a predict function."
+            self.predict = predict
+            self.predictions = PredictionReservoir(len(self.rows),self.capacity,self.seed)
+        return self.summaries
+
+    def add(self,iteration,values):
+        if iteration < self.burn_in or (iteration - self.burn_in) % self.thinning != 0:
+            return
+        for name,value in values.iteritems():
+            self.summaries[name].update(value)
+        if self.predictions is not None:
+            self.predictions.add(self.predict(values,self.rows,self.columns))
+
+    def close(self):
+        return
+
+
+class RunningSummary:
+    """ Running mean and variance of the draws of a parameter, using Welford's algorithm. """
+    def __init__(self,shape,burn_in,thinning):
+        self.burn_in = burn_in
+        self.thinning = thinning
+        self.count = 0
+        self.mean = numpy.zeros(shape)
+        self.sum_squares = numpy.zeros(shape) # sum of squared differences from the mean
+
+    def update(self,value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean = self.mean + delta / float(self.count)
+        self.sum_squares = self.sum_squares + delta * (value - self.mean)
+
+    def variance(self):
+        assert self.count > 0, "No draws have been summarised yet."
+        return self.sum_squares / float(self.count)
+
+    # Return the mean, checking the burn-in and thinning are the ones we summarised
+    def expectation(self,burn_in,thinning):
+        assert (burn_in,thinning) == (self.burn_in,self.thinning), \
+            "Draws were summarised with burn-in %s and thinning %s, not %s and %s." % (self.burn_in,self.thinning,burn_in,thinning)
+        assert self.count > 0, "No draws have been summarised yet."
+        return self.mean
+
+
+class PredictionReservoir:
+    """ Uniform sample of at most <capacity> draws of the predictions, using reservoir sampling. """
+    def __init__(self,no_entries,capacity,seed=None):
+        assert capacity >= 1, "Capacity should be at least 1, but is %s." % capacity
+        self.capacity = capacity
+        self.count = 0
+        self.draws = numpy.zeros((capacity,no_entries))
+        self.random_state = numpy.random.RandomState(seed) # so we do not change the sampler's random draws
+
+    def add(self,predictions):
+        if self.count < self.capacity:
+            self.draws[self.count] = predictions
+        else:
+            index = self.random_state.randint(0,self.count+1)
+            if index < self.capacity:
+                self.draws[index] = predictions
+        self.count += 1
+
+    # Return the q-quantile of the predictions for each entry, for q (or each q) in [0,1]
+    def quantiles(self,q):
+        assert self.count > 0, "No draws have been summarised yet."
+        return numpy.percentile(self.draws[:min(self.count,self.capacity)],numpy.array(q)*100.,axis=0)
+
+    # Return the lower and upper bound of the central credible interval of the given mass
+    def interval(self,mass=0.95):
+        (lower,upper) = self.quantiles([(1.-mass)/2.,(1.+mass)/2.])
+        return (lower,upper)
+
+
+# Return the average of the samples over the iterations after the burn-in, using every <thinning>th,
+# reading one draw at a time
+def sample_mean(samples,burn_in,thinning):
+    if isinstance(samples,RunningSummary):
+        return samples.expectation(burn_in,thinning)
+    indices = range(burn_in,len(samples),thinning)
+    total = 0.
+    for i in indices:
+        total = total + numpy.array(samples[i],dtype=float)
+    return total / float(len(indices))
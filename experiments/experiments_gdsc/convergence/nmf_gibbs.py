@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.bnmf_gibbs_optimised import bnmf_gibbs_optimised
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import numpy, matplotlib.pyplot as plt
@@ -35,15 +36,16 @@ priors = { 'alpha':alpha, 'beta':beta, 'lambdaU':lambdaU, 'lambdaV':lambdaV }
 # Run the Gibbs sampler
 BNMF = bnmf_gibbs_optimised(R,M,K,priors)
 BNMF.initialise(init_UV)
-BNMF.run(iterations)
+performances_sink = MemorySink()
+BNMF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Extract the performances across all iterations
-print "gibbs_all_performances = %s" % BNMF.all_performances
+print "gibbs_all_performances = %s" % performances_sink.values
 
 '''
 gibbs_all_performances = {'R^2': [-8097.120524618645, -92.03487885308488, -6.1422176349457756, -0.9038601900265792, 0.05832803080595805, 0.4541099367061112, 0.6049897886014735, 0.6736775260991249, 0.7113260353160478, 0.7369323486022221, 0.7525628528289362, 0.7659397349827468, 0.7773012058774671, 0.7855698093348511, 0.7930877773146086, 0.7981951259097773, 0.8033683532126303, 0.8083365002626853, 0.8119712286388999, 0.8143321065006544, 0.8174307057444653, 0.8203981211408663, 0.824072689104962, 0.8262040538252395, 0.8280595312721502, 0.8300349108022617, 0.831698141327422, 0.833322847879864, 0.8347412513742691, 0.8361247549331208, 0.8379854025250282, 0.8382916154890347, 0.8396590145998284, 0.8409666592263021, 0.8416328694506152, 0.8423226039002082, 0.8436124922062069, 0.8443654471055815, 0.8453909498730786, 0.845580518865929, 0.8465652093896273, 0.8473266413053484, 0.8475762860160989, 0.8484714859501538, 0.8492485657082272, 0.84966685946956, 0.8505509120849405, 0.85143711565206, 0.851852342846928, 0.8521812307471013, 0.852139235169544, 0.8533607840336465, 0.8538099348560734, 0.8541389391880759, 0.8547553473683829, 0.8551349698989649, 0.8554572833125114, 0.8555974212169639, 0.8562449936037535, 0.8562960240997501, 0.8571512526606135, 0.8574317831241824, 0.8578119177871499, 0.8579728992983436, 0.8580465976062377, 0.8586124715798914, 0.859267244033816, 0.8594562427751072, 0.8594384799184416, 0.8602714365040705, 0.8604894643211488, 0.860582665238959, 0.8610246381518363, 0.8613466343545377, 0.8614398141537936, 0.8617954338275668, 0.8622262163772405, 0.861905573949389, 0.862334418720568, 0.8628297028804424, 0.8628435094308295, 0.8634237727418607, 0.8632092252941954, 0.8636937263449179, 0.8637203890138985, 0.8640835967054745, 0.8642409583561601, 0.8640804715773884, 0.8645989544651734, 0.8651739238553432, 0.8655308475374881, 0.8653673995029159, 0.8655456853941349, 0.8655640745445357, 0.8658403125015841, 0.8663842177748899, 0.8667337429325581, 0.8667530964887968, 0.8668809138224083, 0.8667922423687051, 0.8666434734617718, 0.86712992023443, 0.8666621878076579, 0.8671240046046882, 0.8669761667431293, 0.8674455977960188, 0.8673842265418769, 0.8675186960418493, 0.8677119115944193, 0.8674869033419581, 0.8676845902882724, 0.8679810495489251, 0.8685090295740011, 0.8681921196951283, 0.8679386407884324, 0.8685689055910684, 0.8686292405923675, 0.8689979745997642, 0.8686733209624224, 0.8688539889067889, 0.8689575178877409, 0.8694702389597223, 0.8693889935182963, 0.8691664671604185, 0.8693314628576805, 0.8695296386156133, 0.8699234023085682, 0.8700626367293269, 0.8698235714484666, 0.8698417878864653, 0.8699605755411289, 0.8699548491894418, 0.8699177614295612, 0.8702401532205712, 0.870089029705315, 0.8701709473716509, 0.8705157718817089, 0.8707897374566467, 0.8705681409883498, 0.8705077836816242, 0.8704211202866602, 0.8709499553159825, 0.8705323689139849, 0.8707828962071351, 0.8708432466981006, 0.8708162776386472, 0.8708752487165031, 0.8709395522623583, 0.8712577197500219, 0.8715952816152841, 0.8719170982721198, 0.8720101023103196, 0.8721999840699668, 0.8724102627545355, 0.8724269566330951, 0.8721872229249841, 0.872624671270274, 0.8723150046165411, 0.8727134321121253, 0.8727809445597847, 0.8729836051892527, 0.8725220514452008, 0.8729064306688725, 0.8727540629259423, 0.872811021288973, 0.8730114623442058, 0.8730120206782903, 0.873148828139038, 0.8730567472128643, 0.8732358404117283, 0.8731992488974761, 0.8735205417375718, 0.8737142814404085, 0.8733196505195533, 0.873779786914497, 0.8735748615376708, 0.8735316352600613, 0.8739230682270438, 0.874008164332888, 0.8737181024742783, 0.873392278996135, 0.8731817547281827, 0.8737761689477963, 0.873726112530435, 0.8736718633040765, 0.8743360122054964, 0.8742358139574171, 0.8745797936948219, 0.8745306149812437, 0.8745080879713857, 0.8748673454911532, 0.8747381575101926, 0.8750171522010532, 0.8748271842107753, 0.8751481079866305, 0.8750341987717516, 0.875070401257694, 0.8753040865153376, 0.8752875238839548, 0.8756194967501238, 0.8754649720978467, 0.8752305012455419, 0.8754660392907536, 0.8750430069344697, 0.8753753112421354, 0.8753228876209207, 0.8754190096499348, 0.8753742732211153, 0.874932023597963, 0.8753178929551866, 0.8754591290908846, 0.8756386225083636, 0.875327743517445, 0.8758326034658949, 0.8755754904552859, 0.8757111996209137, 0.8756139901465797, 0.8756489396742231, 0.8754978448654253, 0.875687357985614, 0.875904318511274, 0.8759004388455014, 0.8758937941307692, 0.8765213049190524, 0.8763542096831669, 0.8766003816992559, 0.8763511813248714, 0.8765320511402347, 0.8765361349231945, 0.8767221424150524, 0.8763962819611748, 0.8765337596797868, 0.8765651125433056, 0.8765205587540978, 0.8767898443549997, 0.8770749262760689, 0.8768779974522254, 0.8774617455282151, 0.8771975343547003, 0.8774017084933295, 0.8775479100226988, 0.8776549254193673, 0.878002327573694, 0.8783410061964131, 0.877584117631878, 0.8777600854721646, 0.8773919495895153, 0.8773866088567158, 0.8778120356420893, 0.8778296992781149, 0.8778781797574046, 0.8777438538680431, 0.8775108488094653, 0.8778780826280024, 0.8778141378815467, 0.8779622806719389, 0.8783804379144875, 0.8783616419844514, 0.8784345054783582, 0.8783779566782007, 0.878685921429486, 0.8781496611658914, 0.878369104818205, 0.878549660705894, 0.8788113344036906, 0.8787222834008148, 0.8787909126431644, 0.8787860679141768, 0.8792155718373028, 0.8788732756509796, 0.8791408982027165, 0.8789349770168012, 0.8790324450103074, 0.8789716990660366, 0.8790491844352575, 0.8794264945784204, 0.8793745156201396, 0.8795214315046469, 0.8795572180962931, 0.8796702839284319, 0.8791682242962183, 0.8794015606423875, 0.8793688367311017, 0.8793072154557543, 0.879498787464662, 0.8793769251079315, 0.8796242871925027, 0.8798471122918762, 0.8796497898358203, 0.8793723808175908, 0.879602795011505, 0.8797602833141777, 0.8795713875252283, 0.8793271051258167, 0.879181917781312, 0.8795858854534391, 0.879497792677256, 0.8799848781504043, 0.880132579757744, 0.8798416357359783, 0.8804438151975417, 0.879985743668034, 0.8797555197282148, 0.8797906113602598, 0.8799882230631781, 0.8803768936633788, 0.8805490623689693, 0.8798189423722694, 0.8800451066946586, 0.8802178393670685, 0.8804099598973915, 0.88017332296716, 0.8801566657123907, 0.8798535142703103, 0.8798990334278867, 0.8799703587742911, 0.8802857013732331, 0.8800439850882587, 0.8800917052445562, 0.8804827828542173, 0.8808959714400665, 0.8804798849154631, 0.8809540924891105, 0.8807764699353184, 0.8808858160267399, 0.8808202212020417, 0.8809102224538164, 0.8808603483264676, 0.8812348814768288, 0.8810101108401295, 0.8810229663556421, 0.8813515856611203, 0.8812895158573928, 0.881109302217869, 0.8811061573533391, 0.8810843911911028, 0.8814852226699503, 0.8810197404585685, 0.8810031828279404, 0.88106642719292, 0.8810714987368234, 0.8813460547810501, 0.8812561636490028, 0.881684472899955, 0.8816039022223956, 0.8814772534490188, 0.8816542675730777, 0.8821094330330805, 0.882067896525182, 0.8819211691504016, 0.8819025253544251, 0.8818385107548776, 0.881800292063456, 0.8818945575636021, 0.8816727475214896, 0.8818639952923207, 0.881825677726259, 0.8816686184893145, 0.8819482306564362, 0.8816423288860238, 0.8816724317793293, 0.8815274639878543, 0.8814530804585867, 0.881574266086974, 0.8816608480934317, 0.8813446777912521, 0.8816579480340355, 0.8817015880788085, 0.8817540147485188, 0.8817328475916443, 0.8819051988500844, 0.881936338495981, 0.8819493713243178, 0.8819681964444197, 0.8820528329611529, 0.8823066673277756, 0.8823634158776184, 0.8821833365310139, 0.8822090032809478, 0.8820009631317465, 0.8820211585168174, 0.88209522910204, 0.8817595137084046, 0.8816991655993722, 0.8817649436748548, 0.8818480989425592, 0.8819867549060114, 0.8822002534508783, 0.8820011972105416, 0.88213572494363, 0.8822448338077196, 0.8821069514258616, 0.8824167213717884, 0.8820802430906017, 0.8822698469912832, 0.8822934811702775, 0.8821810684779078, 0.8821800477452143, 0.8823559193822448, 0.8825678977970318, 0.882288977370051, 0.8821310815246239, 0.882406454522845, 0.8827041411491623, 0.8826998813242738, 0.8828259560298077, 0.8825230338988669, 0.882554862281831, 0.8824798803185648, 0.8826431761723457, 0.8827866547484304, 0.8825199618345575, 0.8829243456619593, 0.8827757757596811, 0.8829442810149261, 0.8827430806600383, 0.882385904194805, 0.8823720602932045, 0.8826575684943072, 0.8825380445330001, 0.8825116824354196, 0.8828954027607119, 0.8828642440416647, 0.8828706679303298, 0.8830171911168937, 0.8828793945087832, 0.8829665249989219, 0.8838070861669896, 0.8832405655264856, 0.8832324927600742, 0.883024970903529, 0.8830418861501715, 0.8830072571234296, 0.8832545910701987, 0.8831505450762547, 0.8833043597502448, 0.883184797344809, 0.8833056300135701, 0.8831224326229611, 0.883302936005317, 0.8832597336788235, 0.883551011617595, 0.8834210433962496, 0.8834033380637913, 0.883057199329653, 0.8834776306335889, 0.8835235464455033, 0.8835250356217219, 0.8835201070852376, 0.8835426188136185, 0.8834743242449845, 0.8833529158019313, 0.8831089334269735, 0.8830735248371071, 0.8831418804495536, 0.8832270458147763, 0.8830847278149905, 0.8831741349208921, 0.8830412061977555, 0.8829683291558491, 0.8829776515780637, 0.8832489762840519, 0.8833135079841824, 0.883325180919543, 0.8837597265887456, 0.8835777442484358, 0.8838575059973188, 0.8838359064725356, 0.8844484758831598, 0.8841571035581643, 0.884049358015375, 0.8840958439375419, 0.884213178027971, 0.8840797975566118, 0.8838209667420592, 0.8841117474279783, 0.8839950829331353, 0.884072782261511, 0.8835113779542265, 0.8838630640350119, 0.8837274001927073, 0.8838734239759831, 0.8839148658121109, 0.8837933629764947, 0.884110906390748, 0.8844284656012616, 0.8843058766450629, 0.8841246803621507, 0.884005689337822, 0.8838520284355581, 0.8840316654277575, 0.8839912955267794, 0.8840863397933251, 0.8841285161910367, 0.8842227673409914, 0.8842513894743921, 0.8841503886790125, 0.8841527870620856, 0.8840874771018112, 0.8840407673095213, 0.8838633717784687, 0.8838838069026591, 0.8834519692821029, 0.8836302736179938, 0.8840806166111697, 0.8839679569866545, 0.883916965223105, 0.8842050778124985, 0.8847727791244839, 0.8847088630804918, 0.8841717984667983, 0.8844685826637968, 0.8846572721549342, 0.8847739477249252, 0.8846042970863779, 0.884362703853601, 0.8844404324888259, 0.884345487624207, 0.8843270489088968, 0.8845341509017453, 0.8843569376878041, 0.8844534903483312, 0.8844426251651443, 0.8847366232090356, 0.8847318463837691, 0.8846779930417522, 0.8848675722372796, 0.8847071335594104, 0.8846313196572319, 0.8847695897536374, 0.8852002925022526, 0.8849434830023856, 0.8850574523976309, 0.8848237940186497, 0.885187146887056, 0.8855123650329709, 0.8853035988121922, 0.8853121322098495, 0.8849191720296313, 0.8849450531579128, 0.8850598175908879, 0.8849699384714567, 0.8850246858764342, 0.8850254199411649, 0.8852961506255522, 0.8852843330043558, 0.8848010276622433, 0.8851758630104641, 0.8851361279792316, 0.8853305570557476, 0.88533695132133, 0.8853445690364108, 0.8850536556576839, 0.8852974248798672, 0.8854842466590023, 0.8850341416403156, 0.8852857920761271, 0.8851619097715835, 0.8850860679679015, 0.8851422622130587, 0.8851408472208426, 0.8849524361130161, 0.8847810878871345, 0.8846922709735019, 0.884823019706124, 0.8850387468000227, 0.8850092101159812, 0.8849460583674205, 0.8848954592858158, 0.8849393331344371, 0.8854465542932138, 0.8851212751443385, 0.8853224359216089, 0.8849135076315469, 0.8850740987933868, 0.8853147447463385, 0.8845884691155067, 0.885032901526111, 0.8848315211551345, 0.8850328907707198, 0.8850285706020307, 0.8851292540124098, 0.8852918009660319, 0.8855363133975207, 0.8856059770550685, 0.8853435726759948, 0.8857345382113256, 0.8858693116340052, 0.8857691762019493, 0.8861239374313212, 0.8858015582435145, 0.8858579767299745, 0.8857380756317571, 0.8854769375641524, 0.8857883440906792, 0.8858073079006552, 0.8858423425623367, 0.8858047087885955, 0.8856496029515406, 0.885678525730419, 0.8856103105571498, 0.8856971276517793, 0.8860031076906716, 0.885333764954096, 0.8851049189948728, 0.8849032495967838, 0.8852780190516907, 0.8855371838187627, 0.8854696892707883, 0.8857775568362554, 0.8854066757239494, 0.8855664906290239, 0.8854477594721885, 0.8853791196206057, 0.8853531105635697, 0.8852534906673994, 0.8851160579881581, 0.8850136886823138, 0.884788054046282, 0.8852801462899875, 0.8853158710870375, 0.8852818666321864, 0.8852883442453379, 0.8852503788707302, 0.8851811401276978, 0.8856391880652099, 0.885306063981389, 0.8854999630826965, 0.8857844179662042, 0.8860817089520552, 0.885636109678027, 0.8858627336561052, 0.885877754130326, 0.8860488624446385, 0.8863002570180794, 0.8864187108259031, 0.886667104300022, 0.8867140019063984, 0.8864593520934897, 0.8865380936070256, 0.8864339111646542, 0.8863975493970135, 0.8864856631680333, 0.8861100151894936, 0.8864622338256677, 0.8860332393588589, 0.8858783865418227, 0.8857868652509804, 0.8857975831009766, 0.8858918761729189, 0.8856393077476215, 0.885368196416833, 0.8856307809523633, 0.8858630416812926, 0.8859462400411013, 0.8860829282348391, 0.8861262575386575, 0.8862941845414389, 0.8859531247974936, 0.8863959625150064, 0.8864891439419631, 0.8866438758797961, 0.8865322705626931, 0.8865269535945615, 0.8862323746354378, 0.8864076972316539, 0.8861669766489841, 0.8860611153055064, 0.8861507586609968, 0.885984557275075, 0.8857247213687698, 0.8858154914700013, 0.8856974002153534, 0.8855337219639209, 0.8853331159979118, 0.8851290957971637, 0.8854805534718266, 0.885898927498177, 0.885516107860453, 0.8860396030794969, 0.8858227323098672, 0.8858998761549918, 0.8858372973796993, 0.8860581403583567, 0.8857401714239368, 0.8858194841786413, 0.8858219703490599, 0.8860460284600564, 0.8862794874048704, 0.8861659669633665, 0.8861841977325703, 0.8859571388294847, 0.8861591290090042, 0.8861778721124087, 0.886075517087606, 0.8861153942676638, 0.8863493482296616, 0.8863588053367283, 0.8862855171694561, 0.8859522358455347, 0.8861881413646316, 0.88635919271561, 0.8866150672343261, 0.88654301302033, 0.8863308168970878, 0.8864878406571476, 0.8865920791660741, 0.8865282934881934, 0.8861324687594393, 0.886499999490782, 0.8867613222651942, 0.8867015249226922, 0.8864541399495274, 0.8862886890345055, 0.8867196084510127, 0.8865279899931009, 0.8865048203708887, 0.8864352997649659, 0.8865299602743015, 0.8864135657205212, 0.8865718553942905, 0.8861959021091852, 0.8862738925916949, 0.8863226709576972, 0.8861503604810642, 0.8860617778477002, 0.8863049282736523, 0.8865571213664623, 0.8867652877313581, 0.886519354823718, 0.8865398180490415, 0.8864300887393763, 0.8863778263209242, 0.8864502685513204, 0.8864001356937976, 0.8864619607900333, 0.886117507465142, 0.8864898693791723, 0.8862616397468371, 0.8864203307182813, 0.8861489143443313, 0.8864813836158378, 0.8863573171914811, 0.8862357329915082, 0.8864369477571208, 0.8864368087225932, 0.8861249691183342, 0.8858822806566068, 0.886328931471174, 0.8865216443730759, 0.8862349428078365, 0.8862938519407512, 0.8864305098942695, 0.8866093265863396, 0.8866769178416114, 0.8866594305117043, 0.8865791563163847, 0.886575074194492, 0.8867175327231442, 0.8868718511084557, 0.8865477383542729, 0.886276306679302, 0.886161681176577, 0.8864468201009081, 0.8866686380271538, 0.8864278223420893, 0.8866868094871566, 0.8865815864540443, 0.8867997401157333, 0.8866653322100713, 0.8866855913444673, 0.886660110090162, 0.8869666562282644, 0.886796054352894, 0.8865010781771416, 0.8862260037695419, 0.886271774497799, 0.8863760663420235, 0.8863932330238726, 0.8861578910581166, 0.886198387869516, 0.8862255611336365, 0.8865602455757948, 0.8865932390135045, 0.8869227081520129, 0.8866545743348462, 0.8867931842599903, 0.8867516474116198, 0.8868499807822032, 0.8867491065997263, 0.8867111163634813, 0.8867844068606505, 0.8867153203893243, 0.8868451847011102, 0.8867842631332229, 0.8868809246879129, 0.8870755295822882, 0.8870495155093687, 0.8870435700839171, 0.8870529943177412, 0.8868819212859723, 0.8869410269511423, 0.8866352999594027, 0.8868859153530155, 0.8870110870950605, 0.8867961225506547, 0.8864798502126707, 0.8867088668266693, 0.8868666729168021, 0.8868459347531128, 0.8868373091590261, 0.8867172720971221, 0.8867458573939145, 0.8869391146442525, 0.8867135916002784, 0.8864547461496559, 0.8865756292130951, 0.8868875992596796, 0.8862852633205196, 0.886560065002256, 0.886740138943271, 0.8869774686018966, 0.8869787198416665, 0.8867743319735734, 0.8865932902381132, 0.88693725818608, 0.8871352571270734, 0.8867709077254926, 0.8868371947167154, 0.8870526719801723, 0.886961521718147, 0.8869519103249646, 0.8865510605389585, 0.8862901930825455, 0.8861671465136208, 0.8865366766885663, 0.8865301793481626, 0.8864226350235148, 0.8863422535312271, 0.8867166851138877, 0.8866410356798157, 0.8866047539509775, 0.8866195654416535, 0.8866504139538347, 0.8868632201730076, 0.8870580774839936, 0.8869005082252339, 0.8868965448224995, 0.8870637678707096, 0.887050191655253, 0.8866409655994814, 0.8866595123088015, 0.886598657191479, 0.8865231220076876, 0.886700624072653, 0.8867349479544991, 0.8868710355638849, 0.8868908039848267, 0.8866028410912757, 0.886410830219349, 0.8864217377859681, 0.8867154760004796, 0.886349959718782, 0.8868709647173981, 0.8870982087272005, 0.8870586352537466, 0.8869645748884123, 0.8868685843412969, 0.8867986678053389, 0.8871434661877957, 0.8871572728457117, 0.8870824042811187, 0.8871600993031206, 0.886824024403074, 0.8867461117768587, 0.886719700715262, 0.8863056073655038, 0.8861596887388066, 0.8859960320739404, 0.8861735940248185, 0.8862430936757228, 0.8864181414095205, 0.8864176596875383, 0.8864555000460892, 0.8865307221786273, 0.8865203206232013, 0.8862417747061914, 0.8862313138283079, 0.8865247329402326, 0.8863891119719655, 0.886407524432922, 0.88640118657897, 0.8868251551743832, 0.8865192976073032, 0.8867823158259955, 0.8870416072982047, 0.886732360250583, 0.8868263825878785, 0.8869592730305085, 0.8870058133340738, 0.8869699692193139, 0.8867577662465964, 0.8866904966731739, 0.8867433927636496, 0.8868575898771585, 0.8870484047028097, 0.8870453910767528, 0.8865840767143341, 0.8867536974907636, 0.8868500514585902, 0.8869487371439763, 0.8870580933144936, 0.8869553328800597, 0.8870747630579054, 0.8874638796376468, 0.8872084643724794, 0.8871573389609362, 0.8874155187966375, 0.8876146932353551, 0.8876924130594047, 0.8877458253902962, 0.8879117232738927, 0.8874326951645379, 0.8874147804144568, 0.887542649090779, 0.8876354822587322, 0.8877945685839165, 0.8877181906744973, 0.8876646145975096, 0.8876390112866566, 0.8875405988901918, 0.8871655928407496, 0.8869247205165992, 0.8867992359272762, 0.8869447207580359, 0.8871833812880315, 0.8870079486690066, 0.887200716562372, 0.8872326115161795, 0.88739037775038, 0.887576526858284, 0.8873508802724428, 0.8873444372584421, 0.8874309825068387, 0.8873425546874489, 0.8874947475707057, 0.8874590751080943, 0.8872952701780269, 0.8871807539196388, 0.8871069116207407, 0.8872617452817327, 0.8872980845403687, 0.8868868485734503, 0.8867771984709133, 0.8868716048886842, 0.8865290677516751, 0.8867558197384083, 0.886823837383965, 0.8867628018800351, 0.886953774684374, 0.8870813461952152, 0.8874118488826606, 0.887363247218449, 0.8871255630723053, 0.8870579091478876, 0.8871299035419601, 0.8872220041914413, 0.8872899196189045, 0.8873164054597948, 0.8870584866091407, 0.8871639332838321, 0.8870366558531979, 0.8869687084819746, 0.8866656306618202, 0.8867322022225995, 0.8866909082201544, 0.8867862271242137, 0.8870588217726434, 0.8872519259894909, 0.88729541341738, 0.8871447102941838, 0.8873539629187063, 0.8869080787178747, 0.887406446733914, 0.887185636927453, 0.8869347122832676, 0.8865376176044902, 0.8865296113014239, 0.8864976786675496, 0.8864347026635753, 0.8864546428150488, 0.886720188911171, 0.8868620661647653, 0.8870429278494079, 0.8871962242022878, 0.8869608455278348, 0.8869419502233197, 0.8869563352915487, 0.8868897550819352, 0.8871412043455362], 'MSE': [94713.290145945168, 1088.1092035759793, 83.533324687824575, 22.267001587234756, 11.013524702360355, 6.3845732840555938, 4.6199259012092337, 3.8165738652267929, 3.3762477221193312, 3.0767636415269872, 2.8939537565108702, 2.7375015875377922, 2.6046210893944259, 2.5079138798659706, 2.4199858871409892, 2.360251805893355, 2.2997472262150827, 2.2416412062306801, 2.1991304678128518, 2.1715183188901843, 2.1352779927141423, 2.1005719551133866, 2.0575952643261388, 2.0326674351409868, 2.0109663042113777, 1.9878628329781407, 1.9684101667909426, 1.9494080659163442, 1.9328188263142398, 1.916637766327653, 1.8948761668681313, 1.8912947880508817, 1.8753020810601448, 1.8600082453437605, 1.8522164420380749, 1.8441495061546993, 1.8290633432591821, 1.8202569991655779, 1.8082630135403768, 1.8060458690847059, 1.7945292117329814, 1.7856237228925973, 1.7827039501069448, 1.7722339489708774, 1.7631454474637447, 1.7582532038545127, 1.7479135785537692, 1.7375487963396983, 1.7326924184104666, 1.7288458400568971, 1.7293370082619048, 1.7150501238371239, 1.7097969849100749, 1.7059490448032928, 1.6987397118905181, 1.6942997558815105, 1.6905300708339304, 1.6888910581809933, 1.6813172376662144, 1.6807203996518976, 1.6707178922083603, 1.6674368885347297, 1.6629909427725342, 1.6611081492858897, 1.6602461950586564, 1.6536278957026807, 1.6459698652720869, 1.6437593903147552, 1.6439671395810302, 1.6342251187585668, 1.6316751280741799, 1.6305850769266832, 1.6254158887666972, 1.6216499137259901, 1.6205601095750353, 1.6164008840805146, 1.6113625751922971, 1.6151127168714516, 1.6100970716835628, 1.604304370501078, 1.6041428930559389, 1.5973563001456881, 1.5998655854297257, 1.5941990003926685, 1.5938871614794852, 1.5896391887096428, 1.5877987320711033, 1.5896757393095338, 1.5836117124730349, 1.5768870357396327, 1.5727125589379876, 1.574624200173157, 1.5725390196312488, 1.5723239454134537, 1.5690931456623607, 1.5627317859115495, 1.5586438401257472, 1.5584174864944549, 1.5569225716969752, 1.5579596475341062, 1.5596996059113906, 1.5540102642697995, 1.5594807283006644, 1.5540794517750269, 1.5558085209132082, 1.5503181902394825, 1.5510359707889938, 1.5494632541656794, 1.5472034605955989, 1.5498350924459521, 1.5475230027397782, 1.5440557004336075, 1.5378805978089596, 1.5415870846680462, 1.5445517011074752, 1.5371803051225232, 1.5364746442884285, 1.5321620373170859, 1.5359590929495635, 1.5338460525986781, 1.5326352073931007, 1.5266385690982174, 1.5275887924300904, 1.5301913967547283, 1.528261654501559, 1.525943847795185, 1.521338500815425, 1.5197100550480986, 1.5225060938624277, 1.5222930396392467, 1.520903733371489, 1.5209707071349907, 1.5214044749150266, 1.517633873187159, 1.5194013703866427, 1.518443284905429, 1.5144103165430458, 1.5112060939200058, 1.5137978225233679, 1.5145037442353186, 1.5155173343945791, 1.5093322318860072, 1.5142162024237584, 1.5112861072080259, 1.5105802652112443, 1.5108956875793369, 1.5102059788018245, 1.509453903011216, 1.5057327075211675, 1.5017846809649322, 1.4980208058410651, 1.496933057340907, 1.4947122548546736, 1.492252895796913, 1.4920576489913269, 1.4948615055386654, 1.4897452354207597, 1.4933670076004113, 1.4887071141255406, 1.4879175079417117, 1.4855472474668758, 1.4909454474004822, 1.4864498584762351, 1.4882319078049855, 1.4875657391615855, 1.4852214381890696, 1.4852149080740893, 1.4836148473335096, 1.4846917993807258, 1.4825971768006343, 1.483025140634429, 1.4792673919206023, 1.4770014680396499, 1.4816169578676781, 1.4762353348418755, 1.4786320831508943, 1.4791376452699947, 1.4745595577913271, 1.4735642981951516, 1.4769567783257265, 1.4807675160799907, 1.4832297474104221, 1.4762776495405543, 1.4768630950111168, 1.4774975783706403, 1.4697298837050612, 1.4709017736162573, 1.466878685472027, 1.4674538655714056, 1.4677173350041364, 1.4635155623084337, 1.465026507803366, 1.461763466085928, 1.4639852771008348, 1.4602318448562914, 1.4615640942944566, 1.4611406804239617, 1.4584075648148835, 1.4586012765912111, 1.4547186173620155, 1.4565258932825629, 1.4592681969810064, 1.4565134117010481, 1.4614610765548917, 1.4575745408812115, 1.4581876724876768, 1.4570634568631067, 1.4575866812767218, 1.4627591057605542, 1.4582460886625683, 1.456594231412631, 1.4544949279906476, 1.4581308793175793, 1.4522261824641274, 1.4552333023384327, 1.4536460869419101, 1.4547830210143953, 1.454374261384048, 1.4561414228410441, 1.4539249318559644, 1.4513874239052518, 1.4514327993610601, 1.4515105140347866, 1.4441713282101611, 1.4461256260636348, 1.4432464689166442, 1.4461610448718676, 1.4440456434958244, 1.4439978807440612, 1.441822390580374, 1.4456335607922, 1.4440256609082811, 1.4436589668278035, 1.4441800551410133, 1.4410305681492086, 1.4376963319368059, 1.4399995548604565, 1.4331722051408182, 1.4362623430883636, 1.4338743810453798, 1.4321644499781852, 1.4309128286564314, 1.4268497129075308, 1.4228886250770514, 1.4317409761877844, 1.4296829069033441, 1.4339885183795491, 1.4340509820553726, 1.4290753126470888, 1.4288687238369027, 1.428301710085081, 1.4298727470799641, 1.432597907276268, 1.4283028460826519, 1.4290507254586073, 1.4273180899604339, 1.4224274430356656, 1.4226472748311612, 1.4217950843483864, 1.4224564628621341, 1.4188545956443603, 1.4251265415588685, 1.4225599916725005, 1.4204482619043064, 1.4173878015434573, 1.4184293164786241, 1.4176266485850799, 1.4176833111428784, 1.4126599567032665, 1.4166633545179224, 1.41353331807117, 1.4159417130770844, 1.414801755438664, 1.4155122225436447, 1.4146059759355862, 1.4101930649452201, 1.4108009959018135, 1.4090827099422385, 1.408664160251899, 1.4073417747758608, 1.4132137199354633, 1.410484685094709, 1.4108674145558102, 1.411588119281481, 1.4093475481256974, 1.410772815225118, 1.4078797393792004, 1.4052736410598936, 1.4075814677927652, 1.4108259639388512, 1.4081311057510055, 1.4062891678272267, 1.4084984386835588, 1.4113554954169927, 1.4130535648695015, 1.4083288750821075, 1.4093591828732821, 1.4036623711743317, 1.4019348956263367, 1.4053376932836392, 1.398294775375762, 1.4036522483288953, 1.4063448813595294, 1.4059344597169428, 1.4036232500359018, 1.3990774704051714, 1.397063834708212, 1.4056031083431961, 1.4029579554312348, 1.4009377237404488, 1.398690737235845, 1.40145837475916, 1.4016531932234193, 1.4051987653601432, 1.4046663863759568, 1.4038321856242841, 1.4001440292208114, 1.4029710734173237, 1.4024129521846902, 1.397839020863118, 1.3930064859190461, 1.39787291432188, 1.3923267188342079, 1.3944041411722217, 1.3931252607145113, 1.3938924389313354, 1.3928398101581621, 1.3934231236171306, 1.3890426915364285, 1.3916715443011265, 1.3915211898865394, 1.3876777529393256, 1.3884037035240162, 1.390511430456036, 1.3905482118877002, 1.3908027826653251, 1.3861147728931438, 1.3915589190515463, 1.3917525723404836, 1.3910128844249732, 1.39095356910511, 1.3877424405229764, 1.3887937813674671, 1.3837843994702361, 1.3847267309578621, 1.3862079786106958, 1.3841376722919703, 1.378814187892522, 1.3792999869507461, 1.3810160681547332, 1.3812341206339946, 1.3819828169916362, 1.3824298118219311, 1.3813273096254093, 1.3839215361267341, 1.381684757166304, 1.3821329084059719, 1.3839698281003134, 1.3806995645579982, 1.3842773037444125, 1.3839252289562913, 1.3856207305796682, 1.3864906989591437, 1.3850733466799248, 1.3840607084172412, 1.3877585453998884, 1.3840946266784226, 1.3835842252574999, 1.3829710579967076, 1.383218622979782, 1.3812028521971624, 1.3808386518487148, 1.3806862236342983, 1.3804660504401831, 1.379476166066157, 1.3765073922695872, 1.3758436775409326, 1.3779498338215639, 1.3776496428913103, 1.3800828206827997, 1.3798466212634393, 1.3789803129875697, 1.382906743742359, 1.3836125578807341, 1.3828432364154029, 1.3818706763042869, 1.3802489960073596, 1.3777519783889829, 1.3800800829644895, 1.3785066852633878, 1.3772305793483683, 1.3788432120573069, 1.3752202318018443, 1.3791555850701682, 1.3769380323425375, 1.3766616137778043, 1.3779763603188244, 1.3779882985150349, 1.3759313543962268, 1.3734521157823572, 1.3767142889308013, 1.3785609933575007, 1.3753403099162527, 1.3718586526940315, 1.3719084743815968, 1.3704339408612571, 1.3739768310408005, 1.373604575421562, 1.3744815429130866, 1.3725716815407156, 1.3708935973525234, 1.3740127610220099, 1.3692832040021308, 1.3710208348781656, 1.3690500458435226, 1.3714032273665719, 1.3755806606465648, 1.3757425749407595, 1.3724033530796027, 1.3738012709782383, 1.3741095944947153, 1.3696217118565368, 1.3699861352790732, 1.3699110033235598, 1.3681973102462648, 1.3698089397701065, 1.3687898865999313, 1.3589589247669263, 1.3655847873525215, 1.3656792041082464, 1.3681063200977945, 1.367908484234736, 1.368313495378656, 1.3654207486243859, 1.3666376406653205, 1.3648386684467613, 1.366237035976877, 1.3648238118119997, 1.3669664358391411, 1.3648553201582347, 1.3653606021519653, 1.3619538990973359, 1.3634739700595568, 1.3636810465392344, 1.3677293856887374, 1.3628121419955781, 1.362275123856256, 1.3622577068792128, 1.3623153496254043, 1.3620520589204383, 1.3628508125663938, 1.3642707708219062, 1.367124318555559, 1.3675384472457259, 1.3667389796488847, 1.3657429100149243, 1.3674074204362907, 1.3663617406224835, 1.3679164367627659, 1.3687687856990505, 1.3686597533282183, 1.3654864175493922, 1.3647316733319543, 1.3645951500349371, 1.3595128287822797, 1.3616412419303423, 1.3583692289227394, 1.3586218507566072, 1.3514574149907275, 1.3548652219595041, 1.3561253828604345, 1.3555816968754564, 1.3542093910772126, 1.3557693707348666, 1.3587965815503766, 1.3553956942221925, 1.3567601686229116, 1.355851419610075, 1.3624174430328388, 1.3583042237113367, 1.3598909090192972, 1.3581830568193252, 1.3576983650149228, 1.3591194272587221, 1.3554055307519131, 1.3516914494965806, 1.3531252146945489, 1.3552444343412122, 1.3566361191621223, 1.3584332929107668, 1.3563323102801184, 1.3568044650391, 1.3556928546145965, 1.3551995715890317, 1.3540972372282238, 1.3537624809823594, 1.3549437572561165, 1.354915706457023, 1.3556795529814196, 1.3562258572870127, 1.358300624432315, 1.3580616210931169, 1.363112269787137, 1.3610268735216475, 1.3557597913081654, 1.3570774258965861, 1.3576738109073343, 1.3543041288692663, 1.3476644574893635, 1.3484120011695555, 1.3546933545316384, 1.3512222518633596, 1.3490153938069431, 1.3476507898744738, 1.3496349749830225, 1.3524605799963985, 1.3515514882190758, 1.3526619360672136, 1.3528775899819432, 1.3504553845975171, 1.3525280194142857, 1.3513987672473087, 1.3515258433070609, 1.3480873266847455, 1.3481431950601372, 1.3487730482701843, 1.3465557844869342, 1.3484322291510349, 1.3493189267609691, 1.3477017594541161, 1.3426643838961412, 1.3456679539960421, 1.3443350007056079, 1.3470678019495743, 1.3428181312332523, 1.3390144732707496, 1.3414561429867258, 1.3413563388203409, 1.3459522881460717, 1.3456495899082801, 1.3443073380850614, 1.3453585384334481, 1.3447182285199799, 1.34470964310987, 1.3415432548369568, 1.3416814703379254, 1.347334070710744, 1.3429501042107306, 1.3434148337156377, 1.341140847118268, 1.3410660616258154, 1.3409769670196652, 1.3443794062847931, 1.3415283515247269, 1.3393433376910844, 1.3446076366233393, 1.3416644054538447, 1.3431132972823276, 1.3440003212202272, 1.3433430894798588, 1.3433596388221298, 1.3455632409873539, 1.3475672805894543, 1.348606057684111, 1.3470768580863277, 1.3445537759989901, 1.3448992285662935, 1.3456378332667895, 1.3462296255823734, 1.3457164896588401, 1.3397841767680467, 1.3435885482036414, 1.3412358295690303, 1.346018537318042, 1.3441403092452466, 1.3413257833444434, 1.3498200943811578, 1.3446221406426497, 1.3469774275821329, 1.3446222664346144, 1.3446727938859275, 1.3434952296559146, 1.3415941272045562, 1.3387343800820619, 1.3379196139656648, 1.3409886201647225, 1.3364159996323073, 1.3348397284163616, 1.3360108836494027, 1.3318616982738711, 1.335632152598295, 1.3349722981960992, 1.3363746269796435, 1.3394288227637159, 1.3357867015319296, 1.3355649062609074, 1.3351551509273174, 1.3355953047285369, 1.3374093780192029, 1.3370711055102411, 1.3378689305708302, 1.3368535427844566, 1.3332748881923988, 1.3411033284611784, 1.3437798450268128, 1.346138512344333, 1.3417553165135809, 1.3387241998853863, 1.3395135967196439, 1.3359128661592667, 1.340250585052521, 1.3383814358557462, 1.3397700813411451, 1.3405728733172295, 1.3408770677729653, 1.3420421934464604, 1.3436495665628447, 1.3448468485416689, 1.3474858063942325, 1.3417304369458578, 1.341312609987354, 1.3417103163179498, 1.3416345560162848, 1.3420785881259298, 1.3428883845642807, 1.3375311875363478, 1.3414273110763237, 1.3391595229166706, 1.3358326203553674, 1.3323555904303273, 1.337567191468068, 1.3349166625552789, 1.3347409874058818, 1.3327397537405399, 1.3297995150637956, 1.3284141133727256, 1.3255089746910924, 1.3249604737659257, 1.327938784787885, 1.3270178466769509, 1.3282363345794765, 1.3286616113629346, 1.3276310580221826, 1.3320245288128456, 1.32790508087658, 1.33292247686153, 1.3347335909027795, 1.3358039976160083, 1.3356786447229083, 1.3345758200545832, 1.3375297877652597, 1.3407006279690776, 1.3376295147118826, 1.3349130599812189, 1.333939995877236, 1.3323413300493248, 1.3318345629652966, 1.3298705370052692, 1.3338594737452447, 1.3286801710787979, 1.3275903478907232, 1.3257806476178919, 1.3270859513298416, 1.3271481370609406, 1.3305934479008512, 1.3285429252056065, 1.3313583239541416, 1.3325964478014685, 1.3315480048803716, 1.3334918485215739, 1.3365308146013462, 1.3354691935859042, 1.3368503549592337, 1.3387646887446312, 1.3411109184661905, 1.3434970800959589, 1.3393865321468177, 1.3344933497810103, 1.3389706982362597, 1.3328480486139684, 1.3353845068039485, 1.3344822545635611, 1.3352141579333907, 1.3326312419282895, 1.3363501151966686, 1.3354224960132088, 1.335393418478553, 1.3327728992096859, 1.3300424304904181, 1.3313701329469292, 1.3311569111100923, 1.3338125267807646, 1.3314501076958294, 1.3312308937454327, 1.3324280086972988, 1.331961616660587, 1.3292253583626119, 1.3291147507564602, 1.3299719080968604, 1.3338698706718588, 1.331110787522956, 1.3291102200843974, 1.3261175852553118, 1.3269603106328498, 1.3294420955022381, 1.3276055907353437, 1.3263864470945037, 1.3271324660501249, 1.3317619183122218, 1.32746338451177, 1.3244070284499641, 1.3251064009812978, 1.3279997445256275, 1.3299348108748796, 1.3248949012315137, 1.3271360156414977, 1.3274070008836274, 1.328220093909332, 1.3271129717988608, 1.328474289046498, 1.3266229785166981, 1.3310200200852014, 1.3301078658172931, 1.3295373680680953, 1.331552661878421, 1.3325886988983924, 1.3297448814011972, 1.3267953034714164, 1.3243606494974405, 1.3272370101007354, 1.3269976780987618, 1.3282810405669083, 1.3288922867921953, 1.3280450232863639, 1.3286313627790847, 1.3279082742228858, 1.3319369013102447, 1.3275818633856244, 1.3302511715691152, 1.328395167577048, 1.3315695754780106, 1.3276811104346598, 1.3291321556755586, 1.3305541695334899, 1.3282008194667443, 1.3282024455746186, 1.3318496319590891, 1.3346880464554869, 1.3294641469018285, 1.3272102321894932, 1.3305634112946028, 1.3298744270073199, 1.328276114860323, 1.3261847262242217, 1.3253941983292092, 1.3255987251137065, 1.326537589030268, 1.3265853323546679, 1.3249191783480707, 1.3231143148666704, 1.3269050444851784, 1.3300796313424827, 1.3314202582774248, 1.3280853553712539, 1.3254910366593744, 1.3283075476981854, 1.3252785084859053, 1.3265091668386571, 1.3239577043118724, 1.3255297005458344, 1.3252927555326881, 1.3255907769593855, 1.3220055014336689, 1.3240008119347018, 1.3274507685061356, 1.3306679597172968, 1.3301326384347303, 1.3289128709995759, 1.3287120944226061, 1.3314645864136065, 1.3309909473468133, 1.3306731366596263, 1.3267587636170033, 1.3263728818523139, 1.3225195055022316, 1.3256555215625068, 1.3240343797163987, 1.3245201827566855, 1.3233701039166905, 1.3245498993623281, 1.3249942222465387, 1.3241370376563335, 1.3249450531685738, 1.3234261975026953, 1.3241387186510178, 1.3230081928892097, 1.3207321499766902, 1.3210364030967567, 1.3211059390840438, 1.3209957159538894, 1.3229965369647423, 1.3223052540926867, 1.3258809491179759, 1.3229498235045545, 1.3214858507856579, 1.3240000143132939, 1.3276990446773815, 1.3250205321825448, 1.3231748775079684, 1.3234174251100486, 1.3235183075793722, 1.3249222265551175, 1.3245879011396364, 1.3223276198844469, 1.3249652725883769, 1.3279926545831546, 1.3265788410166068, 1.3229301290161879, 1.3299748770410624, 1.3267608755532136, 1.3246547824948036, 1.3218790430192899, 1.3218644088785645, 1.324254870639928, 1.326372282744013, 1.3223493324856603, 1.3200335937793899, 1.3242949196613061, 1.3235196460637468, 1.3209994859214502, 1.3220655531882737, 1.3221779652804913, 1.3268661891679367, 1.3299172199612868, 1.3313563372661728, 1.3270344185480092, 1.3271104095739468, 1.3283682170853255, 1.3293083359163893, 1.3249290917423209, 1.32581386578055, 1.326238206453179, 1.326064975515256, 1.3257041801830678, 1.3232152598070235, 1.320936264702373, 1.3227791494652774, 1.3228255042845245, 1.3208697115748365, 1.3210284950888278, 1.3258146854199993, 1.3255977684383666, 1.3263095123999817, 1.3271929501997672, 1.3251169370644396, 1.3247154948075184, 1.3231238532415717, 1.3228926474719502, 1.3262605787104698, 1.3285062826819882, 1.3283787109177934, 1.3249432331852256, 1.3292182065616089, 1.3231246818417191, 1.3204669012160903, 1.3209297411876528, 1.3220298441863745, 1.323152522036446, 1.3239702457460483, 1.3199375829645785, 1.319776104261815, 1.3206517454750499, 1.3197430468283229, 1.3236736822667692, 1.3245849259498355, 1.3248938221353723, 1.3297369389380826, 1.3314435612569346, 1.3333576425720575, 1.3312809290283061, 1.3304680810864757, 1.3284207731030775, 1.3284264071849285, 1.3279838372271509, 1.3271040607848494, 1.3272257143875632, 1.3304835073750259, 1.3306058547961526, 1.3271741091957245, 1.3287602930612663, 1.3285449462099097, 1.3286190719281468, 1.3236604570905364, 1.3272376792874787, 1.3241614937966664, 1.3211288952616047, 1.32474575984878, 1.3236461016150705, 1.3220918531925916, 1.3215475311784073, 1.321966753642553, 1.3244486186214359, 1.3252353842179949, 1.3246167267468472, 1.3232811101290514, 1.3210493947710111, 1.3210846412752151, 1.3264800414700408, 1.3244962056202398, 1.3233692773059822, 1.3222150778933142, 1.3209360795533953, 1.3221379360597869, 1.3207411150255604, 1.3161901193463028, 1.3191773828778806, 1.3197753309971514, 1.3167557338431848, 1.3144262468533869, 1.3135172581290375, 1.3128925628583612, 1.310952268893125, 1.3165548439809436, 1.3167643697489497, 1.315268854461882, 1.3141831044110166, 1.3123224764752355, 1.3132157705517515, 1.3138423809497073, 1.3141418299147034, 1.3152928330186944, 1.3196787959911309, 1.3224959694644114, 1.3239636011551561, 1.3222620523889088, 1.3194707474243628, 1.3215225569147573, 1.3192679990380711, 1.3188949648253816, 1.317049776294335, 1.314872629830075, 1.3175117274441759, 1.3175870830841172, 1.3165748747331529, 1.3176091010933773, 1.3158290968731106, 1.3162463117430629, 1.3181621271253663, 1.3195014763699429, 1.320365114674573, 1.3185542246769113, 1.3181292111523013, 1.3229389088265684, 1.3242213449109115, 1.3231171945823514, 1.3271234104869774, 1.3244713844217508, 1.323675869588516, 1.3243897233000466, 1.3221561602686811, 1.3206641205436698, 1.316798656102276, 1.317367087198116, 1.3201469726577559, 1.3209382335130857, 1.3200962077721825, 1.319019025046831, 1.3182247057270382, 1.3179149349443757, 1.3209314796922402, 1.3196982056918585, 1.3211868059392913, 1.3219814988641201, 1.3255262099399574, 1.3247476080986551, 1.3252305708827947, 1.3241157483768671, 1.3209275597162435, 1.3186690682967745, 1.3181604518390608, 1.3199230322538356, 1.3174756736994722, 1.322690607159213, 1.3168618380813653, 1.3194443661139907, 1.3223791086332279, 1.3270234138657953, 1.3271170532853382, 1.3274905281932585, 1.3282270774355833, 1.3279938631550192, 1.3248881123363339, 1.3232287567557486, 1.3211134504742759, 1.3193205403904493, 1.3220734617158185, 1.3222944557666612, 1.3221262121431183, 1.3229049151386989, 1.3199640368215606], 'Rp': [-0.058665822562235903, 0.069987963002141176, 0.26072417262976488, 0.49299267944152808, 0.63328005586582659, 0.73924052162561027, 0.79692907336806207, 0.82826148313464454, 0.84644963025567499, 0.85997777045662294, 0.86831935607068333, 0.87588067826048066, 0.88201724308952756, 0.8865857178601354, 0.89088527424567909, 0.89367028040651642, 0.89652598871134237, 0.89928461454028497, 0.90129009314510222, 0.90264145993406308, 0.90431301065077918, 0.90588517661969925, 0.90786223791767617, 0.90910963858781169, 0.91008918665069138, 0.911147409523832, 0.91208611836515374, 0.91294870927243665, 0.91369419209053593, 0.91445873778037889, 0.91549619134811777, 0.91563238397959534, 0.91645179098494123, 0.91711167789942405, 0.91745696083817929, 0.91787023985912108, 0.91855436685415714, 0.91896891951119197, 0.91950389267333366, 0.91962102041512794, 0.92016322733721323, 0.92055948775401131, 0.92071349180373618, 0.92121942844540816, 0.92160432851330809, 0.92182806551788044, 0.9223196197156095, 0.92279348261266092, 0.92300941525765012, 0.9231764474277091, 0.92321592868156177, 0.92384977961214665, 0.92406412048170261, 0.92423673328235634, 0.92458337280534619, 0.92480221177059097, 0.92498305295901295, 0.92504518378446954, 0.92536667242273674, 0.92543070770809777, 0.92586296836648418, 0.92602583081028111, 0.92623279334852582, 0.92631028567317608, 0.92635970018444125, 0.92667173976486861, 0.9270266511138836, 0.92714344065609, 0.92710679897542503, 0.92754120317236133, 0.92767176351745295, 0.92773160954925316, 0.92794378124107568, 0.92814171800294942, 0.92818033035930725, 0.92837055829321602, 0.92861235543199927, 0.92845803167762242, 0.92866964475189973, 0.92895547691078584, 0.92894488633644845, 0.92921997722248961, 0.92913276204830142, 0.92940283951274283, 0.92943827908274823, 0.92961176427468017, 0.92968076134388034, 0.92960446463106217, 0.92989361350816935, 0.93018144661672064, 0.93038107771558709, 0.93028255106679736, 0.93041190658961292, 0.93038116355077949, 0.9305423839409549, 0.93081892334967242, 0.93104346650772407, 0.93101942994044395, 0.93110328865850112, 0.93106920031815499, 0.93096985457240322, 0.93123174217536042, 0.93098597407680928, 0.93124060544553344, 0.93117405035978362, 0.93140405536298221, 0.93138548614431083, 0.9314433889353928, 0.93154839325345762, 0.93141844835031085, 0.93153195586844617, 0.93168427153437661, 0.93196731879054295, 0.93179353841170742, 0.93168791163858189, 0.93201243175099457, 0.93205086157724759, 0.93224268406133226, 0.93206730953421579, 0.93214675049516194, 0.93221267924397111, 0.93249017720921468, 0.93246903365999745, 0.93233848075896597, 0.93240716718372874, 0.93252024773843334, 0.93272715311840826, 0.93279694220640286, 0.93267515824248381, 0.93267964806480086, 0.93273593418918266, 0.93277116818686856, 0.93271301571616561, 0.93289743686597537, 0.93283372366205441, 0.93285497082167335, 0.93306170066029159, 0.93318970956762692, 0.93308141092771213, 0.93303398783726377, 0.93301171270178518, 0.9332924192051727, 0.93307890337734867, 0.93320068001299183, 0.93322569699821944, 0.93322956384943834, 0.93324403430909741, 0.93331322156561525, 0.9334515403545659, 0.93364402426817872, 0.93379844037236093, 0.93384418338293496, 0.93395753283023697, 0.93406087577276664, 0.93406482709371397, 0.93394581700844026, 0.93418488365212105, 0.93401341333883514, 0.93423990429940684, 0.93427501523908818, 0.93437593162384114, 0.93415747089571577, 0.93434000708590648, 0.9342582617309233, 0.9342761601049796, 0.93439531842840318, 0.93440126446446803, 0.93445762165883006, 0.93442578680289767, 0.9345031497652192, 0.93449079087832121, 0.93466095929355131, 0.93476926876748023, 0.93454900491899628, 0.93478698483590228, 0.93467000070205197, 0.93466133611504232, 0.93487087200295516, 0.93490988748342696, 0.93475397605329802, 0.93459936264596322, 0.93450445263354576, 0.93479023897410607, 0.9347618521303438, 0.93477590297016599, 0.93511872916721972, 0.93504721169002103, 0.93522704154806779, 0.9351998420830141, 0.93521234721779756, 0.93537928674435589, 0.93531216120836269, 0.93545126500291831, 0.93536234182327316, 0.93554228757055036, 0.9354507554668926, 0.935501763171251, 0.93559614732362528, 0.93559909793438656, 0.93578759841503789, 0.93569466968029025, 0.93556559565840258, 0.93568912251280423, 0.9354741078826786, 0.93565355115482196, 0.93562911589702302, 0.93565075860670743, 0.93563852919291479, 0.93543145214261403, 0.93560784114907958, 0.93568295497897669, 0.9358042207819538, 0.93564925045409053, 0.93591106503889177, 0.93578136876572993, 0.93583329366847856, 0.9357838221598056, 0.9357863470096679, 0.93571223987453622, 0.93580899896523395, 0.93592614573780764, 0.93593973468082958, 0.93593166940016348, 0.93625633484178405, 0.936161601185165, 0.93630592288201409, 0.93617111728053415, 0.93625093332468934, 0.93626883232964253, 0.93639177287977737, 0.93621289236456873, 0.93625966076971434, 0.93629705735775648, 0.9362570967768179, 0.93638558863077337, 0.93655480841235572, 0.93643776081280183, 0.93676168187119868, 0.93662991344370927, 0.93671521298089322, 0.93681456709135691, 0.93687594814064146, 0.93705025446626311, 0.93723111275785775, 0.93684361473512057, 0.93693005086444592, 0.93674211665775198, 0.93672813611824135, 0.93696166417156102, 0.93696272330514119, 0.9369765789647323, 0.93690373317266673, 0.93681186698614616, 0.93698167600256421, 0.93697477309688104, 0.93703239079353073, 0.9372442464806775, 0.93724840351229577, 0.93728734686830906, 0.93725399852803937, 0.93740810460923663, 0.93711940151301076, 0.93725006523748666, 0.93733895156965585, 0.93747379080205517, 0.93742229527564769, 0.93747661479392963, 0.93747437074777573, 0.93770521078021263, 0.93751838251649078, 0.93765919256223751, 0.93753427419985369, 0.93761325535931672, 0.93758538874320796, 0.93760018881318208, 0.93781024047290351, 0.93781780823934824, 0.93785465526407186, 0.93786096895050564, 0.93793220880048689, 0.93768345098243921, 0.93779779284524711, 0.93779686450014144, 0.93773762099943447, 0.93784679132141002, 0.93777250743655538, 0.93791336041824769, 0.93804324649585247, 0.93794716192791039, 0.93780056037219917, 0.93792659874073514, 0.93798109011641639, 0.93788188529227945, 0.93775610884704896, 0.93768924397721853, 0.93788760897509249, 0.9378471375989228, 0.93810959325306997, 0.93817723120426932, 0.93803191289425791, 0.93835018554366167, 0.9381168034020132, 0.9379884069453801, 0.93799834051609043, 0.93810667768614153, 0.93833449588512541, 0.93840025572713404, 0.93802929590748052, 0.93813546734249431, 0.93824946851547397, 0.93832132509506938, 0.93821164531593271, 0.93820143864153915, 0.93803072672811849, 0.93805219970497333, 0.93809499330102974, 0.93826984638461919, 0.93815318667892711, 0.9381645663705992, 0.93837379788039654, 0.93858843656029378, 0.93836698824227505, 0.93863247262127392, 0.93854117815441229, 0.93857705035794103, 0.9385639997985904, 0.93859445607964764, 0.93859612624452393, 0.93877909039371299, 0.93865617984922445, 0.93866490570393857, 0.9388302667846834, 0.93882326388229487, 0.93872275125482363, 0.93873856352300278, 0.93870415703289756, 0.93891464239871525, 0.9386646996908613, 0.93864034520282524, 0.938704045023668, 0.93869212511210443, 0.93882994572208756, 0.93878118739723626, 0.9390050799620564, 0.93897544460635995, 0.93889460661870228, 0.93901230504034672, 0.93927339870595283, 0.93922782068985766, 0.93914507641013167, 0.93912322041297003, 0.93911089107695267, 0.93907649752702482, 0.93913857887799645, 0.93901418040580131, 0.93911188365630061, 0.93910755776284216, 0.9390066618248174, 0.93916350495127254, 0.93897817945120632, 0.93901866218184138, 0.93895115664866857, 0.93888920853446223, 0.93896684233888761, 0.93900878384385944, 0.93882747371097752, 0.9390129691498309, 0.93901420755254739, 0.93904575134125412, 0.9390302851478175, 0.93912042268488116, 0.93915517177008145, 0.93914939245790985, 0.93915414301932021, 0.9392249543132386, 0.93933698059049431, 0.93937755625886676, 0.93927928844913355, 0.93927796286057663, 0.93916859055731128, 0.93917699682198696, 0.93922369454303778, 0.9390372280585827, 0.93901311552611733, 0.93903966570967579, 0.93911462280997537, 0.93918455817421276, 0.93928774684690264, 0.93919607308746544, 0.93925460008273753, 0.93930136227504257, 0.93924801824803528, 0.93940718479337548, 0.93921595423493265, 0.9393222306410266, 0.93933735041976996, 0.93928934514256568, 0.93928003632156831, 0.93937145736942962, 0.9394789083853593, 0.93934007162291211, 0.93923407588614183, 0.9393838480066794, 0.93956796615356875, 0.93955464066312167, 0.93960879575299994, 0.93946307272805885, 0.9394720963671338, 0.93944855113517012, 0.93951315542259217, 0.93961765959022447, 0.93945429630552657, 0.9396632088431125, 0.93958936564582496, 0.93968160589603511, 0.93956670814355114, 0.93939011466260558, 0.93938702693050069, 0.93953556256259596, 0.93948349183514201, 0.93945183774644303, 0.93967118166253982, 0.93964798011679163, 0.9396350402133381, 0.93971805596458668, 0.93965073788141962, 0.93969819046770953, 0.94013543170066771, 0.93985907659600187, 0.93984390821728203, 0.93973303061452129, 0.93973561145807394, 0.93971155775417425, 0.93983952967972173, 0.939801269644436, 0.93987725925572885, 0.93981382929907387, 0.93986910599007767, 0.93977553254275692, 0.93987398638793118, 0.93984889395666815, 0.94000409270888474, 0.93993369150047246, 0.93993856588207547, 0.9397573512134052, 0.93996016183455966, 0.94000463099104503, 0.93999791754412831, 0.93999625535139175, 0.94000839306494444, 0.93998409890448154, 0.93991980608600878, 0.9397752093910462, 0.93975995019797554, 0.93979519159686531, 0.93982705595553528, 0.93975763193081696, 0.93979616494577678, 0.93973187349040244, 0.93969606651952742, 0.9396878608436352, 0.9398374718251955, 0.93987810569804964, 0.93988516485359885, 0.94012544793609076, 0.94002997766613594, 0.94016212680953637, 0.94016249272345231, 0.94048395598667112, 0.94031774562871273, 0.94027528530570925, 0.94029465536384915, 0.94034951057646254, 0.94028241299310511, 0.94015379000848809, 0.94031171021764515, 0.94024523514004554, 0.9402739483648469, 0.93998294471697519, 0.94018085427831899, 0.94009796932641698, 0.94017009468756962, 0.94022643828364194, 0.94015144111040017, 0.94030366772010554, 0.94047194837297932, 0.94042104884529043, 0.94033267281758459, 0.94023674666027168, 0.9401676830482032, 0.94025725737043275, 0.9402516610109255, 0.94030495498670652, 0.94031620329131649, 0.94035918802017404, 0.940374199574464, 0.94032080812323715, 0.9403411649840665, 0.94028404424530287, 0.94026073378304509, 0.94018719191254774, 0.94018454543822039, 0.93994991334799105, 0.94007314034675171, 0.94028058135106518, 0.94022575666211183, 0.94019210993178159, 0.9403525237864252, 0.94065576391839933, 0.94062420323242724, 0.94034451492276139, 0.94050597760269095, 0.94058709098707016, 0.94065801796986603, 0.94055702381138595, 0.940433230085715, 0.94049407361499682, 0.94043514489853519, 0.9404062475439382, 0.94052457059919625, 0.94045594757833473, 0.94049239360426595, 0.94047191183649381, 0.94062904923034951, 0.94063967503698864, 0.9406140767198925, 0.94070012657697177, 0.94062594816172773, 0.94059370991209656, 0.94065196590211775, 0.94088335183391092, 0.94073919368151404, 0.9407987987332096, 0.94066570402531569, 0.94088710180206214, 0.94104556886510393, 0.94092280739060852, 0.94094989824715591, 0.9407312706662625, 0.94075259337477957, 0.94080206931405652, 0.94074814807104101, 0.94079443132509744, 0.94078582137541089, 0.94093009835337404, 0.94092016054188421, 0.94065718068842274, 0.94086319352571723, 0.94085138270363577, 0.94095621102892102, 0.94093952633922906, 0.94093481942691937, 0.94081828036481774, 0.94093914927256472, 0.94102985089367353, 0.94080860712157466, 0.940933828473838, 0.9408617633651315, 0.94081544917878679, 0.94086184914536253, 0.94085709899386927, 0.94073529760709107, 0.94065182403144065, 0.94061206848960821, 0.94067159681474755, 0.94079755406170662, 0.94078483756414111, 0.94072272454433636, 0.94072422980545733, 0.94073657546728429, 0.94102039503515844, 0.94083947224743225, 0.94095911209416472, 0.9407287702212096, 0.94083000270558537, 0.94093532412494785, 0.94056066990398568, 0.94078908341973821, 0.94070093850175585, 0.94079037919960495, 0.94078519506565039, 0.94085419430844663, 0.94092705432878243, 0.94106626323668385, 0.94111210521028499, 0.94095429361812555, 0.94115747743252565, 0.94122839337843234, 0.94118741343742107, 0.94137708383922691, 0.94121614100716244, 0.94122313460501295, 0.94115905387710541, 0.94104806971062593, 0.94118676442484384, 0.94121000593294857, 0.94121169650675229, 0.94118817762924789, 0.94113097798901613, 0.94113016566484942, 0.94110257559249033, 0.9411512206652547, 0.94131921520969808, 0.94094509816126626, 0.94083154567437299, 0.94072829807119762, 0.94092656049069023, 0.94104696612279726, 0.94103175687555107, 0.9412166690379804, 0.94100600612857865, 0.94107541497688907, 0.94101578744654291, 0.94096762571648285, 0.94096999628222211, 0.94092235119168699, 0.94084073268056767, 0.94077094439655229, 0.94065040250650211, 0.9409310998067717, 0.94093336960677121, 0.94091225850142013, 0.94091708839680654, 0.94091440671544979, 0.94087956212248514, 0.94111172113685826, 0.94095164832409239, 0.94106042751405805, 0.94117852424458326, 0.94134571172630888, 0.94109944190346484, 0.94122354758894067, 0.94125111416732299, 0.94132815574047202, 0.94147591816286047, 0.94151738577630606, 0.94166830851247985, 0.94167488411596156, 0.94155866580216208, 0.94159231547195199, 0.94152927331080971, 0.94152108311200466, 0.94156539513863224, 0.94136080347711237, 0.94155291336594404, 0.94130598090490203, 0.94123285747870067, 0.94120199641501368, 0.94120615213168934, 0.94124445080303398, 0.9411217433912541, 0.9409827588724633, 0.94110011671537497, 0.94123204528101601, 0.94127390509890951, 0.9413300247529256, 0.94136777090368562, 0.94147197833713903, 0.94129379240610611, 0.94152197993840958, 0.94157966118185643, 0.94164295720356239, 0.9416053496746295, 0.94158707513845108, 0.94145195730692388, 0.94151561014518548, 0.94138816279244897, 0.9413445659306976, 0.94138136156203556, 0.94130670247450077, 0.94115283830269614, 0.94124538531692259, 0.9411361955348162, 0.94106158594921774, 0.94095784242355551, 0.94082806041320233, 0.94105918344003148, 0.94124502416766187, 0.94106027685491833, 0.94131573795803691, 0.94122930032830576, 0.94125220273295052, 0.94122760013454787, 0.94134775646338287, 0.94115629036995496, 0.94119778868960169, 0.94121677924359359, 0.94133463327580136, 0.9414317120126241, 0.94139410873455809, 0.94142527616956062, 0.94128914653597218, 0.94138829924878453, 0.94139809407087949, 0.94135609332923298, 0.94135903492439932, 0.94148337054655717, 0.94149339600934567, 0.94148121080972469, 0.94127657858589009, 0.94139372784737929, 0.94149783294566847, 0.94162208828629579, 0.94158396197058447, 0.94148027919872734, 0.94157207980621926, 0.94161161315184383, 0.94158254166683031, 0.94138600909498737, 0.94156264202169182, 0.94169941504521082, 0.94166575743287639, 0.94153365981531523, 0.94145028507686368, 0.94166849543707365, 0.94157186994978059, 0.94157111452796927, 0.94152076672283924, 0.94159263757541756, 0.94153676986883683, 0.94159302369126818, 0.94139707810569206, 0.94145177383708467, 0.94147290042555454, 0.94138112899129356, 0.94134820895057969, 0.94148397428646813, 0.94161017301416738, 0.94171487946929644, 0.94158699870583751, 0.94157386464844961, 0.94156557936931096, 0.94151072670380931, 0.94151965236216906, 0.94153149309178619, 0.9415460222820301, 0.94135902782679226, 0.94156574730677745, 0.94144951460611936, 0.94152756018338624, 0.94138548529577848, 0.9415448112165874, 0.94150259717297302, 0.94142941712124184, 0.94152152326564964, 0.94153569025808548, 0.94137151986838552, 0.94125565219729856, 0.94147679028976128, 0.9415790429980031, 0.94144273576873183, 0.94147585806832379, 0.94152095266333302, 0.94161517938027584, 0.94167417256526464, 0.94165069899315024, 0.94161782856502041, 0.9415974750198115, 0.94167717520949934, 0.94175523046496312, 0.94159684796652687, 0.94143924063924633, 0.94139602740722583, 0.94153699282503145, 0.94164669460375872, 0.94153748837940354, 0.94165334393904321, 0.94162776719209507, 0.94173130352268908, 0.941660193997095, 0.94164929223712834, 0.94166933801814701, 0.941810460237406, 0.94172621318159888, 0.94157738824819248, 0.94140930134317846, 0.94144049610332192, 0.94150002499227425, 0.94150719964460228, 0.9413817974289248, 0.94142207364742037, 0.94141812170808536, 0.94160012772996515, 0.94161116532088585, 0.94178349612764822, 0.94166022758537515, 0.94172040941294866, 0.9417128174444267, 0.94177569674602124, 0.9417055190910163, 0.94168914270741155, 0.94171217407408159, 0.94167661397523184, 0.94174386787297848, 0.94170520166175276, 0.94177058316541395, 0.94186674737110776, 0.94186287761090859, 0.94186040125532522, 0.94185530666538275, 0.94176871037382048, 0.94181108394105939, 0.94164172588825623, 0.94177916990340849, 0.9418349508818078, 0.94172799237327565, 0.9415748720839191, 0.94168080699986578, 0.94174630509503909, 0.94176259588329936, 0.94175637053311301, 0.94166814044334457, 0.94169136109101448, 0.94178058726547886, 0.94167266788389259, 0.94154456488299143, 0.94160943807025022, 0.94177756992535733, 0.94145854695165254, 0.94159852253706977, 0.94169140773480531, 0.94181272635563063, 0.9418107904741474, 0.94170564672229451, 0.94162185926457886, 0.9417847127200768, 0.94189830481190584, 0.94171437619840503, 0.94175295469900711, 0.94185615481593932, 0.9418094746648954, 0.94179863775345429, 0.9415979612896942, 0.9414631954590591, 0.9413877497145251, 0.94158444177646572, 0.94158759079511334, 0.94152789636681422, 0.94147290907172598, 0.94169687082893683, 0.94163834343217634, 0.94161277839184299, 0.94162615463628496, 0.94164665509411727, 0.9417529215282161, 0.94187155619621454, 0.94177615490359556, 0.94179682296658818, 0.94188098741533421, 0.94184544823626248, 0.94164024848571359, 0.94165054675002524, 0.94163757429258466, 0.94156958270010671, 0.9416680302020829, 0.94168236150798335, 0.94175443292425953, 0.94175745544165446, 0.94162558132850005, 0.94151724456673413, 0.94151787033774981, 0.94168058216265205, 0.94148284459125464, 0.94177257625410371, 0.94188863834055159, 0.94185920339442641, 0.94181359746703786, 0.94177455469314175, 0.9417433959359125, 0.94190205501748758, 0.94190424348669477, 0.94186835561335591, 0.94191677621298409, 0.94173536110643952, 0.94170071034725888, 0.94167777900566685, 0.94147165453489889, 0.94136830013459327, 0.94129740477767221, 0.94140446619784035, 0.94144364169615269, 0.9415258346808455, 0.94152569726506785, 0.94153655073382725, 0.94159140931000673, 0.94157700943472833, 0.94143686000421489, 0.94142119174495265, 0.94156539162335295, 0.94151298201632283, 0.94150343833845007, 0.94151300444709651, 0.94174491616549494, 0.94157335165679612, 0.94170240314846176, 0.94184267107118536, 0.94170240510706316, 0.94174424493871656, 0.94182807445997341, 0.94182099996744306, 0.94180765540439682, 0.9416964709893183, 0.94167409293362347, 0.94169317077565062, 0.94175303014892608, 0.94185359456192685, 0.94185776392221909, 0.94161414850627878, 0.94170583253941254, 0.94173884181789214, 0.94180393337750434, 0.9418616440370573, 0.9418043596319059, 0.94187358009818867, 0.94206786434747325, 0.94194484186238892, 0.94192573217803788, 0.9420453395506031, 0.94216845630337365, 0.94219793682492259, 0.94223206895846068, 0.94232891767723559, 0.94205742438082596, 0.9420577998586489, 0.94211710455179465, 0.94217236568480378, 0.94225819854260429, 0.94221524798461187, 0.94218266934560313, 0.9421860186567349, 0.94212679972232949, 0.94192633550159233, 0.94178763683351108, 0.94172750327354771, 0.94180460817250022, 0.94195613698493796, 0.94184168188053619, 0.9419498678570255, 0.94196191866562495, 0.94202925429010786, 0.94213898914399685, 0.942019276580909, 0.94201140000489103, 0.94205473854257848, 0.94200614672336014, 0.94209115964136958, 0.94207785161200541, 0.94198401011890809, 0.94192911048952044, 0.94189462793528789, 0.94196313801018117, 0.94198930638886202, 0.94176916856428439, 0.94170957663528743, 0.94175577158148671, 0.94157279894732226, 0.94170187153727736, 0.94174685668283031, 0.9417072995509751, 0.94180475392604746, 0.9418723517977986, 0.94206010787427907, 0.94201881457920689, 0.94189327062864237, 0.94185811056253543, 0.94189899868824478, 0.94194489032696593, 0.94198648020812814, 0.94200140116922604, 0.94185255262777579, 0.94190706214940312, 0.94185132201787802, 0.94181202440730893, 0.94164676363034117, 0.94170548141491384, 0.94165750218312971, 0.94172303616239605, 0.94185725738668646, 0.94194872947715125, 0.94199265045723124, 0.9418973290348982, 0.94201585109590436, 0.9417736191693864, 0.94204400122430654, 0.94191928350265541, 0.94178609249539535, 0.94158645127675489, 0.9415772456992888, 0.9415527837343951, 0.94152716019835991, 0.94154899022964034, 0.94167625026294333, 0.94175821082596323, 0.94184370403946138, 0.94191892533709376, 0.94181623255172309, 0.94180406219104129, 0.94181223554762339, 0.94176957458275112, 0.94189549698837005]}
 '''
 
 plt.figure()
-plt.plot(BNMF.all_performances['MSE'])
+plt.plot(performances_sink.values['MSE'])
 plt.ylim(0,10)
\ No newline at end of file
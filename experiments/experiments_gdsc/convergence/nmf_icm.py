@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmf_icm import nmf_icm
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import numpy, matplotlib.pyplot as plt
@@ -36,10 +37,11 @@ priors = { 'alpha':alpha, 'beta':beta, 'lambdaU':lambdaU, 'lambdaV':lambdaV }
 # Run the VB algorithm
 NMF = nmf_icm(R,M,K,priors) 
 NMF.initialise(init_UV)
-NMF.run(iterations,minimum_TN=minimum_TN)
+performances_sink = MemorySink()
+NMF.run(iterations,minimum_TN=minimum_TN,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Extract the performances across all iterations
-print "icm_all_performances = %s" % NMF.all_performances
+print "icm_all_performances = %s" % performances_sink.values
 
 '''
 icm_all_performances = {'R^2': [-134.4795537271895, -1.552667222593644, 0.7275416432525234, 0.758957405027868, 0.7737942869115458, 0.7829400027674102, 0.7886893205578526, 0.7933959748585445, 0.7999895644183418, 0.8057333749741846, 0.8113092511467778, 0.8162529860079986, 0.8211735747724334, 0.8256623632852198, 0.8300367710010396, 0.83353230816861, 0.8366509062473786, 0.8393397993801739, 0.8418402113542578, 0.8445427233712197, 0.8473152145379012, 0.849740538837672, 0.852135469333717, 0.8543435416944982, 0.8565009180382597, 0.8588123120360168, 0.8608809896558028, 0.8628519352579829, 0.8646655629823482, 0.8667641800223356, 0.8689211294002801, 0.8708126647285276, 0.8725352789916565, 0.8742943992342669, 0.8761250988891495, 0.877950474762221, 0.8797836518397667, 0.8814017750783866, 0.8829433953845087, 0.8846011349620354, 0.8862328076321098, 0.8877516686607005, 0.8892724935771723, 0.8907328780837084, 0.8920655636547214, 0.8933718215621492, 0.8946900939300994, 0.8961018424928876, 0.8974498278712894, 0.8986083310934327, 0.8995947777446518, 0.9004511181105159, 0.9012070741991316, 0.9018819660284048, 0.9024888590762477, 0.9030379569393765, 0.9035372710494516, 0.9039955717123929, 0.9044196502482333, 0.9048136001573491, 0.9051796655834687, 0.9055219955020183, 0.9058427445637453, 0.9061448797675761, 0.9064284372283268, 0.9066964063334187, 0.9069505308581882, 0.9071911745504364, 0.9074201031576852, 0.9076379564378602, 0.9078457654074116, 0.9080444337745052, 0.9082346754158075, 0.9084172706367779, 0.9085927992074442, 0.9087614267777145, 0.9089240705230237, 0.9090807442738802, 0.9092319068097902, 0.9093780706311573, 0.9095195835822631, 0.9096567068549841, 0.9097896712662532, 0.909918828314758, 0.910044401774638, 0.9101666524693738, 0.9102856578409743, 0.9104014814095568, 0.9105142808103779, 0.9106241366116565, 0.9107312497265956, 0.9108357570164469, 0.9109377187964129, 0.9110372524865092, 0.9111345379524156, 0.9112295958942499, 0.9113226032935826, 0.911413607540165, 0.9115026708061679, 0.9115898401973733, 0.91167522885156, 0.911758929603397, 0.9118409483151302, 0.9119212531349614, 0.9119999846478792, 0.9120772668519438, 0.912153156821094, 0.9122277102823301, 0.9123009428746057, 0.9123729166556694, 0.9124436005923965, 0.9125130157601021, 0.9125813153943878, 0.9126485047872078, 0.9127146694260848, 0.9127798005169567, 0.9128439104823616, 0.9129069669894808, 0.9129690141158783, 0.91303007586807, 0.9130901902147511, 0.9131491878829601, 0.9132074022027021, 0.9132647402006583, 0.9133212098870158, 0.9133768420552691, 0.9134315877490591, 0.913485524158565, 0.9135386382594378, 0.9135909678119791, 0.9136425103662793, 0.9136932960546994, 0.9137433368856267, 0.913792644137409, 0.9138412746626855, 0.913889238878524, 0.9139365656994797, 0.9139832080505594, 0.9140292114803641, 0.9140745936792831, 0.9141193263483582, 0.9141634026287101, 0.9142068657535679, 0.9142497409685086, 0.9142920349968777, 0.9143337483318267, 0.914374877265857, 0.9144154547121696, 0.9144554792478057, 0.9144949591806393, 0.9145338790989948, 0.9145722557859203, 0.9146100943771687, 0.914647410543295, 0.9146841921607967, 0.9147204717589454, 0.914756270496722, 0.9147916004598656, 0.914826473871787, 0.9148609021056724, 0.9148948973228481, 0.9149284800115594, 0.9149616701659378, 0.9149944429710527, 0.9150267964744769, 0.9150587426014973, 0.9150902918156851, 0.9151214761072172, 0.9151523270891484, 0.9151828044236151, 0.9152129196897998, 0.9152426943204929, 0.9152721601710334, 0.9153012999365978, 0.9153301174144226, 0.9153586187570638, 0.9153867986377582, 0.915414589803123, 0.9154420360512162, 0.9154691837952053, 0.9154960436327615, 0.9155226155138347, 0.915548903363186, 0.9155749281432704, 0.915600697691792, 0.9156262017952841, 0.9156514323748831, 0.9156763926115739, 0.9157011003400574, 0.9157255611040298, 0.9157497792963505, 0.9157737599446891, 0.915797515033723, 0.9158210511532063, 0.9158443715153821, 0.915867481676579, 0.915890383244511, 0.9159130701355633, 0.9159355524574111, 0.9159578414491377, 0.9159799268417234, 0.916001813963706, 0.9160235083010821, 0.9160450142782722, 0.9160663350054863, 0.9160874741174502, 0.9161084408764586, 0.9161292443364459, 0.9161498850124705, 0.9161703461300513, 0.9161906358891095, 0.9162107601251055, 0.9162307237126424, 0.9162505310457694, 0.9162701829076731, 0.916289683603157, 0.9163090333401382, 0.9163282361699685, 0.9163472930437883, 0.9163662058992932, 0.916384973228787, 0.916403599532873, 0.9164220899862663, 0.9164404468187672, 0.916458671849508, 0.9164767642761134, 0.9164947265597, 0.9165125623821851, 0.9165302762139367, 0.9165478708344927, 0.9165653464444562, 0.916582697732867, 0.9165999031645339, 0.9166169796173983, 0.9166339343725795, 0.9166507727682797, 0.9166675010967337, 0.9166841373209295, 0.9167006660087997, 0.9167170918986984, 0.9167334096939589, 0.9167496225518356, 0.9167657366769806, 0.9167817544639317, 0.9167976781078641, 0.9168135082188996, 0.9168292460553681, 0.9168448924613248, 0.916860448447096, 0.9168759148330424, 0.9168912935737352, 0.9169065765961278, 0.916921768736635, 0.9169368724676666, 0.9169518891555547, 0.916966819688841, 0.9169816651856043, 0.9169964246262441, 0.9170110932009301, 0.9170256753808407, 0.9170401726787475, 0.9170545870795697, 0.9170689198031345, 0.9170831028507661, 0.9170971672902442, 0.9171111327461715, 0.9171250093187224, 0.9171387997822146, 0.9171525009271297, 0.9171661202173235, 0.9171796582976357, 0.9171931188017315, 0.9172065040565249, 0.9172198155520411, 0.917233054035778, 0.9172462274829067, 0.91725933670945, 0.9172723722030341, 0.9172853367083583, 0.9172982296596978, 0.9173110487690426, 0.9173237938314409, 0.9173364701638511, 0.9173490781498682, 0.9173616182202114, 0.9173740897043727, 0.9173864929950372, 0.9173988316252399, 0.9174111063652814, 0.9174233176669001, 0.9174354664193447, 0.9174475612575695, 0.9174595866170304, 0.9174715385194975, 0.9174834198951446, 0.9174952359462094, 0.9175069895364265, 0.9175186826103456, 0.917530316820097, 0.9175418931474318, 0.9175534117059958, 0.9175648733491787, 0.9175762759681032, 0.9175876207390299, 0.9175989099543429, 0.9176101440076562, 0.9176213245125664, 0.9176324517294485, 0.9176435275319214, 0.9176545522525494, 0.9176655440765238, 0.9176764729898829, 0.9176873409580146, 0.9176981502893321, 0.9177089051344831, 0.9177196071413455, 0.9177302566134952, 0.9177408561021334, 0.9177514073629809, 0.9177619128952813, 0.9177723732020355, 0.9177827879604991, 0.9177931588581864, 0.9178034856995926, 0.9178137655585019, 0.9178239861150813, 0.9178341568682694, 0.9178442837563828, 0.9178543680823877, 0.9178644101111941, 0.9178744100983706, 0.9178843692966896, 0.9178942863942305, 0.9179041598117905, 0.9179139926466806, 0.917923785885773, 0.9179335446022552, 0.9179432598554497, 0.9179529308759687, 0.9179625632126511, 0.9179721567865842, 0.917981711982335, 0.9179912227713521, 0.9180006592554061, 0.9180100317947045, 0.9180193468879222, 0.9180286069173953, 0.9180378144654257, 0.9180469847556958, 0.9180560971001231, 0.9180651515462092, 0.9180741505727783, 0.9180830981951573, 0.9180919949557538, 0.9181008424566248, 0.9181096415878666, 0.9181183940695526, 0.9181271003583596, 0.9181357602926836, 0.9181443699720522, 0.9181529324278016, 0.9181614506967074, 0.9181699253895756, 0.9181783576004265, 0.9181867474535641, 0.9181950967507584, 0.9182034064084998, 0.9182116772531821, 0.9182199090735382, 0.9182281019902833, 0.9182362561951622, 0.9182443718567834, 0.918252448676901, 0.9182604872651636, 0.9182684867515505, 0.9182764492758166, 0.9182843754554415, 0.9182922652237414, 0.9183001180131231, 0.918307933742946, 0.9183157137850115, 0.9183234584360397, 0.9183311675111028, 0.9183388417444586, 0.9183464817695591, 0.9183540851903239, 0.9183616548088498, 0.9183691903794116, 0.9183766896070994, 0.918384155322908, 0.918391587798042, 0.9183989868741353, 0.9184063531333976, 0.9184136846408097, 0.9184209801960084, 0.9184282415495012, 0.9184354948372251, 0.9184427476201946, 0.9184499643711339, 0.9184571424368935, 0.9184643046507801, 0.9184714235537593, 0.9184785048519439, 0.9184855520418773, 0.9184925669378343, 0.9184995510617032, 0.9185065043091963, 0.9185134258950839, 0.9185203156363283, 0.9185271754264968, 0.9185340037849428, 0.9185407977881136, 0.9185475546521311, 0.9185542762144604, 0.9185609645618209, 0.9185676209016038, 0.9185742462625344, 0.9185808411144076, 0.9185874045578153, 0.9185939370320532, 0.9186004413221699, 0.9186069184377778, 0.9186133588328831, 0.918619760496082, 0.9186261259417745, 0.9186324581758548, 0.9186387612503132, 0.9186450341971095, 0.9186512753461483, 0.9186574786473194, 0.9186636450039551, 0.9186697774924564, 0.9186758667631205, 0.9186819260103238, 0.9186879581826749, 0.9186939624233459, 0.9186999378166607, 0.9187058843763377, 0.9187118021728915, 0.918717691236469, 0.9187235514787546, 0.9187293814563139, 0.9187351821032314, 0.9187409538632081, 0.9187466962540807, 0.9187524111156539, 0.9187580972190208, 0.9187637538741382, 0.9187693824737719, 0.9187749828930678, 0.9187805571418516, 0.9187861050163544, 0.9187916263723447, 0.9187971203967904, 0.9188026001452767, 0.918808051314627, 0.9188134746095484, 0.9188188657720888, 0.9188242289620789, 0.9188295683301716, 0.9188348832595574, 0.9188401729557373, 0.9188454371543723, 0.918850675690897, 0.918855888648101, 0.9188610760939129, 0.9188662376897558, 0.9188713741486454, 0.9188764854958021, 0.9188815723414641, 0.9188866349330918, 0.9188916736159155, 0.9188966888802157, 0.9189016811583017, 0.9189066507077013, 0.9189115976933229, 0.9189165219375051, 0.9189214225597764, 0.918926300373903, 0.9189311554797703, 0.9189359867855078, 0.918940795756994, 0.9189455837274397, 0.918950350674029, 0.9189550969874919, 0.9189598233209857, 0.9189645299154563, 0.9189692152620972, 0.918973880351141, 0.9189785451089135, 0.9189831860173695, 0.9189878056926789, 0.91899241096817, 0.918997006061067, 0.9190015821615318, 0.9190061368285303, 0.9190106702514237, 0.9190151828678926, 0.9190196749592554, 0.9190241470036736, 0.9190285996284175, 0.9190330332329392, 0.9190374474624812, 0.9190418427569332, 0.9190462191712561, 0.9190505768146169, 0.9190549190199354, 0.9190592504831077, 0.9190635631852937, 0.9190678581336663, 0.9190721353048792, 0.9190763954331067, 0.919080638792899, 0.9190848649987117, 0.9190890738646929, 0.9190932651749568, 0.9190974397161007, 0.9191015967944396, 0.9191057367157681, 0.9191098599447342, 0.9191139665916379, 0.9191180567521015, 0.9191221302621586, 0.919126186451527, 0.9191302270981453, 0.9191342502857779, 0.9191382561796254, 0.9191422450658459, 0.9191462198854765, 0.9191501799677059, 0.9191541239113624, 0.9191580518372403, 0.919161963920251, 0.9191658604004322, 0.919169741385431, 0.9191736069259315, 0.9191774570309678, 0.9191812917407355, 0.9191851111551054, 0.9191889152898989, 0.9191927042987847, 0.9191964785845543, 0.9192002381044608, 0.9192039830114662, 0.9192077133598231, 0.9192114291968267, 0.9192151308132428, 0.9192188182384635, 0.9192224914676959, 0.9192261504340249, 0.919229798038283, 0.9192334319771417, 0.9192370549402139, 0.9192406670250348, 0.9192442654819484, 0.9192478503839622, 0.9192514217301802, 0.9192549795860712, 0.9192585240721447, 0.9192620428291587, 0.91926554315793, 0.9192690292505181, 0.9192725017665027, 0.9192759604626728, 0.9192794047917575, 0.9192828345648004, 0.9192862499066202, 0.919289650642668, 0.9192930372861958, 0.9192964102560927, 0.9192997673017885, 0.9193031074501049, 0.9193064326215065, 0.9193097445058386, 0.9193130434295034, 0.9193163294022929, 0.9193196026401205, 0.9193228631381725, 0.9193261099231614, 0.9193293404755027, 0.9193325583246902, 0.9193357666473726, 0.9193389623395732, 0.9193421464178786, 0.9193453188391768, 0.9193484790233462, 0.9193516269513704, 0.9193547622523962, 0.9193578852466034, 0.9193609964890035, 0.9193640962052894, 0.9193671846766925, 0.919370261337547, 0.9193733264440381, 0.9193763804715552, 0.9193794216405268, 0.9193824710203193, 0.9193855102346334, 0.919388537765037, 0.9193915539015134, 0.9193945591071497, 0.9193975534906114, 0.9194005372094284, 0.9194035101365349, 0.9194064724922479, 0.9194094206625805, 0.9194123574990316, 0.919415283730179, 0.9194181990055724, 0.9194211010109119, 0.9194239923413177, 0.9194268732860169, 0.9194297439888062, 0.9194326045571004, 0.9194354550356418, 0.9194382953310213, 0.9194411241044623, 0.9194439425976848, 0.9194467509939048, 0.9194495494483895, 0.9194523381258858, 0.919455117172252, 0.9194578866995887, 0.919460646712138, 0.9194633973757966, 0.9194661388991676, 0.9194688715155633, 0.9194715951499322, 0.9194743099822784, 0.9194770161205749, 0.9194797135868094, 0.9194824100961683, 0.9194851083413657, 0.9194878024953378, 0.9194904891853283, 0.9194931670863355, 0.9194958347353721, 0.9194984928711202, 0.9195011418134456, 0.9195037829621893, 0.9195064243979092, 0.9195090568807437, 0.9195116806121779, 0.9195142959691665, 0.9195168971120316, 0.9195194907481257, 0.9195220769338787, 0.9195246547782293, 0.9195272240754219, 0.9195297847974344, 0.9195323368660581, 0.9195348804964946, 0.9195374158291618, 0.9195399414980665, 0.9195424551110282, 0.9195449616604789, 0.9195474607490214, 0.9195499523099389, 0.9195524363308888, 0.919554912773625, 0.9195573815546556, 0.9195598426995437, 0.9195622961566648, 0.9195647419594459, 0.9195671803003262, 0.9195696112025569, 0.9195720347063853, 0.9195744508055534, 0.9195768595648163, 0.9195792610759586, 0.9195816554063082, 0.9195840450846219, 0.9195864275256467, 0.9195888030663826, 0.9195911718072203, 0.919593533812425, 0.9195958861227751, 0.9195982302507101, 0.9196005674717492, 0.9196028980250756, 0.9196052219800102, 0.9196075393543164, 0.9196098501539082, 0.9196121544286839, 0.9196144522721004, 0.9196167435258974, 0.9196190280806509, 0.9196213060546093, 0.9196235928653093, 0.919625888710774, 0.9196281774216438, 0.9196304588586893, 0.919632733263348, 0.9196350008235398, 0.9196372616013511, 0.919639515626083, 0.919641762961928, 0.9196440038899455, 0.9196462387218368, 0.9196484673368123, 0.9196506895744303, 0.9196529056064018, 0.919655115525411, 0.9196573193929116, 0.9196595172462225, 0.9196617091728976, 0.9196638951948707, 0.9196660753803096, 0.9196682497484967, 0.9196704184118577, 0.9196725814471333, 0.9196747389151771, 0.9196768908618671, 0.9196790373510622, 0.9196811785051023, 0.91968331434561, 0.9196854448119653, 0.9196875696674697, 0.9196896898272257, 0.9196918044143441, 0.9196939132963147, 0.9196960166710113, 0.9196981146986751, 0.919700207474719, 0.9197022993472491, 0.9197043867776772, 0.9197064691347765, 0.919708545978941, 0.919710617187723, 0.9197126827521886, 0.9197147427679965, 0.9197167975230682, 0.9197188470646557, 0.9197208913509587, 0.9197229304070671, 0.9197249643453119, 0.9197269932495239, 0.9197290171461848, 0.919731032273836, 0.9197330398363933, 0.9197350423428222, 0.9197370399665693, 0.919739031471071, 0.9197410173293048, 0.9197429979892489, 0.9197449736367412, 0.9197469444380568, 0.9197489102134823, 0.9197508710553222, 0.919752826986966, 0.9197547780499893, 0.9197567246280485, 0.919758666516288, 0.9197606038063374, 0.9197625366195694, 0.9197644650396815, 0.919766389088445, 0.9197683086893909, 0.919770224054212, 0.9197721351748465, 0.9197740414903539, 0.9197759424822394, 0.9197778390362854, 0.9197797313924403, 0.9197816196206614, 0.9197835037435035, 0.9197853837973432, 0.9197872598069242, 0.9197891317628577, 0.9197909995842131, 0.9197928633051327, 0.9197947229918617, 0.919796578557424, 0.9197984300402288, 0.9198002775469318, 0.9198021212913586, 0.9198039613900665, 0.9198057978504371, 0.9198076306900144, 0.9198094599510159, 0.919811285668612, 0.9198131080206505, 0.919814927114819, 0.9198167427808266, 0.9198185550057372, 0.9198203637907946, 0.9198221691477866, 0.9198239710923315, 0.9198257696646103, 0.9198275648964395, 0.9198293567878395, 0.9198311453416896, 0.919832930518151, 0.919834712385184, 0.9198364909690685, 0.9198382663136809, 0.9198400384265647, 0.9198418073195529, 0.9198435730020494, 0.9198453354852977, 0.9198470947818024, 0.9198488509248016, 0.9198506040067647, 0.9198523539519929, 0.919854102086211, 0.9198558563895634, 0.9198576073122934, 0.9198593553886302, 0.9198611005225755, 0.9198628426389996, 0.9198645816208225, 0.9198663173928799, 0.9198680499306195, 0.9198697792323826, 0.9198715053116182, 0.9198732281947751, 0.91987494788308, 0.9198766644048927, 0.9198783777760209, 0.9198800880134507, 0.9198817950610443, 0.919883498871316, 0.9198851994663667, 0.9198868968599645, 0.9198885910680915, 0.9198902821840541, 0.9198919700561056, 0.9198936549422727, 0.9198953369865444, 0.9198970161671177, 0.9198986923173149, 0.9199003654044602, 0.9199020354507976, 0.9199037025053274, 0.9199053665922503, 0.9199070277383863, 0.9199086859337061, 0.9199103412606774, 0.9199119937528533, 0.9199136434782755, 0.9199152904908182, 0.9199169348017489, 0.9199185764573188, 0.9199202153940229, 0.9199218516259765, 0.9199234852908038, 0.919925116347692, 0.919926744770952, 0.91992837056485, 0.9199299937685582, 0.9199316144154632, 0.9199332325321166, 0.9199348479169558, 0.9199364608548203, 0.9199380714059824, 0.9199396796809496, 0.9199412858732509, 0.9199428898792966, 0.9199444916068098, 0.9199460910743793, 0.9199476882990869, 0.9199492832718699, 0.9199508760616628, 0.9199524667023886, 0.9199540552052177, 0.9199556415713782, 0.9199572258263593, 0.9199588080080058, 0.9199603880730197, 0.919961965813284, 0.9199635412950399, 0.9199651146262536, 0.9199666857886835, 0.9199682547740387, 0.9199698211152123, 0.919971383752569, 0.9199729435091364, 0.9199745006693065, 0.9199760553469696, 0.9199776076121232, 0.9199791575242495, 0.9199807051153509, 0.9199822501783046, 0.9199837925199164, 0.919985332379318, 0.9199868698826872, 0.9199884137742557, 0.9199899642460003, 0.9199915119813075, 0.9199930569577862, 0.9199945991540281, 0.9199961386481623, 0.9199976755243112, 0.919999209811926, 0.9200007408193023, 0.9200022688890952, 0.9200037938860217, 0.9200053158880681, 0.9200068350182596, 0.9200083513901216, 0.9200098650938676, 0.920011376203645, 0.9200128847689876, 0.9200143908207941, 0.920015894380015, 0.9200173954722912, 0.9200188941110202, 0.9200203902879303, 0.9200218839953691, 0.9200233752421995, 0.9200248640192311, 0.9200263502958977, 0.9200278340911187, 0.9200293154376105, 0.9200307943868307, 0.9200322711085519, 0.9200337460118875, 0.9200352187284374, 0.9200366884770148, 0.9200381553519383, 0.9200396195221098, 0.9200410811014035, 0.9200425401417937, 0.9200439966574779, 0.9200454521133994, 0.9200469049592935, 0.9200483551863269, 0.9200498028433758, 0.9200512479661619, 0.920052690578584, 0.9200541301501823, 0.9200555662859394, 0.9200569994943383, 0.9200584300274741, 0.9200598579712552, 0.9200612832022395, 0.9200627056712135, 0.9200641255943651, 0.9200655430274357, 0.9200669579812631, 0.9200683704677023, 0.9200697805003143, 0.9200711880920444, 0.9200725924005101, 0.9200739872898447, 0.9200753797905181, 0.9200767691701144, 0.9200781554354204, 0.9200795385723265, 0.9200809186076077, 0.9200822958661365, 0.92008367035386, 0.9200850421210167, 0.9200864112148471, 0.9200877776839734, 0.9200891417828317, 0.9200905034074445, 0.9200918615552618, 0.9200932166762783, 0.9200945688956241, 0.9200959182154893, 0.9200972646322175, 0.9200986081752095, 0.9200999488772823, 0.9201012867695375, 0.9201026219387765, 0.9201039544377568, 0.9201052843698367, 0.9201066117937751, 0.9201079367183296, 0.9201092623716784, 0.9201105883922883, 0.920111911849732, 0.9201132329444703, 0.9201145516939104, 0.9201158680352425, 0.9201171816479236, 0.920118492852559, 0.9201198018119238, 0.9201211083330725, 0.9201224125958705, 0.9201237144810517, 0.9201250140220857, 0.9201263113047216, 0.920127607616406, 0.9201289019894033, 0.9201301941357511, 0.9201314840106133, 0.9201327716366166, 0.9201340570364841, 0.9201353402203525, 0.9201366212165921, 0.9201379000540433, 0.9201391767780035, 0.9201404514509145, 0.9201417240807561, 0.9201429946776754, 0.9201442632426501, 0.9201455297831513, 0.920146794174604], 'MSE': [1584.5299217265892, 29.855262164172501, 3.1865946322806078, 2.8191649118734472, 2.6456370056836263, 2.5386713416365794, 2.4714289731917041, 2.41638129724728, 2.3392645688432205, 2.2720866114313676, 2.2068727662993761, 2.1490522642591858, 2.0915024723145006, 2.0390028920078271, 1.98784107662788, 1.9469582785809072, 1.9104840517791379, 1.8790355305224278, 1.849791430725956, 1.8181836269142844, 1.7857573670804516, 1.7573914711415277, 1.729381052395387, 1.7035560726937211, 1.6783240190363944, 1.6512906191647023, 1.6270959602897725, 1.6040443470032513, 1.5828326784003528, 1.5582878566717449, 1.5330607966838963, 1.5109379431376972, 1.4907907418189132, 1.4702165770564279, 1.4488052400609048, 1.4274561684873155, 1.4060158562683698, 1.3870907519401001, 1.3690604039223415, 1.3496719582804944, 1.3305883836962245, 1.3128242216471477, 1.2950370905298612, 1.2779568530757879, 1.2623701456691798, 1.2470925286201962, 1.231674393894062, 1.215162988459431, 1.1993973389029784, 1.1858478181863739, 1.1743106216719017, 1.1642951108766242, 1.155453665736238, 1.1475603248741513, 1.1404622782158977, 1.1340401874269379, 1.128200353105167, 1.1228402002732503, 1.1178802996040003, 1.1132727746935451, 1.1089913786818328, 1.1049875863447529, 1.1012361975064369, 1.0977025110001988, 1.0943861044375305, 1.0912520148023406, 1.0882798473994819, 1.0854653479392182, 1.0827878647460318, 1.080239915395101, 1.0778094414143522, 1.0754858732928174, 1.0732608617341806, 1.0711252805100611, 1.0690723487968468, 1.0671001292008226, 1.0651978947017116, 1.0633654835418609, 1.0615975299680271, 1.0598880399227875, 1.0582329451194008, 1.0566291907327503, 1.0550740771943263, 1.0535634934765075, 1.0520948223812718, 1.0506650133921538, 1.0492731607696777, 1.0479185216008051, 1.0465992522288838, 1.0453144103511809, 1.0440616461446193, 1.0428393589193354, 1.0416468432460553, 1.040482725814025, 1.0393449029659505, 1.0382331325992027, 1.0371453447881993, 1.0360809852760293, 1.0350393269148537, 1.0340198187689842, 1.0330211376114768, 1.0320421976747258, 1.0310829303955886, 1.0301437083035396, 1.0292228871569613, 1.028319016710179, 1.0274314294428066, 1.0265594735878689, 1.0257029662366559, 1.0248611815795787, 1.024034482571144, 1.0232226227205223, 1.0224238098281613, 1.0216379820008827, 1.020864139401195, 1.0201023848819188, 1.0193525731526198, 1.0186150823686513, 1.0178893970114946, 1.0171752363078388, 1.0164721561867367, 1.0157821364160968, 1.0151012784639808, 1.0144306697196075, 1.0137702164981257, 1.0131195586476764, 1.0124792687477666, 1.0118484440042428, 1.0112272367461492, 1.0106152053398518, 1.0100123784387873, 1.0094184036235243, 1.0088331404474138, 1.0082564570021428, 1.0076876883555834, 1.0071267126727035, 1.0065731917771792, 1.0060276762445954, 1.0054896333516123, 1.0049588561965164, 1.004435675755792, 1.0039201722489184, 1.0034118400324754, 1.0029103838414484, 1.0024157250415231, 1.0019278578649391, 1.001446825673536, 1.0009722435239741, 1.0005041280587705, 1.0000423821114182, 0.99958718593244711, 0.99913834323214801, 0.99869579394423202, 0.99825935479039229, 0.99782916756363027, 0.99740485181093208, 0.99698616006294061, 0.99657295096832521, 0.99616508156558681, 0.99576241883720507, 0.99536482054780617, 0.99497204707276121, 0.99458386456645265, 0.99420056325717898, 0.99382216597996609, 0.99344853326008653, 0.99307954271861931, 0.9927148202076499, 0.99235399598997387, 0.99199754184565214, 0.99164532234789327, 0.991297086824941, 0.99095246270590465, 0.99061165238302895, 0.99027461144492457, 0.98994126793306669, 0.98961168414774692, 0.98928664666519961, 0.98896564323592595, 0.98864813102486127, 0.98833398608468603, 0.98802320900077312, 0.98771575387024702, 0.98741137552225611, 0.98710998228926528, 0.98681169362504739, 0.98651660401766927, 0.98622467626324617, 0.98593570177224055, 0.98564961570717546, 0.98536636669042976, 0.9850858959198262, 0.98480806322602232, 0.98453279153714501, 0.98426004328372696, 0.98398975348054196, 0.98372190332423226, 0.98345656396700476, 0.98319361719239895, 0.98293293155132355, 0.98267462714728426, 0.98241864165923198, 0.98216491092452762, 0.98191338319642274, 0.98166402209879411, 0.98141678512093367, 0.98117156393370297, 0.9809282526448877, 0.9806868452305153, 0.98044753788009409, 0.9802102346897017, 0.97997486740947237, 0.97974137902744707, 0.97950971815209131, 0.97927987562347707, 0.97905180109386325, 0.97882549213150827, 0.97860090135296796, 0.97837801763397625, 0.97815681831180246, 0.97793732102002862, 0.97771947312089236, 0.97750321409241214, 0.97728851785548387, 0.9770753631340624, 0.97686375931249569, 0.97665367760627131, 0.97644507495274235, 0.97623789906777347, 0.97603211744268203, 0.97582772773127802, 0.97562479204902053, 0.97542356226532057, 0.97522384098062365, 0.97502554303705136, 0.97482860600052601, 0.97463295627887714, 0.97443838378215986, 0.97424506899939933, 0.97405295651216905, 0.97386210826875896, 0.9736724873428283, 0.97348402116655097, 0.97329668173410033, 0.97311044337134056, 0.97292529894245772, 0.9727412337303909, 0.97255823786331075, 0.97237629952473259, 0.9721954091199525, 0.9720155437888699, 0.97183679795151312, 0.9716591150425693, 0.97148246614544109, 0.97130683527990314, 0.97113221205382561, 0.97095858339047914, 0.97078596121482064, 0.97061440178124014, 0.97044385279612311, 0.9702742965665252, 0.97010570987740508, 0.96993807846200941, 0.96977219761331146, 0.96960770397148743, 0.96944436801282252, 0.96928207160858293, 0.96912078231114607, 0.96896053765811296, 0.9688012503543767, 0.96864291285807258, 0.9684854826709014, 0.96832893257794117, 0.96817324515228864, 0.96801841165142255, 0.96786433880003286, 0.96771101705415208, 0.96755855766777099, 0.9674069285396738, 0.96725613628641827, 0.96710620766790734, 0.9669571450812009, 0.96680888634068152, 0.96666142695993162, 0.96651476190138463, 0.96636889900710754, 0.96622383368437181, 0.96607952461180957, 0.96593596278021088, 0.96579314290617413, 0.96565105458929923, 0.9655095968376417, 0.96536895168963943, 0.96522916567352413, 0.96509020451882399, 0.96495200738166365, 0.96481454076862694, 0.96467778193681708, 0.9645417115633953, 0.96440631816608113, 0.9642716004157077, 0.9641375483312723, 0.96400418657759934, 0.96387150139748179, 0.96373946597985538, 0.96360807572112217, 0.96347731174912155, 0.96334717101858225, 0.96321763161619622, 0.96308868965238448, 0.96296013243838086, 0.96283231100885069, 0.9627052023771836, 0.96257877954484306, 0.96245299396704542, 0.96232782637068659, 0.96220327320522603, 0.96207930463255054, 0.96195590011825471, 0.96183303043190205, 0.96171068969053819, 0.96158888166889323, 0.96146758663027876, 0.96134680686126617, 0.96122657658603405, 0.96110703989380841, 0.96098808568773386, 0.96086964451496426, 0.96075170113638342, 0.96063425245367973, 0.96051729547779585, 0.96040081555666634, 0.96028482803413551, 0.96016935138010928, 0.96005434936932443, 0.95993981045961074, 0.95982567531642227, 0.95971204850735603, 0.95959893903094795, 0.95948628198957431, 0.95937407830617782, 0.9592623234829688, 0.95915108802815485, 0.95904072162283349, 0.95893110309699403, 0.95882215644400481, 0.95871385380074625, 0.95860616496535811, 0.95849891188602443, 0.95839233652461431, 0.95828643832556304, 0.9581811882972523, 0.95807653947757565, 0.95797248552269032, 0.95786900769539374, 0.95776609558538151, 0.9576637290751624, 0.95756190282358156, 0.95746061872071231, 0.95735992238535594, 0.9572597783638771, 0.95716015113902109, 0.95706103356697569, 0.95696241285239603, 0.95686428754145747, 0.95676663656117511, 0.95666944919253927, 0.95657271577028813, 0.95647643876534061, 0.95638061676584629, 0.95628524752921118, 0.95619032908344093, 0.95609586491673426, 0.95600184789881426, 0.95590828820519513, 0.95581516080991513, 0.95572245849111459, 0.95563018202870609, 0.95553833806109612, 0.95544692753143523, 0.95535593439552546, 0.95526535518301892, 0.95517519205677393, 0.95508543642912413, 0.95499608089139465, 0.95490715346745569, 0.95481862138478946, 0.95473048751732448, 0.95464277870566738, 0.95455546183931794, 0.95446853374634588, 0.95438199627895248, 0.954295842627785, 0.95421009542426616, 0.9541247687075054, 0.95403984200406466, 0.95395500963554014, 0.95387018317047645, 0.95378577812568299, 0.95370182553163263, 0.9536180583365329, 0.95353479769335769, 0.95345197686505145, 0.95336955495704889, 0.9532875107501132, 0.95320582644467444, 0.95312450326045284, 0.95304355038126931, 0.95296296994788054, 0.95288273981366689, 0.95280287729584567, 0.95272341658744819, 0.9526443902479147, 0.95256577678677878, 0.95248755179837241, 0.95240970116139456, 0.95233221284416958, 0.9522550813521099, 0.9521783172044368, 0.95210191526327259, 0.95202584295548875, 0.95195008847295004, 0.95187476346285638, 0.95179989145000643, 0.95172544302670259, 0.95165138303686991, 0.95157766408959377, 0.95150429750679422, 0.95143130282142685, 0.95135875079384369, 0.95128663085892717, 0.95121490703597633, 0.95114368867642862, 0.95107282146264804, 0.95100227090855871, 0.95093204703537171, 0.95086216055257067, 0.95079261129970982, 0.95072339845207232, 0.9506545216570681, 0.95058598194760779, 0.95051779620568966, 0.95044995350652772, 0.95038244866072263, 0.95031528730751758, 0.95024844792908636, 0.95018194489837016, 0.95011578628591664, 0.95004995580233587, 0.94998445490788896, 0.94991926009622829, 0.94985437375057857, 0.94978979755782833, 0.94972554102696927, 0.94966145146362813, 0.94959769615364764, 0.94953426685497477, 0.94947121336739482, 0.94940848703872416, 0.94934603932412043, 0.94928387743760634, 0.9492220106714172, 0.94916044211718464, 0.94909917369961894, 0.9490382044504353, 0.94897753357516201, 0.94891716503369539, 0.94885709048681177, 0.94879730963953623, 0.94873781535470325, 0.94867860473808308, 0.94861967375196288, 0.94856101666216386, 0.94850262841251809, 0.94844450599105645, 0.94838664746905754, 0.94832905492439667, 0.94827173865481806, 0.94821468914274298, 0.94815790521994125, 0.94810139965661877, 0.94804515530827937, 0.94798915658207472, 0.94793340374485258, 0.94787789222674534, 0.94782261438861404, 0.94776756741242474, 0.94771276894474554, 0.94765820740409945, 0.94760364973790689, 0.94754937100646575, 0.94749534061180452, 0.94744147863328043, 0.94738773574744883, 0.94733421499164561, 0.94728094491550474, 0.94722792330431116, 0.94717514503907729, 0.94712260682958738, 0.9470703030833979, 0.94701822646413758, 0.9469663722999313, 0.94691474473991677, 0.94686333863927385, 0.94681215335519475, 0.94676118761089234, 0.94671040242549642, 0.94665974287715526, 0.94660930275191657, 0.94655907027017605, 0.94650904570498817, 0.9464592204696578, 0.94640959135312619, 0.94636016286461055, 0.94631093717777937, 0.94626191681757221, 0.94621309258417341, 0.94616447259072289, 0.94611605326073389, 0.94606782915981935, 0.94601979899793887, 0.94597196165672504, 0.94592431905387842, 0.94587687902882955, 0.94582962078731947, 0.94578256674108685, 0.94573571495799458, 0.94568906209122028, 0.94564257374323801, 0.94559625775966516, 0.94555013052820103, 0.94550419063607272, 0.94545843603756574, 0.94541286392526724, 0.94536747304016966, 0.94532226278948339, 0.94527723306755296, 0.94523238340425753, 0.94518771263153833, 0.94514322056435396, 0.94509890540543751, 0.94505476244385711, 0.94501079217956863, 0.94496699282357044, 0.94492336374134089, 0.94487990437972857, 0.94483661133802099, 0.94479348427245569, 0.94475052323909114, 0.94470772902054334, 0.94466506768951186, 0.94462256618506368, 0.94458019305025998, 0.94453794714435624, 0.94449586062654045, 0.94445393264293687, 0.94441216320402555, 0.94437055154410077, 0.94432909625371797, 0.94428794188302034, 0.94424700304375386, 0.94420623070679366, 0.94416561715788694, 0.9441251652415571, 0.94408488135852864, 0.9440447677187831, 0.94400482286247378, 0.94396504883107757, 0.94392543962174302, 0.94388599033526688, 0.94384672729366859, 0.94380766187896437, 0.94376877162995165, 0.94373003678268319, 0.943691453519655, 0.94365302172634247, 0.94361473887748404, 0.9435766050293799, 0.94353863156531914, 0.94350084795364009, 0.94346321291439683, 0.94342568929441872, 0.94338831339692553, 0.94335107333221435, 0.9433139696045072, 0.94327700899874201, 0.94324019173732732, 0.94320352215765813, 0.94316699651500147, 0.94313060831810436, 0.94309435492732441, 0.94305823305346226, 0.94302224931238343, 0.94298640070781492, 0.94295068167974461, 0.9429151130415262, 0.94287944837190618, 0.94284390259480022, 0.94280849346935292, 0.94277321760400346, 0.94273806958261896, 0.94270304813427741, 0.94266815141655569, 0.94263338091557725, 0.94259873405457839, 0.94256425310171321, 0.94252990470666753, 0.94249568034820663, 0.9424615841250944, 0.94242764310472049, 0.94239382693530227, 0.94236013223412274, 0.94232655731937764, 0.94229310093477547, 0.94225976255702137, 0.942226543278602, 0.94219345875746408, 0.94216049447080696, 0.94212764827578932, 0.94209491835644998, 0.94206230278595793, 0.94202979985839375, 0.94199740826266309, 0.94196512794915188, 0.94193295697757928, 0.94190089290818235, 0.94186893301220942, 0.94183707816744233, 0.94180532626860014, 0.94177367605286477, 0.94174212726307505, 0.94171058966462684, 0.94167903176431067, 0.94164752171378874, 0.94161609895985143, 0.94158477899933557, 0.94155357894292291, 0.94152249015119727, 0.94149150888310207, 0.94146061876649689, 0.94142972529350255, 0.94139893653088091, 0.94136825012212233, 0.94133766165847432, 0.94130723943912797, 0.94127690501681605, 0.94124665773155469, 0.94121650800493739, 0.94118645824342373, 0.94115650877475088, 0.94112666051362803, 0.9410969109431172, 0.9410672584209302, 0.9410377189233321, 0.94100832042857896, 0.94097900454661954, 0.94094977592529927, 0.94092063534491643, 0.94089158294982767, 0.94086261918734915, 0.94083374503397643, 0.9408049601907309, 0.94077626526139912, 0.94074765985502851, 0.94071914172090421, 0.94069071058708975, 0.94066236598286046, 0.94063410798140923, 0.94060593582538143, 0.940577848441289, 0.94054984504168238, 0.94052189605095116, 0.94049403170547075, 0.94046624806378698, 0.94043854395175785, 0.94041091861775505, 0.94038340667198661, 0.94035599042539364, 0.9403286549598685, 0.94030139747799701, 0.94027421716901805, 0.94024711382517678, 0.94022008737730745, 0.94019313724180975, 0.94016626232564293, 0.94013946447977037, 0.94011274498398523, 0.94008610245528779, 0.94005935657460182, 0.94003250502590374, 0.94000573692137657, 0.93997905388940883, 0.93995245310621478, 0.93992593237394073, 0.93989949096643743, 0.93987312854101046, 0.93984684434688248, 0.93982063509686298, 0.93979449714538243, 0.93976843190516379, 0.93974244125268569, 0.9397165231796637, 0.93969067660209371, 0.93966490080122766, 0.93963919534059648, 0.93961355919619427, 0.93958799211148947, 0.9395624932892106, 0.93953706250383795, 0.93951169844047022, 0.93948640020157337, 0.9394611670754176, 0.93943599852543003, 0.93941089380473597, 0.93938585148247877, 0.93936087130576995, 0.93933595398360359, 0.9393111022843369, 0.93928630550519332, 0.93926157390201737, 0.93923690902461143, 0.93921230855869853, 0.93918777063014325, 0.93916329412302646, 0.93913882818314642, 0.93911441419681563, 0.93909005954668046, 0.93906576937424513, 0.93904154511162519, 0.9390173868633056, 0.93899329351049443, 0.93896926168573924, 0.93894529083639844, 0.93892138145135506, 0.93889753323716241, 0.93887374488003283, 0.93885001539950419, 0.93882634448585411, 0.93880277613202057, 0.93877929625735124, 0.93875587551770656, 0.93873251188450491, 0.93870921982023847, 0.93868599379309869, 0.9386628285636619, 0.93863972195841816, 0.93861667203266574, 0.93859368088828099, 0.93857074744569391, 0.93854787143134855, 0.93852505235899153, 0.93850228574148387, 0.9384795739747589, 0.93845691598714553, 0.9384343103591003, 0.93841175611172367, 0.93838925299038345, 0.93836680188943933, 0.93834440033299316, 0.93832204841533529, 0.93829975269706112, 0.93827751924234015, 0.93825533769131253, 0.93823320523761422, 0.93821112106304283, 0.93818908490380415, 0.93816709633444717, 0.93814515506557883, 0.93812326120700695, 0.93810141570527117, 0.93807961816105467, 0.93805786779957112, 0.93803616563806924, 0.93801451122732615, 0.93799290331992591, 0.93797133941502708, 0.93794981814940903, 0.93792833943673737, 0.93790690307182545, 0.93788550856090613, 0.93786415549263735, 0.93784284178696398, 0.93782156618440216, 0.93780033067662483, 0.9377791354149283, 0.93775798038476621, 0.93773686544827184, 0.93771579042277819, 0.93769475483833942, 0.93767375832283961, 0.93765280087603886, 0.93763188246426188, 0.93761100355345395, 0.93759016334876932, 0.93756936154284487, 0.93754859762251641, 0.93752787149955641, 0.9375071830355709, 0.93748653212057298, 0.93746591862306317, 0.93744534239678912, 0.93742480305300957, 0.93740429951022974, 0.93738383265379754, 0.93736338697842114, 0.9373428691506227, 0.93732239086161062, 0.93730194586319704, 0.93728153527814662, 0.93726115998515902, 0.93724082135356523, 0.93722052026246683, 0.9372002569990181, 0.93718003158262286, 0.93715984385598228, 0.93713969350975845, 0.93711958052960631, 0.93709950458383773, 0.93707946548756749, 0.93705946304213505, 0.9370394979041079, 0.93701957062886854, 0.93699968095792996, 0.93697982873026475, 0.93696001375894866, 0.9369402349527004, 0.93692049408630373, 0.93690078814195255, 0.93688111543559316, 0.93686147622222682, 0.93684187245126782, 0.93682230450488524, 0.93680277212291729, 0.93678327473227108, 0.936763812049902, 0.93674438376213143, 0.93672498998625831, 0.9367056297577655, 0.93668630268422604, 0.93666700796983993, 0.93664774498451464, 0.93662851359646782, 0.93660931326475549, 0.9365901447321171, 0.93657100783346248, 0.93655190095918062, 0.93653282458660292, 0.93651377901618571, 0.9364947641980309, 0.93647577967398987, 0.93645682505358507, 0.93643790002627647, 0.93641900694947944, 0.93640014249179693, 0.93638130594829938, 0.93636249602652333, 0.93634371046300902, 0.93632495046931119, 0.93630621712467532, 0.93628751021169054, 0.93626882953057544, 0.93625017518732245, 0.93623154637569328, 0.93621294269893551, 0.93619436402640455, 0.93617581034373409, 0.93615728135281173, 0.93613877661101552, 0.93612029662474416, 0.93610184382807649, 0.93608341744627577, 0.93606501621659588, 0.93604664035238982, 0.93602828995062426, 0.93600997047444412, 0.9359916943170431, 0.93597345185252712, 0.93595523975472628, 0.93593705669161509, 0.93591890184452009, 0.93590077451775566, 0.9358826743370332, 0.93586460372479929, 0.93584656494059748, 0.93582855518761288, 0.93581057299010617, 0.93579251607805647, 0.93577438220615827, 0.93575628033884617, 0.93573821073799779, 0.93572017365399962, 0.93570216817307794, 0.93568419331135944, 0.93566624872439319, 0.93564834250215223, 0.93563047063704252, 0.93561263471129352, 0.93559483381280362, 0.93557706650270167, 0.93555933145323078, 0.93554162760927662, 0.93552395410363343, 0.9355063103569693, 0.93548869600789952, 0.93547111081139611, 0.93545355446756706, 0.9354360268197216, 0.93541852796460434, 0.93540105799171069, 0.93538361679738713, 0.93536620448912011, 0.93534882142440279, 0.9353314673819626, 0.93531414197915297, 0.93529684461414331, 0.93527957330132205, 0.93526232325581737, 0.93524509878632722, 0.93522790902939246, 0.93521075288188649, 0.93519362836838293, 0.93517653415704194, 0.93515946963998642, 0.93514243465116587, 0.93512541205702626, 0.93510841998901539, 0.93509145855044873, 0.93507452716968087, 0.93505762542892301, 0.93504075304866086, 0.9350239162329983, 0.93500711960194827, 0.93499035720843948, 0.93497362610403745, 0.93495692528398344, 0.93494025619202359, 0.93492361940373991, 0.93490701239066287, 0.93489043450085896, 0.93487388560757101, 0.9348573655721466, 0.93484087423597861, 0.93482441144766493, 0.93480798705946744, 0.93479167283471976, 0.93477538654706638, 0.934759136762636, 0.93474292340204868, 0.93472674663032695, 0.93471060613431911, 0.9346944981144083, 0.93467842250104149, 0.93466237870664115, 0.93464636617869634, 0.93463038434853651, 0.93461443024035007, 0.93459850507023035, 0.93458262056370789, 0.93456677145777955, 0.93455095628895735, 0.9345351750316272, 0.93451942772855146, 0.93450371403587018, 0.93448803356976295, 0.93447238596647375, 0.93445677021080131, 0.93444118568570511, 0.93442563118233979, 0.93441010601347685, 0.93439461007668767, 0.93437910561613102, 0.93436359686019366, 0.93434811808231311, 0.93433266693795303, 0.93431724322352838, 0.9343018476736431, 0.93428648403727588, 0.93427114856471749, 0.93425583935219958, 0.93424055865635702, 0.93422530437353468, 0.93421007789863464, 0.93419487884020636, 0.93417970619535418, 0.9341645449064695, 0.93414940629191356, 0.93413429371960965, 0.93411920771394952, 0.93410414801029718, 0.93408911434288722, 0.93407410659316759, 0.93405912442932482, 0.93404416751405162, 0.93402923531755966, 0.93401432710955168, 0.93399944279669445, 0.93398458226031422, 0.93396974548897305, 0.93395493239529104, 0.93394014443626439], 'Rp': [-5.6994053475107662e-14, 0.42971695944005583, 0.85310133403478117, 0.87140840315768953, 0.8802749417122413, 0.88523049227834505, 0.88845663773241046, 0.89128597614012151, 0.89492639464509061, 0.89808431737315508, 0.90117854950874599, 0.90385699981681267, 0.90659004548772049, 0.90903679425509909, 0.91141012244385589, 0.91333324463875143, 0.91501094549277351, 0.91643153227021346, 0.91783163988452188, 0.91929596337841424, 0.92080172456010578, 0.92211151508688061, 0.92339166692947738, 0.92455907843000784, 0.92573552205972054, 0.92697022121052997, 0.92808747888884568, 0.92914566199376081, 0.93013229059706337, 0.93126660393078897, 0.93241410476944142, 0.93342566642416702, 0.93434533796349073, 0.93529314440893863, 0.9362756715974786, 0.93726548538329391, 0.93822913202756753, 0.93908400062200736, 0.93989611678823515, 0.94077677346584154, 0.9416394326316142, 0.94244026258126357, 0.94324787975569235, 0.94401170895454301, 0.94470343148354752, 0.94539028382186241, 0.94609119998519942, 0.94684211249510808, 0.94753622941907756, 0.94812837603620093, 0.94863083402189785, 0.94906817453299741, 0.94945387953500682, 0.94979828235019226, 0.95010856745450822, 0.95039002497248171, 0.95064643766118773, 0.9508820144540272, 0.95110017864596341, 0.95130341374851735, 0.95149242317838689, 0.95166878757565565, 0.9518345415269297, 0.95199042718009019, 0.95213710758126557, 0.95227553583940572, 0.95240717117402518, 0.95253189262150351, 0.95265021418154394, 0.95276273863283512, 0.95287006487418924, 0.9529727724435384, 0.95307116077996057, 0.95316560322950461, 0.95325643708571939, 0.95334403266013479, 0.95342809452075039, 0.95350911555578033, 0.95358731488563986, 0.95366288552516854, 0.95373605702656183, 0.95380698892690785, 0.95387579223898167, 0.95394261566398553, 0.95400768213390108, 0.95407105129762526, 0.95413276411090742, 0.95419275535085613, 0.95425115242344472, 0.95430807002748907, 0.95436378678511335, 0.95441796697170067, 0.95447078857588807, 0.95452233177885804, 0.95457275381289297, 0.9546220159718366, 0.9546701764650618, 0.95471735349747433, 0.95476351886248489, 0.95480869174000371, 0.95485292599011506, 0.95489627549708045, 0.95493874604477713, 0.95498034589776826, 0.95502111750726193, 0.95506113359459022, 0.95510042381065186, 0.95513901344673446, 0.95517693384078772, 0.95521419906724414, 0.95525082823357343, 0.95528678831458436, 0.95532215215075389, 0.95535694653737291, 0.9553912030631293, 0.95542491898615245, 0.95545810763512373, 0.95549075149919005, 0.95552290771563808, 0.95555452582408928, 0.95558568272894884, 0.95561636588817367, 0.95564658575329275, 0.95567632060618846, 0.95570558534169037, 0.95573440375288665, 0.95576275351874396, 0.9557906943763973, 0.95581821321927263, 0.95584535010172078, 0.95587206157825366, 0.95589837088051477, 0.9559243184616415, 0.95594988002584225, 0.95597508249720009, 0.95599993390591842, 0.95602445401169733, 0.95604862151004377, 0.95607245781306405, 0.95609597444080863, 0.95611916750805803, 0.95614202050272623, 0.95616456195109667, 0.95618679119860017, 0.95620871241711969, 0.95623032968662369, 0.95625165252596034, 0.95627268433263268, 0.95629342524208738, 0.95631387982902094, 0.95633404254630172, 0.95635392074893055, 0.95637355128701029, 0.95639288055696747, 0.95641193511499545, 0.95643072716722322, 0.95644926731522084, 0.95646756360891927, 0.95648562146535188, 0.956503446007549, 0.95652105447993141, 0.95653845475334676, 0.95655563889453044, 0.95657260525977295, 0.95658935674919765, 0.95660589670056118, 0.95662222201122604, 0.95663835266276132, 0.95665432906233683, 0.95667011451222972, 0.95668571329127927, 0.95670113505008481, 0.95671640905014832, 0.95673150937328455, 0.95674644205032555, 0.95676121002786585, 0.9567758159486085, 0.95679022516525924, 0.95680445650739776, 0.95681853015511409, 0.95683245052644939, 0.95684621926686231, 0.95685987711886911, 0.95687347359038555, 0.95688684586304606, 0.95690006165566555, 0.95691313770697317, 0.9569260613797248, 0.95693884500744431, 0.95695150737015888, 0.95696406355977737, 0.95697647940865371, 0.95698877897727719, 0.95700096556673875, 0.95701304221176853, 0.95702501136005347, 0.95703687046153729, 0.95704861814388997, 0.95706025922859705, 0.9570718088732616, 0.95708325401984606, 0.95709458793468349, 0.95710582011282253, 0.95711695484994552, 0.95712799483618727, 0.95713894175035641, 0.95714979930550648, 0.95716057517431385, 0.95717126788885343, 0.95718186498978131, 0.95719236944925723, 0.957202787792517, 0.95721312240184042, 0.95722337667116042, 0.95723355055425929, 0.9572436471535295, 0.95725366612059848, 0.9572636097184124, 0.95727347809788454, 0.95728327211578068, 0.95729299129734946, 0.95730263811457361, 0.957312216041737, 0.95732172436999718, 0.95733116528282836, 0.9573405402355637, 0.95734984669579903, 0.9573590873140948, 0.95736826501950656, 0.9573773812666162, 0.95738643514241162, 0.95739542423397783, 0.9574043390351259, 0.95741318682778465, 0.95742197104326188, 0.95743069458686192, 0.95743936165764054, 0.9574479836670946, 0.9574565496545705, 0.9574650614943182, 0.95747351676749415, 0.95748191725515674, 0.9574902670943336, 0.95749856734197791, 0.95750681916698488, 0.95751502256255472, 0.95752317785117247, 0.95753128569916302, 0.95753934677462926, 0.95754736132690865, 0.9575553319427843, 0.95756325268418707, 0.95757112623355878, 0.95757895355533562, 0.95758673547228224, 0.95759447259151631, 0.95760216612836579, 0.9576098173614197, 0.95761742338839473, 0.95762498264554152, 0.95763249665660699, 0.95763996742009183, 0.95764739538847043, 0.95765474700118425, 0.95766203663627747, 0.95766927400877122, 0.95767646642134796, 0.95768361479756958, 0.95769071844575093, 0.95769777920942967, 0.95770479769364081, 0.95771177592700241, 0.95771871564906341, 0.95772561732341621, 0.95773248163291524, 0.95773931337942542, 0.95774611309654478, 0.9577528719559153, 0.9577595937563983, 0.95776627959255989, 0.95777292736381625, 0.9577795389569741, 0.95778611365687538, 0.95779265256212387, 0.95779915616506484, 0.95780562426432903, 0.95781205709713213, 0.95781845582443392, 0.95782482132260516, 0.95783115451388146, 0.9578374557076168, 0.95784373384752153, 0.95784997663625338, 0.95785617524856159, 0.95786233672277155, 0.95786846427171279, 0.95787455948463218, 0.95788062353125503, 0.95788665746620938, 0.95789266115044303, 0.95789863488674398, 0.95790457970180543, 0.95791049421553642, 0.9579163786089141, 0.95792223410088229, 0.95792806103089589, 0.95793386072026132, 0.95793963319290243, 0.95794537847961359, 0.95795109723875538, 0.95795680868344779, 0.95796248098050463, 0.95796811900273571, 0.95797372722536411, 0.95797930699839695, 0.95798485905608555, 0.95799038324632479, 0.95799588111346867, 0.95800135345156734, 0.95800680178971986, 0.95801222658761187, 0.95801762841234639, 0.95802300758400916, 0.95802836339983799, 0.95803369594643173, 0.95803900140954823, 0.95804427880782528, 0.95804953280767624, 0.95805476373686904, 0.95805997228103668, 0.95806515886633659, 0.95807032380073232, 0.9580754669657231, 0.95808058758663617, 0.95808568653166204, 0.95809076478904298, 0.95809582565327944, 0.95810085922030186, 0.95810587055394747, 0.95811086448445471, 0.95811583865407524, 0.95812079328541899, 0.95812572501538762, 0.95813061874568317, 0.9581354802429457, 0.95814031145917444, 0.95814511370929345, 0.95814988975706794, 0.95815465323965587, 0.95815937953884223, 0.95816407650538249, 0.95816874462089374, 0.95817338525214979, 0.95817799970921946, 0.95818258789202859, 0.95818715060885606, 0.95819168998822646, 0.95819620516419035, 0.95820069611372105, 0.95820516111558651, 0.95820960183151782, 0.95821401948395968, 0.95821841441116828, 0.95822278708438602, 0.95822713747871724, 0.95823146709257778, 0.95823577622811962, 0.95824006490411917, 0.95824433305752699, 0.95824858079500363, 0.95825280838841775, 0.95825701614793501, 0.95826120538870485, 0.95826537503209142, 0.95826952428044465, 0.95827365396634845, 0.95827776442415324, 0.95828185578182756, 0.95828592797100032, 0.95828998079618743, 0.95829401493282251, 0.95829803090893273, 0.95830202816921861, 0.95830600729216053, 0.95830996871122176, 0.95831391122833165, 0.95831783628000988, 0.95832174339242959, 0.95832563140427396, 0.9583295023458015, 0.95833335688464116, 0.95833719391248906, 0.9583410140656391, 0.95834481587618836, 0.95834859932800631, 0.9583523659266866, 0.95835613297971178, 0.95835990310647401, 0.95836365234199128, 0.95836738011596201, 0.95837110359771649, 0.95837480084682602, 0.95837847503126072, 0.95838213100319403, 0.95838577036172024, 0.95838939369917531, 0.95839300073680744, 0.95839659148195344, 0.95840016589996835, 0.95840372451459699, 0.95840726633653262, 0.95841079036418997, 0.95841429492622421, 0.9584177814660314, 0.95842125082352314, 0.95842470344227337, 0.95842814004098009, 0.95843156168428123, 0.95843496611617274, 0.95843836682694095, 0.95844174667687332, 0.95844510624454393, 0.95844844642020655, 0.95845176749842131, 0.95845507561885812, 0.95845836190696909, 0.95846163253713579, 0.95846488711181554, 0.95846812492266842, 0.95847134263593603, 0.9584745406316425, 0.95847772268897113, 0.95848088255865482, 0.95848402581286796, 0.95848715488031, 0.95849026925622161, 0.9584933690047569, 0.95849645367742786, 0.95849952322443366, 0.95850257774201197, 0.9585056172553158, 0.95850864144897185, 0.95851165071385458, 0.95851464458214719, 0.95851762258541229, 0.95852058651313321, 0.95852353530644763, 0.95852646870448965, 0.95852938853888647, 0.95853229559992859, 0.95853518780184044, 0.95853806562085586, 0.95854093029366394, 0.95854378028498743, 0.9585466230646148, 0.95854945104543998, 0.95855226506222846, 0.95855506956639214, 0.95855787306449014, 0.95856064619702808, 0.95856340451422994, 0.95856614900019754, 0.95856887990573125, 0.95857159733347641, 0.95857430149644607, 0.95857699256379614, 0.9585796701401017, 0.95858233476699406, 0.95858498626753141, 0.95858762500383654, 0.95859025111002261, 0.95859286481755668, 0.95859546673548046, 0.95859805674472542, 0.95860063488271774, 0.95860320123536247, 0.95860575699226558, 0.95860830050401336, 0.95861083151549886, 0.95861335062625364, 0.95861585787996051, 0.95861835339446166, 0.95862083809441023, 0.95862331233366527, 0.95862577543078376, 0.95862822829258054, 0.95863067197134055, 0.95863310385899403, 0.95863552482732417, 0.95863794959854864, 0.95864036765396299, 0.95864276623931932, 0.95864516139874101, 0.95864754615601855, 0.95864991976911318, 0.95865228266053815, 0.95865463483577773, 0.95865697678913819, 0.95865930802383592, 0.95866162866690685, 0.95866393934000582, 0.95866624017852586, 0.95866853104601557, 0.95867081196683568, 0.95867308300463716, 0.95867534431074031, 0.95867759778770734, 0.9586798458831215, 0.95868208417936041, 0.95868431323952896, 0.95868653273608284, 0.95868874309739927, 0.95869094454844561, 0.95869313734044026, 0.9586953214765932, 0.95869749705566898, 0.95869966321435229, 0.95870182018914119, 0.95870396821581316, 0.95870610768975095, 0.95870823851888065, 0.95871036073432181, 0.95871247402920745, 0.95871457834266793, 0.95871667533724347, 0.95871876298641834, 0.95872084131500257, 0.95872290982455644, 0.95872497127943623, 0.95872702540869781, 0.95872907110263417, 0.95873110847732279, 0.9587331377261421, 0.95873515887056981, 0.95873717195281538, 0.95873917702892686, 0.95874117413780591, 0.95874316320848851, 0.95874514430351709, 0.95874711743613472, 0.95874908277805049, 0.95875104042148962, 0.95875299037498396, 0.95875493274817947, 0.95875686760173084, 0.95875879501812689, 0.95876071504003002, 0.95876262788507327, 0.95876453336129808, 0.95876643647353943, 0.95876832935338796, 0.95877021568687704, 0.95877209597316349, 0.95877396955447336, 0.95877583612982087, 0.95877769574241611, 0.95877954836655843, 0.95878139402278395, 0.95878323268956378, 0.95878505731164376, 0.95878687285904707, 0.95878868112760396, 0.95879048280626389, 0.95879227768477981, 0.95879406512809173, 0.95879584503246906, 0.95879761748306414, 0.95879938221067151, 0.95880113954829238, 0.95880288972522965, 0.95880463203291422, 0.95880636579084499, 0.95880809210656637, 0.95880981137117871, 0.95881152379202017, 0.95881322946706282, 0.95881492851482286, 0.95881662095782183, 0.95881830539697144, 0.95881998147087655, 0.95882165163771149, 0.95882331771996521, 0.95882497671110933, 0.9588266289505436, 0.95882827503537804, 0.95882991486177749, 0.95883154846625884, 0.95883317557501169, 0.95883479634303215, 0.95883641092800709, 0.95883801941409474, 0.95883962209242812, 0.95884121887071505, 0.95884280966684354, 0.9588443946919174, 0.9588459843653675, 0.95884756846342956, 0.95884914534329269, 0.95885071622401052, 0.95885228120133026, 0.95885384055339296, 0.95885539430878974, 0.95885694256572129, 0.95885848522246042, 0.95886002247088786, 0.95886155327068134, 0.95886307781301272, 0.95886459667252211, 0.9588661141067677, 0.95886762085036403, 0.95886912202858965, 0.95887061782187055, 0.95887210821589963, 0.95887359338204303, 0.95887507343072764, 0.95887654806047096, 0.95887801634847558, 0.958879479396611, 0.95888093730016544, 0.95888239011129572, 0.95888383787924558, 0.95888528066912304, 0.95888671854293428, 0.95888815147896533, 0.95888957956125809, 0.95889100287642492, 0.95889242159716326, 0.95889383581033316, 0.95889524542863103, 0.95889665048235906, 0.958898051312564, 0.95889945259953902, 0.9589008553588434, 0.95890225583499966, 0.95890365133878142, 0.95890504164040047, 0.95890642675965532, 0.95890780719649582, 0.9589091837448338, 0.95891055974231409, 0.95891193115290951, 0.95891329792113855, 0.95891466010314663, 0.95891601792273584, 0.95891736842005082, 0.958918715081023, 0.95892005785744616, 0.95892139640400842, 0.9589227304210971, 0.95892405995946273, 0.95892538502624458, 0.95892670565298033, 0.95892802192573601, 0.95892933311292805, 0.95893063798869771, 0.95893193915755826, 0.9589332364689257, 0.95893452990315065, 0.95893581944934636, 0.95893710507025343, 0.95893838672945864, 0.95893966445069323, 0.9589409381887295, 0.95894220793631846, 0.95894347384173273, 0.95894473597231455, 0.95894599424494387, 0.9589472486661097, 0.95894849925845949, 0.95894974596435756, 0.95895098754489316, 0.95895222831177129, 0.95895346555988292, 0.95895469920912135, 0.95895592929849793, 0.95895715586665897, 0.95895837730568734, 0.95895959433499744, 0.95896080777437531, 0.95896201779505219, 0.9589632244256262, 0.95896442767677204, 0.95896562753798986, 0.95896682401729449, 0.95896801719822211, 0.95896920718773115, 0.95897039354919056, 0.95897157644943576, 0.95897276385570196, 0.9589739560017102, 0.95897514455261523, 0.95897632935385646, 0.95897751043797275, 0.95897868794869678, 0.95897986193142781, 0.95898103240322352, 0.95898219938519358, 0.95898336299843734, 0.95898452349023044, 0.95898568078402524, 0.95898683470385271, 0.9589879854065374, 0.95898913292171817, 0.95899027727444242, 0.95899141847528857, 0.9589925566296269, 0.95899369170680027, 0.9589948237549194, 0.95899595281725036, 0.95899707888636565, 0.95899820200845665, 0.95899932222693185, 0.95900043957528702, 0.95900155401674836, 0.9590026656827858, 0.95900377466624986, 0.95900488087774538, 0.95900598411065163, 0.95900708464967166, 0.95900818235289509, 0.9590092771710611, 0.95901036914933047, 0.95901145835128543, 0.95901254482381437, 0.95901363060282185, 0.95901471415077499, 0.95901579509209678, 0.95901687320474527, 0.95901794840866494, 0.959019020693472, 0.95902009014612521, 0.95902115681917477, 0.95902222079128796, 0.95902328207814092, 0.95902434067577835, 0.95902539661166986, 0.95902645007800513, 0.95902750117506474, 0.95902854791371406, 0.95902959048136693, 0.95903063023762714, 0.95903166751295299, 0.95903270182622424, 0.95903373312530771, 0.95903476168991841, 0.95903578771929365, 0.95903681117845974, 0.95903783199163428, 0.95903885022162905, 0.95903986587758416, 0.95904087901070967, 0.95904188992412265, 0.95904289835764922, 0.95904390440717513, 0.9590449082975353, 0.95904590992933436, 0.95904690908965085, 0.95904790581783939, 0.9590489003292102, 0.95904989263628271, 0.95905088245747783, 0.95905186950788701, 0.95905285425129894, 0.95905383681468115, 0.95905481723999397, 0.95905579553677933, 0.95905677172349912, 0.95905774581380354, 0.95905871783321817, 0.95905968771291827, 0.95906065546040331, 0.95906162112418614, 0.95906258462122018, 0.95906354599302635, 0.95906450532370791, 0.95906546268890047, 0.95906641816047633, 0.95906737174111589, 0.9590683234430406, 0.95906927329642855, 0.95907022152577726, 0.95907116813486282, 0.95907211276080084, 0.95907305558144562, 0.95907399660488146, 0.95907493583401138, 0.95907587327538046, 0.95907680890498193, 0.95907774275741042, 0.95907867487387455, 0.95907960524970604, 0.95908053388480319, 0.95908146076282241, 0.95908238590666184, 0.95908330932876029, 0.95908423107794816, 0.95908515116153314, 0.95908606957879106, 0.95908698631818734, 0.95908790138552558, 0.95908881478437136, 0.95908972646867285, 0.95909063656019455, 0.95909154503924154, 0.9590924528141872, 0.95909336558350511, 0.95909427575127848, 0.95909518401681937, 0.95909609053365075, 0.9590969953404358, 0.95909789844061732, 0.95909879983192536, 0.95909969951793461, 0.95910059750638887, 0.95910149381152909, 0.95910238846769824, 0.95910328146569734, 0.95910417281745874, 0.95910506253420547, 0.95910595062086534, 0.95910683705168887, 0.95910772180396753, 0.9591086048881069, 0.95910948632708981, 0.95911036613350054, 0.95911124432430594, 0.95911212095382825, 0.95911299600407995, 0.95911386954851008, 0.95911474161946852, 0.95911561211360552, 0.95911648100605595, 0.95911734831217244, 0.95911821406089959, 0.959119078271368, 0.95911994094944153, 0.95912080209209893, 0.95912166173289604, 0.95912251989202746, 0.95912337660448077, 0.9591242318963783, 0.95912508577374811, 0.95912593826378301, 0.95912678959269049, 0.95912763952409874, 0.95912848803295669, 0.95912933514786602, 0.95913018089501323, 0.9591310252730102, 0.95913186828232255, 0.95913270994690658, 0.95913355029535141, 0.95913438921326422, 0.95913522684478447, 0.95913606322409128, 0.95913689844460215, 0.95913773263855007, 0.95913856564597122, 0.95913939746499388, 0.95914022812223576, 0.95914105761199797, 0.95914188594930416, 0.95914271315919208, 0.95914353925824525, 0.95914436425024885, 0.95914518814119576, 0.95914601095059282, 0.95914683267525636, 0.95914765329080964, 0.95914847270655312, 0.95914929104529456, 0.95915010823535707, 0.95915092425782655, 0.95915173912262297, 0.95915255264309773, 0.95915336444580479, 0.95915417499886413, 0.95915498415493117, 0.95915579195197387, 0.95915659844522028, 0.95915740364861557, 0.95915820759920023, 0.95915901022661965, 0.95915981149086715, 0.95916061153372956, 0.95916141030624469, 0.95916221253875145, 0.95916301824173933, 0.95916382235224551, 0.95916462493553412, 0.95916542602563148, 0.95916622569225918, 0.95916702399413634, 0.95916782102104714, 0.9591686165895118, 0.95916941035077774, 0.9591702024266231, 0.95917099292126939, 0.95917178192197583, 0.95917256948938268, 0.95917335566962558, 0.95917414050252503, 0.95917492400900162, 0.95917570620292969, 0.95917648709450098, 0.95917726669513159, 0.95917804502419379, 0.95917882209303773, 0.95917959788531559, 0.95918037238524734, 0.95918114560667234, 0.95918191756296212, 0.95918268824219444, 0.95918345764194957, 0.95918422580403406, 0.95918499284967518, 0.95918575898442326, 0.95918652394775195, 0.95918728737876635, 0.95918804930243529, 0.95918880979907273, 0.95918956892777307, 0.9591903267039027, 0.95919108162096633, 0.9591918375376246, 0.95919259215463293, 0.95919334539760692, 0.95919409729551131, 0.95919484786871434, 0.95919559713058555, 0.95919634478710691, 0.95919709089784488, 0.9591978354346764, 0.95919857857065527, 0.95919932041311462, 0.9592000605647597, 0.95920079971750227, 0.95920153758409876, 0.95920227408347736, 0.95920300922345214, 0.95920374303254397, 0.95920447555639932, 0.95920520678470789, 0.95920593628474027, 0.95920666085121487, 0.95920738429556107, 0.95920810613560437, 0.95920882634253291, 0.95920954495914423, 0.959210261991298, 0.9592109775622284, 0.95921169167180653, 0.95921240434804755, 0.9592131156196616, 0.95921382551335166, 0.9592145341824666, 0.9592152417304326, 0.95921594737565219, 0.95921665139878864, 0.95921735388667473, 0.95921805484824829, 0.95921875428438474, 0.95921945220922666, 0.95922014864228011, 0.9592208435967029, 0.95922153712290981, 0.95922222927737888, 0.95922292008272358, 0.95922360956877484, 0.95922429774498885, 0.95922498641735432, 0.95922567532734371, 0.95922636281029805, 0.95922704903613343, 0.95922773405027173, 0.95922841781956114, 0.95922910014347429, 0.95922978125466773, 0.95923046128971834, 0.95923114004824739, 0.95923181761895004, 0.95923249391074572, 0.95923316895038846, 0.95923384307735404, 0.95923451662077386, 0.9592351890828319, 0.95923586039321662, 0.95923653051246105, 0.95923719942677155, 0.9592378671709032, 0.95923853376547541, 0.95923919921916123, 0.95923986355433422, 0.95924052680544014, 0.95924118898677513, 0.95924185009188068, 0.95924251012867934, 0.95924316910495344, 0.95924382702700151, 0.95924448386116179]}
@@ -47,5 +49,5 @@ icm_all_performances = {'R^2': [-134.4795537271895, -1.552667222593644, 0.727541
 
 # Plot the MSE values
 plt.figure()
-plt.plot(NMF.all_performances['MSE'])
+plt.plot(performances_sink.values['MSE'])
 plt.ylim(0,10)
\ No newline at end of file
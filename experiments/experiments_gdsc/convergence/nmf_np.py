@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmf_np import NMF
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import matplotlib.pyplot as plt
@@ -31,10 +32,11 @@ expo_prior = 1/10.
 # Run the VB algorithm
 nmf = NMF(R,M,K) 
 nmf.initialise(init_UV,expo_prior)
-nmf.run(iterations)
+performances_sink = MemorySink()
+nmf.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Extract the performances across all iterations
-print "np_all_performances = %s" % nmf.all_performances
+print "np_all_performances = %s" % performances_sink.values
 
 '''
 np_all_performances = {'R^2': [-22.1643872605705, -2.0902469601019193, -1.3562010888546325, -1.0391397997295644, -0.8096028382667757, -0.6295226891673975, -0.48390373019903743, -0.3636574230231868, -0.2626526483494671, -0.17658655891385333, -0.1023543530204627, -0.037661047266266845, 0.019226390251019465, 0.06964158065110382, 0.11462802731410404, 0.15501435474586744, 0.19146723675532906, 0.22452936834612958, 0.2546471955437051, 0.2821914931862083, 0.3074728587674941, 0.33075353334556556, 0.35225652937643737, 0.37217275703652897, 0.390666644435382, 0.4078806114893616, 0.42393866204633224, 0.43894929113647874, 0.45300785543272526, 0.4661985194312872, 0.47859586363992335, 0.4902662215325877, 0.5012687973440347, 0.5116566056370462, 0.5214772650493771, 0.5307736720529055, 0.5395845754479721, 0.5479450683179126, 0.5558870110185085, 0.5634393962803982, 0.5706286655103019, 0.5774789837800192, 0.5840124797036692, 0.5902494553597422, 0.5962085705643485, 0.601907005106219, 0.6073606019824858, 0.6125839942022553, 0.617590717334596, 0.6223933096518781, 0.6270034014486761, 0.631431794888718, 0.6356885355415577, 0.6397829766093587, 0.6437238367081624, 0.647519251951996, 0.6511768229900194, 0.6547036575626973, 0.6581064090712583, 0.6613913115925816, 0.6645642117188524, 0.6676305975552885, 0.6705956251694527, 0.6734641427513829, 0.6762407127137899, 0.6789296319353968, 0.6815349503277726, 0.6840604878861085, 0.6865098503667983, 0.6888864437192979, 0.691193487386438, 0.6934340265750615, 0.6956109435886286, 0.6977269683040107, 0.699784687866312, 0.7017865556684562, 0.7037348996755477, 0.7056319301483567, 0.7074797468150746, 0.7092803455357939, 0.7110356245002394, 0.7127473899954351, 0.7144173617766598, 0.7160471780723742, 0.7176384002506637, 0.7191925171728917, 0.720710949257704, 0.7221950522766494, 0.7236461209012549, 0.7250653920192275, 0.7264540478365984, 0.7278132187809356, 0.7291439862196942, 0.7304473850067735, 0.731724405869115, 0.7329759976446115, 0.734203069381548, 0.7354064923089683, 0.7365871016869847, 0.7377456985451034, 0.7388830513161552, 0.7399998973729517, 0.741096944474208, 0.7421748721257824, 0.7432343328629749, 0.7442759534591369, 0.7453003360654686, 0.7463080592866334, 0.7472996791963888, 0.7482757302972861, 0.7492367264279887, 0.7501831616217902, 0.7511155109194811, 0.7520342311394858, 0.7529397616081681, 0.7538325248528109, 0.7547129272596819, 0.755581359699477, 0.7564381981222552, 0.7572838041236682, 0.75811852548451, 0.75894269668512, 0.7597566393962825, 0.7605606629480859, 0.7613550647780791, 0.762140130860063, 0.7629161361145826, 0.7636833448023852, 0.764442010901729, 0.7651923784705794, 0.7659346819945412, 0.7666691467214164, 0.7673959889830535, 0.7681154165053414, 0.7688276287069098, 0.7695328169871907, 0.7702311650044457, 0.770922848944288, 0.7716080377791669, 0.772286893519343, 0.7729595714557043, 0.7736262203949473, 0.7742869828873792, 0.7749419954477794, 0.7755913887695659, 0.7762352879326913, 0.7768738126053827, 0.7775070772401615, 0.7781351912642546, 0.7787582592646958, 0.7793763811682828, 0.7799896524166424, 0.7805981641364955, 0.7812020033054113, 0.7818012529130485, 0.7823959921182015, 0.7829862964016367, 0.7835722377149312, 0.7841538846253789, 0.7847313024570992, 0.7853045534284345, 0.7858736967857101, 0.7864387889334666, 0.7869998835611938, 0.787557031766723, 0.7881102821762191, 0.7886596810609524, 0.7892052724508176, 0.7897470982446774, 0.7902851983176222, 0.7908196106251035, 0.7913503713040504, 0.7918775147709864, 0.7924010738171676, 0.7929210797008057, 0.7934375622363542, 0.7939505498809916, 0.7944600698181858, 0.7949661480385294, 0.79546880941771, 0.795968077791821, 0.796463976029877, 0.7969565261036665, 0.7974457491549766, 0.7979316655600843, 0.7984142949917814, 0.7988936564787191, 0.7993697684622784, 0.7998426488509376, 0.8003123150721461, 0.8007787841217776, 0.8012420726112444, 0.8017021968121849, 0.8021591726989137, 0.8026130159885694, 0.8030637421790485, 0.8035113665847793, 0.8039559043703695, 0.804397370582159, 0.8048357801777571, 0.8052711480536313, 0.8057034890707085, 0.8061328180781889, 0.8065591499354638, 0.8069824995323619, 0.8074028818075916, 0.8078203117656462, 0.8082348044920247, 0.8086463751670071, 0.8090550390778772, 0.8094608116297983, 0.8098637083553022, 0.8102637449224942, 0.8106609371419963, 0.8110553009727506, 0.8114468525266711, 0.8118356080722374, 0.8122215840370872, 0.8126047970096438, 0.8129852637398604, 0.8133630011391024, 0.8137380262792747, 0.8141103563911465, 0.8144800088620543, 0.8148470012329494, 0.8152113511948018, 0.8155730765845348, 0.8159321953804319, 0.8162887256970722, 0.8166426857798699, 0.8169940939992488, 0.8173429688444682, 0.8176893289171858, 0.8180331929247103, 0.8183745796730889, 0.8187135080599791, 0.8190499970673533, 0.8193840657540827, 0.8197157332484475, 0.8200450187405285, 0.8203719414745838, 0.8206965207414014, 0.8210187758706337, 0.8213387262231681, 0.8216563911835212, 0.8219717901523255, 0.8222849425388388, 0.8225958677535965, 0.8229045852011384, 0.8232111142728492, 0.8235154743399631, 0.8238176847466739, 0.8241177648034179, 0.8244157337803063, 0.8247116109007363, 0.8250054153351526, 0.8252971661950375, 0.8255868825270262, 0.8258745833072618, 0.8261602874359206, 0.8264440137319415, 0.8267257809279482, 0.8270056076653804, 0.8272835124898152, 0.8275595138465144, 0.8278336300761313, 0.8281058794106645, 0.8283762799695804, 0.8286448497561556, 0.8289116066539843, 0.8291765684237229, 0.8294397526999873, 0.8297011769884707, 0.8299608586632143, 0.8302188149640932, 0.830475062994449, 0.83072961971894, 0.8309825019614938, 0.831233726403505, 0.83148330958215, 0.8317312678888507, 0.831977617567926, 0.8322223747153674, 0.8324655552777667, 0.8327071750513872, 0.8329472496813577, 0.8331857946610075, 0.8334228253313234, 0.8336583568805285, 0.8338924043437757, 0.8341249826029495, 0.8343561063865836, 0.8345857902698746, 0.8348140486747861, 0.8350408958702631, 0.835266345972528, 0.8354904129454483, 0.8357131106010041, 0.8359344525998262, 0.8361544524517993, 0.8363731235167402, 0.836590479005136, 0.8368065319789495, 0.837021295352486, 0.8372347818932804, 0.8374470042230798, 0.8376579748188575, 0.8378677060138479, 0.8380762099986458, 0.8382834988223384, 0.8384895843936748, 0.838694478482245, 0.8388981927197294, 0.8391007386011274, 0.8393021274860424, 0.8395023705999748, 0.8397014790356443, 0.839899463754304, 0.8400963355871148, 0.8402921052364762, 0.8404867832774111, 0.8406803801589451, 0.8408729062054836, 0.8410643716182122, 0.8412547864764881, 0.8414441607392379, 0.8416325042463522, 0.8418198267200957, 0.8420061377664889, 0.842191446876717, 0.8423757634285023, 0.8425590966875127, 0.8427414558087193, 0.8429228498377828, 0.8431032877124127, 0.8432827782637237, 0.8434613302175795, 0.8436389521959512, 0.8438156527182072, 0.8439914402024609, 0.8441663229668646, 0.8443403092309002, 0.844513407116656, 0.8446856246501002, 0.8448569697623345, 0.8450274502908232, 0.8451970739806339, 0.845365848485643, 0.8455337813697283, 0.8457008801079628, 0.8458671520877672, 0.8460326046100899, 0.8461972448905161, 0.846361080060408, 0.8465241171680201, 0.8466863631795715, 0.8468478249803455, 0.84700850937574, 0.847168423092331, 0.8473275727788834, 0.8474859650073956, 0.8476436062740847, 0.8478005030003866, 0.84795666153393, 0.8481120881494848, 0.8482667890499311, 0.8484207703671693, 0.8485740381630464, 0.8487265984302689, 0.8488784570932708, 0.8490296200091194, 0.8491800929683452, 0.8493298816958312, 0.8494789918516061, 0.8496274290317057, 0.849775198768964, 0.8499223065338198, 0.8500687577351045, 0.8502145577208042, 0.8503597117788401, 0.8505042251378125, 0.8506481029677377, 0.8507913503807792, 0.8509339724319682, 0.8510759741199041, 0.8512173603874559, 0.8513581361224459, 0.8514983061583279, 0.8516378752748439, 0.8517768481986951, 0.8519152296041725, 0.8520530241138048, 0.8521902362989794, 0.8523268706805672, 0.8524629317295207, 0.8525984238674886, 0.8527333514673983, 0.8528677188540508, 0.8530015303046791, 0.8531347900495347, 0.8532675022724379, 0.8533996711113336, 0.8535313006588395, 0.8536623949627734, 0.8537929580266977, 0.8539229938104331, 0.8540525062305803, 0.8541814991610276, 0.8543099764334676, 0.8544379418378691, 0.8545653991229885, 0.8546923519968518, 0.8548188041272324, 0.8549447591421168, 0.8550702206301847, 0.855195192141261, 0.855319677186775, 0.855443679240215, 0.8555672017375664, 0.8556902480777596, 0.8558128216231055, 0.8559349256997114, 0.8560565635979265, 0.856177738572751, 0.8562984538442512, 0.8564187125979773, 0.8565385179853631, 0.8566578731241339, 0.856776781098699, 0.8568952449605526, 0.8570132677286544, 0.8571308523898153, 0.8572480018990907, 0.8573647191801408, 0.8574810071256125, 0.8575968685975094, 0.8577123064275531, 0.8578273234175446, 0.8579419223397221, 0.858056105937123, 0.8581698769239138, 0.8582832379857623, 0.8583961917801619, 0.8585087409367801, 0.858620888057789, 0.858732635718201, 0.8588439864662019, 0.8589549428234751, 0.8590655072855099, 0.8591756823219422, 0.8592854703768572, 0.8593948738691154, 0.8595038951926375, 0.8596125367167381, 0.8597208007864132, 0.8598286897226465, 0.859936205822704, 0.860043351360428, 0.8601501285865336, 0.8602565397288867, 0.8603625869928001, 0.8604682725613058, 0.8605735985954434, 0.8606785672345301, 0.8607831805964373, 0.860887440777864, 0.8609913498545936, 0.8610949098817724, 0.8611981228941613, 0.8613009909064069, 0.8614035159132799, 0.8615056998899494, 0.8616075447922247, 0.8617090525567911, 0.8618102251014854, 0.8619110643255072, 0.8620115721096866, 0.8621117503166927, 0.8622116007912979, 0.8623111253605975, 0.8624103258342233, 0.8625092040046067, 0.8626077616471719, 0.8627060005205683, 0.8628039223668978, 0.862901528911917, 0.8629988218652661, 0.8630958029206663, 0.8631924737561459, 0.8632888360342276, 0.8633848914021531, 0.8634806414920709, 0.8635760879212362, 0.863671232292222, 0.8637660761930909, 0.8638606211976172, 0.8639548688654421, 0.8640488207422883, 0.8641424783601305, 0.864235843237393, 0.864328916879109, 0.8644217007771228, 0.864514196410239, 0.864606405244422, 0.8646983287329503, 0.8647899683165945, 0.8648813254237772, 0.8649724014707418, 0.8650631978617173, 0.8651537159890692, 0.8652439572334719, 0.8653339229640502, 0.8654236145385429, 0.865513033303452, 0.8656021805941887, 0.8656910577352248, 0.8657796660402399, 0.8658680068122543, 0.8659560813437864, 0.8660438909169759, 0.86613143680374, 0.8662187202658805, 0.8663057425552536, 0.8663925049138637, 0.8664790085740239, 0.8665652547584681, 0.8666512446804734, 0.8667369795440001, 0.8668224605437918, 0.8669076888655154, 0.8669926656858721, 0.8670773921727074, 0.8671618694851344, 0.867246098773642, 0.867330081180213, 0.8674138178384241, 0.8674973098735582, 0.867580558402711, 0.8676635645348959, 0.8677463293711435, 0.867828854004609, 0.8679111395206602, 0.8679931869969904, 0.8680749975037054, 0.8681565721034157, 0.8682379118513373, 0.8683190177953773, 0.8683998909762369, 0.8684805324274734, 0.8685609431756192, 0.8686411242402423, 0.8687210766340477, 0.86880080136295, 0.8688802994261587, 0.8689595718162584, 0.8690386195192912, 0.869117443514825, 0.8691960447760383, 0.869274424269789, 0.8693525829566933, 0.8694305217911937, 0.8695082417216362, 0.8695857436903311, 0.8696630286336317, 0.8697400974819901, 0.8698169511600315, 0.8698935905866275, 0.8699700166749331, 0.8700462303324802, 0.8701222324612229, 0.8701980239575957, 0.8702736057125897, 0.8703489786117844, 0.8704241435354366, 0.8704991013585117, 0.870573852950754, 0.8706483991767264, 0.8707227408958863, 0.870796878962618, 0.870870814226286, 0.8709445475313041, 0.871018079717163, 0.8710914116184905, 0.8711645440650994, 0.8712374778820293, 0.8713102138896014, 0.8713827529034536, 0.8714550957345906, 0.8715272431894369, 0.8715991960698568, 0.8716709551732238, 0.8717425212924365, 0.8718138952159814, 0.8718850777279661, 0.8719560696081397, 0.8720268716319614, 0.8720974845706255, 0.8721679091910906, 0.8722381462561263, 0.8723081965243502, 0.8723780607502574, 0.872447739684252, 0.8725172340726954, 0.87258654465793, 0.8726556721783034, 0.8727246173682213, 0.8727933809581649, 0.8728619636747217, 0.8729303662406301, 0.8729985893747905, 0.8730666337923068, 0.8731345002045168, 0.8732021893190102, 0.873269701839668, 0.8733370384666866, 0.8734041998965996, 0.873471186822315, 0.8735379999331343, 0.8736046399147746, 0.873671107449403, 0.8737374032156617, 0.8738035278886829, 0.8738694821401238, 0.8739352666381832, 0.8740008820476279, 0.8740663290298164, 0.87413160824272, 0.8741967203409474, 0.8742616659757603, 0.8743264457951155, 0.8743910604436513, 0.8744555105627436, 0.8745197967905033, 0.8745839197618106, 0.8746478801083236, 0.8747116784585117, 0.8747753154376674, 0.8748387916679162, 0.8749021077682608, 0.8749652643545757, 0.8750282620396344, 0.875091101433137, 0.87515378314171, 0.875216307768939, 0.8752786759153832, 0.8753408881785883, 0.8754029451531071, 0.8754648474305148, 0.8755265955994349, 0.8755881902455376, 0.8756496319515692, 0.8757109212973717, 0.8757720588598877, 0.8758330452131877, 0.8758938809284678, 0.8759545665740908, 0.8760151027155844, 0.8760754899156533, 0.8761357287342096, 0.8761958197283797, 0.8762557634525092, 0.8763155604582021, 0.8763752112943082, 0.8764347165069574, 0.8764940766395622, 0.8765532922328372, 0.8766123638248186, 0.8766712919508624, 0.8767300771436717, 0.8767887199333125, 0.8768472208472096, 0.8769055804101825, 0.8769637991444437, 0.8770218775696123, 0.8770798162027451, 0.8771376155583188, 0.877195276148278, 0.877252798482017, 0.877310183066415, 0.8773674304058356, 0.8774245410021467, 0.8774815153547354, 0.8775383539605071, 0.8775950573139123, 0.8776516259069563, 0.8777080602292086, 0.8777643607678104, 0.8778205280074984, 0.877876562430614, 0.8779324645171027, 0.8779882347445441, 0.8780438735881586, 0.8780993815208072, 0.8781547590130276, 0.8782100065330127, 0.8782651245466621, 0.8783201135175617, 0.878374973907011, 0.8784297061740283, 0.8784843107753684, 0.8785387881655332, 0.8785931387967776, 0.878647363119127, 0.878701461580384, 0.8787554346261498, 0.8788092826998217, 0.878863006242613, 0.8789166056935642, 0.8789700814895527, 0.8790234340653081, 0.879076663853412, 0.8791297712843258, 0.8791827567863857, 0.8792356207858288, 0.879288363706793, 0.8793409859713301, 0.8793934879994255, 0.8794458702089964, 0.8794981330159162, 0.87955027683401, 0.8796023020750812, 0.8796542091489156, 0.8797059984632848, 0.8797576704239697, 0.8798092254347692, 0.8798606638975008, 0.8799119862120245, 0.8799631927762455, 0.8800142839861226, 0.8800652602356931, 0.880116121917063, 0.880166869420438, 0.8802175031341152, 0.8802680234445088, 0.8803184307361539, 0.8803687253917201, 0.8804189077920148, 0.8804689783159974, 0.8805189373407989, 0.880568785241717, 0.8806185223922365, 0.8806681491640361, 0.8807176659270032, 0.8807670730492279, 0.8808163708970402, 0.8808655598349997, 0.8809146402259118, 0.8809636124308345, 0.8810124768090938, 0.8810612337182882, 0.8811098835143113, 0.8811584265513455, 0.8812068631818725, 0.8812551937567012, 0.8813034186249601, 0.8813515381341078, 0.8813995526299566, 0.8814474624566667, 0.8814952679567641, 0.8815429694711486, 0.8815905673391012, 0.8816380618983004, 0.8816854534848201, 0.8817327424331501, 0.8817799290761975, 0.881827013745305, 0.8818739967702545, 0.8819208784792668, 0.8819676591990329, 0.8820143392547031, 0.8820609189699102, 0.8821073986667666, 0.8821537786658793, 0.8822000592863649, 0.8822462408458465, 0.8822923236604708, 0.8823383080449142, 0.8823841943123863, 0.882429982774655, 0.8824756737420398, 0.8825212675234172, 0.8825667644262519, 0.8826121647565776, 0.8826574688190273, 0.8827026769168259, 0.882747789351812, 0.8827928064244388, 0.8828377284337777, 0.8828825556775405, 0.8829272884520731, 0.8829719270523725, 0.8830164717720931, 0.8830609229035606, 0.8831052807377548, 0.8831495455643569, 0.8831937176717235, 0.8832377973469141, 0.8832817848756893, 0.883325680542528, 0.8833694846306146, 0.8834131974218771, 0.8834568191969716, 0.8835003502352953, 0.8835437908149988, 0.8835871412129859, 0.8836304017049308, 0.8836735725652739, 0.8837166540672459, 0.8837596464828463, 0.883802550082888, 0.8838453651369711, 0.8838880919135131, 0.8839307306797409, 0.8839732817017052, 0.8840157452442882, 0.8840581215712064, 0.8841004109450195, 0.8841426136271378, 0.8841847298778264, 0.8842267599562168, 0.8842687041203096, 0.8843105626269772, 0.8843523357319841, 0.8843940236899771, 0.8844356267545019, 0.8844771451780038, 0.8845185792118471, 0.8845599291062975, 0.8846011951105537, 0.8846423774727368, 0.8846834764399006, 0.8847244922580418, 0.8847654251721073, 0.8848062754259891, 0.8848470432625386, 0.8848877289235806, 0.8849283326498977, 0.8849688546812542, 0.8850092952563999, 0.8850496546130685, 0.885089932987986, 0.8851301306168858, 0.8851702477344934, 0.8852102845745586, 0.8852502413698391, 0.8852901183521156, 0.8853299157521998, 0.8853696337999266, 0.8854092727241855, 0.8854488327528978, 0.8854883141130336, 0.8855277170306242, 0.8855670417307522, 0.8856062884375753, 0.8856454573743119, 0.8856845487632614, 0.8857235628258019, 0.8857624997823959, 0.8858013598525999, 0.8858401432550622, 0.8858788502075359, 0.8859174809268766, 0.8859560356290476, 0.8859945145291371, 0.8860329178413417, 0.8860712457789952, 0.886109498554552, 0.8861476763796033, 0.8861857794648874, 0.8862238080202721, 0.8862617622547873, 0.8862996423766067, 0.8863374485930712, 0.8863751811106739, 0.8864128401350889, 0.8864504258711443, 0.8864879385228579, 0.8865253782934244, 0.8865627453852214, 0.886600039999816, 0.8866372623379716, 0.8866744125996464, 0.8867114909840061, 0.886748497689414, 0.8867854329134532, 0.8868222968529187, 0.8868590897038205, 0.8868958116614002, 0.8869324629201232, 0.8869690436736812, 0.8870055541150108, 0.8870419944362782, 0.8870783648289076, 0.8871146654835552, 0.8871508965901428, 0.8871870583378381, 0.8872231509150704, 0.887259174509538, 0.8872951293082031, 0.8873310154972973, 0.8873668332623305, 0.8874025827880906, 0.8874382642586495, 0.8874738778573615, 0.8875094237668778, 0.8875449021691368, 0.8875803132453802, 0.8876156571761489, 0.8876509341412882, 0.887686144319954, 0.8877212878906129, 0.8877563650310479, 0.8877913759183629, 0.88782632072898, 0.8878611996386557, 0.8878960128224698, 0.8879307604548423, 0.8879654427095216, 0.8880000597596028, 0.8880346117775242, 0.888069098935074, 0.8881035214033802, 0.8881378793529355, 0.8881721729535891, 0.8882064023745478, 0.8882405677843827, 0.8882746693510334, 0.8883087072418111, 0.8883426816233971, 0.888376592661856, 0.8884104405226241, 0.8884442253705324, 0.8884779473697861, 0.8885116066839902, 0.8885452034761343, 0.8885787379086167, 0.8886122101432208, 0.8886456203411417, 0.8886789686629736, 0.8887122552687258, 0.8887454803178116, 0.8887786439690656, 0.8888117463807359, 0.8888447877104905, 0.8888777681154275, 0.8889106877520604, 0.8889435467763409, 0.8889763453436483, 0.8890090836088002, 0.8890417617260493, 0.8890743798490931, 0.8891069381310699, 0.8891394367245586, 0.889171875781602, 0.8892042554536805, 0.8892365758917387, 0.8892688372461786, 0.8893010396668538, 0.8893331833030911, 0.8893652683036786, 0.8893972948168742, 0.889429262990406, 0.8894611729714775, 0.8894930249067711, 0.8895248189424381, 0.889556555224124, 0.8895882338969571, 0.8896198551055433, 0.8896514189939883, 0.8896829257058871, 0.8897143753843293, 0.8897457681718985, 0.8897771042106811, 0.8898083836422703, 0.8898396066077574, 0.8898707732477431, 0.8899018837023381, 0.8899329381111691, 0.8899639366133715, 0.8899948793476034, 0.8900257664520337, 0.890056598064366, 0.8900873743218194, 0.8901180953611398, 0.8901487613186064, 0.890179372330027, 0.8902099285307453, 0.8902404300556398, 0.890270877039125, 0.8903012696151601, 0.8903316079172466, 0.8903618920784268, 0.8903921222312949, 0.8904222985079944, 0.8904524210402208, 0.8904824899592216, 0.8905125053958011, 0.8905424674803273, 0.8905723763427157, 0.8906022321124603], 'MSE': [270.92401563963733, 36.142640266340237, 27.557450731000319, 23.849193021120882, 21.164594691897136, 19.058429025515224, 17.355311534290891, 15.948945285986492, 14.767622471548837, 13.761018226074727, 12.892819681291357, 12.136185370926354, 11.470846251947536, 10.881204675039649, 10.355056124585904, 9.8827092465238628, 9.4563668155953433, 9.0696816270156919, 8.7174321763860689, 8.3952819877651663, 8.0995984021348093, 7.8273143234522378, 7.5758214621287188, 7.3428869876110294, 7.1265877959888471, 6.9252581848537886, 6.7374478408416225, 6.5618878372622538, 6.3974629098759657, 6.2431886949250464, 6.0981929202262002, 5.9616997685332036, 5.8330168041324715, 5.7115239839348142, 5.5966643740392943, 5.4879362696398539, 5.3848864759046426, 5.2871045542171933, 5.1942178750133881, 5.1058873476485829, 5.0218037210293973, 4.9416843674214368, 4.865270476914028, 4.7923246022322408, 4.7226285035299362, 4.6559812509358194, 4.5921975493089287, 4.5311062551804806, 4.4725490604249556, 4.4163793210123838, 4.3624610123601268, 4.3106677954659087, 4.2608821802354626, 4.2129947743045202, 4.1669036072457111, 4.122513521407801, 4.0797356217827474, 4.0384867782809382, 3.9986891746338791, 3.9602698988701501, 3.9231605709279429, 3.8872970035059855, 3.85261889271999, 3.8190695355327064, 3.7865955712763704, 3.7551467448924165, 3.7246756897791351, 3.6951377283706859, 3.6664906887766326, 3.6386947359910553, 3.6117122163359165, 3.5855075139472161, 3.5600469182320951, 3.5352985013352733, 3.5112320047511911, 3.4878187343013489, 3.4650314627749776, 3.4428443395973654, 3.4212328069510769, 3.4001735218301103, 3.3796442835530067, 3.3596239663058851, 3.3400924563252863, 3.3210305933619848, 3.3024201161036095, 3.2842436112555742, 3.2664844660096461, 3.2491268236514563, 3.2321555420749308, 3.215556154996948, 3.199314835675549, 3.1834183629547996, 3.1678540894717417, 3.1526099118726041, 3.1376742428998248, 3.1230359852181193, 3.1086845068600186, 3.0946096181810305, 3.0808015502189439, 3.0672509343628853, 3.053948783243321, 3.0408864727597775, 3.0280557251697426, 3.0154485931679993, 3.0030574448892224, 2.9908749497724401, 2.9788940652302802, 2.9671080240688981, 2.9555103226094488, 2.9440947094637178, 2.932855174922381, 2.9217859409140265, 2.9108814514981045, 2.9001363638576181, 2.8895455397576835, 2.8791040374406416, 2.8688071039295067, 2.8586501677129585, 2.8486288317871624, 2.8387388670333031, 2.8289762059071726, 2.8193369364228507, 2.809817296411302, 2.8004136680367138, 2.7911225725550062, 2.7819406652987921, 2.7728647308763974, 2.7638916785700722, 2.7550185379231027, 2.7462424545036743, 2.7375606858355481, 2.7289705974851688, 2.7204696592974149, 2.7120554417699902, 2.7037256125599218, 2.6954779331144612, 2.6873102554193657, 2.6792205188583429, 2.6712067471781911, 2.6632670455534648, 2.6553995977465732, 2.6476026633571594, 2.6398745751578043, 2.6322137365108831, 2.6246186188637424, 2.6170877593172066, 2.6096197582660836, 2.6022132771065802, 2.5948670360093029, 2.5875798117543622, 2.5803504356266509, 2.5731777913683356, 2.5660608131874794, 2.5589984838194315, 2.551989832640996, 2.5450339338336629, 2.5381299045960861, 2.531276903403298, 2.5244741283119345, 2.517720815309874, 2.511016236709263, 2.5043596995821109, 2.4977505442371193, 2.4911881427374518, 2.484671897457555, 2.4782012396797808, 2.4717756282286536, 2.4653945481431769, 2.4590575093862972, 2.4527640455904138, 2.4465137128394794, 2.4403060884863561, 2.4341407700052744, 2.4280173738791317, 2.4219355345208644, 2.4158949032291961, 2.4098951471771444, 2.4039359484346803, 2.3980170030233072, 2.3921380200041278, 2.3862987205970487, 2.3804988373326448, 2.3747381132351939, 2.3690163010364307, 2.363333162421275, 2.3576884673024106, 2.3520819931261983, 2.3465135242075501, 2.3409828510940476, 2.3354897699592532, 2.3300340820243135, 2.324615593006925, 2.3192341125986773, 2.3138894539685837, 2.3085814332935062, 2.3033098693144991, 2.2980745829184159, 2.2928753967443605, 2.2877121348146634, 2.2825846221894293, 2.2774926846438546, 2.2724361483688083, 2.2674148396923153, 2.2624285848232031, 2.2574772096143159, 2.2525605393468142, 2.2476783985324542, 2.24283061073558, 2.2380169984119953, 2.2332373827660259, 2.2284915836233083, 2.2237794193198139, 2.2191007066058868, 2.2144552605650376, 2.2098428945460649, 2.2052634201086518, 2.2007166469813408, 2.1962023830312005, 2.1917204342447989, 2.1872706047194996, 2.1828526966648316, 2.1784665104127034, 2.17411184443699, 2.1697884953803999, 2.1654962580890103, 2.1612349256543202, 2.1570042894607995, 2.1528041392396142, 2.1486342631278528, 2.1444944477323937, 2.140384478198039, 2.1363041382797299, 2.1322532104178209, 2.128231475817008, 2.1242387145271668, 2.1202747055267284, 2.1163392268079981, 2.1124320554638953, 2.1085529677755548, 2.1047017393013046, 2.1008781449658334, 2.0970819591496315, 2.093312955778639, 2.0895709084134801, 2.0858555903384208, 2.0821667746492394, 2.0785042343408358, 2.074867742393165, 2.071257071856309, 2.0676719959342043, 2.0641122880664642, 2.0605777220089552, 2.0570680719123673, 2.0535831123990187, 2.0501226186375785, 2.046686366416036, 2.0432741322119892, 2.0398856932614633, 2.0365208276249445, 2.0331793142514045, 2.0298609330399415, 2.0265654648991713, 2.0232926918041745, 2.020042396851212, 2.0168143643098029, 2.0136083796729372, 2.0104242297043986, 2.0072617024841177, 2.0041205874509433, 2.0010006754435006, 1.9979017587382546, 1.994823631085807, 1.9917660877446017, 1.9887289255128457, 1.985711942757916, 1.9827149394440453, 1.9797377171574639, 1.9767800791303494, 1.9738418302619096, 1.9709227771380773, 1.9680227280494966, 1.9651414930072806, 1.9622788837573386, 1.9594347137929187, 1.9566087983654623, 1.9538009544940431, 1.9510110009731305, 1.9482387583789544, 1.9454840490744227, 1.9427466972127085, 1.9400265287395655, 1.9373233713943017, 1.9346370547096021, 1.9319674100103268, 1.9293142704109996, 1.9266774708123346, 1.9240568478969535, 1.9214522401239094, 1.9188634877223871, 1.9162904326846595, 1.9137329187581507, 1.9111907914367965, 1.9086638979516373, 1.906152087260669, 1.9036552100384734, 1.901173118664724, 1.8987056672123266, 1.8962527114353189, 1.8938141087560034, 1.8913897182517212, 1.888979400641168, 1.8865830182705992, 1.8842004350992245, 1.8818315166848345, 1.8794761301687739, 1.8771341442608156, 1.8748054292236984, 1.8724898568577555, 1.8701873004848426, 1.8678976349327716, 1.8656207365191144, 1.8633564830350704, 1.8611047537293604, 1.8588654292918507, 1.8566383918372762, 1.8544235248888936, 1.8522207133621709, 1.850029843548294, 1.8478508030980079, 1.8456834810051392, 1.8435277675905426, 1.8413835544856287, 1.839250734616489, 1.8371292021876737, 1.835018852666302, 1.832919582766195, 1.8308312904321573, 1.8287538748240948, 1.8266872363019213, 1.824631276409806, 1.8225858978610248, 1.820551004522883, 1.8185265014017704, 1.8165122946282692, 1.8145082914424924, 1.812514400179712, 1.810530530255841, 1.8085565921533431, 1.8065924974072769, 1.8046381585913362, 1.8026934893043738, 1.8007584041565918, 1.7988328187565841, 1.7969166496979836, 1.795009814546435, 1.7931122318270416, 1.7912238210115057, 1.7893445025058534, 1.7874741976379829, 1.7856128286458497, 1.7837603186652531, 1.7819165917183009, 1.7800815727017276, 1.7782551873754902, 1.7764373623516845, 1.7746280250832087, 1.7728271038531145, 1.771034527763786, 1.7692502267262484, 1.7674741314500235, 1.7657061734325354, 1.7639462849494068, 1.7621943990440485, 1.7604504495183915, 1.7587143709228115, 1.7569860985468713, 1.7552655684098897, 1.7535527172517316, 1.7518474825238863, 1.7501498023803506, 1.7484596156689134, 1.7467768619225532, 1.7451014813508752, 1.7434334148316877, 1.7417726039028063, 1.7401189907538563, 1.7384725182182743, 1.7368331297653727, 1.7352007694926641, 1.7335753821180095, 1.7319569129722434, 1.7303453079916022, 1.7287405137104483, 1.7271424772539765, 1.7255511463312132, 1.723966469227824, 1.7223883947993084, 1.7208168724640349, 1.7192518521967175, 1.7176932845215498, 1.7161411205057722, 1.7145953117531687, 1.7130558103976632, 1.7115225690971383, 1.7099955410270804, 1.7084746798745649, 1.7069599398321547, 1.7054512755919655, 1.7039486423396224, 1.7024519957487396, 1.7009612919749426, 1.69947648765022, 1.6979975398773506, 1.6965244062244476, 1.6950570447193436, 1.6935954138443066, 1.6921394725306695, 1.6906891801535127, 1.689244496526537, 1.6878053818968293, 1.6863717969397687, 1.6849437027541576, 1.6835210608570212, 1.6821038331788094, 1.6806919820585544, 1.6792854702389748, 1.6778842608618099, 1.6764883174630361, 1.675097603968291, 1.6737120846881779, 1.6723317243138089, 1.6709564879123007, 1.6695863409221787, 1.6682212491491515, 1.6668611787616514, 1.6655060962865087, 1.6641559686047194, 1.6628107629472264, 1.6614704468907271, 1.6601349883534464, 1.6588043555912697, 1.6574785171934008, 1.6561574420785599, 1.6548410994909126, 1.6535294589962002, 1.6522224904778195, 1.6509201641329208, 1.649622450468619, 1.6483293202983902, 1.6470407447380824, 1.6457566952023774, 1.6444771434009766, 1.6432020613352749, 1.6419314212944449, 1.6406651958520908, 1.6394033578626548, 1.6381458804579723, 1.6368927370438373, 1.6356439012965323, 1.6343993471595812, 1.6331590488402763, 1.6319229808065043, 1.6306911177833652, 1.6294634347500219, 1.6282399069364579, 1.6270205098202852, 1.6258052191237393, 1.6245940108104162, 1.6233868610823392, 1.6221837463767805, 1.6209846433634751, 1.6197895289414137, 1.6185983802360122, 1.6174111745963562, 1.6162278895919771, 1.6150485030103816, 1.6138729928539246, 1.6127013373373607, 1.6115335148847623, 1.6103695041269503, 1.6092092838989887, 1.6080528332371138, 1.6069001313764792, 1.6057511577484231, 1.6046058919778241, 1.6034643138807287, 1.6023264034616758, 1.6011921409113892, 1.600061506604133, 1.5989344810955197, 1.5978110451198817, 1.5966911795880816, 1.5955748655851667, 1.5944620843679025, 1.5933528173627676, 1.5922470461633476, 1.5911447525285294, 1.590045918379984, 1.588950525800175, 1.5878585570300487, 1.5867699944671694, 1.5856848206633538, 1.58460301832293, 1.5835245703003988, 1.5824494595986336, 1.5813776693667936, 1.5803091828984606, 1.5792439836296568, 1.5781820551369257, 1.5771233811355587, 1.5760679454775846, 1.5750157321501168, 1.5739667252734282, 1.5729209090992207, 1.571878268008909, 1.5708387865118496, 1.569802449243624, 1.5687692409644838, 1.5677391465575028, 1.5667121510271453, 1.5656882394974299, 1.5646673972106886, 1.5636496095255701, 1.5626348619159496, 1.5616231399690446, 1.5606144293841104, 1.559608715971011, 1.5586059856485692, 1.5576062244434075, 1.5566094184883066, 1.5556155540209091, 1.5546246173824281, 1.5536365950162108, 1.5526514734664687, 1.5516692393769003, 1.5506898794895176, 1.5497133806433359, 1.5487397297731247, 1.5477689139081814, 1.5468009201711699, 1.5458357357768591, 1.5448733480311012, 1.5439137443295048, 1.5429569121564175, 1.5420028390838558, 1.5410515127703157, 1.5401029209597736, 1.5391570514804918, 1.5382138922442801, 1.5372734312451111, 1.536335656558407, 1.5354005563398641, 1.5344681188245946, 1.5335383323261298, 1.5326111852354873, 1.531686666020202, 1.5307647632235268, 1.529845465463447, 1.5289287614318716, 1.5280146398937093, 1.5271030896860724, 1.5261940997173824, 1.5252876589666475, 1.5243837564825486, 1.5234823813827829, 1.5225835228532023, 1.5216871701469503, 1.5207933125840252, 1.519901939550196, 1.5190130404964677, 1.5181266049383981, 1.5172426224552127, 1.5163610826894274, 1.5154819753458131, 1.5146052901910254, 1.5137310170527842, 1.5128591458194085, 1.5119896664389372, 1.5111225689187311, 1.5102578433248708, 1.5093954797813338, 1.5085354684696781, 1.507677799628339, 1.506822463552062, 1.5059694505914203, 1.505118751152174, 1.5042703556948593, 1.5034242547341943, 1.5025804388384723, 1.5017388986293165, 1.5008996247808783, 1.5000626080196442, 1.4992278391236988, 1.4983953089223481, 1.49756500829587, 1.496736928174716, 1.4959110595392193, 1.4950873934192543, 1.4942659208936837, 1.4934466330899372, 1.4926295211836564, 1.4918145763983277, 1.4910017900047257, 1.4901911533206289, 1.4893826577105294, 1.4885762945850354, 1.4877720554006462, 1.4869699316594034, 1.486169914908366, 1.4853719967394849, 1.4845761687891041, 1.4837824227376262, 1.4829907503092838, 1.4822011432716871, 1.4814135934355388, 1.4806280926543853, 1.4798446328241723, 1.479063205883026, 1.4782838038109989, 1.4775064186296585, 1.4767310424018021, 1.475957667231276, 1.475186285262573, 1.4744168886806286, 1.4736494697105256, 1.4728840206172011, 1.4721205337052159, 1.4713590013184497, 1.470599415839938, 1.4698417696913595, 1.469086055333213, 1.4683322652641519, 1.4675803920210109, 1.4668304281784152, 1.4660823663486717, 1.4653361991813851, 1.4645919193633141, 1.4638495196182564, 1.4631089927065335, 1.4623703314250578, 1.4616335286070026, 1.4608985771214931, 1.4601654698735975, 1.4594341998039562, 1.4587047598885976, 1.4579771431388013, 1.4572513426008484, 1.456527351355845, 1.4558051625194186, 1.4550847692417408, 1.4543661647071775, 1.453649342134063, 1.4529342947746426, 1.4522210159147544, 1.4515094988738502, 1.4507997370045238, 1.4500917236925255, 1.4493854523566223, 1.448680916448243, 1.4479781094513986, 1.4472770248826219, 1.4465776562905104, 1.4458799972558749, 1.4451840413913386, 1.4444897823413012, 1.4437972137817241, 1.4431063294198898, 1.4424171229944263, 1.4417295882749928, 1.4410437190620879, 1.4403595091871066, 1.439676952511908, 1.4389960429288451, 1.4383167743606025, 1.4376391407598321, 1.4369631361093633, 1.4362887544216392, 1.4356159897389282, 1.4349448361329198, 1.4342752877047193, 1.4336073385846275, 1.4329409829319546, 1.4322762149350372, 1.4316130288109248, 1.4309514188052646, 1.4302913791921945, 1.4296329042742488, 1.4289759883820852, 1.4283206258743815, 1.4276668111378297, 1.4270145385867963, 1.4263638026632417, 1.4257145978367187, 1.4250669186039531, 1.424420759489097, 1.4237761150431207, 1.4231329798440568, 1.4224913484966797, 1.4218512156324439, 1.421212575909276, 1.420575424011451, 1.4199397546495274, 1.4193055625601374, 1.4186728425059085, 1.4180415892752192, 1.4174117976822205, 1.4167834625666109, 1.4161565787934969, 1.4155311412532876, 1.4149071448615074, 1.4142845845588099, 1.4136634553106404, 1.4130437521073007, 1.4124254699636463, 1.4118086039190834, 1.4111931490374108, 1.4105791004066051, 1.409966453138823, 1.4093552023701317, 1.4087453432605483, 1.4081368709937419, 1.4075297807769742, 1.4069240678410648, 1.4063197274401189, 1.4057167548514178, 1.4051151453754234, 1.4045148943354866, 1.4039159970778212, 1.403318448971407, 1.4027222454076977, 1.4021273818007345, 1.4015338535867836, 1.4009416562244335, 1.4003507851942933, 1.3997612359989542, 1.3991730041628196, 1.3985860852320768, 1.3980004747745267, 1.397416168379352, 1.3968331616571776, 1.3962514502398358, 1.3956710297802768, 1.395091895952405, 1.3945140444511439, 1.3939374709920023, 1.3933621713111981, 1.3927881411654628, 1.3922153763319645, 1.391643872608131, 1.3910736258115923, 1.3905046317799192, 1.3899368863706967, 1.3893703854613999, 1.388805124949066, 1.3882411007503941, 1.3876783088016043, 1.3871167450581752, 1.3865564054949102, 1.3859972861057217, 1.3854393829035443, 1.3848826919202455, 1.3843272092064347, 1.3837729308314874, 1.3832198528833055, 1.382667971468307, 1.3821172827111996, 1.3815677827549517, 1.3810194677607839, 1.3804723339078149, 1.3799263773931796, 1.3793815944317602, 1.3788379812562261, 1.3782955341168459, 1.3777542492813262, 1.3772141230348383, 1.3766751516798195, 1.3761373315359073, 1.375600658939891, 1.3750651302454238, 1.3745307418230954, 1.3739974900603791, 1.3734653713612535, 1.3729343821464375, 1.3724045188530287, 1.371875777934598, 1.3713481558609291, 1.3708216491180043, 1.3702962542079733, 1.3697719676488826, 1.3692487859747575, 1.3687267057353965, 1.368205723496303, 1.3676858358385189, 1.3671670393588282, 1.3666493306692045, 1.3661327063971085, 1.3656171631851779, 1.3651026976912368, 1.3645893065881025, 1.364076986563733, 1.3635657343207783, 1.3630555465767638, 1.3625464200639432, 1.3620383515291432, 1.3615313377337803, 1.3610253754536472, 1.3605204614789665, 1.3600165926141123, 1.3595137656778535, 1.3590119775028453, 1.3585112249359179, 1.3580115048377395, 1.3575128140829007, 1.3570151495597482, 1.3565185081702977, 1.3560228868301947, 1.3555282824686194, 1.3550346920281879, 1.354542112464918, 1.3540505407480796, 1.3535599738601736, 1.3530704087968932, 1.3525818425668903, 1.3520942721918909, 1.3516076947064948, 1.3511221071581776, 1.3506375066070508, 1.3501538901260814, 1.3496712548007119, 1.3491895977289901, 1.3487089160214436, 1.348229206800968, 1.3477504672027345, 1.347272694374251, 1.3467958854751994, 1.3463200376772642, 1.3458451481643237, 1.3453712141321605, 1.344898232788428, 1.34442620135266, 1.3439551170561777, 1.34348497714191, 1.343015778864578, 1.3425475194903069, 1.3420801962968334, 1.3416138065733154, 1.3411483476202442, 1.3406838167495376, 1.3402202112841732, 1.3397575285584444, 1.3392957659177744, 1.338834920718571, 1.3383749903283275, 1.3379159721253622, 1.3374578634989756, 1.337000661849219, 1.3365443645869175, 1.3360889691336051, 1.335634472921412, 1.3351808733930903, 1.3347281680018619, 1.3342763542114473, 1.3338254294960019, 1.3333753913399138, 1.332926237238002, 1.332477964695179, 1.3320305712266345, 1.3315840543576596, 1.3311384116235221, 1.3306936405696665, 1.330249738751341, 1.3298067037338033, 1.3293645330920563, 1.3289232244110125, 1.3284827752851709, 1.3280431833189195, 1.3276044461261234, 1.3271665613302768, 1.3267295265644297, 1.3262933394711105, 1.3258579977022489, 1.3254234989191911, 1.3249898407925511, 1.3245570210023314, 1.3241250372376541, 1.3236938871968651, 1.3232635685874818, 1.3228340791260211, 1.3224054165380663, 1.3219775785582579, 1.3215505629300652, 1.3211243674059658, 1.3206989897471175, 1.3202744277236611, 1.3198506791143259, 1.3194277417066602, 1.319005613296848, 1.3185842916896267, 1.3181637746983379, 1.3177440601448709, 1.3173251458595558, 1.3169070296811651, 1.3164897094568488, 1.316073183042145, 1.3156574483008208, 1.3152425031049746, 1.3148283453348564, 1.314414972878913, 1.3140023836337238, 1.3135905755039319, 1.3131795464022464, 1.3127692942493649, 1.3123598169739341, 1.3119511125125702, 1.3115431788096765, 1.3111360138175696, 1.3107296154962824, 1.3103239818137051, 1.3099191107453667, 1.3095150002744786, 1.3091116483918541, 1.3087090530960301, 1.3083072123929731, 1.3079061242961765, 1.3075057868266442, 1.3071061980128202, 1.3067073558905269, 1.306309258502943, 1.3059119039006128, 1.3055152901412919, 1.3051194152900838, 1.3047242774191727, 1.3043298746080632, 1.3039362049432763, 1.3035432665185342, 1.3031510574344716, 1.3027595757989181, 1.3023688197265799, 1.3019787873391957, 1.3015894767653418, 1.3012008861405642, 1.3008130136071829, 1.3004258573143699, 1.300039415418089, 1.299653686080962, 1.2992686674724545, 1.2988843577686, 1.2985007551521281, 1.2981178578123345, 1.2977356639451232, 1.2973541717528956, 1.296973379444589, 1.2965932852356821, 1.2962138873479294, 1.2958351840096567, 1.2954571734554625, 1.2950798539262858, 1.2947032236694818, 1.2943272809385682, 1.2939520239933622, 1.2935774510998825, 1.2932035605303414, 1.292830350563092, 1.2924578194825787, 1.2920859655794563, 1.2917147871502959, 1.2913442824977224, 1.2909744499304625, 1.2906052877631013, 1.2902367943161899, 1.2898689679161952, 1.2895018068955004, 1.2891353095923028, 1.2887694743505695, 1.2884042995201384, 1.2880397834565815, 1.2876759245212051, 1.2873127210809776, 1.2869501715086102, 1.2865882741823969, 1.2862270274863534, 1.2858664298099396, 1.2855064795482798, 1.2851471751020325, 1.2847885148773164, 1.2844304972857632, 1.2840731207444296, 1.2837163836758168, 1.28336028450785, 1.2830048216737837, 1.2826499936122202, 1.2822957987671371, 1.2819422355877486, 1.2815893025285436, 1.2812369980492491, 1.2808853206148323, 1.280534268695444, 1.2801838407663364, 1.2798340353080548, 1.2794848508060763], 'Rp': [0.24751445462281593, 0.37336785250387877, 0.43073248602830072, 0.4653384528198779, 0.4914096631506964, 0.5133139703833558, 0.53263679610013859, 0.55007534213550935, 0.56600317733707328, 0.58065859941454367, 0.59421364426051115, 0.60680213302151231, 0.6185326746476183, 0.62949565802138119, 0.63976755380737782, 0.64941383808296727, 0.65849111170769392, 0.66704869965980318, 0.67512988971985177, 0.68277290951228575, 0.69001170806527745, 0.69687658828280974, 0.70339472391951685, 0.709590585927803, 0.71548629690345245, 0.72110192792550809, 0.72645574883238095, 0.73156444055429093, 0.73644327629463591, 0.74110627696082165, 0.74556634517301845, 0.74983538134629668, 0.75392438468889023, 0.75784354144344013, 0.7616023022875763, 0.76520945048112554, 0.76867316208115388, 0.77200105933062513, 0.77520025814971205, 0.77827741051404509, 0.78123874238455115, 0.78409008775403999, 0.78683691929322797, 0.78948437600869381, 0.79203728826863451, 0.79450020050145675, 0.79687739183203399, 0.79917289488459076, 0.80139051295123687, 0.80353383570022541, 0.80560625357510462, 0.80761097101833301, 0.80955101863604528, 0.81142926440702801, 0.81324842402719755, 0.8150110704701844, 0.81671964283569731, 0.81837645454983043, 0.81998370097397677, 0.82154346647386012, 0.82305773099419755, 0.82452837618009134, 0.82595719108277621, 0.82734587748245525, 0.828696054859269, 0.83000926503912675, 0.83128697653978523, 0.83253058863951934, 0.8337414351890533, 0.83492078818535187, 0.83606986112464909, 0.83718981214989541, 0.8382817470075179, 0.839346721825873, 0.84038574572819003, 0.84139978329027942, 0.84238975685385609, 0.84335654870436927, 0.84430100312211009, 0.84522392831480153, 0.84612609823881013, 0.84700825431584847, 0.84787110705179813, 0.84871533756337558, 0.84954159901816417, 0.85035051799326888, 0.8511426957574858, 0.85191870948113813, 0.85267911337835489, 0.85342443978536564, 0.85415520017851088, 0.85487188613592313, 0.85557497024558227, 0.85626490696326374, 0.85694213342329562, 0.85760707020459315, 0.85826012205484681, 0.85890167857535094, 0.85953211486856318, 0.86015179215069681, 0.86076105833161543, 0.86136024856357629, 0.86194968576119058, 0.86252968109365957, 0.86310053445161206, 0.86366253488986999, 0.86421596104719534, 0.86476108154504849, 0.8652981553661695, 0.86582743221454006, 0.8663491528574796, 0.86686354945145838, 0.86737084585223168, 0.86787125791032227, 0.86836499375312126, 0.8688522540537893, 0.86933323228838455, 0.86980811498170207, 0.87027708194218512, 0.87074030648730882, 0.87119795565939495, 0.87165019043257053, 0.87209716591174902, 0.87253903152358026, 0.87297593120040518, 0.87340800355709014, 0.87383538206162059, 0.87425819519956072, 0.87467656663277771, 0.87509061535286825, 0.87550045582935432, 0.87590619815336423, 0.87630794817640512, 0.87670580764517048, 0.87709987433211933, 0.87749024216237659, 0.87787700133673274, 0.87826023845139745, 0.87864003661442291, 0.87901647555894946, 0.87938963175335716, 0.87975957850877129, 0.88012638608376137, 0.88049012178629149, 0.88085085007339237, 0.88120863264811089, 0.88156352855453113, 0.88191559427020472, 0.88226488379652335, 0.88261144874719699, 0.88295533843441865, 0.88329659995318555, 0.88363527826374966, 0.88397141627216669, 0.88430505490898426, 0.88463623320615337, 0.88496498837227944, 0.88529135586619256, 0.88561536946857677, 0.88593706135230832, 0.88625646215089271, 0.8865736010254438, 0.8868885057300554, 0.88720120267548486, 0.88751171699158082, 0.88782007258776086, 0.88812629221233796, 0.88843039751009634, 0.88873240907850026, 0.88903234652233909, 0.88933022850685306, 0.88962607280949968, 0.88991989637018643, 0.89021171533989796, 0.89050154512814172, 0.89078940044870136, 0.89107529536408669, 0.89135924332848004, 0.89164125722924459, 0.89192134942704904, 0.89219953179452749, 0.89247581575360602, 0.89275021231132945, 0.89302273209438976, 0.89329338538226, 0.89356218213881877, 0.89382913204295744, 0.89409424451746866, 0.89435752875682284, 0.89461899375365639, 0.89487864832389308, 0.89513650113053733, 0.89539256070639883, 0.89564683547544444, 0.89589933377296993, 0.89615006386457552, 0.89639903396408871, 0.89664625225017081, 0.89689172688191199, 0.89713546601340777, 0.89737747780716504, 0.8976177704464684, 0.89785635214690229, 0.89809323116671158, 0.89832841581638812, 0.8985619144672119, 0.89879373555906894, 0.89902388760721608, 0.89925237920847645, 0.89947921904648243, 0.89970441589617733, 0.89992797862770746, 0.90014991620962748, 0.90037023771120661, 0.9005889523045163, 0.90080606926565376, 0.90102159797541281, 0.90123554791964067, 0.90144792868882273, 0.90165874997745088, 0.90186802158279644, 0.90207575340341373, 0.90228195543708689, 0.90248663777866078, 0.90268981061735498, 0.90289148423387411, 0.90309166899729432, 0.90329037536155998, 0.90348761386200482, 0.90368339511135676, 0.9038777297958458, 0.90407062867107524, 0.90426210255772554, 0.90445216233713877, 0.90464081894686132, 0.90482808337609144, 0.90501396666113343, 0.90519847988062907, 0.90538163415095485, 0.90556344062153604, 0.90574391047013803, 0.90592305489815073, 0.90610088512604214, 0.90627741238867066, 0.90645264793073965, 0.90662660300222953, 0.90679928885409855, 0.90697071673371976, 0.90714089788076346, 0.90730984352286637, 0.90747756487154385, 0.90764407311823059, 0.9078093794302351, 0.90797349494711954, 0.90813643077680894, 0.90829819799213085, 0.90845880762723374, 0.90861827067441969, 0.90877659808062505, 0.90893380074461017, 0.9090898895137387, 0.90924487518121666, 0.90939876848330903, 0.9095515800967463, 0.90970332063620341, 0.90985400065185884, 0.91000363062722722, 0.91015222097696269, 0.91029978204489304, 0.91044632410200466, 0.91059185734469161, 0.91073639189318289, 0.91087993778977705, 0.91102250499755044, 0.91116410339890352, 0.91130474279434559, 0.91144443290130772, 0.9115831833531749, 0.91172100369820164, 0.91185790339878259, 0.91199389183051149, 0.91212897828175044, 0.91226317195272999, 0.91239648195527867, 0.91252891731217411, 0.9126604869570224, 0.91279119973372358, 0.9129210643964123, 0.91305008960924017, 0.91317828394632861, 0.91330565589170265, 0.91343221383934847, 0.91355796609335582, 0.91368292086790215, 0.91380708628772778, 0.91393047038809405, 0.91405308111527883, 0.91417492632681407, 0.91429601379193193, 0.9144163511919321, 0.91453594612067413, 0.91465480608504091, 0.91477293850550212, 0.9148903507166819, 0.91500704996784299, 0.91512304342368544, 0.91523833816476841, 0.91535294118830735, 0.91546685940889871, 0.91558009965903664, 0.9156926686900223, 0.9158045731725859, 0.91591581969771907, 0.91602641477735058, 0.91613636484518224, 0.91624567625747444, 0.91635435529383402, 0.91646240815800173, 0.91656984097866656, 0.91667665981033641, 0.91678287063405239, 0.91688847935835538, 0.91699349182000212, 0.91709791378482264, 0.91720175094857359, 0.91730500893777189, 0.91740769331049421, 0.91750980955721151, 0.91761136310171032, 0.91771235930172124, 0.91781280344995786, 0.91791270077474885, 0.91801205644101613, 0.91811087555095805, 0.91820916314491163, 0.91830692420213167, 0.91840416364162403, 0.91850088632279914, 0.91859709704648151, 0.91869280055546743, 0.91878800153537443, 0.91888270461541666, 0.91897691436908202, 0.91907063531498978, 0.91916387191748872, 0.9192566285874989, 0.91934890968311345, 0.91944071951044581, 0.91953206232416085, 0.91962294232828801, 0.91971336367691447, 0.91980333047471374, 0.91989284677775141, 0.91998191659413198, 0.92007054388448861, 0.92015873256284753, 0.92024648649708363, 0.9203338095095599, 0.9204207053778154, 0.92050717783511804, 0.92059323057102216, 0.92067886723199677, 0.92076409142202764, 0.92084890670307618, 0.92093331659570266, 0.92101732457966889, 0.92110093409436045, 0.92118414853943376, 0.92126697127522972, 0.92134940562334999, 0.92143145486715528, 0.92151312225229098, 0.92159441098711659, 0.92167532424325405, 0.92175586515600993, 0.92183603682486748, 0.92191584231394152, 0.9219952846524424, 0.92207436683514232, 0.92215309182275063, 0.92223146254246058, 0.92230948188816841, 0.92238715272115646, 0.9224644778703095, 0.92254146013263483, 0.92261810227356034, 0.92269440702745142, 0.92277037709787024, 0.92284601515805986, 0.92292132385132231, 0.92299630579126002, 0.92307096356228779, 0.92314529971999226, 0.92321931679133484, 0.92329301727513469, 0.92336640364245548, 0.92343947833676432, 0.92351224377443619, 0.92358470234503443, 0.92365685641154982, 0.9237287083109148, 0.92380026035406348, 0.92387151482650609, 0.92394247398846574, 0.9240131400751842, 0.92408351529736499, 0.92415360184132533, 0.92422340186930207, 0.92429291751983944, 0.92436215090796559, 0.92443110412553187, 0.92449977924146276, 0.92456817830206683, 0.92463630333127611, 0.92470415633092073, 0.9247717392809216, 0.92483905413973755, 0.92490610284444952, 0.92497288731105587, 0.9250394094347435, 0.92510567109015418, 0.92517167413158086, 0.92523742039327139, 0.92530291168957779, 0.92536814981530169, 0.92543313654585324, 0.92549787363748426, 0.92556236282756854, 0.92562660583478562, 0.92569060435933936, 0.92575436008318301, 0.92581787467030574, 0.92588114976686509, 0.92594418700138204, 0.92600698798509729, 0.92606955431193849, 0.92613188755901765, 0.92619398928661623, 0.92625586103847968, 0.92631750434198712, 0.92637892070833938, 0.92644011163285267, 0.92650107859498587, 0.92656182305867996, 0.92662234647252573, 0.92668265026979058, 0.92674273586889089, 0.92680260467333142, 0.92686225807195055, 0.92692169743918129, 0.92698092413515942, 0.92703993950588204, 0.92709874488344801, 0.927157341586199, 0.92721573091886078, 0.92727391417274552, 0.92733189262593951, 0.92738966754339569, 0.92744724017721591, 0.92750461176665022, 0.92756178353841712, 0.92761875670677685, 0.92767553247367573, 0.92773211202901307, 0.9277884965506209, 0.92784468720453361, 0.92790068514512858, 0.92795649151530968, 0.92801210744646878, 0.92806753405892761, 0.92812277246179042, 0.92817782375329438, 0.9282326890208602, 0.9282873693412016, 0.92834186578054911, 0.92839617939474284, 0.9284503112293484, 0.92850426231982586, 0.92855803369161805, 0.92861162636034966, 0.92866504133184713, 0.92871827960243247, 0.92877134215883173, 0.92882422997847858, 0.92887694402960364, 0.92892948527126318, 0.92898185465356076, 0.9290340531177006, 0.92908608159615991, 0.92913794101274549, 0.92918963228276574, 0.92924115631308379, 0.92929251400234336, 0.92934370624085205, 0.92939473391093996, 0.92944559788692838, 0.92949629903529407, 0.92954683821473671, 0.92959721627624303, 0.92964743406330352, 0.92969749241191013, 0.92974739215073832, 0.92979713410114784, 0.92984671907736505, 0.92989614788649966, 0.92994542132879188, 0.92999454019746985, 0.93004350527903834, 0.9300923173533181, 0.93014097719344646, 0.93018948556609871, 0.93023784323150749, 0.93028605094352279, 0.9303341094497215, 0.93038201949155297, 0.93042978180430769, 0.93047739711730026, 0.93052486615382846, 0.93057218963144095, 0.93061936826176839, 0.93066640275084833, 0.93071329379901735, 0.93076004210107077, 0.93080664834635318, 0.93085311321871755, 0.9308994373967, 0.93094562155361171, 0.93099166635749309, 0.93103757247129548, 0.93108334055287378, 0.93112897125509908, 0.9311744652258509, 0.93121982310818485, 0.93126504554034228, 0.93131013315576316, 0.93135508658325494, 0.93139990644696735, 0.93144459336644014, 0.93148914795676485, 0.93153357082853616, 0.9315778625879495, 0.93162202383686832, 0.93166605517286749, 0.93170995718925953, 0.93175373047517307, 0.93179737561562992, 0.93184089319155805, 0.93188428377981536, 0.93192754795334254, 0.9319706862810786, 0.93201369932814671, 0.9320565876557394, 0.9320993518213524, 0.93214199237864603, 0.93218450987764734, 0.93222690486465298, 0.93226917788239283, 0.93231132947002104, 0.9323533601631111, 0.93239527049381554, 0.93243706099073886, 0.93247873217918464, 0.93252028458098934, 0.93256171871469085, 0.93260303509552989, 0.93264423423546061, 0.93268531664328824, 0.93272628282450021, 0.93276713328153504, 0.93280786851367858, 0.93284848901712258, 0.93288899528499081, 0.93292938780739931, 0.93296966707151729, 0.93300983356148848, 0.93304988775856657, 0.93308983014109514, 0.93312966118455398, 0.93316938136159255, 0.93320899114203615, 0.93324849099297158, 0.93328788137864449, 0.93332716276070782, 0.93336633559796334, 0.9334054003466854, 0.93344435746037502, 0.93348320739002155, 0.93352195058392473, 0.93356058748788773, 0.93359911854510935, 0.93363754419631051, 0.93367586487967913, 0.93371408103093734, 0.93375219308335544, 0.93379020146776492, 0.93382810661258397, 0.93386590894384947, 0.93390360888522206, 0.93394120685799964, 0.9339787032811544, 0.93401609857141354, 0.93405339314308367, 0.93409058740834805, 0.93412768177702676, 0.9341646766567665, 0.93420157245297553, 0.93423836956888484, 0.9342750684054828, 0.93431166936168797, 0.93434817283422689, 0.93438457921768037, 0.93442088890454766, 0.93445710228519896, 0.93449321974798172, 0.93452924167913398, 0.93456516846281323, 0.93460100048121497, 0.93463673811446124, 0.93467238174071987, 0.93470793173611078, 0.93474338847482341, 0.9347787523290364, 0.93481402366905908, 0.9348492028631642, 0.93488429027777842, 0.93491928627739052, 0.93495419122459822, 0.93498900548012431, 0.93502372940279477, 0.93505836334961223, 0.9350929076757144, 0.93512736273437358, 0.93516172887711557, 0.93519600645360701, 0.93523019581166122, 0.93526429729743843, 0.93529831125518847, 0.9353322380274961, 0.93536607795511628, 0.93539983137707983, 0.93543349863075009, 0.93546708005165102, 0.93550057597367997, 0.93553398672901122, 0.93556731264810356, 0.93560055405974829, 0.93563371129108475, 0.9356667846675768, 0.93569977451297437, 0.9357326811494947, 0.93576550489762222, 0.93579824607629059, 0.93583090500274513, 0.93586348199268454, 0.93589597736016561, 0.9359283914177009, 0.93596072447615941, 0.935992976844919, 0.93602514883171051, 0.93605724074280727, 0.93608925288281275, 0.93612118555488188, 0.93615303906060754, 0.93618481370013262, 0.93621650977194715, 0.93624812757313902, 0.93627966739930124, 0.93631112954447748, 0.93634251430129523, 0.93637382196084207, 0.93640505281277098, 0.93643620714533282, 0.93646728524523271, 0.93649828739780272, 0.93652921388687471, 0.93656006499495015, 0.93659084100301193, 0.93662154219067573, 0.93665216883618363, 0.9366827212163219, 0.93671319960649002, 0.93674360428074011, 0.93677393551176191, 0.93680419357081346, 0.93683437872782793, 0.93686449125140203, 0.93689453140871271, 0.93692449946573231, 0.93695439568693317, 0.93698422033557172, 0.93701397367356565, 0.93704365596153016, 0.93707326745870068, 0.9371028084230939, 0.93713227911141639, 0.93716167977905596, 0.93719101068018362, 0.93722027206761049, 0.9372494641930007, 0.93727858730664448, 0.93730764165761571, 0.93733662749380775, 0.93736554506177205, 0.93739439460690455, 0.93742317637334571, 0.93745189060400569, 0.93748053754062355, 0.93750911742365162, 0.93753763049244387, 0.9375660769851013, 0.93759445713854905, 0.9376227711885472, 0.93765101936962236, 0.93767920191522258, 0.93770731905756, 0.93773537102772286, 0.93776335805567046, 0.93779128037017312, 0.93781913819889329, 0.9378469317683632, 0.937874661303989, 0.93790232703006193, 0.93792992916972706, 0.93795746794507406, 0.93798494357707118, 0.93801235628559088, 0.93803970628942046, 0.93806699380626357, 0.93809421905279278, 0.93812138224450137, 0.93814848359591618, 0.93817552332049259, 0.93820250163063523, 0.93822941873766297, 0.93825627485188101, 0.93828307018258461, 0.93830980493799443, 0.93833647932535613, 0.93836309355089376, 0.93838964781975154, 0.93841614233616799, 0.93844257730333391, 0.93846895292342514, 0.93849526939769135, 0.93852152692636204, 0.93854772570871114, 0.93857386594297865, 0.93859994782654599, 0.93862597155573446, 0.93865193732600183, 0.938677845331784, 0.9387036957666145, 0.93872948882310792, 0.93875522469288786, 0.93878090356669697, 0.93880652563435807, 0.93883209108476862, 0.9388576001059088, 0.93888305288488627, 0.9389084496078679, 0.93893379046016967, 0.93895907562617087, 0.93898430528943044, 0.93900947963257564, 0.93903459883740392, 0.93905966308482502, 0.93908467255485195, 0.93910962742671211, 0.9391345278787615, 0.93915937408846728, 0.93918416623249978, 0.93920890448667771, 0.93923358902599374, 0.93925822002461534, 0.93928279765585954, 0.9393073220923065, 0.93933179350561324, 0.93935621206673092, 0.93938057794575958, 0.93940489131200533, 0.93942915233400037, 0.9394533611794883, 0.93947751801541446, 0.93950162300793805, 0.93952567632248973, 0.93954967812369361, 0.93957362857543258, 0.93959752784083284, 0.93962137608222174, 0.939645173461232, 0.93966892013873404, 0.93969261627486367, 0.93971626202899627, 0.93973985755977452, 0.93976340302518535, 0.93978689858239783, 0.93981034438791278, 0.93983374059750813, 0.93985708736627505, 0.9398803848485302, 0.93990363319798487, 0.93992683256760035, 0.93994998310961186, 0.93997308497566634, 0.93999613831662265, 0.94001914328268987, 0.94004210002345523, 0.94006500868773724, 0.9400878694238155, 0.94011068237919315, 0.94013344770073415, 0.94015616553467163, 0.94017883602658125, 0.94020145932141508, 0.94022403556342071, 0.9402465648962518, 0.94026904746289364, 0.94029148340574953, 0.94031387286655133, 0.94033621598638462, 0.94035851290577399, 0.94038076376457469, 0.94040296870209283, 0.94042512785689669, 0.94044724136710256, 0.94046930937012485, 0.940491332002789, 0.94051330940136868, 0.94053524170149028, 0.94055712903821176, 0.94057897154601089, 0.94060076935878967, 0.94062252260984558, 0.94064423143190978, 0.94066589595713845, 0.94068751631714553, 0.94070909264295943, 0.94073062506502647, 0.94075211371323919, 0.94077355871700408, 0.94079496020503617, 0.94081631830563273, 0.94083763314647373, 0.94085890485470647, 0.94088013355694833, 0.94090131937929733, 0.94092246244724254, 0.94094356288585568, 0.94096462081957044, 0.94098563637236898, 0.94100660966765759, 0.94102754082836382, 0.94104842997689819, 0.94106927723512623, 0.94109008272439343, 0.94111084656562838, 0.94113156887913074, 0.9411522497847955, 0.94117288940194954, 0.94119348784946377, 0.94121404524570274, 0.94123456170856512, 0.94125503735541027, 0.94127547230312814, 0.94129586666816212, 0.94131622056646058, 0.94133653411345608, 0.94135680742412564, 0.9413770406130022, 0.94139723379411067, 0.94141738708103695, 0.94143750058688591, 0.94145757442429789, 0.9414776087054938, 0.94149760354214929, 0.94151755904560119, 0.9415374753266198, 0.94155735249560646, 0.94157719066248324, 0.94159698993670715, 0.94161675042737136, 0.94163647224303781, 0.9416561554918611, 0.94167580028158138, 0.94169540671948315, 0.94171497491245182, 0.94173450496690492, 0.94175399698882079, 0.94177345108383725, 0.94179286735708634, 0.94181224591329971, 0.94183158685682467, 0.94185089029159552, 0.94187015632107129, 0.94188938504834496, 0.94190857657611826, 0.94192773100663718, 0.94194684844180432, 0.94196592898305676, 0.94198497273151904, 0.94200397978777495, 0.94202295025217508, 0.94204188422458524, 0.9420607818044876, 0.94207964309100622, 0.94209846818285436, 0.94211725717830208, 0.9421360101753814, 0.94215472727163863, 0.94217340856424525, 0.94219205415001661, 0.94221066412541576, 0.94222923858645813, 0.94224777762889333, 0.94226628134798551, 0.94228474983876143, 0.94230318319575956, 0.94232158151323575, 0.94233994488500816, 0.94235827340467615, 0.94237656716534057, 0.94239482625976645, 0.94241305078044668, 0.94243124081944196, 0.94244939646849402, 0.94246751781901161, 0.94248560496201805, 0.942503657988225, 0.94252167698798905, 0.94253966205130346, 0.9425576132678658, 0.94257553072702827, 0.94259341451775391, 0.9426112647287741, 0.94262908144835678, 0.94264686476455029, 0.94266461476500973, 0.9426823315370837, 0.94270001516781887, 0.94271766574390625, 0.94273528335168832, 0.94275286807728698, 0.94277042000639655, 0.94278793922443349, 0.94280542581654292, 0.94282287986746238, 0.94284030146173103, 0.94285769068350134, 0.94287504761659069, 0.94289237234457746, 0.94290966495069606, 0.94292692551793877, 0.94294415412889021, 0.94296135086591171, 0.9429785158110312, 0.94299564904599309, 0.9430127506522562, 0.94302982071092278, 0.94304685930286736, 0.94306386650868346, 0.94308084240859835, 0.94309778708262759, 0.94311470061045721, 0.9431315830714736, 0.94314843454482122, 0.94316525510934046, 0.94318204484355506, 0.9431988038257898, 0.94321553213402431, 0.94323222984595623, 0.9432488970390619, 0.94326553379051215, 0.94328214017718481, 0.94329871627569939, 0.94331526216241968, 0.94333177791342826, 0.9433482636045345, 0.94336471931131416, 0.94338114510900573, 0.94339754107267304, 0.94341390727704133, 0.94343024379663543, 0.94344655070564043, 0.94346282807810511, 0.94347907598769432, 0.94349529450789504, 0.94351148371189297, 0.94352764367267539, 0.94354377446294713, 0.9435598761551055, 0.9435759488214206, 0.9435919925338031, 0.94360800736398109, 0.94362399338338288, 0.94363995066327166, 0.94365587927458294, 0.94367177928804746, 0.94368765077415828, 0.94370349380319163, 0.94371930844511709]}
@@ -42,5 +44,5 @@ np_all_performances = {'R^2': [-22.1643872605705, -2.0902469601019193, -1.356201
 
 # Plot the MSE values
 plt.figure()
-plt.plot(nmf.all_performances['MSE'])
+plt.plot(performances_sink.values['MSE'])
 plt.ylim(0,10)
\ No newline at end of file
@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.bnmf_vb_optimised import bnmf_vb_optimised
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import numpy, matplotlib.pyplot as plt
@@ -34,15 +35,16 @@ priors = { 'alpha':alpha, 'beta':beta, 'lambdaU':lambdaU, 'lambdaV':lambdaV }
 # Run the VB algorithm
 BNMF = bnmf_vb_optimised(R,M,K,priors) 
 BNMF.initialise(init_UV)
-BNMF.run(iterations)
+performances_sink = MemorySink()
+BNMF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Extract the performances across all iterations
-print "vb_all_performances = %s" % BNMF.all_performances
+print "vb_all_performances = %s" % performances_sink.values
 
 '''
 vb_all_performances = {'R^2': [-7876.01489808038, -61.87121185862708, -0.04561061270377831, 0.7249416173038344, 0.7385279541978661, 0.7471612660766378, 0.7582747714886064, 0.7740751292361174, 0.7868476885394177, 0.7951002119455569, 0.8040748098265353, 0.8133114626037165, 0.8196366563385856, 0.8246050980581356, 0.8299404751522368, 0.8348152119919283, 0.8385565432320736, 0.8419424103747353, 0.8455165135000065, 0.8491508549460977, 0.8524696497175767, 0.8553114595728968, 0.8577158053109973, 0.8597625577049833, 0.8615293342232082, 0.8630866552744607, 0.8644957806040237, 0.8658006127633798, 0.8670283471031679, 0.868195226564487, 0.8693093745246556, 0.8703728665499292, 0.8713845430190428, 0.8723434743994897, 0.8732513634353343, 0.8741130104184032, 0.8749352281926214, 0.8757251658147309, 0.8764889222176449, 0.8772308231117876, 0.8779533703278753, 0.8786576686288711, 0.8793440466263387, 0.8800126397777562, 0.8806638171133718, 0.8812984009185612, 0.8819176719867973, 0.8825232168440669, 0.8831167060703723, 0.883699606856127, 0.8842726252129265, 0.8848356015238377, 0.8853886828286367, 0.8859326084569347, 0.8864680049465328, 0.8869949547066484, 0.8875128626488347, 0.8880206165044513, 0.8885169123470291, 0.8890003219687882, 0.8894692956505538, 0.8899222798267606, 0.8903578798222909, 0.8907750103261307, 0.891172999775474, 0.8915516291790995, 0.8919111207207522, 0.8922520968739727, 0.8925755147813511, 0.8928825832127765, 0.8931746757823107, 0.8934532501751636, 0.8937197756791933, 0.8939756688584437, 0.8942222462235898, 0.8944607110176449, 0.8946921635833154, 0.8949175989661804, 0.8951378906823184, 0.8953537827984768, 0.8955658945242504, 0.8957747309263996, 0.8959806955050537, 0.8961841025454974, 0.8963851879586282, 0.8965841186509702, 0.8967810016017932, 0.8969758934288613, 0.8971688098913675, 0.8973597343358422, 0.8975486251351024, 0.8977354231989034, 0.8979200602265182, 0.8981024668862505, 0.898282579094019, 0.8984603413087496, 0.8986357074923386, 0.8988086411280314, 0.8989791151425126, 0.8991471118397809, 0.8993126226551882, 0.8994756475683695, 0.8996361941630362, 0.8997942764993435, 0.8999499140864874, 0.900103131210582, 0.9002539566773302, 0.9004024237649804, 0.9005485699794061, 0.9006924362017923, 0.9008340651010128, 0.900973499133822, 0.9011107788175593, 0.9012459420065035, 0.9013790245056449, 0.9015100616180451, 0.9016390896635122, 0.9017661466259417, 0.9018912717189783, 0.9020145042189966, 0.9021358820930601, 0.9022554408479161, 0.9023732128388987, 0.9024892270965862, 0.9026035095775666, 0.9027160836501785, 0.9028269706165261, 0.9029361901470907, 0.9030437606246832, 0.9031496994948269, 0.9032540237139739, 0.9033567502320069, 0.9034578962974152, 0.9035574795716135, 0.9036555185320935, 0.9037520335743714, 0.9038470482727947, 0.903940589798467, 0.9040326882855193, 0.904123375770284, 0.9042126853119199, 0.9043006504793075, 0.9043873051110438, 0.90447268319882, 0.9045568187863231, 0.9046397458321894, 0.9047214980325302, 0.9048021086327802, 0.9048816102758606, 0.90496003492967, 0.9050374139150524, 0.9051137780267683, 0.9051891577159237, 0.9052635832869482, 0.9053370850564506, 0.9054096934275696, 0.9054814388532395, 0.905552351690015, 0.9056224619691036, 0.9056917991238527, 0.9057603917111633, 0.9058282671553772, 0.9058954515377102, 0.9059619694599719, 0.9060278440209375, 0.90609309693617, 0.9061577487917928, 0.9062218193674202, 0.9062853279350734, 0.9063482934645801, 0.9064107347229804, 0.9064726703043287, 0.906534118641374, 0.9065950980350149, 0.9066556267081, 0.9067157228631776, 0.9067754047092738, 0.9068346904258928, 0.9068935980509047, 0.9069521453051307, 0.9070103493924354, 0.9070682268305932, 0.9071257933656219, 0.9071830639965838, 0.9072400530997118, 0.907296774610433, 0.9073532422102422, 0.9074094694643011, 0.907465469851617, 0.9075212566276041, 0.9075768424897712, 0.9076322391085121, 0.907687456704911, 0.9077425039014672, 0.9077973879571886, 0.9078521152878596, 0.9079066920348997, 0.9079611244752981, 0.9080154191951876, 0.9080695830631293, 0.9081236230828268, 0.9081775461967092, 0.9082313590882486, 0.9082850680128342, 0.9083386786768651, 0.9083921961763717, 0.9084456249943045, 0.908498969038556, 0.9085522316858988, 0.9086054157903488, 0.9086585236280467, 0.9087115567858595, 0.9087645160419475, 0.908817401305093, 0.9088702116566181, 0.9089229454866365, 0.90897560067144, 0.9090281747284201, 0.9090806649072551, 0.9091330682088212, 0.909185381348404, 0.9092376006899284, 0.9092897221766211, 0.9093417412753095, 0.9093936529414237, 0.9094454516026519, 0.9094971311535278, 0.909548684950931, 0.909600105801718, 0.9096513859369816, 0.9097025169727462, 0.9097534898635444, 0.9098042948624878, 0.909854921506917, 0.9099053586497498, 0.9099555945515551, 0.9100056170380423, 0.9100554137151214, 0.9101049722221598, 0.9101542804946816, 0.910203327001023, 0.9102521009161744, 0.9103005922045757, 0.9103487916038319, 0.9103966905278961, 0.910444280929807, 0.9104915551699369, 0.9105385059240808, 0.9105851261453171, 0.9106314090766275, 0.9106773483043514, 0.9107229378410041, 0.9107681722234087, 0.9108130466059244, 0.9108575568244748, 0.9109016994113163, 0.910945471554047, 0.9109888710093079, 0.9110318959933784, 0.9110745450743704, 0.911116817084823, 0.9111587110636831, 0.9112002262274577, 0.9112413619637127, 0.9112821178369883, 0.9113224935972281, 0.9113624891830308, 0.9114021047159041, 0.911441340485597, 0.9114801969300387, 0.9115186746152365, 0.9115567742206986, 0.9115944965346652, 0.9116318424612389, 0.9116688130392254, 0.9117054094706483, 0.9117416331556113, 0.911777485729512, 0.9118129690979357, 0.9118480854640633, 0.911882837342864, 0.9119172275567409, 0.9119512592089675, 0.9119849356357178, 0.9120182603437632, 0.9120512369475009, 0.9120838691213036, 0.912116160579137, 0.912148115083103, 0.9121797364717223, 0.9122110286926702, 0.9122419958259109, 0.9122726420896574, 0.9123029718287137, 0.9123329894894712, 0.9123626995866434, 0.9123921066649711, 0.9124212152559903, 0.912450029828194, 0.9124785547304393, 0.9125067941346792, 0.9125347519926491, 0.9125624320262097, 0.912589837765138, 0.9126169726287628, 0.9126438400280518, 0.9126704434562332, 0.9126967865437359, 0.9127228730707387, 0.9127487069461648, 0.9127742921689626, 0.9127996327862625, 0.9128247328574748, 0.9128495964272768, 0.9128742275059772, 0.912898630053737, 0.9129228079656285, 0.9129467650569307, 0.9129705050506733, 0.9129940315702612, 0.9130173481376898, 0.9130404581738648, 0.91306336499481, 0.9130860717989586, 0.9131085816461916, 0.9131308974348833, 0.9131530218853295, 0.9131749575353516, 0.9131967067491433, 0.9132182717367979, 0.9132396545812094, 0.9132608572697444, 0.9132818817288777, 0.9133027298596825, 0.9133234035714262, 0.9133439048100428, 0.9133642355786474, 0.9133843979484654, 0.9134043940600559, 0.9134242261162476, 0.9134438963692102, 0.9134634071046899, 0.9134827606264098, 0.9135019592433922, 0.9135210052621733, 0.9135399009849148, 0.9135586487129984, 0.9135772507542094, 0.9135957094304559, 0.9136140270825406, 0.9136322060691935, 0.913650248758951, 0.9136681575154466, 0.913685934678256, 0.9137035825426518, 0.913721103341972, 0.9137384992359969, 0.9137557723075868, 0.9137729245682781, 0.9137899579714357, 0.9138068744300769, 0.9138236758354584, 0.9138403640728318, 0.9138569410319178, 0.9138734086114222, 0.9138897687184472, 0.9139060232646874, 0.91392217416151, 0.9139382233155697, 0.9139541726258116, 0.9139700239817449, 0.913985779262186, 0.9140014403330916, 0.9140170090430765, 0.9140324872155337, 0.9140478766369661, 0.9140631790420772, 0.9140783960971681, 0.9140935293839473, 0.914108580386124, 0.9141235504805612, 0.9141384409338559, 0.9141532529040597, 0.9141679874461701, 0.9141826455195323, 0.9141972279951742, 0.9142117356615188, 0.9142261692275107, 0.9142405293229813, 0.914254816496678, 0.914269031213047, 0.9142831738494106, 0.9142972446954715, 0.9143112439572495, 0.9143251717671255, 0.9143390282007804, 0.9143528133005845, 0.9143665271035495, 0.9143801696708324, 0.914393741115294, 0.9144072416239075, 0.9144206714726707, 0.9144340310330628, 0.914447320770355, 0.9144605412351613, 0.9144736930503343, 0.9144867768954219, 0.9144997934907297, 0.9145127435825177, 0.91452562793002, 0.9145384472944245, 0.914551202429162, 0.9145638940707033, 0.9145765229289428, 0.9145890896766897, 0.9146015949382148, 0.9146140392775047, 0.9146264231872481, 0.9146387470797741, 0.9146510112810392, 0.9146632160282209, 0.9146753614709536, 0.914687447675574, 0.9146994746314607, 0.914711442258371, 0.9147233504138838, 0.9147351989004504, 0.9147469874719023, 0.9147587158397142, 0.914770383679462, 0.9147819906380149, 0.914793536341734, 0.9148050204058304, 0.9148164424445483, 0.9148278020816759, 0.9148390989607165, 0.9148503327540939, 0.914861503170959, 0.9148726099634711, 0.9148836529316112, 0.914894631926725, 0.9149055468538774, 0.9149163976729133, 0.9149271843979597, 0.9149379070949494, 0.9149485658768739, 0.914959160896659, 0.9149696923379034, 0.9149801604041489, 0.9149905653078355, 0.9150009072605666, 0.9150111864665825, 0.9150214031213167, 0.9150315574162168, 0.9150416495496103, 0.915051679741163, 0.9150616482447533, 0.9150715553521125, 0.915081401378738, 0.9150911866264059, 0.9151009113244649, 0.9151105755640533, 0.9151201792499617, 0.9151297220958209, 0.9151392036746006, 0.9151486235130019, 0.9151579811994751, 0.9151672764728574, 0.9151765092720082, 0.9151856797453644, 0.9151947882319508, 0.9152038352284586, 0.9152128213534354, 0.9152217473143591, 0.9152306138794585, 0.9152394218542463, 0.9152481720622487, 0.9152568653295416, 0.9152655024728136, 0.9152740842907774, 0.915282611558542, 0.9152910850245182, 0.915299505409231, 0.9153078734054323, 0.9153161896788453, 0.9153244548689978, 0.9153326695896876, 0.9153408344287688, 0.9153489499471409, 0.9153570166769477, 0.915365035119193, 0.9153730057410842, 0.9153809289734463, 0.9153888052084644, 0.9153966347978402, 0.9154044180510981, 0.9154121552334671, 0.9154198465625182, 0.9154274922027071, 0.9154350922573975, 0.9154426467587035, 0.9154501556565013, 0.9154576188090396, 0.9154650359780236, 0.9154724068308024, 0.9154797309511024, 0.9154870078578886, 0.9154942370303277, 0.9155014179355253, 0.9155085500555223, 0.9155156329104936, 0.9155226660759639, 0.9155296491929295, 0.9155365819706675, 0.9155434641830331, 0.9155502956599876, 0.9155570762769489, 0.9155638059448553, 0.9155704846033829, 0.9155771122184194, 0.9155836887832729, 0.9155902143214583, 0.9155966888883504, 0.9156031125693673, 0.9156094854735966, 0.915615807723423, 0.9156220794420469, 0.9156283007417438, 0.9156344717157071, 0.9156405924356162, 0.9156466629554025, 0.9156526833197924, 0.9156586535744837, 0.9156645737740843, 0.9156704439846207, 0.9156762642790994, 0.9156820347266658, 0.9156877553773682, 0.9156934262452711, 0.9156990472922379, 0.9157046184139863, 0.9157101394291371, 0.915715610071225, 0.9157210299834005, 0.9157263987154493, 0.9157317157229508, 0.915736980368517, 0.9157421919251644, 0.9157473495817907, 0.9157524524506242, 0.9157574995763054, 0.9157624899461116, 0.9157674225006743, 0.9157722961444772, 0.9157771097552826, 0.9157818621916043, 0.9157865522974528, 0.915791178904045, 0.9157957408289108, 0.9158002368740574, 0.9158046658259811, 0.915809026461241, 0.9158133175613181, 0.9158175379392566, 0.9158216864780913, 0.9158257621777, 0.9158297642035443, 0.9158336919288417, 0.9158375449619066, 0.9158413231524813, 0.9158450265735039, 0.9158486554768765, 0.9158522102223535, 0.915855691179126, 0.915859098602237, 0.9158624324943748, 0.9158656924790991, 0.9158688777296281, 0.9158719870039855, 0.9158750188155143, 0.9158779717154779, 0.9158808446090567, 0.9158836370085038, 0.9158863491629505, 0.9158889820660985, 0.9158915373880753, 0.9158940173854575, 0.9158964248236255, 0.9158987629192038, 0.9159010352924606, 0.915903245913913, 0.9159053990333291, 0.915907499087971, 0.9159095505959336, 0.9159115580461249, 0.915913525796481, 0.915915457986787, 0.9159173584659019, 0.9159192307313748, 0.9159210778866052, 0.9159229026334794, 0.9159247073255998, 0.9159264940955203, 0.9159282650385956, 0.915930022404782, 0.9159317687428252, 0.9159335069644656, 0.9159352403318524, 0.9159369723955515, 0.9159387069147789, 0.9159404477817925, 0.9159421989598848, 0.9159439644349138, 0.9159457481747568, 0.9159475540874794, 0.9159493859655218, 0.915951247400081, 0.9159531416501101, 0.9159550714597817, 0.9159570388431769, 0.9159590448932894, 0.9159610897043617, 0.9159631724865828, 0.9159652918805026, 0.9159674463781925, 0.9159696347014946, 0.915971856019117, 0.9159741099735496, 0.9159763965686653, 0.9159787159980821, 0.9159810684795701, 0.9159834541293785, 0.9159858728840035, 0.9159883244623592, 0.9159908083567482, 0.9159933238417596, 0.9159958699929778, 0.9159984457101665, 0.9160010497418598, 0.9160036807096884, 0.9160063371317249, 0.9160090174444881, 0.9160117200234775, 0.9160144432020723, 0.9160171852886811, 0.9160199445819448, 0.9160227193839126, 0.9160255080111065, 0.9160283088035248, 0.9160311201317057, 0.9160339404020357, 0.9160367680605305, 0.9160396015953423, 0.9160424395382046, 0.9160452804650205, 0.9160481229957835, 0.916050965793951, 0.916053807565437, 0.9160566470573372, 0.9160594830565308, 0.9160623143882762, 0.9160651399149624, 0.9160679585350741, 0.9160707691824852, 0.9160735708260598, 0.9160763624695536, 0.9160791431517377, 0.916081911946657, 0.9160846679638726, 0.9160874103485855, 0.9160901382815027, 0.9160928509783143, 0.916095547688673, 0.9160982276945664, 0.9161008903080428, 0.9161035348682784, 0.9161061607380303, 0.9161087672996062, 0.916111353950513, 0.9161139200989439, 0.9161164651592514, 0.9161189885474306, 0.91612148967643, 0.916123967950856, 0.9161264227603656, 0.9161288534708942, 0.9161312594131785, 0.9161336398688528, 0.9161359940560985, 0.9161383211186166, 0.9161406201231282, 0.9161428900702301, 0.9161451299206801, 0.9161473386350674, 0.9161495152205497, 0.9161516587764043, 0.9161537685309533, 0.916155843865345, 0.9161578843231173, 0.916159889607154, 0.9161618595669345, 0.916163794179222, 0.916165693524957, 0.9161675577645418, 0.9161693871132462, 0.9161711818179759, 0.916172942136462, 0.9161746683195602, 0.9161763605971303, 0.916178019167753, 0.9161796441921407, 0.9161812357899624, 0.9161827940394323, 0.9161843189788962, 0.9161858106095788, 0.9161872688985723, 0.9161886937814353, 0.9161900851637651, 0.9161914429214756, 0.9161927668996728, 0.9161940569102457, 0.9161953127285586, 0.916196534089802, 0.9161977206857966, 0.9161988721632286, 0.9161999881243696, 0.9162010681312908, 0.916202111714276, 0.9162031183847104, 0.9162040876519606, 0.9162050190430899, 0.9162059121235708, 0.9162067665167298, 0.9162075819196471, 0.916208358113588, 0.9162090949679628, 0.916209792437972, 0.9162104505572013, 0.916211069427087, 0.9162116492051664, 0.9162121900935672, 0.9162126923284233, 0.9162131561703035, 0.9162135818951883, 0.9162139697853261, 0.9162143201190954, 0.9162146331591929, 0.9162149091385838, 0.9162151482439913, 0.9162153505971908, 0.9162155162348465, 0.9162156450881686, 0.9162157369643045, 0.9162157915319138, 0.9162158083139763, 0.916215786691043, 0.9162157259176926, 0.9162156251533112, 0.9162154835056853, 0.9162153000826745, 0.9162150740449564, 0.9162148046525098, 0.9162144912993907, 0.916214133534674, 0.916213731070611, 0.9162132837809595, 0.9162127916928253, 0.9162122549746037, 0.9162116739215792, 0.9162110489398239, 0.9162103805287818, 0.9162096692628501, 0.9162089157725395, 0.9162081207259765, 0.9162072848115248, 0.9162064087222085, 0.9162054931423212, 0.9162045387363362, 0.9162035461398992, 0.9162025159523932, 0.9162014487304416, 0.9162003449815147, 0.916199205156867, 0.9161980296430776, 0.9161968187517746, 0.9161955727074627, 0.9161942916340109, 0.9161929755409144, 0.9161916243109998, 0.9161902376914912, 0.9161888152901637, 0.9161873565775869, 0.9161858608954434, 0.9161843274697032, 0.9161827554265621, 0.9161811438086763, 0.9161794915894479, 0.9161777976839444, 0.9161760609560656, 0.9161742802227897, 0.916172454257245, 0.9161705817930512, 0.9161686615325608, 0.9161666921614338, 0.9161646723713616, 0.9161626008915867, 0.9161604765285545, 0.9161582982114113, 0.9161560650395492, 0.9161537763273493, 0.9161514316408486, 0.9161490308217286, 0.9161465739954842, 0.916144061562846, 0.9161414941758211, 0.9161388727016451, 0.9161361981790707, 0.9161334717716992, 0.916130694722381, 0.9161278683116861, 0.9161249938220564, 0.9161220725079113, 0.9161191055708559, 0.9161160941382165, 0.9161130392425545, 0.9161099417994788, 0.9161068025813911, 0.9161036221857464, 0.916100400998612, 0.9160971391581102, 0.9160938365276562, 0.9160904926949985, 0.9160871070171368, 0.9160836787288504, 0.9160802071191592, 0.9160766917547737, 0.9160731327001967, 0.9160695306669961, 0.9160658870358052, 0.9160622037352895, 0.9160584830133398, 0.9160547271694093, 0.9160509383181534, 0.9160471182293264, 0.9160432682559367, 0.916039389337231, 0.916035482051646, 0.9160315466946579, 0.9160275833625982, 0.9160235920307847, 0.9160195726205137, 0.9160155250532054, 0.9160114492919195, 0.9160073453711194, 0.9160032134156485, 0.9159990536499107, 0.9159948663983326, 0.915990652078434, 0.9159864111879911, 0.9159821442880229, 0.9159778519832247, 0.9159735349014999, 0.9159691936740202, 0.9159648289171165, 0.9159604412172129, 0.9159560311199499, 0.9159515991245853, 0.9159471456843317, 0.9159426712126956, 0.915938176094855, 0.9159336607021034, 0.915929125406734, 0.9159245705946883, 0.9159199966741108, 0.915915404078988, 0.9159107932683557, 0.9159061647223599, 0.9159015189368488, 0.9158968564180332, 0.9158921776783839, 0.9158874832343653, 0.9158827736062563, 0.9158780493197944, 0.9158733109093083, 0.9158685589218076, 0.9158637939214292, 0.9158590164937532, 0.9158542272494604, 0.9158494268269661, 0.9158446158937007, 0.9158397951458821, 0.9158349653066326, 0.9158301271224297, 0.9158252813579216, 0.9158204287891677, 0.915815570195362, 0.915810706349205, 0.915805838006052, 0.9158009658921051, 0.9157960906920196, 0.9157912130364583, 0.9157863334904017, 0.9157814525432438, 0.9157765706020481, 0.9157716879895292, 0.9157668049484002, 0.9157619216534274, 0.9157570382317097, 0.9157521547903095, 0.9157472714486568, 0.9157423883715994, 0.9157375057982532, 0.9157326240623933, 0.9157277436018992, 0.9157228649571221, 0.9157179887601749, 0.9157131157183427, 0.9157082465951132, 0.9157033821915553, 0.9156985233299026, 0.9156936708401161, 0.91568882554943, 0.9156839882745005, 0.9156791598155137, 0.9156743409517076, 0.9156695324378288, 0.9156647350012501, 0.9156599493395973, 0.9156551761188596, 0.9156504159720382, 0.9156456694984043, 0.9156409372634756, 0.9156362197996956, 0.9156315176078471, 0.9156268311590845, 0.915622160897422, 0.9156175072424292, 0.9156128705917994, 0.9156082513234061, 0.9156036497963511, 0.915599066350542, 0.9155945013042935, 0.9155899549496327, 0.9155854275452435, 0.9155809193074671, 0.9155764304004509, 0.9155719609272097, 0.9155675109239209, 0.9155630803597028, 0.9155586691434823, 0.9155542771380397, 0.9155499041795957, 0.9155455500997515, 0.9155412147459729, 0.9155368979971401, 0.9155325997721422, 0.9155283200310882, 0.915524058770295, 0.9155198160131532, 0.9155155917991398, 0.9155113861729952, 0.9155071991753655, 0.9155030308355778, 0.915498881166624, 0.9154947501620699, 0.915490637794494, 0.9154865440150247, 0.9154824687536139, 0.9154784119199066, 0.9154743734045125, 0.9154703530806896, 0.9154663508063728, 0.9154623664265255, 0.9154583997757579, 0.9154544506810463, 0.9154505189645067, 0.9154466044460157, 0.9154427069455837, 0.9154388262853868, 0.9154349622913652, 0.9154311147944045, 0.9154272836310717, 0.915423468643984, 0.9154196696818133, 0.9154158865990599, 0.9154121192556084, 0.9154083675161495, 0.9154046312495222, 0.9154009103280262, 0.9153972046267267, 0.9153935140227872, 0.9153898383948278, 0.9153861776223478, 0.9153825315851667, 0.915378900162944, 0.9153752832347257, 0.9153716806785487, 0.9153680923711149, 0.9153645181875506, 0.9153609580012686], 'MSE': [92127.302286718317, 735.32362385700048, 12.229161203470248, 3.2170037884936491, 3.0581018970790876, 2.9571291626762446, 2.8271487975504859, 2.6423523545733416, 2.4929681719692258, 2.3964490300985042, 2.2914847127040892, 2.1834554765618304, 2.1094778285855185, 2.0513683622313961, 1.9889673251987408, 1.9319538041873858, 1.8881962693121368, 1.8485961403558395, 1.8067944574485229, 1.764288244454209, 1.7254725746737516, 1.6922355833807359, 1.6641150466695822, 1.6401768189340018, 1.619513108572447, 1.601299129152252, 1.5848184042994711, 1.5695574623901529, 1.5551982344195416, 1.5415507476169841, 1.5285199932961306, 1.5160816962306047, 1.5042494190174303, 1.4930340332016474, 1.4824156239780668, 1.4723380485131563, 1.4627216257424738, 1.4534827423530976, 1.4445500669785956, 1.4358730073531119, 1.4274223027836479, 1.4191850322801127, 1.4111573524961045, 1.4033376791598915, 1.3957216961997554, 1.3882997864022797, 1.3810569699751187, 1.3739746913663222, 1.36703341195233, 1.360215971895758, 1.3535141138879023, 1.3469297047625337, 1.3404610247846955, 1.3340994269677462, 1.3278375835056402, 1.3216745305638584, 1.3156172281258347, 1.3096786849659068, 1.303874151433293, 1.2982203314356999, 1.2927353500431853, 1.287437377312084, 1.2823427249617259, 1.277464086477796, 1.2728093162658587, 1.2683809755842956, 1.2641764658358849, 1.2601885067490026, 1.2564059038590103, 1.2528145197407035, 1.2493982889988091, 1.2461401629660709, 1.2430229572739959, 1.2400301041966622, 1.2371462062036034, 1.2343571905103603, 1.2316501878248942, 1.2290135603801, 1.2264370917829852, 1.223912079642729, 1.2214312818618758, 1.2189887913247606, 1.2165798888098445, 1.2142008985267645, 1.2118490613294699, 1.2095224251272247, 1.2072197387212373, 1.2049403399264105, 1.2026840444277536, 1.2004510469994603, 1.1982418345010981, 1.1960570980351861, 1.193897636427397, 1.1917642605613237, 1.1896577199459619, 1.1875786641737502, 1.1855276316931209, 1.1835050495935369, 1.1815112345167147, 1.1795463934300014, 1.1776106265030577, 1.1757039339740663, 1.1738262271461195, 1.1719773415756836, 1.1701570490888076, 1.1683650656420823, 1.1666010543322864, 1.1648646259465905, 1.1631553418270775, 1.1614727238391582, 1.159816272939947, 1.1581854925674488, 1.1565799088425048, 1.1549990790323528, 1.1534425843721159, 1.1519100119673313, 1.1504009370319632, 1.1489149153172875, 1.1474514881917852, 1.1460101962902676, 1.1445905955608737, 1.1431922707268907, 1.1418148433696298, 1.1404579739557925, 1.1391213589045848, 1.1378047249066361, 1.1365078228186574, 1.1352304225803518, 1.1339723091916494, 1.1327332786147208, 1.1315131325317769, 1.1303116727018621, 1.129128697391601, 1.1279640000381654, 1.1268173645341224, 1.125688552339376, 1.1245772877351339, 1.1234832529359777, 1.1224060955017718, 1.1213454407447809, 1.1203009020145847, 1.1192720866992043, 1.1182585990321365, 1.1172600414563303, 1.1162760158066067, 1.1153061249125147, 1.1143499746740229, 1.1134071762620816, 1.1124773478944678, 1.1115601156838246, 1.1106551133105651, 1.109761980608021, 1.1088803614288083, 1.1080099013410258, 1.1071502457703342, 1.1063010391303598, 1.1054619252523361, 1.1046325490947242, 1.1038125594211516, 1.1030016119876487, 1.102199372800905, 1.1014055211137059, 1.1006197518876439, 1.099841777387027, 1.099071327455218, 1.0983081481132342, 1.0975519985916935, 1.0968026475539097, 1.096059869599864, 1.0953234428639034, 1.0945931478521211, 1.0938687670937994, 1.0931500850048059, 1.0924368875430881, 1.0917289615794505, 1.0910260942221142, 1.0903280725035482, 1.0896346838014934, 1.0889457171502059, 1.0882609652920565, 1.0875802270155868, 1.0869033091336575, 1.086230027485366, 1.0855602066459946, 1.0848936784752525, 1.0842302799883912, 1.0835698511705798, 1.0829122333675838, 1.0822572689328098, 1.0816048028347429, 1.0809546865669697, 1.0803067836359184, 1.0796609744987244, 1.0790171583091168, 1.0783752501678237, 1.0777351750376751, 1.077096861090393, 1.0764602349121164, 1.0758252194733302, 1.0751917344413162, 1.0745596979027723, 1.0739290286610388, 1.0732996485481514, 1.0726714844028742, 1.0720444694848019, 1.0714185441922306, 1.0707936560938573, 1.0701697594840969, 1.069546814869184, 1.0689247888693718, 1.0683036548635729, 1.067683394292245, 1.0670639980542491, 1.0664454672164441, 1.0658278125234197, 1.0652110528039445, 1.0645952128962994, 1.0639803218363599, 1.0633664117910957, 1.0627535178374017, 1.062141678392349, 1.0615309359824288, 1.0609213380544953, 1.0603129376272311, 1.0597057937004795, 1.059099971446394, 1.0584955422727549, 1.0578925838755908, 1.0572911803838381, 1.0566914226604032, 1.056093408761855, 1.0554972444813817, 1.0549030438157876, 1.0543109291333297, 1.0537210308070788, 1.0531334861380459, 1.0525484375132343, 1.051966029890359, 1.0513864078358266, 1.0508097124522797, 1.0502360786107445, 1.0496656329174201, 1.0490984927453346, 1.048534766424797, 1.0479745543757453, 1.0474179507131238, 1.0468650447878249, 1.0463159222616423, 1.0457706655533487, 1.0452293536910855, 1.0446920616871853, 1.0441588595695492, 1.0436298112339213, 1.0431049733535251, 1.0425843946302029, 1.0420681156216847, 1.0415561692210145, 1.0410485816658777, 1.0405453738181549, 1.0400465624247983, 1.0395521611400957, 1.0390621812042471, 1.0385766317807619, 1.0380955200324926, 1.0376188510524549, 1.0371466277652333, 1.0366788508889602, 1.0362155190025168, 1.035756628717083, 1.0353021749107632, 1.0348521509636994, 1.0344065489285597, 1.033965359586313, 1.0335285723628342, 1.0330961751085501, 1.0326681537649411, 1.032244491956793, 1.0318251705569679, 1.0314101672782863, 1.0309994563529805, 1.0305930083666894, 1.0301907903094016, 1.0297927658861188, 1.0293988960779099, 1.0290091398705854, 1.0286234549911937, 1.0282417984653278, 1.0278641268555131, 1.027490396161286, 1.0271205614884114, 1.0267545766660147, 1.0263923939760065, 1.0260339640833804, 1.0256792361725586, 1.025328158239823, 1.0249806774823822, 1.0246367407462564, 1.0242962950318997, 1.0239592880771053, 1.0236256690188905, 1.0232953890632885, 1.0229684019919412, 1.0226446642750349, 1.0223241346293122, 1.0220067730632842, 1.0216925396832579, 1.0213813936334355, 1.0210732924533654, 1.0207681919311615, 1.0204660463491855, 1.0201668089368843, 1.0198704323601819, 1.0195768691413849, 1.0192860719751091, 1.0189979939579357, 1.0187125887729618, 1.0184298108645391, 1.0181496156102634, 1.0178719594666463, 1.0175968000553892, 1.0173240961842422, 1.0170538078432776, 1.0167858962492349, 1.0165203239941567, 1.016257055290557, 1.0159960562398798, 1.0157372950263281, 1.0154807419682743, 1.0152263694147861, 1.0149741515172488, 1.0147240639147328, 1.0144760833635691, 1.0142301873322612, 1.0139863535864049, 1.0137445597957562, 1.0135047832012307, 1.0132670003749706, 1.0130311870925197, 1.0127973183185108, 1.0125653682892954, 1.0123353106641431, 1.0121071187096238, 1.0118807654820536, 1.0116562239757707, 1.0114334672141922, 1.0112124682718955, 1.0109932002325812, 1.0107756361050577, 1.0105597487329532, 1.0103455107389132, 1.0101328945359083, 1.0099218724222196, 1.0097124167534657, 1.0095045001666456, 1.0092980958169087, 1.0090931775837759, 1.0088897202070772, 1.0086876993262779, 1.0084870914150255, 1.0082878736273264, 1.0080900235890782, 1.0078935191806888, 1.0076983383527967, 1.0075044590037692, 1.0073118589268937, 1.0071205158172463, 1.0069304073161987, 1.0067415110689479, 1.0065538047758109, 1.0063672662272705, 1.0061818733241701, 1.0059976040924121, 1.0058144367083062, 1.0056323495509816, 1.0054513212945597, 1.0052713310446155, 1.0050923585125551, 1.0049143842098001, 1.0047373896371437, 1.0045613574415475, 1.0043862715196188, 1.0042121170576026, 1.004038880511261, 1.0038665495416448, 1.0036951129285303, 1.0035245604846244, 1.0033548829887593, 1.0031860721493222, 1.003018120599984, 1.002851021922756, 1.0026847706856066, 1.0025193624754836, 1.0023547939041091, 1.0021910625619312, 1.002028166900663, 1.0018661060351635, 1.0017048794698791, 1.0015444867719352, 1.0013849272260538, 1.0012261995122478, 1.0010683014437343, 1.0009112297925207, 1.0007549802138946, 1.0005995472661762, 1.0004449245095435, 1.0002911046592902, 1.0001380797676203, 0.9999858414100472, 0.99983438085852716, 0.99968368923327633, 0.99953375763166263, 0.99938457724177199, 0.99923613945005552, 0.9990884359537916, 0.99894145888399755, 0.99879520093938268, 0.99864965552371987, 0.99850481687466541, 0.99836068016973611, 0.99821724159663661, 0.99807449838141071, 0.99793244877397425, 0.99779109199847449, 0.99765042817913308, 0.99751045825444917, 0.99737118389013746, 0.99723260739667097, 0.99709473165316542, 0.99695756003412883, 0.99682109633393534, 0.99668534468269765, 0.99655030945039214, 0.99641599513739676, 0.99628240625540199, 0.99614954720447146, 0.99601742215408884, 0.99588603493549255, 0.99575538895036741, 0.99562548709738907, 0.99549633171592122, 0.99536792454458245, 0.99524026669370802, 0.99511335863293704, 0.99498720019704523, 0.99486179061490332, 0.99473712856499319, 0.99461321225873955, 0.9944900395488242, 0.99436760805468172, 0.99424591529167339, 0.99412495878494844, 0.99400473614576945, 0.99388524508840381, 0.99376648337373574, 0.99364844868218172, 0.99353113844459451, 0.99341454969168552, 0.9932986790114503, 0.99318352271392063, 0.9930690772696108, 0.99295533999612229, 0.99284230982753063, 0.99272998787737532, 0.99261837749495008, 0.99250748367467789, 0.99239731195212655, 0.99228786714066108, 0.99217915229477005, 0.99207116812953411, 0.99196391290887898, 0.99185738266766832, 0.99175157159674154, 0.99164647246174809, 0.99154207698822672, 0.99143837619119579, 0.99133536064960859, 0.99123302073174235, 0.99113134677604686, 0.9910303292307715, 0.99092995875439838, 0.99083022628147599, 0.99073112305880751, 0.99063264065933998, 0.99053477098084486, 0.99043750623721682, 0.99034083894872138, 0.99024476193655564, 0.99014926832534766, 0.9900543515549779, 0.98996000540164542, 0.98986622400575464, 0.98977300190298068, 0.98968033405451761, 0.98958821587348234, 0.98949664324647346, 0.989405612553383, 0.98931512069216554, 0.98922516511817671, 0.98913574390798842, 0.98904685585268914, 0.98895850057668055, 0.98887067866619538, 0.98878339177911956, 0.98869664270247815, 0.98861043532685988, 0.98852477452088383, 0.98843966591059385, 0.98835511558750855, 0.98827112978420828, 0.98818771455859133, 0.98810487552255533, 0.98802261764064314, 0.98794094511165631, 0.98785986133580728, 0.98777936895802032, 0.98769946996701985, 0.98762016581988155, 0.98754145755824674, 0.98746334588764595, 0.98738583120704493, 0.98730891359471307, 0.98723259277562525, 0.98715686810213243, 0.98708173857521297, 0.98700720291900657, 0.98693325970213719, 0.98685990748368924, 0.98678714495052, 0.98671497101266792, 0.98664338483178859, 0.98657238577711837, 0.98650197332554801, 0.98643214694261117, 0.98636290598962939, 0.98629424969437385, 0.986226177202983, 0.98615868770675152, 0.98609178062032887, 0.98602545577922107, 0.98595971362946278, 0.98589455539070947, 0.9858299831843198, 0.9857660001267976, 0.98570261039174867, 0.98563981924475341, 0.98557763305319623, 0.98551605927178387, 0.98545510640310929, 0.9853947839335877, 0.98533510224634591, 0.98527607251499127, 0.98521770658403784, 0.98516001684355525, 0.98510301610638906, 0.98504671749790607, 0.98499113436860186, 0.98493628023859892, 0.98488216877764467, 0.98482881381557408, 0.9847762293637643, 0.98472442961500617, 0.98467342887831222, 0.98462324140512958, 0.98457388107775567, 0.98452536095989285, 0.98447769274867969, 0.98443088620464081, 0.98438494865844572, 0.98433988469113221, 0.9842956960600725, 0.98425238191220765, 0.98420993930135658, 0.98416836401993957, 0.98412765175000338, 0.98408779950863745, 0.98404880726439925, 0.98401067942002751, 0.98397342564532519, 0.98393706046608764, 0.98390160126983195, 0.9838670650005612, 0.9838334644629716, 0.98380080536161207, 0.98376908478271319, 0.98373829110422717, 0.98370840479282129, 0.98367939945622296, 0.98365124275133986, 0.9836238970574569, 0.98359732003295675, 0.98357146523981243, 0.98354628297395719, 0.98352172133845017, 0.98349772749095155, 0.98347424893048219, 0.98345123468787587, 0.98342863634539346, 0.98340640888788911, 0.98338451140903338, 0.9833629076123569, 0.98334156589737232, 0.983320458737025, 0.98329956118957695, 0.98327884874836202, 0.9832582950985358, 0.98323787043070388, 0.98321754068998657, 0.98319726772322436, 0.98317701000401736, 0.98315672356565875, 0.98313636288541573, 0.98311588160976127, 0.98309523312124436, 0.98307437101271034, 0.98305324957655149, 0.98303182445747417, 0.98301005365387051, 0.98298789904996442, 0.98296532855069918, 0.98294231859996095, 0.98291885641441179, 0.98289494089181617, 0.98287058126957882, 0.98284579344743483, 0.9828205950616864, 0.98279500106129825, 0.98276902116882359, 0.9827426595655977, 0.98271591620632359, 0.98268878882649968, 0.98266127487915089, 0.98263337300465992, 0.98260508394574919, 0.98257641098991788, 0.98254736007504873, 0.98251793968534018, 0.98248816063249078, 0.98245803578454782, 0.98242757977829676, 0.98239680873474988, 0.9823657399861031, 0.982334391818382, 0.98230278323127995, 0.98227093371711482, 0.98223886306024988, 0.98220659115929765, 0.98217413787299779, 0.9821415228908269, 0.98210876562768856, 0.9820758851412984, 0.98204290007010386, 0.98200982858905606, 0.98197668838029395, 0.98194349661623825, 0.98191026995272046, 0.98187702452989911, 0.98184377597959116, 0.98181053943705465, 0.98177732955589825, 0.98174416052443392, 0.98171104608210347, 0.98167799953407719, 0.98164503376336087, 0.98161216123905781, 0.98157939402103966, 0.9815467437610933, 0.98151422170147429, 0.9814818386718861, 0.98144960508664969, 0.98141753094324591, 0.9813856258238921, 0.98135389890164992, 0.98132235895236553, 0.9812910143737068, 0.98125987321175734, 0.98122894319532405, 0.98119823177741639, 0.98116774618238622, 0.98113749345681966, 0.98110748052231778, 0.98107771422844614, 0.98104820140555837, 0.98101894891963926, 0.98098996373424241, 0.98096125298776482, 0.98093282409604043, 0.98090468488658378, 0.98087684376119388, 0.98084930986379382, 0.98082209320941038, 0.9807952047134072, 0.98076865606451802, 0.98074245941741878, 0.9807166269287596, 0.98069117021053875, 0.98066609979735009, 0.98064142471451743, 0.9806171521999516, 0.98059328759230191, 0.98056983436655376, 0.98054679428315483, 0.98052416761387362, 0.98050195341205504, 0.9804801498016793, 0.98045875426501106, 0.98043776391431736, 0.98041717573524145, 0.98039698679385423, 0.98037719440177806, 0.98035779623647068, 0.98033879041828587, 0.98032017554761031, 0.98030195070967274, 0.98028411545599148, 0.98026666977224197, 0.98024961404330679, 0.98023294902287117, 0.98021667581504401, 0.98020079587110065, 0.98018531100263628, 0.98017022340974091, 0.98015553571969349, 0.98014125102962613, 0.98012737294391583, 0.98011390559482203, 0.98010085363405841, 0.98008822218351854, 0.9800760167368634, 0.9800642430087938, 0.98005290673761525, 0.98004201345466169, 0.98003156824203952, 0.98002157550521685, 0.98001203878705412, 0.98000296064580916, 0.97999434260882512, 0.97998618520005987, 0.97997848802670517, 0.97997124990239437, 0.97996446898461387, 0.97995814290933603, 0.97995226891480813, 0.97994684395349252, 0.97994186479759915, 0.97993732814603218, 0.97993323074295668, 0.97992956951594823, 0.97992634174031323, 0.97992354523218828, 0.97992117856732563, 0.97991924131691144, 0.97991773428549134, 0.97991665972861197, 0.97991602152153767, 0.97991582524335763, 0.9799160781389703, 0.97991678892660883, 0.97991796743785298, 0.97991962410777456, 0.97992176937059094, 0.97992441304277478, 0.97992756377940404, 0.97993122866742299, 0.97993541298072351, 0.97994012008472964, 0.97994535145593764, 0.979951106777321, 0.97995738407938182, 0.97996417990855289, 0.97997148951553559, 0.97997930705897252, 0.97998762582088261, 0.9799964384269918, 0.98000573706308669, 0.98001551367825945, 0.98002576016710363, 0.98003646852631443, 0.98004763098440517, 0.98005924010704804, 0.98007128888402817, 0.98008377080523912, 0.98009667993545591, 0.98011001099693484, 0.98012375946835595, 0.98013792170500924, 0.98015249508115287, 0.9801674781480465, 0.98018287079463973, 0.98019867439135933, 0.98021489189459765, 0.98023152789170731, 0.98024858857475206, 0.9802660816432226, 0.98028401614995264, 0.98030240231470367, 0.98032125133429515, 0.98034057521552087, 0.98036038664743863, 0.98038069891754898, 0.98040152586213769, 0.98042288183034065, 0.98044478163337978, 0.98046724044816636, 0.98049027364684449, 0.98051389653101351, 0.98053812396308915, 0.98056296990254366, 0.98058844687377289, 0.98061456541002756, 0.98064133353011029, 0.98066875630952866, 0.98069683559992671, 0.98072556993355708, 0.98075495462358497, 0.9807849820443264, 0.98081564205284144, 0.98084692250017824, 0.98087880977718722, 0.98091128934785299, 0.98094434623499016, 0.98097796543953319, 0.98101213229014739, 0.98104683273320992, 0.98108205358383316, 0.98111778276547801, 0.98115400956944421, 0.98119072496194393, 0.98122792195531505, 0.9812655960342257, 0.98130374558323796, 0.98134237219980724, 0.98138148070550757, 0.98142107862068828, 0.98146117489514972, 0.98150177784431092, 0.98154289253579963, 0.98158451821521164, 0.98162664656025178, 0.98166926142343247, 0.98171234024763354, 0.98175585674217047, 0.9817997840133017, 0.98184409732862188, 0.9818887759895979, 0.98193380417182918, 0.98197917089015785, 0.98202486937935185, 0.98207089618360988, 0.98211725017626494, 0.98216393164599269, 0.98221094151328869, 0.98225828069720023, 0.98230594962977102, 0.98235394790792596, 0.98240227407153324, 0.98245092549602986, 0.98249989838701479, 0.98254918786129564, 0.98259878809702628, 0.98264869253268838, 0.98269889409594269, 0.98274938544300705, 0.98280015919188235, 0.98285120813413762, 0.98290252541112577, 0.98295410464119082, 0.98300593998515962, 0.98305802614238669, 0.98311035827661808, 0.98316293188292425, 0.98321574261876132, 0.98326878612989677, 0.98332205790246774, 0.9833755531629349, 0.98342926683551701, 0.98348319355146274, 0.9835373276951237, 0.9835916634671984, 0.98364619494719485, 0.98370091614139876, 0.98375582100939429, 0.98381090346614586, 0.98386615736277927, 0.98392157644994072, 0.98397715432996347, 0.98403288440486358, 0.98408875982586386, 0.9841447734506189, 0.98420091781240582, 0.9842571851051507, 0.98431356718608731, 0.9843700555977889, 0.98442664160966575, 0.98448331627861307, 0.98454007052806536, 0.98459689524479155, 0.98465378139150728, 0.98471072013379723, 0.98476770297820759, 0.9848247219172086, 0.98488176957475027, 0.98493883934297877, 0.98499592549808768, 0.98505302327917632, 0.985110128911868, 0.98516723955745944, 0.9852243531719368, 0.9852814682687856, 0.98533858359583526, 0.98539569775626623, 0.98545280882206665, 0.98550991399660581, 0.98556700937614572, 0.98562408983937377, 0.98568114906649817, 0.98573817966450816, 0.98579517336119837, 0.98585212122703803, 0.98590901389295482, 0.98596584174234247, 0.98602259506821355, 0.98607926419547598, 0.98613583957275264, 0.98619231184129708, 0.98624867188736598, 0.98630491088366101, 0.98636102032303674, 0.98641699204626465, 0.9864728182641227, 0.98652849157321498, 0.98658400496463672, 0.986639351824254, 0.98669452592476203, 0.98674952140914796, 0.98680433276692603, 0.98685895480503383, 0.98691338261630557, 0.98696761154943546, 0.98702163718492375, 0.98707545532281604, 0.98712906198765593, 0.98718245345652078, 0.98723562631395034, 0.98728857753444799, 0.98734130458775182, 0.98739380555404055, 0.98744607922848227, 0.98749812518795776, 0.98754994379364713, 0.98760153611071921, 0.98765290374405368, 0.98770404860916627, 0.9877549726756033, 0.98780567772735695, 0.98785616518101393, 0.98790643598522154, 0.98795649060653312, 0.9880063290880261, 0.98805595115612999, 0.98810535634913421, 0.98815454414376647, 0.98820351406464391, 0.98825226576876313, 0.98830079910417523, 0.98834911414613302, 0.98839721121535096, 0.98844509088341626, 0.98849275396959047, 0.98854020153064137, 0.98858743484596745, 0.9886344553979054, 0.98868126484800489, 0.98872786500953536, 0.98877425781684225, 0.98882044529356705, 0.98886642952018555, 0.9889122126033707, 0.98895779664822747, 0.98900318373453744, 0.98904837589804795, 0.98909337511667672, 0.9891381833018893, 0.98918280229438771, 0.98922723386406386, 0.98927147971263751, 0.98931554147886036, 0.98935942074527117, 0.98940311904589051, 0.9894466378742639, 0.98948997869159372, 0.9895331429345402, 0.98957613202272765, 0.98961894736549894, 0.98966159036844792, 0.98970406243904396, 0.98974636499193169, 0.98978849945355396, 0.98983046726597057, 0.98987226988966981, 0.98991390880517904], 'Rp': [0.010314371260624813, 0.12547736633893308, 0.62731037587335559, 0.85327312428848456, 0.85954452845412632, 0.86441350368822778, 0.87079997076889792, 0.87986769682240551, 0.88710323301027982, 0.89173099848211379, 0.89675288685452648, 0.90188737227061277, 0.90537346312193301, 0.90810985125933807, 0.91104892656803282, 0.9137235702369686, 0.91576748226486271, 0.91761622306103707, 0.91956682969845549, 0.92154555763384782, 0.92334602292163015, 0.92488237787216332, 0.92617884862606881, 0.92728060215188179, 0.92823064615857043, 0.929067639239882, 0.9298248077945469, 0.93052581197765805, 0.93118523330384451, 0.9318117047566864, 0.93240951866995303, 0.93297977540723942, 0.93352186275818272, 0.93403529969064147, 0.93452103932531561, 0.93498171636048211, 0.93542104677026872, 0.93584291608064851, 0.93625063130039132, 0.93664653380219332, 0.9370319765806564, 0.93740755851340907, 0.93777346106194992, 0.9381297624228504, 0.93847666672055208, 0.93881462170054708, 0.93914432047870944, 0.93946661765556161, 0.93978240969423155, 0.94009248562426007, 0.94039723975460865, 0.94069660170246427, 0.94099062913950127, 0.94127968453700883, 0.94156408669838998, 0.94184387321720364, 0.94211872270363095, 0.94238804512736063, 0.94265115118093479, 0.94290728341937624, 0.94315561960912353, 0.94339533804332676, 0.94362570582259975, 0.94384615935541305, 0.94405635887566897, 0.94425620750569528, 0.94444584393963216, 0.94462561945660417, 0.94479606155017604, 0.94495782857736577, 0.94511166315332851, 0.9452583493794906, 0.94539867479107631, 0.94553339674026549, 0.94566321764100947, 0.94578877771328618, 0.94591066013183389, 0.94602939041906375, 0.94614542903149845, 0.94625916784425512, 0.94637093273851414, 0.94648098924570101, 0.94658954915562943, 0.94669677702032384, 0.94680279585908622, 0.9469076920579993, 0.94701152010877798, 0.94711430768855609, 0.9472160608349508, 0.94731676858515113, 0.94741640693325568, 0.94751494263232383, 0.94761233737350981, 0.94770855214402716, 0.94780355081210144, 0.94789730215817958, 0.9479897805227302, 0.94808096580382994, 0.94817084333298796, 0.94825940374777185, 0.94834664277960479, 0.94843256087070726, 0.94851716261161478, 0.94860045608969457, 0.948682452304626, 0.94876316478479827, 0.94884260942805076, 0.94892080444974747, 0.94899777022007514, 0.94907352878256845, 0.94914810299900476, 0.94922151550031064, 0.94929378780324369, 0.94936493996729432, 0.94943499095548711, 0.94950395947799615, 0.9495718648084942, 0.94963872712880293, 0.94970456729359509, 0.94976940620202499, 0.94983326405908131, 0.94989615975472208, 0.94995811049091849, 0.95001913168998309, 0.95007923713561016, 0.95013843924561947, 0.95019674937017828, 0.95025417804903933, 0.95031073522748777, 0.95036643047900315, 0.95042127326224579, 0.95047527312927771, 0.95052843972071299, 0.95058078257304013, 0.95063231116767433, 0.9506830356213769, 0.95073296767858062, 0.95078212122317896, 0.95083051203087221, 0.95087815713199464, 0.95092507422434458, 0.95097128130923636, 0.95101679651599158, 0.95106163802355914, 0.951105824006101, 0.95114937256564958, 0.9511923016442132, 0.95123462892998034, 0.95127637178150171, 0.9513175471929608, 0.95135817181108029, 0.95139826199897759, 0.95143783393000025, 0.95147690368662574, 0.9515154873384658, 0.95155360097661945, 0.95159126069269551, 0.95162848250390542, 0.95166528223839819, 0.95170167539878414, 0.95173767702320322, 0.95177330155637296, 0.9518085627425642, 0.95184347355533494, 0.9518780461846531, 0.95191229209757333, 0.95194622216701708, 0.95197984683262826, 0.95201317624431347, 0.95204622035461861, 0.95207898895920573, 0.95211149171091014, 0.9521437381364134, 0.95217573767188146, 0.95220749971363305, 0.95223903366674123, 0.95227034896985197, 0.95230145507980268, 0.95233236141064648, 0.95236307723773839, 0.95239361158825375, 0.95242397314930305, 0.9524541702211663, 0.95248421072999201, 0.95251410229437272, 0.9525438523231694, 0.95257346811700994, 0.95260295694288255, 0.9526323260491486, 0.95266158258522315, 0.95269073340891663, 0.9527197848140958, 0.95274874228110218, 0.9527776103783262, 0.95280639288139934, 0.95283509305965119, 0.95286371399889225, 0.95289225884319517, 0.95292073090688856, 0.95294913367382694, 0.95297747072567129, 0.95300574563936247, 0.9530339618803938, 0.95306212270954449, 0.95309023111433999, 0.95311828977185364, 0.95314630104328535, 0.95317426699087138, 0.95320218939868218, 0.95323006977513902, 0.95325790932157328, 0.95328570887092345, 0.95331346882244017, 0.95334118910798549, 0.95336886921433572, 0.95339650825666789, 0.95342410507478492, 0.95345165831759138, 0.95347916649365694, 0.95350662798290287, 0.95353404101874806, 0.95356140365466724, 0.95358871372919052, 0.95361596883802668, 0.95364316631720392, 0.95367030323553292, 0.95369737639248309, 0.95372438231561096, 0.9537513172530856, 0.95377817715811686, 0.95380495766550499, 0.95383165406340142, 0.9538582612683224, 0.95388477381370762, 0.95391118586378598, 0.95393749126096006, 0.95396368361033146, 0.95398975639671757, 0.95401570312345896, 0.95404151745706334, 0.95406719335768042, 0.95409272517530297, 0.95411810769627736, 0.95414333613596813, 0.95416840608800013, 0.95419331345094816, 0.95421805435731755, 0.95424262512186198, 0.95426702221555992, 0.95429124226279372, 0.95431528205577532, 0.95433913858186703, 0.95436280905958726, 0.95438629097751615, 0.95440958212716676, 0.95443268061980568, 0.95445558488143856, 0.95447829362612691, 0.95450080581489727, 0.95452312061022415, 0.95454523733580932, 0.95456715544698179, 0.95458887451388108, 0.95461039421467697, 0.95463171433501737, 0.95465283476895157, 0.95467375551762046, 0.95469447668361496, 0.95471499846120456, 0.95473532112409243, 0.95475544501372633, 0.95477537053065686, 0.95479509813151153, 0.9548146283321719, 0.95483396171732871, 0.9548530989551961, 0.95487204081549237, 0.95489078818883133, 0.95490934210497247, 0.95492770374705349, 0.95494587445922374, 0.95496385574429232, 0.95498164924976103, 0.95499925674231889, 0.95501668007510421, 0.95503392115418517, 0.9550509819137637, 0.95506786430604407, 0.95508457030652283, 0.95510110192994835, 0.95511746124842423, 0.95513365040415144, 0.95514967161242315, 0.95516552715480352, 0.95518121936479783, 0.95519675060903431, 0.95521212326606664, 0.95522733970336993, 0.9552424022523861, 0.95525731318136875, 0.95527207466964259, 0.955286688789446, 0.955301157504725, 0.95531548269210798, 0.95532966618193649, 0.95534370980765626, 0.95535761544789966, 0.95537138505059871, 0.95538502063655661, 0.95539852428684602, 0.95541189812251315, 0.95542514428296221, 0.95543826490797434, 0.95545126212392884, 0.95546413803394592, 0.95547689470965558, 0.9554895341835381, 0.95550205844120295, 0.95551446941535179, 0.95552676898260802, 0.95553895896403884, 0.95555104112739786, 0.95556301718750802, 0.95557488880219943, 0.95558665756321004, 0.95559832498510799, 0.9556098924965224, 0.95562136143617915, 0.9556327330554919, 0.95564400852609499, 0.95565518895193724, 0.95566627538432503, 0.95567726883919912, 0.955688170315805, 0.95569898081479021, 0.95570970135383737, 0.9557203329795525, 0.95573087677389612, 0.95574133385564985, 0.95575170537729737, 0.95576199251826399, 0.95577219647691858, 0.95578231846205386, 0.95579235968600018, 0.95580232136032095, 0.95581220469448358, 0.95582201089781871, 0.95583174118332137, 0.95584139677186475, 0.95585097889498605, 0.95586048879448204, 0.95586992771797397, 0.95587929691110618, 0.95588859760692457, 0.95589783101468717, 0.95590699831011072, 0.95591610062865506, 0.95592513906358101, 0.95593411466860878, 0.95594302846509682, 0.95595188145150489, 0.9559606746135848, 0.95596940893292259, 0.95597808539258977, 0.95598670497942073, 0.955995268683417, 0.95600377749516152, 0.95601223240266353, 0.95602063438848062, 0.95602898442758721, 0.95603728348647854, 0.95604553252265045, 0.95605373248415404, 0.95606188430825478, 0.95606998891845218, 0.95607804721976908, 0.95608606009199537, 0.95609402838233026, 0.95610195289730571, 0.95610983439647901, 0.95611767358777822, 0.9561254711253625, 0.95613322761035635, 0.95614094359292856, 0.95614861957563535, 0.95615625601669973, 0.95616385333247833, 0.9561714118986071, 0.95617893205005189, 0.95618641407967964, 0.95619385823649228, 0.9562012647239585, 0.95620863369967601, 0.95621596527725339, 0.95622325953143728, 0.95623051650670055, 0.95623773622937014, 0.95624491872193795, 0.95625206401834073, 0.9562591721780761, 0.95626624329793242, 0.95627327751958213, 0.95628027503312185, 0.9562872360762108, 0.95629416092995312, 0.9563010499123703, 0.95630790337048099, 0.95631472167253895, 0.9563215052005728, 0.9563282543439614, 0.9563349694938984, 0.95634165103859625, 0.95634829935835297, 0.95635491482074986, 0.95636149777492485, 0.95636804854545221, 0.95637456742622662, 0.95638105467447587, 0.95638751050612802, 0.95639393509244541, 0.95640032855903157, 0.95640669098640263, 0.9564130224122307, 0.95641932283487585, 0.95642559221716827, 0.95643183049039915, 0.9564380375579592, 0.95644421329876772, 0.95645035757034891, 0.95645647021197289, 0.95646255104800271, 0.9564685998917235, 0.95647461654953458, 0.95648060082567354, 0.95648655252683668, 0.95649247146715644, 0.95649835747258327, 0.95650421038497446, 0.95651003006586599, 0.9565158163995775, 0.95652156929616583, 0.95652728869371328, 0.95653297456001762, 0.95653862689328462, 0.95654424572137586, 0.95654983109965175, 0.95655538310721322, 0.95656090184154297, 0.95656638741239541, 0.9565718399352493, 0.95657725952525707, 0.95658264629320755, 0.95658800034382441, 0.95659332177781753, 0.95659861069715912, 0.95660386721227053, 0.95660909144880413, 0.9566142835496424, 0.95661944366767926, 0.95662457194657902, 0.95662966849049336, 0.95663473333025717, 0.9566397663988998, 0.95664476753024441, 0.95664973648637341, 0.95665467300822027, 0.95665957687285286, 0.95666444794021632, 0.95666928617915326, 0.956674091671747, 0.95667886460271223, 0.95668360524121898, 0.9566883139213912, 0.9566929910242824, 0.95669763696267018, 0.95670225216818505, 0.95670683708117621, 0.95671139214239509, 0.95671591778667786, 0.956720414438466, 0.9567248825089717, 0.95672932239444031, 0.95673373447577459, 0.95673811911857087, 0.95674247667366352, 0.9567468074776162, 0.95675111185310091, 0.95675539010901189, 0.95675964254002066, 0.95676386942590941, 0.95676807103045858, 0.95677224760043666, 0.95677639936431358, 0.95678052653140566, 0.95678462929112007, 0.95678870781223302, 0.95679276224197907, 0.95679679270433582, 0.95680079929727702, 0.95680478208859632, 0.95680874111049985, 0.95681267635384992, 0.95681658776315881, 0.95682047523388503, 0.95682433861330773, 0.9568281777058375, 0.95683199228247129, 0.95683578209289555, 0.95683954687889994, 0.95684328638750005, 0.95684700038152581, 0.95685068864781209, 0.9568543510017824, 0.9568579872890125, 0.9568615973839607, 0.95686518118687036, 0.95686873861964672, 0.956872269622289, 0.95687577415063474, 0.95687925217581538, 0.9568827036850529, 0.95688612868298184, 0.95688952719189702, 0.95689289925011212, 0.95689624490794367, 0.95689956422172073, 0.95690285724684732, 0.95690612403118669, 0.9569093646104494, 0.95691257900677507, 0.95691576723066141, 0.95691892928550915, 0.95692206517338596, 0.95692517489958351, 0.95692825847450547, 0.95693131591207314, 0.9569343472245766, 0.95693735241538869, 0.95694033147074242, 0.95694328435184695, 0.95694621098819332, 0.95694911127228111, 0.9569519850559588, 0.95695483214803656, 0.95695765231285201, 0.95696044527015733, 0.95696321069554469, 0.95696594822209624, 0.95696865744271686, 0.95697133791344646, 0.95697398915755671, 0.95697661067016393, 0.95697920192340624, 0.95698176237145305, 0.95698429145552255, 0.95698678860793285, 0.95698925325516015, 0.95699168481921437, 0.95699408271747821, 0.95699644636186976, 0.95699877515825571, 0.95700106850798894, 0.95700332581344993, 0.95700554648927383, 0.95700772997969952, 0.95700987578075813, 0.9570119834648223, 0.95701405270299622, 0.95701608328135102, 0.95701807510719572, 0.95702002820278775, 0.95702194268542262, 0.95702381873251852, 0.95702565653158256, 0.95702745621533225, 0.95702921778773586, 0.95703094105443987, 0.95703262558143676, 0.95703427070991198, 0.95703587564387693, 0.95703743959910015, 0.95703896197191873, 0.95704044247572739, 0.95704188121209099, 0.95704327867673455, 0.95704463572431442, 0.957045953521236, 0.95704723350477205, 0.9570484773527469, 0.95704968695847381, 0.95705086440298959, 0.95705201191802403, 0.95705313183847029, 0.95705422654740535, 0.95705529841936454, 0.95705634976796194, 0.95705738280003694, 0.95705839957554295, 0.9570594019706602, 0.95706039164772405, 0.95706137004129943, 0.95706233837770227, 0.95706329773665244, 0.95706424914896371, 0.95706519370364007, 0.95706613263319618, 0.9570670673568078, 0.95706799948119559, 0.95706893077235344, 0.95706986311611808, 0.95707079847891663, 0.95707173887561858, 0.95707268634406228, 0.95707364292379093, 0.95707461063460508, 0.95707559144690368, 0.95707658723584688, 0.95707759971025186, 0.95707863031219542, 0.95707968009738331, 0.95708074962769529, 0.95708183892507281, 0.95708294753168033, 0.95708407468131096, 0.9570852195315197, 0.957086381373907, 0.95708755975555582, 0.95708875449547048, 0.9570899656227233, 0.95709119328097747, 0.95709243763585372, 0.95709369880383588, 0.95709497680783995, 0.95709627155492527, 0.95709758283046342, 0.95709891030215366, 0.95710025352959405, 0.95710161197654497, 0.95710298502387525, 0.95710437198251963, 0.95710577210590408, 0.957107184601657, 0.95710860864270997, 0.95711004337745353, 0.9571114879389846, 0.95711294145351289, 0.95711440304751516, 0.95711587185396407, 0.95711734701716955, 0.95711882769685042, 0.95712031307096634, 0.95712180233792088, 0.95712329471783752, 0.95712478945337476, 0.95712628581001458, 0.95712778307598156, 0.95712928056188673, 0.95713077760012877, 0.95713227354429964, 0.95713376776826264, 0.95713525966557, 0.95713674864859999, 0.95713823414804644, 0.95713971561238431, 0.95714119250757745, 0.95714266431690287, 0.95714413054070047, 0.95714559069660554, 0.95714704431943964, 0.95714849096122911, 0.95714993019123507, 0.95715136159574921, 0.95715278477787025, 0.95715419935692525, 0.95715560496777341, 0.9571570012596915, 0.95715838789509766, 0.95715976454822183, 0.95716113090317489, 0.95716248665252079, 0.95716383149541751, 0.95716516513589445, 0.95716648728089293, 0.95716779763771465, 0.95716909591053589, 0.95717038179526859, 0.95717165497233325, 0.95717291509768798, 0.95717416179288139, 0.95717539463681478, 0.95717661316167701, 0.95717781685692283, 0.95717900518206689, 0.95718017758780705, 0.95718133354169144, 0.95718247255410405, 0.95718359419967536, 0.95718469813187546, 0.95718578408947985, 0.95718685189623565, 0.95718790145446697, 0.95718893273525585, 0.9571899457659222, 0.95719094061686583, 0.95719191738801468, 0.957192876196307, 0.95719381716426122, 0.95719474041040209, 0.95719564604180218, 0.95719653414835204, 0.95719740479964854, 0.95719825804330128, 0.95719909390515046, 0.95719991239028124, 0.95720071348485258, 0.95720149715802683, 0.95720226336360659, 0.95720301204109071, 0.95720374311601497, 0.95720445649939279, 0.95720515208658541, 0.95720582975529767, 0.95720648936377761, 0.95720713074877295, 0.95720775372446387, 0.95720835808255111, 0.95720894359426389, 0.95720951001453392, 0.95721005708839224, 0.95721058455967967, 0.95721109218135547, 0.95721157972617044, 0.95721204699688223, 0.95721249383474083, 0.95721292012497006, 0.95721332579906859, 0.95721371083345796, 0.95721407524559177, 0.9572144190883527, 0.95721474244363569, 0.95721504541641711, 0.95721532812895704, 0.95721559071603102, 0.9572158333205244, 0.95721605608882743, 0.95721625916623587, 0.95721644269113559, 0.95721660678842069, 0.95721675156131414, 0.9572168770821825, 0.95721698338220673, 0.95721707044096638, 0.95721713817621645, 0.95721718643563058, 0.9572172149916871, 0.95721722354133676, 0.95721721171262608, 0.95721717907855253, 0.95721712517830515, 0.95721704954316078, 0.95721695172431143, 0.95721683131771917, 0.95721668798397308, 0.95721652146049674, 0.95721633156758357, 0.9572161182084804, 0.95721588136618907, 0.95721562109768066, 0.95721533752692489, 0.95721503083675297, 0.95721470126031516, 0.95721434907154956, 0.95721397457595581, 0.95721357810100915, 0.9572131599874637, 0.9572127205814307, 0.95721226022739248, 0.95721177926269929, 0.95721127801276662, 0.95721075678732359, 0.95721021587695421, 0.95720965554985582, 0.95720907604793271, 0.95720847758247096, 0.95720786032836946, 0.95720722441779604, 0.95720656993247988, 0.95720589689635827, 0.95720520526831576, 0.95720449493713666, 0.95720376571880694, 0.95720301735728963, 0.95720224952858668, 0.95720146184768029, 0.95720065387718278, 0.95719982513645996, 0.95719897510976137, 0.9571981032528184, 0.95719720899724814, 0.95719629175324072, 0.95719535091125152, 0.95719438584395455, 0.95719339590977603, 0.95719238045910193, 0.95719133884443441, 0.95719027043475424, 0.95718917463409392, 0.95718805090296022, 0.95718689878166097, 0.95718571791238771, 0.95718450805807209, 0.95718326911566476, 0.95718200112176544, 0.95718070425022839, 0.95717937880229198, 0.95717802519015494, 0.95717664391655044, 0.95717523555233242, 0.95717380071411162, 0.95717234004335638, 0.95717085418827619, 0.95716934378803575, 0.95716780945975333, 0.95716625178672632, 0.95716467130749305, 0.95716306850386246, 0.95716144378690715, 0.95715979748049029, 0.95715812980218995, 0.95715644084423956, 0.95715473055892553, 0.95715299875671134, 0.95715124512699423, 0.95714946929029276, 0.95714767088544639, 0.95714584968199701, 0.95714400569361058, 0.95714213925927083, 0.95714025106183342, 0.9571383420739632, 0.95713641344660128, 0.95713446637374455, 0.95713250196944999, 0.95713052118162645, 0.95712852475038634, 0.95712651320529207, 0.9571244868895501, 0.95712244599818364, 0.95712039062021237, 0.95711832077876646, 0.95711623646584465, 0.95711413767040587, 0.95711202440039156, 0.95710989669822299, 0.95710775465094899, 0.9571055983948521, 0.95710342811587434, 0.95710124404559782, 0.95709904645419053, 0.95709683564137482, 0.95709461192580747, 0.95709237563440497, 0.95709012709209595, 0.95708786661274947, 0.95708559449209918, 0.9570833110029705, 0.95708101639333554, 0.95707871088740959, 0.95707639468989969, 0.95707406799246997, 0.95707173098161902, 0.95706938384665596, 0.95706702678601896, 0.95706466001142454, 0.95706228374924907, 0.95705989823938109, 0.95705750373272958, 0.95705510048771758, 0.95705268876712501, 0.95705026883556044, 0.95704784095808559, 0.9570454054000932, 0.95704296242815645, 0.95704051231177034, 0.95703805532563613, 0.9570355917522072, 0.95703312188418765, 0.95703064602678167, 0.95702816449926287, 0.95702567763587287, 0.9570231857860716, 0.95702068931371631, 0.95701818859529786, 0.9570156840174735, 0.95701317597361268, 0.9570106648594443, 0.95700815106804027, 0.95700563498417446, 0.95700311697819918, 0.95700059739938192, 0.9569980765696825, 0.95699555477761056, 0.95699303227341614, 0.95699050926558671, 0.95698798592027357, 0.95698546236355631, 0.95698293868793471, 0.95698041496255326, 0.95697789124737198, 0.95697536760925017, 0.95697284413855399, 0.95697032096339085, 0.95696779825975986, 0.95696527625609817, 0.956962755232586, 0.95696023551562792, 0.95695771746979041, 0.95695520148821489, 0.95695268798346045, 0.95695017737919319, 0.95694767010361415, 0.95694516658409279, 0.95694266724317667, 0.95694017249570107, 0.95693768274633695, 0.95693519838788932, 0.95693271979954475, 0.95693024734573751, 0.95692778137499268, 0.9569253222191294, 0.9569228701926118, 0.95692042559255786, 0.95691798869872335, 0.95691555977417309, 0.9569131390660871, 0.95691072680699185, 0.9569083232159824, 0.95690592849997591, 0.95690354285486179, 0.95690116646592716, 0.95689879950815415, 0.9568964421447369, 0.95689409452534935, 0.95689175678276073, 0.95688942902857688, 0.95688711134870219, 0.95688480379896201, 0.9568825064024814, 0.95688021914960197, 0.95687794200113319, 0.95687567489515835, 0.95687341775662893, 0.95687117050793025, 0.95686893307896592, 0.95686670541466623, 0.95686448747923181, 0.95686227925662093, 0.95686008074814244, 0.95685789196796245, 0.95685571293739458, 0.95685354367985576, 0.95685138421596116, 0.95684923456005733, 0.95684709471761176, 0.95684496468378633, 0.95684284444254353, 0.95684073396645564, 0.9568386332169555, 0.95683654214468072, 0.9568344606903143, 0.95683238878533294, 0.9568303263532103, 0.95682827331072928, 0.95682622956924801, 0.95682419503626237, 0.9568221696168776, 0.9568201532150673, 0.95681814573504653, 0.95681614708227924, 0.95681415716424856, 0.95681217589111722, 0.95681020317609689, 0.95680823893555511, 0.95680628308907212, 0.95680433555927946, 0.95680239627164909, 0.95680046515414785, 0.956798542136993, 0.95679662715219338, 0.95679472013334543, 0.95679282101518937, 0.95679092973334046, 0.95678904622411776, 0.9567871704241343, 0.95678530227018677, 0.95678344169904006, 0.95678158864726126, 0.95677974305104219, 0.95677790484615644, 0.95677607396786546]}
 '''
 
 plt.figure()
-plt.plot(BNMF.all_performances['MSE'])
+plt.plot(performances_sink.values['MSE'])
 plt.ylim(0,10)
\ No newline at end of file
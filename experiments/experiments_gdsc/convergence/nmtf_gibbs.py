@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.bnmtf_gibbs_optimised import bnmtf_gibbs_optimised
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import numpy, matplotlib.pyplot as plt
@@ -36,15 +37,16 @@ priors = { 'alpha':alpha, 'beta':beta, 'lambdaF':lambdaF, 'lambdaS':lambdaS, 'la
 # Run the Gibbs sampler
 BNMTF = bnmtf_gibbs_optimised(R,M,K,L,priors)
 BNMTF.initialise(init_S,init_FG)
-BNMTF.run(iterations)
+performances_sink = MemorySink()
+BNMTF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Extract the performances across all iterations
-print "gibbs_all_performances = %s" % BNMTF.all_performances
+print "gibbs_all_performances = %s" % performances_sink.values
 
 '''
 gibbs_all_performances = {'R^2': [-0.06167047723443697, 0.5888241195577258, 0.6804890119267824, 0.7158748524756587, 0.7323580708957134, 0.7412911242322135, 0.7459238675226538, 0.7484840852773231, 0.7501604528635746, 0.7507289960474628, 0.7515341094240809, 0.7519154280484482, 0.7526251612586992, 0.7526975407198075, 0.7528712473611041, 0.7534652978025341, 0.7539817138654233, 0.7544057370532602, 0.7546501555056635, 0.7547881808587072, 0.7554470206986658, 0.7558506863794409, 0.7560080293449752, 0.7562163534348867, 0.7566781987316741, 0.7569301252961845, 0.7571135554466178, 0.7577436263266717, 0.7584291693785371, 0.758384507999288, 0.7586306775125651, 0.7589592660482165, 0.7593718912735726, 0.7599608465661034, 0.7604004742915322, 0.7601534576001652, 0.7603705561710467, 0.7606270881052428, 0.7607035114076179, 0.7611453864214657, 0.7614298802645328, 0.7619170547479872, 0.7619514566021264, 0.7622767052626341, 0.7623713581047014, 0.7625848725759543, 0.7631578166132105, 0.7629922214875201, 0.7635792334273139, 0.7633123619097015, 0.7637273784934683, 0.7643511560006502, 0.7647427115606611, 0.7647727388767578, 0.7653164749751029, 0.7653797013103588, 0.7659367039399385, 0.7659231070731156, 0.7661629071851161, 0.7663240142561765, 0.7665205071498191, 0.7672999001042635, 0.767263015371844, 0.7676500343030689, 0.7676332846657384, 0.7678360542027192, 0.7680877682850173, 0.7683227871119507, 0.7687316271380249, 0.7686058747536308, 0.769026234608121, 0.7691489861664479, 0.769579389034799, 0.7696722032250461, 0.7694652586655037, 0.7701001809029859, 0.7701561245938864, 0.7701927032032783, 0.7703191124598188, 0.7705346919940044, 0.7706045026055549, 0.7708239659314639, 0.7709052946590598, 0.7711496581624893, 0.7712386601926474, 0.7715557161377642, 0.7717272716980508, 0.7719450965291527, 0.7720392097658394, 0.7724284632631071, 0.772690007026888, 0.7726272985190837, 0.7729895617074314, 0.7732590896480546, 0.7734075926372345, 0.7733127604115988, 0.7733912660368405, 0.7736658075417345, 0.7735316819517587, 0.7737094875149835, 0.773677791241226, 0.773974896278306, 0.7741209263082474, 0.7742844955063005, 0.7741614723149217, 0.7743478850750521, 0.7745730270079408, 0.7749992909511269, 0.7750028051254437, 0.7750317582690769, 0.7753413794063282, 0.7754825024624008, 0.7758169256043803, 0.7761066088833726, 0.7762665734647916, 0.7764956626714514, 0.7759787182561411, 0.7764570106879725, 0.7763859712887812, 0.7766432084947779, 0.7767306284190699, 0.7770160365368757, 0.7769841617159048, 0.7768694482769206, 0.7774026786537203, 0.7775307421250657, 0.7775557997136029, 0.7777530752317225, 0.7777711894615742, 0.7778147725664912, 0.7776627435745166, 0.7779332535212864, 0.7777323013113877, 0.7780652493584194, 0.7783750728796708, 0.7781572583709985, 0.7781145394518767, 0.7785544285371468, 0.77833373505112, 0.7785195535469032, 0.7784643952348271, 0.778377656012177, 0.77891796435899, 0.7788813745628878, 0.7786772329458816, 0.7788483406938583, 0.7787901098087031, 0.7786918065361195, 0.7788495459852969, 0.7789787148252604, 0.778670210497434, 0.7789839012978105, 0.7790820598360464, 0.7792316908557899, 0.7793738499190196, 0.7791890032996273, 0.7794715471042836, 0.7795189771852508, 0.7792919058753732, 0.7795906560868762, 0.7794144855355098, 0.7791228008292822, 0.7796170755588594, 0.7794095494846389, 0.7795734482284968, 0.7795208117412282, 0.7796900139964547, 0.7795523125908532, 0.7797900119976016, 0.7798026377885268, 0.7796011758364779, 0.779819613017456, 0.7799923130502369, 0.7800135269230715, 0.7801672433278884, 0.7800564236943753, 0.7799651755321834, 0.7801240711968334, 0.7800100431383568, 0.7798631104208246, 0.7801645975269142, 0.780180254156424, 0.7802339995183024, 0.7801442880945859, 0.7802359674940288, 0.7801251721193607, 0.7802378657167341, 0.7802143540635273, 0.7800916442608541, 0.7801211870338235, 0.7805304609958216, 0.7802868511427058, 0.7806446410323922, 0.7803646352319682, 0.780649151648033, 0.7807670712969843, 0.7807779080009241, 0.7807420341100364, 0.7807160385944875, 0.7810240437229301, 0.7807508783176685, 0.7806735190922146, 0.7810058636751138, 0.7806283106946819, 0.7807922939716495, 0.780876938959315, 0.7808653575579271, 0.7810837537199645, 0.7810660039798749, 0.7812375558630696, 0.781049094794301, 0.780898582491669, 0.7813825188831819, 0.7814912648463693, 0.78147257403734, 0.7816728471738772, 0.7813681030479992, 0.7815201463564498, 0.7814797849341015, 0.7814212252749138, 0.7817109855129897, 0.7819213658185189, 0.781873554197543, 0.7818407849583144, 0.7819015877572709, 0.7817261861450916, 0.7816556073942684, 0.7814491543710333, 0.781682013212753, 0.7814381153558747, 0.7817991580572703, 0.7817873228401515, 0.7820131721160489, 0.7820979726614573, 0.7817068215728349, 0.7820349959806518, 0.7818550353949929, 0.7819240336780255, 0.7820865634431238, 0.782176816989543, 0.7819469235035659, 0.7820425198520682, 0.7820735751922464, 0.7818723954550167, 0.7818932135348229, 0.7818445034400077, 0.7814985126227607, 0.7817137622740425, 0.7818108235859916, 0.7820706234032124, 0.7818617424337514, 0.7815475377246197, 0.7821721042919186, 0.7822232171556565, 0.7819974746366697, 0.7821848514181804, 0.7823802619692681, 0.7823802679549144, 0.7825449407926441, 0.7824085344825531, 0.7825365287844329, 0.7825855486327162, 0.7825232398983859, 0.7822912356502385, 0.7824801089346286, 0.7826011873919048, 0.7824915424998578, 0.7825679457732271, 0.7826023836047502, 0.7828059632259654, 0.7826489323465025, 0.7826189520950861, 0.7825519094654484, 0.7825663723101318, 0.7827324387142479, 0.7826448247556297, 0.7828484887597532, 0.7828068292700215, 0.7825453095524091, 0.7827754285575942, 0.7828027193862764, 0.7827490194881725, 0.782959737223158, 0.7828740878848339, 0.782904204843855, 0.7827315897391873, 0.7827889988313711, 0.7827699461116185, 0.7826163758594538, 0.7827701658426564, 0.7827045626352196, 0.7827461580909439, 0.7829083621635036, 0.7829249939992993, 0.7829475414265412, 0.7828239967562252, 0.782762295048035, 0.7828908585631374, 0.7828247738304215, 0.783116464789561, 0.7832558198183373, 0.7831513180679439, 0.7831515624894768, 0.7831224953160483, 0.7830165119030849, 0.7831847341668937, 0.7832552727656811, 0.7829714844643005, 0.7832245946044369, 0.7831130624133252, 0.7829450195318478, 0.7830899232234707, 0.7828976250708517, 0.7830940793749771, 0.7834329013669463, 0.7831711505550646, 0.7828858849632803, 0.7831168830298754, 0.7830055043338311, 0.7832696821541145, 0.7831808156242356, 0.7832884645807847, 0.7834303190082521, 0.7834476170729435, 0.7833203413140302, 0.7833212420564098, 0.7832795559279532, 0.7834122313219557, 0.7836689483059787, 0.7838093079939229, 0.7834651857828857, 0.7832506291873929, 0.7836672356069436, 0.7833761180412757, 0.7837608456032472, 0.7836300905606959, 0.7837276662558195, 0.7836989243857574, 0.7836907379429079, 0.7836474143434264, 0.7838834459023727, 0.7836614074204916, 0.78387405639391, 0.7836558845697656, 0.7839769725397683, 0.7839564898673125, 0.7841052767388832, 0.7840112202930439, 0.7838530325831033, 0.7840578088489645, 0.7838459403476219, 0.7838694492915542, 0.7841314662050591, 0.7840290976934393, 0.784273633157217, 0.7839778604879272, 0.7839102012986654, 0.7837690334538283, 0.783978117452392, 0.7838182499373593, 0.7839942754183475, 0.784141703314619, 0.7841331856562677, 0.7842736194873157, 0.7841270057769436, 0.7844782694131912, 0.7843810730281702, 0.7849322380682772, 0.7845141265631445, 0.784478577719911, 0.7845788694318119, 0.7845563642834155, 0.7847315967718782, 0.7846358099505347, 0.784787810228822, 0.7847498947533054, 0.7846655560844183, 0.7847319469668458, 0.7846433597403792, 0.7848270851425392, 0.784920823441893, 0.7847489396654103, 0.7850464016845778, 0.7851429570482996, 0.7850024080218584, 0.7849816030181689, 0.7850770658367319, 0.7850209105268551, 0.7847036471600495, 0.7846833576749075, 0.7848059735247719, 0.7846816140348536, 0.7846686132687928, 0.7847497772813176, 0.7846528653679081, 0.7848266706353231, 0.7848950501696479, 0.7847707535896024, 0.784542686779117, 0.7848078615721223, 0.7847361051187042, 0.7848743459352275, 0.7850713139658501, 0.7846632000990866, 0.7848811847666204, 0.7846574382699225, 0.7849127670962399, 0.7846957893076563, 0.7846347826607226, 0.7845585111392794, 0.7845120495404497, 0.7847941435359381, 0.7844916404180111, 0.7847347708183611, 0.7847969308803274, 0.7847567798809488, 0.7849135670573645, 0.7847340003974776, 0.7849301276323578, 0.7850703904929477, 0.7850920567511863, 0.78533155863623, 0.785170461149672, 0.7853494979843638, 0.7854555221240966, 0.7855313217996718, 0.7853058334501216, 0.7852792605904803, 0.7851608775193546, 0.785506243380683, 0.7852574261777923, 0.7850989548675816, 0.7852785208831582, 0.7854945147445223, 0.7853911581428332, 0.7854761879720471, 0.7856008462772078, 0.7857550031509627, 0.7858222063363259, 0.7859085205021976, 0.7855864854422542, 0.7855008491530091, 0.7857465569238933, 0.7856969083418588, 0.7854549651367108, 0.7856481874511807, 0.7859505067139223, 0.7857227216299117, 0.7858620166390624, 0.7858213238889924, 0.7860046661381354, 0.7860830794313511, 0.7860384261304605, 0.7860133906664393, 0.7862205204633138, 0.7860480385871584, 0.7861753390952553, 0.7860016626324495, 0.7861228370087979, 0.7860820876719218, 0.7860690290179128, 0.7860873954992332, 0.7858659576928082, 0.7860350483954969, 0.7859118932516701, 0.7860939195920762, 0.7861362828256606, 0.7862355192963687, 0.7862818317936853, 0.7864195806144635, 0.7860335689044488, 0.7862464397665748, 0.7861340578392884, 0.7862005313813889, 0.7860155359579057, 0.7862199500376397, 0.7862094772885767, 0.7862429383170012, 0.7861544810828903, 0.7863663398444166, 0.7864891698597506, 0.7863925104770906, 0.7864002826791732, 0.7863697066007205, 0.7864324979154238, 0.7864265901195876, 0.7866662168038847, 0.786354352196728, 0.7866383242238216, 0.786423535201938, 0.7863234886529961, 0.786219274188706, 0.7864445049446633, 0.7864512400712009, 0.7865166965371804, 0.7866194486183511, 0.7867276132860097, 0.7866262290788315, 0.7867577984116767, 0.7867080494173249, 0.7867496617511973, 0.7868195422520824, 0.7864650175225524, 0.7864395485808162, 0.7865330487979802, 0.7866712744623061, 0.7865508889509683, 0.7866872559441727, 0.7865563871603568, 0.7865446001763767, 0.7867821641124606, 0.7868947185704812, 0.7868092665930022, 0.7869651154265048, 0.7867866771681831, 0.7867533120762296, 0.786781312438303, 0.7866850066799594, 0.7869098613062407, 0.7870131435466654, 0.7866646314538442, 0.7868093299225675, 0.7868654524907877, 0.7870868854185118, 0.7867801801626223, 0.7868588405304898, 0.7868742766228656, 0.7869920924720195, 0.7869913726702444, 0.7869735082938889, 0.7871357416338729, 0.7872102303745908, 0.7872189909115003, 0.7870080734351413, 0.7870155880492633, 0.7870980913677901, 0.7869593197024684, 0.7868016340667576, 0.7869602546537102, 0.7868893747605356, 0.7869442022028195, 0.7870193148044651, 0.7869286434794818, 0.7871161797191703, 0.787092483435787, 0.787038246379581, 0.7871464651740819, 0.7869877365589095, 0.7873215148096174, 0.7872080788815476, 0.7871630344258881, 0.7872292170686572, 0.7873004143260619, 0.7873250105304055, 0.7870794942119905, 0.7874301707292749, 0.7872745784209298, 0.7873911703989359, 0.7876839472912922, 0.7876380785551591, 0.7875013256643593, 0.7874941816237746, 0.7874268363657322, 0.7874444507007865, 0.7875209393867204, 0.7873951646340285, 0.7872825737325138, 0.7873671708117612, 0.7874714279600645, 0.7874002202726474, 0.7876016060502944, 0.7875525914260534, 0.7875430604798368, 0.7876919185147471, 0.7877476044511785, 0.7877707059460285, 0.7878574100332782, 0.7876555213791512, 0.7880345003869484, 0.7878701970968631, 0.7879379418948239, 0.7879785152051094, 0.7881335968118155, 0.7883917515493972, 0.7880817165797221, 0.7881388734562101, 0.7882309709135754, 0.7883410323144302, 0.7882207514343393, 0.7882196844253323, 0.7880714455859725, 0.7881727871763939, 0.7882260781041058, 0.7881584541881814, 0.7881481245247032, 0.7880002478191985, 0.7880838525892123, 0.787949992404528, 0.7881304397161899, 0.7879471561289642, 0.7880503228968261, 0.7881139453111908, 0.7880849652471944, 0.7883844138778279, 0.7880851272729866, 0.7881753464107015, 0.7883086931409198, 0.7882510544383596, 0.7881899893738958, 0.7880571221155314, 0.7879933098279966, 0.7883173449929719, 0.7884056905343714, 0.7883586330739283, 0.7879771079768819, 0.7881007907827499, 0.7883389732476598, 0.788557856894528, 0.7884351312294522, 0.7884818906950463, 0.7885035680626388, 0.788494561585645, 0.7885753360291051, 0.7885913033585621, 0.7886657138884894, 0.7884544297719285, 0.7884364288533064, 0.7887785631055023, 0.7886559276078526, 0.7884905595879145, 0.7886634100481031, 0.7887208134964796, 0.7888023756886023, 0.7885729239239686, 0.7885453036457455, 0.7885014896140197, 0.7887082126221985, 0.7887206250343084, 0.7885201483166235, 0.7888311229176956, 0.7888347605466013, 0.7887032148161386, 0.7887895991815996, 0.7887046462127085, 0.7884571350108298, 0.7886017791474256, 0.7885748861704625, 0.788944937108123, 0.7885707032488938, 0.7884083945035482, 0.7885586141340386, 0.7885928553690748, 0.788586520338784, 0.7888101546450166, 0.7888201730884254, 0.7886834677263312, 0.7888539004774756, 0.788784214638379, 0.788780026145332, 0.7888922540807581, 0.7888573910554582, 0.7887562335734699, 0.7888643982915119, 0.7889591594791667, 0.7887017653029016, 0.7887544390016147, 0.7889077615432596, 0.7889870388918979, 0.7890095660875416, 0.7890212800384722, 0.7890798410759243, 0.7890846436475694, 0.7890383838777885, 0.788908733917328, 0.7890968377437586, 0.7890407783564385, 0.7889861396159772, 0.7894357735575037, 0.7889596688163791, 0.7890935996950743, 0.7894255860814154, 0.7893046944414928, 0.7892624833255455, 0.7891960448695434, 0.789399903727527, 0.7893272740991679, 0.7893558781350183, 0.7896331961640355, 0.7895281450038139, 0.7896126854391328, 0.7893926125631284, 0.7895342007530505, 0.7895974429875712, 0.7897032300435345, 0.7895584157100766, 0.7896636640986673, 0.7897162785859986, 0.7896751885274866, 0.7895954974265165, 0.7897175338525938, 0.7897175372151163, 0.7897924992746165, 0.7898917990424027, 0.7899097067551969, 0.7896839315663169, 0.789904886144141, 0.7899010341312471, 0.7900413405243818, 0.7900583982236994, 0.7899605607996133, 0.7898650835611893, 0.7899360261689568, 0.7900963272511096, 0.7899765485064256, 0.790011320322739, 0.790038230847122, 0.7900113953397391, 0.7899959379941257, 0.7901255445082176, 0.7899484196234227, 0.7899183762910313, 0.7900431954610491, 0.7902667245565576, 0.7901987931948798, 0.7900279479223132, 0.7903115441966154, 0.7901515547530082, 0.7899653312797791, 0.7903033365939035, 0.7904937327002048, 0.7903698083191693, 0.7906616179950374, 0.7905683756885167, 0.7904080348373662, 0.7904103245176346, 0.7905325455819512, 0.7905681419303243, 0.790549547566332, 0.7905897694657844, 0.7905044003252282, 0.7904104181220424, 0.7906392255226021, 0.7904215688630788, 0.7904553714970554, 0.7903146198819789, 0.7906030729808582, 0.790532856455584, 0.7906117163167031, 0.7905574867994671, 0.7905492351251959, 0.790636010312278, 0.7908597028999717, 0.7908362089086426, 0.7907349400936622, 0.7906908499570255, 0.7906045572897742, 0.7908780806756517, 0.7905679735020692, 0.7907928937685418, 0.7908595472607356, 0.7909047879179971, 0.7908740201587574, 0.7908512932558878, 0.7908062338959576, 0.7908906156403097, 0.7909460815088389, 0.7909079215382191, 0.7908210390765397, 0.7909510362756657, 0.7909570888916043, 0.790945280122846, 0.7909567924035712, 0.7909629012234916, 0.7907400521282, 0.7911862403159124, 0.7911975157918634, 0.7911589115880957, 0.7912061353884654, 0.7910826178871198, 0.7911896249680037, 0.7912104346681954, 0.7914763021461917, 0.7913394207643449, 0.7913172755298046, 0.7914209752805399, 0.7912737925664531, 0.7917261695127004, 0.79143331458511, 0.7915290444310308, 0.7914727879357009, 0.7914577023414482, 0.7913067710171784, 0.7916172364077625, 0.7915342843549822, 0.7913646959715674, 0.7913476670409435, 0.7915636653809047, 0.791398009322432, 0.7914771799369251, 0.791462235915313, 0.7915601032733838, 0.7917699917537462, 0.7916933813972182, 0.7917121152823983, 0.7916098481516753, 0.7914346308304651, 0.7918626068009014, 0.7917413266081674, 0.7915836946584337, 0.7917540420643756, 0.7918206040530882, 0.7918997345753521, 0.7916008873964712, 0.7916717354377748, 0.7917645201819008, 0.7916613677236972, 0.7917011723154376, 0.7920901201990087, 0.791661215583118, 0.7918277684254154, 0.7918923618446689, 0.7920290948766343, 0.7921061531720182, 0.792124521941011, 0.7916679730693816, 0.7917138216119952, 0.7915326108106451, 0.791980215293459, 0.7920493164677984, 0.7915730306894623, 0.7919905461772971, 0.7922489642857613, 0.7920116565409143, 0.7918224989909828, 0.7920173030498766, 0.7922168239043093, 0.7921591222199407, 0.792355584451571, 0.7923867047652807, 0.7923332515867072, 0.7922991208267547, 0.7922428467167558, 0.792314196201641, 0.7923602727716489, 0.7923992378833229, 0.7922315804286457, 0.7924209574201969, 0.7924342513076607, 0.7923406097166221, 0.7924409503533645, 0.7923460492615538, 0.7923853298918828, 0.7926018247397032, 0.7925229180994497, 0.7923032626643932, 0.7926395439896092, 0.7924284249050115, 0.7921605362678414, 0.7922370565278787, 0.7926646245000197, 0.7923464633964215, 0.7925177745861051, 0.7925980794338119, 0.7926268224437321, 0.7927188601752073, 0.7929434840765124, 0.7926816883039693, 0.7928787422147647, 0.7927751041298533, 0.7929985815652404, 0.7929348132035718, 0.7931240273503937, 0.7930020103564858, 0.7931767748901218, 0.7929323156955799, 0.7931169297605933, 0.7932878303568991, 0.793232126593698, 0.7930804531547814, 0.7930856217988351, 0.7933534335081297, 0.793365362562332, 0.793326461396948, 0.7935366168283006, 0.7933057601976483, 0.7932718591110544, 0.793375991068268, 0.7935684621603252, 0.7938010777280387, 0.7935621467013693, 0.7937712815006008, 0.7935782454686421, 0.793638762529648, 0.7936867000040666, 0.7936354061900512, 0.7936404505357786, 0.7935779805406356, 0.793618704949399, 0.7936505431692751, 0.7936302554276723, 0.793968603981791, 0.7938665310494315, 0.7938963593227775, 0.793955527657685, 0.793841813010543, 0.7940547759509137, 0.7942085419071216, 0.7939614802402564, 0.7941865801393726, 0.7942671168949694, 0.7944255023169748, 0.7943744390755422, 0.7942817699857985, 0.7946920258267096, 0.7943851454322766, 0.7943815256042903, 0.7944627686956318, 0.7943780655297871, 0.7944151223586678, 0.7944639924925911, 0.7944527677581029, 0.7943828395925148, 0.7945960419268843, 0.7945040677117821, 0.7946636152822648, 0.7944079258796253, 0.7946717071965259, 0.7945773732792388, 0.7949074441014736, 0.7949549915958491, 0.7951246573294882, 0.7951735042759559, 0.7951365836622709, 0.7951292821711196, 0.7950356752102623, 0.7949773814928792, 0.7950382109740974, 0.7950926294202714, 0.7952632209695966, 0.794820010242611, 0.7948502171350349, 0.7951495791519227, 0.795274069415625, 0.7951872315205233, 0.7953072774483116, 0.7952604911886533, 0.7952963786916777, 0.7953677378188992, 0.7954721653217758, 0.7954185998310606, 0.7953086909077682, 0.7952606837072338, 0.7955446949015592, 0.7956877401616658, 0.795211365972848, 0.7954183099046357, 0.7955414285241237, 0.7956202781382248, 0.7957431849539742, 0.7958474618235992, 0.7958710919350629, 0.7958068900688627, 0.7959917833952048, 0.7958910627251466, 0.7960290005213, 0.7960217852693627, 0.7959792312683012, 0.7959535845474247, 0.7958460521587662, 0.7959811821294139, 0.7958876877531181, 0.7960276895372619, 0.7959994703787296, 0.796065777136874, 0.7959171609206525, 0.7960317748728921, 0.7961689774142412, 0.796278284276658, 0.7960915537222848, 0.7961861328183938, 0.7962373768892297, 0.7963279007927007, 0.7962140674706479, 0.7963072435016377, 0.7963127680583195, 0.7963570212871319, 0.7965206061126201, 0.7964318738702298, 0.7963729909584806, 0.7964864910013213, 0.7963951219348585, 0.7962926833611276, 0.7963817001471469, 0.7963163505726403, 0.7962250873464745, 0.7966390736905572, 0.7965401484583139, 0.7966243776255468, 0.796471568073311, 0.7967263170298875], 'MSE': [12.41699276319731, 4.8089949201117275, 3.7369086847001918, 3.323046064012448, 3.130263078872678, 3.0257846545300131, 2.9716014205184642, 2.9416578495012597, 2.9220515360233099, 2.9154020183515992, 2.9059856436992089, 2.9015258506647679, 2.8932250150246515, 2.8923784856503696, 2.8903468626994169, 2.8833990194746297, 2.8773591656280786, 2.87239991229317, 2.8695412643230496, 2.8679269594642136, 2.8602213580555906, 2.8555002002722527, 2.8536599621698713, 2.8512234634894451, 2.84582185363884, 2.8428753929474468, 2.8407300466282996, 2.8333609187061315, 2.8253430042059113, 2.8258653508613212, 2.8229862229864988, 2.8191431459143348, 2.8143171998726726, 2.8074289480449948, 2.8022871885233678, 2.8051762247496392, 2.8026371022616918, 2.7996367784901008, 2.7987429535106187, 2.7935749103495446, 2.7902475521284313, 2.784549699390523, 2.7841473451920717, 2.7803433303396616, 2.779236297903358, 2.7767390940145464, 2.7700381052267087, 2.7719748582224915, 2.7651093352898797, 2.7682305878573708, 2.7633766731750455, 2.7560811507331873, 2.7515016294416936, 2.751150438582886, 2.7447910574537917, 2.7440515804087471, 2.7375370377433161, 2.7376960627897522, 2.7348914296016074, 2.7330071676028496, 2.730709043193535, 2.7215934872064911, 2.7220248804356952, 2.717498418250595, 2.7176943171947383, 2.7153227829689355, 2.7123788074084256, 2.7096300947562222, 2.7048484193174418, 2.706319183062369, 2.7014027750213923, 2.6999671080756693, 2.6949332398310735, 2.693847711738004, 2.6962680758277302, 2.6888422078234266, 2.6881879064936318, 2.6877600935913741, 2.6862816472586171, 2.6837602909872733, 2.6829438061390971, 2.6803770261560116, 2.6794258287330326, 2.676567823430315, 2.6755268812659798, 2.6718186860580855, 2.6698122215323759, 2.6672646049136275, 2.6661638835467634, 2.6616112865194697, 2.6585523458295253, 2.6592857665135243, 2.6550488403819781, 2.6518965190544459, 2.6501596707747779, 2.6512688012297407, 2.6503506220004982, 2.6471396634662203, 2.6487083578170587, 2.6466287950533194, 2.6469995055612463, 2.6435246504395877, 2.6418167251804112, 2.639903666851994, 2.6413425107398218, 2.6391622806748991, 2.636529085336687, 2.6315436247712394, 2.6315025239984506, 2.6311638963520436, 2.6275426565200788, 2.6258921218169404, 2.6219808048661073, 2.618592752493929, 2.6167218527256488, 2.614042491207909, 2.6200885245125223, 2.6144945536975741, 2.6153254100928249, 2.6123168376649599, 2.6112943993561157, 2.6079563480404349, 2.6083291467852532, 2.6096708021974089, 2.6034342929680245, 2.6019364994143515, 2.6016434330607128, 2.5993361553004521, 2.5991242964743835, 2.5986145610056508, 2.6003926484005859, 2.5972288418114045, 2.5995791211019821, 2.5956850564376968, 2.5920614495806356, 2.5946089454712138, 2.5951085736712636, 2.5899637573600507, 2.59254492494231, 2.5903716452223944, 2.5910167609871859, 2.5920312380052688, 2.5857119468729133, 2.5861398906117197, 2.5885274722911458, 2.5865262452495048, 2.5872072969459321, 2.5883570237683728, 2.5865121485072575, 2.5850014268799248, 2.5886096048298417, 2.5849407673876414, 2.5837927333365336, 2.582042691935603, 2.5803800403905179, 2.5825419533234983, 2.5792374021911701, 2.5786826735962292, 2.5813384343731736, 2.5778443377643088, 2.5799047778992765, 2.583316238389163, 2.5775353432133095, 2.579962508531576, 2.578045595930142, 2.5786612171567924, 2.5766822762106938, 2.5782927922733512, 2.5755127283300654, 2.5753650607082283, 2.577721301796486, 2.5751665233095844, 2.5731466733625177, 2.5728985620029992, 2.5711007391124459, 2.5723968536949449, 2.5734640659739796, 2.5716056679490076, 2.572939307347736, 2.5746577901815306, 2.5711316836402012, 2.5709485682013828, 2.5703199778960015, 2.5713692169235056, 2.5702969610175281, 2.5715927918755486, 2.5702747599503417, 2.570549745488679, 2.5719849240722796, 2.5716394002906244, 2.5668526496619992, 2.5697018404872551, 2.5655172327711639, 2.5687921001354477, 2.5654644779070432, 2.564085323584619, 2.5639585806099543, 2.5643781513271335, 2.5646821874055283, 2.5610798479481263, 2.5642747120166125, 2.5651794832834289, 2.5612924765621927, 2.565708227707463, 2.5637903264310737, 2.5628003429834596, 2.5629357957254397, 2.5603814969842777, 2.5605890928428496, 2.5585826713233488, 2.560786857817392, 2.5625472064496932, 2.5568872255044592, 2.5556153639740877, 2.5558339663045024, 2.5534916292607868, 2.5570558289694496, 2.5552775741331257, 2.5557496297284894, 2.5564345266715067, 2.5530455742080052, 2.5505850266206971, 2.5511442175979209, 2.5515274772016121, 2.5508163451405692, 2.5528677919838092, 2.553693260768144, 2.5561078759904947, 2.5533844259045404, 2.5562369851390274, 2.5520143334720884, 2.5521527547699057, 2.549511286551164, 2.5485194837448986, 2.5530942744552827, 2.5492560409032436, 2.5513608081899899, 2.5505538241026864, 2.5486529226833623, 2.54759734314454, 2.5502861112820137, 2.5491680438656212, 2.5488048295326249, 2.5511577699174692, 2.5509142876394555, 2.5514839869084702, 2.5555305960645232, 2.5530130980088095, 2.5518778968009941, 2.5488393528087809, 2.5512823645923661, 2.554957212563663, 2.5476524615014613, 2.5470546601377153, 2.5496948797583143, 2.5475033747764013, 2.5452179091345291, 2.5452178391281302, 2.5432918729472571, 2.544887241945053, 2.54339025737757, 2.5428169353210195, 2.5435456803693701, 2.5462591353745259, 2.5440501277250496, 2.5426340288883424, 2.5439164040322919, 2.5430228133063042, 2.5426200383267101, 2.5402390295885304, 2.5420756176219172, 2.5424262580257517, 2.5432103693530306, 2.5430412160784313, 2.5410989511456332, 2.5421236588241882, 2.5397416631677645, 2.5402289005861625, 2.5432875600390332, 2.5405961542937208, 2.5402769686052089, 2.5409050271793507, 2.538440533114104, 2.5394422631583575, 2.5390900238616707, 2.541108880513935, 2.5404374402719077, 2.5406602754061223, 2.5424563889372616, 2.5406577054950583, 2.541424981753984, 2.5409384932589312, 2.5390414010459317, 2.5388468798746806, 2.5385831716460965, 2.5400281146016934, 2.5407497600467757, 2.5392461181250403, 2.5400190261652358, 2.5366074925430895, 2.5349776361790535, 2.536199858616428, 2.5361969999324305, 2.5365369612385491, 2.537776512775495, 2.5358090335273533, 2.5349840343496886, 2.5383031407580177, 2.535342837306279, 2.5366472857576534, 2.5386126670016034, 2.5369179150716739, 2.5391669789956004, 2.5368693059181897, 2.5329065412821663, 2.5359679035471916, 2.5393042879194896, 2.5366026009245801, 2.5379052541417608, 2.5348155062840259, 2.5358548636760401, 2.5345958324200168, 2.532936743807249, 2.5327344306143176, 2.5342230113097846, 2.5342124764857972, 2.5347000254630654, 2.533148292187525, 2.5301458041263452, 2.5285041975574338, 2.5325289520323202, 2.5350383443067215, 2.5301658353620065, 2.5335706627389101, 2.5290709997500258, 2.5306002731469288, 2.5294590558613446, 2.5297952125127865, 2.529890958795459, 2.5303976591632034, 2.5276371018884487, 2.5302340001556494, 2.527746918880756, 2.5302985938303983, 2.526543241218298, 2.5267828006683417, 2.5250426321818207, 2.5261426893392551, 2.5279928073294204, 2.5255978029793931, 2.5280757560772074, 2.527800802225765, 2.524736327712636, 2.5259336004024386, 2.523073583900914, 2.5265328560318396, 2.5273241784632741, 2.5289752370029301, 2.5265298506493141, 2.528399615157038, 2.5263408717235163, 2.5246165974215096, 2.5247162175054951, 2.5230737437801514, 2.5247884955978872, 2.5206802170662828, 2.5218169980499257, 2.515370730153164, 2.5202608421462624, 2.5206766111995003, 2.5195036281623095, 2.5197668419096688, 2.5177173730888085, 2.5188376682208062, 2.5170599166529057, 2.5175033651571255, 2.5184897659883472, 2.5177132773091184, 2.518749368048697, 2.5166005685502153, 2.5155042323426349, 2.5175145355906414, 2.5140355053090877, 2.5129062215263231, 2.5145500425438772, 2.5147933718873889, 2.5136768661987894, 2.5143336425633085, 2.5180442637156588, 2.5182815637024061, 2.516847483963855, 2.5183019568153298, 2.5184540100385795, 2.5175047390757319, 2.5186381929611659, 2.5166054165074789, 2.5158056691272246, 2.5172594062029088, 2.5199268100688426, 2.5168254019046947, 2.5176646447600919, 2.5160478199023264, 2.513744138427457, 2.5185173209156448, 2.5159678348959296, 2.5185847096135205, 2.5155984570458907, 2.5181361668987967, 2.5188496831071916, 2.5197417329005183, 2.5202851344067358, 2.516985844113155, 2.5205238336369185, 2.5176802503534095, 2.5169532441342977, 2.5174228386830868, 2.5155891009304967, 2.5176892609746315, 2.5153954132051095, 2.5137549391011045, 2.5135015367719227, 2.5107003915605506, 2.5125845414617238, 2.5104905781007902, 2.5092505502352549, 2.5083640190155858, 2.5110012659435061, 2.5113120544724707, 2.5126966288474506, 2.5086573289962, 2.5115674234877621, 2.5134208583851754, 2.5113207058767069, 2.5087945037537671, 2.5100033328610292, 2.509008848417273, 2.5075508807086058, 2.505747906219951, 2.504961917079052, 2.5039524114028819, 2.5077188409067235, 2.5087204183326994, 2.5058466908641934, 2.5064273664099912, 2.5092570645996344, 2.5069971919443166, 2.5034613527379586, 2.5061254616120148, 2.5044963072202697, 2.504972237929437, 2.5028279196785186, 2.5019108203381126, 2.5024330725113639, 2.5027258801030241, 2.5003033495307001, 2.5023206479805764, 2.5008317778257725, 2.5028630478177716, 2.5014458271391642, 2.5019224196713541, 2.5020751499354086, 2.5018603408486615, 2.5044502137883704, 2.5024725775286916, 2.5039129646944258, 2.501784036933882, 2.5012885687296493, 2.5001279274901589, 2.4995862698323852, 2.4979751992154489, 2.502489881230765, 2.5000002048093193, 2.5013145915307669, 2.5005371360877606, 2.5027007893906181, 2.5003100210654368, 2.5004325073284668, 2.5000411567571681, 2.5010757271435171, 2.4985978879597956, 2.4971613034034665, 2.4982918037618371, 2.4982009023201148, 2.4985585113457165, 2.4978241221760253, 2.4978932180581443, 2.4950906132305732, 2.4987380920417488, 2.4954168368302843, 2.4979289474969493, 2.4990990631786349, 2.5003179256003176, 2.4976836914130223, 2.4976049193088068, 2.4968393592957887, 2.4956376004867624, 2.4943725376218233, 2.4955582981697799, 2.4940195010676383, 2.4946013510070397, 2.4941146651100188, 2.4932973628562736, 2.4974437821976263, 2.4977416596200519, 2.4966481079533356, 2.4950314603113175, 2.4964394546514912, 2.4948445454927008, 2.4963751491747423, 2.4965130063516341, 2.4937345268343041, 2.4924181222429769, 2.4934175440115109, 2.4915947808479384, 2.4936817434316882, 2.4940719719575943, 2.4937444877704689, 2.4948708522404703, 2.4922410171577623, 2.4910330577584765, 2.4951091550289966, 2.4934168033271171, 2.4927604098996041, 2.4901705940197769, 2.493757730541398, 2.4928377414868796, 2.4926572053869958, 2.4912792650771687, 2.4912876836718492, 2.4914966202832387, 2.4895991857668549, 2.4887279868644949, 2.4886255261426999, 2.4910923563256424, 2.4910044675586742, 2.4900395324577618, 2.4916625659704992, 2.4935068118447759, 2.4916516310494932, 2.4924806219082178, 2.4918393759014186, 2.4909608805009547, 2.4920213462577863, 2.4898279762988569, 2.4901051212186731, 2.4907394622395911, 2.4894737663226616, 2.4913302105849544, 2.4874264360970848, 2.4887531501087596, 2.4892799771157654, 2.488505923947729, 2.4876732212881838, 2.4873855511514651, 2.4902570394469166, 2.4861556276899601, 2.4879753906090176, 2.4866117643443797, 2.4831875299594408, 2.4837239975139549, 2.4853234200201091, 2.4854069746654939, 2.4861946254476144, 2.4859886132474189, 2.4850940235606251, 2.486565048918735, 2.4878818797426945, 2.4868924566181665, 2.4856730949765344, 2.4865059196225063, 2.4841505694481598, 2.4847238304058119, 2.4848353016134381, 2.4830943008209525, 2.4824430141133447, 2.4821728256692634, 2.4811587595847238, 2.4835199912578498, 2.4790875617063741, 2.4810092057642121, 2.4802168820780386, 2.4797423483022607, 2.4779285584027897, 2.4749092547892166, 2.4785353346862689, 2.4778668442865293, 2.4767896988952476, 2.475502452383993, 2.4769092229871754, 2.4769217024178483, 2.4786554612771416, 2.4774701991625245, 2.4768469237885435, 2.4776378336731621, 2.4777586464483181, 2.4794881698941236, 2.4785103525331902, 2.4800759427800201, 2.4779654828858351, 2.4801091150438301, 2.47890250617845, 2.4781583967059868, 2.4784973392052252, 2.4749950740869462, 2.4784954441981273, 2.4774402670936211, 2.4758806820626535, 2.4765548077616493, 2.4772690072046881, 2.4788229844706611, 2.4795693146451474, 2.4757794924877117, 2.4747462284272133, 2.4752965989596016, 2.4797588068391532, 2.4783122482898428, 2.4755265346371367, 2.4729665344135032, 2.4744018985192038, 2.4738550132489228, 2.4736014809879303, 2.4737068181542661, 2.47276210347923, 2.472575354183129, 2.4717050700116978, 2.4741761883130655, 2.4743867218835596, 2.4703852180039148, 2.4718195275373147, 2.4737536243694933, 2.4717320150667006, 2.4710606408330209, 2.4701067128760377, 2.4727903147676353, 2.473113353603289, 2.4736257899256047, 2.4712080170369513, 2.4710628450324092, 2.4734075631027159, 2.4697704935469074, 2.469727948884731, 2.4712664699401898, 2.4702561432297991, 2.4712497287373103, 2.4741445486163984, 2.4724528323674666, 2.4727673648966184, 2.468439355487416, 2.4728162871450583, 2.4747146035808796, 2.4729576779578286, 2.4725572023142424, 2.4726312950077491, 2.4700157324375942, 2.469898559602921, 2.471497426226994, 2.4695040937543009, 2.4703191192997167, 2.4703681067105641, 2.4690555210336558, 2.4694632689574565, 2.4706463777927552, 2.469381314338547, 2.4682730147233909, 2.4712834230304002, 2.4706673665893888, 2.4688741502092948, 2.4679469451250089, 2.4676834735193829, 2.4675464705160484, 2.4668615574532451, 2.4668053879556098, 2.4673464289272808, 2.4688627776016632, 2.4666627693113292, 2.4673184237931953, 2.4679574627977137, 2.4626986734485299, 2.4682670576617447, 2.4667006405980825, 2.4628178232408393, 2.4642317371154738, 2.4647254261955438, 2.4655024712816282, 2.4631181966704605, 2.4639676519290057, 2.4636331073468889, 2.4603896753844765, 2.4616183235612965, 2.4606295629278789, 2.4632034720336864, 2.4615474972587301, 2.460807834260454, 2.4595705792585458, 2.461264286081061, 2.4600333311779226, 2.4594179672562149, 2.4598985447707284, 2.4608305889833693, 2.4594032860188979, 2.4594032466918012, 2.4585265119890032, 2.4573651304450794, 2.4571556869831581, 2.4597962887014386, 2.457212067464559, 2.4572571195002442, 2.4556161362521078, 2.4554166343035035, 2.4565609126958088, 2.4576775870349574, 2.4568478626843806, 2.454973027300233, 2.4563739250720151, 2.4559672439023075, 2.4556525061435743, 2.4559663665250357, 2.4561471511966775, 2.4546313106585349, 2.4567029124029944, 2.4570542905837818, 2.4555944414459816, 2.452980109390217, 2.4537746150720015, 2.4557727722766858, 2.4524559117618736, 2.4543271023111619, 2.4565051185308904, 2.4525519055242158, 2.4503250873873461, 2.4517744713303857, 2.4483615492315018, 2.4494520844494616, 2.4513273849603756, 2.4513006055180422, 2.4498711430777913, 2.449454818418094, 2.4496722927550745, 2.4492018689794, 2.4502003219110944, 2.4512995107477917, 2.4486234451532036, 2.4511690948855045, 2.4507737489938513, 2.452419939429856, 2.449046274890708, 2.4498675071891305, 2.4489451849188786, 2.4495794377661704, 2.4496759469768032, 2.448661049329059, 2.4460448051156871, 2.4463195840857788, 2.4475039950397548, 2.4480196606057518, 2.4490289148402375, 2.4458298639333558, 2.449456788306557, 2.4468261855150377, 2.4460466254274591, 2.4455175037029084, 2.4458773545719037, 2.4461431618958467, 2.4466701632189163, 2.4456832585894355, 2.4450345457327636, 2.4454808537814379, 2.4464970060820388, 2.4449765962040249, 2.4449058065476104, 2.4450439185130071, 2.4449092741864318, 2.4448378271843998, 2.4474442061530701, 2.442225717350138, 2.4420938426241414, 2.4425453462960354, 2.4419930302996735, 2.4434376554948019, 2.4421861314320741, 2.441942747159624, 2.4388332375509085, 2.4404341628514161, 2.4406931671497603, 2.4394803246698777, 2.4412017313915229, 2.4359108606475028, 2.4393360077101107, 2.4382163789462812, 2.4388743387467779, 2.4390507755213515, 2.440816024910295, 2.4371849109340009, 2.4381550943017709, 2.4401385512921818, 2.4403377167704123, 2.4378114622670868, 2.4397489279151796, 2.43882297116278, 2.4389977521444393, 2.4378531236528538, 2.4353983283113396, 2.4362943410224318, 2.4360752348857391, 2.4372713218537094, 2.4393206132827445, 2.4343151293386365, 2.4357335876152759, 2.4375772055937945, 2.43558487129406, 2.4348063814048984, 2.4338808935596878, 2.4373761242711351, 2.4365475059427384, 2.4354623222430383, 2.4366687637467681, 2.4362032206821547, 2.4316541980248192, 2.4366705431392552, 2.4347225889652981, 2.4339671228987352, 2.4323679326558021, 2.431466680980594, 2.4312518451378877, 2.4365915095221098, 2.436055278145195, 2.4381746675953373, 2.4329396142119633, 2.4321314267375072, 2.4377019283099144, 2.432818787163828, 2.4297964032401111, 2.4325718864183687, 2.4347842187559134, 2.432505846472429, 2.4301723079039923, 2.4308471702201175, 2.4285494044248876, 2.42818543018014, 2.4288106031935648, 2.4292097867523257, 2.4298679525689271, 2.4290334695005225, 2.4284945711807429, 2.4280388464337075, 2.4299997198365784, 2.4277848209729194, 2.4276293394859874, 2.428724544620906, 2.4275509893728322, 2.4286609252667843, 2.4282015103042434, 2.4256694487877013, 2.4265923181732632, 2.4291613450097254, 2.4252282952818254, 2.4276974834167837, 2.4308306319222872, 2.4299356729538553, 2.4249349608405439, 2.4286560816644012, 2.4266524752270278, 2.4257132528089547, 2.4253770828260603, 2.4243006359716217, 2.4216734993819227, 2.4247353874939201, 2.422430701589231, 2.4236428228433597, 2.4210290949895268, 2.4217749114197074, 2.4195619171411988, 2.4209889928326027, 2.418944997076899, 2.4218041215553634, 2.4196449285115609, 2.4176461242563239, 2.4182976194607049, 2.4200715484092643, 2.4200110974339504, 2.4168788486547692, 2.4167393298653916, 2.4171943067149986, 2.4147363891914289, 2.4174364219922007, 2.4178329193573709, 2.4166150219147418, 2.4143639353408504, 2.4116433305177525, 2.4144377991336494, 2.4119918186300233, 2.4142495125786314, 2.4135417224265323, 2.4129810595036143, 2.4135809772097989, 2.413521979991986, 2.4142526111004523, 2.4137763101203036, 2.4134039394513698, 2.413641219046184, 2.4096839916031878, 2.4108778072829162, 2.4105289443709128, 2.4098369285316195, 2.411166902361455, 2.408676149019326, 2.4068777465899447, 2.4097673088367175, 2.407134605113427, 2.4061926703673255, 2.4043402399936746, 2.4049374609892009, 2.4060212920284858, 2.4012230576262987, 2.4048122425179881, 2.4048545789857276, 2.4039043831397668, 2.4048950470226451, 2.4044616410026922, 2.4038900699622667, 2.4040213512306998, 2.4048392109571131, 2.4023456577315772, 2.4034213617167728, 2.4015553391885489, 2.4045458089532077, 2.4014606984850766, 2.4025640008688156, 2.3987035873988019, 2.3981474855703815, 2.3961631239139787, 2.3955918240673699, 2.3960236369535428, 2.3961090330955015, 2.3972038332057743, 2.3978856197698799, 2.397174175640771, 2.3965377131349235, 2.3945425234043469, 2.3997261886823793, 2.3993728975504607, 2.3958716454416562, 2.3944156430975903, 2.3954312741603072, 2.3940272514917265, 2.394574450137684, 2.394154720216866, 2.3933201243744673, 2.3920987703147074, 2.3927252568986619, 2.3940107200761704, 2.3945721984956978, 2.3912504851955489, 2.3895774689464959, 2.3951490045424859, 2.3927286477947995, 2.3912886878072332, 2.3903664853831588, 2.3889290025912442, 2.3877094102947001, 2.3874330393026364, 2.3881839258772239, 2.3860214666731849, 2.387199466681694, 2.3855861858630845, 2.3856705733759807, 2.3861682727417972, 2.3864682294179516, 2.3877258973294309, 2.3861454560309268, 2.3872389393845266, 2.3856015187555983, 2.385931561923222, 2.3851560571374302, 2.3868942296880342, 2.3855537378442482, 2.3839490563545058, 2.3826706347079587, 2.3848545816030065, 2.3837484116782335, 2.3831490757539799, 2.3820903341967861, 2.3834216960142678, 2.3823319359358708, 2.3822673223087532, 2.3817497492635433, 2.3798365081611372, 2.3808742949652797, 2.3815629725773504, 2.380235508697742, 2.3813041350383779, 2.3825022271544949, 2.3814611124098479, 2.3822254222509214, 2.383292810713864, 2.3784509454187788, 2.3796079465026394, 2.3786228263712919, 2.380410042974697, 2.3774305723968947], 'Rp': [0.60191097161206908, 0.78458904295459175, 0.82868120542505652, 0.84723375392599032, 0.85613566773332117, 0.86115962472144003, 0.86374767187572821, 0.86524082985858441, 0.86615296447612222, 0.86647600496698307, 0.86693750161592209, 0.86717092987414668, 0.86756245647124008, 0.86759415465416667, 0.86771774212268216, 0.86804468956299741, 0.86834444138899536, 0.86858643379503608, 0.86873378719035566, 0.86881783685786429, 0.86919414991993693, 0.86941489213601064, 0.86950227489779885, 0.86962126160823849, 0.86989331902159506, 0.87004014549275832, 0.87013185844198193, 0.87050954180351603, 0.87089698808382754, 0.87086555507418462, 0.87100123005195007, 0.87121161177009099, 0.87142961613316872, 0.8717654649308072, 0.87201484828278375, 0.87191812000867763, 0.8719999217229043, 0.87215426738565227, 0.87218666622059804, 0.87244300326748969, 0.87260105333544269, 0.87288880332398933, 0.87290310451608322, 0.87310018234607822, 0.87314740053749118, 0.87326363412277019, 0.87359005309725757, 0.87351705068589691, 0.87383314961876168, 0.87369374491214324, 0.87393871954902391, 0.87427672664764722, 0.87451057896648432, 0.87452286376998989, 0.87482858763310445, 0.87486591885444309, 0.87518960362030329, 0.87517982679962869, 0.87531709983444372, 0.87542721467148965, 0.87551462318012763, 0.87596367414672849, 0.8759398409369572, 0.87616386878239771, 0.87616485566363023, 0.87627117846046776, 0.87641177609680398, 0.87654749641897756, 0.87678908653884513, 0.87670669175391458, 0.87695948899063247, 0.87701374209218408, 0.87727567448674448, 0.8773193232904668, 0.87721384122651758, 0.87756055003396138, 0.87759490009310248, 0.87761594042186764, 0.8776885526901187, 0.87780164838942487, 0.87784999894274096, 0.87798977612319551, 0.8780159843639711, 0.87818363816329603, 0.87821055003346449, 0.87839287858023174, 0.87848244451484458, 0.87861397543816888, 0.87865999905270276, 0.87889483323508277, 0.87904564786354011, 0.87900107501770697, 0.87920149764058086, 0.87935466975642673, 0.87946304741916925, 0.87938271768892384, 0.87944512292207722, 0.87963549867509416, 0.87951145275309517, 0.87961890523447139, 0.87959127230212675, 0.87976584385567047, 0.87986146806235987, 0.87994391211790035, 0.87987032969840762, 0.87997458932018735, 0.88009910142567149, 0.88035033182441425, 0.88034684683936471, 0.88037182471646558, 0.88056494004345875, 0.88063378535915604, 0.88081422630984041, 0.88097051848857999, 0.88106300585971686, 0.88121221319046672, 0.88091944236409769, 0.88117959452248718, 0.88113410771320144, 0.88128342191349307, 0.88132479165200273, 0.88149495845904358, 0.88147388574901275, 0.88141129351481762, 0.88173196126213027, 0.88178964063268939, 0.8818093015022137, 0.88192616088299891, 0.88192962636922234, 0.88195991300316334, 0.88186203506437566, 0.88203172494610271, 0.88190671962588563, 0.88208512976766706, 0.88227948388019883, 0.88215593939403192, 0.88211635145244705, 0.88237080661980072, 0.88225312815545287, 0.88235549032686511, 0.88232097322576719, 0.88226767518356308, 0.88256917779966371, 0.88255409232594761, 0.88242925035882103, 0.88254164444485683, 0.88250262952844405, 0.88243708915992247, 0.88253099097198651, 0.88261285743479412, 0.88245157799708829, 0.88261239656918011, 0.8826705631027465, 0.88277340784139047, 0.88284351315985654, 0.88273913805972626, 0.88288589312607446, 0.88291221624432248, 0.88279380381095096, 0.88295262723856027, 0.88285736467867448, 0.8826890799618351, 0.88296180817263925, 0.88286938994857334, 0.88294534284809967, 0.88293255144814653, 0.88301019094945499, 0.88293786383211348, 0.88306327670276408, 0.88306771646227344, 0.88295723230212841, 0.88311480345838578, 0.8831875946563249, 0.88319167056338899, 0.88328109587369197, 0.88321289754331334, 0.88316353056622443, 0.8832494987693249, 0.88318948036565648, 0.88311035490382672, 0.88328894325081275, 0.88329257598370958, 0.88332585863551027, 0.88326930267085135, 0.88331902358812686, 0.88324984605981305, 0.88332870441031264, 0.88329955602817278, 0.88323828201334487, 0.88324798280114558, 0.88347981427352673, 0.88334931556537322, 0.88354594226981997, 0.8833889514790817, 0.8835667787351591, 0.88362330855813542, 0.88363085622961213, 0.8836068358438669, 0.88358535388802384, 0.8837828766274578, 0.88360181273360539, 0.88356829463901443, 0.88375005288395925, 0.88354234073055626, 0.88364326377599522, 0.88369400874170245, 0.88368083871283121, 0.88380586064741629, 0.88378939364321818, 0.88390873919294499, 0.88377281140180408, 0.88369117958380994, 0.88397428341466477, 0.88404403428055744, 0.88402457709744109, 0.88413634249131035, 0.88395780829673176, 0.88405602621645751, 0.88403224647830769, 0.88400070019506871, 0.88415052993166643, 0.88427768711069632, 0.88425922501098253, 0.8842248903571116, 0.8842669323583886, 0.88417531264844584, 0.8841190522075929, 0.88400379598235601, 0.88413048388663007, 0.8839924681430088, 0.88421418465987855, 0.88420943075290137, 0.88432226339003761, 0.88437085418633699, 0.88414968174648778, 0.88434507116008609, 0.88423968880120296, 0.88427981213674445, 0.88436403232545135, 0.88442798004036505, 0.88428066945031036, 0.88434179653974843, 0.88436543295787839, 0.88425911717978578, 0.88426491218178083, 0.88424024783988342, 0.88405286596743349, 0.8841485079966428, 0.88421884788180549, 0.88436336953597061, 0.88423548741216074, 0.8840708326661294, 0.88442032929310888, 0.8844373318116131, 0.88431453200522236, 0.88442285935130116, 0.88453098550390263, 0.88453406989640349, 0.88462597785937402, 0.88455254625001845, 0.88461635416076245, 0.88464980938620841, 0.88462842636552186, 0.8844831893258559, 0.88458320553296066, 0.8847000343478495, 0.88460058117613127, 0.88463479893264918, 0.88465151085241556, 0.88476439991877853, 0.88468473749049004, 0.88467596154991757, 0.88464812876643562, 0.88462865004796465, 0.88473406946845501, 0.88467561784604287, 0.88481886512840902, 0.8847778181520668, 0.88463717443092504, 0.88475874624640127, 0.88478306843787291, 0.88474547872382214, 0.88485652207980114, 0.88481058215634723, 0.88482375183612905, 0.88474551476979946, 0.88475664294127376, 0.88475765171077436, 0.88466796135457071, 0.88474704911269564, 0.88472920727334126, 0.88474348202506059, 0.88482686152269718, 0.884846171777112, 0.88486731793675899, 0.88479463538058278, 0.88476348871929134, 0.88482190871251931, 0.88477405531024489, 0.88495738225199916, 0.88502634477438336, 0.8849722918717482, 0.88497644643366924, 0.88495026411204236, 0.88489897024710651, 0.88498738041694913, 0.88503505775394331, 0.88487839214847797, 0.88501296266926555, 0.88494823914871401, 0.88485485414912857, 0.88492856588825475, 0.88483139028353064, 0.88494219770065896, 0.88514089601765955, 0.88498828308684896, 0.88482277989666092, 0.88494521716071828, 0.88491237595419303, 0.88505099771590223, 0.88499395356320743, 0.88504269509303091, 0.88512987277219113, 0.88513226881324936, 0.88506364137951121, 0.88506426197820798, 0.88503725482351248, 0.88511025689372358, 0.88525464781640284, 0.88533772602653815, 0.88515055699951939, 0.88501696921946083, 0.88525339751723353, 0.88509968533617422, 0.88530969977170393, 0.88523029229072492, 0.88529300336747541, 0.88526885213313489, 0.88526751258222303, 0.88524029419180883, 0.88537582142713023, 0.88526148532566551, 0.88537702714292532, 0.88525239753881557, 0.88543110064892649, 0.88541490521143462, 0.88549828584071233, 0.8854537549387308, 0.88535696286148236, 0.88548159298437279, 0.88536733588382599, 0.88537044639925289, 0.88551589914470918, 0.88545967638635836, 0.8856060143395027, 0.88546426146573876, 0.88540082590192482, 0.8853104466182965, 0.88543731407779402, 0.88536405780551564, 0.88544023381459369, 0.88552237925251187, 0.88551688579854115, 0.8855989471916722, 0.88552244057273855, 0.88572592582778797, 0.8856843994777569, 0.88598576103981941, 0.88574320035032916, 0.88571183933889575, 0.8857756264069353, 0.88577218776219102, 0.8858834471767395, 0.88580909121010765, 0.88589782852180565, 0.88586724286856877, 0.88582665325036003, 0.88586700006812624, 0.88580736876098509, 0.88592627398492552, 0.88596139926916673, 0.88588753197940495, 0.88604201883442413, 0.88611263206637059, 0.88601255485216379, 0.88600393191615234, 0.88605966068565456, 0.8860162687130736, 0.88584002482528923, 0.88583703245505474, 0.88593461325408696, 0.88582862461263834, 0.88585571789383466, 0.88587231614860895, 0.88582311022290461, 0.88592120080956338, 0.88594774418610223, 0.88588523290638965, 0.88574864914291884, 0.88591276909246763, 0.885856209863917, 0.88594681177819223, 0.88604751211690891, 0.88584938514592049, 0.88596325257967989, 0.88582237491681781, 0.88596607485756274, 0.88584355706283879, 0.88580729325268714, 0.88576637652923051, 0.88575246616234904, 0.88589788780129552, 0.88573135019307281, 0.88586502481769036, 0.88590157575293826, 0.88587573375663919, 0.88596024907739268, 0.88585875398224945, 0.88597668654805151, 0.88604973479101445, 0.88606236365009572, 0.88619727582592911, 0.88610976900729133, 0.88620155657967747, 0.886270312377609, 0.88630761535546654, 0.88617900761661217, 0.88617565275796661, 0.88612080932919057, 0.88629914120332109, 0.88615014018380545, 0.88606381085884933, 0.88616253891716812, 0.88628592515594939, 0.88625031689542255, 0.88629584163863218, 0.88634694396452041, 0.8864311548861471, 0.88647518054274255, 0.88653490519224798, 0.88634456059346622, 0.88629656849570915, 0.88643379434036229, 0.88641013997101392, 0.88627125403553397, 0.88638064141954931, 0.8865476247505637, 0.88643647356404387, 0.88648957408318851, 0.88648153984988964, 0.88657366869610699, 0.88662662163680428, 0.88659731899105831, 0.88658301415926943, 0.88669619912345843, 0.88659706118479553, 0.88667940160603165, 0.88659468440231159, 0.88666144296714888, 0.88662313913143953, 0.8866119450594816, 0.88662632157928212, 0.8864961161354501, 0.88661074046267785, 0.88652679719119154, 0.88662586885295069, 0.88664760749310489, 0.88671117363336494, 0.88674317246253742, 0.88680589997641135, 0.88659426407348496, 0.88670839135109392, 0.88665188646153437, 0.886683551786007, 0.88661669950214039, 0.88669930654777551, 0.8867040779375811, 0.88672117003582884, 0.88665454725071158, 0.88680255448284506, 0.88684987657681269, 0.88680862925500137, 0.88682049809228136, 0.88677745897275839, 0.8868144527537829, 0.88681909062127917, 0.88695027600762255, 0.88677552204764321, 0.88693607433065269, 0.88681496944549343, 0.88675554649124222, 0.88670017593237926, 0.88681927320334952, 0.88682232861854327, 0.88686179930651388, 0.88693220055513933, 0.88698569095127722, 0.88692103696741109, 0.88702244370180638, 0.88697550818697002, 0.88699625533204784, 0.88703439976683995, 0.88683580662973016, 0.88682574693171012, 0.88689344496447764, 0.88694803050003179, 0.88688264676775175, 0.88696132492837509, 0.88690501604468008, 0.88689790365805021, 0.8870317168613111, 0.88708635244857359, 0.88703410507176217, 0.88711722680317628, 0.88701360138063856, 0.88699872124362167, 0.88701865627249787, 0.88696535146774147, 0.88708720712152567, 0.88714840490927216, 0.88694492411276771, 0.88702979550407779, 0.88708229204523126, 0.8871806946994083, 0.88701060143534594, 0.88706719684496105, 0.88706395704469942, 0.8871385941023131, 0.88712548351870224, 0.88712875973769667, 0.88721105653418153, 0.88725911512047972, 0.8872579476668262, 0.88713641569625223, 0.88714609157200197, 0.88718793023062625, 0.88710887848203279, 0.8870235668653057, 0.8871177428775604, 0.88708413544455555, 0.88710532669303932, 0.88714173474018954, 0.88710076074864175, 0.88720089065860996, 0.88718248824102452, 0.88715229738557211, 0.887221731106, 0.88713013824085629, 0.88731836075038728, 0.88725150380800832, 0.88722748555790698, 0.88726295797536547, 0.88731181264829606, 0.88732347005438938, 0.88719701107670601, 0.88739664050069544, 0.88729714135124615, 0.88736557480430667, 0.88751780542681824, 0.88750905363003285, 0.88741639939266015, 0.88741514797820054, 0.88738443432538272, 0.88738344672733005, 0.88742971123251935, 0.88736389984398711, 0.88729892945471867, 0.88734414034120668, 0.88739776021497641, 0.88736170810040549, 0.88749574252675045, 0.88744544575330275, 0.88745447795086085, 0.88753200307179891, 0.88755457999497545, 0.88757135919029362, 0.88761742896959905, 0.88750127681424884, 0.88772240173012384, 0.88763824130578028, 0.88769721906998733, 0.88769142032527915, 0.88778449233691137, 0.88792100979936339, 0.8877575971395687, 0.88777869260340547, 0.88783500884714894, 0.88788715823530029, 0.88783900666022419, 0.88783085295529562, 0.88776154788108241, 0.88782159873171407, 0.8878214325824203, 0.88779815648773497, 0.88778612722969596, 0.88770624237383478, 0.88775535857563603, 0.88767183539540295, 0.88777339150652546, 0.8876663526559585, 0.88772634334399581, 0.88776480564090698, 0.88775077781505585, 0.88791291032894193, 0.88775570175138374, 0.88779293372340795, 0.88786847425438009, 0.8878388337160863, 0.88780146955578421, 0.88772815260248972, 0.88769966687240909, 0.88787398489733527, 0.88793430659224559, 0.88790565343809869, 0.88768349252062084, 0.88775226510846905, 0.88790231444760992, 0.88801731804608774, 0.88794072404820945, 0.88796990481344196, 0.88797757980541148, 0.88798255989814767, 0.88802069955618212, 0.88803510000279573, 0.88807181100607546, 0.88795140821450969, 0.88796008920175618, 0.88813772301949023, 0.88806405660473053, 0.88797370627519523, 0.88807016060349608, 0.88811034679055867, 0.88817278079957207, 0.88802063125216424, 0.88801421850699647, 0.88799867931803178, 0.8881038236812252, 0.8881043349049933, 0.88799706532100287, 0.88816801724662497, 0.88816649475868648, 0.88809528235809154, 0.88814079890483877, 0.88810400038718407, 0.88795729184736716, 0.88803640333090628, 0.88803391165781842, 0.88822751520430243, 0.88801755507465396, 0.88792908816179916, 0.88800995266694815, 0.88804391278184369, 0.8880350312437848, 0.88817323255398872, 0.88815893494872267, 0.88808242044807539, 0.88817578275391473, 0.88813805848821936, 0.88813423011110004, 0.88819980672510068, 0.88819963064229146, 0.88812670881769273, 0.88819207911940967, 0.88823724559147321, 0.88809648715862255, 0.8881243484143958, 0.88822188285047476, 0.88825465978458717, 0.88826470433370797, 0.88827649626184157, 0.88830183873366553, 0.88830641255515153, 0.8882790009922652, 0.88820965550392028, 0.88831617351236691, 0.88829486760526666, 0.8882701937166928, 0.88850362224131652, 0.88824497724959772, 0.88831788633711295, 0.88849725487916409, 0.88843199865582734, 0.88840519464148682, 0.88836796161578591, 0.88848540371032292, 0.88844459400675813, 0.88847441993693177, 0.88861345495460442, 0.88856899355883923, 0.88860261276927954, 0.88848650595560796, 0.88857299741338569, 0.88861873508357914, 0.88868258613312845, 0.88857778167998991, 0.8886438687787227, 0.88866574888169036, 0.88864933502206278, 0.88859451791749478, 0.88868757803381093, 0.88866780674758272, 0.8887110832550027, 0.88876351987788138, 0.88877722866784503, 0.88864452435841557, 0.88877198778073874, 0.8887809245410897, 0.88885316581556972, 0.8888576598024388, 0.88880808201889228, 0.88874880602197159, 0.88879622097406119, 0.88887795149803328, 0.8888147807050909, 0.88883320070496863, 0.88884953384465004, 0.88883239691688964, 0.88882529782042452, 0.88889060844716239, 0.88879081678839, 0.88877391684846452, 0.88885052520621843, 0.88897253171494572, 0.8889407422834652, 0.88884322442214392, 0.88901278062459343, 0.88890777369908769, 0.88880431749187039, 0.88901106346786007, 0.88910930940662813, 0.88903091613625895, 0.88919250042599562, 0.8891504957229267, 0.88905635551037587, 0.88905364622365513, 0.88913248837144254, 0.88914285374164215, 0.88913509105216959, 0.88915449819326009, 0.88911293627849919, 0.88906261329495473, 0.8891844627251313, 0.88906311748832001, 0.88908539087949501, 0.88899697201673022, 0.88915946255935874, 0.88912028077225924, 0.88917024451663584, 0.88914258476717556, 0.88912839885002382, 0.88918857706712462, 0.88932485582127674, 0.88929805660494354, 0.88924595547809748, 0.88921278283751237, 0.88916151167162938, 0.88932143251235474, 0.88914873743316081, 0.88926738566112418, 0.88931493695495289, 0.88934357114317164, 0.88933323209064663, 0.88931071645323434, 0.88928311855799069, 0.88932096609846534, 0.88936224023979782, 0.88933249915521728, 0.8892820640594481, 0.8893652057752206, 0.88936886819652849, 0.88935648414593305, 0.88936525890160578, 0.88936114334761507, 0.8892466285571442, 0.88949694380375233, 0.88951006169349511, 0.88947164477507967, 0.8895005660795241, 0.88943172925175606, 0.88949186084189436, 0.88950534328510944, 0.88965145914664712, 0.88958021758043915, 0.88956284996662871, 0.88962291574003993, 0.88954744367291938, 0.8897925183084725, 0.8896272111652983, 0.88968728384927553, 0.8896568618761157, 0.88965271912123056, 0.88955827325174464, 0.88973458139992723, 0.889687362461686, 0.88958985311610927, 0.88957988563756762, 0.88969924348476603, 0.88960705838415077, 0.8896525707989531, 0.88964683227829011, 0.88970732152301579, 0.8898150889445573, 0.88977606029919976, 0.88978596373334784, 0.88973480054172716, 0.88965159551621631, 0.88986987696501951, 0.88981232118874509, 0.8897355131534086, 0.88980839740337048, 0.88984869100717834, 0.88989803561178515, 0.88973055753134966, 0.88976290809278213, 0.88981485263905169, 0.88976615845422424, 0.88979041391645397, 0.89000575799548576, 0.88975718051804331, 0.88985509546975128, 0.88988832705354148, 0.8899740318423357, 0.89000672184765239, 0.89002494920095232, 0.88976435826538847, 0.889786401477904, 0.88968581271975111, 0.88993575664056723, 0.88998658692756261, 0.88970745490859082, 0.88994215316688519, 0.89008722702915233, 0.88995346334156533, 0.88984798911256779, 0.88995538810953323, 0.89008446072194791, 0.89003678313311096, 0.89015464275736811, 0.89016608418374921, 0.890135187900709, 0.89011338304047438, 0.89009248597834356, 0.89012355219375283, 0.89015308310473307, 0.89017303300985429, 0.89007766549046941, 0.89018100234503494, 0.89019393763351429, 0.89014494122263543, 0.89020334254604827, 0.89014221988136277, 0.89016609239886124, 0.89028949481529918, 0.8902448011943308, 0.89011926080725101, 0.89030310364191667, 0.89018795130620976, 0.89003783587480123, 0.89010457525138575, 0.89031742665604074, 0.8901477888686643, 0.89023768297690853, 0.89028068800909821, 0.89029715587532532, 0.89035934878955436, 0.89048926139691031, 0.89033209803670832, 0.89044741134249317, 0.89039282557362198, 0.89051059045664016, 0.89046934315337445, 0.89058204210039638, 0.89051040140695081, 0.8906091070254113, 0.89046756669165628, 0.89057414041935579, 0.890668124628473, 0.89063898139325282, 0.89056178403713115, 0.89055618924156343, 0.89070427463429691, 0.89072232795912043, 0.89069268818085368, 0.89080954053435502, 0.89068047107271064, 0.89066286351008384, 0.89072915772707983, 0.89084159924892237, 0.89095888460046913, 0.89084542365903918, 0.89094375646536728, 0.89083624755992941, 0.89087776691919329, 0.89089353760194878, 0.89086615716865158, 0.89087349087839496, 0.89083257643602987, 0.89086675400394932, 0.89087741454822877, 0.89086793163223155, 0.89106053636551674, 0.89100604884742785, 0.89102312035930997, 0.89104928559781404, 0.89098250252298417, 0.89110645105236652, 0.89119376138539363, 0.89104674766900416, 0.89117544801668624, 0.89121848419160077, 0.89131094479844764, 0.89127918402582995, 0.89123376497167939, 0.89145878323397221, 0.89128409968437594, 0.89128644293731907, 0.89133090682065241, 0.8912802371253421, 0.89130848888666447, 0.8913338877157071, 0.89132418977838113, 0.89128363676885247, 0.89141055021129079, 0.891350853018682, 0.89145148627024262, 0.89129686233756333, 0.89144861206936787, 0.89139788802727404, 0.89157860026890134, 0.89162358154760224, 0.89171060146771042, 0.89173619792901038, 0.89171009408287449, 0.89170594247465851, 0.89165435402072424, 0.89161941219936336, 0.89165286359588569, 0.89168101125605537, 0.89178321848629172, 0.8915387448892147, 0.89155687389198202, 0.89171645315593595, 0.89178417522133258, 0.89174734181254844, 0.891815247680528, 0.89178836563472175, 0.8918113600869243, 0.89183638868267723, 0.8918950992317819, 0.89187697223243367, 0.89180535969231356, 0.89177838682491251, 0.89193372656908398, 0.89201787034986157, 0.89174936311831232, 0.89186947284221552, 0.89193809040572702, 0.89198076014515137, 0.89205143553867094, 0.89210735929801088, 0.8921279121196507, 0.89208624886833143, 0.89218448118076088, 0.89213458628486153, 0.89220660490504455, 0.89220611963448215, 0.89217941386231647, 0.89217018253678726, 0.89210695412058616, 0.89217803840906018, 0.89213042562501399, 0.89220898470829335, 0.89219487276427922, 0.89224081816065337, 0.89214551709233092, 0.89221053760324009, 0.89228605303358943, 0.8923449457620769, 0.89225485241099034, 0.89230370063437658, 0.89232166988915507, 0.89238037046172813, 0.89231812211958561, 0.89236327278639493, 0.89237006001243346, 0.89239066182320959, 0.89248612528523863, 0.89243054054721782, 0.89240402957956355, 0.89246363010264229, 0.89241129883321357, 0.89235288649779521, 0.89241065942377229, 0.89238245761041157, 0.89232213637125224, 0.89255209223180521, 0.89249536756125725, 0.89253935182375965, 0.89246081329854088, 0.89259678726999148]}
 '''
 
 plt.figure()
-plt.plot(BNMTF.all_performances['MSE'])
+plt.plot(performances_sink.values['MSE'])
 plt.ylim(0,10)
\ No newline at end of file
@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmtf_icm import nmtf_icm
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import numpy, matplotlib.pyplot as plt
@@ -38,10 +39,11 @@ priors = { 'alpha':alpha, 'beta':beta, 'lambdaF':lambdaF, 'lambdaS':lambdaS, 'la
 # Run the VB algorithm
 NMTF = nmtf_icm(R,M,K,L,priors) 
 NMTF.initialise(init_S,init_FG)
-NMTF.run(iterations,minimum_TN=minimum_TN)
+performances_sink = MemorySink()
+NMTF.run(iterations,minimum_TN=minimum_TN,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Extract the performances across all iterations
-print "icm_all_performances = %s" % NMTF.all_performances
+print "icm_all_performances = %s" % performances_sink.values
 
 '''
 icm_all_performances = {'R^2': [0.037804981423833595, 0.6439409885791966, 0.721160861337115, 0.7438840962351604, 0.7533196412210279, 0.7584979460292265, 0.7619337879573317, 0.7644835851499027, 0.7665062347147026, 0.7681687265546489, 0.7695747818261927, 0.7707857292348244, 0.7718427459598073, 0.7727761252250168, 0.7736066628969382, 0.7743529437258718, 0.7750276137729556, 0.7756407855270708, 0.776201060805582, 0.7767157729868093, 0.777191090280779, 0.7776316890426254, 0.7780417083425109, 0.7784242886978606, 0.7787768936767614, 0.779109894737608, 0.7794247023627859, 0.7797251884741314, 0.7800134892732759, 0.7802920388736556, 0.7805621763515059, 0.780824943203189, 0.7810812106742502, 0.7813318128350808, 0.7815772922461595, 0.7818183058471, 0.7820553449060146, 0.7822883314547547, 0.7825160332958224, 0.7827401929091634, 0.7829606101172988, 0.7831771484481374, 0.7833902682973224, 0.7835997039659697, 0.7838053281493929, 0.7840084411110724, 0.7842084183276546, 0.7844052650164265, 0.7845995303065433, 0.7847912934162294, 0.7849808316379776, 0.7851683465807627, 0.7853539263986429, 0.7855375221909149, 0.7857190011600447, 0.7858983937075581, 0.786075567526773, 0.786250742718877, 0.7864238677500013, 0.7865946303129514, 0.7867630916985245, 0.7869293549332869, 0.7870936870103844, 0.7872558085850491, 0.7874161346150945, 0.7875742434088736, 0.7877304407535038, 0.7878849315440482, 0.7880377726255183, 0.7881889842609917, 0.7883385812491093, 0.7884866706107927, 0.7886330378880086, 0.7887776648208537, 0.7889206998566438, 0.7890621796444784, 0.7892021139713625, 0.7893405409831132, 0.7894775494677817, 0.7896131568922319, 0.7897473579828568, 0.7898801876269292, 0.7900116635157753, 0.7901418192090544, 0.7902706734673377, 0.7903982470179719, 0.7905245615238534, 0.7906496376817752, 0.7907734969066039, 0.790895839932489, 0.7910168195223707, 0.7911365667648482, 0.7912549825978736, 0.7913720269622793, 0.7914877756556478, 0.7916023654051502, 0.7917158824149042, 0.7918283325514194, 0.7919397578782301, 0.7920501847011204, 0.7921596875286611, 0.7922682659310067, 0.792375947283317, 0.7924827597265057, 0.7925887498424768, 0.792693907944299, 0.7927982546835282, 0.7929016821732573, 0.7930042860075119, 0.7931061433309342, 0.7932072995806999, 0.7933077879221192, 0.7934076643468713, 0.7935069271857349, 0.7936055964321514, 0.7937036975178355, 0.7938012538485304, 0.7938982897394244, 0.7939948288038688, 0.794090893692821, 0.7941865077860956, 0.7942816608388614, 0.7943763623868972, 0.7944707249043301, 0.7945647152970777, 0.7946583570394146, 0.7947516684549104, 0.7948446755822185, 0.7949373981889819, 0.7950298563340653, 0.795122059585329, 0.7952140320813424, 0.7953057861463483, 0.7953973319167928, 0.7954886984059953, 0.795579898801037, 0.7956709515714505, 0.7957617365553556, 0.7958523708470181, 0.7959429477663396, 0.796033475168382, 0.7961239337645696, 0.7962143676761574, 0.796304772296554, 0.7963951604149114, 0.7964855509771858, 0.796575946404745, 0.7966663402004475, 0.7967567390691852, 0.7968470913992975, 0.7969374508443752, 0.7970277981535232, 0.7971180994350772, 0.7972084002373062, 0.7972987373633439, 0.7973891290429906, 0.7974795864507238, 0.7975701174059981, 0.7976606828369911, 0.7977513406394166, 0.7978420934399871, 0.7979329499465619, 0.798023898047944, 0.7981149051283281, 0.7982059733778721, 0.7982971485644522, 0.7983884271133239, 0.7984797461836723, 0.7985712435447039, 0.7986629866930925, 0.7987548230814263, 0.7988467378455191, 0.7989387117983602, 0.7990307566775801, 0.7991228809252477, 0.7992150869888158, 0.7993073754255853, 0.7993997730592278, 0.7994922493292007, 0.7995847880120248, 0.799677335786886, 0.7997698912298484, 0.7998624876348841, 0.7999551317614912, 0.800047824681148, 0.8001405648346986, 0.8002333543174194, 0.8003261677018635, 0.8004189943158686, 0.8005117873303469, 0.8006044082476735, 0.8006969688590241, 0.8007894997781273, 0.8008820025153636, 0.800974505582636, 0.8010670009327558, 0.8011594509267581, 0.8012518516869798, 0.8013441970934382, 0.8014364585409537, 0.8015286468844484, 0.8016207540017375, 0.8017127928988288, 0.8018047592430939, 0.801896622032503, 0.801988349431477, 0.8020798300445989, 0.8021710854618002, 0.8022621791156692, 0.8023530548162132, 0.8024437008288894, 0.8025340914919731, 0.8026242482747725, 0.8027141910433936, 0.8028039156579887, 0.8028934196368843, 0.8029827070451121, 0.8030717732769099, 0.8031606497567388, 0.803249092702575, 0.8033372426522881, 0.8034251052258663, 0.8035127487675147, 0.8036001215915236, 0.8036872606344675, 0.8037741227023294, 0.8038606765601907, 0.8039467600386068, 0.8040324781709198, 0.8041177979105489, 0.8042027305420327, 0.8042872649541585, 0.8043713933747653, 0.8044551260413562, 0.8045383448680865, 0.804621192360966, 0.8047035960926746, 0.8047855727904751, 0.8048671445300485, 0.804948325837069, 0.8050290966218002, 0.8051094683592807, 0.8051894208495076, 0.8052689458626185, 0.8053480032148934, 0.8054265954524995, 0.805504750197936, 0.8055824344338338, 0.8056596010846103, 0.8057362787739708, 0.8058125073070421, 0.805888284611855, 0.8059636348329902, 0.8060385683677471, 0.8061130425309542, 0.806187056164133, 0.8062606011280833, 0.8063336742557689, 0.8064062737081114, 0.806478398043309, 0.806550028524593, 0.8066211491689066, 0.8066917319178765, 0.8067617986469149, 0.8068313418455979, 0.8069003843268862, 0.806968967667946, 0.8070370475611311, 0.8071046054496649, 0.8071716347871358, 0.8072381818307517, 0.8073042420180445, 0.8073697890772699, 0.8074348488171371, 0.8074994112173771, 0.8075632660855304, 0.8076265302750837, 0.8076893160835241, 0.8077516114816903, 0.8078134614952661, 0.8078748209176192, 0.8079356903732028, 0.8079960357220389, 0.8080558545587752, 0.8081151598912795, 0.8081739750265239, 0.8082323127946475, 0.8082901747952633, 0.8083475647647441, 0.8084044855932776, 0.8084609478496229, 0.8085168948412647, 0.8085723887799432, 0.8086274366990923, 0.8086820498153564, 0.8087362230942055, 0.8087899527105423, 0.8088432391233884, 0.8088960837007384, 0.8089484517808272, 0.8090003456169709, 0.8090514428902107, 0.8091021053125842, 0.8091523435673337, 0.8092021603731621, 0.8092515583584343, 0.8093005409840007, 0.8093491300003243, 0.8093973110841157, 0.8094450584093216, 0.809492384894598, 0.8095393058716911, 0.8095858304968093, 0.8096316901213462, 0.8096769898938979, 0.8097217925375039, 0.8097660166371959, 0.8098097173388316, 0.809852913806578, 0.8098955909883092, 0.8099377743530158, 0.8099794979111652, 0.8100207630400601, 0.810061583165467, 0.8101019711638776, 0.8101419489322653, 0.810181522938316, 0.8102206923255689, 0.8102594660854088, 0.8102978527777199, 0.8103358730614542, 0.8103735267749554, 0.8104108185244867, 0.8104477556716813, 0.810484344830787, 0.8105205939505514, 0.810556513454065, 0.8105921073586029, 0.8106273813081063, 0.8106623408935041, 0.8106969916008302, 0.8107313387408527, 0.8107653875772484, 0.8107991432655344, 0.810832608931153, 0.810865789242845, 0.8108986942749181, 0.8109313316754625, 0.8109637068727954, 0.8109958253306625, 0.8110276831846399, 0.8110592949747197, 0.811090668226307, 0.8111217948467827, 0.8111526802774793, 0.8111833200291695, 0.8112137375359835, 0.8112439217643572, 0.8112738791266014, 0.8113036156223834, 0.811333182848091, 0.8113625679419507, 0.8113917426755983, 0.811420709352555, 0.8114494751984539, 0.8114780358267861, 0.8115063919631665, 0.8115345516281816, 0.8115625222218472, 0.8115903063966723, 0.8116179081888567, 0.8116453318193699, 0.8116725913617739, 0.8116996550264275, 0.8117264675795685, 0.8117530770908568, 0.8117795001767221, 0.8118057495293916, 0.8118318330416827, 0.8118577564335342, 0.8118835241408506, 0.8119091392557796, 0.8119346053357483, 0.8119599184303149, 0.8119850847194044, 0.8120101105079015, 0.8120349971373332, 0.8120597352462001, 0.812084357930557, 0.8121088482784123, 0.8121332083407562, 0.8121574409172223, 0.8121815501268995, 0.812205538611248, 0.8122294088534215, 0.8122531634712852, 0.8122768048271791, 0.8123003350726868, 0.812323756280763, 0.812347070457476, 0.8123702795442942, 0.8123933854827653, 0.812416390211287, 0.8124392956279014, 0.812462103640785, 0.8124848160200651, 0.8125074211575513, 0.812529924224838, 0.8125523367889396, 0.8125746605655157, 0.8125968972831175, 0.8126190466627675, 0.8126411074465107, 0.8126630845540227, 0.8126849801301207, 0.8127067906785601, 0.8127285062830317, 0.8127501341619574, 0.812771682324274, 0.8127931538029275, 0.8128145487228664, 0.8128358688366653, 0.812857115962938, 0.8128782917255147, 0.8128993977145534, 0.8129204353331538, 0.8129414059104466, 0.8129623161109443, 0.8129831428210352, 0.8130038607919035, 0.8130244956949547, 0.8130450559008057, 0.8130655450873604, 0.8130859674446327, 0.8131063246065193, 0.8131266120937547, 0.8131468323452609, 0.8131669905272716, 0.8131870884157333, 0.8132071274641617, 0.8132271089342074, 0.8132470339832036, 0.8132669037851936, 0.8132867195647557, 0.8133064822790913, 0.8133261914756045, 0.8133456330920112, 0.8133649318268104, 0.8133841902984008, 0.8134034083963496, 0.8134225814608806, 0.8134417122130544, 0.813460801460771, 0.8134798497361072, 0.8134988574657713, 0.8135180181962004, 0.813537146362352, 0.8135562377180823, 0.8135752924888916, 0.8135943109535141, 0.8136132934143644, 0.8136322402704745, 0.8136511518899645, 0.813670028721431, 0.8136888712273445, 0.8137076789518767, 0.8137264521574175, 0.813745191506641, 0.8137638975687883, 0.8137825708566098, 0.8138012118370874, 0.813819820916021, 0.8138383985296611, 0.8138569450756008, 0.8138754609185526, 0.8138939450855871, 0.8139123903300155, 0.8139307982715623, 0.813949173835742, 0.8139675181997598, 0.8139858321675202, 0.8140040722672928, 0.8140217269615334, 0.814039337119884, 0.8140569119637213, 0.8140744463708373, 0.8140919409264207, 0.8141093968820223, 0.8141268154575736, 0.8141441996811021, 0.8141615471999735, 0.814178859019437, 0.8141961355383202, 0.8142133770949698, 0.8142304814226246, 0.8142475258799415, 0.8142645369663639, 0.814281514758962, 0.814298459463269, 0.814315371277073, 0.8143322504011792, 0.8143490968147709, 0.8143659109306907, 0.8143826902126386, 0.8143994310517337, 0.8144161355435887, 0.8144328049437625, 0.8144494412503649, 0.8144660381085622, 0.8144826027251427, 0.8144991352927297, 0.8145156359448609, 0.8145320995198414, 0.8145485293243988, 0.8145649257578891, 0.8145812890576315, 0.8145976194102355, 0.814613916983187, 0.8146301819237098, 0.8146464143578763, 0.8146626140633986, 0.8146787803903757, 0.8146949142764792, 0.8147110158310971, 0.8147271429420173, 0.8147432672251155, 0.814759359748677, 0.8147754205160952, 0.8147914500801742, 0.8148074480216938, 0.8148234142598456, 0.8148393495245108, 0.8148552502592147, 0.8148711192870297, 0.8148869569499566, 0.8149027633625103, 0.8149185385593796, 0.8149342825294166, 0.8149499952360971, 0.8149656766309642, 0.8149813266594013, 0.8149969453072308, 0.8150125327518428, 0.8150280889528896, 0.8150436138780213, 0.8150591074994116, 0.8150745697932832, 0.8150900007392214, 0.8151054003194576, 0.8151207685996564, 0.8151361056964062, 0.8151514113738414, 0.8151666856225301, 0.8151819284314693, 0.8151971397882515, 0.8152123196790855, 0.8152274681331265, 0.8152424835037326, 0.8152573019012868, 0.8152720894917515, 0.8152868468441905, 0.81530157162895, 0.8153162628520662, 0.8153309253250304, 0.8153455569344702, 0.8153601575708008, 0.815374727204214, 0.8153892658084996, 0.8154037733587456, 0.8154182498352354, 0.8154326952259662, 0.8154471095276153, 0.8154614927454814, 0.8154758448927304, 0.8154901659893181, 0.815504456060758, 0.8155187150986607, 0.815532943102073, 0.8155471401274323, 0.8155613062273565, 0.8155754414510639, 0.8155895458445909, 0.8156036194508807, 0.8156176623097999, 0.8156316744581535, 0.8156457125044126, 0.815659727823408, 0.8156737135752843, 0.8156876695495596, 0.8157016100455337, 0.8157155345174487, 0.8157294043209466, 0.8157431973636547, 0.8157569535321434, 0.8157706791635655, 0.8157843741552726, 0.8157980384912078, 0.8158116721090106, 0.8158252749155376, 0.8158388467990452, 0.8158523876398417, 0.8158658973221822, 0.8158793757341586, 0.8158929280090598, 0.8159064956441928, 0.8159200333026173, 0.8159335406625634, 0.8159470086403801, 0.815960428927105, 0.815973812882703, 0.8159869153035544, 0.81599991187354, 0.8160128648843947, 0.8160257787983096, 0.8160386565099529, 0.8160514995350103, 0.8160643087151511, 0.8160770845015343, 0.8160898271402431, 0.8161025367462553, 0.8161152134343035, 0.8161278573314883, 0.8161404684976289, 0.8161530470096583, 0.8161655929392894, 0.816178106334396, 0.8161905871875602, 0.8162030356119875, 0.8162154517457562, 0.8162278357241274, 0.8162401838075273, 0.8162524889586305, 0.8162647559374194, 0.8162769903774091, 0.8162892692820155, 0.8163015416074354, 0.816313781967704, 0.8163259911134036, 0.8163380645383873, 0.8163498708469471, 0.8163616292528757, 0.8163733466276341, 0.8163850355494258, 0.8163966831894899, 0.8164082954900718, 0.8164198753319386, 0.8164314286545982, 0.8164429542779646, 0.8164544521389394, 0.8164659222625492, 0.8164773645171997, 0.8164887786905947, 0.8165001645368557, 0.8165115218487023, 0.816522850368933, 0.8165341496767747, 0.8165454196929997, 0.8165566603770474, 0.8165678719935753, 0.8165790544688236, 0.8165902077963718, 0.8166013319490718, 0.8166124268875521, 0.8166234926114389, 0.816634529163635, 0.8166455365931737, 0.8166565149544571, 0.8166674643064767, 0.8166783846407605, 0.8166892758943556, 0.816700138167579, 0.8167109715588103, 0.8167217761660952, 0.816732552087168, 0.8167432994194285, 0.8167540182598972, 0.8167647084624782, 0.8167753700215573, 0.8167860035782549, 0.816796609184569, 0.8168071868930497, 0.8168177368184395, 0.8168282590818444, 0.8168387538021611, 0.8168492210898395, 0.8168596611370557, 0.8168700740998209, 0.8168804601106232, 0.8168908192728113, 0.8169011518586536, 0.8169114584054404, 0.8169217390589496, 0.816931993963095, 0.8169422232574837, 0.8169524270781101, 0.8169626055578295, 0.8169727588323332, 0.8169828870400795, 0.8169929901129527, 0.8170030681152813, 0.8170131218696247, 0.8170231516162993, 0.8170331574417797, 0.8170431393120687, 0.8170530975020835, 0.8170630321159698, 0.8170729432366066, 0.8170828309394044, 0.8170926953240047, 0.8171025364890109, 0.81711235453235, 0.817122149551198, 0.8171319216418982, 0.8171416708998798, 0.8171513974668484, 0.8171611014377919, 0.8171707829092989, 0.8171804368742261, 0.8171900619755779, 0.8171996647029931, 0.8172092652081357, 0.8172188481055581, 0.8172284089125131, 0.8172379478316926, 0.8172474649680344, 0.8172569496812752, 0.8172664152792097, 0.8172758578077882, 0.8172852769975695, 0.8172946729711483, 0.817304045869859, 0.8173133958097061, 0.8173227229245854, 0.8173318876922238, 0.8173409842464413, 0.8173500586847251, 0.8173591112587562, 0.8173681421602681, 0.8173771515435426, 0.8173861395469368, 0.817395106311978, 0.8174040519527114, 0.8174129765744286, 0.8174218802780204, 0.8174307631623027, 0.8174396253255068, 0.8174484658152366, 0.8174572796718887, 0.8174660712224613, 0.8174748409481157, 0.8174835892480283, 0.8174923164543118, 0.8175010228445159, 0.8175097087075482, 0.817518374298991, 0.8175270198470135, 0.8175356455600925, 0.8175442511204901, 0.8175528324099839, 0.8175613944606315, 0.8175699374355581, 0.8175784614227146, 0.8175869665060416, 0.8175954527594063, 0.8176039202890095, 0.8176123691908872, 0.8176207969191753, 0.8176292035966148, 0.8176375902111078, 0.8176459571680894, 0.8176543047848186, 0.8176626333229828, 0.8176709429995367, 0.8176792340028949, 0.8176875065009205, 0.8176957606468329, 0.8177039965832478, 0.8177122144449358, 0.8177204117242022, 0.8177285888379145, 0.8177367468356342, 0.8177448860661098, 0.8177530068335158, 0.8177611094086588, 0.8177691940342133, 0.8177772609290571, 0.8177853102918973, 0.8177933423043043, 0.8178013571332724, 0.8178093549333693, 0.8178173358480749, 0.8178253000126116, 0.8178332475788423, 0.8178411786892513, 0.817849093485999, 0.8178569916857447, 0.817864873369204, 0.8178727397414035, 0.8178805909038779, 0.8178884269608546, 0.8178962480152681, 0.8179040541685565, 0.8179118455206423, 0.8179196221845066, 0.8179273842689672, 0.8179351318782339, 0.8179428651112869, 0.8179505840604624, 0.8179582888170184, 0.8179659794710048, 0.8179736561113351, 0.8179813188258239, 0.817988967700221, 0.8179966028297728, 0.8180042243193527, 0.8180118322709894, 0.818019426784172, 0.8180270032727668, 0.8180345288962998, 0.8180420424193804, 0.8180495437156896, 0.8180570329179484, 0.8180645100848338, 0.8180719752359886, 0.8180794283970356, 0.818086869598015, 0.818094298873322, 0.818101716261577, 0.8181091218053836, 0.8181165155510042, 0.8181238975480123, 0.8181312678489943, 0.8181386265091739, 0.818145973586138, 0.818153309139527, 0.8181606332307766, 0.8181679459205622, 0.8181752472745031, 0.8181825373616988, 0.8181898162521655, 0.818197084016415, 0.8182043407253722, 0.8182115864732771, 0.8182188253154994, 0.8182260522002326, 0.818233264694979, 0.8182404639359895, 0.8182476505759122, 0.8182548250834604, 0.8182619877975368, 0.8182691373643012, 0.8182762755918805, 0.8182834026720858, 0.8182905187772381, 0.8182976240620516, 0.8183047186685685, 0.8183118027294248, 0.8183188763700044, 0.8183259397098478, 0.818332992863609, 0.8183400358944566, 0.8183470689158951, 0.8183540920488755, 0.8183611049438296, 0.8183681079796821, 0.8183751031014723, 0.8183820887769323, 0.8183890650723882, 0.8183960320597007, 0.8184029898137339, 0.8184099384112652, 0.8184168779302661, 0.8184238084492896, 0.8184307300471134, 0.8184376428024225, 0.8184445467936184, 0.8184514420986722, 0.818458328801773, 0.818465207045301, 0.8184720769400742, 0.8184789385988426, 0.8184857921242545, 0.8184926375984435, 0.8184994751164957, 0.8185063047700354, 0.8185131266477553, 0.8185199408357522, 0.8185267474177874, 0.8185335464755161, 0.8185403380887162, 0.8185471223354648, 0.8185538992922976, 0.8185606690343348, 0.8185674316354367, 0.8185741871682748, 0.8185809357044531, 0.8185876773145884, 0.8185944120683741, 0.8186011400346427, 0.8186078612814436, 0.8186145758760687, 0.8186212838851152, 0.8186279853745265, 0.8186346804096, 0.8186413690550545, 0.8186480513750425, 0.8186547274331634, 0.8186613972925082, 0.8186680610156643, 0.8186747186647338, 0.8186813703013596, 0.8186880159867305, 0.8186946558154802, 0.8187012898534, 0.8187079181334435, 0.8187145407317661, 0.8187211566315058, 0.8187277667106689, 0.8187343712928904, 0.8187409704448767, 0.8187475642316042, 0.8187541588038907, 0.818760753467854, 0.818767342242577, 0.8187739267538421, 0.8187805078329666, 0.8187870859536531, 0.8187936613557283, 0.8188002341285577, 0.8188068042683145, 0.8188133717171331, 0.8188199363894846, 0.8188264981895019, 0.818833057022028, 0.8188396127993061, 0.818846165444627, 0.8188527148940116, 0.8188592610965557, 0.818865804013979, 0.8188723436196519, 0.8188788798922935, 0.818885412821477, 0.8188919424075025, 0.8188984686573602, 0.8189049915836775, 0.8189115112037264, 0.8189180275386255, 0.8189245406125936, 0.8189310488346698, 0.8189375526918349, 0.8189440534104186, 0.8189505510162268, 0.8189570455291109, 0.818963536967865, 0.8189700253821054, 0.8189765108192723, 0.8189829933250466, 0.8189894729435597, 0.8189959497251704, 0.8190024256123332, 0.8190088985464967, 0.8190153686625513, 0.8190218360228325, 0.8190283006849461, 0.819034762702684, 0.8190412221267747, 0.819047679005423, 0.8190541333848744, 0.8190605853099708, 0.8190670348240956, 0.8190734819692707, 0.8190799267723934, 0.8190863692698905, 0.8190928095015726, 0.8190992474955671, 0.8191056832996133, 0.8191121169593952, 0.819118548519389, 0.8191249781061729, 0.8191314057583149, 0.8191378315129991, 0.819144255406294, 0.819150677473272, 0.8191570977481784, 0.8191635162645068, 0.8191699330551317, 0.8191763481523686, 0.8191827615880554, 0.8191891733936143, 0.8191955836001069, 0.8192019922382745, 0.8192083993385668, 0.819214804967787, 0.8192212092156891, 0.8192276119872751, 0.819234013314503, 0.8192404132286458, 0.8192468117605523, 0.8192532089407032, 0.819259604799321], 'MSE': [11.253556389330123, 4.1643638613744969, 3.2612224236397065, 2.9954579992389729, 2.8851025769882437, 2.8245386122667928, 2.7843539925833811, 2.7545322974654685, 2.7308759694925668, 2.7114319427553242, 2.6949871244187591, 2.6808242315701607, 2.6684616677557447, 2.6575451321357515, 2.6478314022327827, 2.6391031161488367, 2.6312123691874936, 2.6240408885852657, 2.6174880699585343, 2.6114681442221825, 2.6059089697645681, 2.6007558532800918, 2.5959603853937541, 2.5914858355163823, 2.5873618690266253, 2.5834671843279988, 2.5797852848239113, 2.5762708856294099, 2.572899002344188, 2.5696411662770915, 2.5664817159773388, 2.5634084704028219, 2.5604112397160463, 2.5574802688694422, 2.5546092122315884, 2.5517903864255751, 2.5490180457207599, 2.5462931020101975, 2.5436299667216762, 2.5410082603105626, 2.5384303239951151, 2.5358977539136887, 2.5334051654111649, 2.5309556660253265, 2.5285507446751958, 2.5261751938528207, 2.5238363178038461, 2.5215340555083863, 2.5192619845096678, 2.5170191782941047, 2.5148023937284005, 2.5126092728519311, 2.510438784640169, 2.5082915010216835, 2.5061689751582659, 2.5040708514824082, 2.5019986774150356, 2.4999498787159218, 2.4979250581103796, 2.4959278682535979, 2.4939575923060286, 2.4920130252985642, 2.4900910445561055, 2.4881949172147735, 2.4863197900472445, 2.4844705950378212, 2.4826437557882679, 2.4808368759048167, 2.4790492905445465, 2.4772807627163309, 2.475531119339518, 2.4737991087281652, 2.4720872391217927, 2.4703957240829864, 2.4687228274146, 2.467068120479301, 2.465431488811094, 2.4638124862674644, 2.4622100744088833, 2.4606240489479325, 2.4590544715632032, 2.4575009342231784, 2.4559632300151932, 2.4544409664351186, 2.4529339240647032, 2.4514418604828592, 2.4499645223265767, 2.4485016675321116, 2.4470530456373409, 2.4456221567696383, 2.4442072142575628, 2.442806684926532, 2.4414217273777883, 2.4400528101318422, 2.4386990466819536, 2.4373588379064253, 2.4360311755866744, 2.4347159911096923, 2.4334127925124682, 2.4321212721301144, 2.4308405585318016, 2.4295706567448767, 2.4283112465973411, 2.4270619989611544, 2.4258223690277574, 2.4245924700927151, 2.4233720606213631, 2.4221624024279578, 2.4209623774722528, 2.4197710834926864, 2.4185879890691093, 2.4174127063095852, 2.416244580351528, 2.4150836307176693, 2.4139296235704655, 2.41278226146789, 2.4116412706631003, 2.4105063667726374, 2.4093772736215366, 2.4082537262907069, 2.4071354513365595, 2.4060225685796914, 2.4049149664923783, 2.4038113296095549, 2.4027120449900954, 2.4016168380856344, 2.4005254945889654, 2.3994377099594839, 2.3983532530005172, 2.3972718891093501, 2.396193506383038, 2.3951178225038112, 2.3940446933308692, 2.3929740003112498, 2.3919054041135088, 2.390838750505337, 2.3897738234723844, 2.3887120283934697, 2.387651995767714, 2.3865926341523691, 2.3855338516768874, 2.3844758739349077, 2.3834181848969132, 2.3823608384402712, 2.3813036849867379, 2.3802465029498543, 2.3791892640099968, 2.3781320441558682, 2.3770747649689765, 2.3760180300844707, 2.3749612119853762, 2.3739045358246265, 2.3728483979893884, 2.3717922657601958, 2.3707357086981777, 2.3696785135928282, 2.3686205497506698, 2.3675617257176103, 2.3665024984664536, 2.3654421908655703, 2.364380772193686, 2.3633181406061836, 2.3622544377521395, 2.3611900450966417, 2.3601249370242279, 2.3590585782469753, 2.3579910105740685, 2.356922968973616, 2.3558528421365779, 2.3547798406412523, 2.3537057486383275, 2.3526307399750532, 2.3515550390571875, 2.350478508604783, 2.3494010498818234, 2.3483226342636088, 2.3472432552321054, 2.3461625990653587, 2.3450810231906942, 2.3439987173532582, 2.3429163051779711, 2.3418338033187762, 2.3407508223789457, 2.3396672833013308, 2.3385831735542308, 2.3374985113730844, 2.3364132722521429, 2.3353277535835137, 2.3342420801857404, 2.3331567997583766, 2.3320735321298374, 2.3309909698226599, 2.3299087547874726, 2.3288268693593031, 2.327744980071123, 2.3266631810405434, 2.3255819124820793, 2.3245012197477628, 2.3234211744151509, 2.3223421110422047, 2.3212639026728743, 2.3201866443018999, 2.3191101838147499, 2.3180345718846049, 2.3169601711022905, 2.3158873538075926, 2.3148174228492913, 2.3137501257177533, 2.3126847205236567, 2.3116218644490067, 2.3105616947376433, 2.3095045115217223, 2.3084500637023853, 2.3073981189313693, 2.3063487256271387, 2.3053019128146368, 2.3042576329504199, 2.3032159399021594, 2.3021764661383899, 2.3011420628635961, 2.3001110863872465, 2.2990834709795744, 2.2980584173064016, 2.2970365298689299, 2.2960173766676055, 2.2950014628872326, 2.2939891538424431, 2.2929823462204517, 2.2919798115814749, 2.2909819364288264, 2.2899885887817866, 2.2889998985939024, 2.2880159567661384, 2.2870366435635989, 2.2860633400843824, 2.2850943796191614, 2.2841306092570504, 2.2831718333607935, 2.2822177937395711, 2.2812683205052715, 2.2803236486216774, 2.279383643880037, 2.2784485425337757, 2.2775184408370008, 2.2765938087669517, 2.2756746165443893, 2.2747605411045018, 2.2738519686089469, 2.2729494496402092, 2.2720526494236597, 2.2711611024099749, 2.2702748328323121, 2.269393558302593, 2.2685171572169933, 2.2676461288090111, 2.2667804866278769, 2.265920325867337, 2.2650656835681375, 2.2642165812396096, 2.2633730357446531, 2.2625352662231308, 2.2617034596082797, 2.2608779440627691, 2.2600584637380665, 2.2592451064739314, 2.2584376054565327, 2.2576354744112823, 2.2568392315476764, 2.2560490939004407, 2.2552651380345252, 2.2544868229389197, 2.2537142019749385, 2.2529475824093548, 2.2521866623909221, 2.251431559113827, 2.2506847309286635, 2.2499448111506379, 2.2492104863806137, 2.2484818973082072, 2.2477585173259595, 2.2470408751576509, 2.2463289634998542, 2.2456231816439405, 2.2449235577222217, 2.2442299395984096, 2.2435420546808613, 2.2428597529119561, 2.2421830155830782, 2.2415117989946891, 2.240846069343982, 2.2401857030217887, 2.2395313630874725, 2.2388823219304017, 2.2382384972895535, 2.2375997579782814, 2.2369661628789994, 2.2363377567289473, 2.2357145341595395, 2.2350964791711045, 2.2344839971576835, 2.2338770617651411, 2.2332794427433811, 2.2326869096123692, 2.232099337423977, 2.2315166943810363, 2.2309389497429448, 2.230366063032593, 2.2297977798628166, 2.2292342677546912, 2.2286758287623143, 2.2281223117927969, 2.2275735375304433, 2.2270293988868706, 2.2264930378989667, 2.225963224778972, 2.2254392259362468, 2.2249219935768556, 2.2244108827307016, 2.2239056692591919, 2.2234065292076655, 2.2229131646981304, 2.2224251779539337, 2.2219425528665377, 2.2214651324120394, 2.2209927659906881, 2.2205251975017792, 2.2200623513011184, 2.2196042374056231, 2.219150750654642, 2.2187017909342281, 2.2182571166232199, 2.2178167296122986, 2.2173805760279355, 2.2169485697705875, 2.2165206334819083, 2.2160966741956338, 2.2156765700062935, 2.2152602739289899, 2.2148477199538115, 2.2144388426908588, 2.2140335779770575, 2.2136318636991899, 2.2132336382948052, 2.2128388414664557, 2.212447436659867, 2.2120593692707908, 2.211674521473018, 2.2112928038166833, 2.2109141528137495, 2.2105385045618182, 2.2101659042580795, 2.209796181846964, 2.2094292493134979, 2.209065201306629, 2.2087039741860943, 2.208345620456607, 2.2079898660393158, 2.2076368399796138, 2.20728646728096, 2.2069386777729672, 2.2065928679991136, 2.2062491883870057, 2.2059079690874794, 2.205569183159211, 2.2052327460932726, 2.2048987091930119, 2.2045670639718464, 2.2042377166233016, 2.2039105805989174, 2.2035856248757124, 2.2032628022474534, 2.2029420633468964, 2.2026232435737012, 2.2023067147303799, 2.2019931228151344, 2.2016819056190431, 2.2013728688011169, 2.2010658639167153, 2.2007607986537141, 2.2004576061133543, 2.2001562344145706, 2.1998566473924939, 2.1995588034404769, 2.1992627487617549, 2.1989684110776975, 2.1986757166481876, 2.1983846497831103, 2.1980953199718716, 2.1978073401325275, 2.1975209080628706, 2.1972359997751112, 2.1969525825255354, 2.1966706081384655, 2.196390045720142, 2.1961108662283126, 2.1958330390451799, 2.1955565365414915, 2.1952813335529462, 2.1950074058348599, 2.194734729924837, 2.1944632831160193, 2.194193042700622, 2.1939239860077047, 2.19365609083831, 2.1933893348749569, 2.1931236974147437, 2.1928593142237296, 2.192596124816431, 2.1923339939083752, 2.1920729014336966, 2.1918128271757622, 2.1915537743974083, 2.1912957578113175, 2.1910387198783776, 2.190782635513421, 2.1905275456075226, 2.1902735661389818, 2.1900206126832149, 2.1897685915699938, 2.1895174673268576, 2.1892672384924428, 2.1890178845691421, 2.18876938428697, 2.1885217186540742, 2.1882748690724263, 2.1880288191317736, 2.1877835532869869, 2.1875389935918417, 2.1872954103764974, 2.1870530989438497, 2.1868117590485139, 2.1865712927901644, 2.1863316571530906, 2.1860928031320981, 2.1858547116175968, 2.1856174349977917, 2.185380944747751, 2.1851451804446884, 2.1849101213176478, 2.1846757503667233, 2.1844420528360167, 2.184209015189686, 2.1839766236964633, 2.1837448640340287, 2.1835137250072325, 2.1832832119095058, 2.1830558283517973, 2.1828301158963055, 2.1826048743477302, 2.1823801049976645, 2.1821558623455082, 2.1819321145665231, 2.181708852211738, 2.1814860690581397, 2.1812637601150691, 2.1810396617190242, 2.1808159441854107, 2.1805926571759051, 2.1803697980531189, 2.1801473635570603, 2.1799253501507727, 2.1797037531672929, 2.1794825683011942, 2.1792617903058202, 2.1790414137722482, 2.1788214440317164, 2.1786018780153849, 2.1783827079728102, 2.1781639272463131, 2.1779455298389099, 2.1777275102889138, 2.1775098638502102, 2.1772925854205338, 2.1770756703497538, 2.1768591143722946, 2.1766429288672602, 2.1764271985898396, 2.1762119045962001, 2.1759969892789424, 2.1757824388698097, 2.1755682439665671, 2.1753549130020797, 2.1751484287724407, 2.1749424654217719, 2.1747369150994986, 2.1745318377134981, 2.1743272264195683, 2.1741230665799294, 2.1739193439266176, 2.1737160230446917, 2.1735131314498841, 2.173310657385092, 2.1731085961857408, 2.1729069438946236, 2.172706896594391, 2.1725075495204198, 2.172308592742842, 2.1721100253602619, 2.1719118449688271, 2.1717140492552605, 2.1715166358710043, 2.1713196050595243, 2.1711229519923316, 2.1709267063332627, 2.170730910290751, 2.1705355393551131, 2.1703405788416941, 2.1701460053811732, 2.1699518932978594, 2.1697581583032295, 2.1695647981444179, 2.1693718112596034, 2.1691792580184859, 2.1689870997465324, 2.1687953317729884, 2.1686039513222353, 2.1684129562117449, 2.1682223444826478, 2.1680321144130588, 2.1678422645284696, 2.1676527974286963, 2.1674637207147955, 2.1672750234200255, 2.1670867042650221, 2.1668980862108498, 2.1667095012300712, 2.1665212876997058, 2.1663334455800656, 2.1661459684057123, 2.1659588610797251, 2.1657721245472157, 2.1655857502717049, 2.1653997798486944, 2.1652141802603437, 2.1650289475067117, 2.1648440802484603, 2.1646595780798839, 2.164475441131362, 2.1642916698300727, 2.1641082647427536, 2.1639252265081854, 2.1637425552921825, 2.1635602490200436, 2.1633783081636642, 2.1631967331013993, 2.1630155241586952, 2.1628346816136466, 2.1626542057050169, 2.162474096640624, 2.162294353652471, 2.1621149753769759, 2.1619359645727529, 2.161757321350116, 2.1615790458377551, 2.1614011381807812, 2.1612235985404937, 2.1610464265759015, 2.1608708111169137, 2.1606974993981312, 2.1605245479902102, 2.1603519502375459, 2.160179733387102, 2.1600079090639941, 2.1598364209943983, 2.1596652938957135, 2.1594945290496117, 2.1593241268047221, 2.159154087467591, 2.1589844113295813, 2.1588150986212926, 2.1586461494831073, 2.1584775639538853, 2.1583093419716555, 2.1581414833824342, 2.1579739879528219, 2.1578068553844214, 2.1576400857753542, 2.1574736791367637, 2.1573076348085802, 2.1571419521753978, 2.1569766306615716, 2.1568116697286741, 2.1566470688744537, 2.1564828276326433, 2.1563189455727816, 2.156154760618461, 2.1559908414756843, 2.1558272681414343, 2.1556640430774467, 2.1555009990432232, 2.1553381424217868, 2.1551759251864451, 2.15501460572324, 2.1548537175303064, 2.1546931864901264, 2.1545330138032468, 2.1543731996574658, 2.154213744782131, 2.1540546502666227, 2.153895917417862, 2.1537375476357274, 2.1535795422739401, 2.1534219026413428, 2.1532633991292065, 2.153104715968214, 2.1529463834061877, 2.152788405206457, 2.1526308876087934, 2.1524739277924319, 2.1523173928944894, 2.152164150746025, 2.1520121465988638, 2.1518606519067789, 2.1517096144812653, 2.1515590004671141, 2.151408792137302, 2.1512589796479085, 2.1511095577223056, 2.1509605234823743, 2.1508118755833689, 2.1506636126834104, 2.1505157332959661, 2.1503682367214059, 2.1502211220599463, 2.1500743884728513, 2.1499280354002042, 2.1497820629287623, 2.1496364697345078, 2.1494912542025144, 2.1493464147508092, 2.1492019951163703, 2.1490580776057366, 2.1489146065475175, 2.1487715160537424, 2.1486279055145894, 2.1484843719237121, 2.1483412121880567, 2.1481984175290281, 2.1480572102204851, 2.1479191270288638, 2.147781604092649, 2.1476445610452077, 2.1475078507754866, 2.1473716233249873, 2.1472358091949153, 2.1471003746926445, 2.1469652503514007, 2.1468304499731263, 2.1466959742958078, 2.1465618230267367, 2.146427997705004, 2.1462945008135654, 2.1461613352281432, 2.1460285033730311, 2.1458960082563832, 2.1457638547994424, 2.1456320439288312, 2.1455005761189341, 2.1453694482743955, 2.1452386612578858, 2.1451082151445013, 2.1449781102517544, 2.1448483470401261, 2.1447189255139851, 2.1445898451715539, 2.1444611054393543, 2.1443327056811143, 2.1442046452068855, 2.144076924115756, 2.1439495431440019, 2.1438225011183456, 2.143695796888168, 2.1435694293067553, 2.1434433972310343, 2.143317699521845, 2.1431923350444624, 2.1430673055075857, 2.1429426109768728, 2.1428182439539669, 2.1426942038307129, 2.1425704899925004, 2.1424471010973334, 2.1423240357287905, 2.1422012924962925, 2.1420788701080462, 2.1419567663164174, 2.1418349792967417, 2.14171350749948, 2.1415923497158924, 2.1414715027616058, 2.1413509603526295, 2.1412307207839851, 2.1411107823724991, 2.1409911434853677, 2.1408718025320375, 2.1407527579586731, 2.1406340081782669, 2.1405155515714522, 2.140397388934888, 2.1402795195162061, 2.140161933694992, 2.1400446286605708, 2.1399276034015626, 2.139810858315589, 2.1396943901872945, 2.1395781977986248, 2.139462280180247, 2.1393466364501839, 2.139231265443057, 2.1391161660056297, 2.1390013369925751, 2.1388867772673494, 2.1387724857031523, 2.1386584611838688, 2.138544702052152, 2.1384312071970504, 2.1383179754888908, 2.1382050654897822, 2.1380924930707579, 2.1379801823308631, 2.1378678975820313, 2.1377558187680337, 2.1376439983177944, 2.1375324338606858, 2.1374211241693875, 2.1373101936893582, 2.1371994867764572, 2.1370890496761143, 2.1369788855396363, 2.1368689929331879, 2.1367593702037664, 2.1366500159946158, 2.1365409287397261, 2.136433740251507, 2.1363273495678521, 2.1362212175458017, 2.1361153412417671, 2.1360097184132871, 2.1359043472559276, 2.1357992261515037, 2.135694353444753, 2.1355897278018348, 2.1354853479912874, 2.135381212833122, 2.1352773211716198, 2.1351736718578898, 2.1350702760308877, 2.1349671916967061, 2.1348643682480213, 2.134761800057305, 2.1346594824559073, 2.134557411559534, 2.1344555841220418, 2.13435399676445, 2.1342526464975449, 2.1341515306527215, 2.1340506467916973, 2.1339499986306416, 2.1338496343351023, 2.1337494950515778, 2.1336495788722041, 2.1335498847683305, 2.1334504117582149, 2.1333511589779257, 2.1332521251853693, 2.1331533092573371, 2.1330547409695235, 2.1329564188863848, 2.132858331453702, 2.1327604739296215, 2.1326628426035765, 2.1325654344149427, 2.1324682468262823, 2.1323712776339527, 2.1322745248746737, 2.1321779867564348, 2.1320816616112479, 2.1319855478628686, 2.1318896748405796, 2.1317940376688127, 2.1316986240722033, 2.1316034299718858, 2.1315084518103253, 2.131413686420244, 2.131319130963389, 2.1312247828798303, 2.1311306398455487, 2.1310366997369456, 2.1309429606009056, 2.1308494206296493, 2.1307560781450752, 2.1306629315656638, 2.130569979115267, 2.130477219127433, 2.1303846499394932, 2.1302922748653175, 2.1302000929608798, 2.1301080901325369, 2.1300162651927677, 2.129924616922557, 2.1298331441180154, 2.1297418455927484, 2.1296507201780921, 2.1295597665526551, 2.1294689834437324, 2.1293783696325179, 2.1292879239613662, 2.1291976453503403, 2.1291075327321138, 2.1290175850534867, 2.1289278012745552, 2.1288381803682621, 2.128748721331704, 2.1286594230509062, 2.1285702842992986, 2.1284813038835853, 2.1283924806401679, 2.1283038682071487, 2.1282158506772744, 2.1281279746708117, 2.1280402416651545, 2.1279526501080341, 2.1278651993131819, 2.1277778890508605, 2.1276907190213943, 2.1276036888734429, 2.1275167982047263, 2.1274300465635538, 2.1273434334516459, 2.1272569583279304, 2.1271706206126111, 2.1270844196906498, 2.1269983549161675, 2.1269124256156449, 2.126826631091546, 2.1267409706253337, 2.126655443507369, 2.1265700489701844, 2.126484786205614, 2.126399654394767, 2.1263146527129586, 2.1262297803306729, 2.1261450361457039, 2.1260603727276131, 2.1259758491608789, 2.1258914938952933, 2.1258072936415955, 2.1257232407665971, 2.1256393297883642, 2.1255555567431879, 2.1254719374651949, 2.1253884508070495, 2.1253050945253897, 2.1252218666047931, 2.1251387652357701, 2.1250557887570349, 2.1249729356173144, 2.1248902043501552, 2.1248075935574482, 2.1247251018982287, 2.1246427286336997, 2.1245604724363396, 2.1244783318915443, 2.1243963110877626, 2.1243144055932017, 2.1242325926592343, 2.1241508902068338, 2.124069297460264, 2.1239878135790633, 2.1239064376876433, 2.1238251688880392, 2.1237440062683173, 2.1236629489097432, 2.123581995890957, 2.1235011462916824, 2.1234203991949556, 2.1233397536888527, 2.1232592087887157, 2.1231787628293142, 2.1230984145145486, 2.1230181625257272, 2.1229380056623053, 2.1228579429636731, 2.1227779733177305, 2.1226980956528663, 2.1226183089317536, 2.1225386121474323, 2.1224590043202531, 2.1223794844952, 2.1223000517392134, 2.1222207051391266, 2.1221414437998005, 2.1220622668426485, 2.1219831734038257, 2.1219041626333817, 2.1218252336938619, 2.1217463857593497, 2.1216676180147322, 2.1215889296549637, 2.1215103198841581, 2.1214317879152893, 2.1213533329694543, 2.1212749542753984, 2.1211966510694231, 2.1211184225945945, 2.1210402681006051, 2.120962186843613, 2.1208841780857246, 2.1208062410949355, 2.1207283751449171, 2.1206505795147126, 2.1205728534886759, 2.1204951959599958, 2.1204176061591991, 2.1203400837008686, 2.1202626276943111, 2.1201852500324558, 2.1201079404463901, 2.1200306951509749, 2.1199535133660294, 2.1198763943316075, 2.1197992661095144, 2.1197221368151955, 2.1196450763997405, 2.119568065848461, 2.1194910954385127, 2.1194141596296041, 2.1193372556167929, 2.1192603823548839, 2.1191835398886361, 2.1191067288948289, 2.1190299503737813, 2.1189532054467297, 2.1188764952266022, 2.118799820739778, 2.1187231828834232, 2.1186465824058227, 2.1185700199023327, 2.1184934958206738, 2.118417010472295, 2.1183405641060937, 2.1182641568440159, 2.1181877886825524, 2.1181114595399508, 2.1180351692685213, 2.1179589176662561, 2.1178827044861599, 2.1178065294449748, 2.1177304111501227, 2.1176543439060183, 2.1175783133698567, 2.1175023192398248, 2.1174263612837438, 2.1173504392818043, 2.1172745526537069, 2.117198700844606, 2.1171228833202287, 2.1170470995644304, 2.1169713489882263, 2.11689560887323, 2.1168199032956618, 2.1167442306778868, 2.1166685902908453, 2.1165929814607964, 2.1165174035586056, 2.116441855990967, 2.1163663381940925, 2.116290849627104, 2.1162153897655478, 2.1161399581020226, 2.1160645541450518, 2.1159891775800532, 2.1159138279809873, 2.115838504882245, 2.1157632079548523, 2.1156879366404642, 2.1156126904047765, 2.1155374687276067, 2.1154622701285346, 2.1153870941564761, 2.1153119403765386, 2.1152368083668764, 2.1151616977172902, 2.1150866080272595, 2.1150115389050517, 2.1149364899661744, 2.114861460832679, 2.1147864511321948, 2.1147114604972179, 2.1146364885644608, 2.1145615349743827, 2.1144865993708506, 2.1144116809725579, 2.1143367787297627, 2.1142618937535356, 2.1141870256701081, 2.1141121741137154, 2.1140373387235623, 2.1139625191431537, 2.1138877150190156], 'Rp': [0.60321885372517614, 0.81156645067810351, 0.85145805750180925, 0.86311721985246015, 0.8681552121057402, 0.87100047454625562, 0.87292188883982225, 0.87436072295592393, 0.87550817128793035, 0.87645399826719061, 0.87725508153258747, 0.87794532892952126, 0.87854788266540662, 0.87907975711779307, 0.87955269947191994, 0.87997731351668596, 0.88036086597513241, 0.8807091775646908, 0.88102720304461091, 0.88131917505702051, 0.88158863222533046, 0.8818382526428733, 0.88207056766170999, 0.88228723323216041, 0.88248697056180914, 0.88267550017573315, 0.88285361469674417, 0.88302359471110015, 0.88318667015334285, 0.88334420094926769, 0.88349694510704069, 0.88364553028131976, 0.88379038681676114, 0.88393202181594177, 0.88407076165442955, 0.8842069524128211, 0.88434087719343268, 0.88447250859559789, 0.8846011533580187, 0.88472776042584456, 0.88485224938869034, 0.88497454774192408, 0.88509488224792476, 0.8852131202049589, 0.8853291994519451, 0.88544385339318588, 0.88555674411246155, 0.88566785615142785, 0.88577749949849782, 0.8858857137513918, 0.88599265886772471, 0.88609845087662464, 0.88620313854251231, 0.88630669692574171, 0.88640905246125756, 0.88651021875150571, 0.88661012615116586, 0.88670889621820725, 0.88680650225630131, 0.886902767165338, 0.88699772203540506, 0.88709143038925342, 0.88718403772119347, 0.8872753928524838, 0.8873657336683527, 0.88745483042504103, 0.88754283810600387, 0.88762987444787311, 0.88771597189195328, 0.8878011440116399, 0.88788539759228735, 0.88796879395136885, 0.88805120886520672, 0.88813263814314036, 0.88821316472562117, 0.88829280828230028, 0.88837157464027217, 0.88844948541900215, 0.8885265906630051, 0.88860290072720416, 0.88867841280987148, 0.88875314677314154, 0.88882711297811134, 0.88890033025520465, 0.88897280937160894, 0.88904456207786109, 0.88911560060959804, 0.88918593671272428, 0.88925558348278766, 0.88932438754652254, 0.8893924184092773, 0.88945974385624949, 0.88952632766999695, 0.88959213782979418, 0.88965720796970438, 0.88972161929669125, 0.88978542183342102, 0.8898486184005463, 0.88991123326669741, 0.8899732819083721, 0.89003480574616667, 0.89009580532393295, 0.89015629609145597, 0.89021629401943791, 0.8902758265882238, 0.89033488966522756, 0.89039349322710093, 0.89045157692675214, 0.89050919021282582, 0.89056637973043806, 0.89062317145808723, 0.8906795842248475, 0.89073564996863908, 0.89079136682502824, 0.89084674644229889, 0.89090180326534663, 0.89095655052968459, 0.89101100198690864, 0.89106517094823723, 0.89111907015232006, 0.89117271275406285, 0.8912260928956045, 0.8912792145770787, 0.89133214320668408, 0.89138486012482243, 0.89143737821475788, 0.8914897076980669, 0.89154186309326966, 0.89159385551671355, 0.89164569612648381, 0.89169739067573517, 0.89174895238423302, 0.89180038687456464, 0.89185170120578716, 0.89190291312638503, 0.89195402872909557, 0.89200505833607124, 0.89205587303575884, 0.89210664576585585, 0.89215740130573129, 0.8922081280559413, 0.89225881300546206, 0.8923094806672327, 0.89236012804749942, 0.89241076241910555, 0.89246139446789163, 0.8925120255845076, 0.89256265044369565, 0.89261327486508957, 0.89266387026420546, 0.89271446656463005, 0.89276505420596064, 0.8928156106254499, 0.89286616323052281, 0.89291673341368416, 0.89296733144373375, 0.89301796352158636, 0.8930686337398025, 0.89311932094376367, 0.89317005693231055, 0.89322084267791912, 0.89327168332785145, 0.89332257304073515, 0.89337349151047529, 0.89342443922364512, 0.89347544680349333, 0.8935265091885608, 0.89357759387758673, 0.89362877518632988, 0.89368009011275662, 0.89373145395499365, 0.89378285879897956, 0.89383429353034327, 0.89388576434891831, 0.89393727669782008, 0.89398883194711709, 0.89404043040794101, 0.89409208894149939, 0.89414378843171904, 0.89419551988083612, 0.8942472546630863, 0.89429899193326989, 0.89435074918689761, 0.89440253030140759, 0.89445433574684041, 0.89450616460100629, 0.89455801796172574, 0.894609881327323, 0.89466174923658615, 0.89471359640259829, 0.89476534658233575, 0.89481705735317552, 0.89486874959692897, 0.89492042318643195, 0.89497209456448279, 0.89502376119189031, 0.89507539936576364, 0.89512700707792081, 0.89517858095517089, 0.89523010503256906, 0.89528158536260438, 0.89533301751711103, 0.89538440873743086, 0.89543575752991378, 0.89548704942330259, 0.89553826052722307, 0.89558933009995068, 0.89564027118880607, 0.89569111888809372, 0.89574184188390782, 0.8957924390976959, 0.89584289268512207, 0.89589320655000826, 0.89594339855759453, 0.89599346602277719, 0.89604340755484113, 0.89609322543235559, 0.89614291691417791, 0.89619249976134507, 0.89624183812283265, 0.89629101112402421, 0.89634002182686134, 0.89638890639707902, 0.89643763723044445, 0.89648623506120728, 0.89653467585715885, 0.89658294229873703, 0.8966309441520508, 0.89667874032266115, 0.89672631164822036, 0.8967736646781781, 0.89682079353907218, 0.89686769380980025, 0.89691437053825751, 0.89696075699754907, 0.89700693566417478, 0.8970528652239903, 0.89709855486685386, 0.89714401607511196, 0.89718925718977527, 0.89723426712868648, 0.89727905248100392, 0.89732360199609074, 0.89736791126505688, 0.89741195782776406, 0.89745574305635256, 0.8974992823825958, 0.89754255872473365, 0.89758554352355091, 0.89762825378460298, 0.8976707118958247, 0.89771291673848885, 0.8977548818334532, 0.8977966130131082, 0.89783808645305585, 0.89787930154067908, 0.89792025388053698, 0.89796094168545881, 0.89800136391838936, 0.89804151994972492, 0.89808139948211396, 0.89812099251149402, 0.89816028467193565, 0.89819928977366714, 0.8982380007836247, 0.89827643134867308, 0.89831460480480507, 0.89835249641070425, 0.89839009589023511, 0.89842740060621173, 0.89846443549097843, 0.8985011977768641, 0.89853767367967763, 0.89857387632823171, 0.89860980058540263, 0.89864532953321918, 0.89868052836557999, 0.89871545973349298, 0.89875011684102746, 0.89878452485432758, 0.89881865863217392, 0.89885251854900472, 0.8988860863315109, 0.89891936075697798, 0.89895234732119778, 0.89898505984691113, 0.89901750580414597, 0.89904968603449653, 0.89908160264562975, 0.89911325727331237, 0.89914465586088588, 0.89917576830059476, 0.8992066272249245, 0.89923723701671121, 0.89926760397282912, 0.89929772529700025, 0.89932759887575653, 0.89935722499799953, 0.8993866044595229, 0.89941571800161058, 0.89944456694052843, 0.89947297212196509, 0.89950113477243421, 0.89952906081171835, 0.89955675175063499, 0.89958420906055736, 0.89961143467969229, 0.89963844074313559, 0.89966521976287872, 0.89969175675448998, 0.89971805859640619, 0.89974413434935352, 0.89976998905023353, 0.89979551758549436, 0.89982070340757692, 0.89984560346114095, 0.89987018094358751, 0.89989446671142159, 0.89991847339389608, 0.89994219112933138, 0.89996563394672702, 0.89998882077246989, 0.90001175234306596, 0.9000344361242304, 0.90005687926228151, 0.90007909399219976, 0.90010108389409815, 0.90012284845675228, 0.90014439268982382, 0.90016572136198814, 0.90018684591565046, 0.90020776621464349, 0.90022848494863272, 0.90024900623405191, 0.90026933373797224, 0.90028947190585407, 0.90030942654171309, 0.90032919987309346, 0.90034879504333265, 0.90036821516315402, 0.90038746328717656, 0.900406542371745, 0.90042545530045259, 0.90044420484226739, 0.90046279337739288, 0.90048122340376491, 0.90049949925031259, 0.90051762572917315, 0.90053560619197126, 0.90055344373004276, 0.900571134859669, 0.9005886896528762, 0.90060611220980558, 0.90062339763835153, 0.90064054874772159, 0.90065756285710663, 0.90067445397459112, 0.90069121529102003, 0.90070785031364331, 0.90072436236319442, 0.90074078011361991, 0.90075709644907642, 0.90077329565189679, 0.900789378983754, 0.90080535051874677, 0.90082120824241363, 0.90083695272877951, 0.90085258787909606, 0.90086811782082377, 0.9008835439350128, 0.90089886846888689, 0.90091409377190268, 0.90092922880333637, 0.90094425801981015, 0.90095914504716257, 0.90097391863576048, 0.90098858801885284, 0.90100316040322359, 0.90101764030140985, 0.90103203093559758, 0.90104633479249796, 0.90106055368885318, 0.90107468960216497, 0.90108874109478465, 0.90110271061570368, 0.90111660148433725, 0.90113041379062397, 0.90114414221089667, 0.90115780796274814, 0.90117139995205531, 0.9011849193682423, 0.90119836778519546, 0.90121174746258292, 0.90122505987374957, 0.90123830640157943, 0.90125148850662384, 0.90126460751592175, 0.90127766462200654, 0.90129066097368249, 0.90130359768364321, 0.90131647582924712, 0.9013292964877414, 0.90134206073615808, 0.90135476963553318, 0.90136742424955096, 0.90138002556311025, 0.90139256716933469, 0.90140505192771303, 0.90141748627203344, 0.90142987116532602, 0.90144220754537618, 0.90145449537520472, 0.90146673502343955, 0.90147892797171436, 0.90149107541940077, 0.9015031753370949, 0.90151522234143444, 0.90152722093971294, 0.90153917534492245, 0.90155108702205489, 0.90156295599714331, 0.90157478321968265, 0.90158656968308248, 0.90159831628080622, 0.90161002390111611, 0.90162169333003239, 0.90163332530590645, 0.90164492248971584, 0.90165647048543496, 0.90166795733877136, 0.90167939819578946, 0.90169079791710216, 0.90170215880826388, 0.90171348290504294, 0.90172477050961997, 0.90173601917544444, 0.90174723106496302, 0.90175840884228842, 0.90176955332936393, 0.90178066522961309, 0.90179174517627814, 0.90180279376881878, 0.90181381165471419, 0.90182479946363525, 0.90183575757755619, 0.9018466853502225, 0.90185746398633848, 0.90186816336677644, 0.90187884099689331, 0.9018894967006279, 0.90190012728887758, 0.90191073429957036, 0.90192131816671428, 0.90193187917443429, 0.9019424175517573, 0.90195304070490812, 0.90196364558801889, 0.90197422994236509, 0.90198479387775332, 0.90199533753565342, 0.90200586107453373, 0.9020163647112116, 0.90202684865030192, 0.90203731314085311, 0.90204775811199056, 0.90205818358478962, 0.90206858986668315, 0.90207897729537612, 0.90208934616609682, 0.90209969674807833, 0.90211002929192963, 0.90212034401773655, 0.90213064116185604, 0.90214092094019771, 0.90215118355121027, 0.90216142796605447, 0.90217164918775838, 0.90218185019175312, 0.90219203354204214, 0.90220219973655713, 0.90221234911959947, 0.90222245767193698, 0.90223224335508057, 0.90224200326391024, 0.90225174307758804, 0.90226146007898655, 0.90227115466989083, 0.90228082758688211, 0.90229047956490371, 0.90230011241961106, 0.90230972468673343, 0.90231931696215684, 0.90232888948517564, 0.90233844245890027, 0.90234791947042603, 0.90235736307761572, 0.90236678801133863, 0.90237619433976879, 0.90238558217343656, 0.90239495162535144, 0.90240430281171391, 0.90241363577693801, 0.90242295070045175, 0.9024322457394337, 0.90244151938382244, 0.90245077311128086, 0.90246000748208954, 0.90246922348546166, 0.9024784175274142, 0.90248759361507636, 0.90249675183557132, 0.90250589225232103, 0.90251501214816854, 0.90252411320102899, 0.9025331956331677, 0.90254225957943923, 0.90255130514126647, 0.9025603324118664, 0.90256934147421619, 0.90257833240127838, 0.90258730507911633, 0.90259625917470743, 0.90260519518717708, 0.90261411317901263, 0.90262304523054793, 0.90263197559738118, 0.90264088827301803, 0.90264978327344869, 0.90265866115445659, 0.90266752147670892, 0.90267636409930407, 0.90268518809447806, 0.90269399331410205, 0.90270278119651914, 0.90271155181047047, 0.90272030514581614, 0.90272904117670905, 0.90273775986908755, 0.90274646118538626, 0.90275514508787202, 0.90276381154045382, 0.90277246053238613, 0.90278109215694169, 0.90278970638957157, 0.90279830321125276, 0.9028068826059753, 0.90281544456013907, 0.90282398906227768, 0.90283251610259896, 0.90284102572224756, 0.90284951799318469, 0.90285799277090328, 0.90286645005108368, 0.90287488982844832, 0.9028833120968891, 0.90289171684950886, 0.90290010410653088, 0.9029084179730662, 0.90291662326204858, 0.90292481130956703, 0.90293298246464493, 0.90294113466053072, 0.90294926835732614, 0.90295738656321367, 0.90296548754401473, 0.90297357124145861, 0.90298163764263273, 0.90298968673687396, 0.90299771851427435, 0.9030057329676987, 0.90301373009417474, 0.90302170989543662, 0.90302967237781362, 0.90303761755178247, 0.90304554543142401, 0.90305345603372666, 0.90306134935722682, 0.90306922540501189, 0.90307708421139099, 0.90308492580807476, 0.90309275022449342, 0.90310055748797291, 0.90310834762394854, 0.90311612065591762, 0.90312387660557469, 0.90313164687725511, 0.90313940446243646, 0.90314714570660959, 0.90315487045537579, 0.90316258660269577, 0.90317029382738157, 0.90317797037879077, 0.9031856035917939, 0.90319321655444407, 0.90320081279536057, 0.90320839219198068, 0.90321595467259508, 0.90322350016464836, 0.90323102859303184, 0.90323853988083957, 0.90324603395211356, 0.90325351073606974, 0.90326097016575702, 0.903268470446148, 0.90327597914687774, 0.90328347121676655, 0.90329094649990327, 0.90329840218927204, 0.90330583208886739, 0.90331324303528349, 0.90332049775879197, 0.9033276926086552, 0.90333486277729258, 0.90334201093095046, 0.90334913877330159, 0.90335624719114804, 0.90336333667882407, 0.9033704075046507, 0.90337745981959994, 0.90338449369823137, 0.90339150921832623, 0.90339850646483533, 0.90340548547725841, 0.90341244630466511, 0.90341938899475849, 0.90342631359960957, 0.90343322012773419, 0.90344010862314217, 0.9034469791669576, 0.90345383183751349, 0.90346066517326717, 0.90346747561006258, 0.90347426411355758, 0.90348103413361547, 0.90348782854959675, 0.9034946192354929, 0.90350139206927294, 0.90350814749908159, 0.90351482437813779, 0.903521346966072, 0.90352784469714875, 0.90353432228917063, 0.90354078705052843, 0.90354722995161441, 0.90355366069228471, 0.90356007374723257, 0.90356646712777344, 0.9035728454649371, 0.9035792086464175, 0.90358555659857831, 0.90359188918214761, 0.9035982062298451, 0.90360450756977562, 0.9036107930601488, 0.90361706253848784, 0.9036233157572181, 0.90362955266843936, 0.90363577325559541, 0.90364197777434319, 0.90364816605234488, 0.90365433808889828, 0.90366049387075753, 0.90366663337988085, 0.90367275661973445, 0.90367886361692107, 0.90368495440150665, 0.90369102900668241, 0.90369708746823851, 0.90370312978666179, 0.90370915593497769, 0.90371516597295287, 0.90372115995672297, 0.90372713794224369, 0.90373309998536377, 0.90373904614161216, 0.90374497646632734, 0.90375089084749605, 0.90375678928138348, 0.90376267217254724, 0.90376853955837233, 0.90377439147293459, 0.90378022797730351, 0.90378604913046778, 0.90379185500666792, 0.90379764566588039, 0.90380342120023416, 0.90380918170033886, 0.90381492724482682, 0.90382065790835797, 0.90382637387737386, 0.90383207540750887, 0.90383776257679893, 0.9038434354629985, 0.90384909414188708, 0.90385473868752464, 0.90386036917242674, 0.90386598567112364, 0.90387158825988945, 0.90387717659265798, 0.90388275093612402, 0.90388831193363384, 0.90389385968718328, 0.90389939421983356, 0.90390491549586716, 0.90391042365999763, 0.90391591876107791, 0.90392140083897166, 0.90392686993439819, 0.90393232609861174, 0.90393776938340287, 0.90394319984093263, 0.90394861752355105, 0.9039540224835596, 0.9039594147730492, 0.90396479447147282, 0.90397016163710731, 0.90397551632108253, 0.9039808558026754, 0.90398617934046632, 0.9039914904640034, 0.90399680050897258, 0.90400210074311904, 0.90400738867134656, 0.90401266442326744, 0.90401792875702447, 0.90402318293265471, 0.90402841949191737, 0.90403364342084425, 0.90403885448971644, 0.90404405272808641, 0.90404923818974359, 0.90405441092389227, 0.90405957099478929, 0.9040646416732383, 0.90406967461670573, 0.90407469520994099, 0.90407970361384482, 0.90408469993533769, 0.90408968426235348, 0.90409465667810118, 0.90409961727138277, 0.90410456610587853, 0.90410950324141537, 0.90411442873587411, 0.90411934264622584, 0.90412424502906397, 0.9041291353839862, 0.90413401106121161, 0.90413887431983064, 0.90414372543435073, 0.90414856463060411, 0.90415339209696266, 0.90415820799260516, 0.90416301247892028, 0.9041678056988276, 0.90417258777983611, 0.90417735883933414, 0.90418211869830789, 0.90418686503865164, 0.90419160072296723, 0.90419632583338527, 0.90420104041357974, 0.90420574450740654, 0.90421043815657864, 0.904215121417281, 0.90421979433593536, 0.90422445443440613, 0.90422910302636783, 0.90423374068708329, 0.90423836759220433, 0.90424298388165836, 0.9042475896739699, 0.90425218506934846, 0.90425677015707173, 0.90426134501865307, 0.90426590972999366, 0.90427046436313552, 0.90427500898717728, 0.90427954220438911, 0.90428406424946606, 0.90428857570307686, 0.90429307675400405, 0.90429756756726309, 0.90430204829028038, 0.90430651905564574, 0.90431097998325161, 0.90431543118220736, 0.90431987275248982, 0.90432430478609904, 0.90432872736843861, 0.90433314057917946, 0.90433754449993597, 0.9043419392136518, 0.90434632479831745, 0.90435070133015338, 0.90435506865145698, 0.90435942681465076, 0.90436377649020983, 0.90436811773152093, 0.90437245059457161, 0.90437677513504922, 0.90438109140804301, 0.90438539946810015, 0.90438969937767277, 0.90439399120264075, 0.9043982749965519, 0.90440255081189613, 0.90440681869966055, 0.90441107871026938, 0.90441533089347714, 0.90441957529843364, 0.90442381197377864, 0.904428040969531, 0.90443226234286145, 0.90443647615086142, 0.9044406824491521, 0.90444488129215184, 0.90444907017535137, 0.90445323114005816, 0.90445738519307506, 0.90446153246630856, 0.90446567301848713, 0.90446980687273748, 0.90447393403650711, 0.90447805452347541, 0.90448216835118489, 0.90448627554037619, 0.9044903761144818, 0.90449447009918793, 0.90449855752222175, 0.90450263841291356, 0.90450671280221062, 0.90451078072219893, 0.90451484220620793, 0.90451889728850332, 0.90452294600417416, 0.90452698838648771, 0.90453102447239808, 0.90453505430129211, 0.904539077913038, 0.90454309534732558, 0.90454710664410765, 0.90455111186501114, 0.90455511328386495, 0.9045591077644709, 0.90456309400821133, 0.90456707285623283, 0.9045710447311075, 0.90457500992367146, 0.90457896863537191, 0.90458292013430708, 0.90458686542017031, 0.90459080459061836, 0.90459473773270882, 0.90459866492374785, 0.90460258623450196, 0.90460650173114554, 0.90461041147670573, 0.90461431553170801, 0.90461821395487041, 0.90462210678175936, 0.9046259940720216, 0.90462987588895916, 0.90463375203077856, 0.90463762270937831, 0.90464148903119779, 0.90464535012752345, 0.90464920603005605, 0.90465305677497421, 0.90465690240094165, 0.90466074294841181, 0.90466457845903137, 0.90466840897513245, 0.90467223453955148, 0.90467605519522942, 0.90467987098520342, 0.90468368195242432, 0.90468748814711486, 0.90469128965420131, 0.90469508653297226, 0.9046988788412712, 0.90470266663249788, 0.90470644995770633, 0.90471022886879737, 0.90471400341597519, 0.9047177736479789, 0.90472153961218948, 0.90472530135466223, 0.90472905892045552, 0.90473281235360115, 0.90473656169712002, 0.90474030699330099, 0.904744048283601, 0.90474778560884905, 0.90475151900916573, 0.90475524852413047, 0.90475897419278339, 0.90476269605362236, 0.90476641414468184, 0.90477012850360283, 0.90477383916757026, 0.9047775461734312, 0.90478124955761352, 0.90478494935626164, 0.90478864560511763, 0.90479233833970263, 0.90479602759516142, 0.90479971340641296, 0.90480339580804658, 0.9048070748344279, 0.9048107505196632, 0.90481442289758196, 0.90481809201175634, 0.90482175790793895, 0.90482542061770277, 0.90482908018120123, 0.90483273603448311, 0.90483638866444416, 0.90484003824862136, 0.90484368482245825, 0.90484732842071947, 0.90485097414275784, 0.90485462188156718, 0.90485826555151749, 0.90486190633963182, 0.90486554481789772, 0.90486918132717575, 0.90487281605788328, 0.90487644910283604, 0.90488008049355173, 0.90488371022457281, 0.90488733827021028, 0.90489096459531837, 0.90489458916237875, 0.90489821193574538, 0.90490183288417969, 0.90490545198206607, 0.90490906920974334, 0.90491268455357199, 0.90491629800549134, 0.90491990956059054, 0.90492351921881686, 0.9049271269846888, 0.90493073286604242, 0.90493433687329261, 0.90493793901899167, 0.90494153931760246, 0.90494513778481633, 0.90494873353195115, 0.90495232683328419, 0.90495591838232559, 0.90495950819690263, 0.90496309628851612, 0.90496668267059033, 0.90497026736935837, 0.90497385041034839, 0.9049774318183228, 0.90498101161742017, 0.90498458983546548, 0.90498816758982004, 0.90499174369872526, 0.90499531823563173, 0.90499889123455268, 0.90500246272719265, 0.90500603274325053, 0.90500960131086794, 0.90501316845677493, 0.90501673420665041, 0.90502029858566824, 0.90502386161821391, 0.90502742332753727, 0.90503098373049073, 0.90503454285116081, 0.90503810071071855, 0.90504165732646802, 0.90504521272380045, 0.90504876692711023, 0.90505231996025048, 0.90505587189469627, 0.90505942275094586, 0.905062972548768, 0.9050665213074145, 0.90507006904572374, 0.90507361578210477, 0.9050771615345895, 0.90508070632094184, 0.90508425015869509, 0.90508779306509335, 0.90509133505721739, 0.90509487615197914, 0.9050984163661373, 0.9051019557163138, 0.90510549423965392, 0.90510903198618764, 0.9051125689014724, 0.90511610500323614, 0.90511964030881353, 0.90512317483529314, 0.90512670859959354, 0.90513024161841682]}
@@ -49,5 +51,5 @@ icm_all_performances = {'R^2': [0.037804981423833595, 0.6439409885791966, 0.7211
 
 # Plot the MSE values
 plt.figure()
-plt.plot(NMTF.all_performances['MSE'])
+plt.plot(performances_sink.values['MSE'])
 plt.ylim(0,10)
\ No newline at end of file
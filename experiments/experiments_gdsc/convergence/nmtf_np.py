@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmtf_np import NMTF
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import numpy, matplotlib.pyplot as plt
@@ -32,10 +33,11 @@ expo_prior = 1/10.
 # Run the VB algorithm
 nmtf = NMTF(R,M,K,L) 
 nmtf.initialise(init_S,init_FG,expo_prior)
-nmtf.run(iterations)
+performances_sink = MemorySink()
+nmtf.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Extract the performances across all iterations
-print "np_all_performances = %s" % nmtf.all_performances
+print "np_all_performances = %s" % performances_sink.values
 
 '''
 np_all_performances = {'R^2': [-2.6946094024820337, -1.3161339963861205, -0.7598468647266379, -0.40799276043211363, -0.16395023488515026, 0.013513146663712505, 0.14684977207548555, 0.24957355600406417, 0.3303262517104919, 0.39487697105443875, 0.4472080944615284, 0.49014537932027624, 0.5257414824200333, 0.5555181879673705, 0.5806241085523853, 0.6019400554095495, 0.6201510678311246, 0.6357966656627694, 0.6493065608438036, 0.6610264650155085, 0.6712370287025551, 0.6801679378217922, 0.6880085433739034, 0.694915973978343, 0.7010213965898682, 0.7064348980457797, 0.7112493275882132, 0.7155433481442397, 0.7193838789460818, 0.7228280654974065, 0.7259248792419217, 0.728716424721265, 0.7312390138852294, 0.7335240537189178, 0.7355987832032143, 0.7374868879278966, 0.7392090147885046, 0.7407832046567491, 0.74222525738458, 0.7435490407379504, 0.7447667526768359, 0.7458891446678355, 0.7469257123337083, 0.7478848586336468, 0.7487740338710722, 0.7495998560970546, 0.750368214883169, 0.7510843609502511, 0.751752983738757, 0.7523782786749986, 0.7529640056131551, 0.753513539704349, 0.7540299157535411, 0.7545158669655915, 0.7549738588478003, 0.7554061189238432, 0.7558146628189725, 0.7562013171960889, 0.7565677399543783, 0.756915438044407, 0.7572457832045761, 0.7575600258819831, 0.7578593075649381, 0.7581446717240048, 0.7584170735321247, 0.7586773885119651, 0.7589264202393755, 0.7591649072150993, 0.7593935290026949, 0.7596129117180835, 0.759823632945545, 0.7600262261456463, 0.7602211846125372, 0.7604089650310659, 0.7605899906781105, 0.7607646543071354, 0.7609333207504145, 0.7610963292693602, 0.7612539956797834, 0.7614066142758575, 0.7615544595738103, 0.7616977878940714, 0.7618368387984376, 0.7619718363969012, 0.7621029905373978, 0.7622304978900196, 0.7623545429361879, 0.7624752988720638, 0.7625929284344368, 0.7627075846566659, 0.7628194115611228, 0.7629285447943395, 0.7630351122099719, 0.7631392344045587, 0.7632410252103209, 0.7633405921488776, 0.7634380368494161, 0.7635334554344676, 0.763626938876075, 0.7637185733250191, 0.7638084404153587, 0.7638966175464141, 0.7639831781440718, 0.7640681919032151, 0.7641517250127295, 0.7642338403646143, 0.7643145977483845, 0.764394054032116, 0.764472263330966, 0.764549277164329, 0.7646251446024819, 0.7646999124034588, 0.7647736251409596, 0.7648463253239841, 0.7649180535087647, 0.7649888484035875, 0.7650587469670199, 0.7651277845000535, 0.7651959947325325, 0.7652634099043824, 0.7653300608418381, 0.7653959770292297, 0.7654611866764297, 0.7655257167824256, 0.7655895931951333, 0.7656528406678599, 0.7657154829124757, 0.7657775426496329, 0.7658390416561697, 0.76590000080991, 0.7659604401319506, 0.7660203788267383, 0.7660798353198923, 0.7661388272940832, 0.7661973717229815, 0.7662554849034149, 0.7663131824858611, 0.7663704795033875, 0.7664273903990516, 0.7664839290519799, 0.7665401088020655, 0.7665959424735076, 0.7666514423970714, 0.7667066204313655, 0.7667614879830005, 0.7668160560258199, 0.7668703351191496, 0.7669243354252109, 0.7669780667257214, 0.7670315384376452, 0.7670847596282806, 0.7671377390295888, 0.7671904850518876, 0.7672430057968983, 0.7672953090702228, 0.7673474023932004, 0.7673992930142881, 0.7674509879199085, 0.7675024938447792, 0.7675538172818512, 0.7676049644917354, 0.7676559415117734, 0.7677067541646725, 0.7677574080667969, 0.7678079086360701, 0.767858261099574, 0.7679084705007819, 0.7679585417065113, 0.7680084794135884, 0.7680582881551862, 0.7681079723069844, 0.7681575360929487, 0.7682069835910086, 0.7682563187383846, 0.7683055453367446, 0.7683546670571901, 0.768403687444951, 0.7684526099239553, 0.7685014378011976, 0.7685501742709188, 0.7685988224186444, 0.7686473852250372, 0.7686958655695929, 0.7687442662342315, 0.7687925899067017, 0.7688408391838648, 0.7688890165748684, 0.7689371245041727, 0.7689851653144687, 0.7690331412694964, 0.7690810545567293, 0.7691289072899672, 0.7691767015118578, 0.7692244391962734, 0.7692721222506206, 0.7693197525180764, 0.7693673317797259, 0.7694148617566116, 0.7694623441117299, 0.7695097804519286, 0.769557172329751, 0.7696045212451998, 0.7696518286474567, 0.7696990959365102, 0.7697463244647479, 0.7697935155384761, 0.7698406704193913, 0.7698877903259982, 0.7699348764349757, 0.7699819298824929, 0.7700289517654819, 0.770075943142859, 0.770122905036706, 0.7701698384334044, 0.7702167442847463, 0.7702636235089904, 0.7703104769918809, 0.7703573055876394, 0.7704041101199123, 0.770450891382701, 0.7704976501412482, 0.770544387132877, 0.7705911030678518, 0.77063779863016, 0.7706844744782742, 0.7707311312459292, 0.7707777695428031, 0.7708243899552685, 0.7708709930470046, 0.770917579359697, 0.7709641494136305, 0.77101070370834, 0.7710572427231652, 0.7711037669178165, 0.7711502767329559, 0.7711967725906979, 0.771243254895144, 0.7712897240328846, 0.7713361803734514, 0.771382624269822, 0.7714290560588415, 0.7714754760616752, 0.7715218845842297, 0.7715682819175578, 0.7716146683382639, 0.7716610441088786, 0.7717074094782332, 0.7717537646818164, 0.7718001099421501, 0.7718464454690902, 0.7718927714601767, 0.7719390881009389, 0.7719853955652276, 0.7720316940154794, 0.7720779836030406, 0.7721242644684264, 0.7721705367415985, 0.7722168005422279, 0.7722630559799633, 0.7723093031546686, 0.7723555421566666, 0.772401773066967, 0.7724479959575153, 0.7724942108913904, 0.7725404179230407, 0.7725866170984633, 0.7726328084554416, 0.7726789920237227, 0.7727251678251964, 0.7727713358741171, 0.7728174961772597, 0.772863648734085, 0.772909793536943, 0.7729559305712116, 0.7730020598154699, 0.7730481812416566, 0.7730942948152277, 0.7731404004952749, 0.7731864982347225, 0.7732325879804258, 0.7732786696733249, 0.7733247432485799, 0.7733708086357022, 0.773416865758674, 0.7734629145360759, 0.7735089548812136, 0.7735549867022343, 0.7736010099022357, 0.7736470243793839, 0.7736930300270137, 0.7737390267337556, 0.7737850143836179, 0.773830992856102, 0.773876962026294, 0.773922921764973, 0.7739688719386976, 0.7740148124098887, 0.7740607430369555, 0.7741066636743351, 0.7741525741726345, 0.7741984743786561, 0.7742443641355327, 0.7742902432827754, 0.7743361116563824, 0.7743819690888745, 0.7744278154094166, 0.7744736504438703, 0.7745194740148691, 0.7745652859418896, 0.7746110860413251, 0.7746568741265619, 0.7747026500080274, 0.7747484134932758, 0.7747941643870544, 0.7748399024913474, 0.7748856276054661, 0.7749313395260843, 0.7749770380473178, 0.7750227229607872, 0.7750683940556614, 0.7751140511187351, 0.7751596939344461, 0.7752053222849935, 0.7752509359503381, 0.7752965347082981, 0.7753421183345584, 0.7753876866027649, 0.7754332392845681, 0.7754787761496515, 0.775524296965801, 0.7755698014989603, 0.7756152895132707, 0.7756607607711064, 0.7757062150331642, 0.7757516520584621, 0.7757970716044247, 0.7758424734268995, 0.775887857280233, 0.7759332229172827, 0.7759785700894983, 0.776023898546939, 0.776069208038325, 0.7761144983110817, 0.7761597691113825, 0.7762050201842055, 0.7762502512733319, 0.776295462121457, 0.776340652470153, 0.7763858220599754, 0.776430970630476, 0.7764760979202283, 0.7765212036669012, 0.7765662876072663, 0.776611349477266, 0.7766563890120199, 0.7767014059459033, 0.7767464000125418, 0.7767913709448853, 0.776836318475232, 0.7768812423352434, 0.7769261422560313, 0.7769710179681525, 0.7770158692016459, 0.7770606956861088, 0.777105497150681, 0.7771502733241156, 0.7771950239348006, 0.7772397487108055, 0.7772844473798978, 0.7773291196695857, 0.7773737653071682, 0.7774183840197318, 0.7774629755342403, 0.7775075395775127, 0.7775520758762805, 0.7775965841572379, 0.7776410641470378, 0.7776855155723679, 0.777729938159931, 0.7777743316365299, 0.7778186957290686, 0.7778630301645932, 0.7779073346703156, 0.7779516089736659, 0.7779958528022931, 0.7780400658841252, 0.7780842479473832, 0.7781283987206129, 0.7781725179327269, 0.7782166053130156, 0.7782606605912017, 0.7783046834974444, 0.7783486737623828, 0.7783926311171733, 0.7784365552935051, 0.7784804460236237, 0.7785243030403762, 0.7785681260772368, 0.778611914868325, 0.7786556691484448, 0.7786993886530987, 0.7787430731185291, 0.7787867222817462, 0.7788303358805373, 0.7788739136535198, 0.7789174553401375, 0.7789609606807201, 0.7790044294164802, 0.779047861289555, 0.7790912560430354, 0.7791346134209689, 0.7791779331684189, 0.7792212150314636, 0.779264458757222, 0.7793076640938981, 0.7793508307907764, 0.7793939585982785, 0.7794370472679522, 0.7794800965525137, 0.7795231062058892, 0.779566075983195, 0.7796090056407917, 0.779651894936298, 0.7796947436286116, 0.779737551477931, 0.7797803182457744, 0.7798230436950111, 0.7798657275898655, 0.7799083696959567, 0.7799509697803076, 0.7799935276113577, 0.7800360429590136, 0.7800785155946182, 0.7801209452910187, 0.7801633318225614, 0.7802056749651121, 0.7802479744960661, 0.7802902301944014, 0.7803324418406525, 0.78037460921694, 0.7804167321070108, 0.7804588102962393, 0.7805008435716249, 0.7805428317218346, 0.7805847745372103, 0.7806266718097967, 0.7806685233333103, 0.7807103289032178, 0.7807520883167061, 0.7807938013727126, 0.7808354678719391, 0.7808770876168587, 0.7809186604117371, 0.7809601860626385, 0.78100166437744, 0.7810430951658539, 0.7810844782394128, 0.7811258134115132, 0.781167100497407, 0.7812083393142191, 0.7812495296809541, 0.7812906714185083, 0.7813317643496833, 0.7813728082991869, 0.7814138030936576, 0.7814547485616486, 0.781495644533658, 0.7815364908421351, 0.7815772873214787, 0.7816180338080401, 0.78165873014016, 0.7816993761581342, 0.7817399717042478, 0.781780516622781, 0.7818210107599957, 0.7818614539641713, 0.7819018460855641, 0.7819421869764716, 0.7819824764911797, 0.7820227144860139, 0.7820629008192981, 0.7821030353514076, 0.7821431179447349, 0.782183148463707, 0.7822231267747739, 0.7822630527464448, 0.7823029262492533, 0.7823427471557749, 0.7823825153406448, 0.7824222306805056, 0.782461893054079, 0.782501502342121, 0.7825410584274199, 0.7825805611948351, 0.782620010531241, 0.782659406325575, 0.7826987484688133, 0.7827380368539673, 0.782777271376103, 0.7828164519323073, 0.7828555784217138, 0.782894650745485, 0.7829336688068136, 0.7829726325109285, 0.7830115417650703, 0.78305039647851, 0.7830891965625356, 0.7831279419304469, 0.7831666324975401, 0.7832052681811401, 0.7832438489005547, 0.7832823745770826, 0.783320845134028, 0.7833592604966672, 0.7833976205922487, 0.7834359253500073, 0.7834741747011302, 0.7835123685787793, 0.7835505069180494, 0.7835885896559821, 0.7836266167315831, 0.7836645880857509, 0.783702503661335, 0.7837403634030852, 0.7837781672576617, 0.7838159151736284, 0.783853607101426, 0.7838912429933902, 0.7839288228037272, 0.7839663464884985, 0.7840038140056238, 0.7840412253148674, 0.7840785803778334, 0.7841158791579442, 0.7841531216204385, 0.7841903077323638, 0.7842274374625553, 0.7842645107816446, 0.7843015276620202, 0.7843384880778472, 0.7843753920050366, 0.7844122394212419, 0.7844490303058436, 0.7844857646399431, 0.7845224424063436, 0.7845590635895472, 0.7845956281757405, 0.7846321361527789, 0.7846685875101735, 0.7847049822390871, 0.7847413203323155, 0.7847776017842701, 0.784813826590989, 0.7848499947500885, 0.7848861062607779, 0.7849221611238377, 0.7849581593416044, 0.7849941009179677, 0.7850299858583385, 0.7850658141696508, 0.7851015858603453, 0.7851373009403583, 0.7851729594211005, 0.7852085613154505, 0.7852441066377407, 0.785279595403739, 0.785315027630627, 0.7853504033370309, 0.7853857225429339, 0.7854209852697283, 0.7854561915401702, 0.785491341378362, 0.7855264348097577, 0.7855614718611357, 0.7855964525605931, 0.7856313769375083, 0.7856662450225658, 0.785701056847713, 0.7857358124461472, 0.7857705118523225, 0.7858051551019087, 0.7858397422317953, 0.7858742732800676, 0.7859087482860002, 0.7859431672900486, 0.7859775303337952, 0.7860118374600021, 0.7860460887125356, 0.7860802841363823, 0.7861144237776356, 0.7861485076834628, 0.7861825359021168, 0.7862165084828896, 0.7862504254761352, 0.7862842869332227, 0.786318092906545, 0.7863518434494864, 0.7863855386164279, 0.7864191784627153, 0.7864527630446662, 0.7864862924195154, 0.7865197666454562, 0.7865531857815841, 0.7865865498878999, 0.7866198590252945, 0.786653113255539, 0.7866863126412449, 0.7867194572458991, 0.7867525471338063, 0.7867855823700927, 0.7868185630206941, 0.7868514891523353, 0.7868843608325313, 0.7869171781295499, 0.7869499411124183, 0.7869826498509134, 0.7870153044155159, 0.7870479048774381, 0.7870804513085873, 0.7871129437815702, 0.7871453823696398, 0.7871777671467383, 0.7872100981874455, 0.7872423755669811, 0.7872745993611838, 0.7873067696465089, 0.7873388865000073, 0.7873709499993138, 0.7874029602226459, 0.7874349172487762, 0.7874668211570294, 0.7874986720272653, 0.7875304699398817, 0.7875622149757686, 0.7875939072163354, 0.7876255467434827, 0.787657133639582, 0.7876886679874748, 0.7877201498704585, 0.7877515793722784, 0.787782956577116, 0.7878142815695633, 0.7878455544346353, 0.787876775257754, 0.787907944124701, 0.787939061121675, 0.7879701263352228, 0.7880011398522531, 0.7880321017600118, 0.7880630121461079, 0.7880938710984484, 0.7881246787052789, 0.7881554350551373, 0.7881861402368705, 0.7882167943396021, 0.7882473974527375, 0.7882779496659575, 0.7883084510691847, 0.7883389017526072, 0.78836930180665, 0.7883996513219541, 0.7884299503894003, 0.7884601991000685, 0.7884903975452487, 0.7885205458164287, 0.7885506440052812, 0.7885806922036415, 0.7886106905035327, 0.7886406389971355, 0.7886705377767805, 0.7887003869349318, 0.7887301865642117, 0.7887599367573512, 0.7887896376072175, 0.7888192892067755, 0.7888488916491065, 0.7888784450273821, 0.788907949434877, 0.7889374049649328, 0.7889668117109734, 0.7889961697664942, 0.7890254792250496, 0.7890547401802489, 0.7890839527257489, 0.7891131169552534, 0.7891422329624894, 0.78917130084122, 0.7892003206852306, 0.7892292925883161, 0.7892582166442933, 0.7892870929469662, 0.7893159215901449, 0.7893447026676341, 0.7893734362732134, 0.7894021225006571, 0.7894307614436931, 0.7894593531960412, 0.7894878978513629, 0.7895163955032993, 0.789544846245429, 0.7895732501712798, 0.7896016073743329, 0.7896299179479895, 0.7896581819856019, 0.7896863995804366, 0.7897145708256939, 0.7897426958144863, 0.7897707746398439, 0.7897988073947078, 0.7898267941719215, 0.7898547350642322, 0.7898826301642835, 0.7899104795646125, 0.7899382833576445, 0.7899660416357054, 0.7899937544909692, 0.7900214220155256, 0.7900490443013124, 0.7900766214401562, 0.7901041535237403, 0.7901316406436069, 0.7901590828911782, 0.7901864803577231, 0.7902138331343528, 0.7902411413120553, 0.7902684049816484, 0.7902956242338051, 0.7903227991590354, 0.7903499298476933, 0.7903770163899677, 0.7904040588758806, 0.7904310573952943, 0.7904580120378957, 0.7904849228931998, 0.7905117900505437, 0.7905386135990922, 0.7905653936278283, 0.7905921302255532, 0.7906188234808886, 0.7906454734822683, 0.7906720803179383, 0.7906986440759574, 0.7907251648442, 0.7907516427103229, 0.7907780777618204, 0.7908044700859717, 0.7908308197698702, 0.790857126900397, 0.7908833915642448, 0.7909096138479021, 0.7909357938376532, 0.7909619316195752, 0.790988027279543, 0.7910140809032378, 0.7910400925761022, 0.7910660623834045, 0.7910919904101794, 0.7911178767412682, 0.7911437214612844, 0.7911695246546513, 0.791195286405558, 0.7912210067979936, 0.791246685915723, 0.7912723238423077, 0.7912979206610893, 0.7913234764551871, 0.7913489913075213, 0.7913744653007709, 0.7913998985174214, 0.7914252910397279, 0.7914506429497301, 0.7914759543292427, 0.7915012252598881, 0.7915264558230408, 0.7915516460998665, 0.7915767961713174, 0.7916019061181278, 0.7916269760208039, 0.7916520059596404, 0.791676996014713, 0.7917019462658768, 0.7917268567927697, 0.7917517276748075, 0.7917765589911947, 0.7918013508209237, 0.79182610324274, 0.7918508163352034, 0.7918754901766527, 0.7919001248451887, 0.7919247204187176, 0.7919492769749137, 0.7919737945912573, 0.791998273344986, 0.792022713313143, 0.7920471145725546, 0.7920714771998204, 0.7920958012713476, 0.7921200868633126, 0.7921443340516867, 0.7921685429122324, 0.7921927135204989, 0.7922168459518268, 0.7922409402813437, 0.7922649965839742, 0.7922890149344329, 0.7923129954072197, 0.7923369380766419, 0.7923608430167923, 0.7923847103015598, 0.7924085400046283, 0.7924323321994863, 0.7924560869594088, 0.7924798043574703, 0.7925034844665546, 0.7925271273593467, 0.7925507331083119, 0.7925743017857408, 0.7925978334637154, 0.79262132821412, 0.7926447861086554, 0.7926682072188154, 0.7926915916159037, 0.7927149393710422, 0.7927382505551436, 0.7927615252389502, 0.7927847634929938, 0.792807965387635, 0.7928311309930451, 0.792854260379203, 0.7928773536159004, 0.7929004107727529, 0.7929234319191909, 0.7929464171244638, 0.7929693664576345, 0.7929922799875914, 0.7930151577830474, 0.7930379999125198, 0.7930608064443809, 0.7930835774467944, 0.7931063129877742, 0.7931290131351469, 0.7931516779565783, 0.7931743075195461, 0.793196901891378, 0.7932194611392217, 0.7932419853300536, 0.7932644745306946, 0.7932869288077931, 0.7933093482278395, 0.7933317328571485, 0.7933540827618845, 0.793376398008044, 0.7933986786614744, 0.7934209247878461, 0.7934431364526877, 0.7934653137213672, 0.7934874566590935, 0.7935095653309251, 0.7935316398017686, 0.7935536801363605, 0.7935756863993269, 0.7935976586551018, 0.793619596967988, 0.7936415014021411, 0.7936633720215777, 0.7936852088901486, 0.7937070120715757, 0.793728781629433, 0.7937505176271547, 0.7937722201280306, 0.79379388919521, 0.7938155248917084, 0.7938371272803955, 0.7938586964240093, 0.7938802323851512, 0.7939017352262927, 0.7939232050097536, 0.793944641797739, 0.7939660456523207, 0.7939874166354259, 0.794008754808875, 0.794030060234329, 0.7940513329733502, 0.7940725730873563, 0.7940937806376561, 0.7941149556853968, 0.7941360982916523, 0.7941572085173392, 0.7941782864232563, 0.794199332070093, 0.7942203455184106, 0.7942413268286502, 0.7942622760611386, 0.7942831932760832, 0.7943040785335782, 0.7943249318935939, 0.7943457534159968, 0.7943665431605332, 0.794387301186831, 0.7944080275544235, 0.7944287223227191, 0.794449385551014, 0.7944700172985015, 0.7944906176242674, 0.7945111865872897, 0.7945317242464283, 0.7945522306604491, 0.7945727058880142, 0.7945931499876707, 0.7946135630178627, 0.7946339450369404, 0.7946542961031533, 0.7946746162746288, 0.7946949056094181, 0.794715164165458, 0.7947353920005871, 0.7947555891725591, 0.7947757557390076, 0.794795891757484, 0.7948159972854439, 0.7948360723802337, 0.7948561170991214, 0.7948761314992647, 0.7948961156377492, 0.7949160695715419, 0.7949359933575331, 0.7949558870525182, 0.7949757507132003, 0.7949955843961933, 0.7950153881580108, 0.7950351620550982, 0.7950549061437933, 0.7950746204803595, 0.7950943051209496, 0.795113960121657, 0.7951335855384769, 0.7951531814273112, 0.79517274784399, 0.7951922848442442, 0.7952117924837266, 0.7952312708180173, 0.795250719902592, 0.7952701397928607, 0.7952895305441353, 0.7953088922116622, 0.7953282248505967, 0.7953475285160151, 0.7953668032629112, 0.795386049146198, 0.7954052662207179, 0.7954244545412211, 0.7954436141623897, 0.7954627451388194, 0.7954818475250284, 0.795500921375464, 0.7955199667444921, 0.7955389836863993, 0.7955579722553942, 0.795576932505621, 0.7955958644911378, 0.7956147682659285, 0.7956336438839021, 0.7956524913988958, 0.7956713108646698, 0.7956901023349079, 0.7957088658632292, 0.7957276015031686, 0.7957463093081926, 0.7957649893316979, 0.7957836416269993, 0.7958022662473554, 0.7958208632459347, 0.7958394326758462, 0.7958579745901202, 0.7958764890417239, 0.795894976083547, 0.7959134357684113, 0.7959318681490659, 0.7959502732781951, 0.7959686512084063, 0.7959870019922402, 0.7960053256821676, 0.7960236223305996, 0.7960418919898571, 0.7960601347122137, 0.7960783505498619, 0.796096539554929, 0.796114701779477, 0.796132837275495, 0.7961509460949123, 0.7961690282895811, 0.7961870839112866, 0.7962051130117546, 0.7962231156426383, 0.7962410918555273, 0.7962590417019441, 0.7962769652333354, 0.7962948625010984, 0.7963127335565502, 0.7963305784509436], 'MSE': [43.211089690431194, 27.088837533315992, 20.582663125915293, 16.467478649742251, 13.613227412086429, 11.537666706880756, 9.9781998588245298, 8.7767720062086898, 7.8323116866495051, 7.0773450259575021, 6.4652952472648897, 5.9631131043167036, 5.5467913132661755, 5.1985315234147347, 4.904899892035484, 4.6555947040871715, 4.4426039368971173, 4.259617521415838, 4.1016096703061073, 3.9645370395737269, 3.8451172213449256, 3.7406638751510921, 3.6489624061102881, 3.5681750830502774, 3.4967678149673862, 3.4334530578530016, 3.3771448736572385, 3.3269232433938716, 3.2820054989563201, 3.2417232829580902, 3.2055038394686348, 3.1728547258703799, 3.1433512480350916, 3.1166260788918025, 3.0923606391489482, 3.0702779089560424, 3.0501364081570563, 3.0317251359016515, 3.0148593016625114, 2.9993767120348336, 2.9851347031846038, 2.9720075290485974, 2.9598841315521969, 2.9486662320998094, 2.9382666940839406, 2.9286081146813916, 2.9196216111557658, 2.9112457725852927, 2.9034257526222125, 2.8961124827662004, 2.8892619888434119, 2.8828347960563816, 2.8767954101985316, 2.8711118644913789, 2.86575532307016, 2.8606997334581887, 2.8559215214818292, 2.8513993230168042, 2.8471137477507358, 2.843047170822921, 2.8391835487752748, 2.8355082567379428, 2.8320079441917283, 2.8286704070048261, 2.8254844737490399, 2.8224399045628936, 2.8195273010542068, 2.8167380259305421, 2.8140641312118362, 2.8114982940262268, 2.8090337591139849, 2.8066642872736414, 2.8043841090786006, 2.8021878832741347, 2.8000706593355353, 2.7980278437311625, 2.7960551694876008, 2.7941486687008772, 2.7923046476800391, 2.7905196644450156, 2.7887905083329105, 2.7871141814936462, 2.7854878820812994, 2.7839089889698152, 2.7823750478380509, 2.7808837584891335, 2.7794329632813839, 2.7780206365622777, 2.7766448750090995, 2.7753038887876658, 2.7739959934537115, 2.772719602524385, 2.7714732206600732, 2.7702554373983204, 2.7690649213901879, 2.7679004150937216, 2.7667607298831554, 2.7656447415369927, 2.7645513860723652, 2.7634796558945016, 2.7624285962349142, 2.761397301853397, 2.7603849139818855, 2.7593906174890575, 2.7584136382487281, 2.757453240694153, 2.7565087255443474, 2.7555794276866399, 2.7546647142057075, 2.7537639825455167, 2.7528766587942139, 2.7520021960832715, 2.7511400730915061, 2.750289792645872, 2.7494508804123345, 2.7486228836699027, 2.747805370161795, 2.7469979270177598, 2.7462001597432346, 2.7454116912693158, 2.7446321610612205, 2.7438612242786964, 2.743098550987185, 2.7423438254142867, 2.7415967452502077, 2.7408570209873817, 2.7401243752985884, 2.7393985424496106, 2.7386792677448066, 2.7379663070031497, 2.7372594260636469, 2.7365584003166057, 2.7358630142612821, 2.735173061086241, 2.7344883422723107, 2.733808667216481, 2.7331338528752598, 2.7324637234262132, 2.7317981099474915, 2.7311368501128204, 2.7304797879026435, 2.7298267733288131, 2.7291776621742443, 2.7285323157440584, 2.7278906006298151, 2.7272523884845969, 2.7266175558095638, 2.7259859837502933, 2.7253575579026283, 2.7247321681284662, 2.724109708379288, 2.7234900765285879, 2.7228731742117049, 2.7222589066732361, 2.7216471826211048, 2.7210379140878893, 2.7204310162977174, 2.7198264075394003, 2.7192240090456159, 2.718623744876675, 2.7180255418102743, 2.717429329235399, 2.7168350390513387, 2.7162426055707121, 2.715651965427043, 2.7150630574858843, 2.7144758227602219, 2.7138902043291564, 2.71330614725996, 2.7127235985339415, 2.7121425069744118, 2.711562823179078, 2.7109844994536538, 2.7104074897495352, 2.7098317496035116, 2.7092572360794303, 2.7086839077133065, 2.7081117244598576, 2.7075406476414283, 2.7069706398990938, 2.7064016651454343, 2.7058336885194749, 2.7052666763434616, 2.7047005960808574, 2.7041354162965279, 2.7035711066183263, 2.7030076376999861, 2.7024449811857161, 2.7018831096760763, 2.7013219966950142, 2.7007616166584696, 2.700201944844046, 2.6996429573615228, 2.6990846311250576, 2.6985269438261712, 2.6979698739075952, 2.6974134005382684, 2.696857503589376, 2.6963021636109876, 2.6957473618098726, 2.695193080027932, 2.694639300721565, 2.6940860069415593, 2.6935331823140509, 2.6929808110219042, 2.6924288777869361, 2.6918773678527059, 2.6913262669679341, 2.6907755613705211, 2.6902252377721605, 2.6896752833434499, 2.6891256856996089, 2.6885764328866619, 2.6880275133681741, 2.6874789160122585, 2.6869306300792259, 2.6863826452096671, 2.6858349514128523, 2.685287539055647, 2.6847403988516416, 2.6841935218507764, 2.6836468994295339, 2.6831005232808618, 2.6825543854050453, 2.6820084781007765, 2.6814627939560736, 2.6809173258403165, 2.6803720668954627, 2.6798270105288799, 2.6792821504051698, 2.6787374804392301, 2.6781929947886445, 2.6776486878471957, 2.6771045542382406, 2.6765605888079231, 2.6760167866193152, 2.6754731429461605, 2.6749296532670077, 2.674386313259923, 2.6738431187965803, 2.6733000659373354, 2.6727571509259334, 2.6722143701845771, 2.6716717203091953, 2.6711291980647056, 2.6705868003806232, 2.6700445243466886, 2.669502367208695, 2.6689603263640915, 2.6684183993584609, 2.6678765838814344, 2.6673348777631118, 2.6667932789701858, 2.666251785602844, 2.6657103958909865, 2.6651691081911837, 2.6646279209834436, 2.6640868328681289, 2.6635458425628169, 2.6630049488995304, 2.6624641508218816, 2.6619234473823989, 2.6613828377396334, 2.6608423211558319, 2.6603018969941785, 2.6597615647167072, 2.6592213238815146, 2.6586811741406837, 2.6581411152382008, 2.6576011470073504, 2.6570612693688931, 2.6565214823291372, 2.6559817859775539, 2.6554421804851591, 2.6549026661024864, 2.6543632431577318, 2.6538239120549121, 2.6532846732724802, 2.6527455273610188, 2.6522064749420933, 2.6516675167064494, 2.6511286534124405, 2.650589885884477, 2.6500512150116418, 2.6495126417461941, 2.648974167102085, 2.6484357921535979, 2.647897518034076, 2.6473593459345368, 2.6468212771025073, 2.6462833128405343, 2.6457454545052204, 2.6452077035058843, 2.6446700613034846, 2.6441325294093487, 2.6435951093841714, 2.6430578028370357, 2.6425206114239495, 2.6419835368473734, 2.641446580854566, 2.6409097452372814, 2.6403730318301926, 2.6398364425103327, 2.6392999791958194, 2.6387636438454427, 2.6382274384572377, 2.6376913650678793, 2.6371554257517955, 2.6366196226203349, 2.6360839578209077, 2.6355484335360964, 2.6350130519830883, 2.6344778154126698, 2.633942726108466, 2.6334077863864076, 2.6328729985936952, 2.6323383651083727, 2.6318038883384021, 2.6312695707209293, 2.6307354147217752, 2.6302014228345256, 2.6296675975803367, 2.6291339415065429, 2.6286004571866597, 2.6280671472192627, 2.6275340142278769, 2.6270010608598739, 2.6264682897859641, 2.6259357036998616, 2.6254033053174792, 2.6248710973762708, 2.6243390826347697, 2.623807263872183, 2.6232756438873284, 2.6227442254986619, 2.6222130115432787, 2.6216820048767149, 2.6211512083720638, 2.6206206249198312, 2.6200902574269902, 2.6195601088167804, 2.6190301820280935, 2.6185004800149714, 2.6179710057460976, 2.6174417622041335, 2.6169127523857418, 2.6163839793002839, 2.6158554459702552, 2.6153271554300472, 2.6147991107257864, 2.6142713149150398, 2.6137437710659581, 2.6132164822571857, 2.6126894515770651, 2.6121626821235573, 2.6116361770033363, 2.6111099393318393, 2.610583972232408, 2.6100582788360036, 2.6095328622810401, 2.6090077257123521, 2.6084828722812725, 2.6079583051451878, 2.6074340274666508, 2.6069100424135647, 2.606386353158356, 2.6058629628777181, 2.6053398747520733, 2.6048170919653755, 2.6042946177046087, 2.6037724551592079, 2.6032506075210886, 2.6027290779836063, 2.6022078697418038, 2.6016869859917535, 2.6011664299299611, 2.6006462047534162, 2.6001263136586998, 2.5996067598422181, 2.5990875464992063, 2.5985686768237168, 2.5980501540081407, 2.5975319812429301, 2.5970141617159817, 2.596496698612635, 2.5959795951149687, 2.5954628544016289, 2.5949464796474673, 2.5944304740230431, 2.5939148406944992, 2.5933995828229217, 2.5928847035642884, 2.5923702060689697, 2.5918560934812818, 2.5913423689393107, 2.5908290355746377, 2.5903160965118022, 2.5898035548680172, 2.5892914137529441, 2.588779676268238, 2.5882683455073856, 2.5877574245552228, 2.5872469164875986, 2.5867368243712794, 2.5862271512633206, 2.5857179002111144, 2.585209074251686, 2.5847006764117424, 2.5841927097071689, 2.5836851771427058, 2.5831780817118948, 2.5826714263964048, 2.5821652141660301, 2.5816594479783963, 2.5811541307784327, 2.5806492654984399, 2.580144855057414, 2.5796409023611804, 2.5791374103018989, 2.5786343817575781, 2.5781318195923069, 2.5776297266556241, 2.5771281057823501, 2.576626959792347, 2.5761262914902647, 2.5756261036653201, 2.5751263990909226, 2.5746271805246379, 2.5741284507077165, 2.5736302123649919, 2.5731324682047307, 2.5726352209180345, 2.5721384731792183, 2.5716422276449884, 2.5711464869545311, 2.5706512537292534, 2.5701565305726763, 2.5696623200698094, 2.5691686247874572, 2.568675447273876, 2.568182790058299, 2.5676906556509267, 2.5671990465429531, 2.5667079652060645, 2.566217414092367, 2.5657273956340427, 2.5652379122437248, 2.5647489663135756, 2.5642605602156401, 2.5637726963014877, 2.5632853769020527, 2.5627986043275541, 2.5623123808672439, 2.5618267087893378, 2.5613415903408514, 2.5608570277473341, 2.5603730232130477, 2.5598895789204521, 2.5594066970303078, 2.5589243796814714, 2.5584426289908104, 2.5579614470530707, 2.5574808359407148, 2.5570007977039113, 2.5565213343702426, 2.5560424479449049, 2.5555641404103411, 2.5550864137261784, 2.5546092698292391, 2.5541327106335117, 2.5536567380297166, 2.5531813538857078, 2.5527065600460759, 2.5522323583320716, 2.5517587505417758, 2.5512857384496637, 2.5508133238070987, 2.5503415083415661, 2.5498702937572943, 2.5493996817346609, 2.5489296739306675, 2.5484602719783251, 2.5479914774870513, 2.5475232920424702, 2.547055717206542, 2.5465887545171459, 2.5461224054884837, 2.5456566716108782, 2.545191554350557, 2.5447270551502745, 2.5442631754284664, 2.5437999165797742, 2.5433372799750762, 2.5428752669610208, 2.5424138788606929, 2.5419531169730498, 2.5414929825732027, 2.5410334769124567, 2.5405746012180925, 2.5401163566937521, 2.5396587445191385, 2.5392017658502275, 2.5387454218192511, 2.5382897135346218, 2.5378346420812279, 2.5373802085202093, 2.5369264138891188, 2.5364732592019741, 2.5360207454494463, 2.5355688735984825, 2.5351176445928338, 2.5346670593529659, 2.534217118775894, 2.5337678237355648, 2.5333191750828554, 2.5328711736454195, 2.5324238202280691, 2.5319771156125275, 2.5315310605579002, 2.5310856558005366, 2.5306409020538059, 2.5301968000089432, 2.5297533503343645, 2.5293105536762588, 2.5288684106584731, 2.5284269218825917, 2.5279860879282436, 2.5275459093528982, 2.5271063866921444, 2.5266675204598763, 2.5262293111482537, 2.5257917592278596, 2.5253548651477615, 2.5249186293357631, 2.5244830521984212, 2.5240481341211374, 2.5236138754684054, 2.5231802765837141, 2.5227473377899949, 2.5223150593894093, 2.521883441663693, 2.5214524848742035, 2.5210221892621045, 2.5205925550484221, 2.5201635824342916, 2.5197352716009691, 2.519307622710012, 2.518880635903459, 2.5184543113039872, 2.5180286490149548, 2.517603649120618, 2.517179311686339, 2.5167556367584578, 2.5163326243648503, 2.5159102745147663, 2.5154885871990773, 2.5150675623904553, 2.5146472000434077, 2.514227500094651, 2.5138084624630861, 2.5133900870499946, 2.5129723737391627, 2.5125553223971333, 2.5121389328732846, 2.5117232049999876, 2.5113081385928253, 2.5108937334508483, 2.5104799893562069, 2.5100669060751852, 2.5096544833575871, 2.5092427209372583, 2.5088316185323087, 2.5084211758450343, 2.5080113925622425, 2.5076022683553179, 2.5071938028806589, 2.5067859957793881, 2.5063788466778592, 2.505972355187803, 2.5055665209062585, 2.5051613434160385, 2.5047568222856973, 2.5043529570697962, 2.5039497473089956, 2.5035471925301347, 2.5031452922468804, 2.5027440459590995, 2.502343453153745, 2.5019435133046626, 2.5015442258727614, 2.5011455903063853, 2.5007476060411808, 2.5003502725006443, 2.4999535890958482, 2.499557555225997, 2.4991621702783164, 2.498767433628438, 2.4983733446403398, 2.4979799026667129, 2.4975871070488802, 2.4971949571174421, 2.4968034521917857, 2.4964125915807487, 2.4960223745825778, 2.4956328004851085, 2.4952438685658871, 2.4948555780926256, 2.4944679283228002, 2.4940809185043222, 2.4936945478754922, 2.4933088156651464, 2.4929237210928892, 2.4925392633690842, 2.4921554416952931, 2.4917722552641899, 2.4913897032596894, 2.4910077848574628, 2.4906264992246365, 2.4902458455202034, 2.4898658228949753, 2.4894864304922035, 2.4891076674470862, 2.4887295328873549, 2.4883520259332648, 2.4879751456978263, 2.4875988912868414, 2.4872232617991448, 2.4868482563267418, 2.4864738739548233, 2.4861001137620868, 2.4857269748207753, 2.4853544561968688, 2.4849825569500594, 2.4846112761342827, 2.4842406127973948, 2.4838705659815101, 2.4835011347232356, 2.4831323180536824, 2.482764114998627, 2.4823965245786082, 2.4820295458090627, 2.4816631777006268, 2.4812974192589921, 2.4809322694850851, 2.4805677273756293, 2.4802037919224689, 2.4798404621133798, 2.4794777369318997, 2.4791156153576277, 2.4787540963659134, 2.47839317892862, 2.4780328620136558, 2.4776731445855065, 2.4773140256050414, 2.4769555040298981, 2.4765975788144172, 2.4762402489097179, 2.4758835132640917, 2.4755273708227215, 2.4751718205280273, 2.4748168613198938, 2.4744624921354075, 2.4741087119093237, 2.4737555195739387, 2.4734029140592408, 2.4730508942930514, 2.4726994592012903, 2.4723486077076817, 2.471998338734108, 2.4716486512006961, 2.4712995440260128, 2.4709510161267736, 2.4706030664184238, 2.4702556938148161, 2.4699088972286596, 2.4695626755713, 2.4692170277530319, 2.4688719526829392, 2.4685274492693265, 2.4681835164195358, 2.4678401530400671, 2.467497358036741, 2.467155130314727, 2.4668134687786423, 2.4664723723325523, 2.4661318398802576, 2.4657918703251291, 2.4654524625702785, 2.465113615518709, 2.4647753280731672, 2.4644375991365464, 2.4641004276116738, 2.4637638124014329, 2.4634277524090056, 2.463092246537637, 2.4627572936911095, 2.4624228927733052, 2.4620890426887838, 2.4617557423423491, 2.4614229906395302, 2.4610907864864551, 2.4607591287897903, 2.460428016457147, 2.4600974483967009, 2.4597674235176354, 2.4594379407299058, 2.459108998944493, 2.4587805970733481, 2.4584527340294553, 2.4581254087269442, 2.4577986200810691, 2.4574723670083012, 2.4571466484263502, 2.4568214632542356, 2.4564968104121423, 2.4561726888220283, 2.4558490974068397, 2.4555260350912982, 2.4552035008014257, 2.4548814934649217, 2.4545600120111342, 2.4542390553708149, 2.4539186224765106, 2.4535987122626097, 2.4532793236649435, 2.4529604556213318, 2.4526421070712905, 2.4523242769562401, 2.4520069642194264, 2.4516901678060248, 2.4513738866631654, 2.4510581197398453, 2.45074286598711, 2.450428124358019, 2.4501138938077105, 2.4498001732933403, 2.4494869617741872, 2.4491742582116589, 2.4488620615692609, 2.448550370812697, 2.4482391849098666, 2.4479285028308615, 2.4476183235479261, 2.4473086460358497, 2.4469994692713297, 2.4466907922335692, 2.4463826139039493, 2.4460749332663347, 2.4457677493067922, 2.4454610610137784, 2.4451548673781347, 2.4448491673931292, 2.4445439600543928, 2.4442392443598244, 2.443935019310111, 2.4436312839079788, 2.4433280371588877, 2.4430252780705572, 2.4427230056533715, 2.4424212189199408, 2.4421199168856127, 2.4418190985680783, 2.4415187629876423, 2.441218909166996, 2.4409195361314002, 2.4406206429087152, 2.4403222285291295, 2.440024292025655, 2.4397268324335633, 2.4394298487908226, 2.4391333401379218, 2.4388373055179771, 2.4385417439763568, 2.4382466545613304, 2.4379520363236051, 2.4376578883163882, 2.4373642095954344, 2.4370709992191655, 2.4367782562484788, 2.4364859797468315, 2.4361941687802604, 2.4359028224173462, 2.4356119397292617, 2.4353215197896549, 2.435031561674653, 2.4347420644632725, 2.4344530272367, 2.4341644490787067, 2.4338763290758481, 2.4335886663169561, 2.4333014598935758, 2.4330147088995173, 2.4327284124314335, 2.4324425695882486, 2.4321571794714236, 2.4318722411850739, 2.4315877538355601, 2.4313037165319473, 2.4310201283856947, 2.4307369885107093, 2.430454296023385, 2.4301720500425636, 2.4298902496895716, 2.4296088940881142, 2.4293279823643492, 2.4290475136469492, 2.4287674870668363, 2.4284879017574421, 2.428208756854584, 2.4279300514964746, 2.4276517848236172, 2.4273739559790037, 2.4270965641079796, 2.4268196083581146, 2.4265430878793075, 2.4262670018240242, 2.4259913493467735, 2.4257161296045071, 2.425441341756486, 2.4251669849641178, 2.4248930583912323, 2.4246195612038806, 2.4243464925702436, 2.4240738516609457, 2.4238016376486047, 2.4235298497083009, 2.4232584870171179, 2.4229875487543509, 2.4227170341015483, 2.4224469422424462, 2.4221772723628403, 2.4219080236506918, 2.4216391952960805, 2.4213707864912664, 2.4211027964305512, 2.4208352243102866, 2.4205680693291161, 2.420301330687376, 2.420035007587845, 2.4197690992350473, 2.419503604835707, 2.4192385235984246, 2.4189738547339967, 2.4187095974549808, 2.4184457509760353, 2.4181823145138246, 2.4179192872868294, 2.4176566685155505, 2.4173944574223345, 2.4171326532315822, 2.416871255169458, 2.4166102624640802, 2.4163496743453226, 2.4160894900451186, 2.4158297087970646, 2.4155703298366378, 2.4153113524011736, 2.4150527757297637, 2.4147945990632813, 2.4145368216445857, 2.4142794427178313, 2.4140224615294126, 2.4137658773272648, 2.4135096893610428, 2.4132538968820265, 2.4129984991434332, 2.4127434953999942, 2.4124888849081625, 2.4122346669260302, 2.4119808407133796, 2.411727405531634, 2.4114743606437825, 2.4112217053145177, 2.4109694388100764, 2.4107175603982895, 2.4104660693485056, 2.4102149649318556, 2.4099642464208024, 2.4097139130893752, 2.4094639642132871, 2.4092143990695085, 2.4089652169368674, 2.4087164170953499, 2.4084679988266315, 2.4082199614136637, 2.4079723041412855, 2.4077250262951937, 2.4074781271629258, 2.4072316060333963, 2.4069854621967997, 2.4067396949448274, 2.4064943035705788, 2.4062492873684889, 2.4060046456343884, 2.4057603776654353, 2.4055164827602313, 2.4052729602185945, 2.4050298093417521, 2.4047870294323119, 2.4045446197939908, 2.4043025797319642, 2.40406090855272, 2.40381960556395, 2.403578670074606, 2.4033381013948967, 2.4030978988364153, 2.4028580617118491, 2.4026185893351069, 2.4023794810214367, 2.4021407360872944, 2.4019023538502298, 2.4016643336289776, 2.401426674743695, 2.4011893765154286, 2.4009524382665717, 2.4007158593206572, 2.4004796390022136, 2.4002437766371769, 2.4000082715524429, 2.3997731230760255, 2.3995383305372204, 2.3993038932662345, 2.3990698105945691, 2.3988360818545678, 2.3986027063799598, 2.3983696835053743, 2.3981370125665475, 2.3979046929002963, 2.397672723844479, 2.3974411047381339, 2.3972098349210853, 2.3969789137344271, 2.3967483405201175, 2.3965181146214101, 2.396288235382249, 2.3960587021477369, 2.3958295142640553, 2.3956006710782356, 2.3953721719384609, 2.3951440161938349, 2.3949162031943105, 2.3946887322910557, 2.3944616028360142, 2.3942348141822709, 2.3940083656836837, 2.393782256695169, 2.3935564865725714, 2.3933310546726991, 2.3931059603533047, 2.3928812029729687, 2.3926567818913478, 2.3924326964688953, 2.3922089460670772, 2.3919855300482626, 2.3917624477756507, 2.3915396986133968, 2.391317281926578, 2.3910951970811878, 2.3908734434439687, 2.3906520203826735, 2.3904309272659239, 2.3902101634632138, 2.3899897283448794, 2.3897696212821571, 2.3895498416471765, 2.3893303888128243, 2.3891112621529706, 2.3888924610422881, 2.3886739848562626, 2.3884558329713403, 2.388238004764625, 2.3880204996142709, 2.3878033168991331, 2.3875864559989832, 2.3873699162943307, 2.3871536971665961, 2.3869377979979873, 2.3867222181715686, 2.3865069570711568, 2.3862920140814743, 2.3860773885880189, 2.385863079977105, 2.3856490876357492, 2.3854354109520237, 2.3852220493145473, 2.385009002112894, 2.384796268737396, 2.3845838485791524, 2.3843717410301135, 2.3841599454829296, 2.383948461331153, 2.383737287969117, 2.3835264247918517, 2.3833158711952378, 2.3831056265758956, 2.3828956903312348, 2.3826860618595491, 2.3824767405597109, 2.3822677258315315, 2.3820590170755711], 'Rp': [0.20917376096467255, 0.37455451000358747, 0.4533700379078095, 0.50888775007702025, 0.55416565302848997, 0.59288876476353725, 0.6264876418639711, 0.65575179860673938, 0.68125949476131831, 0.70349609129506863, 0.72288640812362859, 0.73980450696515376, 0.75457845501953047, 0.76749443732707323, 0.7788009813085276, 0.78871320948466439, 0.79741692826876631, 0.80507241635865689, 0.81181784446192629, 0.81777230752113794, 0.82303848069302665, 0.82770492643063986, 0.83184808715729919, 0.83553399982833443, 0.83881976750943477, 0.84175482042655803, 0.84438199563293437, 0.84673846099435945, 0.84885650588467809, 0.85076421794506596, 0.85248606254106629, 0.85404337916404183, 0.85545480694843534, 0.8567366496866039, 0.85790318919025221, 0.85896695453448602, 0.85993895360310457, 0.86082887240114481, 0.86164524679039245, 0.86239561061473091, 0.86308662359607435, 0.86372418188453404, 0.86431351372203147, 0.86485926231941057, 0.8653655577404169, 0.8658360793257206, 0.86627410996796861, 0.86668258336016313, 0.86706412517895948, 0.8674210890269427, 0.86775558784098439, 0.86806952137437166, 0.86836460027452589, 0.86864236720559684, 0.86890421540292662, 0.869151404992907, 0.86938507736616011, 0.86960626785268891, 0.86981591691434379, 0.87001488004063532, 0.87020393650978289, 0.8703837971543773, 0.87055511125467144, 0.87071847266408464, 0.87087442525997838, 0.87102346780012285, 0.87116605825468552, 0.87130261767521067, 0.87143353365463883, 0.87155916342504014, 0.87167983663422521, 0.87179585783780111, 0.87190750873844247, 0.87201505019999181, 0.87211872406173208, 0.8722187547739001, 0.87231535087438172, 0.87240870632301903, 0.87249900170884198, 0.87258640534360576, 0.87267107425314727, 0.87275315507751694, 0.87283278488876848, 0.87291009193501068, 0.87298519631798654, 0.87305821061072686, 0.87312924042137541, 0.87319838490807755, 0.8732657372500674, 0.87333138507865982, 0.87339541087258377, 0.87345789232017279, 0.87351890265232268, 0.87357851094826944, 0.87363678241700393, 0.87369377865649933, 0.87374955789247011, 0.87380417519890319, 0.87385768270153363, 0.87391012976605653, 0.87396156317213469, 0.87401202727473815, 0.87406156415345881, 0.87411021375118125, 0.87415801400277704, 0.87420500095479914, 0.87425120887653418, 0.87429667036378389, 0.87434141643511543, 0.87438547662191435, 0.87442887905230915, 0.87447165052948217, 0.87451381660487193, 0.8745554016467606, 0.87459642890425959, 0.87463692056738607, 0.87467689782329894, 0.87471638090908244, 0.87475538916122486, 0.87479394106216557, 0.87483205428394628, 0.87486974572934395, 0.87490703157049954, 0.87494392728538173, 0.87498044769202143, 0.87501660698086126, 0.87505241874520567, 0.87508789601013071, 0.87512305125944934, 0.87515789646154685, 0.87519244309357958, 0.87522670216435716, 0.87526068423620762, 0.8752943994453396, 0.87532785752144149, 0.87536106780606571, 0.87539403927014847, 0.87542678053052625, 0.87545929986574211, 0.87549160523089642, 0.87552370427190362, 0.87555560433894875, 0.87558731249921617, 0.87561883554916153, 0.87565018002605277, 0.87568135221889343, 0.87571235817907878, 0.8757432037302405, 0.87577389447779208, 0.8758044358180116, 0.87583483294661291, 0.87586509086710063, 0.875895214398419, 0.87592520818263397, 0.87595507669197847, 0.87598482423566815, 0.87601445496648211, 0.87604397288693636, 0.87607338185518602, 0.87610268559076332, 0.87613188768003247, 0.87616099158125449, 0.87619000062969699, 0.87621891804227758, 0.87624774692218566, 0.87627649026309717, 0.8763051509535531, 0.8763337317806793, 0.87636223543423386, 0.87639066451012448, 0.87641902151397699, 0.87644730886445177, 0.87647552889646774, 0.87650368386427635, 0.87653177594445575, 0.87655980723875049, 0.87658777977671432, 0.87661569551842011, 0.87664355635686175, 0.87667136412047464, 0.87669912057532751, 0.87672682742741537, 0.87675448632476516, 0.87678209885945968, 0.87680966656962245, 0.87683719094129087, 0.8768646734102894, 0.87689211536386047, 0.876919518142387, 0.87694688304103408, 0.87697421131128972, 0.8770015041624164, 0.87702876276292807, 0.87705598824192332, 0.87708318169037558, 0.87711034416257327, 0.87713747667716124, 0.87716458021840982, 0.87719165573733449, 0.87721870415283099, 0.87724572635266784, 0.87727272319450467, 0.87729969550692177, 0.87732664409035077, 0.87735356971791667, 0.87738047313639322, 0.87740735506700018, 0.87743421620627216, 0.87746105722672585, 0.87748787877774592, 0.87751468148624601, 0.87754146595734417, 0.87756823277513396, 0.87759498250323975, 0.87762171568550895, 0.87764843284657079, 0.87767513449249035, 0.87770182111127715, 0.87772849317345902, 0.87775515113254032, 0.87778179542569057, 0.87780842647402879, 0.87783504468320894, 0.87786165044385722, 0.87788824413203004, 0.87791482610960625, 0.87794139672474636, 0.87796795631225188, 0.87799450519396738, 0.87802104367915812, 0.87804757206486805, 0.87807409063629194, 0.87810059966703324, 0.87812709941953893, 0.87815359014533523, 0.87818007208535698, 0.87820654547025645, 0.87823301052067182, 0.87825946744751082, 0.87828591645223852, 0.87831235772708693, 0.87833879145531923, 0.87836521781152443, 0.87839163696178812, 0.87841804906395915, 0.87844445426784834, 0.87847085271544978, 0.87849724454116307, 0.87852362987196608, 0.87855000882760481, 0.87857638152082795, 0.87860274805752059, 0.87862910853688558, 0.87865546305167141, 0.87868181168825865, 0.87870815452686968, 0.87873449164169604, 0.87876082310112213, 0.87878714896773358, 0.87881346929863369, 0.87883978414539299, 0.87886609355437961, 0.87889239756671189, 0.87891869621854501, 0.87894498954107148, 0.87897127756060245, 0.87899756029894327, 0.87902383777319149, 0.87905010999604005, 0.87907637697579899, 0.87910263871654515, 0.87912889521820514, 0.87915514647666415, 0.87918139248381, 0.87920763322769113, 0.87923386869261944, 0.87926009885914191, 0.8792863237042583, 0.87931254320144447, 0.87933875732074751, 0.87936496602884451, 0.87939116928908656, 0.8794173670617107, 0.87944355930374873, 0.87946974596920047, 0.87949592700907153, 0.87952210237142459, 0.87954827200147112, 0.87957443584164219, 0.87960059383164624, 0.87962674590844592, 0.87965289200649521, 0.87967903205762155, 0.87970516599118254, 0.87973129373409276, 0.8797574152108979, 0.87978353034379464, 0.87980963905265952, 0.87983574125520758, 0.87986183686694597, 0.87988792580125363, 0.87991400796940467, 0.87994008328067452, 0.87996615164229486, 0.87999221295958141, 0.88001826713597564, 0.8800443140729971, 0.8800703536703911, 0.88009638582609784, 0.88012241043634065, 0.88014842739566468, 0.88017443659688921, 0.88020043793128444, 0.88022643128851974, 0.88025241655668529, 0.88027839362239335, 0.88030436237077225, 0.88033032268550004, 0.88035627444890574, 0.88038221754185242, 0.88040815184394516, 0.88043407723348655, 0.88045999358742078, 0.88048590078153077, 0.88051179869037055, 0.88053768718730641, 0.88056356614454889, 0.88058943543321744, 0.88061529492330337, 0.88064114448377617, 0.88066698398255161, 0.88069281328653226, 0.88071863226164149, 0.88074444077290837, 0.88077023868439142, 0.88079602585924732, 0.88082180215978712, 0.88084756744750525, 0.88087332158299325, 0.88089906442616739, 0.88092479583608041, 0.88095051567108384, 0.88097622378884632, 0.8810019200463024, 0.8810276042997055, 0.88105327640471676, 0.8810789362163487, 0.88110458358901855, 0.88113021837660133, 0.88115584043234818, 0.88118144960908085, 0.88120704575904985, 0.8812326287340676, 0.88125819838542596, 0.88128375456403518, 0.8813092971204054, 0.88133482590456902, 0.88136034076626946, 0.88138584155489064, 0.881411328119443, 0.88143680030865423, 0.88146225797095434, 0.88148770095454665, 0.88151312910732915, 0.88153854227700679, 0.88156394031110974, 0.88158932305690862, 0.88161469036155049, 0.8816400420720536, 0.88166537803527001, 0.88169069809798017, 0.88171600210685985, 0.88174128990851697, 0.88176656134952591, 0.88179181627643, 0.88181705453567916, 0.88184227597390952, 0.88186748043758267, 0.88189266777337183, 0.88191783782788791, 0.88194299044788471, 0.88196812548025016, 0.88199324277188929, 0.88201834216995301, 0.88204342352162346, 0.88206848667436533, 0.88209353147579062, 0.88211855777371295, 0.88214356541615546, 0.88216855425139284, 0.88219352412795937, 0.88221847489465965, 0.88224340640059395, 0.88226831849515963, 0.88229321102810787, 0.88231808384945554, 0.8823429368096406, 0.88236776975949793, 0.88239258255013719, 0.88241737503317708, 0.88244214706061019, 0.88246689848489135, 0.88249162915886659, 0.88251633893594161, 0.88254102766990605, 0.88256569521510442, 0.8825903414263504, 0.882614966159048, 0.88263956926905585, 0.88266415061285886, 0.88268871004744875, 0.88271324743047597, 0.8827377626201095, 0.88276225547514509, 0.8827867258550699, 0.88281117361991746, 0.88283559863042638, 0.88286000074799442, 0.88288437983463919, 0.88290873575317852, 0.8829330683670451, 0.88295737754040671, 0.88298166313815785, 0.88300592502596686, 0.88303016307019366, 0.88305437713805368, 0.88307856709743771, 0.88310273281704776, 0.88312687416645907, 0.88315099101597816, 0.88317508323676375, 0.88319915070080712, 0.883223193280955, 0.88324721085087432, 0.8832712032851332, 0.88329517045913497, 0.88331911224921145, 0.88334302853255908, 0.88336691918732202, 0.88339078409247462, 0.88341462312801999, 0.88343843617482554, 0.88346222311470446, 0.88348598383046861, 0.8835097182058318, 0.88353342612550911, 0.88355710747521121, 0.88358076214156478, 0.88360439001225943, 0.88362799097596123, 0.88365156492233321, 0.88367511174208202, 0.8836986313269185, 0.88372212356956159, 0.88374558836380801, 0.88376902560449033, 0.88379243518747819, 0.88381581700970224, 0.88383917096915632, 0.88386249696489538, 0.88388579489704056, 0.88390906466686359, 0.88393230617663332, 0.88395551932971583, 0.88397870403066847, 0.88400186018499749, 0.88402498769945037, 0.88404808648183897, 0.88407115644103551, 0.88409419748710261, 0.88411720953118711, 0.88414019248556508, 0.8841631462636399, 0.88418607077999645, 0.88420896595025422, 0.88423183169122521, 0.88425466792092977, 0.88427747455840122, 0.88430025152390845, 0.88432299873883891, 0.8843457161256999, 0.88436840360824509, 0.8843910611112733, 0.88441368856080471, 0.88443628588396439, 0.88445885300909532, 0.88448138986566649, 0.88450389638430504, 0.88452637249679034, 0.88454881813607555, 0.88457123323625497, 0.8845936177326249, 0.88461597156157967, 0.8846382946607283, 0.88466058696883976, 0.88468284842576395, 0.88470507897257278, 0.88472727855154421, 0.88474944710600389, 0.88477158458048188, 0.88479369092070848, 0.88481576607344714, 0.88483780998672901, 0.88485982260967122, 0.88488180389256832, 0.88490375378683361, 0.88492567224502128, 0.88494755922085078, 0.8849694146691357, 0.88499123854587125, 0.88501303080813776, 0.88503479141417485, 0.88505652032334614, 0.88507821749614346, 0.88509988289409836, 0.88512151647996984, 0.88514311821755653, 0.88516468807175941, 0.88518622600864449, 0.88520773199528979, 0.88522920599995725, 0.88525064799190667, 0.88527205794155506, 0.88529343582035425, 0.8853147816008835, 0.88533609525673229, 0.88535737676257675, 0.88537862609415785, 0.88539984322828968, 0.88542102814282786, 0.88544218081662174, 0.885463301229651, 0.88548438936285201, 0.88550544519823771, 0.88552646871880547, 0.88554745990855877, 0.88556841875258963, 0.88558934523694988, 0.88561023934863126, 0.88563110107570253, 0.88565193040718582, 0.88567272733303004, 0.88569349184428725, 0.88571422393282762, 0.88573492359157646, 0.88575559081439414, 0.88577622559604285, 0.88579682793227055, 0.88581739781973623, 0.88583793525603716, 0.88585844023967841, 0.88587891277007502, 0.88589935284753585, 0.88591976047331256, 0.88594013564947249, 0.88596047837901537, 0.88598078866578878, 0.88600106651457511, 0.88602131193089773, 0.8860415249211987, 0.88606170549279706, 0.88608185365379877, 0.88610196941312336, 0.88612205278055522, 0.88614210376669467, 0.88616212238287462, 0.88618210864132696, 0.88620206255501321, 0.88622198413766784, 0.88624187340381333, 0.88626173036878741, 0.88628155504858308, 0.88630134746004274, 0.88632110762069505, 0.88634083554878262, 0.88636053126335179, 0.88638019478412056, 0.88639982613149049, 0.88641942532659024, 0.88643899239125168, 0.88645852734799635, 0.88647803022001748, 0.88649750103112357, 0.88651693980586277, 0.88653634656941394, 0.88655572134754568, 0.8865750641667598, 0.88659437505409144, 0.88661365403724635, 0.88663290114454807, 0.88665211640491426, 0.88667129984783966, 0.88669045150341275, 0.88670957140234463, 0.88672865957586144, 0.88674771605579328, 0.88676674087447493, 0.88678573406486993, 0.88680469566038556, 0.8868236256950629, 0.88684252420336873, 0.88686139122035201, 0.8868802267815632, 0.88689903092299915, 0.88691780368121742, 0.88693654509321818, 0.88695525519651941, 0.88697393402904512, 0.88699258162924755, 0.88701119803594686, 0.88702978328854565, 0.88704833742674305, 0.8870668604907137, 0.88708535252109588, 0.88710381355893353, 0.88712224364564007, 0.88714064282305949, 0.88715901113339579, 0.88717734861929887, 0.88719565532373257, 0.88721393129006987, 0.88723217656204612, 0.88725039118375226, 0.88726857519958668, 0.88728672865435487, 0.88730485159317229, 0.88732294406148537, 0.88734100610501221, 0.88735903776987224, 0.88737703910244425, 0.88739501014940025, 0.887412950957706, 0.88743086157464912, 0.88744874204777691, 0.88746659242489212, 0.88748441275408918, 0.88750220308372119, 0.88751996346238349, 0.88753769393892612, 0.88755539456245103, 0.88757306538227476, 0.88759070644797033, 0.88760831780930904, 0.88762589951626902, 0.88764345161904579, 0.88766097416812462, 0.88767846721403276, 0.88769593080761289, 0.8877133649998401, 0.88773076984188604, 0.88774814538511859, 0.8877654916810177, 0.88778280878126614, 0.88780009673770699, 0.88781735560235864, 0.88783458542733462, 0.88785178626490469, 0.88786895816749001, 0.88788610118766043, 0.88790321537802819, 0.8879203007914479, 0.88793735748083125, 0.88795438549917072, 0.88797138489959571, 0.88798835573537083, 0.88800529805976525, 0.88802221192623454, 0.88803909738826303, 0.88805595449944552, 0.88807278331342909, 0.88808958388396531, 0.88810635626484824, 0.8881231005099518, 0.88813981667319553, 0.88815650480853869, 0.88817316497006338, 0.88818979721181324, 0.88820640158790376, 0.88822297815251194, 0.88823952695982755, 0.88825604806406411, 0.88827254151947799, 0.88828900738037797, 0.88830544570098002, 0.88832185653565698, 0.88833823993871941, 0.88835459596446742, 0.8883709246672632, 0.88838722610137666, 0.8884035003211932, 0.88841974738103513, 0.88843596733520847, 0.88845216023799611, 0.88846832614370741, 0.88848446510659096, 0.88850057718086639, 0.88851666242083616, 0.88853272088058211, 0.88854875261432109, 0.88856475767617948, 0.88858073612023192, 0.88859668800053238, 0.88861261337109421, 0.88862851228585404, 0.88864438479872543, 0.88866023096359248, 0.88867605083425694, 0.88869184446445315, 0.88870761190789083, 0.88872335321820806, 0.88873906844896478, 0.88875475765365974, 0.88877042088578828, 0.8887860581986613, 0.88880166964560081, 0.88881725527983813, 0.88883281515449963, 0.88884834932270151, 0.88886385783738109, 0.88887934075151531, 0.8888947981178823, 0.88891022998924085, 0.8889256364182635, 0.88894101745747245, 0.88895637315941778, 0.8889717035764253, 0.88898700876081993, 0.88900228876479115, 0.88901754364042151, 0.88903277343972453, 0.88904797821464143, 0.88906315801693536, 0.88907831289833217, 0.88909344291039893, 0.8891085481046519, 0.88912362853248095, 0.88913868424515297, 0.88915371529383191, 0.88916872172960804, 0.88918370360341337, 0.88919866096611744, 0.88921359386840959, 0.88922850236093176, 0.88924338649417345, 0.88925824631851691, 0.88927308188425935, 0.88928789324150603, 0.88930268044033656, 0.8893174435306489, 0.88933218256224966, 0.8893468975848049, 0.88936158864789594, 0.88937625580091684, 0.88939089909321956, 0.88940551857398098, 0.88942011429225687, 0.88943468629704103, 0.88944923463713288, 0.88946375936120026, 0.8894782605178565, 0.88949273815554175, 0.88950719232255648, 0.88952162306711979, 0.88953603043730822, 0.88955041448104977, 0.88956477524617683, 0.88957911278038704, 0.88959342713121747, 0.88960771834614361, 0.88962198647244295, 0.88963623155731208, 0.88965045364780115, 0.88966465279085971, 0.88967882903325823, 0.88969298242168293, 0.88970711300266636, 0.8897212208226617, 0.88973530592791128, 0.88974936836458596, 0.88976340817875299, 0.88977742541627536, 0.88979142012294998, 0.88980539234442801, 0.88981934212622393, 0.88983326951373742, 0.8898471745522355, 0.88986105728687315, 0.88987491776265781, 0.88988875602448003, 0.88990257211707624, 0.88991636608512203, 0.88993013797309073, 0.88994388782541278, 0.88995761568629139, 0.88997132159989889, 0.88998500561026406, 0.88999866776123526, 0.89001230809659337, 0.8900259266599797, 0.89003952349489979, 0.89005309864476545, 0.8900666521528392, 0.89008018406225609, 0.89009369441604658, 0.89010718325715765, 0.8901206506283087, 0.89013409657223486, 0.89014752113143436, 0.89016092434836991, 0.89017430626531591, 0.89018766692448048, 0.89020100636793431, 0.89021432463764005, 0.8902276217754268, 0.89024089782300442, 0.89025415282201303, 0.89026738681391837, 0.89028059984011998, 0.8902937919418491, 0.89030696316027791, 0.89032011353644791, 0.89033324311125073, 0.89034635192554157, 0.89035944001998812, 0.89037250743520147, 0.8903855542116621, 0.89039858038972719, 0.89041158600965076, 0.89042457111161888, 0.89043753573566209, 0.89045047992171056, 0.8904634037096234, 0.89047630713908399, 0.89048919024977691, 0.89050205308113284, 0.89051489567264797, 0.89052771806361042, 0.89054052029319519, 0.89055330240053943, 0.89056606442464159, 0.89057880640440212, 0.89059152837860611, 0.89060423038600689, 0.89061691246514318, 0.89062957465457837, 0.89064221699267976, 0.89065483951782443, 0.89066744226815275, 0.89068002528183887, 0.89069258859687184, 0.89070513225120518, 0.89071765628265509, 0.89073016072901123, 0.89074264562786554, 0.8907551110168197, 0.89076755693334619, 0.89077998341479614, 0.89079239049848491, 0.89080477822158066, 0.89081714662123479, 0.8908294957344447, 0.89084182559814318, 0.89085413624920184, 0.89086642772435298, 0.89087870006031078, 0.89089095329364354, 0.89090318746088137, 0.89091540259841129, 0.89092759874262351, 0.8909397759297436, 0.89095193419596741, 0.89096407357740348, 0.89097619411001294, 0.89098829582981309, 0.8910003787726023, 0.89101244297418492, 0.89102448847024651, 0.89103651529643857, 0.89104852348829733, 0.89106051308124967, 0.89107248411075846, 0.89108443661210035, 0.89109637062054425, 0.89110828617121851, 0.89112018329929643, 0.89113206203971673, 0.89114392242749629, 0.89115576449747902, 0.89116758828449405, 0.89117939382327915, 0.89119118114846207, 0.8912029502947143, 0.89121470129650937, 0.89122643418832692, 0.89123814900456977, 0.89124984577954325, 0.89126152454747998, 0.89127318534267008, 0.89128482819914689, 0.89129645315099593, 0.89130806023219333, 0.89131964947672149, 0.89133122091841011, 0.89134277459106859, 0.89135431052843705, 0.89136582876418402, 0.89137732933194758, 0.89138881226525946, 0.89140027759760798, 0.8914117253624475, 0.89142315559311514, 0.89143456832297996, 0.89144596358523343, 0.89145734141312605, 0.89146870183972915, 0.89148004489814336, 0.8914913706213965, 0.89150267904245495, 0.89151397019417444, 0.89152524410944334, 0.89153650082107194, 0.89154774036174811, 0.89155896276416435, 0.89157016806095613, 0.89158135628468527, 0.89159252746787332, 0.89160368164296488, 0.89161481884239846, 0.89162593909849419, 0.89163704244356778, 0.89164812890987166, 0.89165919852960063, 0.89167025133488842, 0.89168128735783825, 0.89169230663048926, 0.89170330918483276, 0.89171429505282029, 0.89172526426633847, 0.89173621685720894, 0.89174715285723138, 0.8917580722981473, 0.89176897521163856, 0.89177986162937006, 0.89179073158291922, 0.89180158510385432, 0.89181242222362, 0.89182324297373294, 0.89183404738556449, 0.89184483549046345, 0.89185560731976432, 0.89186636290468935, 0.8918771022764802, 0.89188782546631673, 0.89189853250528439, 0.8919092234245134, 0.89191989825499607, 0.89193055702773549, 0.89194119977363817, 0.89195182652363403, 0.89196243730858904, 0.89197303215931156, 0.89198361110648894, 0.8919941741809424, 0.8920047214132929, 0.89201525283418981, 0.89202576847419901, 0.89203626836388561, 0.89204675253373134, 0.89205722101420459, 0.89206767383576124, 0.89207811102870394, 0.89208853262339538, 0.89209893865015666, 0.89210932913919738, 0.89211970412071118, 0.892130063624889, 0.89214040768184888, 0.89215073632166431, 0.89216104957435771, 0.89217134746996352, 0.89218163003840067, 0.89219189730959914, 0.89220214931342556, 0.89221238607971498, 0.89222260763830064, 0.89223281401890109, 0.89224300525120492, 0.89225318136491427, 0.89226334238964999, 0.89227348835500642, 0.89228361929053812, 0.89229373522576405, 0.89230383619013576, 0.89231392221311312, 0.89232399332406576, 0.89233404955238926, 0.89234409092732281, 0.89235411747820814, 0.89236412923426878, 0.89237412622469114]}
@@ -43,5 +45,5 @@ np_all_performances = {'R^2': [-2.6946094024820337, -1.3161339963861205, -0.7598
 
 # Plot the MSE values
 plt.figure()
-plt.plot(nmtf.all_performances['MSE'])
+plt.plot(performances_sink.values['MSE'])
 plt.ylim(0,10)
\ No newline at end of file
@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.bnmtf_vb_optimised import bnmtf_vb_optimised
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import numpy, matplotlib.pyplot as plt
@@ -36,15 +37,16 @@ priors = { 'alpha':alpha, 'beta':beta, 'lambdaF':lambdaF, 'lambdaS':lambdaS, 'la
 # Run the VB algorithm
 BNMTF = bnmtf_vb_optimised(R,M,K,L,priors) 
 BNMTF.initialise(init_S,init_FG)
-BNMTF.run(iterations)
+performances_sink = MemorySink()
+BNMTF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Extract the performances across all iterations
-print "vb_all_performances = %s" % BNMTF.all_performances
+print "vb_all_performances = %s" % performances_sink.values
 
 '''
 vb_all_performances = {'R^2': [-1.5108706892697326, 0.7105009579804371, 0.7403589871409084, 0.7413312665615213, 0.7416939121170105, 0.7420446186316821, 0.7423972537965842, 0.7427550199657418, 0.7431212675031883, 0.7434996703192932, 0.7438944059396653, 0.7443104080312456, 0.7447537011428624, 0.7452318493157403, 0.7457546060213766, 0.7463348221769794, 0.7469891868105005, 0.7477381498954011, 0.7486051891709076, 0.749615131101133, 0.750789290171726, 0.7521363120227713, 0.7536418524393619, 0.7552569844450319, 0.7569000186854451, 0.7584779143501456, 0.7596749898354103, 0.7606770942011676, 0.7615966507369671, 0.7624450280939142, 0.763239602008639, 0.7639942904679538, 0.7647195928829935, 0.7654229568053628, 0.76610867639523, 0.7667801224570578, 0.7674417135984147, 0.7680975439271701, 0.7687509698536001, 0.7694049784534454, 0.7700624280366944, 0.7707262005295467, 0.7713992836379913, 0.7720846946848255, 0.7727852243592446, 0.7735031486655748, 0.774240458625985, 0.7749992903967324, 0.7757817386390135, 0.77658957066751, 0.777424103450908, 0.7782859594465076, 0.7791749225866644, 0.7800903865751027, 0.7810315853866105, 0.7819972432551611, 0.7829853435567093, 0.7839929749104813, 0.7850161586276081, 0.7860499977444623, 0.7870889403329759, 0.7881264711312916, 0.7891500477741185, 0.790138345420367, 0.7910887938604237, 0.7920053835619629, 0.7928861910099593, 0.793726517224474, 0.7945217783599549, 0.7952714229606612, 0.7959772597473223, 0.7966401396111149, 0.7972611506989109, 0.7978434222537216, 0.798389689277357, 0.7989021828003583, 0.799383093623752, 0.7998347242226841, 0.8002594261658698, 0.8006594745851373, 0.8010369954456005, 0.8013939256676261, 0.8017319817537382, 0.8020528524520606, 0.8023583521710382, 0.8026502131772978, 0.8029299417302409, 0.8031988402636954, 0.803458051792092, 0.8037085860759356, 0.8039513399352646, 0.8041867158627694, 0.8044092327142383, 0.8046180208158537, 0.8048199276290077, 0.8050177800878263, 0.8052126964389009, 0.8054053745313327, 0.8055960548048239, 0.8057847335748409, 0.8059714730790413, 0.8061564649741828, 0.8063400270294021, 0.8065225185372624, 0.8067042705929933, 0.8068855867594124, 0.8070667013641278, 0.807247800440914, 0.8074290350830851, 0.807610520268881, 0.8077923736413016, 0.8079751684181855, 0.8081605434606947, 0.8083489607593941, 0.808538997543236, 0.808729589551013, 0.8089202799950457, 0.8091107391944421, 0.8093005822819572, 0.8094894941540336, 0.8096773120506763, 0.8098638686374275, 0.8100485697140298, 0.8102299333331456, 0.8104067873050795, 0.8105794802989905, 0.8107487195343478, 0.8109147869839165, 0.8110776486175344, 0.8112371442191822, 0.8113930810289313, 0.8115452704061107, 0.8116935415106992, 0.811837747654369, 0.8119777710008562, 0.8121135258517842, 0.8122449587243263, 0.812372044044603, 0.8124947751247371, 0.8126131513969458, 0.8127271703910681, 0.8128368391821305, 0.8129421972738493, 0.8130433192824456, 0.8131402967269968, 0.8132332236799087, 0.8133221939656632, 0.8134073036011447, 0.8134886501928533, 0.8135663093358583, 0.8136402574387886, 0.8137103233873575, 0.8137763936002391, 0.8138386765834839, 0.8138975881927653, 0.8139535049183746, 0.814006692169031, 0.8140573362043886, 0.814105581420179, 0.8141515517860123, 0.8141953612076891, 0.8142371183777183, 0.8142769289800829, 0.8143148964354643, 0.8143511216928596, 0.8143857024121253, 0.8144187319037564, 0.8144502981977693, 0.8144804835144052, 0.8145093642236416, 0.8145370111951062, 0.8145634903401403, 0.8145888631540218, 0.8146131871319267, 0.8146365159887052, 0.8146588996173072, 0.8146803836696316, 0.8147010085740798, 0.8147208078009539, 0.8147398053950976, 0.8147580133805928, 0.8147754306138181, 0.8147920455418037, 0.814807844891997, 0.8148228272347562, 0.814837015542334, 0.8148504610953278, 0.8148632360832442, 0.8148754198360484, 0.814887086244691, 0.8148982966526592, 0.8149090981771723, 0.8149195253724378, 0.8149296031870921, 0.8149393499531379, 0.8149487798509769, 0.8149579047210517, 0.8149667352947997, 0.8149752819879942, 0.8149835553997337, 0.8149915666269815, 0.814999327460755, 0.8150068504942808, 0.8150141491744953, 0.815021238057124, 0.8150281349888844, 0.8150348718735867, 0.8150415244276529, 0.8150482423752728, 0.8150551996667665, 0.815062461863053, 0.8150699429286872, 0.8150774928151698, 0.8150849856132397, 0.815092349459104, 0.8150995590690056, 0.8151066178286609, 0.8151135408225892, 0.8151203386894935, 0.8151269997224525, 0.8151334783835713, 0.8151397127943304, 0.8151456703263036, 0.8151513721942661, 0.8151568731731604, 0.8151622307848698, 0.815167490654948, 0.8151726853092001, 0.8151778372192343, 0.815182961081786, 0.8151880627531183, 0.8151931322126007, 0.8151981294865742, 0.8152029718900167, 0.8152075458309326, 0.8152117576841095, 0.815215588832094, 0.8152191008235322, 0.8152223940088346, 0.8152255648573278, 0.8152286861750803, 0.8152318057510592, 0.8152349523340858, 0.8152381422636386, 0.8152413844977866, 0.815244683876922, 0.8152480430737972, 0.8152514637015917, 0.8152549469211902, 0.8152584937601999, 0.815262105265228, 0.8152657825508302, 0.8152695267747498, 0.8152733390499264, 0.8152772202978031, 0.8152811710543595, 0.8152851912636635, 0.8152892801306788, 0.8152934361384035, 0.8152976573254986, 0.815301941833754, 0.8153062885880095, 0.8153106978636787, 0.8153151715312246, 0.815319712929852, 0.8153243264872907, 0.8153290172624961, 0.8153337905460352, 0.8153386515760459, 0.8153436053689351, 0.8153486566378432, 0.8153538097681792, 0.8153590688258111, 0.8153644375814227, 0.8153699195411113, 0.8153755179777183, 0.8153812359601661, 0.8153870763796636, 0.8153930419725555, 0.8153991353399943, 0.8154053589648729, 0.8154117152264779, 0.8154182064132904, 0.8154248347342665, 0.8154316023289441, 0.8154385112764322, 0.815445563603364, 0.8154527612908872, 0.8154601062804561, 0.8154676004785149, 0.8154752457598047, 0.8154830439694081, 0.8154909969233524, 0.8154991064079862, 0.8155073741781422, 0.8155158019543022, 0.8155243914189416, 0.8155331442122942, 0.8155420619277123, 0.8155511461068585, 0.8155603982348241, 0.815569819735321, 0.8155794119660014, 0.8155891762138838, 0.8155991136907718, 0.8156092255285476, 0.8156195127738343, 0.8156299763811115, 0.8156406172019017, 0.8156514359642916, 0.815662433230202, 0.8156736093075814, 0.8156849640859766, 0.8156964967681741, 0.8157082054984538, 0.8157200869366876, 0.815732135925398, 0.815744345613982, 0.8157567085134094, 0.8157692183371306, 0.8157818715214034, 0.8157946674702986, 0.81580760768008, 0.8158206944731596, 0.8158339298443897, 0.8158473145967783, 0.8158608478200748, 0.8158745239252305, 0.8158882992585785, 0.8159019718202163, 0.8159151508058214, 0.8159277103329455, 0.8159400442691076, 0.8159525472886004, 0.8159653527295907, 0.8159784374888447, 0.8159917279386737, 0.8160051468311849, 0.8160186298916499, 0.8160321294927513, 0.8160456131910043, 0.8160590605761839, 0.8160724596820852, 0.8160858034069873, 0.8160990865053466, 0.8161123040452832, 0.8161254518288943, 0.816138527913979, 0.8161515337206917, 0.8161644743303709, 0.8161773585595014, 0.8161901989061093, 0.8162030109515495, 0.8162158121519061, 0.8162286204114029, 0.816241452853461, 0.8162543249844675, 0.8162672502396874, 0.8162802397841482, 0.816293302425956, 0.8163064446035935, 0.8163196705599371, 0.8163329828114184, 0.8163463827901647, 0.8163598713546989, 0.8163734489877887, 0.8163871157761764, 0.8164008713864463, 0.8164147151591609, 0.816428646307862, 0.8164426641484267, 0.816456768283456, 0.8164709586868114, 0.8164852356694656, 0.8164995997520494, 0.8165140514978921, 0.8165285913555936, 0.8165432195336246, 0.8165579359067995, 0.8165727399492497, 0.8165876306938848, 0.8166026067218278, 0.8166176661830071, 0.8166328068434475, 0.8166480261504753, 0.8166633213055976, 0.816678689336236, 0.816694127159846, 0.8167096316371336, 0.8167251996130205, 0.8167408279459637, 0.8167565135268244, 0.8167722532891879, 0.8167880442129656, 0.8168038833230544, 0.8168197676848559, 0.8168356943982465, 0.8168516605916512, 0.8168676634177617, 0.8168837000524843, 0.8168997676982859, 0.8169158635928018, 0.8169319850227688, 0.8169481293425056, 0.8169642939951532, 0.8169804765342792, 0.8169966746431041, 0.8170128861488479, 0.8170291090306063, 0.8170453414200909, 0.8170615815957675, 0.8170778279717593, 0.8170940790832185, 0.817110333570144, 0.817126590161179, 0.8171428476585894, 0.8171591049252217, 0.8171753608737699, 0.8171916144583395, 0.8172078646680999, 0.8172241105225692, 0.817240351067948, 0.8172565853738599, 0.8172728125298263, 0.8172890316410725, 0.8173052418236486, 0.8173214421993988, 0.8173376318921803, 0.8173538100273354, 0.8173699757372044, 0.8173861281754694, 0.8174022665420089, 0.8174183901170482, 0.8174344982987117, 0.8174505906341712, 0.8174666668337579, 0.8174827267610963, 0.8174987703989607, 0.8175147977950777, 0.8175308089902508, 0.8175468039167251, 0.8175627822232256, 0.8175787429315876, 0.8175946837749817, 0.8176106000759056, 0.8176264832413299, 0.8176423195407811, 0.8176580905993169, 0.8176737769543327, 0.817689363941593, 0.8177048464169608, 0.8177202290981986, 0.8177355229641361, 0.8177507407574359, 0.8177658939243081, 0.8177809913960081, 0.8177960395704673, 0.817811042791097, 0.817826003905453, 0.8178409247354463, 0.8178558064236714, 0.8178706496717847, 0.8178854548987813, 0.8179002223440719, 0.8179149521339942, 0.8179296443245704, 0.8179442989290754, 0.8179589159357692, 0.8179734953194402, 0.8179880370489138, 0.8180025410920316, 0.8180170074189601, 0.8180314360044405, 0.8180458268293409, 0.8180601798817253, 0.8180744951575558, 0.8180887726610728, 0.8181030124047803, 0.8181172144088453, 0.8181313786994385, 0.8181455053049687, 0.8181595942482697, 0.8181736455312272, 0.818187659106099, 0.8182016348254296, 0.8182155723605365, 0.8182294710800905, 0.8182433298885514, 0.8182571470446693, 0.8182709200148282, 0.8182846454565447, 0.8182983194463105, 0.8183119380176291, 0.818325497937398, 0.8183389974789839, 0.8183524368821942, 0.818365818314668, 0.8183791453908222, 0.8183924224836161, 0.8184056540788918, 0.818418844317059, 0.8184319967471019, 0.8184451142464402, 0.8184581990413811, 0.8184712527741073, 0.8184842765800527, 0.8184972711462166, 0.8185102366951342, 0.8185231727484805, 0.8185360773460522, 0.8185489452190311, 0.8185617646472484, 0.8185745141268593, 0.8185871625717045, 0.8185996773317248, 0.8186120379182732, 0.8186242448543353, 0.8186363164246232, 0.818648278260416, 0.8186601545550071, 0.8186719642406806, 0.8186837207423201, 0.8186954331500444, 0.8187071075527268, 0.8187187480902242, 0.8187303576735665, 0.8187419384450672, 0.8187534920621141, 0.8187650198695211, 0.8187765230037019, 0.8187880024557436, 0.8187994591086535, 0.8188108937521081, 0.8188223070529617, 0.8188336993911576, 0.8188450703223772, 0.8188564172512711, 0.8188677330475653, 0.818879003536259, 0.8188902080439977, 0.8189013262776375, 0.8189123484922165, 0.8189232794545244, 0.8189341326862535, 0.8189449222093718, 0.8189556584979509, 0.8189663485270462, 0.8189769971613136, 0.818987608271718, 0.8189981852975403, 0.8190087314468074, 0.8190192497362629, 0.8190297429810236, 0.8190402137784337, 0.8190506644991529, 0.8190610972869516, 0.8190715140654132, 0.8190819165493648, 0.8190923062591968, 0.8191026845367709, 0.8191130525617465, 0.8191234113675823, 0.8191337618565382, 0.819144104813163, 0.819154440915889, 0.8191647707463534, 0.8191750947963923, 0.8191854134725026, 0.819195727098083, 0.8192060359136097, 0.8192163400754013, 0.8192266396536023, 0.8192369346302414, 0.819247224898211, 0.8192575102619755, 0.8192677904404958, 0.8192780650727575, 0.8192883337256828, 0.8192985959041207, 0.8193088510621734, 0.8193190986150659, 0.8193293379507122, 0.8193395684403834, 0.8193497894479396, 0.8193600003379028, 0.8193702004839521, 0.8193803892847333, 0.8193905662090374, 0.8194007309288094, 0.8194108836610228, 0.81942102588674, 0.8194311614909228, 0.8194412978192235, 0.8194514452910415, 0.8194616142666162, 0.819471810109355, 0.8194820298202152, 0.8194922626328037, 0.8195024936212215, 0.8195127076918318, 0.8195228921848068, 0.8195330378353661, 0.8195431386519887, 0.8195531913249307, 0.8195631945474473, 0.8195731484176153, 0.8195830539667446, 0.8195929128081465, 0.8196027268844992, 0.8196124982908431, 0.8196222291536923, 0.8196319215509852, 0.8196415774612889, 0.8196511987336286, 0.8196607870716384, 0.8196703440274293, 0.8196798710019395, 0.8196893692494316, 0.8196988398845056, 0.8197082838905628, 0.8197177021289306, 0.8197270953482397, 0.8197364641937301, 0.819745809216285, 0.8197551308812452, 0.8197644295768957, 0.8197737056227064, 0.8197829592773419, 0.819792190746514, 0.8198014001907062, 0.8198105877327272, 0.8198197534651385, 0.8198288974574299, 0.8198380197629046, 0.8198471204250776, 0.8198561994834896, 0.8198652569787512, 0.8198742929566935, 0.8198833074714849, 0.819892300587681, 0.8199012723811667, 0.8199102229390778, 0.8199191523587468, 0.8199280607459354, 0.8199369482123906, 0.8199458148730563, 0.8199546608430384, 0.8199634862345244, 0.819972291153831, 0.8199810756987064, 0.8199898399559451, 0.8199985839994862, 0.8200073078889127, 0.8200160116685552, 0.8200246953670319, 0.8200333589973064, 0.820042002557188, 0.8200506260302144, 0.8200592293868285, 0.8200678125858024, 0.8200763755757897, 0.8200849182969849, 0.8200934406827263, 0.8201019426611333, 0.8201104241566242, 0.8201188850913097, 0.8201273253863044, 0.8201357449628918, 0.8201441437435868, 0.8201525216530645, 0.8201608786190047, 0.8201692145728343, 0.8201775294504146, 0.8201858231925689, 0.8201940957455889, 0.8202023470615927, 0.8202105770987912, 0.8202187858216248, 0.820226973200764, 0.8202351392129911, 0.8202432838409901, 0.8202514070730039, 0.8202595089024751, 0.820267589327612, 0.8202756483510348, 0.8202836859794066, 0.8202917022231586, 0.8202996970962748, 0.8203076706161778, 0.8203156228036406, 0.8203235536827587, 0.8203314632809255, 0.8203393516287882, 0.8203472187601881, 0.8203550647120524, 0.8203628895242161, 0.820370693239208, 0.8203784759020164, 0.8203862375597988, 0.8203939782615596, 0.8204016980578989, 0.8204093970007056, 0.8204170751429114, 0.8204247325382651, 0.8204323692411659, 0.8204399853065085, 0.8204475807895779, 0.8204551557460085, 0.8204627102317006, 0.8204702443027898, 0.8204777580156142, 0.8204852514266727, 0.8204927245925226, 0.8205001775696954, 0.8205076104145732, 0.8205150231832326, 0.820522415931338, 0.8205297887140031, 0.8205371415857774, 0.8205444746006936, 0.8205517878124423, 0.8205590812747372, 0.8205663550417672, 0.8205736091688665, 0.8205808437132854, 0.8205880587350258, 0.8205952542977698, 0.8206024304697447, 0.8206095873245403, 0.8206167249417664, 0.8206238434075839, 0.8206309428149814, 0.8206380232638312, 0.8206450848607466, 0.8206521277186515, 0.8206591519561881, 0.8206661576969152, 0.8206731450683924, 0.8206801142011529, 0.8206870652276402, 0.8206939982811711, 0.8207009134949436, 0.8207078110011793, 0.8207146909304429, 0.8207215534111567, 0.8207283985694052, 0.8207352265290071, 0.8207420374119264, 0.8207488313390092, 0.8207556084310265, 0.8207623688100754, 0.8207691126011827, 0.8207758399341731, 0.8207825509456144, 0.8207892457808369, 0.8207959245958671, 0.8208025875592097, 0.8208092348533803, 0.8208158666760982, 0.8208224832411214, 0.8208290847786558, 0.8208356715352949, 0.8208422437734765, 0.8208488017704374, 0.820855345816507, 0.8208618762127121, 0.8208683932675555, 0.8208748972928532, 0.8208813885986627, 0.820887867487315, 0.8208943342470117, 0.8209007891454004, 0.8209072324239779, 0.8209136642940598, 0.8209200849351083, 0.8209264944957584, 0.8209328930975206, 0.8209392808406755, 0.8209456578114487, 0.8209520240894669, 0.8209583797545807, 0.8209647248923115, 0.8209710595976706, 0.8209773839772915, 0.8209836981500936, 0.820990002246868, 0.8209962964091277, 0.8210025807876146, 0.8210088555406864, 0.8210151208327623, 0.8210213768329577, 0.8210276237138868, 0.8210338616506279, 0.8210400908198406, 0.821046311398898, 0.8210525235650743, 0.8210587274947011, 0.8210649233622493, 0.8210711113394227, 0.8210772915942464, 0.821083464290229, 0.8210896295856889, 0.8210957876332655, 0.8211019385797633, 0.821108082566231, 0.8211142197283892, 0.8211203501972846, 0.8211264741001282, 0.8211325915611789, 0.8211387027026557, 0.8211448076454695, 0.8211509065097473, 0.8211569994149505, 0.8211630864791063, 0.8211691678143687, 0.8211752435056734, 0.821181313518626, 0.8211873773617516, 0.821193433066198, 0.8211994747361758, 0.8212054881845536, 0.8212114462243458, 0.8212173089745938, 0.8212230350174452, 0.8212286000448814, 0.8212340084366259, 0.8212392881090032, 0.8212444755479305, 0.8212496034108303, 0.8212546954727642, 0.8212597668411268, 0.8212648261675966, 0.8212698779370202, 0.8212749241820527, 0.8212799655907468, 0.8212850021619316, 0.821290033570462, 0.8212950593615479, 0.8213000790502432, 0.8213050921706468, 0.8213100982992945, 0.8213150970658303, 0.8213200881573209, 0.821325071319412, 0.8213300463557826, 0.8213350131265457, 0.8213399715459802, 0.8213449215796897, 0.8213498632414129, 0.8213547965894991, 0.8213597217232603, 0.8213646387791969, 0.8213695479272014, 0.8213744493668753, 0.8213793433238867, 0.8213842300465501, 0.8213891098025704, 0.8213939828759791, 0.8213988495643139, 0.8214037101760382, 0.8214085650281672, 0.8214134144441252, 0.8214182587518248, 0.8214230982819585, 0.8214279333664889, 0.8214327643372907, 0.821437591525024, 0.8214424152581163, 0.821447235861909, 0.8214520536579477, 0.8214568689633773, 0.8214616820904592, 0.8214664933461908, 0.8214713030320081, 0.821476111443577, 0.8214809188706449, 0.8214857255969681, 0.8214905319002664, 0.8214953380522203, 0.8215001443184318, 0.821504950958296, 0.8215097582246722, 0.8215145663630872, 0.8215193756100938, 0.8215241861902552, 0.8215289983107709, 0.8215338121526773, 0.8215386278573018, 0.8215434455068314, 0.8215482650989784, 0.8215530865177477, 0.8215579095061669, 0.821562733650932, 0.821567558392155, 0.8215723830690964, 0.821577207003024, 0.8215820296025279, 0.8215868504629691, 0.8215916694300948, 0.8215964866113505, 0.8216013023388145, 0.8216061171030509, 0.8216109314808031, 0.8216157460731749, 0.8216205614617524, 0.8216253781826801, 0.8216301967150543, 0.8216350174789576, 0.8216398408391405, 0.8216446671114337, 0.8216494965700282, 0.8216543294545364, 0.8216591659763341, 0.8216640063239561, 0.8216688506675434, 0.8216736991624148, 0.8216785519519015, 0.8216834091695416, 0.8216882709407891, 0.8216931373842841, 0.8216980086128001, 0.8217028847339811, 0.8217077658507865, 0.8217126520618578, 0.8217175434616741, 0.8217224401406821, 0.8217273421852638, 0.8217322496776892, 0.821737162695992, 0.8217420813138319, 0.8217470056002818, 0.821751935619661, 0.8217568714313117, 0.8217618130894022, 0.821766760642741, 0.8217717141346135, 0.8217766736026348, 0.8217816390786167, 0.821786610588527, 0.821791588152416, 0.8217965717844316, 0.8218015614928408, 0.8218065572801192, 0.8218115591430433, 0.8218165670728412, 0.8218215810553495, 0.8218266010712203, 0.8218316270960797, 0.8218366591004629, 0.8218416970477193, 0.8218467408794443, 0.8218517904387292, 0.8218568451436444, 0.821861902872166, 0.8218669569619672, 0.8218719901466216, 0.8218769667665267, 0.8218818318604525, 0.8218865297580609, 0.8218910355992973, 0.8218953690327566, 0.8218995781822532, 0.8219037147333563, 0.8219078192299204, 0.8219119181193832, 0.8219160265482894, 0.8219201522350064, 0.8219242985480119, 0.8219284665057858, 0.8219326559440929, 0.8219368661524498, 0.8219410962037297, 0.8219453451165557, 0.8219496119303237, 0.8219538957362256, 0.8219581956868305, 0.8219625109958877, 0.8219668409339638, 0.8219711848227107, 0.8219755420288928, 0.8219799119587186, 0.8219842940524946, 0.8219886877795316, 0.8219930926330148, 0.8219975081245321, 0.8220019337778427, 0.8220063691215015, 0.8220108136799276, 0.8220152669628866, 0.8220197284537437, 0.8220241975976466, 0.8220286737919373, 0.8220331563821256, 0.8220376446672535, 0.8220421379176703, 0.8220466354056227, 0.8220511364447619, 0.8220556404306543, 0.8220601468726139, 0.8220646554088291], 'MSE': [29.366421923308256, 3.3858975894981826, 3.0366866620410384, 3.0253151613838827, 3.0210737631961448, 3.0169720005983693, 3.0128476810618179, 3.0086633507742144, 3.0043798248407643, 2.9999541342617175, 2.9953374198982323, 2.9904719789997691, 2.9852873501747696, 2.9796950665710793, 2.9735810543893453, 2.966795012995429, 2.9591417523150629, 2.9503820953362445, 2.9402414531688019, 2.9284294626239347, 2.914696835603567, 2.8989424551861438, 2.8813340871864961, 2.8624439674590887, 2.8432275112136058, 2.8247728970279469, 2.8107722462080682, 2.7990519215645966, 2.7882970526149418, 2.7783746748832812, 2.7690815667480106, 2.760254947435596, 2.7517720188510699, 2.7435456765713995, 2.7355256973334496, 2.7276726571770427, 2.7199348773380261, 2.7122644743074598, 2.7046221924754339, 2.6969730958626128, 2.6892837544968846, 2.681520462197728, 2.6736482756146014, 2.6656319050072854, 2.6574387112770381, 2.6490420749314119, 2.6404187095473648, 2.6315436312552767, 2.6223923414998254, 2.6129441702764433, 2.6031837146978951, 2.5931036946824984, 2.5827066372953231, 2.5719996336033519, 2.5609916428172976, 2.5496975859299376, 2.5381410487964962, 2.5263560820897375, 2.5143892194111395, 2.5022977342398391, 2.4901465603308148, 2.478011898314179, 2.4660404400895279, 2.454481594869192, 2.4433654230860977, 2.4326452533772445, 2.4223435826215201, 2.4125153687377416, 2.4032142230660249, 2.3944465952742187, 2.3861913310845249, 2.3784384787182966, 2.3711753115224674, 2.3643652307701672, 2.3579762486663016, 2.3519822717188874, 2.3463576769487866, 2.3410755352684549, 2.3361083434060701, 2.3314294920736751, 2.3270141165943286, 2.3228395633041172, 2.3188857564828678, 2.3151329450178926, 2.3115599081095044, 2.3081463856651165, 2.3048747609076847, 2.3017298009454978, 2.2986981374102902, 2.2957679604334156, 2.2929287810654664, 2.2901758918676136, 2.2875733987272024, 2.2851314730992498, 2.2827700290433648, 2.2804560035505097, 2.2781763179299523, 2.2759228103391753, 2.273692668664526, 2.2714859359992512, 2.269301884429598, 2.2671382723932099, 2.2649913833535962, 2.2628570151282044, 2.2607312953223886, 2.2586106735526847, 2.2564924091907326, 2.2543743264389797, 2.2522546581534493, 2.2501320595816905, 2.248005154804992, 2.2458672396322634, 2.2436991464143845, 2.2414954718424913, 2.2392728562378332, 2.2370437468936082, 2.2348134862672304, 2.2325859302116537, 2.230365580023562, 2.2281561210636003, 2.2259594569258851, 2.2237775447061425, 2.2216173339998049, 2.2194961572369967, 2.217427724011495, 2.2154079563890274, 2.2134285829339473, 2.2114863057738359, 2.2095815229156903, 2.2077161082000223, 2.2058923160915582, 2.204112352877365, 2.2023782166532304, 2.2006916230436744, 2.1990539502277753, 2.1974662005091128, 2.195928999407454, 2.1944426460275497, 2.1930072185888809, 2.1916227237320798, 2.190289190347436, 2.1890065356874722, 2.187774297728077, 2.1865916037793771, 2.1854573834605415, 2.184370536527755, 2.1833299656368408, 2.1823345478019163, 2.181383141445409, 2.1804748624291173, 2.179609986670934, 2.178790515474379, 2.1780177772539928, 2.17728933338294, 2.1766003201327822, 2.1759463341812828, 2.1753242713843455, 2.1747319533025875, 2.1741676911250347, 2.1736300349387561, 2.1731176525342479, 2.1726292726751648, 2.1721636593120173, 2.1717196028662396, 2.1712959226673751, 2.170891476513813, 2.1705051730728213, 2.1701359827706286, 2.1697829439829261, 2.169445163508406, 2.1691218124762712, 2.1688121200064185, 2.1685153668677524, 2.1682308806132191, 2.1679580330093677, 2.1676962405225986, 2.1674449692214219, 2.1672037462668734, 2.1669721801999215, 2.166749989798983, 2.1665370344338535, 2.1663333274800012, 2.1661390040576376, 2.1659542193987251, 2.1657789902239424, 2.1656130478564255, 2.1654557925330447, 2.1653063799460806, 2.1651638822750581, 2.1650274353126595, 2.1648963216030856, 2.1647699900768864, 2.1646480365979786, 2.1645301693742831, 2.1644161739999643, 2.1643058846251195, 2.1641991627673374, 2.164095882914808, 2.1639959232476409, 2.1638991598018276, 2.1638054627904726, 2.1637146943092262, 2.1636267070713311, 2.1635413438052815, 2.1634584342714986, 2.1633777697399004, 2.1632989770726945, 2.1632211707123714, 2.1631425995278377, 2.1630612290461468, 2.1629762924856353, 2.1628887960921372, 2.1628004947897761, 2.1627128611770834, 2.1626267357523243, 2.1625424142270564, 2.1624598570029101, 2.1623788876556866, 2.1622993817581744, 2.1622214762311569, 2.1621457036727665, 2.1620727877963835, 2.1620031102147013, 2.1619364228058053, 2.1618720849377127, 2.1618094238510106, 2.1617479059223355, 2.1616871507392164, 2.1616268954801856, 2.1615669682564489, 2.1615073005748355, 2.1614480096337614, 2.1613895629536506, 2.1613329275947604, 2.1612794320964217, 2.1612301714722086, 2.1611853634665059, 2.1611442882240386, 2.1611057720752482, 2.1610686867426159, 2.1610321807072927, 2.1609956950432516, 2.160958893512543, 2.1609215850133241, 2.1608836647745893, 2.1608450761845095, 2.1608057879833358, 2.1607657813037848, 2.1607250425684867, 2.1606835597588385, 2.1606413206340256, 2.1605983121585242, 2.1605545207917012, 2.1605099335169364, 2.1604645395572937, 2.1604183326441109, 2.1603713134315541, 2.1603234912181395, 2.1602748837462831, 2.160225513955246, 2.1601754035781164, 2.1601245651896614, 2.1600729955687195, 2.1600206728388964, 2.1599675579458109, 2.1599135991040059, 2.1598587371453957, 2.1598029101930294, 2.1597460569831504, 2.1596881188453061, 2.1596290406559606, 2.1595687711246301, 2.1595072626980918, 2.1594444712755121, 2.1593803558505846, 2.1593148781450946, 2.1592480022658114, 2.1591796943979862, 2.1591099225381152, 2.159038656263867, 2.1589658665360414, 2.1588915255271841, 2.1588156064718804, 2.1587380835348142, 2.1586589316925648, 2.1585781266284685, 2.1584956446396086, 2.1584114625550512, 2.1583255576681024, 2.1582379076815417, 2.1581484906689341, 2.1580572850507251, 2.1579642695871786, 2.1578694233856774, 2.1577727259222033, 2.1576741570744935, 2.157573697164799, 2.1574713270094201, 2.1573670279729624, 2.1572607820245842, 2.1571525717950868, 2.157042380633142, 2.1569301926600422, 2.1568159928231863, 2.1566997669496719, 2.1565815018013246, 2.1564611851371467, 2.1563388057938147, 2.1562143538121683, 2.1560878206767176, 2.1559591998153911, 2.1558284876265206, 2.1556956854019274, 2.1555608024655948, 2.1554238605214917, 2.1552848986347963, 2.1551439771258836, 2.1550011761174348, 2.1548565831989968, 2.1547102718962483, 2.1545622838896912, 2.1544126261491421, 2.154261281174731, 2.1541082218041945, 2.1539534247063128, 2.1537968804893359, 2.1536385997992915, 2.1534786480040902, 2.15331753566447, 2.1531576253132343, 2.1530034876854165, 2.1528565950659515, 2.152712340893542, 2.1525661091710901, 2.1524163404137271, 2.1522633048302304, 2.1521078635488857, 2.1519509200388476, 2.1517932260388637, 2.151635338584351, 2.151477637124982, 2.1513203603728819, 2.1511636482813468, 2.151007583910058, 2.1508522286093923, 2.1506976400611943, 2.1505438673629316, 2.1503909332300251, 2.1502388210527594, 2.1500874714012586, 2.1499367811604508, 2.1497866041570148, 2.1496367581559026, 2.1494870389957716, 2.1493372372739641, 2.1491871527198723, 2.1490366039752451, 2.1488854339050869, 2.1487335119264452, 2.1485807350222417, 2.1484270278898348, 2.1482723409057591, 2.1481166446385558, 2.147959922338476, 2.1478021639644798, 2.1476433638702583, 2.1474835210412975, 2.1473226393771294, 2.1471607265903483, 2.1469977918791412, 2.1468338432448157, 2.1466688853352318, 2.1465029184561031, 2.1463359389703776, 2.1461679407889109, 2.1459989173231628, 2.1458288633264386, 2.1456577763605265, 2.1454856578895591, 2.145312514063944, 2.1451383561944946, 2.1449632008759867, 2.1447870697463283, 2.1446099889334489, 2.1444319882926877, 2.1442531005544123, 2.1440733604850477, 2.1438928041371459, 2.1437114682269871, 2.1435293896554626, 2.1433466051651542, 2.1431631511196563, 2.142979063382874, 2.1427943772768976, 2.1426091275976744, 2.1424233486674256, 2.1422370744051626, 2.142050338396003, 2.1418631739412439, 2.141675614070675, 2.14148769150344, 2.141299438547362, 2.1411108869359867, 2.1409220676124412, 2.1407330104810156, 2.1405437441544799, 2.1403542957292214, 2.1401646906174476, 2.1399749524550788, 2.1397851030930775, 2.1395951626660112, 2.1394051497218403, 2.139215081393004, 2.1390249735856846, 2.138834841169305, 2.138644698152218, 2.1384545578342453, 2.1382644329322074, 2.138074335678581, 2.1378842778957559, 2.1376942710511631, 2.137504326300165, 2.1373144545241805, 2.1371246663719021, 2.136934972308361, 2.1367453826719767, 2.1365559077334102, 2.1363665577397764, 2.1361773429208184, 2.1359882734244362, 2.1357993591489195, 2.1356106094522587, 2.1354220327527349, 2.1352336360897075, 2.1350454247593298, 2.1348574021494828, 2.1346695698551734, 2.1344819280778728, 2.1342944762593787, 2.1341072139224702, 2.1339201418595857, 2.133733264179138, 2.1335465923214612, 2.1333601527987396, 2.1331740003176942, 2.1329882353799299, 2.1328030185731155, 2.1326185648052989, 2.132435101705505, 2.1322528007824215, 2.1320717222003931, 2.1318918107818279, 2.1317129381214879, 2.1315349551848537, 2.1313577281003435, 2.1311811524105591, 2.1310051532871337, 2.1308296799307804, 2.130654699037299, 2.130480189298146, 2.1303061373498653, 2.1301325349860836, 2.1299593773063559, 2.1297866615106007, 2.1296143861212116, 2.1294425504829682, 2.1292711544406102, 2.129100198131447, 2.128929681850344, 2.1287596059619118, 2.1285899708422638, 2.1284207768403283, 2.1282520242515215, 2.1280837132996044, 2.1279158441241783, 2.1277484167724703, 2.127581431194884, 2.1274148872451768, 2.1272487846874819, 2.1270831232157139, 2.1269179024976128, 2.1267531222661176, 2.1265887824991765, 2.1264248837551665, 2.126261427758688, 2.1260984183539149, 2.1259358629246932, 2.1257737742841436, 2.1256121727974273, 2.1254510880969892, 2.1252905592755509, 2.1251306322213415, 2.1249713533253609, 2.12481276040105, 2.124654873642613, 2.1244976902453323, 2.1243411848571236, 2.1241853152048078, 2.1240300301435071, 2.123875277208104, 2.1237210079735527, 2.1235671809319601, 2.1234137624298461, 2.1232607264289669, 2.1231080537228211, 2.1229557310317015, 2.1228037503206632, 2.1226521089869985, 2.122500812625058, 2.1223498841608173, 2.1221993852168577, 2.122049452868906, 2.1219003386197497, 2.1217524060441759, 2.1216060370078904, 2.1214614711402215, 2.1213187023244782, 2.1211775167079248, 2.1210376145144867, 2.1208987127863583, 2.1207605900969844, 2.120623089432788, 2.1204861044783492, 2.1203495640199583, 2.1202134196390374, 2.1200776372890187, 2.1199421919140176, 2.1198070641297035, 2.1196722382075195, 2.1195377008562981, 2.1194034404845699, 2.1192694467649331, 2.1191357104615589, 2.119002223775114, 2.1188689822618874, 2.1187359911185033, 2.1186032806994217, 2.1184709343982786, 2.1183391180018103, 2.1182080732996247, 2.1180780376345063, 2.1179491249807247, 2.1178212795872788, 2.1176943433083419, 2.1175681521470056, 2.1174425836015391, 2.1173175560937008, 2.1171930127278724, 2.1170689082303595, 2.1169452023763227, 2.116821857645601, 2.1166988387552288, 2.1165761127804092, 2.1164536493433506, 2.1163314207174984, 2.1162094018299298, 2.116087570182966, 2.1159659057204836, 2.1158443906604329, 2.115723009308784, 2.115601747868582, 2.1154805942527881, 2.1153595379088301, 2.1152385696608529, 2.1151176815741066, 2.1149968668459285, 2.1148761197239465, 2.1147554354538873, 2.1146348102533761, 2.1145142413098696, 2.1143937267951101, 2.1142732658887118, 2.1141528588008569, 2.1140325067842474, 2.1139122121258116, 2.1137919781125012, 2.1136718089666373, 2.1135517097533731, 2.1134316862638536, 2.1133117448827399, 2.1131918924493958, 2.1130721361226019, 2.1129524832557895, 2.112832941289069, 2.1127135176548077, 2.1125942196782748, 2.1124750543927382, 2.1123560280110647, 2.1122371443700905, 2.1121184009321556, 2.1119997803751791, 2.1118812372617688, 2.1117626856792828, 2.1116440037654201, 2.111525070349801, 2.111405822703551, 2.1112862959026142, 2.1111666158676288, 2.1110469571676194, 2.1109274963334235, 2.110808381430751, 2.1106897208178061, 2.1105715845697017, 2.1104540113962469, 2.1103370165807553, 2.1102205989761473, 2.1101047465205212, 2.1099894403450485, 2.1098746577287266, 2.1097603741685629, 2.1096465647934624, 2.1095332053004512, 2.1094202725487796, 2.1093077449127784, 2.1091956024672354, 2.1090838270591021, 2.1089724023034133, 2.1088613135306722, 2.1087505477048358, 2.1086400933243268, 2.1085299403153073, 2.1084200799220065, 2.1083105045978843, 2.1082012078999677, 2.1080921843857681, 2.1079834295140114, 2.1078749395482719, 2.1077667114632805, 2.107658742853094, 2.1075510318407402, 2.1074435769898878, 2.1073363772179619, 2.107229431712228, 2.1071227398492716, 2.1070163011201508, 2.1069101150624072, 2.1068041812010749, 2.1066984990001258, 2.1065930678260201, 2.1064878869237331, 2.1063829554057398, 2.1062782722529247, 2.1061738363269131, 2.1060696463907473, 2.1059657011374657, 2.1058619992227174, 2.1057585393002594, 2.1056553200579766, 2.1055523402524212, 2.1054495987403552, 2.105347094506659, 2.1052448266865582, 2.1051427945831902, 2.1050409976780768, 2.1049394356365054, 2.1048381083068608, 2.1047370157147638, 2.1046361580527488, 2.1045355356665119, 2.1044351490382418, 2.1043349987684699, 2.1042350855566654, 2.1041354101824843, 2.1040359734866194, 2.1039367763530548, 2.1038378196927616, 2.1037391044283589, 2.1036406314804941, 2.1035424017554081, 2.1034444161340824, 2.103346675462352, 2.1032491805422264, 2.1031519321238576, 2.1030549308993534, 2.1029581774968773, 2.1028616724764366, 2.1027654163267879, 2.1026694094638252, 2.1025736522305767, 2.1024781448985914, 2.1023828876703918, 2.1022878806834857, 2.1021931240145659, 2.1020986176845891, 2.1020043616629094, 2.1019103558715968, 2.1018166001886511, 2.1017230944505183, 2.1016298384534315, 2.1015368319544332, 2.1014440746717118, 2.101351566284877, 2.1012593064354941, 2.1011672947277615, 2.1010755307297901, 2.1009840139756801, 2.1008927439680294, 2.1008017201806655, 2.1007109420620482, 2.1006204090390375, 2.1005301205198283, 2.1004400758975406, 2.100350274553104, 2.1002607158578877, 2.1001713991756517, 2.1000823238643656, 2.0999934892774306, 2.0999048947641645, 2.0998165396707713, 2.0997284233407059, 2.0996405451150557, 2.0995529043330232, 2.0994655003331326, 2.0993783324542066, 2.0992914000368161, 2.0992047024251073, 2.0991182389680434, 2.0990320090210299, 2.0989460119460732, 2.0988602471112205, 2.0987747138885249, 2.0986894116497643, 2.09860433976116, 2.0985194975755435, 2.0984348844233249, 2.0983504996027444, 2.0982663423689933, 2.098182411924105, 2.0980987074073938, 2.0980152278877644, 2.0979319723575069, 2.0978489397290514, 2.0977661288343223, 2.0976835384263985, 2.0976011671845565, 2.0975190137211897, 2.0974370765911901, 2.0973553543026586, 2.0972738453289153, 2.097192548120939, 2.0971114611194968, 2.0970305827667404, 2.0969499115162438, 2.0968694458409614, 2.0967891842389039, 2.0967091252354213, 2.0966292673823648, 2.0965496092532816, 2.0964701494347882, 2.0963908865143828, 2.0963118190640517, 2.0962329456215185, 2.0961542646683888, 2.0960757746074083, 2.0959974737388323, 2.0959193602378194, 2.0958414321335925, 2.095763687291496, 2.0956861233990636, 2.0956087379562431, 2.0955315282706115, 2.0954544914580837, 2.095377624449263, 2.0953009240016662, 2.0952243867196838, 2.0951480090825934, 2.0950717874822362, 2.0949957182716981, 2.094919797824641, 2.0948440226050837, 2.0947683892423061, 2.0946928946059766, 2.0946175358716213, 2.0945423105677508, 2.0944672165954263, 2.0943922522162577, 2.0943174160090914, 2.0942427068010772, 2.0941681235837408, 2.0940936654257958, 2.0940193313933291, 2.0939451204861079, 2.0938710315929097, 2.0937970634665763, 2.0937232147162606, 2.0936494838122708, 2.0935758690995088, 2.0935023688149434, 2.0934289811064648, 2.0933557040510746, 2.0932825356708484, 2.0932094739469407, 2.0931365168316853, 2.0930636622589205, 2.0929909081541442, 2.092918252444008, 2.0928456930661858, 2.0927732279801186, 2.0927008551776081, 2.0926285726934792, 2.0925563786153831, 2.0924842710916747, 2.092412248337125, 2.092340308634753, 2.0922684503348914, 2.0921966718501945, 2.0921249716479724, 2.0920533482404067, 2.0919818001741994, 2.0919103260199123, 2.091838924363405, 2.091767593799708, 2.0916963329316367, 2.0916251403787753, 2.0915540148294047, 2.0914829552901417, 2.0914119621632521, 2.0913410411968858, 2.0912702154181724, 2.0911995537825696, 2.0911292222186897, 2.0910595386977024, 2.0909909696558358, 2.0909239995043882, 2.0908589125429589, 2.0907956575475621, 2.0907339080168859, 2.0906732372221337, 2.0906132632114738, 2.0905537079186232, 2.090494394651834, 2.0904352222235629, 2.0903761381803307, 2.0903171187487906, 2.0902581558816733, 2.0901992495926756, 2.0901404036845981, 2.0900816234765398, 2.0900229146402864, 2.0899642826248845, 2.0899057323830501, 2.0898472682463622, 2.0897888938747942, 2.0897306122432062, 2.0896724256477093, 2.0896143357243808, 2.0895563434757922, 2.0894984493042323, 2.0894406530490182, 2.0893829540277142, 2.0893253510787928, 2.0892678426057878, 2.0892104266216838, 2.089153100791997, 2.0890958624773823, 2.0890387087736206, 2.088981636549716, 2.088924642483716, 2.0888677230957047, 2.088810874777983, 2.0887540938228333, 2.0886973764475765, 2.0886407188170417, 2.0885841170635442, 2.0885275673045465, 2.0884710656585339, 2.0884146082582045, 2.0883581912623637, 2.0883018108659117, 2.088245463308144, 2.0881891448798231, 2.0881328519288314, 2.0880765808646151, 2.0880203281616647, 2.0879640903619583, 2.0879078640766919, 2.087851645987135, 2.0877954328451542, 2.0877392214732553, 2.087683008765032, 2.0876267916866733, 2.0875705672808111, 2.0875143326758336, 2.0874580851050872, 2.0874018219421457, 2.0873455407636641, 2.0872892394522897, 2.0872329163551004, 2.0871765705108598, 2.087120201946326, 2.0870638120181413, 2.0870074037317821, 2.0869509819211349, 2.0868945531344867, 2.0868381250996579, 2.0867817057549058, 2.0867253020171876, 2.0866689186190488, 2.086612557364584, 2.0865562169971397, 2.0864998936328276, 2.0864435815341462, 2.0863872739556748, 2.0863309638670735, 2.0862746444662781, 2.0862183094826992, 2.0861619533129629, 2.0861055710439023, 2.0860491584095029, 2.0859927117158983, 2.0859362277562297, 2.0858797037280579, 2.0858231371591924, 2.0857665258445892, 2.0857098677943231, 2.0856531611918285, 2.0855964043607504, 2.0855395957392622, 2.0854827338600912, 2.0854258173356559, 2.0853688448469896, 2.0853118151351193, 2.0852547269958626, 2.0851975792755373, 2.0851403708691398, 2.0850831007188351, 2.0850257678143223, 2.0849683711933942, 2.0849109099433938, 2.0848533832028155, 2.0847957901638052, 2.0847381300741006, 2.0846804022396523, 2.0846226060269255, 2.08456474086507, 2.08450680624783, 2.0844488017352707, 2.0843907269553323, 2.0843325816043015, 2.084274365447675, 2.0842160783199839, 2.0841577201245407, 2.0840992908323885, 2.0840407904812328, 2.0839822191736634, 2.0839235770753328, 2.0838648644125293, 2.0838060814703212, 2.0837472285933214, 2.0836883062101861, 2.083629315003996, 2.0835702568099119, 2.0835111384340137, 2.0834519846948862, 2.0833928735131844, 2.0833340068320734, 2.0832758017160109, 2.0832189009757496, 2.0831639557155617, 2.0831112566914993, 2.0830605740992483, 2.0830113450965015, 2.0829629651837012, 2.0829149601715762, 2.0828670207384956, 2.0828189697348272, 2.0827707168887648, 2.0827222228035587, 2.0826734755673622, 2.0826244771010236, 2.0825752357141538, 2.0825257622501576, 2.0824760681869403, 2.0824261647594504, 2.0823760625968455, 2.0823257716104338, 2.0822753009959807, 2.0822246592847251, 2.082173854410434, 2.0821228937792493, 2.0820717843359842, 2.0820205326266517, 2.0819691448580446, 2.0819176269577202, 2.0818659846380054, 2.0818142234688786, 2.0817623489642227, 2.0817103666862988, 2.0816582823687431, 2.0816061020539713, 2.0815538322313771, 2.0815014799494711, 2.0814490528629865, 2.0813965591701256, 2.0813440074046703, 2.0812914060782184, 2.0812387632181069, 2.081186085893616, 2.0811333798436706, 2.0810806492999103], 'Rp': [0.78582321300261126, 0.84627475567869648, 0.86045676853146125, 0.86100777450744903, 0.86121841736363203, 0.86142247929418181, 0.86162771395507021, 0.861835953234102, 0.86204914092218199, 0.86226941248058153, 0.86249919676649101, 0.86274136223635245, 0.8629994111482141, 0.8632777396940835, 0.86358201448486804, 0.86391969769905108, 0.86430047284922273, 0.86473619206339281, 0.8652404352358023, 0.86582750626830562, 0.86650956609615759, 0.86729126639185228, 0.86816372438735456, 0.8690978562917786, 0.87004567244638953, 0.87095297168700758, 0.87163973003001083, 0.87221398575799869, 0.87274032963155246, 0.87322558295447261, 0.87367991031116277, 0.87411139798300641, 0.87452610901213035, 0.87492831361620527, 0.87532045876197606, 0.87570445177258116, 0.87608277958674707, 0.87645774554486178, 0.87683124293877213, 0.87720496438737949, 0.87758053604414565, 0.87795959508432042, 0.87834383446360154, 0.87873496327817147, 0.87913456139621715, 0.87954391856140934, 0.87996414469819828, 0.88039640661602114, 0.88084185000924664, 0.8813014419681755, 0.88177589397238609, 0.88226552469674691, 0.8827701770699673, 0.88328945443342222, 0.88382285304095987, 0.88436958440533986, 0.8849284495180747, 0.88549774977343843, 0.8860751880852562, 0.88665794938158282, 0.88724284999737246, 0.88782617702080613, 0.88840088223154923, 0.88895507388092165, 0.88948733622727416, 0.88999993492805918, 0.89049188463552098, 0.89096070489220069, 0.89140399833830275, 0.89182155194925561, 0.8922144246708138, 0.89258314489667079, 0.89292837716491924, 0.89325191048649932, 0.89355530840137698, 0.89383985616501782, 0.89410681468780151, 0.89435749630556338, 0.89459322638097871, 0.8948152756589911, 0.89502482416829776, 0.89522294427708737, 0.89541058652635297, 0.8955886897365174, 0.89575826660617897, 0.89592028416432767, 0.8960755820845353, 0.89622488560700797, 0.89636883065016504, 0.89650797825634698, 0.89664282568861597, 0.89677360221846125, 0.89689736595341607, 0.89701362345630198, 0.89712605544921931, 0.8972361959497297, 0.89734466572241578, 0.89745185732842148, 0.89755791126037476, 0.89766283270565461, 0.89776666207724676, 0.89786950870085436, 0.89797153563428489, 0.89807293174445624, 0.89817389572018369, 0.89827460802016257, 0.89837520456419195, 0.89847579149416434, 0.89857645405081654, 0.89867725673601662, 0.89877826536989258, 0.89887980021446656, 0.89898277725163078, 0.89908745463718309, 0.89919303724370336, 0.8992989315213985, 0.89940488373069027, 0.89951071222322532, 0.8996162050046147, 0.89972118591805494, 0.89982556056063012, 0.89992923252343671, 0.90003187144348951, 0.9001326585448638, 0.90023094551546645, 0.90032692145503335, 0.90042097382369302, 0.90051325669735838, 0.9006037504235217, 0.90069236603267444, 0.90077899685771712, 0.90086353876281777, 0.90094589764568034, 0.9010259928607246, 0.90110375973973589, 0.90117915135751026, 0.90125213855294828, 0.90132270755812804, 0.90139085503931871, 0.90145658106460691, 0.90151988467706157, 0.90158077021877314, 0.90163925996874128, 0.90169539562176793, 0.90174922824855619, 0.90180081039254611, 0.90185019450430692, 0.90189743423501711, 0.90194258406547578, 0.90198568635282983, 0.90202672906582915, 0.90206561938488894, 0.90210229599707004, 0.90213687386535024, 0.90216958161471306, 0.9022006266531023, 0.9022301557667699, 0.9022582723857866, 0.90228505687931226, 0.90231057826600236, 0.90233489990747684, 0.90235808219937852, 0.90238018381354712, 0.90240126213318528, 0.9024213731578955, 0.90244057106714903, 0.90245890764516801, 0.90247643177196812, 0.90249318913110577, 0.90250922218277574, 0.90252457034953004, 0.90253927030716352, 0.90255335627726629, 0.90256686025306054, 0.90257981212150895, 0.90259223964745827, 0.9026041682593825, 0.90261562054002331, 0.90262661532577915, 0.90263716643058745, 0.90264728131796446, 0.90265696054345634, 0.90266619922690017, 0.90267499156554398, 0.90268333781537347, 0.90269125073432877, 0.90269875760671314, 0.90270589649888988, 0.9027127092372127, 0.90271923494398487, 0.90272550633288295, 0.9027315487780746, 0.90273738111630786, 0.9027430171420634, 0.90274846714334833, 0.90275373918304469, 0.90275884005039786, 0.90276377591437207, 0.90276855274960732, 0.90277317660852896, 0.90277765379586916, 0.90278199097975775, 0.90278619525476267, 0.90279027417391022, 0.90279423590172236, 0.90279809049042781, 0.90280185614227593, 0.90280557643183423, 0.90280933751120962, 0.90281323866875463, 0.90281731571980384, 0.90282151776857034, 0.902825758984378, 0.90282996854761377, 0.9028341065139156, 0.90283815896143349, 0.90284212777917028, 0.90284602122038227, 0.9028498449809691, 0.90285359230383921, 0.90285723765465664, 0.90286074652094672, 0.9028641007855851, 0.90286731230356521, 0.90287041150896441, 0.90287343027753819, 0.90287639384536911, 0.90287932018453343, 0.9028822217136182, 0.90288510657776677, 0.90288797809657584, 0.90289083096083611, 0.90289364359855928, 0.90289637123506683, 0.90289895224291605, 0.90290133567163755, 0.90290351110853517, 0.90290551159196497, 0.90290739130769515, 0.9029092024911991, 0.90291098467755737, 0.90291276392194775, 0.90291455600084225, 0.90291636998052671, 0.902918210926831, 0.90292008166599413, 0.90292198383745992, 0.90292391849293951, 0.90292588642562899, 0.90292788834348148, 0.90292992495245916, 0.90293199698351767, 0.90293410517916051, 0.90293625024516633, 0.90293843277012653, 0.90294065311857907, 0.90294291131785465, 0.90294520697780967, 0.90294753930222627, 0.90294990724449298, 0.90295230981268426, 0.90295474644660445, 0.90295721733171908, 0.90295972353298726, 0.90296226692404657, 0.90296484997649651, 0.90296747550771528, 0.90297014646080476, 0.9029728657487518, 0.90297563616132148, 0.9029784603205494, 0.90298134066735991, 0.90298427946598658, 0.90298727881752516, 0.90299034067666417, 0.90299346686892168, 0.90299665910671001, 0.90299991900385945, 0.90300324808808763, 0.90300664781187612, 0.90301011956163235, 0.90301366466595712, 0.90301728440253615, 0.90302098000440656, 0.9030247526655536, 0.90302860354585635, 0.90303253377557169, 0.90303654445911707, 0.90304063667843615, 0.90304481149561011, 0.90304906995468703, 0.90305341308295706, 0.90305784189120886, 0.90306235737354257, 0.90306696050629254, 0.90307165224652242, 0.90307643352997247, 0.90308130526883512, 0.90308626834906169, 0.9030913236278495, 0.90309647193093656, 0.90310171405008888, 0.903107050740383, 0.90311248271792877, 0.90311801065734776, 0.90312363518913463, 0.90312935689674212, 0.90313517631257245, 0.90314109391182384, 0.90314711010085291, 0.9031532251932185, 0.90315943936108478, 0.90316575254477638, 0.90317216430557257, 0.90317867362154958, 0.90318527865068965, 0.90319197653953731, 0.90319876347945161, 0.90320563528452313, 0.90321258842445473, 0.90321962089353458, 0.90322673236382089, 0.90323392369406919, 0.90324119620659116, 0.90324855102725599, 0.90325598859677825, 0.90326350838828928, 0.90327110741893191, 0.90327876326932532, 0.90328637245321419, 0.90329373198254348, 0.90330076691507344, 0.90330766816484886, 0.90331463634991804, 0.90332174434670243, 0.90332898519088756, 0.90333632431375377, 0.90334372387479278, 0.90335115194288729, 0.90335858479852726, 0.90336600635352593, 0.90337340656252463, 0.90338077952736417, 0.90338812157381054, 0.9033954296837533, 0.90340270085883168, 0.90340993266907699, 0.90341712432541632, 0.90342427727054775, 0.90343139513205395, 0.90343848354587053, 0.90344555000653692, 0.90345260350995482, 0.90345965390809924, 0.90346671115480015, 0.90347378465483097, 0.9034808828219677, 0.90348801284715974, 0.90349518061519352, 0.90350239069674632, 0.90350964638891007, 0.90351694985067121, 0.90352430237384651, 0.90353170471880551, 0.90353915736051638, 0.90354666056429755, 0.90355421435744976, 0.90356181851500328, 0.90356947262123111, 0.90357717619073041, 0.90358492880192454, 0.90359273019966546, 0.90360058033890933, 0.90360847936169197, 0.90361642752404348, 0.90362442510284913, 0.90363247230909061, 0.90364056921883806, 0.90364871572109451, 0.90365691147956062, 0.9036651559094947, 0.90367344817135731, 0.90368178718288528, 0.90369017164655252, 0.90369860008737546, 0.9037070708947903, 0.90371558236396865, 0.9037241327322092, 0.90373272020917939, 0.9037413429999499, 0.90374999932118083, 0.90375868741140009, 0.90376740553658763, 0.90377615199158501, 0.90378492509913189, 0.90379372320693097, 0.9038025446839717, 0.9038113879170927, 0.90382025130849886, 0.9038291332751256, 0.90383803225077786, 0.90384694669098653, 0.90385587508116327, 0.9038648159469912, 0.90387376786646312, 0.90388272948183601, 0.90389169951007853, 0.90390067675032637, 0.90390966008792861, 0.90391864849403813, 0.90392764102181267, 0.90393663679980596, 0.90394563502338243, 0.90395463494563477, 0.90396363586823525, 0.90397263713328257, 0.90398163811608179, 0.90399063821949366, 0.90399963686940343, 0.90400863351128169, 0.90401762760758431, 0.90402661863566458, 0.90403560608577727, 0.90404458945887978, 0.90405356826390904, 0.90406254201490244, 0.90407151022774224, 0.90408047241781109, 0.90408942809932091, 0.90409837678794447, 0.90410731800838295, 0.90411625130818329, 0.9041251762770649, 0.90413409256875743, 0.9041429999196644, 0.90415189815829189, 0.90416078720081006, 0.90416966703291368, 0.90417853767965806, 0.90418739916497204, 0.9041962514547488, 0.90420509435895835, 0.90421392734140937, 0.90422274915334167, 0.90423155721389981, 0.90424034677995924, 0.90424911027394139, 0.9042578375603979, 0.90426651791338708, 0.90427514326364533, 0.90428371079433834, 0.90429222311646862, 0.90430068627682547, 0.90430910728168201, 0.904317492418512, 0.90432584659128479, 0.90433417331373012, 0.9043424749735226, 0.904350753139051, 0.90435900881713771, 0.90436724264264701, 0.90437545500893501, 0.90438364615454192, 0.90439181621962927, 0.90439996528231703, 0.90440809338225014, 0.90441620053574745, 0.90442428674533037, 0.90443235200621275, 0.90444039631044704, 0.90444841964938982, 0.9044564220155783, 0.9044644034039766, 0.90447236381251717, 0.90448030324275475, 0.90448822170007381, 0.90449611919377415, 0.90450399573706119, 0.90451185134655976, 0.90451968604142963, 0.90452749984123682, 0.904535292761803, 0.90454306480679092, 0.90455081595227527, 0.90455854611951425, 0.90456625513082889, 0.9045739426437619, 0.90458160806355281, 0.90458925044491911, 0.90459686841305409, 0.90460446015539153, 0.90461202354644699, 0.90461955644047853, 0.90462705709302216, 0.90463452457934823, 0.90464195904204492, 0.90464936166826271, 0.90465673442804739, 0.90466407970173512, 0.90467139993182855, 0.90467869737645612, 0.90468597397715056, 0.90469323131533086, 0.9047004706216969, 0.90470769280959928, 0.90471489851321718, 0.90472208811541832, 0.90472926173578183, 0.90473641909933022, 0.90474355910782356, 0.90475067883898574, 0.90475777182465045, 0.90476482622761412, 0.90477182496007724, 0.90477875009013642, 0.90478559036751505, 0.90479234605954173, 0.90479902715094118, 0.90480564763378646, 0.9048122207076027, 0.90481875669887624, 0.90482526293309795, 0.90483174437695735, 0.90483820436602258, 0.9048446451776353, 0.90485106842246121, 0.90485747529435712, 0.90486386672435659, 0.90487024347383638, 0.90487660619090249, 0.90488295544441277, 0.90488929174388133, 0.90489561554743769, 0.90490192724566076, 0.90490822707261942, 0.904914514814252, 0.9049207890860983, 0.90492704602776386, 0.90493327790310119, 0.90493947331861768, 0.9049456208685609, 0.9049517146692998, 0.90495775670986855, 0.90496375397883067, 0.90496971407794069, 0.90497564294116783, 0.90498154472289305, 0.90498742244912589, 0.90499327857128142, 0.90499911525243759, 0.90500493447442243, 0.90501073806444121, 0.90501652769711105, 0.90502230489347835, 0.90502807102352023, 0.90503382731243964, 0.90503957484947406, 0.90504531459842485, 0.90505104740877673, 0.90505677402676254, 0.90506249510619008, 0.90506821121870507, 0.90507392286278876, 0.90507963047207618, 0.90508533442216887, 0.90509103503619948, 0.90509673258889412, 0.90510242730934964, 0.90510811938215741, 0.90511380894778148, 0.90511949610155085, 0.90512518089244731, 0.9051308633216858, 0.90513654334153937, 0.90514222085522766, 0.90514789571759513, 0.90515356773758937, 0.90515923668172771, 0.90516490227921409, 0.90517056422769659, 0.90517622219991134, 0.9051818758503043, 0.90518752482143194, 0.90519316874974176, 0.90519880727079283, 0.90520444002450251, 0.90521006666399739, 0.90521568687931875, 0.90522130046609828, 0.90522690750279011, 0.9052325087257872, 0.90523810612935995, 0.90524370353006967, 0.90524930637511258, 0.90525492008292252, 0.90526054738415351, 0.90526618646974388, 0.90527183128735833, 0.90527747352926558, 0.90528310486746866, 0.90528871841650149, 0.90529430925835186, 0.90529987434362114, 0.90530541212572413, 0.90531092215362152, 0.90531640472109043, 0.90532186059672948, 0.9053272908285841, 0.90533269660791071, 0.90533807917687725, 0.90534343976796527, 0.90534877956530335, 0.90535409968180558, 0.90535940114662894, 0.90536468489961142, 0.90536995179066559, 0.90537520258184156, 0.90538043795126122, 0.90538565849823471, 0.9053908647485992, 0.90539605716048899, 0.90540123612983492, 0.90540640199583455, 0.90541155504608317, 0.90541669552169557, 0.90542182362192181, 0.90542693950879405, 0.90543204331160843, 0.9054371351312015, 0.90544221504412592, 0.90544728310694267, 0.90545233936025071, 0.90545738383247465, 0.90546241654376747, 0.90546743750949699, 0.90547244674330019, 0.90547744425986043, 0.90548243007718288, 0.90548740421815865, 0.90549236671161226, 0.90549731759289198, 0.90550225690358521, 0.90550718469102431, 0.90551210100726853, 0.90551700590770978, 0.90552189944958417, 0.90552678169037337, 0.9055316526860574, 0.90553651248964739, 0.90554136114959793, 0.90554619870864095, 0.90555102520272757, 0.90555584066018402, 0.90556064510124457, 0.90556543853776961, 0.90557022097335005, 0.90557499240342831, 0.90557975281592407, 0.90558450219180953, 0.90558924050583567, 0.90559396772744816, 0.90559868382167674, 0.90560338875000734, 0.90560808247131774, 0.90561276494264142, 0.9056174361199687, 0.9056220959590614, 0.90562674441594249, 0.90563138144756039, 0.90563600701231262, 0.90564062107049315, 0.90564522358460309, 0.90564981451984727, 0.90565439384430046, 0.90565896152916991, 0.90566351754898633, 0.90566806188157611, 0.90567259450821036, 0.9056771154134301, 0.90568162458488688, 0.90568612201317156, 0.90569060769161847, 0.90569508161587864, 0.90569954378377682, 0.90570399419504621, 0.90570843285115088, 0.90571285975505667, 0.90571727491136844, 0.90572167832620953, 0.90572607000729488, 0.90573044996409957, 0.90573481820786461, 0.90573917475182308, 0.90574351961114163, 0.90574785280302139, 0.90575217434665933, 0.90575648426327449, 0.90576078257590031, 0.90576506930931078, 0.90576934448992374, 0.9057736081455583, 0.90577786030534113, 0.90578210099953849, 0.90578633025934885, 0.90579054811689941, 0.9057947546049866, 0.90579894975720898, 0.90580313360756326, 0.90580730619063909, 0.90581146754140085, 0.90581561769512908, 0.90581975668727632, 0.90582388455339446, 0.90582800132889574, 0.90583210704896211, 0.90583620174830626, 0.9058402854609876, 0.90584435822026532, 0.90584842005855248, 0.90585247100726884, 0.9058565110970066, 0.9058605403576756, 0.90586455881873584, 0.90586856650969327, 0.90587256346052458, 0.90587654970224307, 0.90588052526755025, 0.90588449019139672, 0.90588844451143025, 0.90589238826869256, 0.90589632150781163, 0.9059002442773002, 0.90590415662967894, 0.90590805862140755, 0.90591195031273297, 0.90591583176738488, 0.90591970305211356, 0.90592356423619402, 0.90592741539093202, 0.90593125658896889, 0.90593508790367983, 0.90593890940866884, 0.90594272117724817, 0.90594652328187231, 0.90595031579405094, 0.90595409878394362, 0.90595787232052305, 0.90596163647166073, 0.90596539130446885, 0.90596913688581282, 0.90597287328314302, 0.90597660056523033, 0.90598031880321361, 0.90598402807166778, 0.90598772844976994, 0.90599142002229227, 0.90599510288067442, 0.90599877712389076, 0.90600244285921749, 0.90600610020255001, 0.90600974927889444, 0.90601339022222893, 0.90601702317529975, 0.90602064828900797, 0.90602426572162031, 0.90602787563721721, 0.90603147820406005, 0.90603507359230917, 0.90603866197093286, 0.90604224350470952, 0.90604581835032583, 0.90604938665312051, 0.90605294854383533, 0.90605650413648919, 0.90606005352761154, 0.90606359679677728, 0.90606713400895045, 0.90607066521761059, 0.90607419046891913, 0.90607770980572855, 0.90608122327138307, 0.9060847309125023, 0.90608823278116957, 0.90609172893592949, 0.9060952194421138, 0.9060987043716392, 0.90610218380227803, 0.9061056578169987, 0.90610912650293907, 0.90611258995076205, 0.90611604825381009, 0.90611950150760023, 0.90612294980909902, 0.90612639325646904, 0.90612983194840957, 0.90613326598373634, 0.90613669546093112, 0.9061401204774765, 0.90614354112948292, 0.90614695751095486, 0.90615036971344487, 0.90615377782545037, 0.90615718193225969, 0.90616058211580042, 0.90616397845457564, 0.90616737102407341, 0.90617075989700269, 0.90617414514384742, 0.90617752683343256, 0.90618090503350113, 0.9061842798113009, 0.90618765123401934, 0.9061910193691971, 0.90619438428493826, 0.9061977460495485, 0.90620110472842563, 0.90620446036837043, 0.906207812932878, 0.90621116208147223, 0.90621450655796454, 0.90621784286043783, 0.90622116316498569, 0.90622445370879745, 0.90622769654064728, 0.9062308763432213, 0.90623398797592258, 0.90623703780626397, 0.9062400386671462, 0.90624300392589385, 0.90624594423080906, 0.90624886684977413, 0.90625177626602649, 0.90625467504919166, 0.90625756458600382, 0.90626044558384378, 0.90626331838304142, 0.90626618313802432, 0.90626903991740138, 0.90627188875702736, 0.90627472968752121, 0.90627756274781424, 0.90628038799175525, 0.90628320549093577, 0.90628601533586062, 0.90628881763594349, 0.90629161251898405, 0.90629440013031815, 0.90629718063160347, 0.9062999541996597, 0.90630272102488663, 0.90630548130977862, 0.90630823526737947, 0.90631098311982361, 0.90631372509670172, 0.90631646143367273, 0.90631919237105518, 0.90632191815253393, 0.90632463902398808, 0.90632735523233865, 0.90633006702459851, 0.9063327746469626, 0.90633547834401329, 0.90633817835807395, 0.90634087492847648, 0.90634356829122076, 0.90634625867840546, 0.90634894631791274, 0.90635163143309849, 0.90635431424263713, 0.90635699496023059, 0.90635967379457583, 0.90636235094926187, 0.90636502662272378, 0.90636770100826047, 0.9063703742940401, 0.90637304666326068, 0.90637571829412467, 0.90637838935997639, 0.90638106002947882, 0.90638373046663057, 0.90638640083095634, 0.90638907127741608, 0.90639174195642913, 0.90639441301319745, 0.90639708458712298, 0.90639975680986462, 0.90640242980259889, 0.90640510367117755, 0.90640777849929599, 0.90641045433893852, 0.90641313119856237, 0.90641580903041818, 0.90641848772002087, 0.9064211670820933, 0.90642384686819111, 0.90642652678934765, 0.90642920655328296, 0.90643188590854085, 0.90643456468453498, 0.90643724281537541, 0.90643992034256482, 0.90644259739929722, 0.90644527418379173, 0.9064479509315625, 0.9064506278916854, 0.90645330530984169, 0.9064559834180681, 0.90645866242970641, 0.90646134253800736, 0.90646402391671821, 0.90646670672195395, 0.90646939109434566, 0.90647207716143086, 0.90647476503949143, 0.90647745483548403, 0.90648014664845677, 0.90648284057081796, 0.9064855366892316, 0.90648823508546073, 0.90649093583692242, 0.90649363901715219, 0.90649634469620721, 0.90649905294087929, 0.90650176381487524, 0.90650447737894868, 0.90650719369102961, 0.90650991280617443, 0.90651263477655197, 0.90651535965151575, 0.90651808747743901, 0.90652081829770337, 0.90652355215263836, 0.90652628907936061, 0.90652902911178557, 0.90653177228049842, 0.90653451861270473, 0.9065372681321483, 0.90654002085915908, 0.90654277681050766, 0.9065455359995509, 0.9065482984360923, 0.90655106412660191, 0.90655383307411153, 0.90655660527835802, 0.90655938073596443, 0.90656215944043184, 0.90656494138219712, 0.90656772654904927, 0.90657051492593022, 0.90657330649517376, 0.90657610123526244, 0.90657889911030942, 0.90658170000852423, 0.90658450346625707, 0.90658730771444651, 0.90659010717723187, 0.90659288803443616, 0.90659562514412406, 0.90659828826412447, 0.90660085804693602, 0.9066033366817966, 0.90660574329763266, 0.90660810221973853, 0.90661043454988011, 0.90661275538167652, 0.90661507432979371, 0.90661739705500688, 0.90661972667801993, 0.90662206479067164, 0.90662441210034661, 0.90662676881637272, 0.9066291348745662, 0.90663151006487885, 0.90663389410377559, 0.90663628667431484, 0.90663868744855181, 0.90664109609953114, 0.90664351230759022, 0.9066459357633454, 0.9066483661688377, 0.90665080323765068, 0.90665324669451852, 0.90665569627428411, 0.90665815172076736, 0.90666061278534793, 0.90666307922500111, 0.90666555079995426, 0.90666802727063356, 0.90667050839403263, 0.90667299391923517, 0.9066754835825519, 0.90667797710276543, 0.90668047417747755, 0.90668297448175017, 0.90668547767065333, 0.90668798338682166, 0.90669049127306223, 0.90669300098864725, 0.90669551222625866, 0.90669802472521754]}
 '''
 
 plt.figure()
-plt.plot(BNMTF.all_performances['MSE'])
+plt.plot(performances_sink.values['MSE'])
 plt.ylim(0,10)
\ No newline at end of file
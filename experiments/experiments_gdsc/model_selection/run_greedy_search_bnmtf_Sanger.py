@@ -42,7 +42,7 @@ search_metric = 'AIC'
 (_,X_min,M,_,_,_,_) = load_gdsc(standardised=standardised)
 
 folds_test = compute_folds(I,J,no_folds,M)
-folds_training = compute_Ms(folds_test)
+folds_training = compute_Ms(folds_test,M)
 (M_train,M_test) = (folds_training[0],folds_test[0])
 
 # Run the line search
@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmf_icm import nmf_icm
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import numpy, random, scipy, matplotlib.pyplot as plt
@@ -46,11 +47,12 @@ for i in range(0,repeats):
     # Run the classifier
     nmf = nmf_icm(R,M,K,priors) 
     nmf.initialise(init_UV)
-    nmf.run(iterations,minimum_TN=minimum_TN)
+    performances_sink = MemorySink()
+    nmf.run(iterations,minimum_TN=minimum_TN,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
     # Extract the performances and timestamps across all iterations
     times_repeats.append(nmf.all_times)
-    performances_repeats.append(nmf.all_performances)
+    performances_repeats.append(performances_sink.values)
 
 # Check whether seed worked: all performances should be the same
 assert all(numpy.array_equal(performances, performances_repeats[0]) for performances in performances_repeats), \
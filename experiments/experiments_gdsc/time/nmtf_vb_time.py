@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.bnmtf_vb_optimised import bnmtf_vb_optimised
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 from BNMTF.data_drug_sensitivity.gdsc.load_data import load_gdsc
 
 import numpy, random, scipy, matplotlib.pyplot as plt
@@ -47,11 +48,12 @@ for i in range(0,repeats):
     # Run the classifier
     BNMTF = bnmtf_vb_optimised(R,M,K,L,priors) 
     BNMTF.initialise(init_S,init_FG)
-    BNMTF.run(iterations)
+    performances_sink = MemorySink()
+    BNMTF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
     # Extract the performances and timestamps across all iterations
     times_repeats.append(BNMTF.all_times)
-    performances_repeats.append(BNMTF.all_performances)
+    performances_repeats.append(performances_sink.values)
 
 # Check whether seed worked: all performances should be the same
 assert all(numpy.array_equal(performances, performances_repeats[0]) for performances in performances_repeats), \
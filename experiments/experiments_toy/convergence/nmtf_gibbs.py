@@ -12,6 +12,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.bnmtf_gibbs_optimised import bnmtf_gibbs_optimised
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 
 import numpy, matplotlib.pyplot as plt
 
@@ -42,7 +43,8 @@ numpy.random.seed(3)
 # Run the Gibbs sampler
 BNMTF = bnmtf_gibbs_optimised(R,M,K,L,priors)
 BNMTF.initialise(init_S)#(init_S,init_FG)
-BNMTF.run(iterations)
+performances_sink = MemorySink()
+BNMTF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 taus = BNMTF.all_tau
 Fs = BNMTF.all_F
@@ -64,7 +66,7 @@ axarr[3].set_ylabel("G[0,0]")
 axarr[3].set_xlabel("Iterations")
 
 # Extract the performances across all iterations
-print "gibbs_all_performances = %s" % BNMTF.all_performances
+print "gibbs_all_performances = %s" % performances_sink.values
 
 '''
 gibbs_all_performances = {'R^2': [-1275.1106428818866, -0.37992071447006426, 0.8650269600324816, 0.9300904020467348, 0.9360424809220652, 0.9386272259269968, 0.9415301182158252, 0.9453860665004572, 0.9504441476841898, 0.9564132954144573, 0.962468146527695, 0.9679926343358807, 0.9716961211641357, 0.9739512620547103, 0.9752598152643973, 0.9761945765101814, 0.9769168686278003, 0.9773054614143125, 0.9777454484336157, 0.9780609809584355, 0.9780967461244384, 0.9779597705366482, 0.9780623648797686, 0.9783536557417841, 0.9783731071419491, 0.978345440236002, 0.978414394346419, 0.9785316002856954, 0.9786294887515125, 0.9785839720162592, 0.9786413615948524, 0.9786660587634429, 0.9785747062193084, 0.9788089110929671, 0.97883866990551, 0.9787462439477624, 0.9786492370125149, 0.9788430612275272, 0.9787954268035237, 0.9789551272937123, 0.9789205520257065, 0.9789716414866803, 0.9791954351385403, 0.9791813215837024, 0.9793839365431662, 0.9795137886482082, 0.9798192757720723, 0.9801105889126535, 0.9803963646308221, 0.98058682610937, 0.9811524600643902, 0.9818059378878389, 0.9822675919609931, 0.9829902804947755, 0.9838114093723913, 0.9846715943519253, 0.9856371139757977, 0.9863286312735091, 0.9874366293875962, 0.988406731957402, 0.9893761401196456, 0.9902941176929393, 0.9912010819145697, 0.9919438422896384, 0.9925299469251245, 0.9931401978254994, 0.9935523979197843, 0.9940191008925233, 0.9943437502701735, 0.9946790904963331, 0.9949201038953126, 0.9951552490802649, 0.9953248178935661, 0.9955158243628611, 0.9956461101588946, 0.9957306863138069, 0.9958487717238478, 0.9958940287186973, 0.9959553117555129, 0.9960058582900927, 0.9960104964323059, 0.9960665785865718, 0.9960752298628333, 0.9961112813727157, 0.9961288579504574, 0.996143223340018, 0.9961581495191661, 0.9961705049142657, 0.9961888312084214, 0.9961736017685714, 0.9961957733115463, 0.9962037309708256, 0.9962182010163925, 0.9962220430593709, 0.996212414011442, 0.9962483827734544, 0.9962461909229448, 0.9962283791860891, 0.9962552617541618, 0.9962394569495863, 0.9962323923077706, 0.996240642205172, 0.9962483169461014, 0.9962236110630222, 0.9962596376549888, 0.9962977169574888, 0.9962713606341382, 0.9962961528227106, 0.9963194394041549, 0.9962862175425722, 0.9962996811107981, 0.9962962028317505, 0.9962720538136113, 0.9962714606633514, 0.9962802082659121, 0.9963255433901653, 0.9962867051851813, 0.9963066211014197, 0.9963005851163524, 0.9962762659855023, 0.996276361065216, 0.996283238613357, 0.9962666870993109, 0.9962776440025031, 0.99627383245159, 0.9962243891623804, 0.996263628423123, 0.9962523753914228, 0.9962702532191234, 0.9962982833248905, 0.9963136952325883, 0.9962983364316543, 0.996306936186879, 0.9963009897184111, 0.9963071133690126, 0.9963109928725586, 0.9963017602188274, 0.9962953604516515, 0.9963009324057822, 0.99628726350478, 0.9962894815013694, 0.996280422205863, 0.9962970911713032, 0.9962826271865919, 0.9962931110320956, 0.9962776645016099, 0.9962991342096533, 0.9962787895128393, 0.9963080880405749, 0.9962910430383873, 0.9962715123857819, 0.9962970504844637, 0.9962897179583178, 0.9962825949838957, 0.9962971243040517, 0.9962944580799609, 0.9963017751827383, 0.9962843363607, 0.9962661049683561, 0.9962957942444719, 0.9962905593265803, 0.9962973932238753, 0.9962811748388198, 0.9962846678491369, 0.9963100327718529, 0.9963052395405482, 0.9962827224459458, 0.9962963518787303, 0.9962749051582516, 0.9962876883759287, 0.9962966770788587, 0.9962785305141199, 0.9962818060030828, 0.9962573345627581, 0.9962774616718756, 0.9962900646322673, 0.9962994867004539, 0.9962578453168468, 0.9962874351890499, 0.9962961326320556, 0.996307910204831, 0.9962631700533161, 0.9962925177531474, 0.996298891003326, 0.9963002926638019, 0.9962858827472394, 0.9962658511976383, 0.9962940197914941, 0.9963135014005631, 0.9963062944220185, 0.9963056997342837, 0.9963295324391366, 0.9963153860141468, 0.9963199275261577, 0.9963526738457142, 0.9963213902457309, 0.9962945462529248, 0.9962881382432729, 0.996307119847869, 0.996312729548403, 0.9962994657308281, 0.9962913517337846, 0.9963217969533635, 0.9962968695543672, 0.996271751979019, 0.99630162431902, 0.9962960066559745, 0.9962955924714791, 0.9963074163430665, 0.9963163679817167, 0.9963045547167165, 0.9963017453800015, 0.996281094939729, 0.9963102337102552, 0.9962836154142457, 0.9962700824930949, 0.9963018944745533, 0.9963079285318048, 0.9962945951232272, 0.9963115099236401, 0.9963080384229955, 0.996290582802658, 0.9962996366594921, 0.9963213387568833, 0.996304860984905, 0.9963188561381352, 0.9963040055637181, 0.9962816557402875, 0.9962837025274116, 0.9963095165748576, 0.9963050205984785, 0.9963026249800869, 0.9963012288255383, 0.9962989025295206, 0.9963138457668413, 0.9962949671921335, 0.9963120127522529, 0.9963098015807169, 0.9962677136219075, 0.9962682396749093, 0.9963133473798834, 0.9963039737719227, 0.9963078499391684, 0.996290764201431, 0.996310056539151, 0.9963187935667555, 0.9963049224590332, 0.996310387873004, 0.9963118958066265, 0.9963159009164989, 0.9963030577945399, 0.9963128890411034, 0.9962995902872203, 0.9962811204237416, 0.9962823364162716, 0.9963034266396437, 0.9963095200509472, 0.996294138325825, 0.9962820757332824, 0.9963118737865722, 0.9963178184079623, 0.9963282429111089, 0.9963257377932858, 0.9963165526578478, 0.9962915549511798, 0.996276770608938, 0.9962920894481975, 0.9963013726726959, 0.99628524839574, 0.9962833897027107, 0.9962767648511427, 0.9962721909671783, 0.996281240860881, 0.9962862432338329, 0.9962569616686736, 0.9962624530626292, 0.9962596024156363, 0.9962743483994054, 0.9963037242754413, 0.9963168831872186, 0.9963099481733366, 0.9962871405231404, 0.9962851630465138, 0.996316280588272, 0.9963285864481356, 0.996271029528235, 0.9962877236031702, 0.996314181414694, 0.9963134574732019, 0.9963087369558885, 0.9963222568458282, 0.9963273682699058, 0.9963176515486576, 0.9963045782060016, 0.9962728320211388, 0.9962725738971893, 0.9962607339802285, 0.9962913401372103, 0.996305478031007, 0.996315918380076, 0.9962741240306974, 0.9963089046686339, 0.9963179223709551, 0.9963150790394696, 0.9963029072623402, 0.9962927883263293, 0.9962993832386692, 0.9962768741140826, 0.996281089294913, 0.9962894027962865, 0.9963077665267995, 0.9962987170194125, 0.9962877120293258, 0.9963037576303359, 0.996292479556152, 0.9963068221067726, 0.9962842356347676, 0.9962877923585052, 0.9963091495047186, 0.9963228081039313, 0.9963034122448527, 0.9962847251250304, 0.9963370202142698, 0.9963026827539604, 0.9963161944455879, 0.9962897616232818, 0.9963186681981041, 0.9963150303170978, 0.996316372868091, 0.9962869202729326, 0.996293978393247, 0.996309048970446, 0.9962989547383304, 0.9962876336719803, 0.9962967138644411, 0.9962905919357963, 0.9963024763641609, 0.9963052047024039, 0.9963035242966131, 0.996288651628865, 0.996293689491556, 0.9963189956222069, 0.996309381365982, 0.9962988638640794, 0.996297311861104, 0.9963057178835356, 0.996311693446558, 0.9963100754301786, 0.9963183648605365, 0.9963042413556722, 0.996304503304247, 0.9963295034716467, 0.9963249749756177, 0.9963126407716558, 0.9963169106165077, 0.996319304779625, 0.9963359416432769, 0.9963063814553095, 0.9963156367920442, 0.9963101393394509, 0.9963377456669577, 0.9963332144464339, 0.9963005605969064, 0.9963310179542935, 0.996333769201895, 0.9963370907313469, 0.9963155766565228, 0.9962916267321331, 0.9962831601142716, 0.9963001185440848, 0.996307729403192, 0.9962859625428349, 0.9962948968591817, 0.9962989357745224, 0.9962895101545298, 0.9962774299384708, 0.9963090808643583, 0.9963037700851501, 0.9962897773470204, 0.9962999958003249, 0.9962908870613731, 0.9962950814767754, 0.9963044109361513, 0.9963164838079875, 0.9963167996340062, 0.9963124612534319, 0.9962881337311295, 0.9962884765653512, 0.9963098728056352, 0.9963128580789872, 0.9963139341760794, 0.9963193774634161, 0.996315900994688, 0.996314339122549, 0.9963255057674215, 0.9963404284036445, 0.9963134007451029, 0.996314431064792, 0.9963407534318971, 0.9963338735308002, 0.9963232854808706, 0.9963309362700377, 0.9963353390798125, 0.9963203065368472, 0.9963245960125651, 0.9963331307882287, 0.9963086769012556, 0.996291600531118, 0.996288217928411, 0.9963139893619922, 0.9963376384103326, 0.9963264963472802, 0.9963167986379431, 0.9963234292062515, 0.9963386520465771, 0.9963389666882745, 0.996339509616824, 0.9963206561707115, 0.9963005470082347, 0.9963265613208474, 0.9963132049679042, 0.9963245334069177, 0.9963065124233832, 0.9963076501862764, 0.9963067365100288, 0.9963177178368947, 0.9963462002205045, 0.996331783933952, 0.9963186561036557, 0.9963258387864034, 0.9963195611207202, 0.9963336508431525, 0.9963498722681984, 0.9963464948297648, 0.9963309870228529, 0.9963125452424233, 0.996298668787706, 0.9962964343221463, 0.9963271309580546, 0.9963386593801489, 0.9963196773339397, 0.9963497425635681, 0.996343813913849, 0.9963479707564997, 0.9963337757110095, 0.9963418599202809, 0.9963519685372381, 0.99635102758369, 0.996373906545462, 0.996349521296831, 0.9963607193377401, 0.9963697659066715, 0.9963513020049743, 0.9963507419076811, 0.9963503046167944, 0.9963343737768702, 0.9963436782427224, 0.9963584397596572, 0.9963395588706941, 0.9963340982629715, 0.9963528906552421, 0.9963565334530804, 0.9963487214789616, 0.9963485638543617, 0.9963714756290805, 0.9963466214788205, 0.9963404385322814, 0.9963383701553562, 0.9963526539208639, 0.9963784313062151, 0.9963615959390574, 0.9963643889412236, 0.9963583368326201, 0.9963709591646381, 0.9963781260413953, 0.9963683055025203, 0.9963833194702587, 0.9963977714886487, 0.9963763240556244, 0.9963984364441392, 0.9964194476340968, 0.99641686380756, 0.9964157963842678, 0.9964067674074064, 0.9964229410738028, 0.9964384597558579, 0.9964373967077654, 0.9964264274774052, 0.9964593823145553, 0.9964544386439982, 0.9964516888307249, 0.9964714007328104, 0.9964774696127584, 0.9964673676415685, 0.9964818522958772, 0.9964906074980519, 0.99648624531391, 0.9965025558489098, 0.9965063423445472, 0.9965171969905228, 0.9965337251753996, 0.9965232405271564, 0.9965609482442177, 0.9965518672801816, 0.9965468226700919, 0.9965898382060376, 0.9965686782206236, 0.9965740658727689, 0.996595721619472, 0.9966025858668347, 0.9966186075836457, 0.9966395225766272, 0.9966678172713795, 0.9966487928741197, 0.9966864667986303, 0.9967024164106785, 0.9967185026395159, 0.9967450906063757, 0.9967613631652064, 0.996781525847905, 0.9968244102854436, 0.996806997027505, 0.9968512232872123, 0.9968903731434026, 0.9968854362079232, 0.9969258826194384, 0.9969378812915937, 0.9969706081453288, 0.9969833673084257, 0.9970075656107446, 0.9970241888812256, 0.9970687137102949, 0.9970836010131789, 0.9971313945112529, 0.9971796179439543, 0.9971975453068627, 0.997224653075566, 0.9972408887938764, 0.9972888285970184, 0.9972909139226938, 0.9973513132215344, 0.9973627565303684, 0.9974047766203191, 0.9974257153786132, 0.9974615480645296, 0.9974946865712577, 0.997526989510611, 0.997554310569108, 0.9975767146308318, 0.9976136294917652, 0.9976455592009957, 0.9976813119263245, 0.9976964079239569, 0.9977155216151476, 0.9977311212571416, 0.9977546078596653, 0.9977810946756503, 0.9977924647811363, 0.9978036482048501, 0.9978199655968216, 0.9978158949303779, 0.9978396913294404, 0.9978577297848851, 0.9978797211490165, 0.9978862675615309, 0.9979037688982748, 0.9979171500023893, 0.9979072318907167, 0.9979297874275953, 0.997940564461336, 0.9979444004553183, 0.9979549089283256, 0.9979661874355013, 0.9979786333419998, 0.9979623688967133, 0.9979715543504816, 0.9979946583433303, 0.9979976443995778, 0.9980071588127634, 0.9980068077588271, 0.9979954172749801, 0.9980059945558567, 0.9980216548139503, 0.998013733013959, 0.9980220514483719, 0.9980186890840279, 0.9980252444607243, 0.9980298192599723, 0.9980219448699229, 0.998031674443582, 0.998034088209609, 0.9980284728963869, 0.9980399118561271, 0.9980326985584824, 0.9980496474532513, 0.998049547827637, 0.9980389030166206, 0.9980427266642908, 0.9980417146990701, 0.9980472395287507, 0.9980510225546224, 0.9980481532280211, 0.9980441296244053, 0.9980461916428487, 0.998058546446039, 0.9980649652010214, 0.9980628843314399, 0.9980635184139072, 0.9980702135965445, 0.9980872412221141, 0.998082145814232, 0.9980662649623381, 0.9980828094865242, 0.9980855768734368, 0.9980891376493557, 0.9980815390122645, 0.9980924090483814, 0.9980853056927917, 0.9980877844778219, 0.9980878173503475, 0.99808974682066, 0.9981021834254856, 0.9981034519876844, 0.9981247525737529, 0.9981171963277272, 0.9981136760906324, 0.9981102336998927, 0.9981038999276579, 0.9981064784493022, 0.9981179761156589, 0.9981067817351584, 0.9981156020335638, 0.9981067942284517, 0.9981009881995812, 0.9981105982747833, 0.9981078004772019, 0.9981219009330963, 0.9981230262249867, 0.9981201208540217, 0.998122908823602, 0.9981254800406505, 0.9981245526364966, 0.9981283033629733, 0.9981274140645021, 0.9981314108648986, 0.9981419677540986, 0.9981480613313048, 0.9981431084030037, 0.9981424857697271, 0.9981324758956879, 0.9981435280880223, 0.9981480192226464, 0.9981576496346158, 0.998160456319855, 0.9981473333117427, 0.9981345997211906, 0.9981422832575896, 0.9981369199814445, 0.9981321749931206, 0.9981345595044112, 0.998138036210126, 0.9981441995914392, 0.9981416013057355, 0.9981507391035233, 0.9981383073888213, 0.9981422826498028, 0.9981368012618188, 0.9981236006660389, 0.9981388253660054, 0.9981388214682831, 0.9981412801847386, 0.9981384915452448, 0.998143164617839, 0.9981498742842253, 0.9981350756110725, 0.9981391763217415, 0.9981500442957364, 0.998148323515523, 0.998154016010505, 0.9981378058109379, 0.9981330979545331, 0.9981453856386598, 0.9981432172304917, 0.9981378686707145, 0.9981415599156287, 0.9981317534626829, 0.998132122943729, 0.9981416784459659, 0.9981481270005975, 0.998159173876469, 0.9981563198873172, 0.9981626293483112, 0.9981702104156911, 0.9981632165527604, 0.9981655177701239, 0.9981699093666948, 0.9981469650330667, 0.9981546211264979, 0.9981579098397521, 0.9981571759502376, 0.9981455593672662, 0.998159848155204, 0.9981434341772193, 0.9981552810540435, 0.9981433799414833, 0.9981527012444984, 0.9981414030587812, 0.9981505407702601, 0.9981458160987657, 0.9981340076018752, 0.9981489629366802, 0.9981597678767574, 0.9981562329352732, 0.9981707622162862, 0.9981681359949255, 0.9981622715839595, 0.9981604271149888, 0.9981661166342368, 0.9981676796846228, 0.9981598077387596, 0.9981648444372565, 0.998164037413411, 0.998165899407106, 0.9981512836205412, 0.9981596514292663, 0.9981579290268069, 0.99816054024751, 0.9981679216432446, 0.9981631745126794, 0.9981687347468321, 0.998183001120388, 0.9981586821888294, 0.9981627964262626, 0.9981673891731444, 0.9981753696166328, 0.9981625599067456, 0.9981562849685007, 0.9981520954615188, 0.9981727825608198, 0.9981645973475819, 0.998170853870934, 0.9981770931408155, 0.9981677970195622, 0.998156578949424, 0.9981725583930563, 0.998165217854785, 0.9981776239724067, 0.9981773380564545, 0.9981686898554316, 0.9981616648348246, 0.9981589227139516, 0.998157017133188, 0.9981405310429212, 0.9981460661071159, 0.9981450883579248, 0.9981590855939311, 0.9981594873126073, 0.9981801788818686, 0.9981683925737491, 0.9981637750395801, 0.9981701467785381, 0.9981588234967886, 0.9981609235153761, 0.9981525035273695, 0.9981510803587438, 0.9981563910958341, 0.998161067291534, 0.9981581424184099, 0.9981614423660601, 0.9981699055846845, 0.9981826552790467, 0.9981718333172602, 0.998181414848731, 0.998186895039704, 0.9981773553505878, 0.9981809547519129, 0.998186284330298, 0.9981845272013838, 0.9981851219951468, 0.9981748470258988, 0.9981761812032439, 0.9981732868136776, 0.9981744970007224, 0.9981757566999631, 0.9981826951447836, 0.9981792341846121, 0.9981879584479851, 0.9981910921441011, 0.9981885126899375, 0.9981865556057565, 0.9981842482485752, 0.9981806042088173, 0.9981722467931253, 0.9981759658488627, 0.9981728395036964, 0.9981769276237829, 0.9981837921585619, 0.9981825976201842, 0.9981751281376136, 0.9981666121272667, 0.9981687588646011, 0.9981791817021664, 0.9981859922592827, 0.9981968588501706, 0.9981771003916298, 0.9981714198111732, 0.9981673448296722, 0.9981792043536538, 0.9981620459925716, 0.9981594608482458, 0.9981525751685664, 0.9981680796617843, 0.9981575740834959, 0.9981592126432546, 0.9981738634432141, 0.9981756907206607, 0.9981751662282473, 0.9981810610513325, 0.9981914471041059, 0.9981825895217834, 0.9981907595240491, 0.9981864441176517, 0.9981944206561585, 0.9981877128826856, 0.9981970441634023, 0.9981943827909768, 0.9981879757099079, 0.9981808422938779, 0.9981784772097445, 0.9981883449990808, 0.9981831655641763, 0.9981923042563046, 0.9981963820437083, 0.9981946486699932, 0.9981966526496072, 0.9981985405301881, 0.998202537475154, 0.9981837558752327, 0.9981834870792051, 0.9981971402918726, 0.9981870318377097, 0.9981838002335086, 0.9981825839671642, 0.9981901245581841, 0.9982053635039941, 0.9982016049385438, 0.9982000397632751, 0.998178032048949, 0.9981831210197661, 0.9981898960639717, 0.9981937523652938, 0.9981856725105753, 0.9982024118504073, 0.9982043750267321, 0.9981925516498894, 0.998207131260934, 0.998195683452336, 0.9981973341320495, 0.9982138241067994, 0.9982042362262823, 0.9982005633837778, 0.9981940937851309, 0.9981924815660257, 0.9981871588286787, 0.99819254378074, 0.9981857288175247, 0.9981804575741499, 0.9981984519639862, 0.9981901540252817, 0.998194032339016, 0.998198314969221, 0.9982097643437837, 0.9981951782104049, 0.9982069949498776, 0.9982069854957895, 0.9982060483042577, 0.9981958252645744, 0.9981959020784444, 0.9981927680670323, 0.9981874321319141, 0.9981974448229047, 0.9981870634085156, 0.9981905455359301, 0.9981930220653903, 0.9981932959704789, 0.9982037339676311, 0.9981962240608332, 0.9982066885572536, 0.9982022411923419, 0.9981953385717169, 0.9981984300516221, 0.9981905998390109, 0.9981931343269584, 0.9981921704174753, 0.998189508311101, 0.9982044400389988, 0.9981994121383697, 0.9982005639465914, 0.9982047077320004, 0.9981983644758362, 0.9981939203053047, 0.9981978027718527, 0.9981966960222173, 0.9981926664503302, 0.9981909234930568, 0.9981848687041391, 0.9981922397623048, 0.9981910126978538, 0.9981938503742314, 0.9981919852336643, 0.9981968951146478, 0.9982132777643606, 0.9982071785086577, 0.9982024481471738, 0.9982072120264837, 0.9982004589130993, 0.9982118534655054, 0.9982096016230607, 0.9982057673932598, 0.9982211061835967, 0.998219835629201, 0.9982072509978421, 0.9982063412647688, 0.9982046405015331, 0.9981944879337978, 0.9981905715859221, 0.9982104790703172, 0.998201204269063, 0.9981981023450849, 0.9981965758004605, 0.9981963610826793, 0.9982040515634797, 0.9982100093171214, 0.9982120909550862, 0.9982174676939908, 0.9982199855277359, 0.9982021905995628, 0.9982082661040341, 0.9982090430207196, 0.9982071281207233, 0.9982125239089551, 0.9982193512107285, 0.9981945241107684, 0.9982035138826257, 0.9982015862606847, 0.998196021851928, 0.9981922281069316, 0.9981944612006275, 0.9981942835252187, 0.9981872123528658, 0.9981882720170917, 0.9981781331469265, 0.9981861476309893, 0.9982015164314209, 0.9982088173367852, 0.9982049190163267, 0.99819448875148, 0.9981897980140324, 0.9982012926880234, 0.9981934489214069, 0.9981989451661846, 0.9982004826666635, 0.9981982937730328, 0.9982172591929883, 0.9982148318080818, 0.9982063948050807, 0.9982037260475766, 0.9981939416665856, 0.9981993883057213, 0.9981996702638883, 0.9981810516800342, 0.998192783452122, 0.9981959568882076, 0.9981893967897392, 0.9981956819870111, 0.998211995233942, 0.9982081419710858, 0.9981968824678096, 0.9982078713373047, 0.9982098272509561, 0.9982079831995674, 0.9982051328005226, 0.9982055718098118, 0.9982010471978161, 0.998206993472456, 0.998200686249579, 0.998207679769837, 0.9982017583293732, 0.9982098076830461, 0.9982104707371886, 0.9982146515724106, 0.998218506510693, 0.9982096009688205, 0.9982091263468194, 0.9982050725929269, 0.9982177474713058, 0.9982319773693566, 0.9982156492880674, 0.9982153191249595, 0.9982022934742845], 'MSE': [731376.08233576361, 790.87265019894994, 77.356970371674095, 40.067221564157059, 36.655912244017209, 35.17451979102853, 33.510787886989682, 31.300831904070687, 28.401898632939719, 24.980806656160009, 21.510595580790138, 18.344351123383351, 16.221775230344612, 14.929288470780577, 14.179318610904282, 13.643579784749774, 13.229613188488861, 13.006899373343913, 12.75473003030813, 12.573889173647697, 12.553391117980523, 12.631895806686344, 12.573096008126718, 12.406148752675579, 12.395000590149136, 12.410857297711937, 12.371337693813107, 12.304163565008079, 12.248060841443692, 12.274147804745779, 12.241256170001918, 12.227101505193458, 12.279458302163373, 12.145228685071853, 12.128173045066033, 12.181145046561859, 12.236742539347045, 12.125656250843599, 12.152956923090416, 12.061427932628096, 12.081244023184849, 12.05196316887641, 11.923700525459042, 11.931789413756306, 11.815664894223577, 11.741242880428461, 11.566159334889502, 11.399199310945198, 11.235412944655772, 11.126253938112526, 10.80207268598812, 10.427545560873128, 10.162958199815295, 9.7487644059346312, 9.2781515911655603, 8.7851545897497214, 8.2317872435364059, 7.8354585906184839, 7.2004326824524068, 6.6444387167833714, 6.0888427362617374, 5.5627231204019658, 5.0429155763345461, 4.6172180270960048, 4.2813044332930286, 3.9315519135976449, 3.6953080645410146, 3.4278270324532247, 3.2417610425776475, 3.0495678168364537, 2.9114360360857976, 2.7766674992745575, 2.679482686147002, 2.5700113295737381, 2.4953407548720343, 2.446867703429521, 2.3791895243794388, 2.3532514258485731, 2.3181283370867871, 2.2891586496675451, 2.2865003956203047, 2.2543580837410016, 2.2493997859831882, 2.2287376183199394, 2.2186639709906624, 2.2104307488975863, 2.2018761220002925, 2.194794886126219, 2.1842915545396648, 2.1930199889554385, 2.1803128335604356, 2.1757520678457025, 2.1674588643551171, 2.1652568779071291, 2.1707755650132716, 2.1501608225582856, 2.1514170357618729, 2.1616254596111335, 2.146218278870315, 2.1552764715255051, 2.1593254229883097, 2.1545971671159125, 2.1501985501266678, 2.1643582094617826, 2.1437103229799548, 2.121885968457224, 2.136991543059573, 2.1227824195390128, 2.1094362032036797, 2.1284766172209388, 2.1207602551340639, 2.1227537579054272, 2.1365942617656839, 2.1369342134114886, 2.1319207082531459, 2.1059378314913024, 2.1281971350749158, 2.1167827448918879, 2.120242143288217, 2.1341801436850654, 2.1341256507389739, 2.1301839280964519, 2.1396700816421985, 2.1333903621085302, 2.1355748726680126, 2.1639122581146033, 2.1414230978245659, 2.1478725372091376, 2.1376262347765524, 2.1215613668455195, 2.1127283548051681, 2.1215309298162732, 2.1166021602614431, 2.1200102540941042, 2.1165006120332963, 2.1142771558456972, 2.1195686579213024, 2.1232365504125488, 2.1200431016267021, 2.1278771458928705, 2.1266059476113823, 2.1317980930520664, 2.1222446247002122, 2.1305343545383528, 2.1245257581090042, 2.1333786134748802, 2.1210737000684143, 2.1327338368560627, 2.1159419994452646, 2.1257109853814731, 2.1369045697839657, 2.1222679435098879, 2.126470427264842, 2.1305528108390543, 2.1222256353594697, 2.123753725843696, 2.1195600816692406, 2.1295547772029777, 2.1400037178041753, 2.1229879311448454, 2.125988214670643, 2.1220715095960103, 2.1313667372394005, 2.1293647915495608, 2.1148274174525286, 2.1175745575637412, 2.1304797586351598, 2.1226683347512414, 2.1349600733165568, 2.1276336398943991, 2.1224819531101069, 2.1328822765464821, 2.1310049986640194, 2.1450302920455964, 2.1334948610881468, 2.1262717383529925, 2.1208716773502796, 2.1447375640392004, 2.1277787486501034, 2.1227939913899689, 2.1160439222764542, 2.1416858028772063, 2.1248657835098457, 2.1212130886801206, 2.1204097563410387, 2.1286684981524284, 2.1401491611749024, 2.1240049216968564, 2.1128394455699118, 2.1169699743472128, 2.117310807164583, 2.1036515916380791, 2.1117593187742925, 2.1091564463032135, 2.0903885792363699, 2.1083181192216398, 2.1237031913564843, 2.127375807850163, 2.1164968988124615, 2.1132818164663294, 2.1208836956520285, 2.1255340630812598, 2.108085023261947, 2.1223716398044843, 2.1367672519392369, 2.1196465460490512, 2.1228661919418341, 2.1231035731087982, 2.1163269688011446, 2.111196524632343, 2.1179670499967864, 2.1195771624835378, 2.131412529729519, 2.114712253816613, 2.129967972560519, 2.1377240828233766, 2.1194917120644727, 2.1160334185553475, 2.1236751823664237, 2.1139808188497811, 2.1159704367214771, 2.1259747598484355, 2.1207857314689389, 2.1083476289760283, 2.1177915188003942, 2.1097704899042786, 2.1182817855338789, 2.1310911186373906, 2.1299180454743736, 2.1151232649468605, 2.1177000396244634, 2.1190730381209013, 2.1198732148530746, 2.1212064826831689, 2.1126420792514966, 2.123461938867047, 2.1136926331639425, 2.1149599198089732, 2.139081751720084, 2.138780255462164, 2.1129277192959788, 2.1183000063354189, 2.1160784622785322, 2.1258707949417461, 2.1148137957235202, 2.1098063513798442, 2.1177562861916126, 2.114623898666625, 2.1137596580998728, 2.1114642132775989, 2.1188249795840046, 2.1131904065662601, 2.1208123087650805, 2.1313979241015577, 2.1307010034562284, 2.1186135837395521, 2.1151212726988544, 2.1239369862282338, 2.1308504084505695, 2.1137722784327471, 2.1103652432139954, 2.1043906576134317, 2.1058264134152105, 2.1110906813765138, 2.1254175932882466, 2.1338909293340049, 2.1251112575195208, 2.1197907718680451, 2.1290320634256257, 2.130097334398465, 2.1338942292937775, 2.1365156550718587, 2.1313288980781064, 2.1284618928130379, 2.145244008478576, 2.1420967310695405, 2.1437305196766578, 2.1352791679859595, 2.1184430000171361, 2.1109012453918043, 2.1148759033198945, 2.127947630243332, 2.1290809795466497, 2.1112466123544404, 2.1041937665632173, 2.1371813094718211, 2.127613450138897, 2.1124497097160941, 2.1128646216167617, 2.1155700872270935, 2.1078214455298498, 2.10489193989658, 2.1104608751290534, 2.1179535876051214, 2.1361482484235297, 2.1362961867579364, 2.1430819871352371, 2.1255407094148708, 2.1174378717532591, 2.1114542043942293, 2.135407760210748, 2.1154739661804176, 2.1103056590025893, 2.1119352548798922, 2.1189112539608415, 2.1247107101587321, 2.120930974304811, 2.1338316075286987, 2.1314157649375929, 2.1266510557808811, 2.1161262683304098, 2.121312803915429, 2.1276200834453656, 2.1184238833580915, 2.1248876753176043, 2.1166675428846222, 2.1296125061610223, 2.1275740444589673, 2.1153336435073946, 2.1075055034961121, 2.1186218338124125, 2.1293319650710676, 2.0993601301783125, 2.1190399262355979, 2.111295983229271, 2.1264454016054577, 2.1098782037960477, 2.1119631790865827, 2.1111937241093037, 2.1280738620359907, 2.1240286482349964, 2.1153912626196947, 2.1211765602975352, 2.1276649923165043, 2.1224608702241921, 2.1259695253816218, 2.1191582142256311, 2.117594524316289, 2.1185576136932878, 2.1270815716526572, 2.124194226187182, 2.1096905475305858, 2.1152007570814275, 2.1212286429707787, 2.1221181409639498, 2.1173004053010418, 2.1138756365339657, 2.1148029687268153, 2.110052055368473, 2.1181466463149046, 2.1179965159766447, 2.1036681937480712, 2.1062636063818561, 2.1133326969992368, 2.1108855248692922, 2.1095133604327678, 2.099978290548413, 2.1169200930396879, 2.1116155906758736, 2.1147663404661596, 2.0989443521674418, 2.1015413262882414, 2.1202561960950299, 2.1028001997452646, 2.1012233798170157, 2.0993197147927822, 2.1116500560901295, 2.1253764535385953, 2.1302289182027851, 2.1205095494093453, 2.116147544948356, 2.128622764978501, 2.1235022487250235, 2.1211874290067985, 2.1265895256527743, 2.1335130484242826, 2.1153729832920041, 2.118416745142182, 2.1264363898740446, 2.1205798974240464, 2.125800380339653, 2.1233964390186664, 2.1180494548157767, 2.1111301412316221, 2.1109491321651377, 2.1134355841086281, 2.127378393890619, 2.1271819056382926, 2.1149190987391213, 2.1132081518545252, 2.1125914093487785, 2.109471703240513, 2.1114641684651385, 2.1123593227627553, 2.1059593941787753, 2.0974067978347657, 2.1128971341383598, 2.1123066279922167, 2.0972205147005925, 2.1011635858905544, 2.1072319049037422, 2.1028470153653047, 2.1003236371752356, 2.1089392242662286, 2.1064808011167218, 2.1015892732360646, 2.1156045062819056, 2.1253914701015382, 2.1273301379824829, 2.1125597806989029, 2.099005824055189, 2.1053916640839612, 2.1109497030378486, 2.1071495317124813, 2.0984248796758531, 2.0982445493782507, 2.0979333812536813, 2.1087388389412398, 2.1202639841575968, 2.1053544258449728, 2.1130093397385576, 2.1065166822319794, 2.1168450314318412, 2.1161929464640572, 2.1167166008652147, 2.1104228834145347, 2.0940988019124918, 2.1023611945501068, 2.1098851354758237, 2.1057685313255807, 2.1093664439040887, 2.1012912146508578, 2.0919942447006612, 2.0939299527865685, 2.1028179274524228, 2.1133874475776642, 2.1213404469076589, 2.122621084034416, 2.1050279502127505, 2.0984206765928319, 2.1092998387318036, 2.0920685821924048, 2.0954664635824969, 2.0930840562969326, 2.1012196492544031, 2.096586354062723, 2.0907928120143366, 2.0913320998288447, 2.078219502169623, 2.0921953965876021, 2.08577747402297, 2.0805926225521523, 2.0911748210183818, 2.0914958290488235, 2.091746453159903, 2.1008768803349573, 2.0955442206465786, 2.0870839664473286, 2.0979051524298131, 2.1010347853544031, 2.0902643193973298, 2.088176526127552, 2.0926537954444262, 2.0927441346818392, 2.0796127309695791, 2.0938573665334004, 2.0974009928186552, 2.0985864397239093, 2.0903999987469351, 2.0756262303310709, 2.0852750683414039, 2.083674317659133, 2.0871429569225137, 2.0799087317455656, 2.0758011864676615, 2.0814296225980917, 2.0728246815092777, 2.0645418099174364, 2.0768339568633523, 2.0641607046079109, 2.0521185812370617, 2.0535994472892942, 2.0542112185883252, 2.0593859875327047, 2.0501163894519863, 2.0412221819255842, 2.0418314456704594, 2.0481182302622867, 2.0292308557048164, 2.0320642169220395, 2.0336402147951382, 2.022342751050012, 2.0188644996418685, 2.0246542328080142, 2.0163526566231162, 2.0113347959052246, 2.0138348903648624, 2.0044868489112724, 2.0023166982582534, 1.9960955853061064, 1.986622802384987, 1.9926318588877254, 1.9710204707749621, 1.9762250350794768, 1.9791162476752453, 1.954462794359886, 1.966590196729519, 1.96350237676577, 1.9510908391988062, 1.947156739618652, 1.9379742282597379, 1.9259872381705931, 1.9097707266053425, 1.9206741613617877, 1.8990821407416301, 1.8899409547169581, 1.88072146964151, 1.865483133414408, 1.8561568572066813, 1.8446010379963753, 1.8200227209867186, 1.8300027649922179, 1.8046554107157167, 1.782217490771947, 1.7850469919203689, 1.7618659784530257, 1.7549891908617214, 1.7362324802226035, 1.7289198331792295, 1.7150510831238659, 1.7055238038806328, 1.6800053308288869, 1.6714729850478929, 1.644081142829994, 1.616442892586845, 1.6061682000876016, 1.5906319503229991, 1.5813267884877136, 1.5538510945848805, 1.5526559338585633, 1.5180393410041033, 1.5114808482662665, 1.4873979139698208, 1.4753973032895504, 1.4548605499984408, 1.4358679090699169, 1.4173541560784035, 1.4016956637366662, 1.3888552450917104, 1.3676982658594681, 1.3493984218941875, 1.3289074963387895, 1.32025554153466, 1.3093009298322096, 1.3003603218128206, 1.2868994675860088, 1.2717191038637916, 1.2652025660914499, 1.2587930210660734, 1.249441049682807, 1.2517740668805688, 1.2381356592573323, 1.2277972963982131, 1.2151934067328718, 1.2114414675379344, 1.201410943010272, 1.1937418435013896, 1.1994262014367627, 1.1864989679799236, 1.1803223368543929, 1.1781238172618327, 1.1721011060947004, 1.1656370659750235, 1.1585039553887393, 1.16782558148861, 1.162561131082966, 1.1493195615762495, 1.1476081659914332, 1.142155179387033, 1.1423563785965472, 1.1488845957996685, 1.1428224488436676, 1.1338470999765518, 1.1383873136915781, 1.1336197772667287, 1.1355468459539129, 1.1317897691258707, 1.1291678187721372, 1.1336808604721311, 1.1281045591495942, 1.1267211597159972, 1.1299394588567886, 1.1233834587109921, 1.1275176091480918, 1.1178037051656018, 1.1178608034994297, 1.123961653940418, 1.1217702103779945, 1.122350197045076, 1.1191837566506426, 1.1170155946210678, 1.1186600890544964, 1.1209661331783507, 1.1197843305037183, 1.1127034338700907, 1.1090246589153525, 1.1102172657248868, 1.1098538546418015, 1.1060166509674532, 1.0962576240757995, 1.0991779503621317, 1.1082797279447774, 1.0987975804908239, 1.0972115106545288, 1.0951707265296424, 1.0995257261982581, 1.0932957927090301, 1.097366932160448, 1.0959462684472876, 1.0959274282478737, 1.094821592757832, 1.0876938132304912, 1.0869667633807896, 1.0747587786914081, 1.0790894828087969, 1.0811070329559722, 1.0830799670954396, 1.0867100359686013, 1.0852322103043961, 1.0786425636911936, 1.0850583883693363, 1.0800032191105189, 1.0850512280999987, 1.0883788319194412, 1.0828710186341521, 1.0844745177082242, 1.0763931367960857, 1.075748199322305, 1.0774133518276678, 1.0758154854665531, 1.0743418462784202, 1.0748733685414387, 1.0727237182335314, 1.0732334010227649, 1.0709427186025591, 1.0648922587088232, 1.0613998525844914, 1.0642385196838184, 1.0645953689030137, 1.0703323185165721, 1.0639979860071349, 1.0614239862799859, 1.0559045174025827, 1.0542959245537007, 1.0618171017456295, 1.0691150924206627, 1.0647114344923074, 1.06778528386219, 1.0705047745195047, 1.0691381418253059, 1.0671455407767307, 1.0636131278907621, 1.065102280911604, 1.059865143532928, 1.0669901203883143, 1.0647117828326267, 1.0678533255285971, 1.0754189704669466, 1.0666932526160873, 1.0666954865139262, 1.0652863246839868, 1.066884574991936, 1.0642063013285419, 1.0603607965968509, 1.0688423461040364, 1.0664921096879312, 1.0602633580607268, 1.0612495871922545, 1.0579870529427007, 1.0672775892448321, 1.0699757985206189, 1.0629333697722081, 1.0641761474888245, 1.0672415624806979, 1.0651260027842515, 1.0707463658594563, 1.0705346055379392, 1.0650580696045184, 1.061362215605083, 1.0550309301150655, 1.05666663421055, 1.0530504988157015, 1.0487055688591538, 1.052713954886767, 1.051395060362029, 1.048878108784786, 1.0620281729538961, 1.0576402433876115, 1.0557553862796831, 1.0561759996810316, 1.0628338008608316, 1.0546444813832516, 1.0640518090166244, 1.0572620197393707, 1.0640828930925275, 1.0587405835369315, 1.0652159020005152, 1.0599788140879178, 1.0626866605799821, 1.0694544532022361, 1.0608831163509027, 1.0546904912932045, 1.0567164689530508, 1.0483893159074775, 1.049894479664867, 1.053255543959295, 1.0543126627109918, 1.0510518339409496, 1.0501560043558091, 1.0546676452217001, 1.0517809669896079, 1.0522434958007152, 1.05117633312042, 1.0595530650109124, 1.0547572307333484, 1.0557443896211698, 1.0542478231764147, 1.0500173308404277, 1.0527380492785019, 1.0495513175525903, 1.0413748444084427, 1.055312730585567, 1.0529547415879505, 1.050322504923894, 1.0457486809170367, 1.0530902977943462, 1.0566866471987508, 1.0590877753614174, 1.0472313977612844, 1.0519225812604041, 1.0483367859661104, 1.0447608791369873, 1.0500887562933359, 1.0565181581910559, 1.0473598748189361, 1.0515669505556886, 1.0444566441305911, 1.0446205108691122, 1.0495770461183349, 1.0536032895154634, 1.0551748786504838, 1.0562670223459691, 1.0657156796231566, 1.0625433735314602, 1.0631037499978553, 1.0550815274022838, 1.0548512907584717, 1.0429923512941299, 1.0497474268870741, 1.0523938698655013, 1.0487420411602395, 1.0552317428889679, 1.0540281612278184, 1.0588539009674987, 1.0596695602520712, 1.0566258225408343, 1.053945758934864, 1.0556220886941274, 1.0537307928274715, 1.0488802763647627, 1.0415730561283532, 1.0477754368221444, 1.0422839827786348, 1.0391431261243018, 1.0446105990989103, 1.0425476776315259, 1.0394931414269208, 1.0405002030548063, 1.0401593094696664, 1.0460481928487084, 1.0452835370524149, 1.0469423957991459, 1.0462488024461005, 1.0455268322151114, 1.0415502079163517, 1.043533784736683, 1.0385336559448533, 1.0367376436622666, 1.0382160037803825, 1.0393376655806863, 1.0406600790134357, 1.0427485840634332, 1.0475384617917742, 1.0454069629046452, 1.0471987621444048, 1.0448557417569464, 1.0409214774501911, 1.0416061020975116, 1.0458870795582851, 1.050767852490756, 1.0495374949584824, 1.0435638639510143, 1.0396605358109057, 1.0334325768824901, 1.0447567234846749, 1.0480124291735831, 1.0503479194560701, 1.0435508817254804, 1.0533848369374523, 1.0548664582528322, 1.058812841316308, 1.0499267658246576, 1.0559478179443254, 1.0550087117440083, 1.0466119126598463, 1.0455646468700948, 1.0458652487094877, 1.0424867543460339, 1.03653420577139, 1.0416107435263191, 1.0369282778771896, 1.0394015626525053, 1.0348299767039735, 1.0386743965520704, 1.0333263684858511, 1.0348516783396244, 1.0385237626354049, 1.0426121305984859, 1.043967629024525, 1.0383121122820067, 1.0412805968960246, 1.0360429469448487, 1.0337058485179944, 1.0346992953511738, 1.0335507564158326, 1.0324687572091964, 1.030177991932107, 1.0409422724802395, 1.0410963272925355, 1.033271274466848, 1.0390647232130492, 1.0409168494636247, 1.0416139270399027, 1.0372921952610699, 1.0285583127034985, 1.0307124557549658, 1.0316095031720793, 1.0442227636090555, 1.0413061265915593, 1.0374231519323642, 1.0352129936133661, 1.0398437930842688, 1.0302499911240013, 1.0291248377390581, 1.0359011584941795, 1.0275451598453413, 1.0341062315285394, 1.0331601790301062, 1.0237092954427796, 1.0292043883092494, 1.0313094010500292, 1.0350173159860088, 1.0359413255925316, 1.0389919409995048, 1.0359056685323582, 1.0398115219358082, 1.0428326246513158, 1.0325195170725221, 1.03727530681142, 1.0350525325394906, 1.0325980327523365, 1.0260360635691677, 1.0343958003573033, 1.0276232836717498, 1.0276287020843162, 1.0281658337779813, 1.0340249548148921, 1.0339809305543932, 1.0357771235423736, 1.0388353029754025, 1.0330967388851915, 1.0390466290670672, 1.0370509206848555, 1.0356315497043762, 1.0354745667407204, 1.029492247333609, 1.0337963930933556, 1.0277988861857439, 1.0303478002191546, 1.0343038926306187, 1.0325320756848959, 1.0370197980116524, 1.0355672093382988, 1.0361196538660513, 1.0376453843673603, 1.0290875773203454, 1.031969213238805, 1.0313090784852077, 1.0289341546842459, 1.032569659072889, 1.035116742314194, 1.0328915879441931, 1.0335258983129851, 1.0358353630264594, 1.0368343024752888, 1.0403044779045956, 1.0360799103297889, 1.0367831766146491, 1.0351568218439546, 1.0362257880880501, 1.0334117926570532, 1.0240224201664936, 1.0275180808022562, 1.030229188392604, 1.0274988707624368, 1.0313692762309374, 1.0248387272183974, 1.0261293235428164, 1.0283268320317234, 1.0195357256751105, 1.020263917310817, 1.0274765351446959, 1.0279979295981305, 1.0289726864181914, 1.034791417934388, 1.0370359906776669, 1.0256264330289657, 1.0309420910744467, 1.0327198938217794, 1.0335948008943794, 1.0337178618926861, 1.0293102239261067, 1.0258956622325117, 1.0247026150401781, 1.0216210497718168, 1.0201780061056456, 1.0303767964106523, 1.026894748295732, 1.0264494747727699, 1.027546959591255, 1.024454476599995, 1.020541551610489, 1.0347706838615489, 1.0296183844439428, 1.0307231605786262, 1.0339122848913644, 1.0360865903627035, 1.034806739490949, 1.0349085704294403, 1.0389612647329043, 1.0383539403802202, 1.0441648214210546, 1.0395714877720512, 1.0307631817583527, 1.026578820791979, 1.0288130614986959, 1.0347909492969567, 1.0374793472010682, 1.0308914155995486, 1.0353869061204466, 1.0322368485643667, 1.0313556623732092, 1.0326101809035662, 1.021740547753601, 1.0231317525626153, 1.0279672440899617, 1.029496786546934, 1.0351044995435543, 1.0319828724219928, 1.0318212740051467, 1.042492125309308, 1.0357683059004974, 1.0339495174868161, 1.0377093004996598, 1.0341070713488003, 1.0247574756088351, 1.0269658924947032, 1.0334190409274848, 1.0271210005769114, 1.0260000096411237, 1.0270568890644309, 1.0286905355653166, 1.0284389265877896, 1.0310321131691877, 1.0276241304249689, 1.0312389830899407, 1.0272307934579996, 1.030624543014407, 1.0260112245788258, 1.0256312089870914, 1.0232350508619037, 1.0210256737405687, 1.0261296985068757, 1.026401718164212, 1.0287250422875398, 1.0214607012646617, 1.0133051332921355, 1.022663231033899, 1.0228524571026842, 1.0303178359190206], 'Rp': [0.022067520736128395, 0.15958169091611438, 0.93012846814255246, 0.96462498618581904, 0.96757056336650815, 0.96892230852715933, 0.97034575911748977, 0.97237559982636268, 0.97492364868452441, 0.97796969037744896, 0.98105698972708755, 0.98386982381049892, 0.98574703063574209, 0.98689295061034299, 0.98755472976219816, 0.9880313736530224, 0.98839262782090864, 0.98859327107425876, 0.98881106733219193, 0.9889698219950378, 0.98898819064513377, 0.98891891862484038, 0.98897702289028844, 0.98912915447959981, 0.98913305610592028, 0.98912106186682069, 0.98915409673114751, 0.98921714570529717, 0.98925719267419532, 0.98923792286873891, 0.98926331281425817, 0.98928512364107557, 0.98923192372313185, 0.98934775706047196, 0.98936370192416989, 0.98931749333424446, 0.9892681750677087, 0.98936562292872865, 0.98934176358618009, 0.98942462295878719, 0.98940692449256595, 0.9894317907336122, 0.9895461594207825, 0.98953819814580846, 0.98963912980119939, 0.98970432184005663, 0.98985840549699755, 0.99001276195210464, 0.99015063163689787, 0.99024960739436796, 0.99053200478153902, 0.99086141292182472, 0.9910943350633864, 0.99145935652062633, 0.99187900786776606, 0.99231131695657027, 0.99279261593155477, 0.99314685185819418, 0.99370198337294768, 0.99418701063193915, 0.99467493545741847, 0.99513656061281952, 0.99559143416106621, 0.995964669472999, 0.99625821359783784, 0.99656455897685903, 0.99677225008573256, 0.99700630686276848, 0.99716814549215094, 0.99733735185452566, 0.99745705359671144, 0.99757598515103596, 0.99765996894844844, 0.99775603433841975, 0.99782188354755019, 0.99786381017698411, 0.99792224568811094, 0.9979470229895766, 0.9979756495874581, 0.99800126284110646, 0.99800328749662048, 0.9980319196504126, 0.99803693814566419, 0.99805443784382852, 0.99806371528633553, 0.99807120462973076, 0.99807728688821995, 0.99808361144328539, 0.99809342304818693, 0.99808517298832211, 0.99809650725318699, 0.99810031877227345, 0.99810824096260475, 0.99810923992275402, 0.99810457274613096, 0.99812245455157433, 0.99812138944709561, 0.99811323930100659, 0.99812727286917136, 0.99811849732371682, 0.99811488719000108, 0.99811940134379118, 0.99812244110650461, 0.99811040495207071, 0.99812846510245368, 0.99814859076211393, 0.99813433557221998, 0.998147411270216, 0.99815823010267213, 0.99814162913706328, 0.99814819003392452, 0.99814768144692745, 0.9981351618425619, 0.9981341800668182, 0.99813854179842387, 0.99816146835103881, 0.99814188052971342, 0.99815180518475066, 0.99814859880117834, 0.99813649174437713, 0.99813741656796506, 0.99814108382310351, 0.99813325035088662, 0.99813838394580767, 0.9981352164685291, 0.99811086758435286, 0.99813023427964265, 0.99812443137278928, 0.99813403893455888, 0.99814784561434899, 0.99815556615639445, 0.99814841691982059, 0.99815196558029029, 0.99814925391223597, 0.99815208120866972, 0.99815380106682683, 0.99814967508607355, 0.99814600342923465, 0.99814910501293885, 0.99814275967809185, 0.99814302764567142, 0.99813916640016276, 0.99814706689371036, 0.99814013431318727, 0.99814505406635112, 0.99813712658902054, 0.99814825902340898, 0.99813826415510842, 0.99815258609483459, 0.99814487362575532, 0.99813423561088521, 0.99814692218930423, 0.99814418594061205, 0.99814023916854011, 0.99814690011321194, 0.99814658241577991, 0.99814991750168824, 0.99814044942100566, 0.99813262184500251, 0.99814719884662639, 0.99814422892827137, 0.99814741276930363, 0.99813910681870632, 0.99814151824374109, 0.99815396854424732, 0.99815176604317124, 0.99813971604822305, 0.99814647692315772, 0.99813644780514033, 0.99814327103761613, 0.99814815241191335, 0.99813795810556005, 0.99813942662366484, 0.99812699988067188, 0.99813767272450804, 0.99814363019153951, 0.99814895390309399, 0.9981283149207365, 0.99814252179963903, 0.99814715598827553, 0.99815248090343089, 0.99813169356123665, 0.99814495831049244, 0.99814816177040788, 0.99814937466628262, 0.99814139587679274, 0.99813228195723891, 0.99814564998736288, 0.99815556596828547, 0.99815198959577978, 0.99815170568682177, 0.99816396054060363, 0.99815608757716701, 0.99815915969205238, 0.99817559411661549, 0.99816015659625079, 0.99814653403258491, 0.99814456058842349, 0.99815235111902056, 0.99815486670227138, 0.99814864161727757, 0.99814439549214251, 0.99815927420535999, 0.99814694184662422, 0.99813453218384607, 0.99814925633342355, 0.99814651752914008, 0.99814636007353597, 0.99815222317293872, 0.99815678758602022, 0.9981512544923854, 0.99814979659746639, 0.99813910733221833, 0.99815355660380278, 0.99814093836689666, 0.99813340414242357, 0.99814965125045829, 0.99815261763122964, 0.99814616952326829, 0.99815437902613979, 0.99815272651842124, 0.99814358935570746, 0.99814838222368585, 0.99815928703292678, 0.99815092481726519, 0.99815773949873654, 0.99815097831154265, 0.99813920520706112, 0.99814051809619464, 0.99815305847115388, 0.99815093288224099, 0.99814964743572032, 0.99814933420360319, 0.99814928915535184, 0.99815540086607413, 0.99814606108810378, 0.99815494325388743, 0.99815344138051321, 0.99813375655282544, 0.99813520619355367, 0.99815538900708023, 0.99815046388374906, 0.9981527216189926, 0.99814563991292815, 0.9981544892664781, 0.99815783133581892, 0.99815121492652936, 0.99815351618845671, 0.99815446683003861, 0.99815737389874626, 0.9981499529612905, 0.9981555235381927, 0.99814822484821153, 0.99813946590188363, 0.99813957648250573, 0.99815079110642091, 0.99815327879867011, 0.99814595371919501, 0.99813955378715191, 0.99815491159489722, 0.99815780073478622, 0.99816250171038423, 0.99816173332628289, 0.99815732220859976, 0.99814461026506984, 0.99813691950322436, 0.99814475831145189, 0.99814938294745337, 0.99814098321279643, 0.99814012889943793, 0.99813742218004686, 0.99813481679098048, 0.99813985169066233, 0.99814150419032976, 0.99812692711401729, 0.99812984856559805, 0.99812851763986676, 0.99813600911244715, 0.99815099476748093, 0.99815757490859691, 0.99815337360805634, 0.9981422042521757, 0.9981415442116629, 0.99815789192611948, 0.9981638298315344, 0.99813379755773746, 0.99814339007187969, 0.99815658592922352, 0.99815514838677144, 0.99815267541455188, 0.99816058776235694, 0.99816221473226419, 0.99815733485013014, 0.99815091602153738, 0.99813490632554636, 0.99813459552369066, 0.99812945248169993, 0.99814396827335772, 0.99815114208205069, 0.99815628920227339, 0.99813559370802774, 0.99815310868405138, 0.9981576621779219, 0.99815606953880531, 0.99815044202342096, 0.99814473446341057, 0.99814804434743054, 0.99813706404808811, 0.99813897205782509, 0.99814364183288706, 0.99815281021195112, 0.99814870553581014, 0.99814259683560747, 0.99815022818901278, 0.99814471344830225, 0.99815210675511379, 0.99814126743927656, 0.99814234266008062, 0.99815403637178657, 0.99815972346869364, 0.99815089627948639, 0.99814102745096833, 0.99816716843519715, 0.9981505979049351, 0.99815674934952148, 0.99814458424110031, 0.99815787512227472, 0.99815601135273835, 0.99815723413732316, 0.99814195144617257, 0.99814600146302923, 0.99815285652233254, 0.99814794589917355, 0.99814209749447103, 0.99814750793087637, 0.99814389032480577, 0.99815022188043789, 0.99815112623051649, 0.99815026112104011, 0.99814297990435252, 0.99814512507131892, 0.99815804406311481, 0.99815306109628466, 0.99814839952158507, 0.99814770079822535, 0.99815130579284583, 0.99815486932819053, 0.99815450884993151, 0.9981584700909808, 0.99815137130912235, 0.99815111333215301, 0.99816323562106934, 0.99816085393793597, 0.99815506007748012, 0.99815684209632383, 0.99815882847127124, 0.99816668351511251, 0.99815255494710309, 0.99815764780297489, 0.99815473459304793, 0.99816731276004822, 0.99816564682133035, 0.99814896078290338, 0.99816460902255111, 0.99816520944925913, 0.99816721131543551, 0.99815637316335692, 0.99814424196945806, 0.99814020000286507, 0.99814876907759875, 0.99815280301969278, 0.99814198382651176, 0.99814644086269044, 0.99814923009965328, 0.99814315523716479, 0.99813767674642251, 0.9981539024879923, 0.99815032909188628, 0.99814366057216541, 0.9981496894284746, 0.99814471567479679, 0.99814589012098698, 0.99815056368552602, 0.99815678611230363, 0.99815696038318014, 0.99815494660115711, 0.99814342991185245, 0.99814290324695421, 0.99815346253009662, 0.99815519710333978, 0.998155553996244, 0.99815844273845356, 0.99815682975921671, 0.99815596786291139, 0.99816126653610959, 0.99816985946599601, 0.99815629804018025, 0.99815570048552249, 0.99816974581807316, 0.99816531300083999, 0.99816097462645159, 0.99816398109923365, 0.99816647800768366, 0.99815867202049657, 0.9981607161015098, 0.99816500694854171, 0.99815275957639515, 0.99814454952034282, 0.9981426981543472, 0.99815550575859568, 0.99816726046710169, 0.99816240650620058, 0.9981568599621905, 0.99816021496490692, 0.99816814583050906, 0.99816782920508496, 0.99816928730326959, 0.99815869310849936, 0.99814914065808202, 0.99816170530969162, 0.99815515095269447, 0.99816107392119402, 0.99815166424778323, 0.9981525156727904, 0.99815241049650871, 0.99815726230541224, 0.99817177434469539, 0.9981653139140364, 0.99815843606595001, 0.9981612894929579, 0.99815839289449315, 0.99816542664442898, 0.9981738309210062, 0.99817260296663368, 0.99816432096543706, 0.99815495914548757, 0.99814767935763038, 0.99814715157407186, 0.99816275726550086, 0.99816800067226841, 0.9981582176918643, 0.9981733115318614, 0.99817026642720552, 0.99817231934543593, 0.9981667662613416, 0.99816979891383484, 0.99817443313483678, 0.99817567154320364, 0.99818561767114544, 0.99817328797775517, 0.99817886156025981, 0.99818335555575821, 0.99817428831542976, 0.99817395915522977, 0.99817456806793103, 0.99816625140783255, 0.99817043563382646, 0.99817788939309993, 0.99816832464675631, 0.998165509484359, 0.99817487966536866, 0.99817676270675304, 0.99817314845992111, 0.99817321991778973, 0.99818419452537133, 0.99817235382536196, 0.99817032563233177, 0.99816826945474191, 0.99817473881740826, 0.99818786364214118, 0.99817936221039727, 0.99818092624691857, 0.99817779777680338, 0.99818392344688722, 0.99818747921020856, 0.99818334281623422, 0.99819052126716579, 0.99819770034099553, 0.99818654540979512, 0.99819877731884266, 0.99820823943134684, 0.99820782670857333, 0.99820836397866197, 0.99820359834837069, 0.99820987663965155, 0.99821767025288, 0.99821726879471462, 0.99821204235079242, 0.99822818054367468, 0.99822581756668027, 0.99822481504961269, 0.99823491291403399, 0.9982371996809708, 0.99823218572164985, 0.99823995439764179, 0.99824419717587187, 0.99824159876608587, 0.99825015084260171, 0.99825213405499968, 0.9982570878544007, 0.99826555730559741, 0.99826160823396148, 0.99827903777875115, 0.99827452377445702, 0.99827196318984868, 0.99829376645552437, 0.99828398088637338, 0.99828633363937791, 0.99829725280475134, 0.99829991665701545, 0.99830835287039588, 0.99831861693516755, 0.99833291622235842, 0.99832308261065039, 0.99834187013573317, 0.99835034406127976, 0.99835839285448558, 0.99837293225115342, 0.99837962831400251, 0.99838967478487584, 0.99841126919192191, 0.99840227374069423, 0.99842438712344306, 0.99844448692972909, 0.99844200509559156, 0.99846208821821658, 0.99846848059356696, 0.99848546783625369, 0.99849112273210883, 0.99850318742099586, 0.99851100568850082, 0.99853465958622256, 0.99854085549321003, 0.99856595880542576, 0.9985892633947745, 0.99859799400664528, 0.99861152588558677, 0.9986195920066957, 0.99864414686604952, 0.99864542963961023, 0.99867481962130877, 0.99868054861465039, 0.99870186302143982, 0.99871207110816529, 0.99873009662355461, 0.99874658943365469, 0.9987632416473865, 0.99877652931910543, 0.99878812677638817, 0.9988062795298448, 0.99882429699945419, 0.99884033888836465, 0.99884776328805436, 0.99885751035817816, 0.99886519381727101, 0.99887668265812912, 0.99888999886791574, 0.99889570816091811, 0.99890193911863157, 0.9989095945871076, 0.99890782394973188, 0.99891973631069586, 0.99892838512380711, 0.99893976710971821, 0.99894271218163699, 0.99895187967552379, 0.9989588226760987, 0.99895440282466985, 0.99896612666759921, 0.99897022991356854, 0.99897180964858245, 0.99897695702379963, 0.99898263365068318, 0.99898929826478844, 0.99898074453878449, 0.9989852665348522, 0.99899732153871978, 0.99899865974053659, 0.99900317049941512, 0.99900303871208362, 0.99899845463675141, 0.99900254786774667, 0.99901034276368794, 0.99900672282465597, 0.99901078999201509, 0.99900902794953061, 0.99901224444503089, 0.99901468660333947, 0.99901050508563394, 0.99901552327353049, 0.9990167855842339, 0.99901419094096955, 0.99901952096738866, 0.99901682716620199, 0.99902476465370804, 0.99902436757572022, 0.99901967355141563, 0.99902125012131227, 0.99902076518659944, 0.99902376194562936, 0.99902609273247267, 0.99902377997221015, 0.99902182568448028, 0.9990228495608322, 0.99902895179735351, 0.99903209366041756, 0.99903225085350233, 0.99903178396698034, 0.99903469176946857, 0.99904362497121113, 0.99904174454808403, 0.99903275318720708, 0.99904139192532149, 0.999042467843829, 0.99904440957324625, 0.99904056047248357, 0.99904603539067105, 0.99904295650310282, 0.99904347683395545, 0.99904367702175711, 0.99904513334956724, 0.9990516644039279, 0.99905169814193984, 0.99906209962172643, 0.99905836305858831, 0.99905642829547048, 0.99905488323886626, 0.99905242731099442, 0.99905315887103174, 0.99905866054274994, 0.99905324608540103, 0.99905740221763828, 0.99905329926384234, 0.99905125703226194, 0.99905489382819179, 0.99905433751158568, 0.99906062179997335, 0.99906129488990114, 0.99905982163307971, 0.99906133343261616, 0.99906256295524298, 0.99906267500544632, 0.99906390816808777, 0.99906350519656772, 0.99906542902126594, 0.99907059763488371, 0.99907459838356605, 0.99907140604795475, 0.99907091339885279, 0.99906581712507869, 0.99907162725165621, 0.99907386977244705, 0.99907885318684186, 0.99907989055860158, 0.99907334305389195, 0.9990676672344696, 0.99907085321703804, 0.99906832183729388, 0.99906565245961665, 0.99906689409157956, 0.99906906430834574, 0.99907206079331834, 0.99907053008303581, 0.99907494441238731, 0.99906898250642251, 0.99907112832122558, 0.99906812664805777, 0.99906156491385523, 0.99906926925570827, 0.99906953755256023, 0.999070564265929, 0.99906938403916123, 0.99907131733625998, 0.99907457906046482, 0.9990675655423803, 0.99906945633544464, 0.99907461263389952, 0.99907390866136403, 0.999076839835499, 0.99906885227730768, 0.99906655519160481, 0.99907232825035597, 0.9990711921290707, 0.99906908928278415, 0.99907051378812672, 0.9990656335480631, 0.99906639247612061, 0.99907056679210871, 0.99907367220615173, 0.99907944679408167, 0.99907790359479332, 0.99908091880241756, 0.9990847689504796, 0.99908133561351931, 0.9990830272663862, 0.9990848756945131, 0.99907332671117688, 0.99907751362718566, 0.99907864129009505, 0.99907819538258003, 0.99907260118767738, 0.99907982034954668, 0.99907131103149571, 0.9990782062627841, 0.99907136803253516, 0.99907599430211225, 0.99907050842394773, 0.99907492773002271, 0.99907291443912472, 0.99906727540581253, 0.99907406363297069, 0.99907957146786974, 0.99907801919743067, 0.99908519651784089, 0.99908367185008762, 0.99908149593978135, 0.99908032683654535, 0.99908294822409305, 0.99908353975315256, 0.99907998046181146, 0.9990820596620974, 0.99908189519795343, 0.99908263581957202, 0.9990760297259742, 0.99908021233077626, 0.99907873024415428, 0.99908068468657873, 0.99908395715333487, 0.99908143481680745, 0.99908405085932206, 0.99909118170879563, 0.99907906295921112, 0.99908103623663014, 0.99908351937142903, 0.99908810365901335, 0.9990817902233462, 0.99907774453190223, 0.9990762151250242, 0.99908599997809744, 0.99908203196984591, 0.99908612425311771, 0.9990883067860501, 0.99908360929871209, 0.99907790689563392, 0.99908596152739715, 0.99908225762364944, 0.99908908600394419, 0.99908837039171172, 0.99908396668766375, 0.99908045702699122, 0.99907933651197844, 0.99907889467916988, 0.99906995900061402, 0.99907441180756285, 0.999072674768958, 0.99907927509846894, 0.99907965827077516, 0.99908968853777047, 0.99908413578061828, 0.99908150153548625, 0.99908471528476206, 0.9990792808828437, 0.99908045317308114, 0.99907667471546524, 0.99907515276124614, 0.99907794615437262, 0.99908055675243801, 0.99907868802578226, 0.9990803667512107, 0.99908469197087679, 0.99909142534825202, 0.99908576288818174, 0.99909041874552473, 0.99909305546058158, 0.99908891194608374, 0.99909018878730471, 0.99909362699946858, 0.99909200387103569, 0.99909227342117146, 0.99908735983475871, 0.99908901810609752, 0.99908643974552125, 0.99908715965829165, 0.99908764794982252, 0.99909130965901993, 0.99908929738295571, 0.99909381068043746, 0.9990958625966091, 0.99909453189615416, 0.99909305595999276, 0.99909208309001662, 0.99908994297170861, 0.99908613506916388, 0.99908766072387367, 0.99908638682270923, 0.99908817622189738, 0.99909174698638625, 0.99909183159781789, 0.99908717401135672, 0.99908331989863197, 0.99908425747415885, 0.99908920638799126, 0.99909286013631493, 0.99909823983418578, 0.99908832804252989, 0.99908567204753318, 0.99908389587883872, 0.99908927192046726, 0.99908091540602817, 0.9990800913693112, 0.99907600025137311, 0.99908379723776652, 0.99907892734020876, 0.99908019904748679, 0.99908652935256681, 0.99908782883533553, 0.99908804710161636, 0.99909035853089689, 0.99909558526340503, 0.99909088982339, 0.99909553762225323, 0.99909330085982351, 0.99909857670752911, 0.99909431410428196, 0.9990983412498543, 0.9990967978804427, 0.99909360086536614, 0.99909027041634169, 0.99909055784681833, 0.99909380000784409, 0.99909156978201574, 0.99909594831022974, 0.99909842053619335, 0.99909757309979741, 0.99909813755986909, 0.99909947470832938, 0.99910093697024627, 0.9990917320506606, 0.99909206984844545, 0.99909820697873408, 0.99909339023334576, 0.99909151043113642, 0.99909165558639978, 0.99909495496239331, 0.99910231099751357, 0.99910071922117449, 0.99909988937582939, 0.99908867498030163, 0.99909153792960981, 0.99909512267810496, 0.99909707292003458, 0.99909244264259123, 0.99910083283528095, 0.99910188905198716, 0.99909602303417433, 0.99910336666572963, 0.99909859180222793, 0.99909830347165562, 0.99910701333992002, 0.99910179971503843, 0.99909990313833474, 0.99909704905614038, 0.99909600023222733, 0.99909329717141604, 0.99909587945772593, 0.99909296380670132, 0.99908988576166902, 0.99909884899755319, 0.99909471641472591, 0.99909697229149386, 0.99909876388683172, 0.99910456917595136, 0.99909726358476503, 0.99910416380220846, 0.99910323527488243, 0.99910265500548123, 0.99909771301157946, 0.99909760471896847, 0.99909694749423272, 0.99909357156853706, 0.99909841512008268, 0.99909324500582586, 0.99909515716801189, 0.99909621673794724, 0.99909629585763782, 0.99910189600957144, 0.99909773870762386, 0.99910295466761356, 0.99910085093326673, 0.99909759389408881, 0.99909910491304588, 0.99909501305932291, 0.99909621239454316, 0.99909603926427915, 0.99909504316258535, 0.99910209464136779, 0.99910002556807598, 0.9991001266970061, 0.99910217664796164, 0.99909936008360611, 0.99909683334459054, 0.99909853982642438, 0.99909824416968229, 0.9990962898377489, 0.99909635742915326, 0.99909342665078937, 0.9990959532367113, 0.99909541615350406, 0.99909654384608959, 0.99909621295730644, 0.99909837894004505, 0.99910636698574529, 0.99910321239178745, 0.99910088311147416, 0.99910365493273035, 0.99910100165256666, 0.99910561234566897, 0.99910472487929058, 0.99910258925566253, 0.99911017776952815, 0.9991099608506856, 0.99910334357657526, 0.99910277923154556, 0.99910210567167168, 0.99909690685433461, 0.99909502508331982, 0.99910491732438256, 0.99910114631726488, 0.99909929274634823, 0.99909794367437665, 0.99909930115187295, 0.9991018023533601, 0.99910487812284199, 0.9991061590448066, 0.99910864708580327, 0.9991096293039321, 0.99910099717532175, 0.9991037830773889, 0.99910413722140567, 0.99910364365551629, 0.99910587289046493, 0.99910930256733654, 0.99909696788196822, 0.99910163942915464, 0.99910052258633941, 0.99909768694047574, 0.99909590391100911, 0.99909683239829783, 0.99909687134129999, 0.9990934874814047, 0.9990937764533051, 0.99908910630652192, 0.99909315111931019, 0.9991005526947796, 0.99910410081730172, 0.99910221271586497, 0.99909701091499259, 0.99909465831137656, 0.99910040165993297, 0.99909712259542549, 0.99909933322250455, 0.99910027464713391, 0.99909877325378804, 0.99910837191013546, 0.99910710300922156, 0.99910283967946356, 0.99910163794058837, 0.99909695051484937, 0.9990995998198795, 0.99909945368084596, 0.99909012633759775, 0.99909666614065518, 0.99909770358536187, 0.99909446637394739, 0.99909801202265125, 0.99910570611156924, 0.99910367669210087, 0.9990981028405258, 0.99910445525137948, 0.99910519102201234, 0.99910359304421392, 0.9991024303673437, 0.99910240262925676, 0.99910020632074004, 0.99910363549594761, 0.99910072513849435, 0.99910382899984906, 0.99910066858330837, 0.99910454524331294, 0.99910494137913497, 0.99910693806100703, 0.99910886370771224, 0.99910443161948725, 0.99910432927742432, 0.99910268338088393, 0.99910851581613658, 0.99911562422446487, 0.99910772610011922, 0.99910736241312204, 0.99910096485343858]}
@@ -12,6 +12,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmtf_icm import nmtf_icm
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 
 import numpy, matplotlib.pyplot as plt
 
@@ -42,13 +43,14 @@ numpy.random.seed(3)
 # Run the Gibbs sampler
 NMTF = nmtf_icm(R,M,K,L,priors)
 NMTF.initialise(init_S=init_S,init_FG=init_FG)
-NMTF.run(iterations,minimum_TN=minimum_TN)
+performances_sink = MemorySink()
+NMTF.run(iterations,minimum_TN=minimum_TN,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Plot the tau expectation values to check convergence
 plt.plot(NMTF.all_tau)
 
 # Extract the performances across all iterations
-print "icm_all_performances = %s" % NMTF.all_performances
+print "icm_all_performances = %s" % performances_sink.values
 
 '''
 icm_all_performances = {'R^2': [0.9288177442589758, 0.9382287011236542, 0.9418203899864597, 0.9460128280404809, 0.9522883341388004, 0.9595457624926458, 0.9656885834266021, 0.9699748031764066, 0.9725999243410073, 0.974172214388124, 0.9751600751033723, 0.9758339191664401, 0.9763306418389491, 0.9767265135122127, 0.9770435156342856, 0.9773156898933042, 0.9775581979741197, 0.9777792516208544, 0.9779848864143771, 0.9781797334003397, 0.9783684955978944, 0.9785519239167353, 0.9787346370702479, 0.9789196522092244, 0.9791101181706288, 0.979309927497815, 0.9795224632110561, 0.9797498421420886, 0.9799983905326746, 0.9802732667024991, 0.9805791511830504, 0.9809203269838284, 0.9813011607831511, 0.9817290522918887, 0.9822062551135903, 0.9827368747345924, 0.9833244560179435, 0.9839666017876979, 0.984659952168261, 0.9854029585781526, 0.9861900386678588, 0.9870112862799908, 0.9878499309050247, 0.9886805982448128, 0.9894979224362951, 0.9902767181882643, 0.9909985800068991, 0.9916802560992952, 0.992295521226413, 0.9928413177614401, 0.9933312307465926, 0.9937686064150106, 0.9941555116674502, 0.9944944154961567, 0.9947895649063778, 0.9950449929079808, 0.9952623900823357, 0.9954466356495406, 0.9956019554898691, 0.9957331157101431, 0.9958434692290997, 0.9959363582216619, 0.9960146840052838, 0.9960808244328051, 0.9961367522112476, 0.9961836648090953, 0.9962228758725375, 0.996256400962399, 0.9962851097196743, 0.9963098258632112, 0.9963312077778805, 0.9963497935221144, 0.996366026625379, 0.9963802728027767, 0.9963928375171478, 0.9964039753259945, 0.9964138989078771, 0.9964227859440662, 0.9964307850420339, 0.9964380207291804, 0.9964445978277849, 0.9964506056642113, 0.9964561220734516, 0.9964612029498067, 0.9964659000439121, 0.9964702566157648, 0.9964743134550366, 0.9964781027249976, 0.9964816512694582, 0.9964849825025989, 0.9964881183399927, 0.9964910752826958, 0.9964938687267392, 0.9964965120598348, 0.9964990170024879, 0.9965013938866413, 0.9965036518521448, 0.9965057989706391, 0.9965078425215448, 0.9965097890916235, 0.9965116446024694, 0.9965134144989232, 0.9965151038197939, 0.9965167171386687, 0.9965182586893899, 0.9965197324568198, 0.9965211418591099, 0.9965224903770997, 0.9965237812557216, 0.9965250175319493, 0.996526202055565, 0.9965273375078822, 0.9965284264170015, 0.9965294711711425, 0.996530474031543, 0.9965314371385793, 0.996532362525351, 0.9965332521241852, 0.9965341077734834, 0.9965349299297284, 0.9965357212900875, 0.9965364837090278, 0.9965372172642156, 0.9965379230407762, 0.9965386041477567, 0.9965392619039739, 0.9965398975856726, 0.9965405119998524, 0.9965411069248207, 0.9965416831829101, 0.996542241857783, 0.9965427840051146, 0.9965433106322324, 0.9965438227014591, 0.9965443211328916, 0.9965448068072218, 0.9965452805685177, 0.9965457432276982, 0.996546195604077, 0.9965466384475147, 0.9965470724773619, 0.9965474983891589, 0.9965479168785698, 0.9965483286117983, 0.99654873422099, 0.9965491343210678, 0.9965495295269977, 0.9965499204540275, 0.9965503076740128, 0.9965506918551651, 0.9965510698444803, 0.9965514446460894, 0.9965518175733223, 0.9965521892359364, 0.9965525602521278, 0.9965529311766528, 0.9965533025901314, 0.9965536750432833, 0.9965540490746913, 0.9965544252206944, 0.9965548041378417, 0.9965551867449614, 0.9965555737161053, 0.996555965640454, 0.9965563630684473, 0.9965567665325351, 0.9965571765585783, 0.9965575936720976, 0.9965580184016902, 0.9965584512830463, 0.9965588928613773, 0.9965593436934195, 0.9965598043495258, 0.9965602754157055, 0.9965607574955951, 0.9965612510094215, 0.9965617558253514, 0.9965622719360466, 0.9965628015387199, 0.9965633453643038, 0.9965639041604548, 0.9965644786961658, 0.9965650697787399, 0.996565678253401, 0.9965663050088793, 0.9965669509681488, 0.9965676170334197, 0.996568304264343, 0.9965690138184005, 0.9965697469180335, 0.9965705048343321, 0.9965712888901356, 0.9965721004308128, 0.9965729409265306, 0.9965738118967407, 0.9965747149307094, 0.9965756517004156, 0.9965766239714315, 0.9965776337291536, 0.9965786830617244, 0.9965797740653883, 0.9965809089594835, 0.9965820900962561, 0.9965833199681247, 0.9965846012099271, 0.9965859366141216, 0.9965873291506624, 0.996588781973032, 0.9965902984310987, 0.9965918820853915, 0.996593516280625, 0.9965952040624987, 0.9965969674349808, 0.9965988107820811, 0.9966007385237398, 0.9966027533955147, 0.9966048637244879, 0.9966070747836465, 0.9966093915970226, 0.9966118191890845, 0.9966143657384746, 0.9966170382117072, 0.9966198440143872, 0.9966227910432239, 0.9966258875768328, 0.9966291448306024, 0.9966325690349079, 0.9966361673866537, 0.9966399508929759, 0.9966439313094287, 0.996648121078328, 0.996652533338605, 0.9966571819558705, 0.9966620815739075, 0.9966672554783558, 0.996672703775935, 0.9966784388956732, 0.9966844797968025, 0.9966908463942735, 0.9966975593232852, 0.9967046399418474, 0.9967121460249945, 0.9967200177622165, 0.9967282626954845, 0.9967368670134645, 0.9967458653885639, 0.9967553034619616, 0.9967651326624041, 0.9967753123189906, 0.9967859962929266, 0.9967972270561245, 0.9968090433828972, 0.9968214624709999, 0.9968345053933296, 0.9968482016708096, 0.9968625764972829, 0.9968776547850084, 0.9968934695723696, 0.9969100352332168, 0.9969273628046704, 0.9969454669146812, 0.9969643652670741, 0.9969840691073129, 0.9970045544496247, 0.9970257765945071, 0.9970477856419219, 0.9970705728863065, 0.9970940696041724, 0.9971181656685212, 0.9971429144671222, 0.9971683207260185, 0.9971943608886645, 0.9972209693189135, 0.9972481136680906, 0.9972757336178006, 0.9973037789111586, 0.9973321825301111, 0.9973608415960363, 0.9973896690929039, 0.9974186083016627, 0.9974475670064834, 0.9974765520436261, 0.9975054375714574, 0.9975341826093523, 0.9975627808321784, 0.9975911638313025, 0.997619269811127, 0.997647038015551, 0.9976744122463923, 0.9977013407325264, 0.9977277761633317, 0.9977536756023909, 0.9977789992185001, 0.9978036518579755, 0.9978276547924937, 0.9978510026331857, 0.9978736763681845, 0.9978956599396783, 0.997916940169419, 0.9979375066936276, 0.9979573447080864, 0.9979764501305581, 0.99799482126879, 0.998012462513662, 0.9980292914947395, 0.9980451696761796, 0.9980602506704596, 0.9980746246350353, 0.9980882668781031, 0.9981012619263807, 0.9981136413732812, 0.9981254215199644, 0.9981366258166697, 0.9981472735607358, 0.9981573831309614, 0.9981669732530801, 0.9981760633630041, 0.9981846733677358, 0.9981928322226837, 0.99820056116082, 0.9982078711704311, 0.9982147863619651, 0.99822132774574, 0.9982275147767306, 0.9982333690811201, 0.9982389150606759, 0.9982441725532445, 0.9982491581241156, 0.9982538605779645, 0.9982583084944916, 0.9982625306635545, 0.9982665415042848, 0.9982703549033964, 0.9982739823628896, 0.998277434193844, 0.9982807200317797, 0.9982838489447018, 0.9982868295692282, 0.9982896699177997, 0.9982923779433869, 0.998294960695057, 0.9982974244765395, 0.9982997760150498, 0.9983020215302472, 0.9983041668162563, 0.9983062170194611, 0.9983081660730347, 0.9983100294633308, 0.9983118121449644, 0.9983135189061296, 0.9983151541128472, 0.9983167218044512, 0.9983182258432376, 0.9983196697563184, 0.9983210567168296, 0.9983223881010884, 0.998323666154919, 0.9983248954226643, 0.9983260784988466, 0.9983272178873521, 0.9983283158972337, 0.9983293746336928, 0.9983303961763181, 0.998331382464184, 0.9983323353067407, 0.9983332563942254, 0.9983341473208666, 0.9983350095696754, 0.9983358445225263, 0.9983366513229393, 0.9983374164844699, 0.9983381541739101, 0.9983388732035502, 0.9983395736371682, 0.9983402555639372, 0.9983409193652897, 0.9983415655991935, 0.9983421948964311, 0.998342807898951, 0.9983434052273583, 0.9983439874831933, 0.9983445552325293, 0.998345109007519, 0.9983456493086772, 0.9983461764855288, 0.9983466909779795, 0.9983471932409029, 0.9983476837246695, 0.9983481628201073, 0.9983486309185619, 0.9983490883860965, 0.9983495355676086, 0.9983499727887961, 0.9983504003578134, 0.9983508185667033, 0.9983512276989692, 0.998351628058565, 0.9983520199415841, 0.998352403626381, 0.998352779417067, 0.998353147561707, 0.998353508282963, 0.9983538617820248, 0.9983542082473217, 0.9983545478567425, 0.9983548807792443, 0.9983552071760383, 0.9983555272018213, 0.9983558409839577, 0.998356148626513, 0.9983564502559094, 0.9983567460025956, 0.9983570359973701, 0.9983573203689691, 0.9983575992430295, 0.9983578727416722, 0.9983581406638283, 0.9983584029718375, 0.998358660042769, 0.9983589120063292, 0.9983591590285038, 0.9983594008664224, 0.9983596371424162, 0.9983598685189689, 0.9983600952416475, 0.99836031750884, 0.9983605354844459, 0.9983607493069975, 0.9983609590961682, 0.9983611649576162, 0.9983613669866327, 0.998361565270858, 0.9983617598922584, 0.9983619509285345, 0.9983621384540987, 0.9983623225407403, 0.9983625032580682, 0.9983626806738031, 0.9983628548539674, 0.9983630258630115, 0.9983631937639004, 0.9983633586181746, 0.9983635204860003, 0.9983636794262105, 0.998363835496343, 0.9983639887526764, 0.9983641392502657, 0.9983642870429769, 0.99836443218352, 0.9983645747235897, 0.9983647147135974, 0.998364852201692, 0.9983649872354646, 0.9983651198637148, 0.9983652501342443, 0.9983653780938446, 0.9983655037882867, 0.9983656272623221, 0.9983657485590018, 0.9983658677231966, 0.9983659847958768, 0.9983660998170368, 0.9983662128265866, 0.9983663238635407, 0.9983664329660684, 0.998366540171519, 0.9983666455162705, 0.9983667490361311, 0.998366850766144, 0.9983669507406129, 0.9983670489931231, 0.9983671455325255, 0.9983672403763989, 0.9983673335618203, 0.9983674251249138, 0.9983675151009159, 0.9983676035241661, 0.998367690428088, 0.9983677758451757, 0.9983678598069928, 0.9983679423441836, 0.998368023486493, 0.9983681032627946, 0.9983681816907082, 0.9983682587949679, 0.9983683345992147, 0.9983684091286387, 0.9983684824090577, 0.9983685544661876, 0.9983686253252948, 0.9983686950110499, 0.9983687635474797, 0.9983688309579667, 0.9983688972664382, 0.9983689625120022, 0.9983690267237842, 0.9983690899236438, 0.9983691521315748, 0.9983692133667668, 0.9983692736479233, 0.9983693329933355, 0.9983693914208812, 0.9983694489480112, 0.9983695055917448, 0.9983695613686757, 0.9983696162949861, 0.9983696703864636, 0.9983697236585204, 0.9983697761262118, 0.9983698278085332, 0.9983698787235452, 0.9983699288836103, 0.9983699783010831, 0.9983700269886246, 0.9983700749596741, 0.9983701222275096, 0.9983701688049934, 0.9983702147049004, 0.9983702599389392, 0.9983703045276491, 0.9983703484844674, 0.9983703918199206, 0.9983704345446653, 0.9983704766694633, 0.9983705182050837, 0.9983705591622143, 0.998370599551395, 0.9983706393829704, 0.9983706786670604, 0.9983707174135426, 0.9983707556320446, 0.998370793331942, 0.9983708305223619, 0.9983708672121879, 0.9983709034120677, 0.9983709391339831, 0.9983709743868763, 0.9983710091794787, 0.998371043520273, 0.9983710774174734, 0.9983711108790274, 0.9983711439126242, 0.998371176525708, 0.9983712087254928, 0.9983712405189761, 0.9983712719129526, 0.9983713029140261, 0.9983713335286208, 0.9983713637659698, 0.9983713936331448, 0.9983714231365998, 0.9983714522826299, 0.9983714810773523, 0.998371509526701, 0.998371537636431, 0.9983715654121269, 0.9983715928592108, 0.9983716199829532, 0.9983716467884802, 0.9983716732807834, 0.9983716994647258, 0.9983717253450503, 0.9983717509263844, 0.9983717762132469, 0.9983718012100528, 0.9983718259211177, 0.9983718503506628, 0.9983718745028183, 0.9983718983816278, 0.998371921991051, 0.9983719453349678, 0.9983719684171803, 0.9983719912414166, 0.9983720138113328, 0.9983720361305154, 0.9983720582024839, 0.9983720800306929, 0.9983721016185338, 0.9983721229693375, 0.9983721440863751, 0.9983721649728604, 0.9983721856319514, 0.9983722060667517, 0.9983722262803117, 0.9983722462756305, 0.9983722660556569, 0.9983722856232906, 0.9983723049813837, 0.9983723241327414, 0.9983723430801232, 0.9983723618262447, 0.9983723803737771, 0.9983723987253494, 0.9983724168835492, 0.9983724348509229, 0.998372452629977, 0.9983724702231791, 0.9983724876329584, 0.9983725048617065, 0.998372521911778, 0.9983725387854918, 0.998372555485131, 0.9983725720129444, 0.9983725883711461, 0.9983726045619173, 0.9983726205874061, 0.9983726364497283, 0.9983726521509683, 0.998372667693179, 0.9983726830783832, 0.9983726983085734, 0.9983727133857127, 0.998372728311735, 0.9983727430885461, 0.9983727577180235, 0.9983727722020173, 0.9983727865423504, 0.9983728007408195, 0.9983728147991945, 0.9983728287192201, 0.9983728425026154, 0.9983728561510747, 0.9983728696662679, 0.9983728830498407, 0.9983728963034152, 0.9983729094285899, 0.9983729224269409, 0.998372935300021, 0.9983729480493616, 0.9983729606764717, 0.9983729731828389, 0.9983729855699297, 0.9983729978391898, 0.9983730099920443, 0.998373022029898, 0.9983730339541362, 0.9983730457661243, 0.9983730574672087, 0.9983730690587167, 0.998373080541957, 0.9983730919182199, 0.9983731031887775, 0.9983731143548845, 0.9983731254177777, 0.9983731363786766, 0.9983731472387842, 0.9983731579992862, 0.9983731686613522, 0.9983731792261353, 0.9983731896947731, 0.9983732000683868, 0.9983732103480827, 0.9983732205349515, 0.998373230630069, 0.9983732406344964, 0.9983732505492801, 0.9983732603754519, 0.9983732701140302, 0.9983732797660189, 0.9983732893324083, 0.9983732988141754, 0.9983733082122836, 0.9983733175276835, 0.9983733267613127, 0.9983733359140962, 0.9983733449869461, 0.9983733539807627, 0.9983733628964337, 0.9983733717348353, 0.9983733804968316, 0.9983733891832751, 0.998373397795007, 0.9983734063328572, 0.9983734147976446, 0.998373423190177, 0.9983734315112515, 0.9983734397616547, 0.9983734479421625, 0.998373456053541, 0.9983734640965455, 0.9983734720719218, 0.9983734799804059, 0.9983734878227237, 0.9983734955995918, 0.9983735033117174, 0.9983735109597983, 0.9983735185445235, 0.9983735260665725, 0.9983735335266162, 0.9983735409253169, 0.998373548263328, 0.9983735555412947, 0.9983735627598536, 0.998373569919633, 0.9983735770212534, 0.9983735840653271, 0.9983735910524585, 0.9983735979832444, 0.9983736048582738, 0.998373611678128, 0.9983736184433812, 0.9983736251546002, 0.9983736318123442, 0.9983736384171659, 0.9983736449696105, 0.9983736514702164, 0.9983736579195154, 0.9983736643180577, 0.9983736706663412, 0.998373676964866, 0.998373683214131, 0.9983736894146318, 0.9983736955668586, 0.9983737016713125, 0.9983737077284669, 0.9983737137387813, 0.998373719702716, 0.9983737256207292, 0.998373731493275, 0.9983737373208026, 0.9983737431037564, 0.9983737488425756, 0.9983737545376944, 0.9983737601895418, 0.9983737657985419, 0.9983737713651137, 0.9983737768896712, 0.9983737823726238, 0.9983737878143756, 0.9983737932153265, 0.9983737985758712, 0.9983738038964, 0.9983738091772983, 0.9983738144189476, 0.998373819621724, 0.9983738247859998, 0.9983738299121425, 0.9983738350005157, 0.9983738400514782, 0.9983738450653851, 0.9983738500425866, 0.9983738549834296, 0.9983738598882563, 0.9983738647574052, 0.9983738695912107, 0.9983738743900034, 0.9983738791541098, 0.998373883883853, 0.9983738885795518, 0.9983738932415218, 0.9983738978700747, 0.9983739024655185, 0.9983739070281578, 0.9983739115582936, 0.9983739160560327, 0.9983739205216801, 0.9983739249556624, 0.9983739293582888, 0.9983739337298533, 0.9983739380706445, 0.9983739423809465, 0.9983739466610395, 0.9983739509111996, 0.9983739551316988, 0.9983739593228046, 0.998373963484781, 0.9983739676178887, 0.9983739717223842, 0.9983739757985214, 0.9983739798465507, 0.9983739838667196, 0.9983739878592728, 0.9983739918244519, 0.9983739957624961, 0.9983739996736417, 0.9983740035581224, 0.9983740074161696, 0.9983740112480117, 0.998374015053875, 0.9983740188339834, 0.9983740225885578, 0.9983740263178175, 0.9983740300219789, 0.9983740337012563, 0.9983740373558617, 0.9983740409860047, 0.9983740445918927, 0.9983740481737311, 0.998374051731723, 0.9983740552660691, 0.9983740587769684, 0.9983740622646174, 0.9983740657292108, 0.9983740691709214, 0.9983740725899004, 0.9983740759863196, 0.9983740793603669, 0.9983740827122286, 0.9983740860420884, 0.9983740893501284, 0.9983740926365308, 0.9983740959014742, 0.9983740991451329, 0.998374102367682, 0.9983741055692948, 0.9983741087501428, 0.9983741119103952, 0.9983741150502199, 0.9983741181697826, 0.9983741212692476, 0.9983741243487774, 0.9983741274085325, 0.9983741304486723, 0.9983741334693541, 0.9983741364707339, 0.998374139452966, 0.9983741424162031, 0.9983741453605965, 0.9983741482862959, 0.9983741511934494, 0.9983741540822038, 0.9983741569527039, 0.9983741598050928, 0.9983741626395122, 0.998374165456103, 0.9983741682550048, 0.998374171036356, 0.9983741738002934, 0.9983741765469528, 0.9983741792764683, 0.9983741819889731, 0.9983741846845986, 0.9983741873634754, 0.9983741900257325, 0.9983741926714977, 0.9983741953008979, 0.9983741979140583, 0.9983742005111033, 0.9983742030921559, 0.9983742056573377, 0.9983742082067696, 0.9983742107405709, 0.9983742132588602, 0.998374215761755, 0.9983742182493717, 0.9983742207218254, 0.9983742231792301, 0.9983742256216991, 0.9983742280493443, 0.9983742304622765, 0.9983742328606057, 0.9983742352444408, 0.9983742376138895, 0.9983742399690587, 0.998374242310053, 0.9983742446369338, 0.9983742469498099, 0.9983742492487946, 0.9983742515339976, 0.9983742538055242, 0.9983742560634762, 0.9983742583079527, 0.9983742605390513, 0.998374262756869, 0.998374264961502, 0.9983742671530456, 0.9983742693315949, 0.9983742714972446, 0.9983742736500885, 0.99837427579022, 0.9983742779177315, 0.9983742800327151, 0.9983742821352617, 0.9983742842254617, 0.9983742863034579, 0.9983742883694243, 0.9983742904232695, 0.9983742924650993, 0.9983742944950127, 0.9983742965131037, 0.9983742985194625, 0.9983743005141754, 0.9983743024973268, 0.9983743044689991, 0.9983743064292735, 0.9983743083782302, 0.9983743103159486, 0.9983743122425077, 0.9983743141579856, 0.9983743160624597, 0.9983743179560068, 0.9983743198387033, 0.9983743217106245, 0.9983743235718454, 0.9983743254224405, 0.9983743272624832, 0.9983743290920468, 0.9983743309112035, 0.998374332720023, 0.9983743345185707, 0.9983743363069167, 0.9983743380851303, 0.9983743398532339, 0.9983743416112923, 0.9983743433593786, 0.9983743450975651, 0.9983743468259226, 0.998374348544521, 0.9983743502534282, 0.9983743519533005, 0.9983743536444841, 0.9983743553269848, 0.998374357000778, 0.998374358665865, 0.998374360322267, 0.9983743619700229, 0.9983743636091853, 0.9983743652398175, 0.9983743668619914, 0.9983743684757856, 0.9983743700812827, 0.9983743716785687, 0.9983743732677315, 0.9983743748488603, 0.9983743764220445, 0.9983743779873739, 0.9983743795449375, 0.9983743810948236, 0.9983743826371195, 0.9983743841719119, 0.9983743856992858, 0.9983743872193251, 0.9983743887321127, 0.9983743902377297, 0.9983743917362561, 0.9983743932277707, 0.9983743947123508, 0.9983743961900724, 0.9983743976610104, 0.9983743991252382, 0.9983744005829918, 0.9983744020344106, 0.9983744034795383, 0.9983744049183222, 0.998374406350812, 0.9983744077771296, 0.998374409197406, 0.9983744106117758, 0.9983744120203722, 0.9983744134233246, 0.9983744148207564, 0.9983744162127849, 0.9983744175995196, 0.9983744189810632, 0.9983744203575112, 0.9983744217289526, 0.9983744230954698, 0.9983744244571392, 0.9983744258140324, 0.9983744271662153, 0.9983744285137496, 0.9983744298566929, 0.9983744311950988, 0.9983744325290177, 0.9983744338584968, 0.9983744351835805, 0.9983744365043106, 0.9983744378207268, 0.9983744391328665, 0.9983744404407655, 0.9983744417444577, 0.9983744430439754, 0.9983744443393497, 0.9983744456306105, 0.9983744469177863, 0.9983744482009048, 0.9983744494799925, 0.9983744507550755, 0.9983744520261785, 0.9983744532933259, 0.9983744545565414, 0.9983744558151675, 0.9983744570694429, 0.9983744583198825, 0.9983744595664964, 0.9983744608092981, 0.9983744620483042, 0.9983744632835327, 0.9983744645150033, 0.9983744657427356, 0.9983744669667495, 0.9983744681870647, 0.9983744694037008, 0.9983744706166773, 0.9983744718260134, 0.998374473031728, 0.9983744742338397, 0.9983744754323671, 0.9983744766273283, 0.9983744778187411], 'MSE': [40.796618714911304, 35.402925933558627, 33.344424702415196, 30.941616657134048, 27.344941799460347, 23.185498770852092, 19.664869635575005, 17.208312575943694, 15.703779372861485, 14.802654269509386, 14.23648259478675, 13.850282986076676, 13.565596791934025, 13.338711235329491, 13.157028109789403, 13.001037134881349, 12.862048708547851, 12.735356441669019, 12.61750116750652, 12.505828699258457, 12.397643600019061, 12.292515501627577, 12.187797285262393, 12.081759734151708, 11.97259815835322, 11.858081628186508, 11.736271236451493, 11.605953765382731, 11.463503462039851, 11.305963943554394, 11.130652661354233, 10.93511489826718, 10.716847984090579, 10.471610929552391, 10.198112128987962, 9.8939986089074274, 9.5572387053142531, 9.1892063093843319, 8.7918270634303752, 8.3659885044871896, 7.9148900392366865, 7.4442091742669811, 6.9635575757942627, 6.4874779912478369, 6.0190457526336782, 5.5726952820124831, 5.1589753026002505, 4.7682869303500697, 4.4156606116376178, 4.1028487612175892, 3.822065396730431, 3.5713926947504815, 3.3496460544079869, 3.1554104245191823, 2.9862517229948926, 2.8398585147152882, 2.7152618783832447, 2.6096653912121206, 2.5206470784489836, 2.4454753458116651, 2.3822285381648567, 2.328991157964905, 2.2841003758914407, 2.2461933754018393, 2.2141395407917508, 2.1872525680849884, 2.1647795684869182, 2.1455653655338804, 2.12911154270759, 2.1149460028061235, 2.1026914063328546, 2.0920393763691036, 2.0827357132925424, 2.0745708151533471, 2.0673696123237688, 2.060986210503962, 2.0552987174323163, 2.0502052988107655, 2.0456207833798996, 2.0414738008687832, 2.0377042745841538, 2.0342610089916624, 2.0310993945962008, 2.0281873967501416, 2.0254953556608033, 2.0229984777671355, 2.0206733853233385, 2.0185016446247568, 2.016467870703933, 2.014558644213762, 2.0127614047026623, 2.0110666949359581, 2.0094656910010222, 2.0079507200112015, 2.0065150646043972, 2.0051528032440853, 2.0038586976167729, 2.0026281216307451, 2.0014569032385592, 2.0003412673756755, 1.9992778202045225, 1.9982634411287925, 1.9972952422605288, 1.9963706023440222, 1.9954870948414365, 1.9946424359122104, 1.9938346665145479, 1.9930617916781579, 1.9923219516379906, 1.9916134058162285, 1.9909345209199849, 1.9902837602103827, 1.9896596747597532, 1.9890608958098364, 1.9884861273796854, 1.9879341427575945, 1.9874037767148314, 1.9868939217788264, 1.9864035243081195, 1.9859323226792842, 1.9854787710672996, 1.9850418066231954, 1.9846213848342045, 1.9842168837835203, 1.9838265215857553, 1.9834495423889367, 1.9830852147399054, 1.9827330761238173, 1.9823921073410125, 1.9820618370888312, 1.9817416442889104, 1.98143092390291, 1.9811290986023751, 1.9808356168522216, 1.9805499513180929, 1.9802715972498985, 1.9800000708877672, 1.9797349074704691, 1.9794756374255973, 1.9792218309861935, 1.9789730758715987, 1.9787289734473377, 1.9784891250081902, 1.9782531487334623, 1.9780206823222102, 1.977791373344097, 1.9775648693443297, 1.9773408177065694, 1.9771188906836732, 1.9768987053042633, 1.9766820686465942, 1.9764672589559062, 1.9762535235245959, 1.9760405128831096, 1.975827872725241, 1.9756152851040858, 1.9754024172493709, 1.9751889535277292, 1.9749745852616583, 1.9747590050596446, 1.9745418366344434, 1.974322553378838, 1.9741007689741985, 1.9738761457439149, 1.9736483682150927, 1.9734171312251427, 1.9731821333879096, 1.9729430735122346, 1.9726996486436941, 1.9724515517626693, 1.9721984703926581, 1.9719400854519946, 1.9716760700546718, 1.9714060883419766, 1.9711297943520676, 1.9708469472408656, 1.9705576225657513, 1.970261824532598, 1.9699582938548144, 1.9696466116137274, 1.9693263493057533, 1.9689970661986216, 1.9686582996035784, 1.9683095650982536, 1.967950353325431, 1.9675801353020397, 1.9671983939450974, 1.96680452193794, 1.9663978558939796, 1.9659776951966406, 1.9655433113473273, 1.9650939461883872, 1.9646288286498188, 1.96414711613629, 1.9636479378059513, 1.9631303828040114, 1.9625934928708002, 1.9620362561056437, 1.9614575346201828, 1.9608561316391955, 1.9602308457441655, 1.9595804049678514, 1.9589034611696794, 1.9581985858722091, 1.9574642689732911, 1.9566989100339103, 1.9559008068871651, 1.9550681521805144, 1.9541990260071218, 1.9532913877244706, 1.9523547829603241, 1.9513874661359658, 1.9503768261378716, 1.9493203503627259, 1.9482155056144654, 1.9470607240651969, 1.9458512332224875, 1.9445840109841617, 1.9432561779315141, 1.94186485439568, 1.9404053529591749, 1.9388736809102929, 1.9372655938816334, 1.9355765660397906, 1.9338018526696312, 1.9319350259063, 1.9299725149405607, 1.927910195017625, 1.9257417576279632, 1.9234604653218508, 1.9210591870466505, 1.9185303924992487, 1.915866134895164, 1.9130580214570339, 1.9100927065081665, 1.9069701288844503, 1.903683165148738, 1.9002209492144158, 1.8965720672447446, 1.892724692607642, 1.8886665844071826, 1.8843646300928294, 1.8798531088052173, 1.8751276980218754, 1.8701963134193262, 1.8650390832338346, 1.8596298491796264, 1.8539964488532195, 1.848162191929408, 1.8420388960814189, 1.8356022194225028, 1.8288299392672644, 1.8217121990827885, 1.8142369213794169, 1.8063871868586119, 1.7981485561967421, 1.7895067514547143, 1.7804428373751167, 1.7709485758866679, 1.7610176412950158, 1.7506416498966475, 1.7398104551152314, 1.7285176118486933, 1.7167768670403669, 1.7046138392735772, 1.6919998148048097, 1.6789397830447981, 1.6654731314215458, 1.6516629769169398, 1.6374787214494881, 1.6229176563866932, 1.6079932826690384, 1.5927432182791399, 1.5771860031822778, 1.5613562076030847, 1.5452826352224283, 1.5290036960335993, 1.5125783527636818, 1.4960564768274189, 1.4794705755609612, 1.4628735005350941, 1.4462613336904437, 1.4297061985230872, 1.4132315822196171, 1.3968411098973619, 1.3805739885312476, 1.3644656349735751, 1.3485508703108733, 1.3328619033537992, 1.3174284056380503, 1.3022774922551856, 1.2874337713133859, 1.2729200712327646, 1.2587909273538012, 1.2450341482606864, 1.2316528224708172, 1.2186578462375046, 1.2060584227591569, 1.1938621048726106, 1.1820748323607424, 1.1707050899508076, 1.1597552172914769, 1.1492261842620508, 1.1391154743216578, 1.1294702963593914, 1.1203700492914102, 1.1117266933444125, 1.1034885566611985, 1.0956697908316286, 1.0882219511384177, 1.0811269304785289, 1.0743753861837171, 1.0679538782405333, 1.0618513467835309, 1.0560572583892947, 1.0505608807958149, 1.0453510747172574, 1.0404164308722277, 1.0357403540747108, 1.0313106750917518, 1.0271210962170314, 1.0231577990523397, 1.0194087419740734, 1.0158627747710289, 1.0125075028491612, 1.0093289408468749, 1.0063157191178573, 1.0034583436134425, 1.0007632306993657, 0.99821400051917542, 0.99579415276894145, 0.99349542342554942, 0.99130985360983559, 0.98923085119124587, 0.98725250659048436, 0.9853692974110736, 0.98357602651590947, 0.98186774400823029, 0.98023985772560984, 0.97868780958941171, 0.97720755957455263, 0.9757954948304246, 0.97444775979449083, 0.97316078979937637, 0.97193126406377572, 0.97075623304568071, 0.96963917381976872, 0.96857121070686303, 0.96754950407308216, 0.96657130966535576, 0.96563412519031389, 0.96473563558836439, 0.96387362726529269, 0.96304607873093617, 0.96225117136867488, 0.96148811637127585, 0.96075562659160507, 0.96005109753468909, 0.95937304220452102, 0.95872002555108948, 0.95809072418915764, 0.95748393156662803, 0.95689845581071253, 0.95633318558165503, 0.9557870838308905, 0.95525918183442504, 0.95474856589369084, 0.9542543860517585, 0.95377585031626722, 0.9533134495608574, 0.9528749132585449, 0.95245212200941554, 0.95204002523381004, 0.95163858637868814, 0.9512477543363751, 0.95086731049688622, 0.95049693507258826, 0.9501362665437173, 0.94978493699087474, 0.94944259072737303, 0.94910888299298601, 0.9487834893545567, 0.94846610481997817, 0.94815644252969533, 0.94785430216074251, 0.94755943159052025, 0.94727157011758067, 0.94699045962163786, 0.94671587610782704, 0.94644759528460531, 0.94618540735037571, 0.94592911463449647, 0.94567853047005068, 0.94543347824468593, 0.94519379058035624, 0.94495930499283676, 0.94472984727740195, 0.9445052477344501, 0.94428534683067444, 0.94406997027129536, 0.94385897588293699, 0.94365223605165249, 0.94344963546969707, 0.94325106614269383, 0.94305642611747764, 0.942865618559797, 0.94267855107483245, 0.94249513500138415, 0.9423152973431832, 0.94213897845724914, 0.94196610588744678, 0.94179660486967642, 0.94163040043962909, 0.94146741881486362, 0.9413075879891023, 0.94115083797140775, 0.9409972840002464, 0.94084694765973043, 0.94069961284062764, 0.94055520520434577, 0.94041362961969699, 0.94027502528280715, 0.94013960864665591, 0.94000700002244575, 0.93987705866867877, 0.93974967088347783, 0.93962474273121677, 0.93950219481502761, 0.93938195854660889, 0.93926397337023038, 0.93914818467157368, 0.93903454222162741, 0.93892299904299747, 0.93881351060328533, 0.93870603425452248, 0.93860052885227607, 0.93849695450152804, 0.93839527238969966, 0.93829544467737358, 0.93819743442606507, 0.93810120554894239, 0.93800672277511987, 0.9379139516216719, 0.93782285836973422, 0.93773341004276378, 0.93764557438577156, 0.93755931984514718, 0.93747461554882794, 0.93739143128695879, 0.93730973743200185, 0.9372295050916557, 0.93715070667042033, 0.93707331489245793, 0.93699730178923402, 0.93692263996420377, 0.93684930259981603, 0.9367772634635132, 0.93670649690665175, 0.93663697825571324, 0.93656868179378949, 0.93650158403959793, 0.9364356620712575, 0.936370893015258, 0.93630725451097629, 0.93624472468277808, 0.93618328212457713, 0.93612290598704861, 0.93606357574756693, 0.93600527132176381, 0.93594797304924693, 0.93589166168127547, 0.93583633214512296, 0.9357819743659358, 0.93572856709379004, 0.93567608962479021, 0.9356245217640774, 0.93557384383056719, 0.93552403666824246, 0.93547508165379156, 0.93542696069717535, 0.93537965623535957, 0.93533315122051497, 0.93528742910444607, 0.93524247978871522, 0.93519828909744185, 0.93515484348139866, 0.93511212850336478, 0.93507012936630018, 0.93502883133180503, 0.93498821991890335, 0.93494828098818883, 0.93490900076913519, 0.93487036586069494, 0.93483236254929558, 0.93479496842104426, 0.93475816678332635, 0.93472194510776851, 0.93468629193530728, 0.934651196267823, 0.93461664738579875, 0.93458263480593362, 0.93454914828207847, 0.93451617781266616, 0.93448371364337957, 0.93445174626381955, 0.93442026639964459, 0.93438926500248065, 0.93435873323908936, 0.93432866248085045, 0.93429904184100465, 0.93426986096847864, 0.93424111277796651, 0.93421279018864678, 0.93418488594415983, 0.9341573923420704, 0.9341303017723549, 0.93410360686323746, 0.93407730029309088, 0.93405137535131499, 0.93402582026633052, 0.93400062733672995, 0.93397579052955715, 0.93395130373713042, 0.9339271607916021, 0.93390335552091419, 0.93387988179947057, 0.93385673358666144, 0.93383390495362806, 0.93381139010040726, 0.93378918336581351, 0.93376727923204739, 0.93374567232557726, 0.93372435741551418, 0.93370332941030743, 0.9336825822075725, 0.93366210894003232, 0.93364190448280726, 0.93362196383154716, 0.93360228212475926, 0.93358285465439672, 0.9335636768656943, 0.93354474435174761, 0.93352605284596712, 0.93350759821384588, 0.93348937644487806, 0.93347138364489468, 0.93345361602906651, 0.93343606991542039, 0.93341874001227987, 0.93340162226660373, 0.93338471297947212, 0.93336800854284596, 0.9333515054509206, 0.933335200302713, 0.9333190897997542, 0.93330317074155345, 0.93328744002032349, 0.93327189461563409, 0.93325653158933297, 0.93324134808080106, 0.93322634130266124, 0.93321150853686519, 0.93319684713110129, 0.93318235449555065, 0.9331680280999255, 0.93315386547072199, 0.93313986418874251, 0.93312602188675708, 0.93311233624735934, 0.93309880500100284, 0.93308542592414512, 0.93307219683753451, 0.93305911560460253, 0.93304618012996132, 0.93303338835801819, 0.93302073827165199, 0.93300822789094728, 0.93299585527211382, 0.93298361850627931, 0.93297151571856196, 0.93295954506702272, 0.93294770474177757, 0.93293599296410357, 0.93292440798563137, 0.93291294808752179, 0.93290161157975526, 0.93289039680038477, 0.93287930211487458, 0.93286832591543145, 0.93285746662040148, 0.93284672267364621, 0.93283609254401045, 0.93282557472472005, 0.93281516773290829, 0.93280487010909074, 0.93279468041664859, 0.93278459724139695, 0.93277461919110694, 0.93276474489508954, 0.93275497300374843, 0.93274530218817309, 0.93273573113975783, 0.93272625856980651, 0.93271688320915513, 0.93270760380781959, 0.93269841913464502, 0.93268932797694126, 0.93268032914017385, 0.9326714214476477, 0.9326626037401532, 0.93265387487570461, 0.93264523372919905, 0.93263667919217264, 0.93262821017246811, 0.93261982559396528, 0.93261152439634587, 0.93260330553478976, 0.93259516797972419, 0.93258711071657774, 0.93257913274552517, 0.9325712330812419, 0.93256341075267313, 0.93255566480280649, 0.93254799428842128, 0.93254039827988189, 0.93253287586091116, 0.93252542612839384, 0.93251804819212147, 0.93251074117464916, 0.93250350421102934, 0.93249633644865004, 0.93248923704704612, 0.93248220517767, 0.9324752400237295, 0.93246834078002372, 0.93246150665269822, 0.9324547368591305, 0.93244803062772652, 0.93244138719774905, 0.93243480581915661, 0.93242828575241443, 0.93242182626838077, 0.93241542664809274, 0.93240908618263263, 0.93240280417297883, 0.93239657992984615, 0.9323904127735344, 0.93238430203377209, 0.93237824704961292, 0.93237224716922751, 0.93236630174982649, 0.9323604101574815, 0.93235457176701475, 0.93234878596184567, 0.93234305213387514, 0.93233736968334657, 0.93233173801873881, 0.93232615655661244, 0.93232062472150479, 0.93231514194581211, 0.93230970766966026, 0.93230432134079289, 0.93229898241446096, 0.93229369035330012, 0.93228844462723803, 0.93228324471336022, 0.93227809009580842, 0.93227298026569849, 0.93226791472098713, 0.93226289296639475, 0.93225791451326423, 0.93225297887951775, 0.93224808558950178, 0.93224323417394794, 0.93223842416982872, 0.93223365512028145, 0.93222892657454359, 0.93222423808781685, 0.93221958922120796, 0.93221497954163512, 0.9322104086217381, 0.9322058760397991, 0.93220138137965491, 0.93219692423061384, 0.93219250418738575, 0.93218812084999625, 0.93218377382368389, 0.93217946271887808, 0.9321751871510654, 0.93217094674076095, 0.93216674111339304, 0.93216256989928448, 0.93215843273351118, 0.93215432925590669, 0.93215025911093174, 0.93214622194764774, 0.93214221741962466, 0.93213824518488686, 0.9321343049058517, 0.93213039624925953, 0.93212651888609999, 0.93212267249157044, 0.93211885674502015, 0.93211507132984839, 0.93211131593349605, 0.93210759024735679, 0.93210389396673587, 0.93210022677624504, 0.93209658839054643, 0.93209297852303452, 0.93208939688767245, 0.93208584320057475, 0.93208231718066659, 0.93207881854077901, 0.93207534700962158, 0.93207190232384607, 0.93206848421956368, 0.93206509243426039, 0.93206172670770082, 0.93205838678234854, 0.93205507240353624, 0.93205178331951588, 0.93204851928147348, 0.93204528004350928, 0.93204206536260725, 0.93203887499861027, 0.93203570871419372, 0.93203256627481712, 0.93202944744873162, 0.93202635200690231, 0.93202327972299581, 0.93202023037338855, 0.93201720373706509, 0.93201419959564147, 0.93201121773331608, 0.93200825793684217, 0.93200531999548364, 0.93200240370101051, 0.93199950884763605, 0.93199663523201048, 0.93199378265318011, 0.93199095091254613, 0.93198813981386441, 0.93198534916317188, 0.93198257876880752, 0.93197982844132166, 0.93197709799349882, 0.93197438724030568, 0.93197169599886132, 0.93196902408841742, 0.93196637133031079, 0.93196373754796336, 0.93196112256682806, 0.93195852621438657, 0.93195594842946183, 0.93195338903718405, 0.93195084779311788, 0.93194832452000254, 0.93194581904939089, 0.93194333121591044, 0.93194086085661576, 0.93193840781091664, 0.93193597192065269, 0.9319335530300239, 0.93193115098553148, 0.93192876563587468, 0.93192639683184131, 0.93192404442619003, 0.93192170827354437, 0.9319193882303497, 0.9319170841547525, 0.93191479590655935, 0.9319125233472122, 0.93191026633968899, 0.93190802474853196, 0.93190579843975663, 0.93190358728086931, 0.93190139114081272, 0.93189920988996144, 0.93189704340008861, 0.93189489154435945, 0.93189275419729556, 0.93189063123478133, 0.93188852253401822, 0.93188642797351862, 0.93188434743311621, 0.9318822807939009, 0.93188022793824876, 0.9318781887497638, 0.93187616311331078, 0.93187415091494719, 0.93187215204195539, 0.93187016638279674, 0.93186819383851804, 0.93186623432228655, 0.93186428773582353, 0.93186235397124684, 0.93186043292195786, 0.93185852448254647, 0.93185662854873808, 0.93185474501605026, 0.93185287378214487, 0.93185101474713261, 0.93184916781061022, 0.93184733287328325, 0.93184550983693559, 0.93184369860444483, 0.9318418990797156, 0.93184011116766852, 0.93183833477422751, 0.93183656980628748, 0.93183481617170427, 0.93183307377928504, 0.93183134253876321, 0.93182962236079425, 0.93182791315694236, 0.93182621483965056, 0.93182452732225329, 0.93182285051896829, 0.93182118434485151, 0.93181952871581009, 0.93181788354875428, 0.93181624876182167, 0.93181462427372097, 0.93181301000372796, 0.93181140587179534, 0.93180981179865063, 0.93180822770578831, 0.93180665351550229, 0.93180508915082993, 0.93180353453556408, 0.93180198959424576, 0.93180045425215619, 0.93179892843528533, 0.93179741207033129, 0.93179590508472299, 0.93179440740656172, 0.93179291896464744, 0.93179143968845435, 0.93178996950818349, 0.93178850835472393, 0.93178705615957413, 0.93178561285479689, 0.93178417837306471, 0.93178275264770549, 0.93178133561269205, 0.93177992720261227, 0.93177852735267286, 0.93177713599870704, 0.93177575307714267, 0.931774378524999, 0.9317730122798803, 0.93177165427997777, 0.93177030446405362, 0.93176896277227106, 0.93176762916927958, 0.93176630359273915, 0.93176498597784763, 0.93176367626160661, 0.93176237438368692, 0.93176108028583582, 0.93175979391117925, 0.93175851520370412, 0.93175724410794247, 0.93175598056880404, 0.93175472453151487, 0.93175347594158464, 0.93175223474483915, 0.93175100088744645, 0.93174977431593031, 0.93174855497722675, 0.93174734281870264, 0.93174613778814708, 0.93174493983381657, 0.93174374887381972, 0.9317425648084231, 0.93174138769012083, 0.93174021745809288, 0.93173905405581126, 0.9317378974292172, 0.93173674752673696, 0.93173560429875546, 0.93173446769706258, 0.93173333767440469, 0.93173221418423768, 0.93173109718055347, 0.93172998661779138, 0.93172888245078622, 0.93172778463477668, 0.93172669312534973, 0.93172560787847369, 0.93172452885046753, 0.93172345599803186, 0.93172238927821749, 0.93172132864844037, 0.93172027406647828, 0.93171922549045205, 0.93171818287886776, 0.93171714619193624, 0.931716115391934, 0.93171509043890488, 0.93171407129302031, 0.93171305794148529, 0.93171205034712612, 0.93171104846812314, 0.93171005226296943, 0.93170906169098922, 0.93170807671236999, 0.93170709728799173, 0.93170612304178257, 0.93170515377532126, 0.93170418948533584, 0.93170323018577217, 0.93170227587610721, 0.9317013265439501, 0.93170038216715112, 0.93169944271562022, 0.93169850815293975, 0.93169757843787759, 0.93169665352558384, 0.93169573336856815, 0.93169481791758524, 0.93169390712220856, 0.93169300093136354, 0.93169209929373153, 0.93169120215798429, 0.93169030947307996, 0.93168942118835618, 0.93168853725370382, 0.93168765761961647, 0.93168678223726309, 0.93168591105854393, 0.9316850440360821, 0.93168418112325913, 0.93168332227421058, 0.93168246744386096, 0.93168161658787374, 0.93168076966265645, 0.93167992662538202, 0.93167908743392636, 0.9316782519530018, 0.93167742010265742, 0.93167659185799034, 0.93167576724918699, 0.93167494624766034, 0.93167412878360834, 0.9316733147818872, 0.9316725041654772, 0.9316716968579728, 0.93167089278523629, 0.93167009187640737, 0.93166929406448362, 0.93166849928652484, 0.93166770748374206, 0.93166691860136908, 0.93166613258849451, 0.93166534939783219, 0.93166456898547134, 0.93166379131060262, 0.93166301633530046, 0.93166224402421349, 0.93166147434440483, 0.93166070726508177, 0.93165994275740471, 0.93165918079432608, 0.93165842135038324, 0.93165766440157638, 0.93165690992521855, 0.93165615789980427, 0.93165540830490734, 0.93165466112106421, 0.93165391632969519, 0.93165317391301516, 0.93165243385395324, 0.93165169613609777, 0.93165096074363662, 0.93165022766127858, 0.93164949687424337, 0.93164876836819621, 0.93164804212919328, 0.93164731814368273, 0.93164659678848216, 0.93164587792675957, 0.93164516126357932, 0.93164444679291536, 0.93164373450715199, 0.93164302439681712, 0.93164231645139772, 0.93164161065981788, 0.93164090701077629, 0.93164020549288606, 0.93163950609481361, 0.93163880880530314, 0.93163811361321958, 0.93163742050756948, 0.9316367294775022, 0.93163604051232529, 0.93163535360147298, 0.93163466873452738, 0.93163398590121138], 'Rp': [0.96477769833978566, 0.96884168296274564, 0.97067702115063459, 0.97286425427801004, 0.97612010580069719, 0.97977551348646386, 0.98278532089140946, 0.98489509556151777, 0.98620992640874483, 0.98700554141048413, 0.98750679206070979, 0.98784857548791005, 0.98810028637798641, 0.98830062793412998, 0.98846013594216364, 0.98859757116020686, 0.98871993007680925, 0.98883140379663959, 0.98893503622628909, 0.98903320312358056, 0.98912829811079239, 0.98922069855337469, 0.98931284602698921, 0.98940623006641426, 0.98950244473835736, 0.98960334610902334, 0.9897107063188163, 0.98982553436784182, 0.98995115678055279, 0.99009018240415214, 0.99024490472400628, 0.99041757260373475, 0.99061024105991435, 0.99082663706306684, 0.99106794127175846, 0.99133618316145367, 0.99163308709187492, 0.9919573850079707, 0.99230721406748201, 0.99268190399949885, 0.99307848090420014, 0.99349195440818305, 0.99391386305795215, 0.99433141210432463, 0.99474184066244631, 0.9951326567229184, 0.99549461127943184, 0.99583617109387057, 0.99614370890050297, 0.99641711938619315, 0.99666248946842417, 0.99688150301735157, 0.99707522708729146, 0.99724491736120757, 0.9973926978683173, 0.99752056228509878, 0.99762938766380194, 0.99772161130881509, 0.99779934799167891, 0.99786498924101774, 0.99792021392967534, 0.99796669609465416, 0.99800588756296504, 0.99803897759226845, 0.99806695478828067, 0.99809042202985176, 0.99811003516567642, 0.99812679669996296, 0.99814114968513501, 0.99815350670211223, 0.99816419609572604, 0.99817348708904341, 0.99818160113506726, 0.99818872131758507, 0.99819500084763635, 0.99820056671294943, 0.99820552530546303, 0.998209965588718, 0.99821396194828027, 0.99821757670124278, 0.99822086237818564, 0.9982238636821742, 0.99822661930725298, 0.99822915722975558, 0.99823150345090605, 0.99823367961332854, 0.99823570606771683, 0.99823759887347263, 0.99823937126305884, 0.99824103505275275, 0.99824260145475541, 0.99824407857618047, 0.99824547408039566, 0.99824679464380772, 0.99824804611405726, 0.99824923364920304, 0.99825036181496962, 0.99825143463646604, 0.99825245574373744, 0.99825342842211573, 0.99825435563949261, 0.9982552400966419, 0.99825608430394697, 0.99825689064319734, 0.9982576610912246, 0.99825839759898438, 0.99825910195367185, 0.99825977589287207, 0.99826042103674884, 0.99826103890197204, 0.9982616309115464, 0.99826219840429997, 0.99826274264256332, 0.99826326481883709, 0.9982637660627699, 0.99826424744280184, 0.99826470997414862, 0.99826515462180809, 0.99826558230393614, 0.99826599324346599, 0.99826638879796326, 0.99826676988969387, 0.99826713655952104, 0.99826748935044074, 0.99826782980995121, 0.99826815859583529, 0.99826847634719174, 0.99826878341385128, 0.99826908078266019, 0.9982693688278913, 0.99826964808627694, 0.99826991908426665, 0.9982701823249982, 0.99827043828938455, 0.99827068743730507, 0.99827093020899815, 0.99827116702642371, 0.998271398295137, 0.99827162442609163, 0.99827184579238781, 0.99827206275384639, 0.99827227565834009, 0.99827248485439113, 0.99827269067505875, 0.99827289343628567, 0.99827309344555704, 0.99827329101048312, 0.99827348643890945, 0.99827368001907191, 0.99827387219940278, 0.99827406127668061, 0.99827424873688908, 0.99827443524810255, 0.99827462111413956, 0.99827480663284829, 0.99827499210965531, 0.99827517782795672, 0.99827536405224016, 0.99827555107738741, 0.99827573917183887, 0.99827592866356829, 0.99827612001673971, 0.99827631355871471, 0.99827650958033876, 0.99827670835663063, 0.99827691015511189, 0.99827711523987939, 0.99827732387470647, 0.99827753632490424, 0.99827775285904075, 0.99827797375037441, 0.99827819927789507, 0.99827842972738245, 0.99827866539241683, 0.9982789065754154, 0.99827915348586727, 0.99827940606865206, 0.99827966432693693, 0.99827992933604415, 0.99828020146650798, 0.99828048109399348, 0.99828076860453496, 0.99828106440316844, 0.99828136891502206, 0.9982816825839802, 0.99828200587258198, 0.99828233923785747, 0.99828268321600799, 0.99828303837747057, 0.99828340533289661, 0.99828378471897228, 0.99828417719853157, 0.99828458344724824, 0.99828500420006239, 0.99828544021802335, 0.9982858922975254, 0.99828636127630488, 0.99828684803728329, 0.99828735357721254, 0.99828787894473237, 0.99828842518875305, 0.99828899342035726, 0.9982895848174097, 0.99829020062814922, 0.99829084217229791, 0.99829151084872536, 0.9982922081448482, 0.99829293564020505, 0.99829369501271836, 0.9982944880458674, 0.99829530638646635, 0.99829615156907492, 0.99829703463181463, 0.99829795775875829, 0.99829892316155977, 0.99829993220508118, 0.99830098906529285, 0.99830209638372602, 0.99830325667783582, 0.99830447246470833, 0.99830574783663739, 0.99830708628389286, 0.99830849151557699, 0.99830996748657364, 0.99831151834659237, 0.9983131497113078, 0.99831486469329045, 0.99831666689467735, 0.99831856183057432, 0.99832055538877884, 0.99832265380049323, 0.99832486364542994, 0.99832719186701613, 0.99832964579827688, 0.99833223708352303, 0.99833496578922432, 0.99833783813525834, 0.99834086361668517, 0.99834405221589462, 0.99834741425847739, 0.99835096043759142, 0.99835471963211786, 0.99835866196987699, 0.99836279119165339, 0.99836710036421261, 0.99837160687121806, 0.9983763335885516, 0.99838125616600337, 0.99838635423735578, 0.99839170484560946, 0.99839732925973035, 0.99840324689601323, 0.99840946635929628, 0.99841599820269644, 0.99842285720806234, 0.99843005598359535, 0.99843760701992923, 0.99844552690913979, 0.99845382273221472, 0.99846250006210724, 0.99847156622558686, 0.99848103010770939, 0.99849089735939711, 0.99850115592019195, 0.99851178341442814, 0.99852280495379331, 0.99853421617171756, 0.99854598156551178, 0.99855804737890408, 0.99857044024341235, 0.99858316240684997, 0.99859620205087363, 0.99860952625143318, 0.99862311880301402, 0.99863694950052928, 0.99865099338740659, 0.99866521662202901, 0.99867956781573874, 0.99869400317347246, 0.99870849428211717, 0.99872299512325247, 0.9987375089215389, 0.99875197296999285, 0.99876636650976491, 0.99878068618565696, 0.99879489795314413, 0.99880897086707443, 0.99882287449137719, 0.99883658067327874, 0.9988500634780928, 0.99886329920689321, 0.99887626633265936, 0.99888894496763025, 0.99890128756972718, 0.99891330476007134, 0.99892499378327837, 0.9989363450910459, 0.99894735063445417, 0.99895800381454514, 0.99896829944653465, 0.99897823015437182, 0.99898779391610804, 0.99899698992849173, 0.9990058203468406, 0.99901424408365003, 0.99902219159518912, 0.99902973993406485, 0.99903693411189576, 0.99904377400217703, 0.99905027905604016, 0.99905647435020695, 0.99906236981681418, 0.99906797699359229, 0.99907330547395412, 0.99907836444524478, 0.99908316328689939, 0.99908771174012656, 0.99909201978234652, 0.99909610144607497, 0.99909996762461228, 0.99910362470802161, 0.9991070843777754, 0.99911035703303352, 0.99911345237364224, 0.99911638125984237, 0.99911915595442913, 0.99912178628890824, 0.9991242806714713, 0.99912663345218511, 0.9991288587039705, 0.9991309707114816, 0.99913297731366535, 0.99913488502537773, 0.99913669964136365, 0.99913842633836614, 0.99914006996483296, 0.99914163513515641, 0.99914312606240108, 0.99914454676888886, 0.99914590130882841, 0.99914719323171952, 0.99914842557105799, 0.99914960171513778, 0.99915072479306044, 0.99915179769662688, 0.99915282333351185, 0.99915379823131334, 0.99915473016678991, 0.99915562168467842, 0.99915647520370821, 0.99915729290994615, 0.99915807683377289, 0.99915882891736019, 0.99915955092145614, 0.99916024444330598, 0.99916091015537778, 0.99916154917006705, 0.99916216376981992, 0.99916275525348552, 0.99916332487904402, 0.99916387380540039, 0.99916440308748766, 0.99916491376836247, 0.99916540681980115, 0.99916588314808275, 0.99916634359939094, 0.99916678897166156, 0.99916722000765712, 0.99916763739952397, 0.99916804094784539, 0.99916842456057864, 0.99916879274857473, 0.9991691519792536, 0.99916950206387412, 0.99916984295169931, 0.99917017479406667, 0.99917049785497913, 0.99917081244521389, 0.99917111888512378, 0.99917141748566873, 0.9991717085488957, 0.99917199235892407, 0.99917226918260282, 0.99917253927072458, 0.99917280279884335, 0.99917305998815797, 0.99917331106560858, 0.99917355625244142, 0.99917379574923615, 0.99917402975084058, 0.99917425843975594, 0.9991744819880618, 0.99917470055832758, 0.99917491430442085, 0.99917512337215397, 0.99917532790339125, 0.99917552805054555, 0.99917572396172682, 0.99917591577471909, 0.99917610364191789, 0.99917628768712019, 0.99917646802160043, 0.99917664474581114, 0.99917681795390811, 0.99917698773480268, 0.99917715417293829, 0.99917731734891702, 0.99917747733939899, 0.9991776342133738, 0.99917778803076107, 0.99917793885091621, 0.9991780867353609, 0.99917823174705511, 0.99917837394872966, 0.99917851340212105, 0.99917865016759144, 0.99917878398699989, 0.99917891508572754, 0.99917904368059174, 0.99917916971869181, 0.99917929328166621, 0.9991794142549546, 0.99917953244955071, 0.99917964817998428, 0.99917976157311361, 0.99917987273089248, 0.99917998173747558, 0.99918008866350172, 0.99918019356975074, 0.99918029650964491, 0.9991803975312562, 0.99918049667871955, 0.99918059399320558, 0.9991806895137717, 0.99918078327773219, 0.99918087532111122, 0.99918096567880099, 0.99918105438475235, 0.99918114147204373, 0.99918122697297118, 0.99918131091906448, 0.99918139334115907, 0.99918147426937909, 0.99918155373317752, 0.99918163176135466, 0.99918170838210107, 0.99918178362295273, 0.99918185751087552, 0.99918193007223088, 0.99918200133305668, 0.99918207131848846, 0.99918214005259054, 0.99918220755934362, 0.99918227386315772, 0.99918233898794329, 0.99918240295706207, 0.99918246579339842, 0.9991825275192916, 0.9991825881568388, 0.99918264772712551, 0.9991827062510048, 0.99918276374893977, 0.99918282024085114, 0.99918287574624465, 0.99918293028417937, 0.99918298387332194, 0.99918303653187157, 0.99918308827772784, 0.99918313912842038, 0.99918318910108728, 0.99918323821253852, 0.99918328646697741, 0.99918333387324376, 0.99918338045011701, 0.99918342621570977, 0.99918347118766904, 0.99918351538316008, 0.99918355881887677, 0.99918360151106589, 0.99918364347550703, 0.9991836847275285, 0.99918372528199995, 0.99918376515336127, 0.99918380435216003, 0.99918384289206053, 0.99918388078356024, 0.99918391803830209, 0.99918395466869425, 0.99918399068731356, 0.99918402610665524, 0.9991840609389947, 0.99918409519632567, 0.99918412889034292, 0.99918416203393523, 0.99918419464270347, 0.99918422673427476, 0.99918425831987434, 0.99918428940957638, 0.99918432001296786, 0.99918435013934481, 0.99918437979781971, 0.99918440899725758, 0.99918443774636323, 0.99918446605360267, 0.99918449392727016, 0.99918452137543579, 0.99918454840598137, 0.9991845750266235, 0.99918460124488828, 0.999184627070413, 0.99918465251239563, 0.99918467757698559, 0.99918470227021561, 0.99918472659833346, 0.99918475056836453, 0.99918477418707086, 0.99918479746070732, 0.99918482039555412, 0.99918484299736987, 0.99918486527678663, 0.99918488724065013, 0.99918490889406864, 0.99918493024221899, 0.99918495129036211, 0.99918497204381507, 0.9991849925078542, 0.99918501268774729, 0.99918503258863622, 0.99918505221559273, 0.9991850715735503, 0.9991850906673363, 0.9991851095016383, 0.99918512808102866, 0.99918514640995892, 0.99918516449378747, 0.99918518233854492, 0.99918519994867727, 0.99918521732854837, 0.99918523448237295, 0.99918525141428594, 0.99918526812825381, 0.99918528462812273, 0.99918530091762137, 0.99918531700037405, 0.9991853328798711, 0.99918534855953001, 0.99918536404264391, 0.99918537933243212, 0.99918539443359755, 0.99918540934967492, 0.99918542408385447, 0.99918543863929787, 0.99918545301903583, 0.99918546722603796, 0.99918548126318041, 0.99918549513325394, 0.9991855088389745, 0.99918552238297342, 0.99918553576782598, 0.99918554899600165, 0.9991855620699599, 0.99918557499206051, 0.99918558776461774, 0.9991856003898919, 0.99918561287008645, 0.99918562520736531, 0.99918563740384025, 0.99918564946156974, 0.99918566138258924, 0.99918567316886187, 0.99918568482234404, 0.99918569634492505, 0.99918570773847892, 0.99918571900482778, 0.99918573014576406, 0.9991857411630598, 0.99918575205843507, 0.99918576283358429, 0.99918577349018356, 0.99918578402985248, 0.99918579445420985, 0.99918580476483698, 0.99918581496328474, 0.99918582505107811, 0.99918583502970904, 0.99918584490067164, 0.99918585466540022, 0.99918586432532353, 0.99918587388184887, 0.99918588333636271, 0.99918589269021474, 0.99918590194474211, 0.9991859111012682, 0.99918592016108188, 0.99918592912545279, 0.99918593799563959, 0.99918594677287631, 0.99918595545837707, 0.99918596405333981, 0.99918597255894648, 0.99918598097634881, 0.99918598930670055, 0.9991859975511127, 0.99918600571070504, 0.9991860137865588, 0.99918602177975846, 0.99918602969135806, 0.99918603752239998, 0.99918604527391275, 0.99918605294690477, 0.99918606054239001, 0.99918606806132393, 0.99918607550468841, 0.9991860828734408, 0.99918609016851412, 0.99918609739083308, 0.9991861045413144, 0.99918611162086024, 0.99918611863034512, 0.99918612557065001, 0.99918613244263654, 0.99918613924714583, 0.99918614598501909, 0.99918615265707333, 0.99918615926412768, 0.99918616580698427, 0.99918617228642304, 0.99918617870322168, 0.99918618505814794, 0.99918619135196773, 0.9991861975854105, 0.99918620375921219, 0.9991862098740999, 0.9991862159307956, 0.99918622192998796, 0.99918622787237332, 0.9991862337586338, 0.99918623958945796, 0.99918624536549216, 0.99918625108739967, 0.9991862567558194, 0.9991862623714044, 0.99918626793476018, 0.99918627344651512, 0.9991862789072794, 0.99918628431766443, 0.99918628967825363, 0.99918629498963718, 0.9991863002523923, 0.99918630546707421, 0.99918631063425489, 0.99918631575449213, 0.99918632082833281, 0.9991863258563054, 0.9991863308389366, 0.99918633577677829, 0.99918634067031609, 0.99918634552006991, 0.99918635032655079, 0.99918635509024101, 0.99918635981163695, 0.99918636449121934, 0.99918636912945824, 0.99918637372683416, 0.99918637828380408, 0.99918638280082595, 0.99918638727834252, 0.99918639171680923, 0.99918639611665583, 0.99918640047832619, 0.99918640480223297, 0.99918640908880463, 0.99918641333845248, 0.99918641755160031, 0.99918642172863126, 0.99918642586995332, 0.99918642997595863, 0.99918643404705121, 0.99918643808359209, 0.99918644208595875, 0.99918644605454876, 0.99918644998971395, 0.99918645389181326, 0.99918645776121029, 0.99918646159826663, 0.99918646540331901, 0.99918646917671905, 0.99918647291881169, 0.99918647662991977, 0.99918648031037904, 0.9991864839605209, 0.99918648758066442, 0.99918649117113278, 0.99918649473224119, 0.9991864982642924, 0.99918650176759827, 0.99918650524245445, 0.99918650868916636, 0.999186512108031, 0.99918651549933424, 0.99918651886336551, 0.9991865222004026, 0.99918652551073628, 0.99918652879463798, 0.99918653205237162, 0.99918653528422074, 0.99918653849044181, 0.99918654167133769, 0.99918654482712521, 0.9991865479580605, 0.99918655106439214, 0.99918655414636048, 0.99918655720420857, 0.99918656023821217, 0.99918656324860111, 0.99918656623559488, 0.99918656919942062, 0.99918657214030349, 0.99918657505847674, 0.99918657795415577, 0.99918658082756562, 0.99918658367893542, 0.99918658650847503, 0.99918658931641047, 0.99918659210295113, 0.99918659486830397, 0.99918659761267581, 0.9991866003362766, 0.99918660303930196, 0.99918660572197204, 0.99918660838444706, 0.99918661102696216, 0.99918661364968653, 0.99918661625282557, 0.99918661883655535, 0.99918662140106562, 0.9991866239465419, 0.99918662647316603, 0.99918662898112554, 0.99918663147058062, 0.99918663394172125, 0.99918663639471161, 0.99918663882972991, 0.99918664124693879, 0.99918664364652221, 0.99918664602862362, 0.99918664839342008, 0.99918665074106361, 0.9991866530717266, 0.99918665538554952, 0.99918665768270665, 0.99918665996333544, 0.99918666222759622, 0.9991866644756533, 0.99918666671147449, 0.99918666892734198, 0.99918667112683401, 0.9991866733107454, 0.99918667547920714, 0.99918667763235813, 0.99918667977035125, 0.99918668189331283, 0.99918668400138066, 0.9991866860946883, 0.99918668817336997, 0.99918669023755091, 0.9991866922873569, 0.99918669432292584, 0.99918669634437307, 0.99918669835180962, 0.99918670034537638, 0.99918670232518736, 0.99918670429136502, 0.99918670624401429, 0.99918670818325905, 0.99918671010922111, 0.99918671202200748, 0.99918671392173541, 0.99918671580852114, 0.99918671768246192, 0.99918671954367788, 0.99918672139227582, 0.99918672322836721, 0.99918672505205486, 0.99918672686344123, 0.99918672866263492, 0.99918673044974349, 0.9991867322248672, 0.99918673398809243, 0.99918673573954031, 0.99918673747930387, 0.9991867392074778, 0.99918674092415216, 0.99918674262950669, 0.99918674432359067, 0.99918674600641166, 0.99918674767807913, 0.99918674933868545, 0.99918675098832643, 0.99918675262710421, 0.99918675425508963, 0.99918675587237826, 0.99918675747906649, 0.99918675907524146, 0.99918676066098555, 0.99918676223638625, 0.99918676380153171, 0.99918676535650519, 0.99918676690137687, 0.99918676843624565, 0.99918676996117795, 0.99918677147626767, 0.99918677298158165, 0.99918677447720372, 0.99918677596321037, 0.99918677743968953, 0.99918677890670504, 0.99918678036433506, 0.99918678181265652, 0.99918678325173371, 0.999186784681659, 0.99918678610249678, 0.99918678751430279, 0.99918678891716939, 0.99918679031115498, 0.99918679169633595, 0.99918679307277736, 0.99918679444054459, 0.99918679579970882, 0.9991867971503392, 0.99918679849250513, 0.99918679982626191, 0.99918680115167613, 0.99918680246882507, 0.99918680377776048, 0.99918680507855051, 0.99918680637124901, 0.99918680765594159, 0.99918680893265777, 0.99918681020149047, 0.9991868114624709, 0.99918681271567233, 0.99918681396116416, 0.99918681519898656, 0.9991868164292067, 0.99918681765187478, 0.99918681886706717, 0.99918682007481319, 0.9991868212751891, 0.99918682246824109, 0.999186823654034, 0.99918682483260446, 0.99918682600402309, 0.99918682716833718, 0.99918682832558603, 0.99918682947544768, 0.99918683061819979, 0.99918683175399758, 0.9991868328829232, 0.99918683400506136, 0.99918683512046846, 0.99918683622920768, 0.99918683733130254, 0.99918683842680533, 0.99918683951577214, 0.99918684059824081, 0.99918684167426464, 0.99918684274389047, 0.99918684380714773, 0.99918684486409182, 0.99918684591477469, 0.99918684695922833, 0.99918684799751545, 0.99918684902966248, 0.99918685005583063, 0.99918685107633143, 0.99918685209073321, 0.99918685309913213, 0.99918685410159536, 0.99918685509816307, 0.99918685608887969, 0.9991868570737954, 0.99918685805295548, 0.99918685902640647, 0.99918685999417889, 0.99918686095632003, 0.99918686191286565, 0.9991868628638636, 0.99918686380935706, 0.99918686474936802, 0.9991868656839511, 0.99918686661313805, 0.99918686753696739, 0.99918686845548454, 0.99918686936871415, 0.99918687027670916, 0.99918687117949456, 0.99918687207710422, 0.99918687296957487, 0.99918687385695892, 0.99918687473926793, 0.99918687561654118, 0.99918687648866678, 0.99918687735570277, 0.99918687821773733, 0.99918687907483494, 0.9991868799270418, 0.99918688077440287, 0.99918688161694225, 0.99918688245650666, 0.99918688329188765, 0.99918688412272116, 0.99918688494903152, 0.99918688577086723, 0.99918688658827559, 0.9991868874012918, 0.99918688820997859, 0.99918688901437858, 0.99918688981455483, 0.99918689061054067, 0.99918689140238293, 0.99918689219015533, 0.99918689297388408, 0.99918689375362346, 0.99918689452942333, 0.99918689530133986, 0.99918689606939148, 0.99918689683365747, 0.9991868975941538, 0.99918689835094265, 0.99918689910405767, 0.99918689985354525, 0.99918690059944637, 0.99918690134179944, 0.99918690208064653, 0.99918690281602196, 0.99918690354797812, 0.99918690427653867, 0.9991869050017449, 0.99918690572363511, 0.99918690644248209, 0.99918690715840774, 0.99918690787135778, 0.99918690858123715, 0.99918690928801468, 0.99918690999172188, 0.9991869106924175, 0.99918691139016524, 0.99918691208503041, 0.99918691277707494, 0.99918691346636723, 0.99918691415296113, 0.99918691483691002, 0.99918691551828642, 0.99918691619712718, 0.99918691687349226, 0.99918691754741651, 0.99918691821893435, 0.99918691888809164, 0.99918691955491312, 0.99918692021945443, 0.99918692088171701, 0.99918692154174515, 0.99918692219956262, 0.99918692285517829, 0.99918692350863658, 0.99918692415994315, 0.99918692480913152, 0.99918692545620014, 0.99918692610119375, 0.99918692674410148, 0.99918692738495229, 0.99918692802376718, 0.99918692866055892, 0.99918692929532449, 0.9991869299280991, 0.99918693055889241, 0.99918693118770396, 0.99918693181455964, 0.99918693243946932, 0.99918693306243267, 0.99918693368286593, 0.99918693430103134, 0.99918693491742339, 0.99918693553202098, 0.99918693614478349, 0.99918693675569448, 0.99918693736475128, 0.99918693797196978, 0.99918693857735552, 0.99918693918090795, 0.99918693978265571, 0.99918694038257339, 0.99918694098070848, 0.99918694157704591, 0.99918694217160664, 0.99918694276439368, 0.99918694335541669, 0.99918694394470442, 0.99918694453222878]}
@@ -11,6 +11,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmtf_np import NMTF
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 
 import numpy, matplotlib.pyplot as plt
 
@@ -35,14 +36,15 @@ numpy.random.seed(3)
 # Run the algorithm
 nmtf = NMTF(R,M,K,L) 
 nmtf.initialise(init_S,init_FG,expo_prior)
-nmtf.run(iterations)
+performances_sink = MemorySink()
+nmtf.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Extract the performances across all iterations
-print "np_all_performances = %s" % nmtf.all_performances
+print "np_all_performances = %s" % performances_sink.values
 
 '''
 np_all_performances = {'R^2': [0.6258765455951327, 0.671376745958256, 0.6803219120927243, 0.6856724319385931, 0.6897914419619472, 0.693147668097625, 0.6959811377094869, 0.6984460090216679, 0.7006472286777821, 0.7026587622894724, 0.7045341232137792, 0.7063128114672601, 0.7080244204252755, 0.7096913436703565, 0.7113306059462803, 0.7129551283280895, 0.7145746192465009, 0.7161962140253131, 0.7178249437779788, 0.7194640883103198, 0.7211154507582819, 0.7227795804176518, 0.7244559624367721, 0.7261431874292845, 0.727839109816731, 0.7295410003444678, 0.7312456954532567, 0.7329497438997568, 0.7346495491655097, 0.7363415047974591, 0.7380221189312353, 0.7396881239019524, 0.7413365670539753, 0.7429648795783304, 0.7445709213344134, 0.7461530010054735, 0.7477098724206034, 0.7492407092763647, 0.7507450616601901, 0.7522227986132095, 0.7536740414235877, 0.7550990924172131, 0.7564983637560747, 0.7578723102382867, 0.759221369399819, 0.7605459114267878, 0.7618462005669655, 0.7631223689326495, 0.7643744028513428, 0.765602141268819, 0.7668052851552061, 0.7679834164162722, 0.7691360244737355, 0.7702625384534849, 0.7713623628105186, 0.7724349142236626, 0.7734796577072913, 0.7744961401017674, 0.7754840194036234, 0.7764430887593917, 0.7773732943474946, 0.7782747467825799, 0.7791477260677306, 0.7799926804674834, 0.7808102199582613, 0.7816011051203922, 0.7823662324620537, 0.7831066172126196, 0.7838233745994262, 0.7845177005410143, 0.785190852566753, 0.7858441316237655, 0.7864788652720837, 0.7870963926111524, 0.7876980511349074, 0.7882851655857301, 0.7888590387734287, 0.7894209442452303, 0.7899721206358733, 0.7905137674910102, 0.7910470423391899, 0.791573058784101, 0.7920928853962438, 0.7926075451982648, 0.7931180155583303, 0.7936252283285828, 0.7941300700894178, 0.7946333823835751, 0.7951359618461358, 0.7956385601569888, 0.7961418837608885, 0.7966465933170376, 0.7971533028551979, 0.7976625786290102, 0.7981749376697514, 0.7986908460554478, 0.7992107169213317, 0.7997349082484082, 0.8002637204773996, 0.8007973940056683, 0.8013361066349949, 0.8018799710479642, 0.8024290324001834, 0.8029832661242544, 0.8035425760488937, 0.8041067929424296, 0.8046756735935928, 0.8052489005433014, 0.8058260825786728, 0.8064067560938706, 0.8069903874113532, 0.8075763761410697, 0.8081640596338084, 0.8087527185584095, 0.8093415836010034, 0.8099298432483335, 0.8105166525778709, 0.8111011429357434, 0.8116824323418015, 0.812259636421115, 0.8128318796257386, 0.8133983064818715, 0.8139580925784748, 0.8145104550058159, 0.815054661958226, 0.8155900412352294, 0.816115987408929, 0.8166319674719317, 0.8171375248367072, 0.8176322816207924, 0.8181159392187842, 0.8185882772273158, 0.8190491508490999, 0.8194984869530633, 0.8199362790067936, 0.8203625811234141, 0.8207775014768911, 0.8211811953384532, 0.8215738579735175, 0.8219557176156512, 0.8223270287040902, 0.8226880655369757, 0.8230391164562444, 0.823380478644368, 0.8237124535796017, 0.8240353431664814, 0.8243494465328649, 0.8246550574641626, 0.8249524624297042, 0.8252419391451161, 0.825523755607727, 0.8257981695388076, 0.8260654281662844, 0.8263257682837581, 0.8265794165257485, 0.8268265898043415, 0.8270674958585787, 0.827302333874432, 0.8275312951398783, 0.8277545637059902, 0.8279723170311158, 0.8281847265907942, 0.8283919584410933, 0.8285941737274107, 0.8287915291345256, 0.8289841772767139, 0.8291722670292185, 0.8293559438041922, 0.8295353497755956, 0.8297106240584029, 0.8298819028479529, 0.8300493195254495, 0.8302130047355416, 0.8303730864415927, 0.8305296899638277, 0.8306829380050492, 0.8308329506679721, 0.8309798454676971, 0.8311237373422034, 0.8312647386632126, 0.8314029592492389, 0.8315385063821848, 0.8316714848284339, 0.8318019968650442, 0.831930142311349, 0.8320560185660513, 0.8321797206496808, 0.8323013412521895, 0.8324209707853084, 0.8325386974392585, 0.8326546072433337, 0.832768784129889, 0.8328813100012444, 0.8329922647990048, 0.8331017265753845, 0.8332097715660716, 0.8333164742642625, 0.8334219074954975, 0.8335261424929767, 0.8336292489730788, 0.8337312952108127, 0.8338323481149934, 0.8339324733029623, 0.8340317351746711, 0.8341301969860091, 0.8342279209212609, 0.8343249681646088, 0.8344213989705929, 0.834517272733503, 0.8346126480556397, 0.8347075828144304, 0.8348021342283858, 0.8348963589218892, 0.8349903129888252, 0.8350840520550502, 0.835177631339733, 0.8352711057155774, 0.8353645297679433, 0.8354579578529047, 0.835551444154261, 0.8356450427395304, 0.83573880761494, 0.8358327927794561, 0.8359270522778468, 0.8360216402528213, 0.8361166109962259, 0.8362120189993376, 0.8363079190022087, 0.8364043660421132, 0.8365014155010184, 0.8365991231521018, 0.8366975452052544, 0.8367967383515347, 0.8368967598065128, 0.8369976673524296, 0.8370995193791071, 0.8372023749234825, 0.8373062937076752, 0.837411336175451, 0.8375175635269245, 0.8376250377513541, 0.8377338216578031, 0.8378439789035215, 0.8379555740197406, 0.8380686724346903, 0.8381833404935153, 0.8382996454748106, 0.8384176556034277, 0.8385374400591902, 0.8386590689811287, 0.8387826134668127, 0.8389081455663162, 0.8390357382703296, 0.839165465491903, 0.839297402041246, 0.8394316235930064, 0.8395682066453881, 0.8397072284704412, 0.8398487670548468, 0.8399929010304237, 0.840139709593636, 0.8402892724132509, 0.8404416695253756, 0.8405969812149678, 0.8407552878829868, 0.840916669898252, 0.8410812074331463, 0.841248980282219, 0.8414200676628075, 0.8415945479967634, 0.8417724986724477, 0.8419539957861119, 0.8421391138619463, 0.8423279255500258, 0.8425205013015631, 0.842716909020936, 0.8429172136940899, 0.8431214769930866, 0.8433297568567467, 0.843542107047522, 0.8437585766850092, 0.8439792097567662, 0.8442040446074155, 0.8444331134073539, 0.8446664416027854, 0.8449040473491941, 0.8451459409308576, 0.8453921241694491, 0.8456425898253405, 0.8458973209957441, 0.8461562905143882, 0.8464194603580439, 0.8466867810657559, 0.8469581911772688, 0.8472336166976483, 0.847512970595673, 0.8477961523440345, 0.8480830475098007, 0.848373527403925, 0.8486674487988458, 0.8489646537232818, 0.8492649693433373, 0.8495682079388256, 0.8498741669833697, 0.8501826293362937, 0.850493363553598, 0.8508061243243566, 0.8511206530378093, 0.8514366784850338, 0.8517539176976575, 0.8520720769243642, 0.8523908527441609, 0.8527099333134055, 0.8530289997415705, 0.8533477275885591, 0.8536657884742199, 0.8539828517884703, 0.8542985864882418, 0.8546126629652357, 0.8549247549664247, 0.8552345415471878, 0.8555417090351449, 0.8558459529811926, 0.8561469800728705, 0.8564445099843159, 0.8567382771365423, 0.8570280323418775, 0.8573135443070551, 0.8575946009708252, 0.8578710106540459, 0.8581426030030407, 0.8584092297105115, 0.8586707650025107, 0.8589271058846257, 0.8591781721456115, 0.8594239061219854, 0.8596642722322785, 0.8598992562946918, 0.8601288646464356, 0.8603531230869504, 0.8605720756703725, 0.8607857833748224, 0.860994322677429, 0.8611977840642966, 0.8613962705041279, 0.8615898959127144, 0.8617787836335441, 0.8619630649569946, 0.8621428776976507, 0.8623183648459068, 0.8624896733067144, 0.8626569527349368, 0.8628203544736819, 0.8629800305989854, 0.8631361330716703, 0.8632888129949214, 0.8634382199742404, 0.8635845015749304, 0.8637278028711065, 0.8638682660793895, 0.8640060302698868, 0.8641412311468221, 0.8642740008910356, 0.8644044680567182, 0.8645327575149447, 0.8646589904368904, 0.8647832843100016, 0.864905752980818, 0.8650265067185475, 0.8651456522939839, 0.8652632930686973, 0.8653795290898753, 0.8654944571865305, 0.8656081710630661, 0.8657207613865725, 0.8658323158643572, 0.8659429193085387, 0.8660526536846667, 0.8661615981415651, 0.8662698290197333, 0.866377419835914, 0.8664844412415664, 0.8665909609533258, 0.8666970436538094, 0.8668027508615124, 0.8669081407690424, 0.8670132680494975, 0.8671181836314994, 0.8672229344442106, 0.8673275631346359, 0.8674321077605852, 0.8675366014639023, 0.867641072129883, 0.8677455420402328, 0.8678500275283321, 0.8679545386470329, 0.8680590788605537, 0.8681636447731886, 0.8682682259084833, 0.8683728045530582, 0.8684773556793163, 0.868581846960774, 0.8686862388925796, 0.8687904850278584, 0.8688945323379238, 0.8689983217009387, 0.8691017885196105, 0.869204863463855, 0.8693074733294502, 0.8694095419985982, 0.8695109914834015, 0.8696117430288459, 0.8697117182481688, 0.8698108402608928, 0.8699090348024602, 0.8700062312744792, 0.8701023637061892, 0.87019737160076, 0.8702912006443515, 0.8703838032612021, 0.8704751390040876, 0.8705651747758714, 0.8706538848842501, 0.8707412509377179, 0.8708272615960317, 0.8709119121926547, 0.870995204249795, 0.8710771449085528, 0.871157746297405, 0.8712370248618833, 0.8713150006770345, 0.8713916967621926, 0.8714671384150481, 0.8715413525791581, 0.8716143672560297, 0.8716862109700259, 0.8717569122915705, 0.8718264994217109, 0.8718949998389671, 0.8719624400076581, 0.8720288451455366, 0.8720942390475163, 0.8721586439615837, 0.8722220805124952, 0.8722845676686424, 0.8723461227473881, 0.8724067614541637, 0.872466497950807, 0.8725253449487114, 0.8725833138225769, 0.8726404147407464, 0.872696656808276, 0.8727520482191256, 0.8728065964139684, 0.872860308240387, 0.8729131901123585, 0.8729652481661581, 0.8730164884100796, 0.873066916865551, 0.8731165396976026, 0.8731653633328712, 0.8732133945637253, 0.8732606406374042, 0.8733071093294619, 0.8733528090011609, 0.8733977486408188, 0.8734419378894576, 0.8734853870514189, 0.8735281070908938, 0.8735701096155343, 0.8736114068485277, 0.8736520115906239, 0.8736919371737148, 0.8737311974075892, 0.873769806521481, 0.8738077791019723, 0.873845130028728, 0.8738818744094217, 0.8739180275150592, 0.8739536047167796, 0.8739886214250261, 0.8740230930318161, 0.8740570348566938, 0.8740904620967739, 0.8741233897811744, 0.8741558327299699, 0.874187805517707, 0.8742193224414417, 0.8742503974931399, 0.8742810443362683, 0.874311276286313, 0.8743411062949646, 0.8743705469376652, 0.8743996104042091, 0.8744283084921122, 0.874456652602412, 0.874484653737657, 0.8745123225017769, 0.8745396691016045, 0.8745667033498125, 0.874593434669067, 0.8746198720971918, 0.8746460242932, 0.8746718995440489, 0.8746975057719718, 0.8747228505423112, 0.8747479410717358, 0.8747727842367752, 0.8747973865826124, 0.87482175433206, 0.8748458933946974, 0.8748698093761128, 0.8748935075872207, 0.8749169930536348, 0.8749402705250582, 0.8749633444846868, 0.8749862191585882, 0.8750088985250627, 0.8750313863239457, 0.875053686065851, 0.8750758010413513, 0.8750977343300533, 0.8751194888095843, 0.8751410671644719, 0.8751624718948827, 0.8751837053252469, 0.8752047696127248, 0.8752256667555282, 0.875246398601073, 0.8752669668539684, 0.8752873730838253, 0.8753076187328829, 0.8753277051234504, 0.8753476334651591, 0.8753674048620174, 0.8753870203192811, 0.8754064807501285, 0.875425786982136, 0.8754449397635828, 0.8754639397695544, 0.8754827876078759, 0.8755014838248671, 0.875520028910929, 0.8755384233059628, 0.8755566674046403, 0.8755747615615134, 0.8755927060959855, 0.8756105012971431, 0.8756281474284486, 0.8756456447323088, 0.8756629934345107, 0.8756801937485438, 0.8756972458797887, 0.8757141500295914, 0.8757309063992171, 0.8757475151936707, 0.875763976625404, 0.8757802909178753, 0.8757964583089928, 0.8758124790543962, 0.8758283534306068, 0.8758440817380129, 0.8758596643036931, 0.8758751014840719, 0.8758903936673986, 0.8759055412760337, 0.8759205447685515, 0.8759354046416348, 0.8759501214317753, 0.8759646957167551, 0.8759791281169229, 0.8759934192962524, 0.8760075699631866, 0.8760215808712718, 0.8760354528195692, 0.8760491866528737, 0.876062783261716, 0.8760762435821796, 0.8760895685955257, 0.8761027593276441, 0.8761158168483367, 0.876128742270447, 0.8761415367488501, 0.8761542014793188, 0.8761667376972688, 0.8761791466764232, 0.8761914297273788, 0.8762035881961148, 0.8762156234624537, 0.8762275369384779, 0.8762393300669322, 0.8762510043196162, 0.8762625611957833, 0.8762740022205578, 0.8762853289433865, 0.8762965429365167, 0.876307645793547, 0.8763186391280122, 0.8763295245720494, 0.8763403037751246, 0.8763509784028461, 0.8763615501358385, 0.8763720206687148, 0.8763823917091181, 0.8763926649768496, 0.8764028422030767, 0.8764129251296093, 0.8764229155082662, 0.8764328151002921, 0.8764426256758552, 0.8764523490135939, 0.8764619869002149, 0.8764715411301389, 0.8764810135051864, 0.8764904058342802, 0.8764997199331763, 0.8765089576242022, 0.8765181207359942, 0.8765272111032254, 0.8765362305663154, 0.8765451809711097, 0.876554064168513, 0.8765628820140854, 0.8765716363675612, 0.8765803290923132, 0.876588962054724, 0.8765975371234693, 0.8766060561687091, 0.8766145210611551, 0.8766229336710352, 0.8766312958669178, 0.8766396095144182, 0.8766478764747457, 0.8766560986031169, 0.8766642777470119, 0.8766724157442718, 0.8766805144210389, 0.8766885755895272, 0.8766966010456374, 0.8767045925664012, 0.8767125519072646, 0.8767204807992091, 0.876728380945728, 0.8767362540196402, 0.8767441016597782, 0.8767519254675396, 0.8767597270033249, 0.8767675077828727, 0.8767752692735168, 0.8767830128903673, 0.8767907399924606, 0.8767984518788796, 0.8768061497848916, 0.876813834878109, 0.8768215082547247, 0.8768291709358389, 0.8768368238639197, 0.8768444678994236, 0.876852103817628, 0.8768597323056895, 0.8768673539599839, 0.8768749692837615, 0.8768825786851381, 0.8768901824754846, 0.8768977808682183, 0.8769053739780517, 0.8769129618207107, 0.8769205443131562, 0.876928121274319, 0.8769356924263814, 0.8769432573965995, 0.876950815719674, 0.8769583668406853, 0.8769659101185616, 0.8769734448300875, 0.8769809701744242, 0.8769884852781114, 0.8769959892005346, 0.8770034809397962, 0.8770109594389738, 0.8770184235926886, 0.877025872253955, 0.8770333042412355, 0.8770407183456562, 0.8770481133383035, 0.8770554879775581, 0.8770628410163788, 0.8770701712095026, 0.8770774773204691, 0.8770847581284323, 0.8770920124346967, 0.8770992390689264, 0.8771064368949802, 0.8771136048163378, 0.8771207417810807, 0.87712784678639, 0.8771349188825612, 0.8771419571764947, 0.8771489608346794, 0.8771559290856443, 0.877162861221905, 0.8771697566013931, 0.8771766146483997, 0.8771834348540459, 0.8771902167763067, 0.8771969600396103, 0.8772036643340518, 0.8772103294142465, 0.8772169550978566, 0.8772235412638328, 0.8772300878503964, 0.8772365948528034, 0.8772430623209236, 0.8772494903566609, 0.8772558791112627, 0.8772622287825252, 0.8772685396119385, 0.8772748118817997, 0.8772810459123033, 0.8772872420586341, 0.877293400708096, 0.8772995222772679, 0.8773056072092236, 0.8773116559708127, 0.8773176690500171, 0.8773236469533938, 0.8773295902036056, 0.8773354993370436, 0.8773413749015483, 0.8773472174542291, 0.8773530275593803, 0.877358805786496, 0.8773645527083821, 0.877370268899361, 0.8773759549335679, 0.8773816113833395, 0.8773872388176794, 0.8773928378008186, 0.8773984088908376, 0.8774039526383761, 0.8774094695854091, 0.8774149602640827, 0.8774204251956313, 0.8774258648893325, 0.8774312798415407, 0.877436670534761, 0.877442037436786, 0.8774473809998737, 0.8774527016599855, 0.8774579998360593, 0.8774632759293441, 0.8774685303227665, 0.8774737633803478, 0.8774789754466723, 0.8774841668463939, 0.8774893378837901, 0.8774944888423631, 0.8774996199844929, 0.8775047315511283, 0.87750982376154, 0.877514896813114, 0.8775199508812057, 0.8775249861190405, 0.877530002657678, 0.877535000606023, 0.8775399800509034, 0.8775449410572047, 0.8775498836680619, 0.8775548079051201, 0.8775597137688484, 0.8775646012389297, 0.8775694702747016, 0.8775743208156712, 0.87757915278209, 0.8775839660755866, 0.8775887605798791, 0.8775935361615244, 0.8775982926707538, 0.8776030299423454, 0.8776077477965666, 0.8776124460401619, 0.8776171244673945, 0.8776217828611327, 0.8776264209939841, 0.8776310386294578, 0.877635635523175, 0.8776402114240941, 0.8776447660757741, 0.8776492992176456, 0.8776538105862995, 0.8776582999167866, 0.877662766943907, 0.877667211403513, 0.8776716330337785, 0.8776760315764731, 0.8776804067782009, 0.8776847583916114, 0.8776890861765795, 0.8776933899013434, 0.8776976693435948, 0.8777019242915224, 0.8777061545447964, 0.877710359915494, 0.8777145402289664, 0.8777186953246238, 0.8777228250566698, 0.8777269292947472, 0.8777310079245129, 0.877735060848143, 0.877739087984748, 0.8777430892707186, 0.8777470646599888, 0.8777510141242252, 0.877754937652933, 0.8777588352534909, 0.8777627069511114, 0.87776655278873, 0.877770372826821, 0.8777741671431554, 0.8777779358324889, 0.8777816790061946, 0.8777853967918413, 0.8777890893327186, 0.8777927567873168, 0.8777963993287639, 0.8778000171442228, 0.8778036104342604, 0.8778071794121828, 0.8778107243033475, 0.8778142453444557, 0.8778177427828311, 0.8778212168756814, 0.8778246678893602, 0.87782809609862, 0.8778315017858668, 0.8778348852404193, 0.8778382467577722, 0.8778415866388797, 0.8778449051894323, 0.8778482027191734, 0.8778514795412141, 0.8778547359713799, 0.8778579723275718, 0.8778611889291592, 0.8778643860963907, 0.8778675641498306, 0.8778707234098313, 0.877873864196024, 0.8778769868268418, 0.8778800916190717, 0.8778831788874365, 0.8778862489442013, 0.8778893020988153, 0.8778923386575745, 0.8778953589233206, 0.8778983631951622, 0.8779013517682239, 0.8779043249334237, 0.8779072829772739, 0.8779102261817088, 0.8779131548239324, 0.8779160691762967, 0.8779189695061934, 0.877921856075972, 0.877924729142878, 0.8779275889590044, 0.8779304357712714, 0.8779332698214143, 0.8779360913459907, 0.8779389005764037, 0.8779416977389383, 0.8779444830548112, 0.8779472567402309, 0.8779500190064751, 0.8779527700599685, 0.8779555101023843, 0.8779582393307384, 0.8779609579375052, 0.8779636661107361, 0.8779663640341777, 0.8779690518874126, 0.8779717298459836, 0.8779743980815442, 0.8779770567619962, 0.8779797060516424, 0.8779823461113383, 0.8779849770986399, 0.8779875991679666, 0.8779902124707557, 0.8779928171556199, 0.8779954133685095, 0.8779980012528726, 0.8780005809498098, 0.8780031525982412, 0.8780057163350625, 0.8780082722953021, 0.8780108206122813, 0.8780133614177678, 0.8780158948421336, 0.8780184210145017, 0.8780209400629035, 0.8780234521144225, 0.8780259572953423, 0.8780284557312873, 0.878030947547367, 0.8780334328683135, 0.8780359118186102, 0.8780383845226323, 0.8780408511047664, 0.8780433116895415, 0.8780457664017483, 0.8780482153665559, 0.8780506587096275, 0.8780530965572299, 0.8780555290363382, 0.8780579562747441, 0.8780603784011489, 0.8780627955452598, 0.8780652078378834, 0.8780676154110058, 0.8780700183978836, 0.8780724169331182, 0.8780748111527272, 0.8780772011942184, 0.8780795871966564, 0.878081969300721, 0.878084347648767, 0.8780867223848781, 0.878089093654913, 0.8780914616065549, 0.8780938263893492, 0.8780961881547409, 0.8780985470561061, 0.8781009032487852, 0.8781032568900993, 0.878105608139379, 0.8781079571579734, 0.8781103041092648, 0.8781126491586809, 0.8781149924736912, 0.8781173342238126, 0.8781196745806028, 0.8781220137176549, 0.878124351810582, 0.8781266890370049, 0.8781290255765297, 0.8781313616107241, 0.8781336973230962, 0.8781360328990511, 0.8781383685258662, 0.8781407043926475, 0.8781430406902863, 0.8781453776114119, 0.8781477153503428, 0.8781500541030289, 0.878152394066994, 0.8781547354412731, 0.8781570784263436, 0.8781594232240557, 0.8781617700375548, 0.8781641190712064, 0.8781664705305063, 0.8781688246219976, 0.8781711815531762, 0.8781735415323926, 0.8781759047687533, 0.8781782714720116, 0.8781806418524614, 0.8781830161208147, 0.8781853944880906, 0.878187777165482, 0.8781901643642269, 0.8781925562954787, 0.8781949531701577, 0.878197355198813, 0.8781997625914627, 0.8782021755574445, 0.8782045943052491, 0.8782070190423563, 0.8782094499750556, 0.8782118873082708, 0.878214331245375, 0.878216781987996, 0.8782192397358244, 0.8782217046864069, 0.8782241770349356, 0.87822665697404, 0.8782291446935594, 0.8782316403803228, 0.8782341442179109, 0.8782366563864212, 0.8782391770622305, 0.8782417064177374, 0.8782442446211173, 0.8782467918360581, 0.8782493482215059, 0.8782519139313969, 0.8782544891143835, 0.8782570739135693, 0.878259668466229], 'MSE': [14.711373280759894, 12.922203358344662, 12.57045936444856, 12.360064924399614, 12.198096212501701, 12.066121873776693, 11.954703493963809, 11.857779225956568, 11.771222332362303, 11.69212431944716, 11.618380921996945, 11.548438910773173, 11.481134607887078, 11.415587447451037, 11.351127978358019, 11.287248114959025, 11.223566099984982, 11.159801356501619, 11.095756049844592, 11.031301210693316, 10.966365935698475, 10.900928625317821, 10.835009524673186, 10.768664053997034, 10.701976582246274, 10.635054429834437, 10.568021995005747, 10.50101498838853, 10.434174833154556, 10.367643343126252, 10.301557826241906, 10.236046774413285, 10.171226292681927, 10.107197392377806, 10.044044228629204, 9.981833307803905, 9.9206136321368081, 9.8604176937322681, 9.8012631841614581, 9.7431552530208609, 9.6860891309878117, 9.6300529299303577, 9.5750304427147235, 9.5210037856590688, 9.4679557538677948, 9.415871790792588, 9.3647415056184045, 9.314559703393412, 9.2653269217508676, 9.2170494937041436, 9.1697391777784549, 9.1234124143766611, 9.0780892805818887, 9.033792224444495, 8.9905446641295956, 8.9483695371339671, 8.9072878802922375, 8.8673175128576531, 8.828471883173572, 8.790759125182257, 8.7541813552688517, 8.7187342238173198, 8.6844067204784761, 8.6511812184854069, 8.6190337321971473, 8.5879343538894446, 8.5578478308501325, 8.5287342419833685, 8.5005497340491445, 8.473247280848323, 8.446777433505833, 8.4210890358631332, 8.3961298852824218, 8.3718473253703056, 8.348188762865604, 8.3251021059268648, 8.302536125150592, 8.2804407418036039, 8.2587672499900826, 8.2374684808847221, 8.2164989178689751, 8.1958147715483047, 8.1753740233341325, 8.1551364456816504, 8.1350636062826016, 8.1151188626208501, 8.0952673523669034, 8.0754759841728934, 8.0557134325607915, 8.0359501397915629, 8.0161583268731125, 7.9963120152039142, 7.9763870597566369, 7.9563611941681796, 7.9362140876091791, 7.9159274128463597, 7.8954849244758414, 7.8748725458816526, 7.85407846306079, 7.8330932230498123, 7.8119098342839575, 7.7905238658312737, 7.7689335420720083, 7.7471398290513536, 7.7251465084398703, 7.7029602348064241, 7.680590571763573, 7.6580500025143952, 7.6353539104268098, 7.6125205255220525, 7.5895708331979312, 7.5665284421377619, 7.5434194091946871, 7.520272020083163, 7.4971165259498926, 7.4739848373161282, 7.4509101784306351, 7.4279267067117951, 7.4050691035971372, 7.3823721446923134, 7.3598702585061417, 7.3375970841870535, 7.3155850394260211, 7.2938649099895869, 7.2724654721178688, 7.251413158241129, 7.2307317751420941, 7.2104422818668379, 7.190562632461055, 7.1711076861106742, 7.1520891846498333, 7.1335157948332224, 7.1153932104149131, 7.0977243070727161, 7.0805093416757412, 7.0637461863746163, 7.0474305875263834, 7.0315564395181029, 7.0161160640756535, 7.0011004865433035, 6.9864997017996657, 6.9723029238266543, 6.9584988143726516, 6.945075687556364, 6.9320216885766772, 6.9193249458701427, 6.9069736970585414, 6.8949563898406527, 6.8832617595999643, 6.8718788859352067, 6.8607972305903777, 6.8500066593871116, 6.8394974507688771, 6.8292602934802362, 6.8192862757435906, 6.8095668680892487, 6.8000939017521969, 6.7908595442933057, 6.7818562738403063, 6.7730768530922631, 6.7645143039889328, 6.7561618837275494, 6.7480130626111041, 6.7400615040411527, 6.7323010468207922, 6.7247256898144112, 6.717329578913577, 6.7101069961863296, 6.703052351033671, 6.6961601731428271, 6.6894251070076232, 6.6828419077799905, 6.6764054382193336, 6.6701106665192187, 6.6639526648073355, 6.6579266081342983, 6.6520277737920095, 6.6462515408231493, 6.6405933896086085, 6.6350489014402685, 6.6296137580078565, 6.6242837407463728, 6.6190547300066518, 6.6139227040253861, 6.608883737682528, 6.6039340010426377, 6.5990697576853856, 6.5942873628339793, 6.5895832612963865, 6.5849539852353374, 6.5803961517860428, 6.5759064605400841, 6.5714816909145464, 6.5671186994262385, 6.562814416887047, 6.558565845538741, 6.5543700561417708, 6.5502241850325591, 6.5461254311619284, 6.5420710531255137, 6.538058366196843, 6.5340847393712478, 6.5301475924277046, 6.526244393015685, 6.522372653771761, 6.5185299294703922, 6.514713814212314, 6.5109219386538726, 6.5071519672783955, 6.5034015957119884, 6.499668548084407, 6.4959505744354802, 6.4922454481674725, 6.4885509635430356, 6.4848649332287378, 6.4811851858830227, 6.4775095637881188, 6.4738359205252483, 6.470162118691678, 6.4664860276589007, 6.462805521370834, 6.4591184761815166, 6.4554227687304877, 6.4517162738562508, 6.4479968625460602, 6.4442623999227546, 6.4405107432671169, 6.4367397400775266, 6.4329472261649272, 6.429131023786165, 6.425288939814819, 6.4214187639519071, 6.417518266977873, 6.4135851990481738, 6.4096172880355109, 6.4056122379211358, 6.401567727240276, 6.3974814075852446, 6.3933509021716226, 6.3891738044736481, 6.3849476769346545, 6.3806700497614113, 6.3763384198080786, 6.3719502495619205, 6.3675029662382014, 6.3629939609970387, 6.3584205882931819, 6.3537801653724664, 6.3490699719290822, 6.3442872499390361, 6.3394292036864481, 6.3344930000008199, 6.3294757687245076, 6.3243746034306154, 6.3191865624139174, 6.3139086699775495, 6.3085379180405772, 6.3030712680926833, 6.2975056535226637, 6.2918379823510611, 6.2860651403952801, 6.2801839949007352, 6.274191398668183, 6.2680841947130306, 6.2618592214892441, 6.2555133187145984, 6.249043333831195, 6.2424461291384041, 6.2357185896328398, 6.2288576315914375, 6.2218602119302702, 6.2147233383740792, 6.207444080464553, 6.2000195814378154, 6.1924470709941843, 6.1847238789812335, 6.1768474500058455, 6.1688153589842312, 6.1606253276320295, 6.1522752418890621, 6.1437631702626243, 6.1350873830632846, 6.1262463724944967, 6.1172388735440979, 6.1080638856102958, 6.0987206947787218, 6.0892088966485236, 6.0795284195874251, 6.069679548273835, 6.0596629473632744, 6.0494796850944841, 6.0391312566260833, 6.0286196068737743, 6.0179471525926358, 6.007116803429426, 5.9961319816469638, 5.9849966402044661, 5.973715278861472, 5.9622929579598916, 5.9507353095286817, 5.9390485453529029, 5.9272394616489521, 5.9153154399955667, 5.903284444184111, 5.8911550126729377, 5.878936246359185, 5.8666377914186123, 5.8542698170063181, 5.8418429876653599, 5.829368430346773, 5.8168576960111107, 5.8043227158522992, 5.7917757522617341, 5.7792293447301306, 5.7666962509697282, 5.7541893836245412, 5.741721743024482, 5.729306346525445, 5.716956155064941, 5.7046839976437118, 5.6925024945240397, 5.6804239800073857, 5.6684604257152866, 5.6566233653515097, 5.6449238219576676, 5.6333722386951246, 5.6219784141820073, 5.610751443388283, 5.599699665037889, 5.5888306163845627, 5.5781509961169276, 5.5676666360105482, 5.5573824817791238, 5.5473025833939422, 5.5374300949410573, 5.527767283877921, 5.5183155493476965, 5.5090754490105214, 5.5000467336730763, 5.4912283888434974, 5.4826186822143521, 5.4742152159891795, 5.4660149829157483, 5.4580144248775184, 5.4502094929141549, 5.4425957076012645, 5.4351682187962727, 5.4279218638670823, 5.4208512236351387, 5.4139506753974498, 5.4072144425218518, 5.4006366402434951, 5.3942113174119504, 5.3879324940564279, 5.3817941947365746, 5.3757904777362624, 5.3699154602316561, 5.3641633396240866, 5.3585284112739853, 5.3530050829048763, 5.3475878859682355, 5.3422714842696424, 5.3370506801620179, 5.331920418606261, 5.3268757893916616, 5.3219120277958591, 5.3170245139489722, 5.3122087711497281, 5.3074604633655715, 5.3027753921294378, 5.2981494930325743, 5.2935788319951902, 5.2890596014833475, 5.2845881168297621, 5.2801608128010979, 5.2757742405493273, 5.2714250650717265, 5.2671100632990671, 5.2628261229220801, 5.2585702420611273, 5.2543395298729996, 5.2501312081838636, 5.2459426142237664, 5.2417712045271276, 5.2376145600487467, 5.233470392524775, 5.229336552086397, 5.2252110361059723, 5.2210919992235905, 5.2169777644633797, 5.2128668353068948, 5.2087579085425117, 5.2046498876578688, 5.2005418964863184, 5.1964332927627312, 5.1923236811864015, 5.1882129255365017, 5.1841011593398001, 5.1799887945539753, 5.1758765277088372, 5.1717653429456343, 5.1676565114141955, 5.163551586533889, 5.1594523946999997, 5.1553610211194103, 5.1512797905953471, 5.1472112432382326, 5.1431581052624677, 5.1391232552222244, 5.1351096862400416, 5.1311204649749493, 5.1271586882507316, 5.1232274384106864, 5.1193297385676191, 5.1154685089704826, 5.1116465257063783, 5.1078663828935627, 5.1041304594030832, 5.1004408909769436, 5.0967995484007833, 5.0932080221501739, 5.0896676136787518, 5.0861793332655081, 5.0827439041056968, 5.079361772123109, 5.0760331208164438, 5.0727578903290533, 5.0695357998568715, 5.0663663724809869, 5.0632489615262051, 5.0601827775966601, 5.057166915520523, 5.0542003805358622, 5.0512821131615828, 5.0484110123156327, 5.0455859563560805, 5.0428058218297931, 5.0400694998083351, 5.0373759097746715, 5.0347240110924334, 5.0321128121430254, 5.0295413772570754, 5.0270088315938573, 5.0245143641416981, 5.0220572290208922, 5.0196367452739041, 5.0172522953279408, 5.014903322307787, 5.0125893263729413, 5.0103098602446865, 5.0080645240809822, 5.0058529598505963, 5.0036748453486561, 5.0015298879911949, 4.9994178185159166, 4.9973383847108463, 4.9952913452838894, 4.993276463975457, 4.9912935040094935, 4.9893422229631872, 4.9874223681267624, 4.9855336724090549, 4.9836758508323582, 4.9818485976444604, 4.980051584061763, 4.9782844566434523, 4.976546836282937, 4.9748383177903817, 4.97315847002921, 4.9715068365605095, 4.9698829367411426, 4.9682862672169179, 4.9667163037479423, 4.9651725033023526, 4.963654306354754, 4.9621611393280309, 4.960692417120387, 4.9592475456642102, 4.957825924469307, 4.9564269491080148, 4.9550500136071509, 4.9536945127180561, 4.9523598440419105, 4.9510454099940731, 4.9497506195959184, 4.9484748900888862, 4.9472176483691008, 4.9459783322442661, 4.9447563915189052, 4.9435512889148585, 4.942362500837346, 4.9411895179968575, 4.9400318458987948, 4.9388890052131202, 4.93776053203504, 4.9366459780501906, 4.9355449106136975, 4.9344569127552562, 4.9333815831193135, 4.9323185358495687, 4.9312674004256571, 4.9302278214600852, 4.9291994584610297, 4.928181985566753, 4.9271750912572623, 4.9261784780463334, 4.9251918621583695, 4.9242149731927967, 4.9232475537783404, 4.9222893592200636, 4.9213401571400404, 4.920399727113975, 4.9194678603047954, 4.9185443590941063, 4.9176290367129232, 4.9167217168719324, 4.9158222333926762, 4.9149304298394672, 4.9140461591535871, 4.9131692832898288, 4.9122996728554957, 4.9114372067535399, 4.9105817718292073, 4.9097332625208576, 4.90889158051632, 4.9080566344137964, 4.9072283393888991, 4.906406616867466, 4.9055913942049498, 4.9047826043722997, 4.9039801856489005, 4.903184081322669, 4.9023942393974345, 4.90161061230779, 4.9008331566416476, 4.900061832870092, 4.8992966050849027, 4.8985374407439268, 4.897784310423142, 4.8970371875766761, 4.8962960483034816, 4.8955608711210328, 4.8948316367456792, 4.8941083278795023, 4.8933909290031234, 4.8926794261747748, 4.8919738068347955, 4.8912740596156512, 4.890580174157412, 4.889892140928108, 4.8892099510492741, 4.8885335961260346, 4.8878630680823525, 4.8871983590008652, 4.8865394609673611, 4.8858863659205971, 4.8852390655064886, 4.8845975509381487, 4.8839618128605089, 4.8833318412212225, 4.8827076251468675, 4.8820891528254959, 4.8814764113956448, 4.8808693868419004, 4.8802680638974314, 4.8796724259540776, 4.8790824549796721, 4.8784981314435267, 4.8779194342495833, 4.8773463406781614, 4.8767788263357543, 4.8762168651134266, 4.8756604291536103, 4.8751094888251814, 4.8745640127072516, 4.8740239675805981, 4.8734893184275512, 4.8729600284392172, 4.8724360590301945, 4.8719173698602027, 4.871403918862228, 4.8708956622767667, 4.870392554691545, 4.8698945490860952, 4.8694015968810902, 4.8689136479908965, 4.8684306508798931, 4.8679525526211744, 4.8674792989570124, 4.8670108343611735, 4.8665471021016806, 4.8660880443040853, 4.8656336020143787, 4.8651837152612432, 4.8647383231169705, 4.8642973637572648, 4.8638607745182467, 4.8634284919521242, 4.8630004518795991, 4.8625765894399624, 4.8621568391377679, 4.8617411348870876, 4.8613294100519369, 4.8609215974839506, 4.8605176295567016, 4.8601174381968031, 4.8597209549123761, 4.8593281108179802, 4.8589388366575212, 4.8585530628240248, 4.8581707193774282, 4.8577917360604248, 4.8574160423123649, 4.8570435672816297, 4.8566742398373117, 4.8563079885798182, 4.8559447418511361, 4.8555844277451987, 4.8552269741185308, 4.8548723086017178, 4.8545203586119676, 4.85417105136756, 4.8538243139037114, 4.8534800730914913, 4.8531382556589087, 4.8527987882156092, 4.8524615972810796, 4.852126609316433, 4.8517937507610878, 4.8514629480734888, 4.8511341277773301, 4.850807216512445, 4.8504821410919039, 4.8501588285644299, 4.8498372062829587, 4.8495172019794683, 4.8491987438459319, 4.8488817606220431, 4.8485661816889483, 4.8482519371697856, 4.8479389580364778, 4.8476271762229493, 4.8473165247440173, 4.8470069378207041, 4.8466983510104322, 4.8463907013426573, 4.8460839274589276, 4.8457779697570107, 4.8454727705380494, 4.8451682741567321, 4.8448644271727135, 4.8445611785031284, 4.8442584795745027, 4.8439562844736903, 4.8436545500959385, 4.8433532362892935, 4.8430523059937949, 4.8427517253743613, 4.8424514639453466, 4.8421514946862221, 4.8418517941461374, 4.8415523425361773, 4.8412531238083059, 4.8409541257187199, 4.8406553398753758, 4.8403567617675183, 4.8400583907767762, 4.8397602301684204, 4.8394622870625126, 4.8391645723834529, 4.8388671007883781, 4.8385698905738979, 4.8382729635607005, 4.8379763449571547, 4.8376800632017174, 4.8373841497851693, 4.8370886390539303, 4.8367935679950662, 4.8364989760054371, 4.836204904645605, 4.8359113973815475, 4.8356184993152995, 4.8353262569075772, 4.8350347176940049, 4.83474392999823, 4.8344539426434965, 4.83416480466627, 4.8338765650330844, 4.8335892723643319, 4.8333029746664149, 4.833017719074733, 4.8327335516095156, 4.8324505169463849, 4.832168658202975, 4.8318880167430844, 4.831608631999794, 4.8313305413176222, 4.8310537798152442, 4.8307783802681907, 4.8305043730124257, 4.8302317858678236, 4.8299606440819609, 4.8296909702929902, 4.8294227845111797, 4.8291561041179429, 4.8288909438816043, 4.8286273159883182, 4.8283652300871696, 4.8281046933480773, 4.8278457105309753, 4.8275882840651461, 4.8273324141371274, 4.8270780987859307, 4.8268253340044653, 4.8265741138453473, 4.8263244305307769, 4.8260762745648362, 4.8258296348469605, 4.8255844987863838, 4.8253408524164438, 4.8250986805074856, 4.8248579666786888, 4.8246186935074045, 4.8243808426360504, 4.8241443948760896, 4.8239093303085649, 4.8236756283812028, 4.8234432680018973, 4.8232122276283329, 4.8229824853537249, 4.8227540189887517, 4.8225268061396207, 4.8223008242823351, 4.8220760508332363, 4.8218524632160467, 4.8216300389252051, 4.8214087555862069, 4.821188591012235, 4.8209695232582988, 4.8207515306720206, 4.8205345919417262, 4.8203186861422314, 4.8201037927774379, 4.819889891821405, 4.8196769637563683, 4.8194649896091368, 4.8192539509850674, 4.8190438301003482, 4.8188346098120132, 4.8186262736464709, 4.8184188058257185, 4.8182121912922264, 4.8180064157318601, 4.8178014655947807, 4.8175973281148812, 4.817393991327279, 4.81719144408404, 4.8169896760677915, 4.8167886778038813, 4.8165884406701016, 4.8163889569047811, 4.816190219612567, 4.8159922227682825, 4.8157949612183701, 4.8155984306804589, 4.815402627740264, 4.8152075498463551, 4.8150131953025683, 4.8148195632577648, 4.8146266536934927, 4.8144344674086827, 4.8142430060022532, 4.8140522718529297, 4.8138622680966039, 4.8136729986014526, 4.8134844679399515, 4.8132966813593745, 4.8131096447489581, 4.8129233646056147, 4.812737847996817, 4.8125531025218145, 4.8123691362706325, 4.8121859577813799, 4.8120035759956359, 4.8118220002127572, 4.8116412400422552, 4.8114613053556603, 4.8112822062367995, 4.8111039529318536, 4.8109265557986527, 4.810750025255599, 4.8105743717309375, 4.8103996056115577, 4.8102257371930488, 4.8100527766296031, 4.8098807338853202, 4.8097096186865747, 4.8095394404756266, 4.8093702083658689, 4.8092019310989578, 4.8090346170037952, 4.8088682739577973, 4.8087029093505036, 4.8085385300494989, 4.8083751423695471, 4.8082127520436728, 4.8080513641978175, 4.8078909833282095, 4.8077316132815069, 4.8075732572384648, 4.8074159177003439, 4.8072595964785609, 4.8071042946872495, 4.8069500127390903, 4.8067967503439348, 4.8066445065103656, 4.8064932795500734, 4.8063430670850638, 4.8061938660572148, 4.8060456727405096, 4.8058984827555147, 4.8057522910859438, 4.8056070920973193, 4.8054628795574459, 4.8053196466585559, 4.8051773860409668, 4.8050360898179516, 4.8048957496018314, 4.8047563565310423, 4.8046179012979611, 4.804480374177273, 4.8043437650549876, 4.8042080634574855, 4.8040732585808801, 4.8039393393203431, 4.8038062942992017, 4.8036741118979469, 4.80354278028239, 4.8034122874320877, 4.8032826211672344, 4.8031537691756041, 4.8030257190382315, 4.8028984582545293, 4.8027719742661796, 4.8026462544802913, 4.8025212862915554, 4.802397057102997, 4.8022735543460051, 4.8021507654990634, 4.8020286781054144, 4.8019072797894315, 4.801786558272167, 4.8016665013853777, 4.8015470970848222, 4.8014283334620806, 4.8013101987555302, 4.8011926813602166, 4.8010757698365873, 4.8009594529183399, 4.8008437195191833, 4.8007285587388289, 4.8006139598677908, 4.800499912391631, 4.8003864059941757, 4.8002734305599484, 4.8001609761760973, 4.8000490331331642, 4.7999375919255671, 4.7998266432513352, 4.7997161780111846, 4.7996061873070754, 4.7994966624402737, 4.7993875949089775, 4.7992789764052706, 4.7991707988120691, 4.7990630541991397, 4.7989557348193657, 4.7988488331042243, 4.7987423416591186, 4.7986362532587101, 4.7985305608414155, 4.7984252575044959, 4.7983203364981515, 4.798215791220108, 4.7981116152096073, 4.7980078021414547, 4.7979043458201946, 4.797801240173702, 4.7976984792471358, 4.7975960571966958, 4.7974939682833027, 4.7973922068662525, 4.797290767397147, 4.7971896444133399, 4.7970888325317871, 4.7969883264428699, 4.7968881209040877, 4.7967882107340483, 4.7966885908062258, 4.7965892560432239, 4.7964902014105446, 4.7963914219109958, 4.7962929125788154, 4.7961946684741683, 4.7960966846774706, 4.7959989562839827, 4.7959014783987275, 4.7958042461309986, 4.7957072545896358, 4.7956104988778776, 4.7955139740886832, 4.7954176753001088, 4.7953215975708012, 4.7952257359356727, 4.795130085401766, 4.7950346409440296, 4.7949393975016479, 4.7948443499742357, 4.7947494932181787, 4.7946548220435004, 4.7945603312102421, 4.7944660154255772, 4.7943718693409938, 4.7942778875493683, 4.7941840645823754, 4.7940903949081664, 4.7939968729290312, 4.7939034929792799, 4.7938102493234132, 4.7937171361542044, 4.7936241475911956, 4.7935312776792163, 4.7934385203871859, 4.7933458696067683, 4.7932533191517424, 4.7931608627568734, 4.7930684940775539, 4.7929762066892243, 4.7928839940868988, 4.792791849685301, 4.7926997668186422, 4.7926077387408892, 4.7925157586259779, 4.7924238195683939, 4.7923319145837082, 4.7922400366093925, 4.7921481785058004, 4.7920563330569843, 4.7919644929724026, 4.7918726508878748, 4.7917807993673431, 4.7916889309045292, 4.7915970379248156, 4.79150511278716, 4.7914131477863799, 4.7913211351553935, 4.791229067067694, 4.7911369356400675, 4.791044732935303, 4.7909524509652774, 4.7908600816938796, 4.7907676170405447, 4.7906750488835392, 4.7905823690636655, 4.7904895693881118, 4.7903966416343327, 4.7903035775543703, 4.7902103688789861, 4.7901170073225154, 4.7900234845872181, 4.7899297923685165, 4.7898359223600533, 4.7897418662588072, 4.7896476157709085, 4.7895531626171097, 4.7894584985390205, 4.7893636153050112, 4.7892685047167634, 4.7891731586157089, 4.7890775688900753, 4.788981727481799, 4.7888856263938013, 4.7887892576976148, 4.7886926135409693, 4.7885956861558707, 4.7884984678669431, 4.7884009510995549, 4.7883031283887965, 4.7882049923881382, 4.7881065358787689, 4.7880077517788582, 4.7879086331528695, 4.787809173221711, 4.7877093653723373, 4.7876092031681745, 4.7875086803591165, 4.7874077908920372, 4.7873065289215901, 4.7872048888206278, 4.7871028651911987], 'Rp': [0.80356837206859411, 0.81952979947871418, 0.82490383822701885, 0.82819277076196918, 0.83064293791745358, 0.83262217025105201, 0.83429387939329513, 0.83575159389197751, 0.83705638856548537, 0.83825087571686541, 0.83936588546475266, 0.84042423091227025, 0.84144304569188888, 0.84243531656151471, 0.8434109222903281, 0.84437735466366981, 0.84534022881238802, 0.84630365147018594, 0.84727049257247755, 0.84824259105643929, 0.84922091626975993, 0.85020570004885065, 0.85119655010385342, 0.85219255212683753, 0.85319236557931022, 0.85419431615056307, 0.85519648626045597, 0.85619680364164885, 0.85719312696164263, 0.85818332665216912, 0.85916535863132237, 0.8601373284552194, 0.86109754362108104, 0.86204455223057186, 0.86297716694530768, 0.86389447403157793, 0.86479582819099654, 0.86568083470298485, 0.86654932107599292, 0.86740130086184564, 0.86823693250729495, 0.86905647610877612, 0.86986025073384576, 0.8706485946231165, 0.87142183014248853, 0.87218023486560003, 0.8729240196711564, 0.87365331426896986, 0.87436816014205532, 0.87506851052142665, 0.87575423670150443, 0.8764251397598315, 0.87708096656618395, 0.87772142885420401, 0.87834622408238283, 0.87895505683047914, 0.87954765955799452, 0.88012381168753107, 0.88068335615805537, 0.88122621280844537, 0.8817523881856919, 0.88226198160759506, 0.88275518753218707, 0.88323229447997043, 0.88369368091150835, 0.88413980857383212, 0.88457121389349991, 0.88498849801391954, 0.88539231605402968, 0.88578336611444497, 0.88616237848258039, 0.88653010540111998, 0.88688731167166324, 0.88723476627568043, 0.88757323511237318, 0.88790347488263255, 0.88822622809030594, 0.8885422190888923, 0.88885215107069637, 0.88915670387736789, 0.88945653250161283, 0.88975226614942515, 0.89004450773717558, 0.8903338337073724, 0.89062079405875105, 0.89090591249973106, 0.89118968664774079, 0.89147258821036746, 0.89175506309686803, 0.89203753142001729, 0.89232038735890162, 0.89260399886272623, 0.89288870718402646, 0.89317482623760647, 0.89346264178845447, 0.89375241047838838, 0.89404435870774024, 0.89433868139402706, 0.89463554063611295, 0.89493506431742798, 0.89523734468835481, 0.89554243697299662, 0.89585035805093194, 0.89616108526945792, 0.89647455544577037, 0.8967906641216985, 0.89710926513530731, 0.89743017057381291, 0.89775315117031029, 0.89807793720261209, 0.89840421994543074, 0.89873165371757224, 0.89905985855294435, 0.89938842350827353, 0.89971691060225867, 0.9000448593594842, 0.90037179191005501, 0.90069721857178409, 0.90102064381855174, 0.90134157251592828, 0.90165951628589958, 0.90197399984731519, 0.90228456716927352, 0.90259078727198916, 0.9028922595147385, 0.90318861822370666, 0.90347953653315849, 0.90376472934176033, 0.90404395531844428, 0.90431701792960217, 0.90458376549708219, 0.90484409033327273, 0.90509792703277347, 0.90534525002782074, 0.90558607053538276, 0.90582043303690429, 0.90604841143647397, 0.90627010504088046, 0.9064856344959259, 0.90669513779904276, 0.90689876649035106, 0.90709668210396288, 0.90728905294072593, 0.90747605120293762, 0.90765785051292369, 0.9078346238206686, 0.90800654169185824, 0.90817377095627794, 0.90833647368859904, 0.90849480648754199, 0.90864892001633613, 0.90879895876587213, 0.90894506100250627, 0.90908735886391911, 0.90922597856912757, 0.90936104071187884, 0.90949266061054312, 0.90962094869104904, 0.90974601088357532, 0.90986794901727763, 0.90998686120068006, 0.91010284217871407, 0.91021598366003453, 0.9103263746106991, 0.91043410151240967, 0.91053924858509305, 0.91064189797494777, 0.91074212991019721, 0.91084002282712817, 0.91093565346997574, 0.91102909696799395, 0.91112042689315986, 0.91120971530226447, 0.91129703276634999, 0.91138244839064986, 0.91146602982768843, 0.9115478432857721, 0.91162795353500947, 0.91170642391234147, 0.9117833163269351, 0.91185869126702201, 0.91193260780885832, 0.91200512362831898, 0.91207629501547893, 0.91214617689232447, 0.91221482283362476, 0.91228228509084686, 0.9123486146190275, 0.91241386110630684, 0.9124780730059181, 0.91254129757040114, 0.91260358088764015, 0.91266496791854002, 0.9127255025360963, 0.9127852275654682, 0.91284418482493135, 0.91290241516744175, 0.9129599585226017, 0.9130168539388539, 0.91307313962575187, 0.91312885299616264, 0.91318403070822807, 0.91323870870709301, 0.91329292226618763, 0.91334670602805479, 0.91340009404467304, 0.91345311981717747, 0.91350581633501682, 0.91355821611438159, 0.91361035123605616, 0.913662253382585, 0.91371395387470056, 0.91376548370714583, 0.91381687358376784, 0.91386815395194598, 0.91391935503641952, 0.91397050687235171, 0.91402163933788672, 0.91407278218598775, 0.91412396507571869, 0.91417521760292764, 0.91422656933033963, 0.91427804981713068, 0.91432968864784891, 0.91438151546093227, 0.91443355997658593, 0.91448585202412624, 0.91453842156887566, 0.9145912987384186, 0.91464451384838152, 0.91469809742758512, 0.91475208024271204, 0.91480649332222042, 0.91486136797976747, 0.91491673583687083, 0.9149726288448361, 0.91502907930592658, 0.91508611989368593, 0.91514378367234683, 0.91520210411517122, 0.91526111512180985, 0.9153208510343348, 0.91538134665203386, 0.9154426372446941, 0.91550475856437497, 0.91556774685532982, 0.91563163886207188, 0.91569647183532143, 0.91576228353563294, 0.91582911223448471, 0.91589699671264091, 0.91596597625543874, 0.91603609064482461, 0.91610738014782211, 0.91617988550108354, 0.91625364789120856, 0.91632870893055418, 0.91640511062804775, 0.91648289535476346, 0.91656210580368558, 0.91664278494341866, 0.91672497596526936, 0.91680872222330267, 0.91689406716693367, 0.91698105426550403, 0.91706972692446365, 0.91716012839249617, 0.91725230165937355, 0.91734628934372986, 0.91744213357051918, 0.91753987583760543, 0.91763955687102983, 0.9177412164685862, 0.91784489333132313, 0.91795062488265156, 0.9180584470747748, 0.91816839418233021, 0.91828049858309069, 0.91839479052576278, 0.91851129788497821, 0.91863004590381836, 0.91875105692420189, 0.91887435010582685, 0.91899994113437478, 0.91912784192006314, 0.91925806028772117, 0.91939059965991976, 0.91952545873492109, 0.91966263116146452, 0.91980210521284389, 0.91994386346274803, 0.92008788246612727, 0.9202341324481107, 0.92038257700478676, 0.92053317281970271, 0.92068586940023078, 0.92084060883836072, 0.92099732560049896, 0.92115594635114362, 0.92131638981533293, 0.92147856668488737, 0.92164237957331951, 0.92180772302421565, 0.92197448357764844, 0.92214253989884409, 0.92231176297292417, 0.92248201636889304, 0.92265315657557179, 0.92282503341118605, 0.92299749050775171, 0.9231703658702044, 0.92334349250929126, 0.92351669914630519, 0.92368981098635239, 0.92386265055588612, 0.9240350385989079, 0.92420679502516001, 0.9243777399023787, 0.924547694483424, 0.92471648225826109, 0.92488393001942082, 0.92504986892882513, 0.92521413557308219, 0.9253765729934984, 0.9255370316769187, 0.92569537049312378, 0.92585145756480869, 0.926005171056409, 0.92615639986915443, 0.92630504423072491, 0.92645101616967029, 0.92659423986657541, 0.92673465187648929, 0.92687220121951341, 0.92700684933939692, 0.92713856993270838, 0.92726734865414262, 0.92739318270597659, 0.92751608032234278, 0.92763606016083111, 0.9277531506157547, 0.92786738906831379, 0.92797882108965823, 0.92808749961286596, 0.92819348408941238, 0.92829683964487475, 0.92839763624741167, 0.92849594790101675, 0.9285918518737476, 0.92868542796952824, 0.92877675784996461, 0.92886592441100135, 0.9289530112174561, 0.92903810199684866, 0.92912128019266726, 0.92920262857574953, 0.92928222891188417, 0.92936016168249269, 0.92943650585504345, 0.92951133869909075, 0.92958473564400013, 0.9296567701737577, 0.92972751375476537, 0.92979703579232298, 0.92986540361164183, 0.9299326824595896, 0.9299989355234014, 0.93006422396304356, 0.93012860695393162, 0.93019214173719988, 0.9302548836746648, 0.93031688630618747, 0.9303782014070221, 0.9304388790430248, 0.93049896762188866, 0.93055851393848665, 0.93061756321263833, 0.93067615911777868, 0.93073434379893738, 0.93079215787873437, 0.93084964045010132, 0.9309068290544853, 0.93096375964462319, 0.93102046653102477, 0.93107698231139768, 0.93113333778290608, 0.93118956183688129, 0.93124568133655483, 0.93130172097847863, 0.93135770313889465, 0.93141364770703206, 0.93146957190773305, 0.93152549011686092, 0.9315814136733076, 0.93163735069261844, 0.9316933058876874, 0.93174928040289895, 0.93180527166862892, 0.93186127328360735, 0.93191727493276899, 0.93197326234841471, 0.93202921732206667, 0.93208511777384773, 0.93214093788512187, 0.93219664829865378, 0.93225221638873113, 0.93230760660141165, 0.93236278086262814, 0.93241769904900884, 0.93247231951377141, 0.93252659965706264, 0.93258049652796471, 0.93263396744330651, 0.932686970606869, 0.9327394657122543, 0.93279141451228498, 0.93284278133910237, 0.93289353356056381, 0.93294364196104362, 0.93299308103767409, 0.93304182920632217, 0.93308986891518353, 0.93313718666731549, 0.93318377295666766, 0.93322962212504901, 0.9332747321496595, 0.93331910437265087, 0.9333627431850825, 0.93340565567788558, 0.93344785127260921, 0.93348934134348227, 0.93353013884160452, 0.93357025793037407, 0.93360971363995449, 0.93364852154664102, 0.93368669748160671, 0.93372425727203145, 0.93376121651593391, 0.9337975903914506, 0.93383339349976202, 0.93386863974060852, 0.93390334221840432, 0.93393751317692786, 0.93397116395991853, 0.93400430499529219, 0.93403694580007735, 0.93406909500374669, 0.93410076038722156, 0.93413194893526985, 0.93416266689997862, 0.93419291987296893, 0.93422271286445469, 0.93425205038697567, 0.93428093654207423, 0.93430937510803691, 0.93433736962709768, 0.93436492349045774, 0.93439204001986642, 0.93441872254433478, 0.93444497447092012, 0.93447079934862531, 0.93449620092467311, 0.93452118319251765, 0.93454575043128851, 0.9345699072364374, 0.9345936585416591, 0.93461700963224581, 0.93463996615028566, 0.93466253409220956, 0.93468471979937273, 0.93470652994235837, 0.9347279714999237, 0.93474905173335765, 0.9347697781572597, 0.93479015850747627, 0.93481020070716758, 0.93482991283177586, 0.93484930307355796, 0.93486837970647652, 0.93488715105191911, 0.93490562544570044, 0.93492381120693235, 0.93494171660878678, 0.93495934985166607, 0.93497671903866308, 0.93499383215361254, 0.9350106970415667, 0.93502732139178213, 0.93504371272308062, 0.9350598783715105, 0.93507582548011869, 0.9350915609907301, 0.93510709163755623, 0.93512242394242884, 0.93513756421157712, 0.93515251853367776, 0.93516729277907296, 0.93518189260004569, 0.93519632343195358, 0.93521059049506439, 0.93522469879715997, 0.93523865313652332, 0.93525245810551239, 0.93526611809443383, 0.93527963729573083, 0.93529301970844481, 0.93530626914287296, 0.93531938922533175, 0.9353323834031374, 0.93534525494958665, 0.93535800696906357, 0.9353706424021756, 0.93538316403090005, 0.93539557448380672, 0.9354078762412148, 0.93542007164038299, 0.93543216288068398, 0.93544415202872433, 0.93545604102345459, 0.9354678316812548, 0.93547952570091542, 0.93549112466866369, 0.93550263006298884, 0.93551404325955367, 0.93552536553591381, 0.93553659807623168, 0.93554774197588941, 0.93555879824599475, 0.93556976781781287, 0.93558065154712178, 0.93559145021841006, 0.93560216454906142, 0.93561279519333729, 0.93562334274633274, 0.93563380774779181, 0.93564419068581728, 0.93565449200047579, 0.93566471208730506, 0.93567485130071282, 0.93568490995726894, 0.93569488833891068, 0.93570478669602619, 0.93571460525050598, 0.93572434419860917, 0.93573400371381699, 0.93574358394960555, 0.93575308504207944, 0.93576250711257469, 0.9357718502701905, 0.9357811146142212, 0.93579030023653043, 0.93579940722386223, 0.93580843566010685, 0.93581738562842132, 0.93582625721339319, 0.93583505050301519, 0.9358437655907168, 0.93585240257720603, 0.93586096157230791, 0.93586944269672401, 0.93587784608364022, 0.93588617188036305, 0.93589442024975256, 0.93590259137163156, 0.93591068544408518, 0.93591870268463229, 0.93592664333132558, 0.93593450764373598, 0.93594229590377809, 0.93595000841650133, 0.93595764551070859, 0.9359652075394872, 0.93597269488058643, 0.93598010793673336, 0.93598744713577586, 0.93599471293076275, 0.93600190579989473, 0.93600902624634297, 0.93601607479803106, 0.93602305200724478, 0.93602995845024906, 0.93603679472669599, 0.93604356145909129, 0.93605025929209462, 0.93605688889182403, 0.93606345094506427, 0.93606994615845596, 0.93607637525766452, 0.93608273898648997, 0.93608903810598765, 0.93609527339356402, 0.93610144564206765, 0.93610755565892778, 0.93611360426523182, 0.93611959229487729, 0.93612552059373999, 0.93613139001885737, 0.936137201437648, 0.93614295572718942, 0.93614865377348666, 0.93615429647085835, 0.93615988472129497, 0.93616541943387777, 0.93617090152433269, 0.93617633191447069, 0.93618171153181562, 0.93618704130917041, 0.93619232218434623, 0.93619755509976077, 0.93620274100226308, 0.93620788084284734, 0.93621297557642458, 0.93621802616171679, 0.93622303356104342, 0.93622799874016194, 0.93623292266817282, 0.93623780631739806, 0.93624265066320722, 0.93624745668393705, 0.9362522253607074, 0.93625695767730455, 0.9362616546199829, 0.9362663171772686, 0.93627094633969155, 0.93627554309955696, 0.93628010845059839, 0.93628464338760065, 0.93628914890601533, 0.93629362600144062, 0.93629807566909051, 0.93630249890317829, 0.93630689669623046, 0.93631127003834191, 0.93631561991629464, 0.93631994731265467, 0.93632425320477841, 0.93632853856366749, 0.93633280435283561, 0.93633705152699021, 0.93634128103067238, 0.93634549379683751, 0.93634969074526886, 0.93635387278098658, 0.93635804079251617, 0.93636219565014689, 0.93636633820403725, 0.93637046928233114, 0.93637458968917764, 0.93637870020274028, 0.93638280157310061, 0.93638689452023749, 0.93639097973191687, 0.93639505786162081, 0.93639912952647697, 0.93640319530524374, 0.9364072557363422, 0.93641131131593491, 0.93641536249613544, 0.93641940968327464, 0.93642345323635667, 0.93642749346561849, 0.93643153063125373, 0.93643556494238611, 0.93643959655615217, 0.93644362557709848, 0.93644765205678426, 0.93645167599361634, 0.93645569733300205, 0.9364597159677398, 0.93646373173875663, 0.93646774443604841, 0.9364717538000088, 0.93647575952300965, 0.93647976125129717, 0.93648375858715038, 0.93648775109133153, 0.93649173828580512, 0.9364957196567093, 0.93649969465748029, 0.93650366271229668, 0.93650762321962489, 0.93651157555585507, 0.93651551907922082, 0.93651945313358542, 0.93652337705247979, 0.93652729016296987, 0.93653119178967736, 0.93653508125858975, 0.93653895790086672, 0.93654282105656761, 0.93654667007804748, 0.93655050433344411, 0.93655432320970511, 0.93655812611554867, 0.93656191248412912, 0.9365656817754896, 0.9365694334786101, 0.93657316711337801, 0.93657688223213587, 0.9365805784209662, 0.93658425530073841, 0.93658791252787033, 0.93659154979478132, 0.93659516683015687, 0.93659876339891135, 0.93660233930194925, 0.93660589437573971, 0.93660942849164186, 0.93661294155512309, 0.9366164335047209, 0.93661990431101771, 0.93662335397534258, 0.93662678252848686, 0.93663019002924885, 0.93663357656300772, 0.93663694224017446, 0.93664028719462467, 0.93664361158215104, 0.93664691557884483, 0.93665019937955107, 0.93665346319627796, 0.93665670725667094, 0.93665993180249008, 0.93666313708814197, 0.93666632337923106, 0.93666949095121343, 0.93667264008801332, 0.93667577108076427, 0.93667888422657697, 0.9366819798273367, 0.93668505818863101, 0.93668811961861975, 0.93669116442704703, 0.93669419292427303, 0.93669720542038837, 0.93670020222426442, 0.93670318364282423, 0.93670614998021584, 0.93670910153709275, 0.93671203860990437, 0.93671496149028577, 0.9367178704643726, 0.93672076581228503, 0.93672364780753137, 0.93672651671651452, 0.93672937279802504, 0.93673221630278913, 0.93673504747304048, 0.93673786654209867, 0.93674067373400804, 0.93674346926316809, 0.93674625333399875, 0.93674902614065536, 0.9367517878667192, 0.93675453868496383, 0.93675727875710368, 0.93676000823359706, 0.93676272725345044, 0.93676543594410555, 0.93676813442122919, 0.93677082278871326, 0.936773501138496, 0.9367761695505864, 0.93677882809303958, 0.93678147682195512, 0.93678411578152021, 0.93678674500410442, 0.93678936451036077, 0.93679197430936856, 0.93679457439882052, 0.93679716476521602, 0.93679974538412136, 0.93680231622045407, 0.93680487722878947, 0.93680742835368647, 0.93680996953012885, 0.93681250068386623, 0.93681502173192954, 0.93681753258306255, 0.9368200331382559, 0.9368225232912667, 0.93682500292919235, 0.93682747193306537, 0.93682993017846006, 0.93683237753609905, 0.93683481387255552, 0.93683723905086547, 0.93683965293126459, 0.93684205537179699, 0.93684444622911189, 0.93684682535907204, 0.93684919261749777, 0.93685154786086777, 0.9368538909469849, 0.93685622173567784, 0.93685854008946923, 0.93686084587421969, 0.9368631389597627, 0.93686541922052313, 0.93686768653611008, 0.93686994079184827, 0.93687218187936117, 0.93687440969700975, 0.93687662415038142, 0.93687882515273313, 0.93688101262536583, 0.93688318649794189, 0.9368853467088476, 0.93688749320542719, 0.9368896259442121, 0.9368917448911166, 0.93689385002155356, 0.93689594132055065, 0.93689801878279455, 0.93690008241266221, 0.93690213222418062, 0.93690416824095768, 0.93690619049612045, 0.93690819903212286, 0.93691019390063901, 0.93691217516229253, 0.93691414288647701, 0.93691609715108493, 0.93691803804222595, 0.93691996565389324, 0.9369218800876713, 0.93692378145239141, 0.93692566986374393, 0.93692754544391532, 0.93692940832121607, 0.93693125862969429, 0.93693309650870182, 0.93693492210253015, 0.93693673555997792, 0.93693853703397356, 0.93694032668115179, 0.93694210466145467, 0.93694387113776767, 0.93694562627550415, 0.93694737024225339, 0.93694910320737534, 0.9369508253416966, 0.93695253681712065, 0.93695423780633147, 0.9369559284824629, 0.93695760901878344, 0.93695927958841685, 0.93696094036409028, 0.93696259151783268, 0.93696423322076261, 0.9369658656428852, 0.93696748895279258, 0.93696910331758088, 0.93697070890259471, 0.93697230587127323, 0.93697389438503664, 0.93697547460311081, 0.9369770466824201, 0.93697861077749467, 0.93698016704035469, 0.93698171562043975, 0.93698325666454485, 0.93698479031676385, 0.93698631671843724, 0.93698783600813307, 0.93698934832158254, 0.93699085379173219, 0.9369923525486874, 0.93699384471973846, 0.93699533042936356, 0.93699680979925226, 0.93699828294835541, 0.93699974999285851, 0.93700121104629275, 0.93700266621953698, 0.93700411562088903, 0.93700555935609109, 0.93700699752843519, 0.93700843023880376, 0.9370098575857182, 0.93701127966544528, 0.93701269657204078, 0.93701410839746846, 0.93701551523160964, 0.93701691716241486, 0.93701831427593785, 0.93701970665645129, 0.93702109438650472, 0.93702247754702839, 0.93702385621740303, 0.93702523047557651, 0.93702660039810326, 0.93702796606029226, 0.93702932753621404, 0.93703068489887875, 0.93703203822024228, 0.93703338757134824, 0.93703473302238849, 0.93703607464277072, 0.93703741250123018, 0.93703874666590314, 0.93704007720440163, 0.93704140418389514, 0.93704272767118502, 0.93704404773279326, 0.93704536443501252, 0.93704667784402229, 0.93704798802590283, 0.93704929504675483, 0.93705059897273713, 0.93705189987014892, 0.93705319780548058, 0.9370544928455028, 0.93705578505728004, 0.9370570745082708, 0.93705836126635444, 0.9370596453999146, 0.93706092697787269, 0.93706220606971524, 0.93706348274559881, 0.93706475707633385, 0.93706602913346304, 0.9370672989892973, 0.93706856671694416, 0.93706983239035313, 0.93707109608434402, 0.93707235787462861, 0.9370736178378728, 0.93707487605169193, 0.93707613259467393, 0.93707738754643677, 0.93707864098760574, 0.93707989299985839, 0.93708114366592921, 0.9370823930696357, 0.93708364129585975, 0.93708488843060389, 0.93708613456094991, 0.93708737977510725, 0.93708862416235705, 0.93708986781314163, 0.93709111081895613, 0.93709235327244078, 0.93709359526729874, 0.93709483689834738, 0.93709607826147467, 0.93709731945362185, 0.93709856057279417, 0.93709980171803053, 0.93710104298938146, 0.93710228448788568, 0.93710352631555949, 0.93710476857537739, 0.93710601137120242, 0.93710725480781787, 0.93710849899084925, 0.9371097440267433, 0.93711099002273512, 0.93711223708681524, 0.93711348532768413, 0.93711473485469365, 0.93711598577783017, 0.93711723820764303, 0.93711849225522093, 0.93711974803210385, 0.93712100565025969, 0.93712226522201048, 0.93712352685998168, 0.93712479067703025, 0.93712605678619076, 0.93712732530060538, 0.93712859633343826, 0.93712986999782322, 0.93713114640677431, 0.93713242567311439, 0.93713370790939876, 0.93713499322781124, 0.93713628174008401, 0.93713757355742777, 0.93713886879040409, 0.93714016754885121, 0.93714146994177472, 0.93714277607725105, 0.93714408606232258, 0.93714540000285851, 0.93714671800349281, 0.93714804016745878, 0.93714936659652115, 0.93715069739078161, 0.93715203264863178, 0.93715337246657016, 0.93715471693910035, 0.93715606615857272, 0.93715742021507509, 0.937158779196268, 0.93716014318726415, 0.93716151227046152, 0.93716288652542823, 0.9371642660287216, 0.93716565085376269]}
 '''
 
 # Plot the MSE values
-plt.plot(nmtf.all_performances['MSE'])
\ No newline at end of file
+plt.plot(performances_sink.values['MSE'])
\ No newline at end of file
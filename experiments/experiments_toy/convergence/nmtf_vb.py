@@ -12,6 +12,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.bnmtf_vb_optimised import bnmtf_vb_optimised
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 
 import numpy, matplotlib.pyplot as plt
 
@@ -45,13 +46,14 @@ expF = BNMTF.expF
 expS = BNMTF.expS
 expG = BNMTF.expG
 
-BNMTF.run(iterations)
+performances_sink = MemorySink()
+BNMTF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
 # Plot the tau expectation values to check convergence
 plt.plot(BNMTF.all_exp_tau)
 
 # Extract the performances across all iterations
-print "vb_all_performances = %s" % BNMTF.all_performances
+print "vb_all_performances = %s" % performances_sink.values
 
 '''
 vb_all_performances = {'R^2': [0.5640738157611842, 0.9377691999406352, 0.9408616526339433, 0.9430220793430073, 0.9470802255399074, 0.9571789776719599, 0.9699605812528003, 0.9760635099999311, 0.9780471604119425, 0.9787745785769697, 0.979117655140942, 0.9793122320248447, 0.979442553107223, 0.9795472233135014, 0.979648952673204, 0.9797655930929889, 0.9799155560333175, 0.9801217342260696, 0.9804162662940422, 0.9808526205819487, 0.9819319610355989, 0.9883851974229043, 0.9927280833303324, 0.9943854996577983, 0.9951025786041116, 0.9954912151488043, 0.9957322765339365, 0.9958948665516809, 0.9960117359091515, 0.9961000533536801, 0.9961690968954828, 0.9962241531745667, 0.99626859811864, 0.9963048133316338, 0.9963345643705713, 0.9963591903469013, 0.9963797151827377, 0.9963969268499755, 0.9964114391780778, 0.9964237375900546, 0.996434209643847, 0.9964431599981138, 0.9964508155559995, 0.996457354367668, 0.9964629624582434, 0.9964678286215591, 0.9964721063969654, 0.996475907295325, 0.99647931219445, 0.9964823824310624, 0.9964851667312676, 0.996487705117511, 0.9964900311672186, 0.9964921734346631, 0.9964941564358143, 0.9964960013849578, 0.9964977267761304, 0.9964993488594914, 0.9965008820420387, 0.9965023392310542, 0.9965037321325098, 0.9965050715132098, 0.9965063674335122, 0.9965076294563019, 0.9965088668371014, 0.9965100886995745, 0.9965113042001487, 0.9965125226850421, 0.9965137538426868, 0.9965150078544832, 0.9965162955471342, 0.996517628550607, 0.9965190194670926, 0.9965204820579312, 0.9965220314567188, 0.9965236844164703, 0.9965254595953849, 0.9965273778790019, 0.9965294627288181, 0.9965317405443034, 0.9965342410312057, 0.9965369975820632, 0.9965400476870969, 0.9965434333988121, 0.9965472018720952, 0.9965514059981773, 0.9965561051490333, 0.9965613660480214, 0.9965672637796902, 0.9965738829443865, 0.9965813189522302, 0.9965896794384514, 0.9965990857683592, 0.9966096745817756, 0.996621599300098, 0.9966350314922495, 0.996650162001835, 0.9966672018239541, 0.9966863828669749, 0.9967079587212216, 0.9967322049970244, 0.9967594157860322, 0.9967898486203957, 0.9968234582482813, 0.9968600394848183, 0.9968997925125103, 0.9969429129051841, 0.9969894633351029, 0.9970390496467505, 0.9970907715916443, 0.9971441390111052, 0.9971988275554147, 0.9972544815671623, 0.9973106652893031, 0.9973668994104018, 0.9974227548883532, 0.9974778074542953, 0.9975315122761891, 0.9975833407602679, 0.9976330186925664, 0.9976803836313127, 0.9977252643229142, 0.9977674551442283, 0.9978067220965289, 0.997842913594705, 0.9978760084783472, 0.9979062234875882, 0.9979338070813549, 0.9979589365280958, 0.9979817851513406, 0.9980025423994768, 0.9980213908840214, 0.9980385023704782, 0.9980540422060519, 0.998068170573196, 0.9980810404176625, 0.9980927947554629, 0.9981035644323842, 0.9981134643810351, 0.9981225912678804, 0.9981310315540833, 0.9981388683467812, 0.9981461777978892, 0.9981530250938878, 0.9981594645089605, 0.9981655413284088, 0.9981712938324677, 0.9981767548673257, 0.998181952970361, 0.9981869130724069, 0.9981916568965817, 0.9981962032452021, 0.9982005683087833, 0.9982047660234573, 0.998208808440723, 0.998212706066437, 0.9982164681440581, 0.9982201028769475, 0.9982236175973503, 0.998227018894956, 0.9982303127177583, 0.9982335044549455, 0.998236599007962, 0.9982396008529871, 0.9982425140962873, 0.9982453425230426, 0.9982480896399896, 0.9982507587122063, 0.9982533527944328, 0.9982558747573481, 0.9982583273092119, 0.9982607130132615, 0.9982630343012271, 0.9982652934833643, 0.9982674927554878, 0.9982696342036269, 0.9982717198070855, 0.9982737514407948, 0.9982757308778633, 0.9982776597930821, 0.9982795397678634, 0.9982813722967135, 0.9982831587949812, 0.9982849006073462, 0.998286599016399, 0.9982882552507024, 0.9982898704918727, 0.9982914458804258, 0.9982929825203287, 0.9982944814823463, 0.9982959438063724, 0.9982973705029683, 0.9982987625543319, 0.9983001209148931, 0.9983014465116915, 0.9983027402446546, 0.9983040029868545, 0.9983052355847971, 0.9983064388587723, 0.9983076136032801, 0.9983087605875367, 0.9983098805560608, 0.9983109742293322, 0.9983120423045171, 0.9983130854562497, 0.9983141043374615, 0.9983150995802418, 0.9983160717967194, 0.9983170215799447, 0.9983179495047556, 0.9983188561286076, 0.9983197419923511, 0.9983206076209412, 0.9983214535240735, 0.9983222801967421, 0.9983230881197275, 0.9983238777600265, 0.9983246495712377, 0.9983254039939213, 0.99832614145595, 0.9983268623728604, 0.9983275671482174, 0.9983282561739929, 0.9983289298309594, 0.9983295884890947, 0.9983302325079924, 0.9983308622372733, 0.9983314780169886, 0.998332080178013, 0.9983326690424192, 0.9983332449238355, 0.9983338081277798, 0.9983343589519735, 0.9983348976866314, 0.9983354246147319, 0.9983359400122664, 0.9983364441484703, 0.998336937286037, 0.9983374196813162, 0.9983378915844994, 0.9983383532397929, 0.9983388048855795, 0.9983392467545709, 0.9983396790739527, 0.9983401020655205, 0.9983405159458104, 0.9983409209262237, 0.9983413172131462, 0.9983417050080625, 0.998342084507667, 0.9983424559039703, 0.9983428193844011, 0.9983431751319055, 0.9983435233250402, 0.998343864138061, 0.9983441977410042, 0.9983445242997604, 0.998344843976135, 0.9983451569278963, 0.9983454633088038, 0.9983457632686134, 0.9983460569530538, 0.9983463445037694, 0.9983466260582231, 0.9983469017495589, 0.998347171706421, 0.9983474360527407, 0.9983476949075069, 0.9983479483845552, 0.9983481965924337, 0.9983484396344227, 0.9983486776088085, 0.9983489106095028, 0.9983491387270654, 0.9983493620501037, 0.9983495806669156, 0.9983497946671315, 0.9983500041430674, 0.9983502091905337, 0.9983504099089694, 0.9983506064009307, 0.998350798771102, 0.9983509871250609, 0.9983511715680246, 0.9983513522037443, 0.998351529133639, 0.9983517024561878, 0.9983518722665616, 0.9983520386564475, 0.998352201714017, 0.9983523615239931, 0.9983525181677794, 0.9983526717236249, 0.9983528222668043, 0.9983529698698028, 0.9983531146024947, 0.9983532565323145, 0.9983533957244161, 0.9983535322418174, 0.9983536661455348, 0.9983537974947034, 0.9983539263466867, 0.9983540527571751, 0.998354176780275, 0.9983542984685895, 0.998354417873291, 0.9983545350441878, 0.998354650029783, 0.9983547628773302, 0.9983548736328832, 0.9983549823413419, 0.9983550890464947, 0.9983551937910575, 0.9983552966167104, 0.9983553975641312, 0.9983554966730271, 0.9983555939821651, 0.9983556895293988, 0.998355783351696, 0.9983558754851626, 0.9983559659650671, 0.9983560548258632, 0.99835614210121, 0.9983562278239937, 0.9983563120263464, 0.9983563947396643, 0.9983564759946257, 0.9983565558212073, 0.9983566342486998, 0.9983567113057225, 0.9983567870202373, 0.9983568614195613, 0.9983569345303774, 0.9983570063787459, 0.9983570769901122, 0.9983571463893147, 0.9983572146005905, 0.9983572816475791, 0.998357347553325, 0.9983574123402773, 0.9983574760302877, 0.998357538644606, 0.9983576002038733, 0.9983576607281138, 0.9983577202367226, 0.9983577787484541, 0.9983578362814075, 0.9983578928530128, 0.9983579484800172, 0.9983580031784732, 0.9983580569637308, 0.9983581098504356, 0.9983581618525346, 0.9983582129832932, 0.9983582632553257, 0.9983583126806415, 0.9983583612707091, 0.9983584090365404, 0.9983584559887941, 0.9983585021378966, 0.998358547494179, 0.9983585920680239, 0.9983586358700156, 0.9983586789110849, 0.9983587212026415, 0.9983587627566831, 0.9983588035858756, 0.9983588437035973, 0.9983588831239448, 0.9983589218617016, 0.9983589599322703, 0.9983589973515764, 0.9983590341359494, 0.9983590703019898, 0.9983591058664314, 0.998359140846004, 0.9983591752573063, 0.9983592091166904, 0.9983592424401632, 0.9983592752433054, 0.9983593075412093, 0.9983593393484327, 0.9983593706789696, 0.9983594015462347, 0.9983594319630591, 0.9983594619416964, 0.9983594914938354, 0.9983595206306187, 0.9983595493626659, 0.9983595777000978, 0.9983596056525639, 0.9983596332292688, 0.9983596604389993, 0.9983596872901507, 0.9983597137907517, 0.9983597399484886, 0.9983597657707273, 0.9983597912645348, 0.9983598164366984, 0.9983598412937438, 0.998359865841952, 0.9983598900873744, 0.9983599140358468, 0.9983599376930029, 0.9983599610642856, 0.9983599841549585, 0.998360006970116, 0.9983600295146919, 0.9983600517934694, 0.998360073811088, 0.9983600955720513, 0.9983601170807339, 0.9983601383413884, 0.9983601593581507, 0.9983601801350462, 0.9983602006759954, 0.9983602209848185, 0.9983602410652409, 0.9983602609208975, 0.9983602805553369, 0.9983602999720262, 0.9983603191743551, 0.998360338165639, 0.9983603569491234, 0.9983603755279875, 0.998360393905347, 0.9983604120842581, 0.9983604300677198, 0.9983604478586774, 0.9983604654600247, 0.9983604828746068, 0.9983605001052225, 0.998360517154626, 0.9983605340255295, 0.9983605507206041, 0.9983605672424823, 0.9983605835937585, 0.9983605997769905, 0.998360615794701, 0.9983606316493775, 0.9983606473434739, 0.99836066287941, 0.9983606782595734, 0.9983606934863182, 0.9983607085619663, 0.9983607234888074, 0.9983607382690984, 0.9983607529050643, 0.9983607673988978, 0.998360781752759, 0.9983607959687759, 0.9983608100490441, 0.9983608239956265, 0.9983608378105541, 0.9983608514958249, 0.9983608650534047, 0.998360878485227, 0.9983608917931931, 0.998360904979172, 0.9983609180450007, 0.9983609309924847, 0.9983609438233977, 0.9983609565394822, 0.9983609691424497, 0.9983609816339808, 0.9983609940157261, 0.9983610062893058, 0.9983610184563109, 0.9983610305183027, 0.9983610424768143, 0.99836105433335, 0.9983610660893861, 0.998361077746372, 0.9983610893057294, 0.9983611007688542, 0.9983611121371155, 0.9983611234118576, 0.9983611345943989, 0.9983611456860337, 0.998361156688032, 0.9983611676016404, 0.9983611784280817, 0.9983611891685565, 0.998361199824243, 0.9983612103962973, 0.9983612208858547, 0.9983612312940289, 0.9983612416219138, 0.9983612518705827, 0.9983612620410895, 0.9983612721344692, 0.9983612821517374, 0.9983612920938918, 0.9983613019619116, 0.9983613117567591, 0.9983613214793787, 0.9983613311306981, 0.9983613407116287, 0.9983613502230656, 0.998361359665888, 0.9983613690409597, 0.9983613783491294, 0.9983613875912309, 0.9983613967680836, 0.9983614058804925, 0.9983614149292488, 0.9983614239151304, 0.9983614328389013, 0.998361441701313, 0.9983614505031039, 0.9983614592450001, 0.9983614679277153, 0.9983614765519515, 0.9983614851183987, 0.9983614936277356, 0.9983615020806297, 0.9983615104777374, 0.9983615188197041, 0.9983615271071652, 0.9983615353407453, 0.9983615435210593, 0.9983615516487119, 0.998361559724298, 0.9983615677484033, 0.9983615757216043, 0.9983615836444679, 0.9983615915175524, 0.9983615993414074, 0.9983616071165741, 0.9983616148435847, 0.9983616225229636, 0.9983616301552274, 0.9983616377408844, 0.9983616452804354, 0.9983616527743735, 0.9983616602231845, 0.998361667627347, 0.9983616749873323, 0.9983616823036049, 0.9983616895766223, 0.9983616968068355, 0.9983617039946889, 0.9983617111406203, 0.9983617182450615, 0.9983617253084377, 0.9983617323311685, 0.9983617393136673, 0.9983617462563418, 0.998361753159594, 0.99836176002382, 0.998361766849411, 0.9983617736367524, 0.9983617803862244, 0.9983617870982019, 0.9983617937730552, 0.9983618004111492, 0.998361807012844, 0.998361813578495, 0.9983618201084529, 0.9983618266030636, 0.9983618330626688, 0.9983618394876056, 0.9983618458782066, 0.9983618522348003, 0.9983618585577112, 0.9983618648472591, 0.9983618711037604, 0.998361877327527, 0.9983618835188673, 0.9983618896780856, 0.9983618958054826, 0.9983619019013553, 0.9983619079659969, 0.9983619139996972, 0.9983619200027425, 0.9983619259754154, 0.9983619319179956, 0.9983619378307589, 0.9983619437139782, 0.9983619495679231, 0.9983619553928602, 0.9983619611890525, 0.9983619669567604, 0.9983619726962412, 0.998361978407749, 0.9983619840915354, 0.9983619897478487, 0.9983619953769347, 0.9983620009790362, 0.9983620065543934, 0.9983620121032438, 0.9983620176258222, 0.9983620231223609, 0.9983620285930894, 0.998362034038235, 0.998362039458022, 0.998362044852673, 0.9983620502224073, 0.9983620555674426, 0.9983620608879937, 0.9983620661842735, 0.9983620714564923, 0.9983620767048581, 0.9983620819295771, 0.998362087130853, 0.9983620923088872, 0.9983620974638794, 0.9983621025960269, 0.9983621077055248, 0.9983621127925667, 0.9983621178573435, 0.9983621229000446, 0.9983621279208572, 0.9983621329199667, 0.9983621378975565, 0.9983621428538079, 0.9983621477889008, 0.9983621527030128, 0.9983621575963199, 0.9983621624689961, 0.9983621673212141, 0.998362172153144, 0.9983621769649549, 0.9983621817568138, 0.998362186528886, 0.998362191281335, 0.9983621960143229, 0.9983622007280097, 0.9983622054225543, 0.9983622100981132, 0.9983622147548417, 0.9983622193928934, 0.9983622240124201, 0.998362228613572, 0.9983622331964978, 0.998362237761344, 0.9983622423082561, 0.9983622468373775, 0.99836225134885, 0.9983622558428137, 0.9983622603194067, 0.9983622647787657, 0.9983622692210251, 0.998362273646318, 0.9983622780547752, 0.9983622824465256, 0.998362286821696, 0.9983622911804113, 0.9983622955227941, 0.9983622998489645, 0.9983623041590407, 0.9983623084531379, 0.9983623127313689, 0.9983623169938436, 0.9983623212406693, 0.9983623254719497, 0.9983623296877855, 0.9983623338882738, 0.9983623380735079, 0.9983623422435773, 0.998362346398567, 0.9983623505385576, 0.9983623546636247, 0.9983623587738387, 0.9983623628692645, 0.9983623669499609, 0.9983623710159805, 0.9983623750673688, 0.9983623791041641, 0.9983623831263974, 0.9983623871340909, 0.9983623911272582, 0.998362395105904, 0.9983623990700231, 0.9983624030196001, 0.9983624069546091, 0.9983624108750131, 0.9983624147807638, 0.9983624186718014, 0.9983624225480541, 0.9983624264094383, 0.9983624302558587, 0.9983624340872084, 0.9983624379033694, 0.9983624417042135, 0.9983624454896026, 0.9983624492593904, 0.9983624530134237, 0.9983624567515439, 0.9983624604735888, 0.9983624641793956, 0.9983624678688026, 0.9983624715416519, 0.998362475197793, 0.9983624788370848, 0.9983624824593991, 0.9983624860646233, 0.9983624896526635, 0.998362493223447, 0.9983624967769242, 0.9983625003130716, 0.9983625038318923, 0.9983625073334177, 0.9983625108177083, 0.9983625142848535, 0.9983625177349709, 0.9983625211682061, 0.9983625245847314, 0.9983625279847431, 0.9983625313684609, 0.9983625347361239, 0.9983625380879897, 0.9983625414243307, 0.9983625447454316, 0.998362548051587, 0.9983625513430984, 0.9983625546202718, 0.9983625578834152, 0.998362561132837, 0.9983625643688429, 0.9983625675917348, 0.9983625708018095, 0.9983625739993562, 0.9983625771846568, 0.9983625803579835, 0.998362583519599, 0.998362586669755, 0.9983625898086925, 0.9983625929366411, 0.9983625960538185, 0.9983625991604305, 0.9983626022566712, 0.9983626053427226, 0.998362608418755, 0.9983626114849271, 0.998362614541386, 0.9983626175882677, 0.9983626206256971, 0.998362623653789, 0.9983626266726473, 0.9983626296823669, 0.9983626326830328, 0.9983626356747217, 0.9983626386575015, 0.9983626416314328, 0.998362644596569, 0.9983626475529569, 0.9983626505006377, 0.9983626534396471, 0.998362656370017, 0.9983626592917749, 0.9983626622049463, 0.9983626651095538, 0.9983626680056193, 0.9983626708931638, 0.9983626737722087, 0.9983626766427766, 0.9983626795048918, 0.998362682358581, 0.9983626852038748, 0.9983626880408071, 0.9983626908694166, 0.9983626936897474, 0.998362696501849, 0.998362699305777, 0.9983627021015943, 0.9983627048893698, 0.9983627076691804, 0.9983627104411106, 0.9983627132052523, 0.9983627159617059, 0.99836271871058, 0.9983627214519921, 0.9983627241860681, 0.9983627269129435, 0.9983627296327628, 0.9983627323456811, 0.9983627350518635, 0.9983627377514864, 0.9983627404447383, 0.9983627431318202, 0.998362745812947, 0.9983627484883493, 0.9983627511582736, 0.9983627538229849, 0.9983627564827682, 0.9983627591379305, 0.9983627617888028, 0.9983627644357423, 0.9983627670791354, 0.9983627697193987, 0.9983627723569829, 0.998362774992374, 0.9983627776260956, 0.9983627802587106, 0.9983627828908227, 0.998362785523077, 0.9983627881561598, 0.9983627907907981, 0.9983627934277578, 0.9983627960678411, 0.9983627987118817, 0.9983628013607413, 0.9983628040153014, 0.9983628066764573, 0.9983628093451089, 0.9983628120221512, 0.998362814708464, 0.998362817404902, 0.9983628201122826, 0.9983628228313761, 0.9983628255628945, 0.9983628283074821, 0.9983628310657063, 0.99836283383805, 0.9983628366249052, 0.998362839426568, 0.9983628422432356, 0.9983628450750047, 0.9983628479218715, 0.9983628507837333, 0.9983628536603922, 0.998362856551559, 0.998362859456859, 0.9983628623758392, 0.998362865307975, 0.9983628682526788, 0.9983628712093084, 0.9983628741771747, 0.9983628771555516, 0.9983628801436829, 0.9983628831407917, 0.9983628861460869, 0.9983628891587715, 0.9983628921780477, 0.9983628952031244, 0.9983628982332212, 0.9983629012675739, 0.9983629043054381, 0.9983629073460926, 0.9983629103888422, 0.9983629134330203, 0.9983629164779899, 0.9983629195231455, 0.9983629225679134, 0.9983629256117525, 0.9983629286541545, 0.998362931694643, 0.9983629347327737, 0.9983629377681337, 0.9983629408003404, 0.9983629438290408, 0.9983629468539099, 0.9983629498746504, 0.9983629528909906, 0.9983629559026839, 0.9983629589095065, 0.9983629619112574, 0.9983629649077558, 0.9983629678988408, 0.9983629708843699, 0.9983629738642172, 0.9983629768382732, 0.9983629798064427, 0.9983629827686447, 0.9983629857248103, 0.9983629886748826, 0.9983629916188154, 0.9983629945565722, 0.9983629974881257, 0.9983630004134569, 0.9983630033325541, 0.9983630062454127, 0.9983630091520341, 0.9983630120524255, 0.9983630149465992, 0.9983630178345719, 0.998363020716365, 0.9983630235920028, 0.9983630264615135, 0.9983630293249282, 0.9983630321822804, 0.9983630350336061, 0.9983630378789435, 0.9983630407183323, 0.9983630435518138, 0.9983630463794309, 0.9983630492012275, 0.9983630520172487, 0.9983630548275403, 0.9983630576321486, 0.9983630604311211, 0.9983630632245052, 0.9983630660123488, 0.9983630687947004, 0.9983630715716083, 0.9983630743431212, 0.9983630771092878, 0.9983630798701568, 0.9983630826257769, 0.9983630853761966, 0.9983630881214642, 0.9983630908616283, 0.9983630935967369, 0.9983630963268378, 0.9983630990519788, 0.9983631017722072, 0.99836310448757, 0.9983631071981144, 0.9983631099038867, 0.9983631126049329, 0.9983631153012994, 0.9983631179930313, 0.9983631206801743, 0.9983631233627729, 0.9983631260408717, 0.9983631287145152, 0.998363131383747, 0.9983631340486107, 0.9983631367091493, 0.9983631393654058, 0.9983631420174226, 0.9983631446652418, 0.9983631473089051, 0.9983631499484539, 0.9983631525839293, 0.9983631552153719, 0.9983631578428221, 0.99836316046632, 0.9983631630859051, 0.9983631657016168, 0.9983631683134938, 0.9983631709215751, 0.9983631735258988, 0.9983631761265027, 0.9983631787234246, 0.9983631813167018, 0.9983631839063709, 0.9983631864924687, 0.9983631890750313, 0.9983631916540948, 0.9983631942296946, 0.998363196801866, 0.9983631993706438, 0.9983632019360626, 0.9983632044981567, 0.9983632070569598, 0.9983632096125056, 0.9983632121648273, 0.9983632147139576, 0.9983632172599292, 0.9983632198027741, 0.9983632223425242, 0.998363224879211, 0.9983632274128658, 0.9983632299435192, 0.9983632324712017, 0.9983632349959434, 0.998363237517774, 0.9983632400367228, 0.9983632425528189, 0.9983632450660911, 0.9983632475765672, 0.9983632500842755, 0.9983632525892433, 0.9983632550914977, 0.9983632575910654, 0.9983632600879727, 0.9983632625822454, 0.998363265073909, 0.9983632675629885, 0.9983632700495085, 0.9983632725334931, 0.9983632750149658, 0.9983632774939497, 0.9983632799704676, 0.9983632824445414, 0.9983632849161929, 0.9983632873854428, 0.9983632898523117, 0.9983632923168195, 0.9983632947789852, 0.9983632972388274, 0.998363299696364, 0.9983633021516118, 0.9983633046045876, 0.9983633070553066, 0.9983633095037837, 0.9983633119500328, 0.9983633143940667, 0.9983633168358974, 0.9983633192755359, 0.9983633217129919, 0.9983633241482743, 0.9983633265813906, 0.9983633290123469, 0.9983633314411482, 0.9983633338677979, 0.9983633362922979, 0.9983633387146487], 'MSE': [249.84196048717777, 35.666279410735257, 33.893904931879369, 32.655701621325903, 30.329860140737836, 24.541971910184063, 17.216463573530408, 13.718697809450013, 12.581810130350162, 12.164905647400296, 11.968278501706594, 11.856760836795848, 11.782070038464834, 11.722080502422484, 11.663776450988701, 11.59692643783332, 11.510978320085998, 11.392811608038564, 11.224006723291566, 10.973919404155478, 10.355318033733178, 6.6567807841140354, 4.1677467033130231, 3.217833255648443, 2.8068544793131771, 2.5841155850837199, 2.4459563020750212, 2.3527712394253673, 2.2857900154314406, 2.2351727222197457, 2.1956018625957303, 2.1640475095864891, 2.1385748209467779, 2.1178188302745737, 2.1007676455477831, 2.086653783092066, 2.0748904033974505, 2.0650258968790509, 2.0567084600390251, 2.0496598828481138, 2.0436580445910595, 2.0385283365397235, 2.0341407139101833, 2.0303931309807988, 2.0271789713487336, 2.0243900317832213, 2.0219383144222407, 2.0197599091505909, 2.0178084625447568, 2.0160488207472822, 2.0144530574115569, 2.012998234511691, 2.0116651078490739, 2.010437312140521, 2.0093007965716772, 2.0082434026190472, 2.0072545308129053, 2.0063248677147709, 2.0054461562556938, 2.0046109988973635, 2.0038126866073611, 2.0030450486171998, 2.0023023190435065, 2.001579017119099, 2.0008698382351708, 2.0001695533549078, 1.999472914663766, 1.9987745655725748, 1.9980689533594447, 1.997350242767989, 1.9966122287003967, 1.9958482456843534, 1.9950510710382892, 1.9942128177382694, 1.9933248122807357, 1.9923774530262617, 1.9913600464187677, 1.990260622348822, 1.9890657343511715, 1.9877602521227031, 1.9863271504361737, 1.9847472910578652, 1.9829991872529318, 1.9810587375090087, 1.9788989159908037, 1.976489409197081, 1.9737961893242131, 1.9707810152772263, 1.9674008539200487, 1.9636072183360478, 1.959345426213813, 1.9545537886759334, 1.9491627477380404, 1.943093991148388, 1.9362595886471627, 1.928561209100083, 1.9198894744929851, 1.9101234574044899, 1.8991302444116407, 1.8867644955323879, 1.8728682504796277, 1.8572729567856259, 1.8398310152931669, 1.8205683611425183, 1.7996025917442131, 1.7768189766897409, 1.7521054269372034, 1.7254260231919563, 1.6970066674310804, 1.6673633182135073, 1.6367768997180241, 1.6054333061912802, 1.5735363752273583, 1.5413358518483282, 1.5091064433623673, 1.4770940462642013, 1.4455418213643945, 1.4147620277326347, 1.3850576178129828, 1.3565857515953685, 1.3294395291783687, 1.3037171009711608, 1.2795363155703467, 1.2570312844438494, 1.2362888854226406, 1.2173212461520053, 1.2000041465653506, 1.1841951876334267, 1.169792771658714, 1.1566975618907678, 1.1448009799552097, 1.1339983658863593, 1.1241912758839945, 1.1152849446615267, 1.1071875670013429, 1.099811485249536, 1.0930747327752985, 1.0869023180565998, 1.0812283698766434, 1.0759974858760777, 1.0711601126503938, 1.0666686190848145, 1.0624793603044482, 1.0585549760435875, 1.054864360190904, 1.0513815584244632, 1.0480846312296042, 1.0449547535013282, 1.0419755696392328, 1.0391327910583994, 1.0364139676087529, 1.0338083231362571, 1.0313065783863029, 1.0289007461568562, 1.0265839193836424, 1.0243500768552316, 1.0221939208766708, 1.0201107498633146, 1.018096361492635, 1.0161469790221065, 1.0142591934836938, 1.0124299161770196, 1.0106563379419633, 1.0089358933499837, 1.0072662289806895, 1.0056451754371716, 1.0040707229070753, 1.0025410000792554, 1.0010542561932227, 0.9996088459797744, 0.99820321725637229, 0.99683590095731467, 0.99550550338740107, 0.9942107004719446, 0.99295023372592339, 0.99172290758513315, 0.99052758765316651, 0.98936319935239547, 0.98822872646287685, 0.98712320911308271, 0.98604574094992259, 0.984995465428254, 0.98397157137060232, 0.98297328810204054, 0.98199988053255649, 0.98105064453721258, 0.9801249028973964, 0.97922200195018738, 0.97834130898019389, 0.97748221030087623, 0.97664410991883521, 0.97582642865206348, 0.97502860357442378, 0.97425008767447263, 0.97349034963874947, 0.97274887369275687, 0.9720251594534689, 0.97131872176373901, 0.97062909049163182, 0.9699558102862097, 0.96929844028716028, 0.96865655378924131, 0.96802973786456892, 0.9674175929469887, 0.96681973238387531, 0.96623578196144333, 0.96566537941076269, 0.96510817390309556, 0.96456382554404818, 0.9640320048773392, 0.96351239240900344, 0.96300467816200175, 0.96250856126917395, 0.9620237496093097, 0.96154995948692812, 0.96108691535261559, 0.96063434955703042, 0.96019200212967049, 0.95975962057253561, 0.95933695965956067, 0.95892378123454902, 0.95851985400269868, 0.95812495331349401, 0.95773886093524285, 0.95736136482297163, 0.95699225888298223, 0.95663134273754846, 0.95627842149332154, 0.95593330551661615, 0.95559581021801454, 0.95526575584816142, 0.95494296730572703, 0.95462727395809788, 0.95431850947464336, 0.95401651167220125, 0.95372112237208495, 0.9534321872677034, 0.95314955580191318, 0.95287308105313184, 0.95260261962930104, 0.9523380315688138, 0.95207918024758886, 0.95182593229164691, 0.95157815749442609, 0.95133572873840733, 0.95109852192040933, 0.95086641588022791, 0.95063929233225453, 0.95041703579970194, 0.95019953355131004, 0.94998667554033811, 0.94977835434577296, 0.94957446511599908, 0.94937490551498238, 0.94917957567167344, 0.94898837813319903, 0.9488012178230476, 0.94861800200570245, 0.94843864025959634, 0.94826304446069309, 0.94809112877955382, 0.94792280969476084, 0.94775800602590154, 0.94759663898885771, 0.94743863227511493, 0.94728391215483432, 0.94713240759934714, 0.94698405041274625, 0.94683877535243799, 0.94669652020648298, 0.94655722578184054, 0.94642083574781888, 0.94628729628086405, 0.94615655547861699, 0.94602856255747103, 0.9459032669114813, 0.94578061717075745, 0.945660560426271, 0.94554304176635517, 0.9454280041997587, 0.94531538894837031, 0.9452051360145286, 0.94509718488870775, 0.94499147526792593, 0.94488794768919404, 0.94478654402647311, 0.94468720783847271, 0.9445898845799876, 0.94449452170251147, 0.94440106867237128, 0.94430947693237655, 0.94421969982770326, 0.94413169251162421, 0.94404541184194257, 0.94396081627547612, 0.94387786576506671, 0.94379652166198158, 0.94371674662486771, 0.94363850453614373, 0.94356176042560436, 0.94348648040116168, 0.9434126315861896, 0.94334018206290227, 0.94326910082130855, 0.9431993577130553, 0.94313092340968718, 0.94306376936481207, 0.94299786777972494, 0.94293319157202204, 0.94286971434696742, 0.9428074103711257, 0.94274625454811889, 0.94268622239616473, 0.9426272900272582, 0.94256943412775474, 0.94251263194019519, 0.94245686124627936, 0.94240210035084582, 0.94234832806670976, 0.94229552370037861, 0.94224366703844809, 0.94219273833473371, 0.94214271829798868, 0.94209358808025756, 0.94204532926573881, 0.94199792386028669, 0.94195135428130794, 0.94190560334833107, 0.94186065427398524, 0.94181649065564121, 0.94177309646755214, 0.94173045605362926, 0.94168855412088925, 0.94164737573360047, 0.9416069063082122, 0.94156713160911631, 0.94152803774536298, 0.94148961116836904, 0.9414518386707299, 0.94141470738620703, 0.94137820479097356, 0.94134231870613339, 0.94130703730157073, 0.94127234910105484, 0.94123824298853165, 0.94120470821537661, 0.94117173440836421, 0.94113931157785036, 0.94110743012558662, 0.94107608085140138, 0.94104525495772495, 0.94101494405079578, 0.94098514013714207, 0.94095583561392293, 0.9409270232515935, 0.94089869616727873, 0.94087084778793195, 0.94084347180228933, 0.94081656210169096, 0.94079011271038282, 0.9407641177072612, 0.94073857114175896, 0.94071346694781999, 0.94068879886059154, 0.9406645603408923, 0.94064074451242818, 0.94061734411604347, 0.94059435148427784, 0.94057175853787245, 0.94054955680408237, 0.94052773745515983, 0.94050629136374697, 0.94048520917097322, 0.94046448136250638, 0.94044409834786713, 0.94042405053857303, 0.94040432842151511, 0.94038492262483753, 0.94036582397452362, 0.94034702354070632, 0.94032851267368212, 0.94031028302991937, 0.94029232658900697, 0.94027463566264702, 0.94025720289689141, 0.94024002126892103, 0.94022308407955468, 0.94020638494255604, 0.94018991777165051, 0.94017367676617292, 0.94015765639579796, 0.94014185138507456, 0.94012625669801819, 0.94011086752307904, 0.94009567925874449, 0.94008068749985008, 0.9400658880246876, 0.94005127678299572, 0.94003684988476321, 0.94002260358987588, 0.94000853429857523, 0.93999463854265486, 0.93998091297735131, 0.93996735437393619, 0.93995395961283534, 0.93994072567735476, 0.93992764964784803, 0.93991472869637605, 0.93990196008174431, 0.93988934114491118, 0.93987686930468872, 0.93986454205377967, 0.93985235695505887, 0.9398403116380375, 0.93982840379560539, 0.93981663118089476, 0.93980499160434428, 0.9397934829308936, 0.93978210307732535, 0.93977085000968374, 0.93975972174089373, 0.93974871632837786, 0.93973783187186444, 0.93972706651124904, 0.93971641842451692, 0.93970588582587355, 0.93969546696381778, 0.93968516011945347, 0.93967496360481906, 0.93966487576134372, 0.93965489495839316, 0.93964501959198143, 0.93963524808347965, 0.93962557887858567, 0.93961601044627474, 0.93960654127793264, 0.93959716988655162, 0.93958789480609217, 0.93957871459089148, 0.93956962781516706, 0.93956063307264592, 0.93955172897624306, 0.93954291415782309, 0.93953418726800153, 0.93952554697606405, 0.93951699196983252, 0.93950852095566106, 0.93950013265839405, 0.93949182582138735, 0.93948359920653468, 0.93947545159424328, 0.93946738178349798, 0.93945938859188893, 0.93945147085557934, 0.93944362742932908, 0.93943585718646971, 0.93942815901887777, 0.93942053183691876, 0.93941297456936435, 0.93940548616331154, 0.93939806558408678, 0.93939071181507894, 0.93938342385762985, 0.93937620073084926, 0.93936904147145583, 0.93936194513354676, 0.93935491078842348, 0.93934793752436929, 0.93934102444638923, 0.93933417067600644, 0.93932737535098854, 0.93932063762511087, 0.93931395666787898, 0.93930733166427383, 0.93930076181447297, 0.93929424633360759, 0.93928778445144001, 0.93928137541213697, 0.93927501847398331, 0.93926871290908109, 0.93926245800310915, 0.93925625305505112, 0.9392500973769069, 0.93924399029345917, 0.93923793114196197, 0.9392319192719385, 0.9392259540448904, 0.93922003483405436, 0.93921416102415567, 0.93920833201117748, 0.93920254720209029, 0.93919680601466304, 0.93919110787718152, 0.93918545222827499, 0.9391798385166571, 0.93917426620092381, 0.93916873474935481, 0.93916324363967851, 0.93915779235889041, 0.93915238040305704, 0.93914700727710276, 0.93914167249463754, 0.93913637557777496, 0.93913111605692312, 0.93912589347065223, 0.93912070736548137, 0.93911555729573493, 0.93911044282334943, 0.93910536351775675, 0.93910031895568002, 0.93909530872102065, 0.93909033240465589, 0.93908538960435028, 0.93908047992457533, 0.93907560297636761, 0.93907075837721865, 0.93906594575091196, 0.93906116472740309, 0.93905641494268532, 0.93905169603868177, 0.93904700766309823, 0.93904234946931908, 0.93903772111628581, 0.93903312226838098, 0.93902855259530715, 0.93902401177201056, 0.93901949947852115, 0.9390150153999044, 0.93901055922609022, 0.93900613065184768, 0.93900172937664284, 0.93899735510455007, 0.93899300754414405, 0.93898868640844979, 0.93898439141479784, 0.93898012228478989, 0.93897587874417643, 0.93897166052277259, 0.93896746735441516, 0.93896329897682707, 0.93895915513157546, 0.93895503556399773, 0.93895094002309887, 0.93894686826150153, 0.93894282003536123, 0.9389387951043201, 0.93893479323139273, 0.93893081418294833, 0.93892685772860529, 0.9389229236412161, 0.93891901169673464, 0.93891512167423075, 0.93891125335577297, 0.93890740652640803, 0.93890358097406912, 0.93889977648956524, 0.93889599286648096, 0.93889222990114729, 0.93888848739259245, 0.93888476514248176, 0.93888106295508167, 0.93887738063717774, 0.93887371799807318, 0.93887007484951368, 0.93886645100565269, 0.93886284628300132, 0.93885926050038249, 0.93885569347891284, 0.9388521450419226, 0.93884861501496775, 0.93884510322572112, 0.93884160950400264, 0.9388381336817061, 0.93883467559277733, 0.93883123507314914, 0.9388278119607536, 0.9388244060954466, 0.93882101731901468, 0.93881764547508961, 0.93881429040917574, 0.93881095196856557, 0.93880763000235623, 0.93880432436138828, 0.93880103489822353, 0.93879776146713745, 0.93879450392406139, 0.93879126212657582, 0.93878803593387394, 0.93878482520673889, 0.93878162980754065, 0.93877844960015711, 0.938775284450025, 0.93877213422403971, 0.93876899879059073, 0.93876587801950961, 0.93876277178205902, 0.93875967995092258, 0.93875660240013992, 0.93875353900514291, 0.93875048964270458, 0.93874745419092165, 0.93874443252920414, 0.93874142453823683, 0.93873843010000058, 0.93873544909772155, 0.9387324814158472, 0.9387295269400685, 0.93872658555727018, 0.93872365715552319, 0.93872074162407626, 0.93871783885333038, 0.93871494873483019, 0.938712071161249, 0.9387092060263762, 0.93870635322509643, 0.93870351265339225, 0.93870068420830588, 0.93869786778795494, 0.93869506329150809, 0.93869227061914828, 0.93868948967212384, 0.93868672035267731, 0.93868396256406317, 0.93868121621054035, 0.93867848119735087, 0.93867575743072662, 0.93867304481787661, 0.93867034326696763, 0.93866765268714492, 0.9386649729885036, 0.93866230408210005, 0.93865964587993789, 0.9386569982949764, 0.93865436124113732, 0.93865173463328377, 0.93864911838724507, 0.93864651241981178, 0.93864391664874958, 0.93864133099279901, 0.9386387553716955, 0.93863618970618223, 0.93863363391803467, 0.93863108793006111, 0.93862855166614256, 0.93862602505126835, 0.93862350801153993, 0.93862100047424968, 0.93861850236787869, 0.93861601362216451, 0.93861353416817506, 0.93861106393832361, 0.93860860286647729, 0.9386061508880108, 0.93860370793989201, 0.93860127396074777, 0.93859884889103296, 0.93859643267306525, 0.93859402525119517, 0.93859162657190831, 0.93858923658398552, 0.93858685523866503, 0.9385844824897871, 0.93858211829399218, 0.93857976261092702, 0.93857741540342698, 0.93857507663775919, 0.9385727462838398, 0.93857042431551685, 0.93856811071078605, 0.93856580545207502, 0.93856350852654069, 0.93856121992631913, 0.93855893964881543, 0.93855666769701274, 0.93855440407969681, 0.9385521488117351, 0.93854990191430332, 0.93854766341507923, 0.93854543334840934, 0.93854321175539002, 0.93854099868392082, 0.93853879418865527, 0.9385365983308257, 0.93853441117804715, 0.93853223280388853, 0.93853006328741495, 0.93852790271248587, 0.93852575116695558, 0.93852360874173568, 0.93852147552963971, 0.93851935162411204, 0.93851723711781954, 0.93851513210112014, 0.93851303666044272, 0.93851095087659064, 0.93850887482305301, 0.93850680856431257, 0.93850475215421725, 0.93850270563450555, 0.93850066903343832, 0.93849864236466629, 0.93849662562631708, 0.93849461880033458, 0.93849262185214755, 0.93849063473058303, 0.93848865736807219, 0.93848668968117044, 0.93848473157131129, 0.93848278292577092, 0.93848084361887829, 0.93847891351333979, 0.93847699246167293, 0.93847508030774063, 0.93847317688831078, 0.93847128203461272, 0.93846939557382592, 0.9384675173305479, 0.93846564712819347, 0.93846378479020531, 0.93846193014124568, 0.93846008300822092, 0.93845824322121152, 0.93845641061421992, 0.93845458502593204, 0.93845276630020003, 0.93845095428656888, 0.93844914884062658, 0.93844734982431055, 0.93844555710611099, 0.93844377056122552, 0.93844199007163298, 0.93844021552615442, 0.93843844682043254, 0.93843668385687007, 0.93843492654455629, 0.938433174799161, 0.93843142854275508, 0.93842968770367186, 0.93842795221629116, 0.93842622202085413, 0.93842449706314468, 0.93842277729430656, 0.9384210626705406, 0.93841935315276159, 0.93841764870631528, 0.93841594930063355, 0.93841425490883101, 0.93841256550737517, 0.93841088107566328, 0.93840920159560171, 0.93840752705118902, 0.93840585742806371, 0.93840419271308828, 0.93840253289384257, 0.93840087795821481, 0.93839922789393382, 0.93839758268808615, 0.9383959423267455, 0.93839430679448399, 0.93839267607399246, 0.93839105014568913, 0.9383894289873892, 0.93838781257390314, 0.93838620087680968, 0.93838459386412032, 0.93838299150007887, 0.93838139374491158, 0.93837980055466397, 0.93837821188100234, 0.9383766276710942, 0.93837504786744874, 0.93837347240778102, 0.938371901224892, 0.93837033424649252, 0.93836877139503849, 0.93836721258753508, 0.93836565773526781, 0.93836410674351489, 0.9383625595111631, 0.93836101593029109, 0.93835947588561064, 0.93835793925388034, 0.9383564059031525, 0.93835487569199116, 0.93835334846853413, 0.93835182406944539, 0.93835030231879801, 0.93834878302687941, 0.93834726598888307, 0.93834575098356765, 0.938344237771916, 0.93834272609577951, 0.93834121567660056, 0.93833970621426621, 0.93833819738611413, 0.93833668884617205, 0.93833518022478191, 0.93833367112854282, 0.93833216114078521, 0.93833064982254333, 0.9383291367141855, 0.93832762133762815, 0.93832610319929954, 0.93832458179376055, 0.93832305660798365, 0.93832152712623718, 0.93831999283556489, 0.93831845323159291, 0.93831690782466803, 0.93831535614617545, 0.9383137977547199, 0.9383122322421571, 0.93831065923925938, 0.93830907842082711, 0.93830748951009957, 0.93830589228245276, 0.9383042865681136, 0.93830267225408004, 0.93830104928495439, 0.93829941766290947, 0.93829777744671727, 0.93829612874993085, 0.93829447173828429, 0.93829280662642545, 0.93829113367410233, 0.93828945318187085, 0.9382877654865236, 0.93828607095625904, 0.93828436998581866, 0.93828266299155771, 0.93828095040666881, 0.93827923267657953, 0.9382775102545251, 0.93827578359752251, 0.93827405316257162, 0.93827231940325551, 0.93827058276673503, 0.9382688436910499, 0.93826710260284674, 0.93826535991544113, 0.93826361602720609, 0.93826187132032457, 0.93826012615977672, 0.93825838089265734, 0.93825663584770302, 0.93825489133502527, 0.93825314764609802, 0.93825140505383209, 0.93824966381284913, 0.9382479241598437, 0.93824618631408596, 0.93824445047794813, 0.93824271683755345, 0.93824098556341684, 0.93823925681117826, 0.93823753072231197, 0.93823580742488932, 0.93823408703428512, 0.93823236965398105, 0.93823065537622519, 0.93822894428280279, 0.93822723644571404, 0.93822553192785108, 0.93822383078364158, 0.9382221330596705, 0.93822043879528638, 0.93821874802313776, 0.93821706076974121, 0.93821537705594404, 0.93821369689743661, 0.93821202030515305, 0.9382103472857356, 0.93820867784188966, 0.93820701197272605, 0.93820534967416047, 0.93820369093915001, 0.93820203575802819, 0.93820038411876439, 0.93819873600718429, 0.93819709140721075, 0.93819545030107809, 0.93819381266949409, 0.93819217849186543, 0.938190547746377, 0.9381889204102084, 0.93818729645962506, 0.93818567587010204, 0.93818405861645437, 0.93818244467291045, 0.93818083401319541, 0.93817922661064368, 0.93817762243823011, 0.93817602146868351, 0.938174423674486, 0.93817282902797539, 0.93817123750135889, 0.93816964906677813, 0.93816806369632555, 0.93816648136210268, 0.9381649020361984, 0.93816332569079119, 0.93816175229810483, 0.93816018183045835, 0.93815861426028724, 0.93815704956013546, 0.93815548770268209, 0.93815392866077751, 0.93815237240740079, 0.93815081891571706, 0.93814926815905064, 0.93814772011091363, 0.93814617474499984, 0.93814463203518339, 0.93814309195554135, 0.93814155448034819, 0.9381400195840629, 0.93813848724134319, 0.9381369574270696, 0.93813543011628897, 0.93813390528427953, 0.93813238290650147, 0.93813086295863246, 0.93812934541653825, 0.93812783025629776, 0.93812631745418762, 0.93812480698667433, 0.93812329883045398, 0.93812179296238907, 0.93812028935955949, 0.93811878799925008, 0.93811728885892509, 0.9381157919162596, 0.93811429714911654, 0.93811280453556978, 0.93811131405387904, 0.93810982568249213, 0.93810833940006988, 0.93810685518544956, 0.93810537301767138, 0.93810389287597395, 0.93810241473978229, 0.93810093858870525, 0.93809946440256686, 0.93809799216136236, 0.93809652184529935, 0.93809505343476407, 0.93809358691034184, 0.93809212225281335, 0.93809065944313896, 0.93808919846249927, 0.93808773929224654, 0.93808628191394428, 0.93808482630934631, 0.9380833724604003, 0.93808192034926752, 0.93808046995828565, 0.93807902127001719, 0.93807757426721206, 0.93807612893283976, 0.93807468525006221, 0.93807324320226271, 0.93807180277302993, 0.93807036394618259, 0.93806892670572672, 0.93806749103591536, 0.93806605692123257, 0.93806462434636662, 0.93806319329626064, 0.93806176375608608, 0.93806033571126679, 0.93805890914747692, 0.93805748405063971, 0.938056060406953, 0.93805463820287638, 0.93805321742515468, 0.93805179806083383, 0.93805038009722896, 0.9380489635220004, 0.93804754832310178, 0.93804613448883956, 0.93804472200785205, 0.93804331086915627, 0.93804190106213259, 0.93804049257656275, 0.93803908540263903, 0.93803767953099682, 0.93803627495270991, 0.93803487165933641, 0.93803346964294043, 0.93803206889610702, 0.9380306694119861, 0.93802927118430801, 0.93802787420741862, 0.93802647847632425, 0.93802508398672091, 0.93802369073503822, 0.93802229871847465, 0.93802090793504989, 0.93801951838364162, 0.93801813006404955], 'Rp': [0.93577179442291958, 0.96909596999980718, 0.97006798079822532, 0.97112995718622852, 0.97319823201471622, 0.97836384132782406, 0.98487976866350735, 0.98796846437474206, 0.98896665631063407, 0.98933243464266796, 0.98950510364898114, 0.98960308966193278, 0.98966874750254086, 0.98972151171303613, 0.98977282787172272, 0.98983170179024127, 0.98990742739422233, 0.99001156349832087, 0.99016033691347516, 0.99038074107836538, 0.99092591904524174, 0.99418145283974302, 0.9963625213796018, 0.99719117894828624, 0.99754943088890069, 0.99774372734024619, 0.99786430907985757, 0.99794566513579275, 0.9980041562792018, 0.99804836361851423, 0.99808292567340662, 0.99811048659646073, 0.99813273569819261, 0.99815086493461114, 0.99816575792125406, 0.9981780849526819, 0.9981883587017486, 0.9981969737593962, 0.99820423749622955, 0.9982103929595062, 0.9982156342370474, 0.99822011411112399, 0.99822394644117163, 0.99822722006825537, 0.99823002761816804, 0.99823246344599692, 0.99823460448729218, 0.99823650667175434, 0.99823821056678963, 0.99823974692674944, 0.9982411401707274, 0.99824241034671923, 0.99824357426840515, 0.998244646230802, 0.99824563850549064, 0.99824656171054482, 0.99824742510204345, 0.99824823681268915, 0.99824900405238781, 0.9982497332801854, 0.99825043035365346, 0.99825110066016809, 0.99825174923357352, 0.99825238085885259, 0.99825300016744378, 0.99825361172516747, 0.99825422011459453, 0.99825483001359916, 0.99825544627143958, 0.99825607398390026, 0.9982567185692528, 0.99825738584697621, 0.99825808212237288, 0.99825881428066343, 0.99825958989488861, 0.99826041735165227, 0.99826130599633511, 0.9982622662960271, 0.99826331001424473, 0.99826445039081835, 0.99826570232379719, 0.998267082557309, 0.99826860988534682, 0.99827030538356898, 0.99827219267981604, 0.99827429827231251, 0.99827665190341974, 0.99827928699656499, 0.99828224116293995, 0.99828555678059527, 0.99828928164347475, 0.99829346967135901, 0.99829818166489159, 0.99830348608046882, 0.9983094597860741, 0.99831618874510664, 0.99832376857770722, 0.99833230499252334, 0.99834191415923168, 0.99835272308976619, 0.99836486981171957, 0.99837850158955566, 0.99839374717490847, 0.99841058288162288, 0.99842890578611343, 0.99844881765238158, 0.9984704168411801, 0.9984937381440524, 0.99851858550774208, 0.99854449776326559, 0.99857122927143638, 0.99859862014874823, 0.99862649345176635, 0.99865463159629353, 0.99868279392477233, 0.99871076454911445, 0.99873833075704932, 0.99876521996111889, 0.99879116824420033, 0.9988160383216047, 0.99883974855876145, 0.9988622134447851, 0.99888333097272564, 0.99890298466914695, 0.99892109823822872, 0.99893766024119146, 0.99895277967566265, 0.99896658186887777, 0.99897915557663652, 0.99899058735693036, 0.99900097214645089, 0.99901040149724429, 0.99901896146470825, 0.99902673485661531, 0.99903380189016511, 0.99904023916663087, 0.99904611833849433, 0.99905150499819562, 0.99905645671485166, 0.99906102174718159, 0.9990652432308148, 0.99906916277377678, 0.99907281857450669, 0.99907624331440459, 0.99907946416673954, 0.99908250377097174, 0.99908538123702884, 0.99908811294471511, 0.99909071312187825, 0.99909319420686249, 0.99909556705058133, 0.99909784105643096, 0.99910002432925715, 0.99910212384968455, 0.9991041456561921, 0.99910609501322689, 0.99910797655215156, 0.99910979438229097, 0.99911155217545433, 0.99911325323052813, 0.99911490052426155, 0.99911649675308489, 0.99911804436893936, 0.99911954561083649, 0.99912100253269553, 0.99912241702785298, 0.99912379085053171, 0.99912512563418376, 0.99912642290722298, 0.99912768410611175, 0.99912891058617481, 0.99913010363025612, 0.9991312644554079, 0.99913239421787714, 0.9991334940165536, 0.99913456489520092, 0.99913560784399291, 0.99913662380060431, 0.99913761365152587, 0.99913857823381758, 0.99913951833766179, 0.99914043470969371, 0.9991413280569138, 0.99914219905111112, 0.99914304833315892, 0.99914387651712189, 0.99914468419381575, 0.99914547193373904, 0.99914624028928389, 0.9991469897964097, 0.99914772097577242, 0.99914843433339473, 0.99914913036117681, 0.99914980953711496, 0.99915047232550269, 0.99915111917700017, 0.99915175052880878, 0.99915236680476771, 0.99915296841554291, 0.99915355575885645, 0.99915412921969793, 0.99915468917066552, 0.99915523597228051, 0.99915576997334954, 0.99915629151136354, 0.99915680091293613, 0.99915729849419044, 0.99915778456125626, 0.99915825941068181, 0.99915872332990452, 0.99915917659759246, 0.99915961948415088, 0.99916005225197924, 0.99916047515585837, 0.99916088844322115, 0.99916129235435691, 0.99916168712269471, 0.99916207297495907, 0.99916245013137828, 0.99916281880581848, 0.99916317920602138, 0.99916353153371784, 0.99916387598489831, 0.99916421274993139, 0.99916454201381133, 0.99916486395633375, 0.99916517875234023, 0.99916548657187032, 0.99916578758040475, 0.99916608193899881, 0.99916636980450768, 0.99916665132971638, 0.9991669266635389, 0.99916719595110759, 0.99916745933394313, 0.99916771695009587, 0.99916796893421056, 0.99916821541767376, 0.99916845652868991, 0.99916869239238881, 0.99916892313092531, 0.99916914886350594, 0.99916936970653059, 0.99916958577362425, 0.99916979717572207, 0.99917000402113054, 0.99917020641557408, 0.99917040446228755, 0.99917059826204735, 0.99917078791322755, 0.99917097351187212, 0.99917115515173394, 0.99917133292429838, 0.99917150691889101, 0.999171677222639, 0.99917184392059122, 0.99917200709569665, 0.99917216682881849, 0.99917232319882676, 0.99917247628251338, 0.9991726261546644, 0.99917277288797657, 0.99917291655306184, 0.99917305721837057, 0.99917319495011636, 0.99917332981220053, 0.99917346186611233, 0.99917359117079196, 0.9991737177826685, 0.9991738417555398, 0.99917396314072304, 0.99917408198722357, 0.99917419834217247, 0.99917431225132469, 0.99917442375980237, 0.99917453291285252, 0.99917463975657483, 0.99917474433850073, 0.99917484670781187, 0.99917494691534836, 0.99917504501323162, 0.99917514105435656, 0.99917523509179218, 0.99917532717818991, 0.99917541736528481, 0.99917550570352998, 0.99917559224183317, 0.99917567702740817, 0.99917576010575748, 0.99917584152060401, 0.99917592131400024, 0.99917599952638825, 0.99917607619661819, 0.99917615136213433, 0.99917622505898684, 0.99917629732195101, 0.99917636818461997, 0.99917643767945863, 0.99917650583786943, 0.99917657269030469, 0.99917663826624548, 0.99917670259434022, 0.99917676570235436, 0.99917682761733695, 0.99917688836553964, 0.9991769479725463, 0.99917700646321261, 0.99917706386178717, 0.99917712019188842, 0.9991771754765264, 0.99917722973814938, 0.99917728299864772, 0.99917733527936037, 0.99917738660115141, 0.99917743698432837, 0.99917748644876014, 0.99917753501383411, 0.99917758269846946, 0.99917762952115208, 0.99917767549994874, 0.99917772065248267, 0.99917776499599487, 0.99917780854730276, 0.99917785132286763, 0.99917789333874441, 0.99917793461064119, 0.99917797515392481, 0.99917801498355141, 0.99917805411418248, 0.99917809256012646, 0.99917813033539182, 0.99917816745361365, 0.99917820392814216, 0.99917823977200593, 0.99917827499795064, 0.99917830961838316, 0.99917834364541491, 0.9991783770908671, 0.99917840996627516, 0.99917844228285413, 0.99917847405152138, 0.99917850528290464, 0.99917853598730411, 0.99917856617474443, 0.99917859585489466, 0.99917862503712085, 0.99917865373048009, 0.9991786819436419, 0.99917870968498546, 0.99917873696250314, 0.99917876378385884, 0.99917879015635136, 0.99917881608693937, 0.99917884158224368, 0.99917886664856848, 0.99917889129187332, 0.99917891551793769, 0.99917893933224755, 0.99917896274015527, 0.99917898574689967, 0.99917900835768947, 0.99917903057777124, 0.99917905241247573, 0.9991790738673455, 0.99917909494815049, 0.99917911566096318, 0.99917913601219122, 0.99917915600858154, 0.99917917565723968, 0.99917919496559804, 0.99917921394138776, 0.99917923259259578, 0.99917925092737059, 0.99917926895402387, 0.99917928668086886, 0.99917930411625555, 0.99917932126841691, 0.99917933814549753, 0.99917935475543085, 0.99917937110594979, 0.99917938720455091, 0.99917940305845077, 0.99917941867459059, 0.99917943405963838, 0.99917944921995205, 0.99917946416163295, 0.99917947889046699, 0.99917949341201295, 0.99917950773153896, 0.99917952185408643, 0.99917953578446894, 0.99917954952724075, 0.99917956308679046, 0.99917957646731137, 0.99917958967279941, 0.99917960270708528, 0.99917961557384394, 0.99917962827659323, 0.99917964081872723, 0.99917965320349567, 0.99917966543403314, 0.99917967751336256, 0.99917968944438529, 0.99917970122992006, 0.99917971287268159, 0.99917972437529956, 0.99917973574030516, 0.99917974697017531, 0.99917975806728021, 0.99917976903395833, 0.99917977987243745, 0.99917979058490003, 0.99917980117347516, 0.99917981164024461, 0.99917982198719424, 0.99917983221629525, 0.99917984232945356, 0.9991798523285379, 0.99917986221535648, 0.99917987199168079, 0.99917988165926264, 0.99917989121978157, 0.99917990067490925, 0.99917991002626971, 0.9991799192754478, 0.9991799284240247, 0.99917993747351463, 0.99917994642543273, 0.99917995528125747, 0.99917996404244169, 0.99917997271040981, 0.99917998128657948, 0.99917998977233424, 0.9991799981690237, 0.99918000647799543, 0.99918001470058471, 0.99918002283808316, 0.99918003089179452, 0.99918003886296924, 0.99918004675287053, 0.99918005456272574, 0.99918006229375445, 0.99918006994714892, 0.99918007752409033, 0.99918008502576006, 0.99918009245330042, 0.9991800998078284, 0.99918010709048333, 0.99918011430233689, 0.99918012144450175, 0.99918012851802385, 0.99918013552395424, 0.99918014246332731, 0.99918014933715504, 0.99918015614644995, 0.99918016289217204, 0.99918016957530464, 0.99918017619679422, 0.99918018275756249, 0.99918018925852814, 0.99918019570060035, 0.99918020208465297, 0.99918020841156063, 0.99918021468217633, 0.99918022089733438, 0.99918022705785492, 0.99918023316455162, 0.99918023921820742, 0.99918024521960458, 0.99918025116950415, 0.99918025706865876, 0.99918026291778872, 0.99918026871762766, 0.99918027446888213, 0.99918028017224414, 0.99918028582840235, 0.99918029143801035, 0.99918029700173172, 0.99918030252020817, 0.99918030799407487, 0.99918031342395042, 0.99918031881044023, 0.99918032415414038, 0.99918032945563362, 0.99918033471551471, 0.99918033993432742, 0.99918034511263065, 0.99918035025098062, 0.9991803553498857, 0.999180360409894, 0.99918036543150279, 0.99918037041523622, 0.99918037536157944, 0.99918038027101341, 0.99918038514403862, 0.99918038998109182, 0.99918039478266651, 0.99918039954920079, 0.99918040428113253, 0.99918040897892069, 0.99918041364297505, 0.99918041827372861, 0.9991804228715977, 0.99918042743698199, 0.99918043197028561, 0.99918043647191024, 0.99918044094222924, 0.99918044538162221, 0.9991804497904887, 0.9991804541691659, 0.99918045851803472, 0.999180462837435, 0.99918046712773068, 0.99918047138924726, 0.99918047562234491, 0.99918047982734393, 0.9991804840045726, 0.99918048815434723, 0.99918049227699046, 0.99918049637280992, 0.99918050044211271, 0.99918050448520557, 0.99918050850237872, 0.99918051249391571, 0.99918051646011175, 0.99918052040125904, 0.99918052431761772, 0.99918052820947001, 0.99918053207709667, 0.99918053592073708, 0.99918053974066867, 0.99918054353714969, 0.99918054731042327, 0.99918055106074766, 0.99918055478836665, 0.9991805584935175, 0.99918056217643536, 0.99918056583737458, 0.99918056947654788, 0.99918057309417974, 0.99918057669050864, 0.9991805802657443, 0.99918058382011654, 0.9991805873538282, 0.99918059086710209, 0.99918059436013984, 0.99918059783314206, 0.99918060128632669, 0.99918060471987946, 0.99918060813401288, 0.99918061152890492, 0.99918061490475263, 0.99918061826175453, 0.99918062160008525, 0.99918062491993387, 0.99918062822147347, 0.99918063150489989, 0.99918063477038066, 0.99918063801808854, 0.99918064124820272, 0.99918064446088095, 0.99918064765631265, 0.99918065083463314, 0.99918065399603762, 0.99918065714066151, 0.99918066026867958, 0.99918066338024436, 0.99918066647550852, 0.99918066955462614, 0.99918067261775245, 0.99918067566503865, 0.99918067869662419, 0.99918068171266006, 0.99918068471329857, 0.99918068769866708, 0.99918069066890869, 0.99918069362417072, 0.99918069656459263, 0.99918069949029775, 0.99918070240142098, 0.99918070529810699, 0.99918070818047633, 0.99918071104866579, 0.9991807139028096, 0.99918071674301345, 0.9991807195694149, 0.99918072238213551, 0.9991807251813013, 0.99918072796702406, 0.99918073073943414, 0.99918073349864756, 0.99918073624477755, 0.99918073897793525, 0.99918074169824633, 0.99918074440581717, 0.99918074710076399, 0.99918074978318994, 0.9991807524532067, 0.99918075511093074, 0.99918075775645032, 0.99918076038989279, 0.9991807630113525, 0.9991807656209275, 0.99918076821873358, 0.99918077080486967, 0.99918077337942057, 0.99918077594249921, 0.99918077849420306, 0.99918078103463559, 0.99918078356387896, 0.99918078608202843, 0.99918078858918724, 0.99918079108545022, 0.99918079357089207, 0.99918079604563603, 0.99918079850973829, 0.99918080096330963, 0.99918080340643634, 0.99918080583919022, 0.99918080826167666, 0.99918081067397591, 0.99918081307616724, 0.99918081546834026, 0.99918081785057389, 0.99918082022295562, 0.99918082258556862, 0.99918082493848104, 0.99918082728177815, 0.99918082961554588, 0.99918083193985818, 0.99918083425478721, 0.99918083656041545, 0.99918083885681197, 0.99918084114406647, 0.99918084342222901, 0.99918084569138876, 0.99918084795161144, 0.9991808502029772, 0.99918085244553789, 0.99918085467938456, 0.99918085690457259, 0.99918085912116483, 0.99918086132924588, 0.99918086352886348, 0.99918086572008002, 0.99918086790297922, 0.99918087007759959, 0.99918087224401919, 0.99918087440228576, 0.99918087655246846, 0.99918087869461614, 0.99918088082878187, 0.99918088295502594, 0.99918088507340952, 0.99918088718395781, 0.99918088928673565, 0.99918089138179755, 0.99918089346917316, 0.99918089554891509, 0.99918089762105644, 0.99918089968563084, 0.9991809017426887, 0.99918090379225488, 0.99918090583435049, 0.99918090786901403, 0.99918090989625896, 0.99918091191610792, 0.99918091392857566, 0.99918091593367642, 0.9991809179314014, 0.99918091992177416, 0.99918092190478169, 0.99918092388041257, 0.99918092584866236, 0.99918092780950096, 0.99918092976292083, 0.99918093170888767, 0.99918093364734628, 0.9991809355782858, 0.99918093750164583, 0.99918093941737973, 0.999180941325432, 0.99918094322572337, 0.99918094511821698, 0.9991809470028179, 0.99918094887946318, 0.999180950748076, 0.99918095260857964, 0.99918095446089306, 0.9991809563049332, 0.99918095814063568, 0.99918095996792455, 0.99918096178671145, 0.99918096359695352, 0.99918096539858847, 0.99918096719156746, 0.99918096897585418, 0.99918097075142043, 0.999180972518244, 0.99918097427634001, 0.99918097602570244, 0.99918097776637149, 0.99918097949837525, 0.99918098122178578, 0.99918098293664781, 0.99918098464307337, 0.99918098634113783, 0.99918098803095756, 0.99918098971265246, 0.99918099138633987, 0.99918099305216246, 0.99918099471028687, 0.99918099636082491, 0.99918099800395732, 0.9991809996398191, 0.99918100126858622, 0.99918100289040135, 0.9991810045054319, 0.99918100611383387, 0.99918100771575313, 0.99918100931133047, 0.9991810109007262, 0.99918101248407165, 0.99918101406149795, 0.99918101563313821, 0.99918101719911379, 0.99918101875955356, 0.99918102031454936, 0.99918102186420843, 0.99918102340863302, 0.99918102494791938, 0.99918102648215468, 0.9991810280114054, 0.99918102953576537, 0.99918103105529321, 0.99918103257004209, 0.99918103408008863, 0.99918103558547222, 0.99918103708624773, 0.99918103858245289, 0.99918104007412778, 0.99918104156131549, 0.99918104304404076, 0.9991810445223176, 0.99918104599619173, 0.99918104746567737, 0.99918104893079418, 0.99918105039154703, 0.99918105184797057, 0.99918105330006524, 0.9991810547478458, 0.99918105619132369, 0.99918105763051035, 0.99918105906541599, 0.99918106049605737, 0.99918106192243938, 0.99918106334458634, 0.99918106476250745, 0.99918106617622049, 0.99918106758575287, 0.99918106899111392, 0.99918107039233617, 0.99918107178944948, 0.9991810731824905, 0.99918107457147731, 0.99918107595646066, 0.99918107733748129, 0.99918107871459483, 0.99918108008784412, 0.99918108145727969, 0.99918108282297213, 0.99918108418498164, 0.99918108554337626, 0.9991810868982407, 0.99918108824963969, 0.99918108959767604, 0.99918109094243024, 0.99918109228399854, 0.99918109362249607, 0.99918109495802954, 0.99918109629072005, 0.99918109762071183, 0.99918109894811802, 0.9991811002731058, 0.99918110159583862, 0.99918110291648099, 0.99918110423522899, 0.99918110555229189, 0.99918110686788131, 0.99918110818223793, 0.99918110949561378, 0.9991811108082943, 0.99918111212056349, 0.99918111343274441, 0.99918111474518345, 0.99918111605821569, 0.99918111737224491, 0.99918111868764847, 0.99918112000485493, 0.99918112132428505, 0.99918112264637826, 0.99918112397159486, 0.99918112530036984, 0.99918112663317438, 0.99918112797044412, 0.99918112931260483, 0.99918113066008563, 0.99918113201327585, 0.999181133372543, 0.99918113473822856, 0.9991811361106161, 0.99918113748996262, 0.99918113887649251, 0.99918114027034421, 0.99918114167165473, 0.99918114308048356, 0.99918114449685835, 0.99918114592073859, 0.99918114735205399, 0.99918114879069497, 0.99918115023650189, 0.99918115168927513, 0.99918115314878075, 0.99918115461477575, 0.99918115608695079, 0.99918115756500125, 0.99918115904859039, 0.9991811605373756, 0.99918116203099971, 0.99918116352907838, 0.99918116503123977, 0.99918116653711209, 0.99918116804629908, 0.99918116955842828, 0.99918117107312465, 0.99918117259002137, 0.99918117410876717, 0.99918117562898801, 0.99918117715036425, 0.99918117867256695, 0.99918118019529267, 0.99918118171822534, 0.99918118324109206, 0.99918118476361306, 0.99918118628554031, 0.99918118780664811, 0.99918118932669586, 0.99918119084547385, 0.99918119236278824, 0.99918119387846738, 0.99918119539233841, 0.99918119690424712, 0.99918119841405217, 0.99918119992161969, 0.99918120142684563, 0.99918120292960988, 0.99918120442981628, 0.99918120592738102, 0.99918120742224281, 0.99918120891431461, 0.99918121040353325, 0.99918121188985465, 0.99918121337323274, 0.99918121485362854, 0.99918121633100243, 0.99918121780533453, 0.99918121927659376, 0.99918122074478211, 0.99918122220985162, 0.99918122367182372, 0.99918122513067642, 0.99918122658641595, 0.99918122803903187, 0.99918122948853838, 0.9991812309349335, 0.99918123237823564, 0.99918123381843782, 0.99918123525557268, 0.99918123668963044, 0.99918123812064663, 0.99918123954862859, 0.99918124097358996, 0.99918124239555295, 0.99918124381454809, 0.99918124523056717, 0.99918124664365993, 0.99918124805383179, 0.99918124946111109, 0.99918125086551413, 0.99918125226706522, 0.99918125366579369, 0.99918125506172295, 0.99918125645486644, 0.99918125784526368, 0.99918125923291745, 0.99918126061786983, 0.99918126200013224, 0.99918126337974, 0.99918126475670177, 0.99918126613105906, 0.99918126750281877, 0.99918126887202818, 0.99918127023868131, 0.99918127160282899, 0.99918127296447623, 0.99918127432365822, 0.99918127568038229, 0.99918127703468484, 0.99918127838659376, 0.99918127973611659, 0.99918128108329352, 0.99918128242812809, 0.99918128377065785, 0.99918128511089432, 0.99918128644886672, 0.99918128778459758, 0.99918128911810344, 0.99918129044941284, 0.99918129177854276, 0.99918129310550541, 0.99918129443035231, 0.9991812957530618, 0.99918129707368109, 0.9991812983922409, 0.99918129970873337, 0.99918130102319525, 0.99918130233564906, 0.99918130364610325, 0.99918130495458934, 0.9991813062611149, 0.99918130756571621, 0.99918130886839385, 0.99918131016918654, 0.99918131146809208, 0.99918131276513944, 0.99918131406036281, 0.99918131535375054, 0.99918131664534227, 0.99918131793514608, 0.99918131922318953, 0.99918132050947883, 0.99918132179404362, 0.99918132307689023, 0.99918132435804141, 0.99918132563752005, 0.99918132691533457, 0.99918132819150118, 0.99918132946604499, 0.99918133073897641, 0.99918133201030312, 0.99918133328006309, 0.9991813345482633, 0.99918133581490698, 0.99918133708001677, 0.99918133834362455, 0.99918133960572242, 0.99918134086634203, 0.99918134212548759, 0.99918134338317977, 0.99918134463942332, 0.99918134589425001, 0.9991813471476565, 0.99918134839967354, 0.99918134965031247, 0.99918135089956206, 0.99918135214746495, 0.99918135339402137, 0.99918135463925495, 0.99918135588316936, 0.99918135712577194, 0.99918135836708788, 0.99918135960711951, 0.99918136084588627, 0.99918136208339015, 0.99918136331965279, 0.9991813645546751, 0.99918136578849004, 0.99918136702107929, 0.99918136825247228, 0.99918136948266745, 0.99918137071167679, 0.99918137193952206, 0.99918137316620448, 0.99918137439172316, 0.99918137561609865, 0.99918137683933894, 0.99918137806143481, 0.99918137928241468, 0.99918138050227667, 0.99918138172102455, 0.99918138293866421, 0.99918138415520208, 0.99918138537064149, 0.99918138658499323, 0.99918138779825039, 0.99918138901042275, 0.99918139022150609, 0.99918139143149554, 0.99918139264041106, 0.99918139384823434]}
@@ -13,6 +13,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.bnmf_gibbs_optimised import bnmf_gibbs_optimised
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 
 import numpy, random, scipy, matplotlib.pyplot as plt
 
@@ -48,11 +49,12 @@ for i in range(0,repeats):
     # Run the classifier
     BNMF = bnmf_gibbs_optimised(R,M,K,priors) 
     BNMF.initialise(init_UV)
-    BNMF.run(iterations)
+    performances_sink = MemorySink()
+    BNMF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
     # Extract the performances and timestamps across all iterations
     times_repeats.append(BNMF.all_times)
-    performances_repeats.append(BNMF.all_performances)
+    performances_repeats.append(performances_sink.values)
 
 # Check whether seed worked: all performances should be the same
 assert all([numpy.array_equal(p, performances_repeats[0]) for p in performances_repeats]), \
@@ -13,6 +13,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmf_np import NMF
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 
 import numpy, random, scipy, matplotlib.pyplot as plt
 
@@ -45,11 +46,12 @@ for i in range(0,repeats):
     # Run the classifier
     nmf = NMF(R,M,K) 
     nmf.initialise(init_UV,expo_prior)
-    nmf.run(iterations)
+    performances_sink = MemorySink()
+    nmf.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
     # Extract the performances and timestamps across all iterations
     times_repeats.append(nmf.all_times)
-    performances_repeats.append(nmf.all_performances)
+    performances_repeats.append(performances_sink.values)
 
 # Check whether seed worked: all performances should be the same
 assert all([numpy.array_equal(performances, performances_repeats[0]) for performances in performances_repeats]), \
@@ -13,6 +13,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.bnmtf_gibbs_optimised import bnmtf_gibbs_optimised
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 
 import numpy, random, scipy, matplotlib.pyplot as plt
 
@@ -50,11 +51,12 @@ for i in range(0,repeats):
     # Run the classifier
     BNMTF = bnmtf_gibbs_optimised(R,M,K,L,priors) 
     BNMTF.initialise(init_S,init_FG)
-    BNMTF.run(iterations)
+    performances_sink = MemorySink()
+    BNMTF.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
     # Extract the performances and timestamps across all iterations
     times_repeats.append(BNMTF.all_times)
-    performances_repeats.append(BNMTF.all_performances)
+    performances_repeats.append(performances_sink.values)
 
 # Check whether seed worked: all performances should be the same
 assert all([numpy.array_equal(performances, performances_repeats[0]) for performances in performances_repeats]), \
@@ -13,6 +13,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmtf_icm import nmtf_icm
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 
 import numpy, random, scipy, matplotlib.pyplot as plt
 
@@ -53,11 +54,12 @@ for i in range(0,repeats):
     # Run the classifier
     NMTF = nmtf_icm(R,M,K,L,priors)
     NMTF.initialise(init_S=init_S,init_FG=init_FG)
-    NMTF.run(iterations,minimum_TN=minimum_TN)
+    performances_sink = MemorySink()
+    NMTF.run(iterations,minimum_TN=minimum_TN,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
     # Extract the performances and timestamps across all iterations
     times_repeats.append(NMTF.all_times)
-    performances_repeats.append(NMTF.all_performances)
+    performances_repeats.append(performances_sink.values)
 
 
 # Check whether seed worked: all performances should be the same
@@ -12,6 +12,7 @@ project_location = os.path.dirname(__file__)+"/../../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.models.nmtf_np import NMTF
+from BNMTF.code.models.observers import IterationObserver, MemorySink, PrintSink
 
 import numpy, random, scipy, matplotlib.pyplot as plt
 
@@ -44,11 +45,12 @@ for i in range(0,repeats):
     # Run the classifier
     nmtf = NMTF(R,M,K,L) 
     nmtf.initialise(init_S,init_FG,expo_prior)
-    nmtf.run(iterations)
+    performances_sink = MemorySink()
+    nmtf.run(iterations,observers=[IterationObserver(metrics=['MSE','R^2','Rp'],sinks=[performances_sink,PrintSink()])])
 
     # Extract the performances and timestamps across all iterations
     times_repeats.append(nmtf.all_times)
-    performances_repeats.append(nmtf.all_performances)
+    performances_repeats.append(performances_sink.values)
 
 # Check whether seed worked: all performances should be the same
 assert all([numpy.array_equal(performances, performances_repeats[0]) for performances in performances_repeats]), \
@@ -0,0 +1,49 @@
+"""
+Test the vectorised draws of the rtnorm library in rtnorm.py.
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+from BNMTF.code.models.distributions.rtnorm import rtnorm
+import numpy, pytest
+
+# Test draws with scalar arguments and a size - verify they are in [a,b]
+def test_rtnorm_size():
+    # Cover Chopin's algorithm, the left tail, the right tail, and a small interval
+    for (a,b,mu,sigma) in [(0.,numpy.inf,1.,3.),(-10.,10.,0.,1.),(0.,numpy.inf,-20.,1.),(2.,2.1,0.,1.),(-numpy.inf,-1.,0.,2.)]:
+        draws = rtnorm(a,b,mu=mu,sigma=sigma,size=1000)
+        assert draws.shape == (1000,)
+        assert numpy.all(draws >= a) and numpy.all(draws <= b)
+        
+    r, p = rtnorm(0.,1.,size=10,probabilities=True)
+    assert r.shape == (10,) and p.shape == (10,)
+    assert numpy.all(p > 0.)
+        
+# Test draws with array arguments
+def test_rtnorm_arrays():
+    mu = numpy.array([[-30.,-2.,0.],[1.,5.,100.]])
+    sigma = numpy.array([[1.,0.5,2.],[1.,3.,1.]])
+    draws = rtnorm(0.,numpy.inf,mu=mu,sigma=sigma)
+    assert draws.shape == (2,3)
+    assert numpy.all(draws >= 0.)
+    
+    # The mean of many draws should be close to the expectation, 0.5 + pdf(0.5)/(1-cdf(0.5)) = 1.141
+    draws = rtnorm(0.5*numpy.ones(10000),numpy.inf)
+    assert abs(draws.mean() - 1.141) < 0.05
+    
+    with pytest.raises(Exception) as error:
+        rtnorm(numpy.array([0.,2.]),numpy.array([1.,1.]))
+    assert str(error.value) == "For a truncated ndst in [a,b] b must be greater than a."
+    
+# Test single draws with scalar arguments, which use the scalar algorithm
+def test_rtnorm_scalar():
+    for (a,b,mu,sigma) in [(0.,numpy.inf,1.,3.),(0.,numpy.inf,-20.,1.),(2.,2.1,0.,1.)]:
+        draw = rtnorm(a,b,mu=mu,sigma=sigma)
+        assert draw.shape == (1,)
+        assert a <= draw[0] <= b
+        
+    r, p = rtnorm(0.,1.,mu=numpy.float64(0.5),probabilities=True)
+    assert r.shape == (1,) and p.shape == (1,)
+    assert p[0] > 0.
@@ -18,7 +18,8 @@ def test_expectation():
     
     lambdav = ( norm.pdf( - mu[0] / sigma[0] ) ) / ( 1 - norm.cdf( - mu[0] / sigma[0] ) )
     expectation = mu[0] + sigma[0] * lambdav
-    assert numpy.array_equal(TN_vector_expectation(mu,tau), [expectation, 1./2000.])
+    # The second is close to the exponential approximation 1/2000, with a relative error of about 2/x^2 = 1/1000
+    assert numpy.allclose(TN_vector_expectation(mu,tau), [expectation, 0.0004995012453969358], rtol=0.000000000001, atol=0)
     
 def test_variance():
     # One normal case, one exponential approximation
@@ -28,7 +29,28 @@ def test_variance():
     
     lambdav = ( norm.pdf( - mu[0] / sigma[0] ) ) / ( 1 - norm.cdf( - mu[0] / sigma[0] ) )
     variance = sigma[0]**2 * ( 1 - ( lambdav * ( lambdav + mu[0] / sigma[0] ) ) )
-    assert numpy.array_equal(TN_vector_variance(mu,tau), [variance, (1./2000.)**2])
+    assert numpy.allclose(TN_vector_variance(mu,tau), [variance, 2.4925310891108535e-07], rtol=0.000000000001, atol=0)
+    
+# Test the expectation and variance in the far tails, and that invalid values give 0
+def test_expectation_variance_tails():
+    mus = numpy.array([-100., -1., 1000., 0.5, 1.])
+    taus = numpy.array([10.**10, 10.**6, 1., 0., numpy.nan])
+    expectations, variances = TN_vector_expectation(mus,taus), TN_vector_variance(mus,taus)
+    assert isinstance(expectations,numpy.ndarray) and isinstance(variances,numpy.ndarray)
+    
+    # Far tail: exponential with rate |mu|*tau, up to a relative error of about 2/x^2 and 5/x^2 for x = -mu*sqrt(tau)
+    for n in [0,1]:
+        x2 = mus[n]**2 * taus[n]
+        assert abs(expectations[n] * abs(mus[n]) * taus[n] - 1.) < 3. / x2
+        assert abs(variances[n] * (abs(mus[n]) * taus[n])**2 - 1.) < 6. / x2
+    # Mean far above zero: the normal distribution itself
+    assert expectations[2] == 1000. and variances[2] == 1.
+    assert numpy.array_equal(expectations[3:], [0.,0.]) and numpy.array_equal(variances[3:], [0.,0.])
+    
+    # The expectation and variance are continuous where we switch to the continued fraction (x = 5)
+    mus = -5. + numpy.array([-0.000000001,0.000000001])
+    assert abs(TN_vector_expectation(mus,[1.,1.])[0] - TN_vector_expectation(mus,[1.,1.])[1]) < 0.0000000001
+    assert abs(TN_vector_variance(mus,[1.,1.])[0] - TN_vector_variance(mus,[1.,1.])[1]) < 0.0000000001
 
 # Test a draw - simply verify it is > 0.
 # Also test whether we get inf for a very negative mean and high variance
@@ -39,7 +61,21 @@ def test_draw():
     for i in range(0,100):
         v1,v2 = TN_vector_draw(mu,tau)
         assert v1 >= 0.0 and v2 == 0.0
+
         
+# Test drawing a whole matrix at once, including the far tail (mu << -30*sigma)
+def test_draw_matrix():
+    mus = numpy.array([[1.0, -1.0, -100.], [0., 5., -1.]])
+    taus = numpy.array([[3.0, 2000., 10.], [1., 0., 1.]])
+    draws = TN_vector_draw(mus,taus)
+    assert draws.shape == (2,3)
+    assert numpy.all(draws >= 0.) and numpy.all(numpy.isfinite(draws))
+    assert draws[1,1] == 0.
+    
+    # The mean of many draws in the tail should be close to the exponential's mean, 1/(|mu|*tau)
+    draws = TN_vector_draw(-100.*numpy.ones(10000),10.*numpy.ones(10000))
+    assert abs(draws.mean() - 0.001) < 0.0001
+
 # Test the mode
 def test_mode():
     # Positive mean
@@ -0,0 +1,33 @@
+"""
+Shared setup for the test_sparse tests of the models, which check that the
+sparse mode gives the same updates and performances as the dense mode.
+"""
+
+import numpy, scipy.sparse
+
+(I,J) = (6,5)
+
+
+# Return the dataset R (I x J), the training mask M with four missing entries, and the test mask M_test = 1 - M
+def dataset():
+    numpy.random.seed(0)
+    R = numpy.random.rand(I,J)
+    M = numpy.ones((I,J))
+    M[0,1], M[2,3], M[4,0], M[5,4] = 0, 0, 0, 0
+    return (R,M,1-M)
+
+# Return (model_dense,model_sparse,M_test): the model <classifier>(R,M,*args) for the dataset, in dense and in sparse mode
+def dense_and_sparse(classifier,*args):
+    (R,M,M_test) = dataset()
+    model_dense = classifier(R,M,*args)
+    model_sparse = classifier(scipy.sparse.csr_matrix(R),scipy.sparse.csr_matrix(M),*args,sparse=True)
+    return (model_dense,model_sparse,M_test)
+
+# Assert the two models give the same performances on M_test for the metrics, and the same model qualities for
+# the qualities, to the given tolerances. We pass <args> to predict and quality (burn_in and thinning for Gibbs).
+def assert_same_performances(model_dense,model_sparse,M_test,metrics=['MSE','R^2','Rp'],qualities=['loglikelihood','BIC','AIC','MSE'],
+                             args=(),rtol=0,atol=0.000000000001):
+    for metric in metrics:
+        assert numpy.allclose(model_sparse.predict(M_test,*args)[metric],model_dense.predict(M_test,*args)[metric],rtol=rtol,atol=atol)
+    for metric in qualities:
+        assert numpy.allclose(model_sparse.quality(metric,*args),model_dense.quality(metric,*args),rtol=rtol,atol=atol)
@@ -8,6 +8,8 @@ sys.path.append(project_location)
 
 import numpy, math, pytest, itertools
 from BNMTF.code.models.bnmf_gibbs_optimised import bnmf_gibbs_optimised
+from BNMTF.code.models.sample_store import MemmapSampleStore
+from BNMTF.tests.code.sparse_mode import dense_and_sparse, assert_same_performances
 
 
 """ Test constructor """
@@ -236,6 +238,38 @@ def test_run():
     assert taus[1] != alpha/float(beta)
     
     
+""" Test running the sampler with the draws stored in memory-mapped files """
+def test_run_memmap_store(tmpdir):
+    I,J,K = 10,5,2
+    R = numpy.ones((I,J))
+    M = numpy.ones((I,J))
+    M[0,0], M[2,2], M[3,1] = 0, 0, 0
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2, 'lambdaV':3 }
+    (iterations,burn_in,thinning) = (15,4,3)
+    
+    all_samples = []
+    for store in [None,MemmapSampleStore(str(tmpdir),burn_in=burn_in,thinning=thinning,chunk_size=2)]:
+        numpy.random.seed(0)
+        BNMF = bnmf_gibbs_optimised(R,M,K,priors)
+        BNMF.initialise('exp')
+        BNMF.run(iterations,store=store)
+        all_samples.append((BNMF.all_U,BNMF.all_V,BNMF.all_tau,BNMF.approx_expectation(burn_in,thinning),BNMF.predict(M,burn_in,thinning)))
+    (samples_memory,samples_memmap) = all_samples
+    
+    assert samples_memmap[0].shape == (iterations,I,K)
+    assert numpy.load(str(tmpdir.join('U.npy'))).shape == (4,I,K)
+    for it in range(burn_in,iterations,thinning):
+        assert numpy.array_equal(samples_memory[0][it],samples_memmap[0][it])
+        assert numpy.array_equal(samples_memory[1][it],samples_memmap[1][it])
+        assert samples_memory[2][it] == samples_memmap[2][it]
+    for exp_memory,exp_memmap in zip(samples_memory[3],samples_memmap[3]):
+        assert numpy.array_equal(exp_memory,exp_memmap)
+    assert samples_memory[4]['MSE'] == samples_memmap[4]['MSE']
+    with pytest.raises(AssertionError) as error:
+        BNMF.approx_expectation(0,1)
+    assert str(error.value) == "Iteration 0 was not stored (burn-in 4, thinning 3)."
+    
+    
 """ Test approximating the expectations for U, V, tau """
 def test_approx_expectation():
     burn_in = 2
@@ -302,6 +336,11 @@ def test_predict():
     assert performances['MSE'] == MSE
     assert performances['R^2'] == R2
     assert performances['Rp'] == Rp
+
+    # The same entries given as indices, and the predictions for those entries
+    performances = BNMF.predict((numpy.array([0,1,3,3]),numpy.array([2,1,0,1])),burn_in,thinning)
+    assert performances['MSE'] == MSE
+    assert numpy.array_equal(BNMF.predict_entries([0,1,3,3],[2,1,0,1],burn_in,thinning),[21084.,21168.,21168.,21168.])
     
     
 """ Test the evaluation measures MSE, R^2, Rp """
@@ -357,4 +396,25 @@ def test_log_likelihood():
     assert MSE == BNMF.quality('MSE',burnin,thinning)
     with pytest.raises(AssertionError) as error:
         BNMF.quality('FAIL',burnin,thinning)
-    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
\ No newline at end of file
+    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
+
+
+""" Test that the sparse mode gives the same updates and performances as the dense mode """
+def test_sparse():
+    K = 3
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2, 'lambdaV':3 }
+    (BNMF_dense,BNMF_sparse,M_test) = dense_and_sparse(bnmf_gibbs_optimised,K,priors)
+    (I,J) = M_test.shape
+    U, V = numpy.random.rand(I,K), numpy.random.rand(J,K)
+    for BNMF in [BNMF_dense,BNMF_sparse]:
+        BNMF.U, BNMF.V, BNMF.tau = numpy.copy(U), numpy.copy(V), 3.
+        BNMF.all_U, BNMF.all_V, BNMF.all_tau = numpy.array([U]), numpy.array([V]), numpy.array([3.])
+    
+    assert BNMF_sparse.size_Omega == BNMF_dense.size_Omega
+    assert abs(BNMF_sparse.beta_s() - BNMF_dense.beta_s()) < 0.000000000001
+    for k in range(0,K):
+        assert numpy.allclose(BNMF_sparse.tauU(k),BNMF_dense.tauU(k),rtol=0,atol=0.000000000001)
+        assert numpy.allclose(BNMF_sparse.muU(BNMF_sparse.tauU(k),k),BNMF_dense.muU(BNMF_dense.tauU(k),k),rtol=0,atol=0.000000000001)
+        assert numpy.allclose(BNMF_sparse.tauV(k),BNMF_dense.tauV(k),rtol=0,atol=0.000000000001)
+        assert numpy.allclose(BNMF_sparse.muV(BNMF_sparse.tauV(k),k),BNMF_dense.muV(BNMF_dense.tauV(k),k),rtol=0,atol=0.000000000001)
+    assert_same_performances(BNMF_dense,BNMF_sparse,M_test,args=(0,1))
@@ -8,6 +8,7 @@ sys.path.append(project_location)
 
 import numpy, math, pytest, itertools, random
 from BNMTF.code.models.bnmf_vb_optimised import bnmf_vb_optimised
+from BNMTF.tests.code.sparse_mode import dataset, dense_and_sparse, assert_same_performances
 
 
 """ Test constructor """
@@ -372,6 +373,10 @@ def test_predict():
     assert performances['MSE'] == MSE
     assert performances['R^2'] == R2
     assert performances['Rp'] == Rp
+    
+    # Editing the test mask in place gives the performances for the new mask
+    M_test[3,:] = 0
+    assert BNMF.predict(M_test)['MSE'] == (444408561. + 447872569.) / 2.
        
         
 """ Test the evaluation measures MSE, R^2, Rp """
@@ -426,4 +431,30 @@ def test_log_likelihood():
     assert MSE == BNMF.quality('MSE')
     with pytest.raises(AssertionError) as error:
         BNMF.quality('FAIL')
-    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
\ No newline at end of file
+    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
+
+
+""" Test that the sparse mode (and a boolean mask) gives the same updates and performances as the dense mode """
+def test_sparse():
+    K = 3
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2, 'lambdaV':3 }
+    (BNMF_dense,BNMF_sparse,M_test) = dense_and_sparse(bnmf_vb_optimised,K,priors)
+    (R,M,_) = dataset()
+    BNMF_bool = bnmf_vb_optimised(R,M.astype(bool),K,priors)
+    for BNMF in [BNMF_dense,BNMF_sparse,BNMF_bool]:
+        numpy.random.seed(1)
+        BNMF.initialise(init='random')
+        for k in range(0,K):
+            BNMF.update_U(k)
+            BNMF.update_exp_U(k)
+        for k in range(0,K):
+            BNMF.update_V(k)
+            BNMF.update_exp_V(k)
+        BNMF.update_tau()
+        BNMF.update_exp_tau()
+    
+    for attr in ['muU','tauU','muV','tauV','alpha_s','beta_s']:
+        assert numpy.allclose(getattr(BNMF_sparse,attr),getattr(BNMF_dense,attr),rtol=0.000000001,atol=0)
+        assert numpy.array_equal(getattr(BNMF_bool,attr),getattr(BNMF_dense,attr))
+    assert numpy.allclose(BNMF_sparse.elbo(),BNMF_dense.elbo(),rtol=0.000000001,atol=0)
+    assert_same_performances(BNMF_dense,BNMF_sparse,M_test,rtol=0.000000001,atol=0)
@@ -8,6 +8,8 @@ sys.path.append(project_location)
 
 import numpy, math, pytest, itertools
 from BNMTF.code.models.bnmtf_gibbs_optimised import bnmtf_gibbs_optimised
+from BNMTF.code.models.sample_store import MemmapSampleStore, SummarySampleStore
+from BNMTF.tests.code.sparse_mode import dataset, dense_and_sparse, assert_same_performances
 
 
 """ Test constructor """
@@ -251,7 +253,7 @@ def test_muS():
     # (Rij - Fi*S*Gj + Fik*Skl*Gjk) * Fik*Gjk = 23/30 * 1/10 = 23/300
     muS = 1./tauS * ( 3. * numpy.array([[12*23./300.,12*23./300.,12*23./300.,12*23./300.],[12*23./300.,12*23./300.,12*23./300.,12*23./300.]]) - lambdaS )
     for k,l in itertools.product(xrange(0,K),xrange(0,L)):
-        assert abs(BNMTF.muS(tauS[k,l],k,l) - muS[k,l]) < 0.000000000000001
+        assert abs(BNMTF.muS(tauS[k,l],k,l) - muS[k,l]) < 0.00000000000001
         
 def test_tauG():
     BNMTF = bnmtf_gibbs_optimised(R,M,K,L,priors)
@@ -272,7 +274,22 @@ def test_muG():
     muG = 1./tauG * ( 3. * numpy.array([[4.*4./15.,4.*4./15.,4.*4./15.,4.*4./15.],[4.*4./15.,4.*4./15.,4.*4./15.,4.*4./15.],[4.*4./15.,4.*4./15.,4.*4./15.,4.*4./15.]]) - lambdaG )
     for j,l in itertools.product(xrange(0,J),xrange(0,L)):
         assert abs(BNMTF.muG(tauG[:,l],l)[j] - muG[j,l]) < 0.000000000000001
-      
+
+        
+def test_residual():
+    BNMTF = bnmtf_gibbs_optimised(R,M,K,L,priors)
+    BNMTF.initialise(init_S,init_FG)
+    # R - FSG.T = 11/15 on the observed entries, 0 elsewhere
+    assert numpy.array_equal(BNMTF.E == 0., M == 0.)
+    assert numpy.abs(BNMTF.E - M*11./15.).max() < 0.000000000000001
+    
+    # After setting new values the rank-one updates should match recomputing it from scratch
+    BNMTF.set_F(1,numpy.arange(I,dtype=float))
+    BNMTF.set_S(0,2,2.)
+    BNMTF.set_G(3,numpy.arange(J,dtype=float))
+    expected_E = M * (R - numpy.dot(BNMTF.F,numpy.dot(BNMTF.S,BNMTF.G.T)))
+    assert numpy.abs(BNMTF.E - expected_E).max() < 0.000000000001
+    assert BNMTF.F[4,1] == 4. and BNMTF.S[0,2] == 2. and BNMTF.G[2,3] == 2.      
       
 """ Test some iterations, and that the values have changed in U and V. """
 def test_run():
@@ -312,6 +329,63 @@ def test_run():
     assert taus[1] != alpha/float(beta)
     
     
+""" Test running the sampler with the draws stored in memory-mapped files """
+def test_run_memmap_store(tmpdir):
+    I,J,K,L = 10,5,3,2
+    R = numpy.ones((I,J))
+    M = numpy.ones((I,J))
+    M[0,0], M[2,2], M[3,1] = 0, 0, 0
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    (iterations,burn_in,thinning) = (12,2,5)
+    
+    expectations = []
+    for store in [None,MemmapSampleStore(str(tmpdir),burn_in=burn_in,thinning=thinning)]:
+        numpy.random.seed(0)
+        BNMTF = bnmtf_gibbs_optimised(R,M,K,L,priors)
+        BNMTF.initialise('exp','exp')
+        (Fs,Ss,Gs,taus) = BNMTF.run(iterations,store=store)
+        expectations.append(BNMTF.approx_expectation(burn_in,thinning))
+    
+    assert len(Fs) == iterations and Ss.shape == (iterations,K,L)
+    assert numpy.load(str(tmpdir.join('G.npy'))).shape == (2,J,L)
+    for exp_memory,exp_memmap in zip(*expectations):
+        assert numpy.array_equal(exp_memory,exp_memmap)
+    
+    
+""" Test running the sampler while only keeping running summaries of the draws """
+def test_run_summary_store():
+    I,J,K,L = 10,5,3,2
+    numpy.random.seed(1)
+    R = numpy.random.rand(I,J)
+    M = numpy.ones((I,J))
+    M[0,0], M[2,2], M[3,1] = 0, 0, 0
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    (iterations,burn_in,thinning) = (12,2,3)
+    (rows,columns) = ([0,2,3],[0,2,1])
+    
+    BNMTFs = []
+    for store in [None,SummarySampleStore(burn_in,thinning,rows,columns,seed=0)]:
+        numpy.random.seed(0)
+        BNMTF = bnmtf_gibbs_optimised(R,M,K,L,priors)
+        BNMTF.initialise('exp','exp')
+        BNMTF.run(iterations,store=store)
+        BNMTFs.append(BNMTF)
+    (BNMTF_memory,BNMTF_summary) = BNMTFs
+    
+    for exp_memory,exp_summary in zip(BNMTF_memory.approx_expectation(burn_in,thinning),BNMTF_summary.approx_expectation(burn_in,thinning)):
+        assert numpy.allclose(exp_memory,exp_summary,rtol=0,atol=0.000000000001)
+    for metric in ['MSE','R^2','Rp']:
+        assert abs(BNMTF_memory.predict(1-M,burn_in,thinning)[metric] - BNMTF_summary.predict(1-M,burn_in,thinning)[metric]) < 0.000000000001
+    assert abs(BNMTF_memory.quality('BIC',burn_in,thinning) - BNMTF_summary.quality('BIC',burn_in,thinning)) < 0.000000001
+    
+    Fs = numpy.array([BNMTF_memory.all_F[it] for it in range(burn_in,iterations,thinning)])
+    assert numpy.allclose(BNMTF_summary.all_F.variance(),Fs.var(axis=0),rtol=0,atol=0.000000000001)
+    predictions = numpy.array([BNMTF_memory.predict_draw({ 'F':BNMTF_memory.all_F[it], 'S':BNMTF_memory.all_S[it], 'G':BNMTF_memory.all_G[it] },rows,columns) for it in range(burn_in,iterations,thinning)])
+    (lower,upper) = BNMTF_summary.store.predictions.interval(0.9)
+    assert numpy.allclose(lower,numpy.percentile(predictions,5.,axis=0))
+    assert numpy.allclose(upper,numpy.percentile(predictions,95.,axis=0))
+    
+    
 """ Test approximating the expectations for F, S, G, tau """
 def test_approx_expectation():
     burn_in = 2
@@ -445,4 +519,60 @@ def test_log_likelihood():
     assert MSE == BNMTF.quality('MSE',burnin,thinning)
     with pytest.raises(AssertionError) as error:
         BNMTF.quality('FAIL',burnin,thinning)
-    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
\ No newline at end of file
+    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
+
+
+""" Test that the sparse mode gives the same updates and performances as the dense mode """
+def test_sparse():
+    (K,L) = (3,2)
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    (BNMTF_dense,BNMTF_sparse,M_test) = dense_and_sparse(bnmtf_gibbs_optimised,K,L,priors)
+    (I,J) = M_test.shape
+    F, S, G = numpy.random.rand(I,K), numpy.random.rand(K,L), numpy.random.rand(J,L)
+    for BNMTF in [BNMTF_dense,BNMTF_sparse]:
+        BNMTF.F, BNMTF.S, BNMTF.G, BNMTF.tau = numpy.copy(F), numpy.copy(S), numpy.copy(G), 3.
+        BNMTF.all_F, BNMTF.all_S, BNMTF.all_G, BNMTF.all_tau = numpy.array([F]), numpy.array([S]), numpy.array([G]), numpy.array([3.])
+        BNMTF.compute_residual()
+        
+    # Also check the rank-one updates of the residual
+    for BNMTF in [BNMTF_dense,BNMTF_sparse]:
+        BNMTF.set_F(1,F[:,1]+1.)
+        BNMTF.set_S(0,1,S[0,1]+2.)
+        BNMTF.set_G(0,G[:,0]+3.)
+    assert numpy.allclose(BNMTF_sparse.E.toarray(),BNMTF_dense.E,rtol=0,atol=0.000000000001)
+    
+    assert abs(BNMTF_sparse.beta_s() - BNMTF_dense.beta_s()) < 0.000000000001
+    for k in range(0,K):
+        assert numpy.allclose(BNMTF_sparse.muF(BNMTF_sparse.tauF(k),k),BNMTF_dense.muF(BNMTF_dense.tauF(k),k),rtol=0,atol=0.000000000001)
+    for k,l in itertools.product(xrange(0,K),xrange(0,L)):
+        assert abs(BNMTF_sparse.muS(BNMTF_sparse.tauS(k,l),k,l) - BNMTF_dense.muS(BNMTF_dense.tauS(k,l),k,l)) < 0.000000000001
+    for l in range(0,L):
+        assert numpy.allclose(BNMTF_sparse.muG(BNMTF_sparse.tauG(l),l),BNMTF_dense.muG(BNMTF_dense.tauG(l),l),rtol=0,atol=0.000000000001)
+    assert_same_performances(BNMTF_dense,BNMTF_sparse,M_test,args=(0,1))
+        
+        
+""" Test that tauS and muS using the Gram products match tauS(k,l) and muS(k,l) during a sweep over S """
+def test_gram_S():
+    (K,L) = (3,2)
+    (R,M,_) = dataset()
+    (I,J) = R.shape
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    
+    for sparse in [False,True]:
+        BNMTF = bnmtf_gibbs_optimised(R,M,K,L,priors,sparse=sparse)
+        BNMTF.F, BNMTF.S, BNMTF.G, BNMTF.tau = numpy.random.rand(I,K), numpy.random.rand(K,L), numpy.random.rand(J,L), 3.
+        BNMTF.compute_residual()
+        BNMTF.compute_gram_S()
+        for k,l in itertools.product(xrange(0,K),xrange(0,L)):
+            # set_S_gram() leaves the residual alone, so recompute it for muS
+            BNMTF.compute_residual()
+            (tauSkl,tauSkl_gram) = (BNMTF.tauS(k,l),BNMTF.tauS_gram(k,l))
+            assert abs(tauSkl - tauSkl_gram) < 0.000000001 * tauSkl
+            assert abs(BNMTF.muS(tauSkl,k,l) - BNMTF.muS_gram(tauSkl,k,l)) < 0.000000001
+            E = BNMTF.E.copy()
+            BNMTF.set_S_gram(k,l,BNMTF.S[k,l]+k-l+0.5)
+            assert (BNMTF.E != E).nnz == 0 if sparse else numpy.array_equal(BNMTF.E,E)
+        FEG = numpy.copy(BNMTF.FEG)
+        BNMTF.compute_residual()
+        BNMTF.compute_gram_S()
+        assert numpy.allclose(FEG,BNMTF.FEG,rtol=0,atol=0.000000001)
@@ -8,6 +8,8 @@ sys.path.append(project_location)
 
 import numpy, math, pytest, itertools
 from BNMTF.code.models.bnmtf_vb_optimised import bnmtf_vb_optimised
+from BNMTF.code.models.observed_entries import dense
+from BNMTF.tests.code.sparse_mode import dataset, dense_and_sparse, assert_same_performances
 
 
 """ Test constructor """
@@ -545,6 +547,12 @@ def test_predict():
     assert performances['MSE'] == MSE
     assert performances['R^2'] == R2
     assert performances['Rp'] == Rp
+
+    # The same entries given as indices, and the predictions for those entries
+    performances = BNMTF.predict(([0,1,3,3],[2,1,0,1]),metrics=['MSE','MAE'])
+    assert performances['MSE'] == MSE
+    assert performances['MAE'] == (3542109. + 3556219. + 3556214. + 3556213.) / 4.
+    assert numpy.array_equal(BNMTF.predict_entries([0,1,3,3],[2,1,0,1]),[3542112.,3556224.,3556224.,3556224.])
        
         
 """ Test the evaluation measures MSE, R^2, Rp """
@@ -602,4 +610,110 @@ def test_log_likelihood():
     assert MSE == BNMTF.quality('MSE')
     with pytest.raises(AssertionError) as error:
         BNMTF.quality('FAIL')
-    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
\ No newline at end of file
+    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
+
+
+""" Test that the sparse mode gives the same updates and performances as the dense mode """
+def test_sparse():
+    (K,L) = (3,2)
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    (BNMTF_dense,BNMTF_sparse,M_test) = dense_and_sparse(bnmtf_vb_optimised,K,L,priors)
+    for BNMTF in [BNMTF_dense,BNMTF_sparse]:
+        numpy.random.seed(1)
+        BNMTF.initialise(init_S='random',init_FG='random')
+        for k,l in itertools.product(xrange(0,K),xrange(0,L)):
+            BNMTF.update_S(k,l)
+            BNMTF.update_exp_S(k,l)
+        for k in range(0,K):
+            BNMTF.update_F(k)
+            BNMTF.update_exp_F(k)
+        for l in range(0,L):
+            BNMTF.update_G(l)
+            BNMTF.update_exp_G(l)
+        BNMTF.update_tau()
+        BNMTF.update_exp_tau()
+    
+    for attr in ['muF','tauF','muS','tauS','muG','tauG','alpha_s','beta_s']:
+        assert numpy.allclose(getattr(BNMTF_sparse,attr),getattr(BNMTF_dense,attr),rtol=0.000000001,atol=0)
+    assert numpy.allclose(BNMTF_sparse.elbo(),BNMTF_dense.elbo(),rtol=0.000000001,atol=0)
+    assert_same_performances(BNMTF_dense,BNMTF_sparse,M_test,metrics=['MSE','R^2'],rtol=0.000000001,atol=0)
+    # Rp over the four test entries amplifies rounding differences in the truncated normal tails
+    assert_same_performances(BNMTF_dense,BNMTF_sparse,M_test,metrics=['Rp'],qualities=[],rtol=0.000001,atol=0)
+        
+        
+""" Test that the updates of S using the Gram products give the same values as update_S(k,l) """
+def test_update_S_gram():
+    (K,L) = (3,2)
+    (R,M,_) = dataset()
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    
+    for sparse in [False,True]:
+        (BNMTF_gram,BNMTF) = (bnmtf_vb_optimised(R,M,K,L,priors,sparse=sparse),bnmtf_vb_optimised(R,M,K,L,priors,sparse=sparse))
+        for model in [BNMTF_gram,BNMTF]:
+            numpy.random.seed(1)
+            model.initialise(init_S='random',init_FG='random')
+        
+        BNMTF_gram.compute_gram_S()
+        for k,l in [(1,0),(0,1),(2,1),(0,0),(1,1)]:
+            BNMTF_gram.update_S_gram(k,l)
+            BNMTF_gram.update_exp_S_gram(k,l)
+            BNMTF.update_S(k,l)
+            BNMTF.update_exp_S(k,l)
+        for attr in ['muS','tauS','expS','varS']:
+            assert numpy.allclose(getattr(BNMTF_gram,attr),getattr(BNMTF,attr),rtol=0.000000001,atol=0)
+        
+        
+""" Test that the updates of F and G give the same values with the second moments computed once per sweep """
+def test_moments():
+    (K,L) = (3,2)
+    (R,M,_) = dataset()
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    
+    for sparse in [False,True]:
+        BNMTF = bnmtf_vb_optimised(R,M,K,L,priors,sparse=sparse)
+        numpy.random.seed(1)
+        BNMTF.initialise(init_S='random',init_FG='random')
+        (moments_F,moments_G) = (BNMTF.compute_moments_F(),BNMTF.compute_moments_G())
+        for k in range(0,K):
+            BNMTF.update_F(k)
+            (muFk,tauFk) = (numpy.copy(BNMTF.muF[:,k]),numpy.copy(BNMTF.tauF[:,k]))
+            BNMTF.update_F(k,moments_G)
+            assert numpy.allclose(BNMTF.muF[:,k],muFk,rtol=0.000000001,atol=0)
+            assert numpy.allclose(BNMTF.tauF[:,k],tauFk,rtol=0.000000001,atol=0)
+        for l in range(0,L):
+            BNMTF.update_G(l)
+            (muGl,tauGl) = (numpy.copy(BNMTF.muG[:,l]),numpy.copy(BNMTF.tauG[:,l]))
+            BNMTF.update_G(l,moments_F)
+            assert numpy.allclose(BNMTF.muG[:,l],muGl,rtol=0.000000001,atol=0)
+            assert numpy.allclose(BNMTF.tauG[:,l],tauGl,rtol=0.000000001,atol=0)
+        
+        
+""" Test that the cached products are kept up to date when we update F and G """
+def test_cache():
+    (K,L) = (3,2)
+    (R,M,_) = dataset()
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    
+    for sparse in [False,True]:
+        BNMTF = bnmtf_vb_optimised(R,M,K,L,priors,sparse=sparse)
+        numpy.random.seed(1)
+        BNMTF.initialise(init_S='random',init_FG='random')
+        BNMTF.cache = BNMTF.compute_products()
+        for k in range(0,K):
+            BNMTF.update_F(k)
+            BNMTF.update_exp_F(k)
+        for l in range(0,L):
+            BNMTF.update_G(l)
+            BNMTF.update_exp_G(l)
+        
+        (FS,SG,E) = BNMTF.cache
+        (FS_new,SG_new,E_new) = BNMTF.compute_products()
+        assert numpy.allclose(FS,FS_new,rtol=0,atol=0.000000001)
+        assert numpy.allclose(SG,SG_new,rtol=0,atol=0.000000001)
+        assert numpy.allclose(dense(E),dense(E_new),rtol=0,atol=0.000000001)
+        exp_square_diff = BNMTF.exp_square_diff()
+        BNMTF.cache = None
+        assert abs(exp_square_diff - BNMTF.exp_square_diff()) < 0.000000001 * exp_square_diff
+        
+        BNMTF.run(2)
+        assert BNMTF.cache is None
@@ -0,0 +1,124 @@
+"""
+Unit tests for the masked K-means clustering (/code/models/kmeans/kmeans.py).
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+import numpy, pytest
+from BNMTF.code.models.kmeans.kmeans import KMeans
+
+
+""" Test the assertions and the removal of unobserved columns """
+def test_init():
+    X = numpy.arange(12.).reshape(4,3)
+    M = numpy.ones((4,3))
+    M[:,1] = 0
+    kmeans = KMeans(X,M,2)
+    assert kmeans.no_coordinates == 2
+    assert numpy.array_equal(kmeans.X,X[:,[0,2]])
+    assert kmeans.no_unique_points == 4
+
+    M[2,:] = 0
+    with pytest.raises(AssertionError) as error:
+        KMeans(X,M,2)
+    assert str(error.value) == "Fully unobserved row in X, row 2."
+
+    with pytest.raises(AssertionError) as error:
+        KMeans(X,numpy.ones((4,3)),2).initialise(init='uniform')
+    assert str(error.value) == "Unrecognised init option for K-means: uniform."
+    
+    # Mini-batches only for large numbers of points, unless the batch size is given
+    assert KMeans(X,numpy.ones((4,3)),2).batch_size == 4
+    assert KMeans(X,numpy.ones((4,3)),2,batch_size=2).batch_size == 2
+    assert KMeans(numpy.ones((20000,2)),numpy.ones((20000,2)),2).batch_size == 1000
+
+
+""" Test k-means++ picks data points as centroids, never picking a duplicate of one it already has """
+def test_kmeans_plus_plus():
+    X = numpy.array([[0.,0.],[0.,0.],[0.,0.],[1.,5.],[4.,4.]])
+    M = numpy.array([[1,1],[1,1],[1,1],[1,0],[1,1]])
+    for seed in range(0,10):
+        kmeans = KMeans(X,M,3)
+        kmeans.initialise(seed=seed)
+        rows = [[i for i in range(0,5) if numpy.array_equal(kmeans.centroids[k],X[i]*M[i]) and numpy.array_equal(kmeans.mask_centroids[k],M[i])]
+                for k in range(0,3)]
+        assert all(len(r) > 0 for r in rows)
+        assert sorted(set(min(r) for r in rows)) == [0,3,4]
+
+
+""" Test the distances to all centroids against computing them one by one """
+def test_compute_MSEs():
+    numpy.random.seed(0)
+    (I,J,K) = (10,6,3)
+    X = numpy.random.rand(I,J)
+    M = numpy.random.rand(I,J) < 0.6
+    M[:,0] = 1
+    X[M == 0] = numpy.nan
+    kmeans = KMeans(X,M,K)
+    kmeans.initialise(seed=0)
+    kmeans.mask_centroids[1,:] = 0
+    kmeans.mask_centroids[2,:3] = 0
+
+    MSEs = kmeans.compute_MSEs()
+    for i in range(0,I):
+        for k in range(0,K):
+            overlap = M[i] * kmeans.mask_centroids[k]
+            if overlap.sum() == 0:
+                assert MSEs[i,k] == numpy.inf
+            else:
+                expected = (overlap * (numpy.nan_to_num(X[i]) - kmeans.centroids[k])**2).sum() / overlap.sum()
+                assert abs(MSEs[i,k] - expected) < 1e-12
+
+
+""" Test the centroids are the masked means of their points, and empty clusters get the point furthest away """
+def test_update():
+    X = numpy.array([[0.,0.],[1.,2.],[3.,4.],[10.,10.]])
+    M = numpy.array([[1,1],[1,0],[1,1],[1,1]])
+    kmeans = KMeans(X,M,3)
+    kmeans.initialise(seed=0)
+    kmeans.cluster_assignments = numpy.array([0,0,0,2])
+    kmeans.distances = numpy.array([1.,2.,5.,0.])
+    kmeans.update()
+    assert numpy.array_equal(kmeans.centroids[0],[0.5,0.])
+    assert numpy.array_equal(kmeans.centroids[1],[3.,4.])
+    assert numpy.array_equal(kmeans.centroids[2],[10.,10.])
+    assert list(kmeans.cluster_assignments) == [0,0,1,2]
+    assert numpy.array_equal(kmeans.mask_centroids,numpy.ones((3,2)))
+
+
+""" Test clustering well-separated data, with missing values """
+def test_cluster():
+    numpy.random.seed(1)
+    centres = numpy.array([[0.,0.,0.],[5.,5.,5.],[10.,0.,10.]])
+    labels = numpy.repeat([0,1,2],10)
+    X = centres[labels] + 0.1*numpy.random.randn(30,3)
+    M = numpy.ones((30,3))
+    M[numpy.arange(0,30,3),1] = 0
+    kmeans = KMeans(X,M,3)
+    kmeans.initialise(seed=3,init='random')
+    kmeans.cluster()
+    assert kmeans.clustering_results.shape == (30,3)
+    assert numpy.array_equal(kmeans.clustering_results.sum(axis=1),numpy.ones(30))
+    # Each true cluster ends up in exactly one cluster
+    assert sorted(kmeans.clustering_results.sum(axis=0)) == [10,10,10]
+    for c in range(0,3):
+        assert len(set(kmeans.cluster_assignments[labels == c])) == 1
+
+
+""" Test the k-means++ seeding and mini-batches on well-separated data, with missing values """
+def test_cluster_mini_batches():
+    numpy.random.seed(2)
+    centres = numpy.array([[0.,0.,0.,0.],[5.,5.,5.,5.],[10.,0.,10.,0.]])
+    labels = numpy.repeat([0,1,2],200)
+    X = centres[labels] + 0.1*numpy.random.randn(600,4)
+    M = numpy.random.rand(600,4) < 0.7
+    M[:,0] = 1
+    kmeans = KMeans(X,M,3,batch_size=50,tolerance=0.02)
+    kmeans.initialise(seed=0)
+    kmeans.cluster()
+    assert sorted(kmeans.clustering_results.sum(axis=0)) == [200,200,200]
+    for c in range(0,3):
+        assert len(set(kmeans.cluster_assignments[labels == c])) == 1
+        assert numpy.allclose(kmeans.centroids[kmeans.cluster_assignments[labels == c][0]],centres[c],atol=0.1)
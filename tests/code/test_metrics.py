@@ -0,0 +1,81 @@
+"""
+Unit tests for the evaluation measures on the observed entries (/code/metrics.py).
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+import numpy, math, pytest, scipy.sparse
+from BNMTF.code.models.metrics import ObservedValues, compute_MSE, compute_R2, compute_Rp
+from BNMTF.code.models.nmf_icm import nmf_icm
+
+R = numpy.array([[1.,2.,3.],[4.,5.,6.]])
+M = numpy.array([[1,0,1],[0,1,1]])
+R_pred = numpy.array([[2.,9.,3.],[9.,3.,7.]])
+(values,predictions) = (numpy.array([1.,3.,5.,6.]),numpy.array([2.,3.,3.,7.]))
+
+
+""" Test storing the observed values of R, for a dense and a sparse R and M """
+def test_observed_values():
+    for (R_in,M_in) in [(R,M),(R.tolist(),M),(scipy.sparse.csr_matrix(R),scipy.sparse.csr_matrix(M))]:
+        observed = ObservedValues(R_in,M_in)
+        assert numpy.array_equal(observed.rows,[0,0,1,1])
+        assert numpy.array_equal(observed.columns,[0,2,1,2])
+        assert numpy.array_equal(observed.values,values)
+        assert observed.size == 4 and observed.mean == 3.75 and observed.SS_total == 14.75
+
+    with pytest.raises(AssertionError) as error:
+        ObservedValues(R,numpy.zeros((2,3)))
+    assert str(error.value) == "The mask does not contain any entries to evaluate."
+
+
+""" Test the metrics against the definitions over the observed entries """
+def test_performances():
+    observed = ObservedValues(R,M)
+    performances = observed.performances(predictions,metrics=['MSE','MAE','R^2','Rp'])
+    mean_pred = predictions.mean()
+    expected_Rp = ((values-3.75)*(predictions-mean_pred)).sum() / math.sqrt(14.75*((predictions-mean_pred)**2).sum())
+    assert performances['MSE'] == 6./4.
+    assert performances['MAE'] == 4./4.
+    assert abs(performances['R^2'] - (1. - 6./14.75)) < 1e-15
+    assert abs(performances['Rp'] - expected_Rp) < 1e-15
+    assert sorted(observed.performances(predictions).keys()) == ['MSE','R^2','Rp']
+
+    # No variance in R gives an infinite R^2
+    assert ObservedValues(numpy.ones((2,3)),M).performances(predictions,['R^2'])['R^2'] == numpy.inf
+
+    with pytest.raises(AssertionError) as error:
+        observed.performances(predictions,['ELBO'])
+    assert str(error.value) == "Unrecognised metric: ELBO."
+
+
+""" Test the log likelihood, with and without E[log tau] """
+def test_log_likelihood():
+    observed = ObservedValues(R,M)
+    tau = 2.
+    expected = 2. * ( math.log(tau) - math.log(2*math.pi) ) - tau / 2. * 6.
+    assert abs(observed.log_likelihood(predictions,tau) - expected) < 1e-12
+    assert abs(observed.log_likelihood(predictions,tau,log_tau=0.5) - (2. * ( 0.5 - math.log(2*math.pi) ) - 6.)) < 1e-12
+
+
+""" Test the functions on full matrices, with dense and sparse predictions """
+def test_compute_functions():
+    for R_pred_in in [R_pred,scipy.sparse.csr_matrix(R_pred)]:
+        assert compute_MSE(M,R,R_pred_in) == 6./4.
+        assert abs(compute_R2(M,R,R_pred_in) - (1. - 6./14.75)) < 1e-15
+    assert compute_Rp(M,R,R_pred) == ObservedValues(R,M).performances(predictions,['Rp'])['Rp']
+
+
+""" Test the models only gather the observed values of the training mask once, and those of other masks each time """
+def test_model_observed_values():
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2, 'lambdaV':3 }
+    model = nmf_icm(R,M,2,priors)
+    model.initialise(init='exp')
+    M_test = 1 - M
+    assert model.observed_values(model.M) is model.observed_values(model.M)
+    assert model.observed_values(M) is not model.observed_values(M)
+    assert numpy.array_equal(model.observed_values(M_test).values,[2.,4.])
+    M_test[0,1] = 0
+    assert numpy.array_equal(model.observed_values(M_test).values,[4.])
+    assert sorted(model.predict(M_test,metrics=['MAE','MSE']).keys()) == ['MAE','MSE']
@@ -0,0 +1,69 @@
+"""
+Unit tests for running multiple Gibbs chains in parallel (/code/multi_chain.py).
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+import numpy, pytest, random
+from BNMTF.code.models.multi_chain import MultiChainGibbs, split_chains, split_rhat, effective_sample_size
+from BNMTF.code.models.bnmf_gibbs_optimised import bnmf_gibbs_optimised
+
+
+""" Test splitting the chains in half """
+def test_split_chains():
+    draws = numpy.array([[1,2,3,4,5],[6,7,8,9,10]])
+    assert numpy.array_equal(split_chains(draws),[[1,2],[6,7],[4,5],[9,10]])
+
+
+""" Test the split-Rhat and ESS on independent, autocorrelated, and non-mixing chains """
+def test_diagnostics():
+    numpy.random.seed(0)
+    independent = numpy.random.randn(4,1000,2)
+    assert numpy.allclose(split_rhat(independent),1.,atol=0.01)
+    assert numpy.allclose(effective_sample_size(independent),4000.,rtol=0.1)
+    
+    # AR(1) chains with coefficient phi have ESS of roughly N (1-phi)/(1+phi)
+    phi = 0.8
+    autocorrelated = numpy.zeros((4,5000))
+    for t in range(1,5000):
+        autocorrelated[:,t] = phi*autocorrelated[:,t-1] + numpy.random.randn(4)
+    assert abs(effective_sample_size(autocorrelated) - 20000*(1-phi)/(1+phi)) < 0.2*20000*(1-phi)/(1+phi)
+    
+    not_mixing = independent + numpy.arange(4)[:,None,None]
+    assert (split_rhat(not_mixing) > 1.5).all()
+
+
+""" Test running chains in parallel, and that they give the same draws as running them one by one """
+def test_run():
+    I,J,K = 6,5,2
+    numpy.random.seed(0)
+    R = numpy.random.rand(I,J)
+    M = numpy.ones((I,J))
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2, 'lambdaV':3 }
+    (iterations,burn_in,thinning) = (20,4,2)
+    
+    with pytest.raises(AssertionError) as error:
+        MultiChainGibbs(bnmf_gibbs_optimised,R,M,{'K':K,'priors':priors},no_chains=2,P=2,seeds=[1])
+    assert str(error.value) == "Expected 2 seeds, but got 1."
+    
+    chains = MultiChainGibbs(bnmf_gibbs_optimised,R,M,{'K':K,'priors':priors},no_chains=3,P=2,seeds=[3,4,5])
+    summaries = chains.run(iterations,burn_in,thinning,init_config={'init':'random'})
+    assert sorted(summaries.keys()) == ['U','V','tau']
+    assert chains.all_draws['U'].shape == (3,8,I,K)
+    for name in ['mean','variance','Rhat','ESS','ESS_per_second']:
+        assert numpy.shape(summaries['V'][name]) == (J,K)
+        assert numpy.shape(summaries['tau'][name]) == ()
+    
+    Us = []
+    for seed in [3,4,5]:
+        numpy.random.seed(seed)
+        random.seed(seed)
+        BNMF = bnmf_gibbs_optimised(R,M,K,priors)
+        BNMF.initialise('random')
+        BNMF.run(iterations)
+        Us.append(BNMF.all_U[burn_in::thinning])
+    assert numpy.array_equal(chains.all_draws['U'],Us)
+    assert numpy.allclose(summaries['U']['mean'],numpy.mean(Us,axis=(0,1)))
+    assert numpy.array_equal(summaries['U']['Rhat'],split_rhat(Us))
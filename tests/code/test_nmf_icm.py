@@ -8,6 +8,7 @@ sys.path.append(project_location)
 
 import numpy, math, pytest, itertools
 from BNMTF.code.models.nmf_icm import nmf_icm
+from BNMTF.tests.code.sparse_mode import dense_and_sparse, assert_same_performances
 
 
 """ Test constructor """
@@ -309,4 +310,21 @@ def test_log_likelihood():
     assert MSE == BNMF.quality('MSE')
     with pytest.raises(AssertionError) as error:
         BNMF.quality('FAIL')
-    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
\ No newline at end of file
+    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
+
+
+""" Test that the sparse mode gives the same updates and performances as the dense mode """
+def test_sparse():
+    K = 3
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2, 'lambdaV':3 }
+    (NMF_dense,NMF_sparse,M_test) = dense_and_sparse(nmf_icm,K,priors)
+    (I,J) = M_test.shape
+    U, V = numpy.random.rand(I,K), numpy.random.rand(J,K)
+    for NMF in [NMF_dense,NMF_sparse]:
+        NMF.U, NMF.V, NMF.tau = numpy.copy(U), numpy.copy(V), 3.
+    
+    assert abs(NMF_sparse.beta_s() - NMF_dense.beta_s()) < 0.000000000001
+    for k in range(0,K):
+        assert numpy.allclose(NMF_sparse.muU(NMF_sparse.tauU(k),k),NMF_dense.muU(NMF_dense.tauU(k),k),rtol=0,atol=0.000000000001)
+        assert numpy.allclose(NMF_sparse.muV(NMF_sparse.tauV(k),k),NMF_dense.muV(NMF_dense.tauV(k),k),rtol=0,atol=0.000000000001)
+    assert_same_performances(NMF_dense,NMF_sparse,M_test)
@@ -8,6 +8,7 @@ sys.path.append(project_location)
 
 import numpy, math, pytest, itertools
 from BNMTF.code.models.nmf_np import NMF
+from BNMTF.tests.code.sparse_mode import dense_and_sparse, assert_same_performances
 
 
 """ Test the initialisation of Omega """
@@ -260,4 +261,19 @@ def test_compute_statistics():
     
     assert MSE_pred == nmf.compute_MSE(M_pred,R,R_pred)
     assert R2_pred == nmf.compute_R2(M_pred,R,R_pred)
-    assert Rp_pred == nmf.compute_Rp(M_pred,R,R_pred)
\ No newline at end of file
+    assert Rp_pred == nmf.compute_Rp(M_pred,R,R_pred)
+
+
+""" Test that the sparse mode gives the same updates and performances as the dense mode """
+def test_sparse():
+    K = 3
+    (NMF_dense,NMF_sparse,M_test) = dense_and_sparse(NMF,K)
+    for nmf in [NMF_dense,NMF_sparse]:
+        numpy.random.seed(1)
+        nmf.initialise(init_UV='random')
+        nmf.run(3)
+    
+    assert numpy.allclose(NMF_sparse.U,NMF_dense.U,rtol=0,atol=0.000000000001)
+    assert numpy.allclose(NMF_sparse.V,NMF_dense.V,rtol=0,atol=0.000000000001)
+    assert abs(NMF_sparse.compute_I_div() - NMF_dense.compute_I_div()) < 0.000000000001
+    assert_same_performances(NMF_dense,NMF_sparse,M_test,qualities=[])
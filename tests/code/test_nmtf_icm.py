@@ -8,6 +8,7 @@ sys.path.append(project_location)
 
 import numpy, math, pytest, itertools
 from BNMTF.code.models.nmtf_icm import nmtf_icm
+from BNMTF.tests.code.sparse_mode import dense_and_sparse, assert_same_performances
 
 
 """ Test constructor """
@@ -251,7 +252,7 @@ def test_muS():
     # (Rij - Fi*S*Gj + Fik*Skl*Gjk) * Fik*Gjk = 23/30 * 1/10 = 23/300
     muS = 1./tauS * ( 3. * numpy.array([[12*23./300.,12*23./300.,12*23./300.,12*23./300.],[12*23./300.,12*23./300.,12*23./300.,12*23./300.]]) - lambdaS )
     for k,l in itertools.product(xrange(0,K),xrange(0,L)):
-        assert abs(NMTF.muS(tauS[k,l],k,l) - muS[k,l]) < 0.000000000000001
+        assert abs(NMTF.muS(tauS[k,l],k,l) - muS[k,l]) < 0.00000000000001
         
 def test_tauG():
     NMTF = nmtf_icm(R,M,K,L,priors)
@@ -386,4 +387,24 @@ def test_log_likelihood():
     assert MSE == NMTF.quality('MSE')
     with pytest.raises(AssertionError) as error:
         NMTF.quality('FAIL')
-    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
\ No newline at end of file
+    assert str(error.value) == "Unrecognised metric for model quality: FAIL."
+
+
+""" Test that the sparse mode gives the same updates and performances as the dense mode """
+def test_sparse():
+    (K,L) = (3,2)
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    (NMTF_dense,NMTF_sparse,M_test) = dense_and_sparse(nmtf_icm,K,L,priors)
+    (I,J) = M_test.shape
+    F, S, G = numpy.random.rand(I,K), numpy.random.rand(K,L), numpy.random.rand(J,L)
+    for NMTF in [NMTF_dense,NMTF_sparse]:
+        NMTF.F, NMTF.S, NMTF.G, NMTF.tau = numpy.copy(F), numpy.copy(S), numpy.copy(G), 3.
+    
+    assert abs(NMTF_sparse.beta_s() - NMTF_dense.beta_s()) < 0.000000000001
+    for k in range(0,K):
+        assert numpy.allclose(NMTF_sparse.muF(NMTF_sparse.tauF(k),k),NMTF_dense.muF(NMTF_dense.tauF(k),k),rtol=0,atol=0.000000000001)
+    for k,l in itertools.product(xrange(0,K),xrange(0,L)):
+        assert abs(NMTF_sparse.muS(NMTF_sparse.tauS(k,l),k,l) - NMTF_dense.muS(NMTF_dense.tauS(k,l),k,l)) < 0.000000000001
+    for l in range(0,L):
+        assert numpy.allclose(NMTF_sparse.muG(NMTF_sparse.tauG(l),l),NMTF_dense.muG(NMTF_dense.tauG(l),l),rtol=0,atol=0.000000000001)
+    assert_same_performances(NMTF_dense,NMTF_sparse,M_test)
@@ -8,6 +8,7 @@ sys.path.append(project_location)
 
 import numpy, math, pytest, itertools, random
 from BNMTF.code.models.nmtf_np import NMTF
+from BNMTF.tests.code.sparse_mode import dense_and_sparse, assert_same_performances
 
 
 """ Test the initialisation of Omega """
@@ -292,4 +293,20 @@ def test_compute_statistics():
     
     assert MSE_pred == nmtf.compute_MSE(M_pred,R,R_pred)
     assert R2_pred == nmtf.compute_R2(M_pred,R,R_pred)
-    assert Rp_pred == nmtf.compute_Rp(M_pred,R,R_pred)
\ No newline at end of file
+    assert Rp_pred == nmtf.compute_Rp(M_pred,R,R_pred)
+
+
+""" Test that the sparse mode gives the same updates and performances as the dense mode """
+def test_sparse():
+    (K,L) = (3,2)
+    (NMTF_dense,NMTF_sparse,M_test) = dense_and_sparse(NMTF,K,L)
+    for nmtf in [NMTF_dense,NMTF_sparse]:
+        numpy.random.seed(1)
+        nmtf.initialise(init_S='random',init_FG='random')
+        nmtf.run(3)
+    
+    assert numpy.allclose(NMTF_sparse.F,NMTF_dense.F,rtol=0,atol=0.000000000001)
+    assert numpy.allclose(NMTF_sparse.S,NMTF_dense.S,rtol=0,atol=0.000000000001)
+    assert numpy.allclose(NMTF_sparse.G,NMTF_dense.G,rtol=0,atol=0.000000000001)
+    assert abs(NMTF_sparse.compute_I_div() - NMTF_dense.compute_I_div()) < 0.000000000001
+    assert_same_performances(NMTF_dense,NMTF_sparse,M_test,qualities=[])
@@ -0,0 +1,95 @@
+"""
+Unit tests for the helper functions for the sparse mode of the models (/code/observed_entries.py).
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+import numpy, pytest, scipy.sparse
+from BNMTF.code.models.observed_entries import sparse_R_M, observed_triplets, nonzero_entries, gather, dot_entries, triple_dot_entries, masked_values, dense, \
+    dense_mask, mask_blocks, mask_dot, mask_T_dot, apply_mask, subtract_outer
+
+
+""" Test converting R and M to sparse matrices, and extracting the observed entries """
+def test_sparse_R_M():
+    R = numpy.array([[1.,0.,3.],[4.,5.,6.]])
+    M = numpy.array([[1,1,0],[0,2,1]])
+    (R_sparse,M_sparse) = sparse_R_M(R,M)
+    assert scipy.sparse.isspmatrix_csr(R_sparse) and scipy.sparse.isspmatrix_csr(M_sparse)
+    assert numpy.array_equal(R_sparse.toarray(),R)
+    assert numpy.array_equal(M_sparse.toarray(),[[1,1,0],[0,1,1]])
+
+    (rows,columns,values) = observed_triplets(R_sparse,M_sparse)
+    assert numpy.array_equal(rows,[0,0,1,1])
+    assert numpy.array_equal(columns,[0,1,1,2])
+    assert numpy.array_equal(values,[1.,0.,5.,6.])
+
+    # A sparse M is copied rather than changed
+    M_csr = scipy.sparse.csr_matrix(numpy.array(M,dtype=float))
+    (_,M_sparse) = sparse_R_M(R,M_csr)
+    assert numpy.array_equal(M_csr.toarray(),M) and numpy.array_equal(M_sparse.toarray(),[[1,1,0],[0,1,1]])
+
+    # Inputs of the wrong shape are returned as they are, for the model to report
+    (R1,M1) = sparse_R_M(numpy.ones(3),numpy.ones((2,3)))
+    assert R1.shape == (3,) and M1.shape == (2,3)
+
+
+""" Test the functions for indexing and building masked matrices """
+def test_entries():
+    X = numpy.array([[1.,2.,3.],[4.,5.,6.]])
+    M = numpy.array([[0,1,0],[1,0,1]])
+    for mask in [M,scipy.sparse.csr_matrix(M)]:
+        (rows,columns) = nonzero_entries(mask)
+        assert sorted(zip(rows,columns)) == [(0,1),(1,0),(1,2)]
+        assert sorted(gather(X,rows,columns)) == [2.,4.,6.]
+        assert sorted(gather(scipy.sparse.csr_matrix(X),rows,columns)) == [2.,4.,6.]
+    assert len(gather(scipy.sparse.csr_matrix(X),[],[])) == 0
+
+    A = numpy.array([[1.,2.],[3.,4.]])
+    B = numpy.array([[1.,0.],[0.,1.],[1.,1.]])
+    assert numpy.array_equal(dot_entries(A,B,[0,1,1],[2,0,1]),[3.,3.,4.])
+
+    # Both for L <= K (using F S) and L > K (using S G.T)
+    for (K,L) in [(3,2),(2,3)]:
+        (F,S,G) = (numpy.random.rand(4,K),numpy.random.rand(K,L),numpy.random.rand(5,L))
+        (rows,columns) = ([0,3,3,1],[4,0,2,2])
+        expected = numpy.dot(F,numpy.dot(S,G.T))[rows,columns]
+        assert numpy.allclose(triple_dot_entries(F,S,G,rows,columns),expected,rtol=1e-14,atol=0)
+
+    (_,M_sparse) = sparse_R_M(X,M)
+    E = masked_values(M_sparse,[7.,8.,9.])
+    assert numpy.array_equal(dense(E),[[0.,7.,0.],[8.,0.,9.]])
+    assert numpy.array_equal(E.dot([1.,1.,1.]),[7.,17.])
+    assert dense(X) is X
+
+
+""" Test the products with and updates through a dense boolean mask, which casts it blockwise """
+def test_dense_mask():
+    (I,J,K) = (2000,100,3)
+    numpy.random.seed(0)
+    M = dense_mask(numpy.random.randint(0,3,size=(I,J)))
+    assert M.dtype == bool
+    M_float = numpy.array(M,dtype=float)
+    
+    # The blocks cover all rows, in several pieces
+    blocks = [(start,block.copy()) for (start,block) in mask_blocks(M)]
+    assert len(blocks) > 1
+    assert numpy.array_equal(numpy.vstack([block for (start,block) in blocks]),M_float)
+    
+    (X,Y) = (numpy.random.rand(J,K),numpy.random.rand(I))
+    assert numpy.allclose(mask_dot(M,X),M_float.dot(X))
+    assert numpy.allclose(mask_T_dot(M,Y),M_float.T.dot(Y))
+    
+    E = numpy.random.rand(I,J)
+    expected = E * M_float
+    assert apply_mask(M,E) is E and numpy.array_equal(E,expected)
+    
+    (a,b) = (numpy.random.rand(I),numpy.random.rand(J))
+    subtract_outer(E,M,a,b)
+    assert numpy.allclose(E,expected - M_float * numpy.outer(a,b))
+    
+    # A sparse mask is multiplied directly
+    M_sparse = scipy.sparse.csr_matrix(M_float)
+    assert numpy.allclose(mask_dot(M_sparse,X),M_float.dot(X))
+    assert numpy.allclose(mask_T_dot(M_sparse,Y),M_float.T.dot(Y))
@@ -0,0 +1,75 @@
+"""
+Unit tests for the observers of the run() method of the models (/code/observers.py).
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+import numpy, json, pytest
+from BNMTF.code.models.observers import IterationObserver, MemorySink, JSONLinesSink, PrintSink
+from BNMTF.code.models.bnmf_vb_optimised import bnmf_vb_optimised
+from BNMTF.code.models.bnmtf_gibbs_optimised import bnmtf_gibbs_optimised
+from BNMTF.code.models.nmf_np import NMF
+
+(I,J,K,L) = (5,4,2,3)
+numpy.random.seed(0)
+R = numpy.random.rand(I,J)
+M = numpy.ones((I,J))
+M[0,1], M[2,3] = 0, 0
+
+
+""" Test that without observers run() does not evaluate the model """
+def test_no_observers():
+    def evaluate(metrics):
+        assert False, "Should not evaluate the model."
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2, 'lambdaV':3 }
+    BNMF = bnmf_vb_optimised(R,M,K,priors)
+    BNMF.initialise()
+    BNMF.evaluate = evaluate
+    BNMF.run(3)
+    assert len(BNMF.all_times) == 3
+
+
+""" Test computing the metrics every few iterations, and sending them to the sinks """
+def test_iteration_observer(tmpdir):
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2, 'lambdaS':3, 'lambdaG':4 }
+    BNMTF = bnmtf_gibbs_optimised(R,M,K,L,priors)
+    BNMTF.initialise()
+
+    memory = MemorySink()
+    filename = str(tmpdir.join('trace.jsonl'))
+    observer = IterationObserver(metrics=['MSE','tau'],every=2,sinks=[memory,JSONLinesSink(filename),PrintSink()])
+    BNMTF.run(5,observers=[observer])
+
+    assert memory.iterations == [2,4,5]
+    assert memory.times == [BNMTF.all_times[1],BNMTF.all_times[3],BNMTF.all_times[4]]
+    assert sorted(memory.values.keys()) == ['MSE','tau']
+    assert memory.values['tau'] == [BNMTF.all_tau[1],BNMTF.all_tau[3],BNMTF.all_tau[4]]
+    assert memory.values['MSE'][-1] == BNMTF.predict_while_running()['MSE']
+
+    lines = open(filename,'r').readlines()
+    records = [json.loads(line) for line in lines]
+    assert [record['iteration'] for record in records] == [2,4,5]
+    assert [record['MSE'] for record in records] == memory.values['MSE']
+    assert lines[0].startswith('{"iteration": 2, "time": ')
+
+
+""" Test the metrics we can evaluate for the non-probabilistic models, and the default sink """
+def test_evaluate():
+    nmf = NMF(R,M,K)
+    nmf.initialise(init_UV='ones')
+    observer = IterationObserver(metrics=['I_div','R^2'])
+    nmf.run(2,observers=[observer])
+
+    values = observer.sinks[0].values
+    assert len(values['I_div']) == 2 and values['I_div'][-1] == nmf.compute_I_div()
+    assert values['R^2'][-1] == nmf.predict(M)['R^2']
+    assert nmf.evaluate([]) == {}
+
+    with pytest.raises(AssertionError) as error:
+        nmf.evaluate(['ELBO'])
+    assert str(error.value) == "Unrecognised metric for evaluation: ELBO."
+    with pytest.raises(AssertionError) as error:
+        IterationObserver(every=0)
+    assert str(error.value) == "Should evaluate at least every 1 iteration, but every is 0."
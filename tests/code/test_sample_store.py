@@ -0,0 +1,95 @@
+"""
+Unit tests for the sample stores of the Gibbs samplers (/code/sample_store.py).
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+import numpy, pytest
+from BNMTF.code.models.sample_store import MemorySampleStore, MemmapSampleStore, SummarySampleStore, sample_mean
+
+
+""" Test storing all the draws in memory """
+def test_memory_store():
+    store = MemorySampleStore()
+    samples = store.allocate(3,{ 'U':(2,1), 'tau':() })
+    for it in range(0,3):
+        store.add(it,{ 'U':it*numpy.ones((2,1)), 'tau':it+1. })
+    store.close()
+    assert samples['U'].shape == (3,2,1)
+    assert numpy.array_equal(samples['U'][2],[[2.],[2.]])
+    assert numpy.array_equal(samples['tau'],[1.,2.,3.])
+
+
+""" Test storing the thinned draws after burn-in in memory-mapped files, and loading them again """
+def test_memmap_store(tmpdir):
+    folder = str(tmpdir.join('samples'))
+    store = MemmapSampleStore(folder,burn_in=2,thinning=3,chunk_size=2)
+    samples = store.allocate(10,{ 'U':(2,1), 'tau':() }) # keep iterations 2, 5, 8
+    for it in range(0,10):
+        store.add(it,{ 'U':it*numpy.ones((2,1)), 'tau':it+1. })
+    store.close()
+    
+    assert numpy.load(os.path.join(folder,'U.npy')).shape == (3,2,1)
+    assert numpy.array_equal(numpy.load(os.path.join(folder,'tau.npy')),[3.,6.,9.])
+    assert len(samples['U']) == 10
+    assert samples['U'].shape == (10,2,1)
+    assert numpy.array_equal(samples['U'][5],[[5.],[5.]])
+    with pytest.raises(AssertionError) as error:
+        samples['U'][4]
+    assert str(error.value) == "Iteration 4 was not stored (burn-in 2, thinning 3)."
+    
+    loaded = MemmapSampleStore(folder,burn_in=2,thinning=3).load(10,['U','tau'])
+    assert numpy.array_equal(loaded['U'][8],[[8.],[8.]])
+    assert sample_mean(loaded['U'],2,3).tolist() == [[5.],[5.]]
+    assert sample_mean(loaded['tau'],2,6) == 6.
+    
+    with pytest.raises(AssertionError) as error:
+        MemmapSampleStore(folder,thinning=0)
+    assert str(error.value) == "Thinning should be at least 1, but is 0."
+
+
+""" Test summarising the draws with running means, variances, and prediction quantiles """
+def test_summary_store():
+    store = SummarySampleStore(burn_in=1,thinning=2,rows=[0,1],columns=[1,0],capacity=3,seed=0)
+    predict = lambda values,rows,columns: values['U'][rows,columns]
+    summaries = store.allocate(10,{ 'U':(2,2), 'tau':() },predict=predict)
+    for it in range(0,10): # keep iterations 1, 3, 5, 7, 9
+        store.add(it,{ 'U':numpy.array([[0.,it],[-it,1.]]), 'tau':float(it) })
+    
+    assert summaries['tau'].count == 5
+    assert sample_mean(summaries['tau'],1,2) == 5.
+    assert numpy.allclose(sample_mean(summaries['U'],1,2),[[0.,5.],[-5.,1.]])
+    assert numpy.allclose(summaries['U'].variance(),[[0.,8.],[8.,0.]])
+    assert numpy.allclose(summaries['tau'].variance(),8.)
+    with pytest.raises(AssertionError) as error:
+        sample_mean(summaries['U'],0,1)
+    assert str(error.value) == "Draws were summarised with burn-in 1 and thinning 2, not 0 and 1."
+    
+    # The reservoir only keeps 3 of the 5 draws of the predictions U[0,1] = it and U[1,0] = -it
+    assert store.predictions.count == 5
+    kept = store.predictions.draws
+    assert kept.shape == (3,2)
+    assert numpy.array_equal(kept[:,0],-kept[:,1])
+    assert set(kept[:,0]).issubset([1.,3.,5.,7.,9.])
+    (lower,upper) = store.predictions.interval(1.)
+    assert numpy.array_equal(lower,[kept[:,0].min(),kept[:,1].min()])
+    assert numpy.array_equal(upper,[kept[:,0].max(),kept[:,1].max()])
+    assert numpy.array_equal(store.predictions.quantiles(0.5),numpy.median(kept,axis=0))
+    
+    with pytest.raises(AssertionError) as error:
+        SummarySampleStore(rows=[0]).allocate(1,{})
+    assert str(error.value) == "Should give both rows and columns of the entries to predict, or neither."
+
+
+""" Test only keeping the thinned draws after burn-in in memory """
+def test_memory_store_thinned():
+    store = MemorySampleStore(burn_in=1,thinning=4)
+    samples = store.allocate(10,{ 'tau':() }) # keep iterations 1, 5, 9
+    for it in range(0,10):
+        store.add(it,{ 'tau':float(it) })
+    assert numpy.array_equal(store.samples['tau'],[1.,5.,9.])
+    assert len(samples['tau']) == 10
+    assert samples['tau'][5] == 5.
+    assert sample_mean(samples['tau'],5,4) == 7.
@@ -66,6 +66,33 @@ def test_search():
     assert len(greedysearch.all_values('BIC')) == 6
     
     
+def test_search_pool():
+    # Training the candidates in a pool gives the same path, and (up to the random update order of VB) the same performances
+    I,J = 10,9
+    values_K = [1,2,4,5]
+    values_L = [5,4,3]
+    R = 2*numpy.ones((I,J))
+    R[0,0] = 1
+    M = numpy.ones((I,J))
+    priors = { 'alpha':3, 'beta':4, 'lambdaF':5, 'lambdaS':6, 'lambdaG':7 }
+    (initFG,initS,iterations,search_metric) = ('exp','exp',2,'BIC')
+    
+    greedysearch = GreedySearch(classifier,values_K,values_L,R,M,priors,initS,initFG,iterations,restarts=2)
+    greedysearch.search(search_metric)
+    greedysearch_pool = GreedySearch(classifier,values_K,values_L,R,M,priors,initS,initFG,iterations,restarts=2,P=3)
+    greedysearch_pool.search(search_metric)
+    
+    for metric in ['BIC','AIC','loglikelihood','MSE']:
+        (values,values_pool) = (greedysearch.all_values(metric),greedysearch_pool.all_values(metric))
+        assert [(K,L) for (K,L,_) in values_pool] == [(K,L) for (K,L,_) in values]
+        assert numpy.allclose([v for (_,_,v) in values_pool],[v for (_,_,v) in values],rtol=1e-2)
+    assert greedysearch_pool.best_value(search_metric) == greedysearch.best_value(search_metric)
+    
+    with pytest.raises(AssertionError) as error:
+        GreedySearch(classifier,values_K,values_L,R,M,priors,initS,initFG,iterations,parallel=True,P=3)
+    assert str(error.value) == "Cannot use both the successive halving restarts and a pool of workers."
+    
+    
 def test_all_values():
     I,J = 10,9
     values_K = [1,2,4,5]
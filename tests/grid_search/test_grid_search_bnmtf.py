@@ -7,6 +7,7 @@ project_location = os.path.dirname(__file__)+"/../../../"
 sys.path.append(project_location)
 
 from BNMTF.code.cross_validation.grid_search_bnmtf import GridSearch
+from BNMTF.code.cross_validation.result_store import JSONLinesResultStore
 from BNMTF.code.models.bnmtf_vb_optimised import bnmtf_vb_optimised
 import numpy, pytest
 
@@ -56,6 +57,42 @@ def test_search():
     gridsearch.search()
     
     
+def test_search_store(tmpdir):
+    # Train the cells in a pool and store them, then resume an interrupted search
+    I,J = 10,9
+    values_K = [1,2]
+    values_L = [3,2]
+    R = numpy.random.rand(I,J)
+    M = numpy.ones((I,J))
+    priors = { 'alpha':3, 'beta':4, 'lambdaF':5, 'lambdaS':6, 'lambdaG':7 }
+    filename = str(tmpdir.join('grid.jsonl'))
+    
+    numpy.random.seed(0)
+    gridsearch = GridSearch(classifier,values_K,values_L,R,M,priors,'random','exp',2,restarts=2,P=2,store=JSONLinesResultStore(filename))
+    gridsearch.search()
+    lines = open(filename,'r').readlines()
+    assert len(lines) == 8
+    
+    # Remove three cells, and cut off the last line as if the process was killed while writing it
+    # The seeds are derived from (K,L,restart), so the resumed cells are the same whatever the state of numpy.random
+    open(filename,'w').write("".join(lines[:5])+lines[5][:10])
+    numpy.random.seed(1)
+    gridsearch_resumed = GridSearch(classifier,values_K,values_L,R,M,priors,'random','exp',2,restarts=2,store=JSONLinesResultStore(filename))
+    gridsearch_resumed.search()
+    assert len(JSONLinesResultStore(filename).results) == 8
+    assert len(open(filename,'r').readlines()) == 9
+    for metric in ['BIC','AIC','loglikelihood','MSE']:
+        assert numpy.allclose(gridsearch_resumed.all_values(metric),gridsearch.all_values(metric))
+    
+    # Nothing is trained again once all cells are stored
+    class fail_classifier:
+        def __init__(self,*args,**kwargs):
+            assert False, "Should not train any models."
+    gridsearch_stored = GridSearch(fail_classifier,values_K,values_L,R,M,priors,'random','exp',2,restarts=2,store=JSONLinesResultStore(filename))
+    gridsearch_stored.search()
+    assert numpy.array_equal(gridsearch_stored.all_values('BIC'),gridsearch_resumed.all_values('BIC'))
+    
+    
 def test_all_values():
     I,J = 10,9
     values_K = [1,2,4,5]
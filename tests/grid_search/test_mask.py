@@ -0,0 +1,94 @@
+"""
+Test the generation of the cross-validation folds, in mask.py
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+import BNMTF.code.cross_validation.mask as mask
+
+import numpy, pytest
+
+
+""" Test the folds split the observed entries evenly """
+def test_compute_folds():
+    numpy.random.seed(0)
+    M = numpy.ones((10,7))
+    M[0,:3], M[4,2] = 0, 0
+    folds_M = mask.compute_folds(10,7,4,M)
+    assert len(folds_M) == 4
+    assert numpy.array_equal(sum(folds_M),M)
+    assert sorted(fold_M.sum() for fold_M in folds_M) == [16,16,17,17]
+    assert numpy.array_equal(sum(mask.compute_folds(3,2,2)),numpy.ones((3,2)))
+
+
+""" Test each training fold has an observed entry in every row and column, also for very sparse M """
+def test_compute_folds_attempts():
+    numpy.random.seed(0)
+    (I,J) = (30,20)
+    M = numpy.zeros((I,J))
+    M[range(0,I),numpy.arange(0,I) % J] = 1
+    M[numpy.arange(0,J) % I,range(0,J)] = 1
+    M[numpy.random.rand(I,J) < 0.1] = 1
+    for no_folds in [2,5,10]:
+        folds_M = mask.compute_folds_attempts(I,J,no_folds,attempts=1,M=M)
+        assert len(folds_M) == no_folds
+        assert (sum(folds_M) <= M).all()
+        sizes = [fold_M.sum() for fold_M in folds_M]
+        assert max(sizes) - min(sizes) <= 1
+        for M_train in mask.compute_Ms(folds_M,M):
+            assert mask.check_empty_rows_columns(M_train)
+        # Only the reserved entries (at most one per row and column) are not in a fold
+        assert M.sum() - sum(sizes) <= I+J
+
+    M[3,:] = 0
+    with pytest.raises(AssertionError) as error:
+        mask.compute_folds_attempts(I,J,2,attempts=1,M=M)
+    assert str(error.value) == "Cannot generate folds for training and test data, as M has a row or column without observed entries."
+
+
+""" Test the entries reserved for training are in every training mask and in no test fold """
+def test_compute_Ms():
+    numpy.random.seed(2)
+    (I,J) = (12,9)
+    M = numpy.ones((I,J))
+    M[numpy.random.rand(I,J) < 0.5] = 0
+    M[range(0,I),numpy.arange(0,I) % J] = 1
+    M[numpy.arange(0,J) % I,range(0,J)] = 1
+    folds_M = mask.compute_folds_attempts(I,J,3,attempts=1,M=M)
+    reserved = M - sum(folds_M)
+    assert reserved.sum() > 0 and (reserved >= 0).all()
+    Ms_train = mask.compute_Ms(folds_M,M)
+    assert len(Ms_train) == 3
+    for (M_train,fold_M) in zip(Ms_train,folds_M):
+        assert numpy.array_equal(M_train + fold_M,M)
+        assert (M_train[reserved == 1] == 1).all()
+        assert (fold_M[reserved == 1] == 0).all()
+
+
+""" Test the Folds only form the dense masks when asked, and agree with the fold numbers """
+def test_compute_fold_indices():
+    numpy.random.seed(1)
+    (I,J) = (8,6)
+    M = numpy.ones((I,J))
+    M[2,:4] = 0
+    folds = mask.compute_fold_indices(I,J,3,M)
+    assert len(folds) == 3
+    assert len(folds.rows) == M.sum() and len(folds.fold_of_entry) == M.sum()
+    assert folds.fold_of_entry.min() == 0 and folds.fold_of_entry.max() == 3
+    for fold in range(0,3):
+        (rows,columns) = folds.test_indices(fold)
+        M_test, M_train = folds.test(fold), folds.train(fold)
+        assert numpy.array_equal(numpy.nonzero(M_test),(rows,columns))
+        assert numpy.array_equal(M_train+M_test,M)
+        assert mask.check_empty_rows_columns(M_train)
+
+
+""" Test the helper functions """
+def test_nonzero_indices():
+    M = numpy.array([[0,1,1],[1,0,0]])
+    assert mask.nonzero_indices(M) == [(0,1),(0,2),(1,0)]
+    assert mask.check_empty_rows_columns(M)
+    assert not mask.check_empty_rows_columns(numpy.array([[0,1,1],[0,1,0]]))
+    assert numpy.array_equal(mask.dense_mask(2,3,[0,1],[2,0]),[[0,0,1],[1,0,0]])
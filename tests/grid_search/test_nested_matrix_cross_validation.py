@@ -0,0 +1,78 @@
+"""
+Test the nested cross-validation with one pool for all outer folds, in nested_matrix_cross_validation.py
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+from BNMTF.code.cross_validation.nested_matrix_cross_validation import MatrixNestedCrossValidation
+
+import numpy, random, pytest
+
+(I,J) = (12,10)
+
+
+class offset_predictor:
+    """ Predicts the mean of the training entries plus an offset, and fails for offset 'fail'. """
+    def __init__(self,X,M,offset):
+        (self.X,self.M,self.offset) = (X,M,offset)
+
+    def train(self,iterations):
+        if self.offset == 'fail':
+            raise Exception("Cannot train with offset fail")
+        self.mean = (self.X*self.M).sum() / float(self.M.sum()) + self.offset
+
+    def predict(self,M_pred):
+        return { 'MSE' : (M_pred*(self.X-self.mean)**2).sum() / float(M_pred.sum()) }
+
+
+""" Test all outer folds share one pool, and each picks the best parameters of its own search """
+def test_run(tmpdir):
+    numpy.random.seed(0)
+    random.seed(0)
+    X = numpy.random.rand(I,J)
+    M = numpy.ones((I,J))
+    parameter_search = [{'offset':0.5},{'offset':0.},{'offset':'fail'}]
+    filename = str(tmpdir.join('performances.txt'))
+    filenames_nested = [str(tmpdir.join('nested_%s.txt' % i)) for i in range(0,3)]
+
+    nested_crossval = MatrixNestedCrossValidation(offset_predictor,X,M,3,2,parameter_search,{'iterations':1},filename,filenames_nested,folder=str(tmpdir))
+    nested_crossval.run()
+    assert sorted(os.listdir(str(tmpdir))) == ['nested_0.txt','nested_1.txt','nested_2.txt','performances.txt']
+
+    assert len(nested_crossval.all_performances['MSE']) == 3
+    for crossval in nested_crossval.crossvals:
+        assert crossval.best_parameters == {'offset':0.}
+        assert len(crossval.performances['MSE']) == 2
+    for filename_nested in filenames_nested:
+        lines = [line for line in open(filename_nested,'r').readlines() if line.startswith('Tried') or line.startswith('Best')]
+        assert len(lines) == 4
+        assert lines[2] == "Tried parameters {'offset': 'fail'} but got exception:\n"
+        assert lines[3].startswith("Best performances")
+    assert open(filename,'r').read().startswith("Average performances")
+
+
+""" Test a failing final model raises an error """
+def test_run_fail(tmpdir):
+    X = numpy.random.rand(I,J)
+    M = numpy.ones((I,J))
+    filenames_nested = [str(tmpdir.join('nested_%s.txt' % i)) for i in range(0,2)]
+    nested_crossval = MatrixNestedCrossValidation(offset_predictor,X,M,2,3,[{'offset':'fail'}],{'iterations':1},str(tmpdir.join('performances.txt')),filenames_nested)
+    with pytest.raises(Exception) as error:
+        nested_crossval.run()
+    assert "failed with exception:\nTraceback" in str(error.value) and "Exception: Cannot train with offset fail" in str(error.value)
+
+
+""" Test a method that cannot be sent to the pool raises an error straight away, and X is not copied """
+def test_run_unpicklable(tmpdir):
+    class local_predictor(offset_predictor):
+        pass
+    X = numpy.random.rand(I,J)
+    M = numpy.ones((I,J))
+    filenames_nested = [str(tmpdir.join('nested_%s.txt' % i)) for i in range(0,2)]
+    nested_crossval = MatrixNestedCrossValidation(local_predictor,X,M,2,2,[{'offset':0.}],{'iterations':1},str(tmpdir.join('performances.txt')),filenames_nested)
+    assert numpy.may_share_memory(nested_crossval.X,X)
+    with pytest.raises(Exception):
+        nested_crossval.run()
+    assert all(crossval.M is None and numpy.may_share_memory(crossval.X,X) for crossval in nested_crossval.crossvals)
@@ -0,0 +1,91 @@
+"""
+Test the parallel cross-validation, in parallel_matrix_cross_validation.py
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+from BNMTF.code.cross_validation.parallel_matrix_cross_validation import ParallelMatrixCrossValidation, open_folds, run_fold
+from BNMTF.code.models.bnmf_vb_optimised import bnmf_vb_optimised
+
+import numpy, random
+
+(I,J) = (6,5)
+
+
+class offset_predictor:
+    """ Predicts the mean of the training entries plus an offset, and fails for offset 'fail'. """
+    def __init__(self,X,M,offset):
+        (self.X,self.M,self.offset) = (X,M,offset)
+
+    def train(self,iterations):
+        if self.offset == 'fail':
+            raise Exception("Cannot train with offset fail")
+        self.mean = (self.X*self.M).sum() / float(self.M.sum()) + self.offset
+
+    def predict(self,M_pred):
+        return { 'MSE' : (M_pred*(self.X-self.mean)**2).sum() / float(M_pred.sum()) }
+
+
+""" Test one pool for all parameters, logging them in order and skipping the ones that fail """
+def test_run(tmpdir):
+    numpy.random.seed(0)
+    random.seed(0)
+    X = numpy.random.rand(I,J)
+    M = numpy.ones((I,J))
+    parameter_search = [{'offset':0.5},{'offset':'fail'},{'offset':0.},{'offset':1.}]
+    filename = str(tmpdir.join('performances.txt'))
+
+    crossval = ParallelMatrixCrossValidation(offset_predictor,X,M,3,parameter_search,{'iterations':1},filename,P=5,folder=str(tmpdir))
+    crossval.run()
+    assert sorted(os.listdir(str(tmpdir))) == ['performances.txt']
+
+    assert crossval.all_performances[crossval.JSON({'offset':'fail'})] == {}
+    assert [len(crossval.all_performances[crossval.JSON(parameters)]['MSE']) for parameters in [{'offset':0.5},{'offset':0.},{'offset':1.}]] == [3,3,3]
+    assert len(crossval.performances['MSE']) == 3
+    assert crossval.performances['MSE'][1] < crossval.performances['MSE'][0] < crossval.performances['MSE'][2]
+
+    lines = [line for line in open(filename,'r').readlines() if line.startswith('Tried')]
+    assert len(lines) == 4
+    assert lines[0].startswith("Tried parameters {'offset': 0.5}. Average performances")
+    assert lines[1] == "Tried parameters {'offset': 'fail'} but got exception:\n"
+    # The log has the traceback of the failed fold
+    log = open(filename,'r').read()
+    assert "Traceback (most recent call last)" in log and "in train\n" in log and "Exception: Cannot train with offset fail\n" in log
+    assert lines[2].startswith("Tried parameters {'offset': 0.0}. Average performances")
+    assert lines[3].startswith("Tried parameters {'offset': 1.0}. Average performances")
+
+
+""" Test the workers read X and the folds from the memory-mapped files """
+def test_run_fold(tmpdir):
+    X = numpy.arange(I*J,dtype=float).reshape(I,J)
+    M = numpy.ones((I,J))
+    M[5,:] = 0
+    (rows,columns) = numpy.nonzero(M)
+    # The first row is fold 0, the second and third fold 1, and the rest is only used for training
+    folds = open_folds(str(tmpdir),'folds',rows,columns,1)
+    folds[0] = numpy.where(rows == 0,0,numpy.where(rows < 3,1,2))
+    folds.flush()
+    del folds
+    numpy.save(str(tmpdir.join('X.npy')),X)
+
+    task = { 'index':0, 'fold':1, 'folder':str(tmpdir), 'folds':'folds', 'parameters':{'offset':0.}, 'method':offset_predictor, 'train_config':{'iterations':1} }
+    (index,fold,performance_dict,exception) = run_fold(task)
+    # Trained on the first, fourth and fifth rows, and tested on the second and third rows
+    mean = numpy.concatenate((X[0],X[3],X[4])).mean()
+    assert (index,fold,exception) == (0,1,None)
+    assert abs(performance_dict['MSE'] - ((X[1:3]-mean)**2).mean()) < 1e-10
+
+
+
+""" Test the models keep the read-only memory-mapped X the workers load, rather than a copy of it """
+def test_shared_X(tmpdir):
+    numpy.random.seed(0)
+    numpy.save(str(tmpdir.join('X.npy')),numpy.random.rand(I,J))
+    X = numpy.load(str(tmpdir.join('X.npy')),mmap_mode='r')
+    priors = { 'alpha':3, 'beta':4, 'lambdaU':5, 'lambdaV':6 }
+    model = bnmf_vb_optimised(X,numpy.ones((I,J)),2,priors)
+    assert numpy.may_share_memory(model.R,X) and not model.R.flags.writeable
+    model.initialise('random')
+    model.run(2)
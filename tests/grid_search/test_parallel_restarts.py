@@ -0,0 +1,108 @@
+"""
+Test running the restarts in parallel with successive halving, in parallel_restarts.py
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+from BNMTF.code.cross_validation.parallel_restarts import ParallelRestarts, compute_checkpoints
+from BNMTF.code.cross_validation.line_search_bnmf import LineSearch
+from BNMTF.code.models.bnmtf_vb_optimised import bnmtf_vb_optimised
+from BNMTF.code.models.bnmf_gibbs_optimised import bnmf_gibbs_optimised
+from BNMTF.code.models.bnmf_vb_optimised import bnmf_vb_optimised
+
+import numpy, pytest
+
+(I,J,K,L) = (6,5,2,2)
+numpy.random.seed(0)
+R = numpy.random.rand(I,J)
+M = numpy.ones((I,J))
+M[0,1], M[3,2] = 0, 0
+
+
+""" Test the iterations at which we compare the restarts """
+def test_compute_checkpoints():
+    assert compute_checkpoints(100,1,2) == []
+    assert compute_checkpoints(100,2,2) == [50]
+    assert compute_checkpoints(100,4,2) == [25,50]
+    assert compute_checkpoints(100,5,2) == [12,25,50]
+    assert compute_checkpoints(90,9,3) == [10,30]
+    assert compute_checkpoints(3,8,2) == [1]
+
+
+""" Test pruning the restarts of VB, and returning the best survivor """
+def test_run_vb():
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2*numpy.ones((I,K)), 'lambdaS':3*numpy.ones((K,L)), 'lambdaG':4*numpy.ones((J,L)) }
+    restarts = ParallelRestarts(bnmtf_vb_optimised,{'R':R,'M':M,'K':K,'L':L,'priors':priors},{'init_S':'random','init_FG':'random'},
+                                iterations=8,restarts=4,seeds=[0,1,2,3])
+    model = restarts.run()
+
+    assert restarts.checkpoints == [2,4]
+    assert sorted(restarts.stopped_at) == [None,2,2,4]
+    assert [len(values) for values in restarts.values] == [1 if stopped == 2 else 2 for stopped in restarts.stopped_at]
+    # The survivors at each checkpoint had the highest log likelihood
+    survivors = [r for r in range(0,4) if restarts.stopped_at[r] != 2]
+    assert min(restarts.values[r][0] for r in survivors) >= max(restarts.values[r][0] for r in range(0,4) if r not in survivors)
+    assert len(model.all_times) == 8
+    assert model.quality('loglikelihood') == max(restarts.loglikelihoods.values())
+
+    # The same seeds give the same restarts
+    restarts_2 = ParallelRestarts(bnmtf_vb_optimised,{'R':R,'M':M,'K':K,'L':L,'priors':priors},{'init_S':'random','init_FG':'random'},
+                                  iterations=8,restarts=4,seeds=[0,1,2,3])
+    restarts_2.run()
+    assert restarts_2.values == restarts.values
+
+
+""" Test running at most P restarts at a time gives the same restarts """
+def test_run_P():
+    priors = { 'alpha':3, 'beta':1, 'lambdaF':2*numpy.ones((I,K)), 'lambdaS':3*numpy.ones((K,L)), 'lambdaG':4*numpy.ones((J,L)) }
+    restarts = ParallelRestarts(bnmtf_vb_optimised,{'R':R,'M':M,'K':K,'L':L,'priors':priors},{'init_S':'random','init_FG':'random'},
+                                iterations=8,restarts=5,seeds=[0,1,2,3,4])
+    restarts.run()
+    for P in [1,2]:
+        restarts_P = ParallelRestarts(bnmtf_vb_optimised,{'R':R,'M':M,'K':K,'L':L,'priors':priors},{'init_S':'random','init_FG':'random'},
+                                      iterations=8,restarts=5,seeds=[0,1,2,3,4],P=P)
+        assert restarts_P.batches([0,1,2,3,4]) == ([[0],[1],[2],[3],[4]] if P == 1 else [[0,1],[2,3],[4]])
+        restarts_P.run()
+        assert restarts_P.values == restarts.values
+        assert restarts_P.stopped_at == restarts.stopped_at
+        assert restarts_P.loglikelihoods == restarts.loglikelihoods
+
+    with pytest.raises(AssertionError) as error:
+        ParallelRestarts(bnmf_vb_optimised,{},{},iterations=4,restarts=2,P=0)
+    assert str(error.value) == "P should be at least 1, but is 0."
+
+
+""" Test the Gibbs sampler, using the burn-in and thinning to pick the best restart """
+def test_run_gibbs():
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2*numpy.ones((I,K)), 'lambdaV':3*numpy.ones((J,K)) }
+    restarts = ParallelRestarts(bnmf_gibbs_optimised,{'R':R,'M':M,'K':K,'priors':priors},{'init':'random'},
+                                iterations=10,restarts=3,eta=3)
+    model = restarts.run(burn_in=4,thinning=2)
+    assert restarts.checkpoints == [3]
+    assert restarts.stopped_at.count(None) == 1
+    assert model.quality('loglikelihood',4,2) == restarts.loglikelihoods[restarts.stopped_at.index(None)]
+
+
+""" Test errors in the restarts are raised in the parent """
+def test_errors():
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2*numpy.ones((I,K)), 'lambdaV':3*numpy.ones((J,K)) }
+    restarts = ParallelRestarts(bnmf_vb_optimised,{'R':R,'M':M,'K':K,'priors':priors},{'init':'fail'},iterations=4,restarts=2)
+    with pytest.raises(Exception) as error:
+        restarts.run()
+    assert "Restart 1 failed with exception" in str(error.value)
+    assert "Unrecognised init option for F,G: fail." in str(error.value)
+
+    with pytest.raises(AssertionError) as error:
+        ParallelRestarts(bnmf_vb_optimised,{},{},iterations=4,restarts=2,seeds=[1])
+    assert str(error.value) == "Expected 2 seeds, but got 1."
+
+
+""" Test the line search with parallel restarts """
+def test_line_search():
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2, 'lambdaV':3 }
+    numpy.random.seed(0)
+    line_search = LineSearch(bnmf_vb_optimised,[1,2],R,M,priors,'random',iterations=4,restarts=2,parallel=True)
+    line_search.search()
+    assert len(line_search.all_values('BIC')) == 2
@@ -0,0 +1,214 @@
+"""
+Test the on-disk result store for the searches, in result_store.py
+"""
+
+import sys, os
+project_location = os.path.dirname(__file__)+"/../../../"
+sys.path.append(project_location)
+
+from BNMTF.code.cross_validation.result_store import JSONLinesResultStore, ResultCache, content_hash
+from BNMTF.code.cross_validation.line_search_bnmf import LineSearch
+from BNMTF.code.cross_validation.greedy_search_bnmtf import GreedySearch
+from BNMTF.code.cross_validation.grid_search_bnmtf import GridSearch
+from BNMTF.code.cross_validation.matrix_cross_validation import MatrixCrossValidation
+from BNMTF.code.cross_validation.parallel_matrix_cross_validation import ParallelMatrixCrossValidation
+from BNMTF.code.cross_validation.nested_matrix_cross_validation import MatrixNestedCrossValidation
+from BNMTF.code.cross_validation.line_search_cross_validation import LineSearchCrossValidation
+from BNMTF.code.cross_validation.greedy_search_cross_validation import GreedySearchCrossValidation
+from BNMTF.code.models.bnmf_vb_optimised import bnmf_vb_optimised
+from BNMTF.code.models.bnmtf_vb_optimised import bnmtf_vb_optimised
+
+import numpy, scipy.sparse
+
+(I,J) = (8,7)
+numpy.random.seed(0)
+R = numpy.random.rand(I,J)
+M = numpy.ones((I,J))
+M[0,1], M[3,2] = 0, 0
+
+
+class cached_bnmf(bnmf_vb_optimised):
+    """ BNMF that fails when fail is set, so we can check nothing is trained again. """
+    fail = False
+    def __init__(self,*args,**kwargs):
+        if cached_bnmf.fail:
+            raise Exception("Should not train any models.")
+        bnmf_vb_optimised.__init__(self,*args,**kwargs)
+
+
+class cached_bnmtf(bnmtf_vb_optimised):
+    """ BNMTF that fails when fail is set, so we can check nothing is trained again. """
+    fail = False
+    def __init__(self,*args,**kwargs):
+        if cached_bnmtf.fail:
+            raise Exception("Should not train any models.")
+        bnmtf_vb_optimised.__init__(self,*args,**kwargs)
+
+
+class mean_predictor:
+    """ Predicts the mean of the training entries plus noise, and fails when fail is set. """
+    fail = False
+    def __init__(self,X,M,offset):
+        if mean_predictor.fail:
+            raise Exception("Should not train any models.")
+        (self.X,self.M,self.offset) = (X,M,offset)
+
+    def train(self,iterations):
+        self.mean = (self.X*self.M).sum() / float(self.M.sum()) + self.offset + numpy.random.rand()
+
+    def predict(self,M_pred):
+        return { 'MSE' : (M_pred*(self.X-self.mean)**2).sum() / float(M_pred.sum()) }
+
+
+def test_store(tmpdir):
+    filename = str(tmpdir.join('results.jsonl'))
+    store = JSONLinesResultStore(filename)
+    assert not store.contains((1,2,0))
+    store.add((1,2,0),{'BIC':10.,'MSE':0.5})
+    store.add([2,2,1],{'BIC':20.,'MSE':0.25})
+    assert store.contains((1,2,0)) and store.contains((2,2,1))
+    assert store.get([1,2,0]) == {'BIC':10.,'MSE':0.5}
+
+    # Reload the results, ignoring a line that was cut off
+    open(filename,'a').write('{"key": [3, 2, 0], "val')
+    store = JSONLinesResultStore(filename)
+    assert sorted(store.results.keys()) == [(1,2,0),(2,2,1)]
+    assert store.get((2,2,1))['BIC'] == 20.
+    store.add((3,2,0),{'BIC':30.})
+    assert JSONLinesResultStore(filename).get((3,2,0)) == {'BIC':30.}
+    assert len(open(filename,'r').readlines()) == 4
+
+
+
+def test_content_hash():
+    X = numpy.arange(6.).reshape(2,3)
+    assert content_hash({'X':X,'K':2}) == content_hash({'K':2.,'X':X.copy()})
+    assert content_hash(X) != content_hash(X.T) != content_hash(X.astype(int))
+    assert content_hash(X) != content_hash(X+1)
+    assert content_hash(scipy.sparse.coo_matrix(X)) == content_hash(scipy.sparse.csc_matrix(X))
+    assert content_hash(scipy.sparse.csr_matrix(X)) != content_hash(X)
+    assert content_hash({'classifier':bnmf_vb_optimised,'seed':numpy.int64(3)}) == content_hash({'classifier':bnmf_vb_optimised,'seed':3})
+    assert content_hash({'classifier':bnmf_vb_optimised}) != content_hash({'classifier':cached_bnmf})
+
+    # Classes with the same name in another module, or with another cache_version, are different
+    class mean_predictor_other(mean_predictor):
+        __module__ = 'other'
+    class mean_predictor_version(mean_predictor):
+        cache_version = 2
+    mean_predictor_other.__name__ = mean_predictor_version.__name__ = 'mean_predictor'
+    assert content_hash(mean_predictor_other) != content_hash(mean_predictor)
+    assert content_hash(mean_predictor_version) != content_hash(mean_predictor)
+    mean_predictor_version.__module__ = 'other'
+    assert content_hash(mean_predictor_version) != content_hash(mean_predictor_other)
+    assert content_hash((None,'a')) != content_hash(('None','a'))
+
+
+def test_cache_seed(tmpdir):
+    cache = ResultCache(str(tmpdir.join('cache.jsonl')))
+    assert cache.seed({'K':2}) == cache.seed({'K':2},0)
+    assert cache.seed({'K':2},1) != cache.seed({'K':2},0) != cache.seed({'K':3},0)
+    assert 0 <= cache.seed({'K':2}) < 2**31-1
+    cache.add(cache.key({'K':2,'R':R}),{'BIC':1.})
+    assert ResultCache(cache.filename).get(cache.key({'K':2.,'R':R.copy()})) == {'BIC':1.}
+
+
+""" Test the searches reuse the restarts in the cache, and give the same results as before """
+def test_cache_line_search(tmpdir):
+    filename = str(tmpdir.join('cache.jsonl'))
+    priors = { 'alpha':3, 'beta':1, 'lambdaU':2, 'lambdaV':3 }
+    cached_bnmf.fail = False
+    line_search = LineSearch(cached_bnmf,[1,2],R,M,priors,'random',iterations=4,restarts=2,cache=ResultCache(filename))
+    line_search.search()
+    assert len(open(filename,'r').readlines()) == 4
+
+    # The seeds are derived from the restarts, so a new cache gives the same results
+    line_search_new = LineSearch(cached_bnmf,[1,2],R,M,priors,'random',iterations=4,restarts=2,cache=ResultCache(str(tmpdir.join('new.jsonl'))))
+    line_search_new.search()
+    assert line_search_new.all_values('BIC') == line_search.all_values('BIC')
+
+    # A longer search only trains the new value of K
+    line_search_more = LineSearch(cached_bnmf,[1,2,3],R,M,priors,'random',iterations=4,restarts=2,cache=ResultCache(filename))
+    line_search_more.search()
+    assert line_search_more.all_values('BIC')[:2] == line_search.all_values('BIC')
+    assert len(open(filename,'r').readlines()) == 6
+
+    cached_bnmf.fail = True
+    line_search_cached = LineSearch(cached_bnmf,[2,1],R,M,priors,'random',iterations=4,restarts=2,cache=ResultCache(filename))
+    line_search_cached.search()
+    assert line_search_cached.all_values('BIC') == line_search.all_values('BIC')[::-1]
+    cached_bnmf.fail = False
+
+
+def test_cache_grid_and_greedy_search(tmpdir):
+    filename = str(tmpdir.join('cache.jsonl'))
+    priors = { 'alpha':3, 'beta':4, 'lambdaF':5, 'lambdaS':6, 'lambdaG':7 }
+    cached_bnmtf.fail = False
+    gridsearch = GridSearch(cached_bnmtf,[1,2],[1,2],R,M,priors,'random','random',3,restarts=2,P=2,cache=ResultCache(filename))
+    gridsearch.search()
+    assert len(open(filename,'r').readlines()) == 8
+
+    cached_bnmtf.fail = True
+    gridsearch_cached = GridSearch(cached_bnmtf,[1,2],[1,2],R,M,priors,'random','random',3,restarts=2,cache=ResultCache(filename))
+    gridsearch_cached.search()
+    assert numpy.array_equal(gridsearch_cached.all_values('BIC'),gridsearch.all_values('BIC'))
+    cached_bnmtf.fail = False
+
+    greedysearch = GreedySearch(cached_bnmtf,[1,2],[1,2],R,M,priors,'random','random',3,restarts=2,P=2,cache=ResultCache(filename))
+    greedysearch.search('BIC')
+    cached_bnmtf.fail = True
+    greedysearch_cached = GreedySearch(cached_bnmtf,[1,2],[1,2],R,M,priors,'random','random',3,restarts=2,cache=ResultCache(filename))
+    greedysearch_cached.search('BIC')
+    assert greedysearch_cached.all_values('BIC') == greedysearch.all_values('BIC')
+    cached_bnmtf.fail = False
+
+
+""" Test the cross-validations reuse the folds in the cache """
+def test_cache_cross_validation(tmpdir):
+    filename = str(tmpdir.join('cache.jsonl'))
+    parameter_search = [{'offset':0.},{'offset':1.}]
+    mean_predictor.fail = False
+    crossval = MatrixCrossValidation(mean_predictor,R,M,3,parameter_search,{'iterations':1},str(tmpdir.join('crossval.txt')),cache=ResultCache(filename))
+    crossval.run()
+    assert len(open(filename,'r').readlines()) == 6
+
+    mean_predictor.fail = True
+    crossval_cached = MatrixCrossValidation(mean_predictor,R,M,3,parameter_search,{'iterations':1},str(tmpdir.join('crossval.txt')),cache=ResultCache(filename))
+    crossval_cached.run()
+    assert crossval_cached.performances == crossval.performances
+    
+    # The parallel cross-validation uses the same folds and keys, so it finds all of them in the cache
+    crossval_parallel = ParallelMatrixCrossValidation(mean_predictor,R,M,3,parameter_search,{'iterations':1},str(tmpdir.join('crossval.txt')),P=2,cache=ResultCache(filename))
+    crossval_parallel.run()
+    assert crossval_parallel.performances == crossval.performances
+    mean_predictor.fail = False
+    
+    # The nested cross-validation adds its final models, and then reuses all folds
+    files_nested = [str(tmpdir.join('nested_%s.txt' % i)) for i in range(0,3)]
+    nested = MatrixNestedCrossValidation(mean_predictor,R,M,3,2,parameter_search,{'iterations':1},str(tmpdir.join('nested.txt')),files_nested,cache=ResultCache(filename))
+    nested.run()
+    mean_predictor.fail = True
+    nested_cached = MatrixNestedCrossValidation(mean_predictor,R,M,3,2,parameter_search,{'iterations':1},str(tmpdir.join('nested.txt')),files_nested,cache=ResultCache(filename))
+    nested_cached.run()
+    assert nested_cached.all_performances == nested.all_performances
+    mean_predictor.fail = False
+    
+    priors = { 'alpha':3, 'beta':4, 'lambdaU':5, 'lambdaV':6 }
+    cached_bnmf.fail = False
+    line_crossval = LineSearchCrossValidation(cached_bnmf,R,M,[1,2],2,priors,'random',3,2,'BIC',str(tmpdir.join('line.txt')),cache=ResultCache(filename))
+    line_crossval.run()
+    cached_bnmf.fail = True
+    line_crossval.run()
+    cached_bnmf.fail = False
+    lines = open(str(tmpdir.join('line.txt')),'r').read().split('Average performance')
+    assert len(lines) == 3 and lines[1].split('\n')[0] == lines[2].split('\n')[0]
+
+    priors = { 'alpha':3, 'beta':4, 'lambdaF':5, 'lambdaS':6, 'lambdaG':7 }
+    cached_bnmtf.fail = False
+    greedy_crossval = GreedySearchCrossValidation(cached_bnmtf,R,M,[1,2],[1,2],2,priors,'random','random',3,1,'BIC',
+                                                  str(tmpdir.join('greedy.txt')),cache=ResultCache(filename))
+    greedy_crossval.run()
+    cached_bnmtf.fail = True
+    greedy_crossval.run()
+    cached_bnmtf.fail = False
+    lines = open(str(tmpdir.join('greedy.txt')),'r').read().split('Average performance')
+    assert len(lines) == 3 and lines[1].split('\n')[0] == lines[2].split('\n')[0]